@@ -1,43 +1,54 @@
 # llama_main.py
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify, g
 from flask_cors import CORS
-import faiss
-import subprocess
-from sentence_transformers import SentenceTransformer
-from pypdf import PdfReader
-import docx
-import pandas as pd
 import re
 from uuid import uuid4
 import time
 import threading
 from ask_menu import ask_menu
-from ask_image import ask_image
+from ask_image import ask_image, decode_image_upload
+from prompt_builder import build_messages, context_budget, likely_fits, prompt_token_summary
+from llm_client import chat
+from llm_scheduler import SCHEDULER, QueueFull
+from index_cache import get_image_index, put_image_index, get_document_index, put_document_index
+from models import embed, loaded_models, warm_up
+from keyword_index import KeywordIndex, hybrid_search
+from chunking import chunk_document, chunk_params, params_to_json, ROW_CHUNK_PARAMS
+from spreadsheet import is_spreadsheet, read_spreadsheet, row_chunks, save_table, answer_from_tables
+from outlet_index import compact_outlet_indexes
+from index_shards import outlet_texts, search_outlet, refresh_outlet, owner
+from outlet_warmup import WarmUp, record_outlet_activity
+from command_meta import warm_outlet_commands
+import metrics
+from metrics import stage
+import profiling
 
 from helper_func import (
     save_document_to_db,
     load_document_from_db,
     save_image_text,
     load_image_text,
-    load_document_from_db_outletwise,
+    load_image_index_from_db,
+    load_outlet_spreadsheet_ids,
+    content_hash,
+    file_content_hash,
+    reuse_document,
+    load_outlet_chunk_embeddings,
+    new_chunks,
     match_command,
     get_command_slots,
+    new_faiss_index,
 )
 
 app = Flask(__name__)
 CORS(app)
 
-embedder = SentenceTransformer("all-MiniLM-L6-v2")
-
 # Store documents per doc_id
 DOCUMENTS = {}  # {doc_id: {"index": ..., "chunks": ..., "created_at": ...}}
 
 # Auto-expiry config
 EXPIRY_SECONDS = 1800  # 30 minutes
 
-OLLAMA_PATH = "/usr/local/bin/ollama"
-
-
 from file_utils import UPLOAD_FOLDER
 
 app.config["UPLOAD_FOLDER"] = UPLOAD_FOLDER
@@ -48,18 +59,20 @@ app.config["UPLOAD_FOLDER"] = UPLOAD_FOLDER
 # ------------------------------
 def extract_text(file):
     """Extract text from PDF, DOCX, TXT, or Excel files."""
+    # Parsers are imported on first use; most workers only ever see one or two types
     if file.filename.endswith(".pdf"):
+        from pypdf import PdfReader
         reader = PdfReader(file)
-        return " ".join([page.extract_text() or "" for page in reader.pages])
+        return "\n\n".join([page.extract_text() or "" for page in reader.pages])
     elif file.filename.endswith(".docx"):
+        import docx
         doc = docx.Document(file)
-        return " ".join([para.text for para in doc.paragraphs])
+        # Blank line between paragraphs so the chunker can break there
+        return "\n\n".join([para.text for para in doc.paragraphs])
     elif file.filename.endswith(".txt"):
         return file.read().decode("utf-8")
-    elif file.filename.endswith((".xls", ".xlsx")):
-        df = pd.read_excel(file, engine="openpyxl")
-        text = " ".join(df.astype(str).apply(lambda row: " ".join(row), axis=1))
-        return text
+    elif is_spreadsheet(file.filename):
+        return "\n".join(row_chunks(read_spreadsheet(file)))
     else:
         raise ValueError("Unsupported file type")
 
@@ -67,22 +80,19 @@ def extract_text(file):
 # ------------------------------
 # Chunking
 # ------------------------------
-def chunk_text(text, chunk_size=500, overlap=50):
-    words = text.split()
-    chunks = []
-    for i in range(0, len(words), chunk_size - overlap):
-        chunks.append(" ".join(words[i:i+chunk_size]))
-    return chunks
+def chunk_text(text, params=None):
+    """Sentence-aware chunks sized for the embedder (see chunking.py)."""
+    return chunk_document(text, params)
 
 
 # ------------------------------
 # Build FAISS index
 # ------------------------------
 def build_index(chunks):
-    embeddings = embedder.encode(chunks)
-    dimension = embeddings.shape[1]
-    index = faiss.IndexFlatL2(dimension)
-    index.add(embeddings)
+    embeddings = embed(chunks)
+    with stage("index_build"):
+        index = new_faiss_index(embeddings.shape[1])
+        index.add(embeddings)
     return index, embeddings
 
 
@@ -94,36 +104,60 @@ def clean_output(output: str) -> str:
     return output.strip()
 
 
+# Fixed instruction preambles. They are sent as the system message so that
+# consecutive requests share a prefix Ollama can serve from its KV cache.
+NOT_AVAILABLE_ANSWER = "The information is not available in the provided document."
+STRICT_SYSTEM_PROMPT = (
+    "You are a strict assistant. Only use the provided context to answer. "
+    "If the answer is not in the context, reply exactly: "
+    f"'{NOT_AVAILABLE_ANSWER}'"
+)
+OPEN_SYSTEM_PROMPT = "You are a helpful assistant. Answer the question using your own knowledge."
+
+
+def run_llama(messages, model="llama3.2:3b"):
+    """Send chat messages to Ollama and return the cleaned output."""
+    content, stats = chat(messages, model=model)
+    return clean_output(content)
+
+
 def query_llama(context, question, model="llama3.2:3b"):
-    """Ask Llama model, preferring context but allowing outside knowledge."""
-    if context.strip():
-        prompt = (
-            f"You are a strict assistant. Only use the provided context to answer. "
-            f"If the answer is not in the context, reply exactly: "
-            f"'The information is not available in the provided document.'\n\n"
-            f"Context:\n{context}\n\n"
-            f"Question: {question}\n\n"
-            f"Answer:"
+    """
+    Ask Llama model, preferring context but allowing outside knowledge.
+    `context` is a string or a list of chunks ordered best match first.
+    Retrieved context changes per question, so it goes in the user message.
+    """
+    if isinstance(context, str):
+        context = [context] if context.strip() else []
+
+    if context:
+        messages = build_messages(
+            STRICT_SYSTEM_PROMPT,
+            "Context:\n{context}\n\nQuestion: {question}",
+            context=context, question=question,
         )
     else:
-        prompt = (
-            f"You are a helpful assistant. Answer the question using your own knowledge.\n\n"
-            f"Question: {question}\n\n"
-            f"Answer:"
-        )
+        messages = build_messages(OPEN_SYSTEM_PROMPT, "Question: {question}", question=question)
 
-    result = subprocess.run(
-        [OLLAMA_PATH, "run", model],
-        input=prompt.encode("utf-8"),
-        capture_output=True
-    )
-    raw_output = result.stdout.decode("utf-8")
-    return clean_output(raw_output)
+    return run_llama(messages, model)
 
 
 # ------------------------------
 # Routes
 # ------------------------------
+@app.before_request
+def remember_outlet():
+    """Expose the request's outlet (if any) to prompt accounting, metrics and warm-up ranking."""
+    data = request.get_json(silent=True) or {}
+    g.document_outlet_name = (
+        data.get("document_outlet_name")
+        or request.form.get("document_outlet_name")
+        or request.args.get("document_outlet_name")
+    )
+    metrics.start_request(request.endpoint, g.document_outlet_name)
+    record_outlet_activity(g.document_outlet_name)
+
+
 @app.route("/upload", methods=["POST"])
 def upload_document():
     try:
@@ -134,20 +168,74 @@ def upload_document():
         username = request.form["username"]
         document_outlet_name = request.form.get("document_outlet_name", None)
 
-        # Extract text and chunk
-        text = extract_text(uploaded_file)
-        chunks = chunk_text(text)
-
-
-        # Get embeddings
-        embeddings = embedder.encode(chunks)
+        spreadsheet_upload = is_spreadsheet(uploaded_file.filename)
+        if spreadsheet_upload:
+            params = ROW_CHUNK_PARAMS
+        else:
+            # Optional per-document overrides: chunk_strategy, chunk_max_tokens, chunk_overlap_tokens
+            try:
+                params = chunk_params(
+                    request.form.get("chunk_strategy"),
+                    request.form.get("chunk_max_tokens"),
+                    request.form.get("chunk_overlap_tokens"),
+                )
+            except (ValueError, TypeError) as e:
+                return jsonify({"error": str(e)}), 400
+
+        # Same file, outlet and chunking as an earlier upload: reuse that document
+        file_hash = file_content_hash(uploaded_file)
+        existing_id = reuse_document(file_hash, document_outlet_name, params_to_json(params))
+        if existing_id:
+            return jsonify({
+                "doc_id": existing_id,
+                "document_outlet_name": document_outlet_name,
+                "duplicate": True,
+                "chunk_params": params,
+                "message": f"Document '{uploaded_file.filename}' is already loaded."
+            })
+
+        # Spreadsheets: one chunk per row, and the table kept for exact answers
+        table = None
+        if spreadsheet_upload:
+            table = read_spreadsheet(uploaded_file)
+            chunks = row_chunks(table)
+        else:
+            # Extract text and chunk
+            text = extract_text(uploaded_file)
+            chunks = chunk_text(text, params)
+
+        # Every chunk gets a row, but each distinct text is embedded once:
+        # repeats within the document, and texts the outlet already has
+        # (their stored embedding is reused)
+        hashes = [content_hash(c) for c in chunks]
+        known = load_outlet_chunk_embeddings(document_outlet_name, hashes) if document_outlet_name else {}
+        _, stored_chunks = new_chunks(chunks, known)
+        embedded = dict(known)
+        if stored_chunks:
+            embedded.update(zip((content_hash(c) for c in stored_chunks), embed(stored_chunks)))
+        embeddings = [embedded[h] for h in hashes]
+
+        # Save document + embeddings to DB, and the new texts to the outlet's
+        # BM25 index in the same transaction
+        doc_id = save_document_to_db(
+            username, uploaded_file.filename, chunks, embeddings, document_outlet_name,
+            params_to_json(params), file_hash, keyword_chunks=stored_chunks
+        )
+        if table is not None:
+            save_table(doc_id, table)
 
-        # Save document + embeddings to DB
-        doc_id = save_document_to_db(username, uploaded_file.filename, chunks, embeddings, document_outlet_name)
+        # Add the new rows and segment to the outlet's cached indexes (other
+        # workers pick them up on their next refresh)
+        if document_outlet_name and chunks:
+            refresh_outlet(document_outlet_name)
 
         return jsonify({
             "doc_id": doc_id,
             "document_outlet_name": document_outlet_name,
+            "duplicate": False,
+            "chunks": len(chunks),
+            "new_chunks": len(stored_chunks),
+            "chunk_params": params,
             "message": f"Document '{uploaded_file.filename}' loaded successfully."
         })
 
@@ -165,19 +253,39 @@ def ask_question():
         if not question:
             return jsonify({"error": "Question is required"}), 400
 
-        context = ""
+        # Lookup / filter / aggregate questions on a spreadsheet: exact answer, no LLM
+        table_answer = answer_from_tables(question, [doc_id]) if doc_id else None
+        if table_answer is not None:
+            return jsonify({
+                "question": question,
+                "doc_id": doc_id,
+                "document_outlet_name": document_outlet_name,
+                "answer": table_answer
+            })
+
+        context = []
         if doc_id:
             try:
-                chunks, index = load_document_from_db(doc_id, document_outlet_name)
-                q_embed = embedder.encode([question])
-                D, I = index.search(q_embed, k=3)
-                context = " ".join([chunks[i] for i in I[0]])
+                cached = get_document_index(doc_id, document_outlet_name)
+                if cached:
+                    chunks, index, keyword_index = cached
+                else:
+                    chunks, index = load_document_from_db(doc_id, document_outlet_name)
+                    keyword_index = KeywordIndex.build(chunks)
+                    put_document_index(doc_id, document_outlet_name, chunks, index, keyword_index)
+                q_embed = embed([question])
+                context = hybrid_search(question, q_embed, chunks, index, keyword_index, k=3)
             except Exception as e:
                 print(e)
                 return jsonify({"error": "Document not found or failed to load"}), 404
 
-        # Hybrid: pass context if available, else fallback
-        answer = query_llama(context, question, model="llama3.2:3b")
+        if doc_id and not context:
+            # Nothing in the document is close to the question: skip the LLM
+            metrics.record_llm_skipped()
+            answer = NOT_AVAILABLE_ANSWER
+        else:
+            # Hybrid: pass context if available, else fallback
+            answer = query_llama(context, question, model="llama3.2:3b")
 
         return jsonify({
             "question": question,
@@ -185,6 +293,8 @@ def ask_question():
             "document_outlet_name": document_outlet_name,
             "answer": answer
         })
+    except QueueFull:
+        raise  # answered with 429 by handle_queue_full
     except Exception as e:
         return jsonify({"error": str(e)}), 500
     
@@ -197,39 +307,52 @@ def ask_question_outlet():
         if not question:
             return jsonify({"error": "Question is required"}), 400
 
-        context = ""
+        if document_outlet_name:
+            table_answer = answer_from_tables(question, load_outlet_spreadsheet_ids(document_outlet_name))
+            if table_answer is not None:
+                return jsonify({
+                    "question": question,
+                    "document_outlet_name": document_outlet_name,
+                    "answer": table_answer
+                })
+
+        context = []
         if document_outlet_name:
             try:
-                chunks, index = load_document_from_db_outletwise(document_outlet_name)
-                q_embed = embedder.encode([question])
-                D, I = index.search(q_embed, k=3)
-                context = " ".join([chunks[i] for i in I[0]])
+                q_embed = embed([question])
+                context = search_outlet(document_outlet_name, question, q_embed, k=3)
             except Exception as e:
                 print(e)
                 return jsonify({"error": "Document not found or failed to load"}), 404
 
-        # Hybrid: pass context if available, else fallback
-        answer = query_llama(context, question, model="llama3.2:3b")
+        if document_outlet_name and not context:
+            # Nothing in the outlet is close to the question: skip the LLM
+            metrics.record_llm_skipped()
+            answer = NOT_AVAILABLE_ANSWER
+        else:
+            # Hybrid: pass context if available, else fallback
+            answer = query_llama(context, question, model="llama3.2:3b")
 
         return jsonify({
             "question": question,
             "document_outlet_name": document_outlet_name,
             "answer": answer
         })
+    except QueueFull:
+        raise  # answered with 429 by handle_queue_full
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
 
-import redis
 import json
 import re
 import datetime
 from flask import Flask, request, jsonify
 
 # ------------------------------
-# Connect to Redis
-r = redis.Redis(host='localhost', port=6379, db=0, decode_responses=True)
+# Redis-backed slot sessions (shared connection pool)
+from session_store import load_session, save_session
 
 # ------------------------------
 
@@ -284,45 +407,44 @@ r = redis.Redis(host='localhost', port=6379, db=0, decode_responses=True)
 #     return output, updated_slots
 
 
+OUTLET_SYSTEM_TEMPLATE = (
+    "You are a helpful assistant. Answer the user's question using the context.\n"
+    "If information is not available, say 'No information provided'.\n\n"
+    "Context:\n{context}"
+)
+
+
 def query_llama_with_no_slots(context, question):
     """
     Calls LLaMA with context + question. If slots are provided, tries to extract slot values.
     If slots are empty, just return answer from context.
+    `context` is a string or a list of chunks ordered best match first.
     """
 
-    # No slots → just answer using document context
-    prompt = (
-            f"You are a helpful assistant. Answer the user's question using the context.\n"
-            f"Context:\n{context}\n\n"
-            f"Question: {question}\n\n"
-            f"If information is not available, say 'No information provided'."
-        )
-
-    output = query_llama(question + "\n" + context + "\n" + prompt, question)
+    # No slots → just answer using document context.
+    # The outlet's documents are the same for every question, so they sit in
+    # the system message to form a reusable prefix.
+    messages = build_messages(
+        OUTLET_SYSTEM_TEMPLATE, "Question: {question}", context=context, question=question
+    )
+    output = run_llama(messages)
 
     return output
-    
 
-from helper_func import get_db_connection  # assuming this exists
 
-# ------------------------------
-# Connect to Redis
-r = redis.Redis(host='localhost', port=6379, db=0, decode_responses=True)
-
-# ------------------------------
-# Utility to get slots for a command
-def get_slots_for_command(command_id):
-    conn = get_db_connection()
-    cursor = conn.cursor(dictionary=True)
-    cursor.execute("""
-        SELECT slot_id, slot_name, required
-        FROM outlet_command_slots
-        WHERE command_id = %s
-    """, (command_id,))
-    slots = cursor.fetchall()
-    cursor.close()
-    conn.close()
-    return slots
+def outlet_context_chunks(document_outlet_name, question):
+    """
+    All of an outlet's chunks for whole-outlet prompts.
+    Kept in document order when they all fit (a stable, cacheable prefix);
+    otherwise ranked by relevance (vector + keyword) so the least useful
+    chunks are dropped.
+    """
+    chunks = outlet_texts(document_outlet_name)
+    budget = context_budget(OUTLET_SYSTEM_TEMPLATE, "Question: {question}", question=question)
+    if likely_fits(chunks, budget):
+        return chunks
+    q_embed = embed([question])
+    return search_outlet(document_outlet_name, question, q_embed, k=None)
 
 
 # @app.route("/ask-outlet-command-slots", methods=["POST"])
@@ -418,9 +540,10 @@ def ask_outlet_command_slots():
         # General question flow (no command_id)
         if not command_id and question:
             try:
-                chunks, index = load_document_from_db_outletwise(document_outlet_name)
-                context = " ".join(chunks)
+                context = outlet_context_chunks(document_outlet_name, question)
                 llama_answer = query_llama_with_no_slots(context, question)
+            except QueueFull:
+                raise  # answered with 429 by handle_queue_full
             except Exception as e:
                 llama_answer = f"No document context found: {str(e)}"
 
@@ -435,50 +558,40 @@ def ask_outlet_command_slots():
 
         # ------------------------------
         # Normal command flow
-        session_key = f"{document_outlet_name}_{user_id}_{command_id}"
-
-        # Load current session from Redis
-        session_json = r.get(session_key)
-        session_slots = json.loads(session_json) if session_json else {}
+        # Session slots + cached command metadata come back in one Redis round trip
+        session_slots, meta = load_session(document_outlet_name, user_id, command_id)
+        if meta is None:
+            meta = {"slots": [], "is_leaf": True, "command_text": None}
 
         # Update session slots with frontend values
         session_slots.update(user_slots)
 
-        # Fetch required slots for this command from DB
-        slots_required = get_slots_for_command(command_id)
-        slots_dict = {slot["slot_name"]: session_slots.get(slot["slot_name"]) for slot in slots_required}
+        # Keep only the slots this command defines
+        slots_dict = {slot["slot_name"]: session_slots.get(slot["slot_name"]) for slot in meta["slots"]}
 
         # Check if all required slots are filled
         ready_to_call_api = all(v is not None and v != "" for v in slots_dict.values())
 
-        # Determine if this command has subcommands
-        conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute("SELECT COUNT(*) AS count FROM outlet_commands WHERE parent_command_id = %s", (command_id,))
-        subcommand_count = cursor.fetchone()["count"]
-        is_last_command = subcommand_count == 0
+        # A command without subcommands is the last step
+        is_last_command = meta["is_leaf"]
 
         # Optionally call LLaMA if it's actionable and has no slots
         llama_answer = None
         if is_last_command and not slots_dict:
-            # Fetch command_text if frontend didn't provide a question
-            cursor.execute("SELECT command_text FROM outlet_commands WHERE command_id=%s", (command_id,))
-            row = cursor.fetchone()
-            if row and row.get("command_text") and not question:
-                question = row["command_text"]
+            # Use command_text if frontend didn't provide a question
+            if meta["command_text"] and not question:
+                question = meta["command_text"]
 
             try:
-                chunks, index = load_document_from_db_outletwise(document_outlet_name)
-                context = " ".join(chunks)
+                context = outlet_context_chunks(document_outlet_name, question)
                 llama_answer = query_llama_with_no_slots(context, question)
+            except QueueFull:
+                raise  # answered with 429 by handle_queue_full
             except Exception as e:
                 llama_answer = f"No document context found: {str(e)}"
 
-        cursor.close()
-        conn.close()
-
         # Save session slots back to Redis
-        r.set(session_key, json.dumps(slots_dict), ex=3600)
+        save_session(document_outlet_name, user_id, command_id, slots_dict)
 
         return jsonify({
             "document_outlet_name": document_outlet_name,
@@ -489,6 +602,8 @@ def ask_outlet_command_slots():
             "llama_answer": llama_answer
         }), 200
 
+    except QueueFull:
+        raise  # answered with 429 by handle_queue_full
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -501,6 +616,12 @@ def home():
     return jsonify({"status": "ok", "message": "Flask Document + Excel Q&A API (Llama) is running!"})
 
 
+@app.route("/stats/prompt-tokens", methods=["GET"])
+def prompt_token_stats():
+    """Recent prompt sizes per route, for capacity planning."""
+    return jsonify(prompt_token_summary())
+
+
 @app.route("/ask-menu", methods=["POST"])
 def ask_menu_endpoint():
     data = request.get_json()
@@ -519,15 +640,23 @@ def ask_image_upload():
 
     image_file = request.files["file"]
     username = request.form["username"]
-    image_path = f"/tmp/{image_file.filename}"
-    image_file.save(image_path)
 
-    response = ask_image(image_path)  # call existing ask_image.py function
+    # Decode in memory (large files spill to a self-deleting temp file)
+    image = decode_image_upload(image_file)
+    if image is None:
+        return jsonify({"error": "Could not read image"}), 400
+
+    response = ask_image(image)  # call existing ask_image.py function
     if "error" in response:
         return jsonify(response), 400
 
-    # Save detected text in DB
-    image_id = save_image_text(username, image_file.filename, response["detected_text"])
+    # Chunk + embed the OCR text so questions only see the relevant parts
+    chunks = chunk_text(response["detected_text"])
+    index, embeddings = build_index(chunks)
+
+    # Save detected text and chunk embeddings in DB
+    image_id = save_image_text(username, image_file.filename, response["detected_text"], chunks, embeddings)
+    put_image_index(image_id, chunks, index)
 
     return jsonify({
         "image_id": image_id,
@@ -546,12 +675,28 @@ def ask_image_question():
     if not image_id or not question:
         return jsonify({"error": "image_id and question are required"}), 400
 
-    detected_text = load_image_text(image_id)
-    if not detected_text:
-        return jsonify({"error": "Image not found"}), 404
+    cached = get_image_index(image_id)
+    if cached:
+        chunks, index = cached
+    else:
+        chunks, index, created_at = load_image_index_from_db(image_id)
+        if index is not None:
+            put_image_index(image_id, chunks, index, created_at)
+
+    if index is not None:
+        # Retrieve only the OCR chunks relevant to the question
+        q_embed = embed([question])
+        with stage("search"):
+            D, I = index.search(q_embed, k=min(3, index.ntotal))
+        context = [chunks[i] for i in I[0]]
+    else:
+        # Images stored before OCR chunking: fall back to the full text
+        context = load_image_text(image_id)
+        if not context:
+            return jsonify({"error": "Image not found"}), 404
 
-    # Send detected_text as context to Llama
-    answer = query_llama(detected_text, question, model="llama3.2:3b")
+    # Send retrieved OCR text as context to Llama
+    answer = query_llama(context, question, model="llama3.2:3b")
     return jsonify({
         "image_id": image_id,
         "question": question,
@@ -570,23 +715,144 @@ def uploaded_file(filename):
 
 # Scheduler jobs wrapped with app context
 from apscheduler.schedulers.background import BackgroundScheduler
-from helper_func import delete_old_documents, delete_old_images
+from cleanup import run_cleanup
 # ------------------------------
-def scheduled_delete_documents():
+def scheduled_cleanup():
     with app.app_context():
-        print("[SCHEDULER] Running delete_old_documents")
-        delete_old_documents()
+        # Every worker schedules this; run_cleanup returns None unless it won the lock
+        run_cleanup()
 
-def scheduled_delete_images():
-    with app.app_context():
-        print("[SCHEDULER] Running delete_old_images")
-        delete_old_images()
+# Start the scheduler in the process that serves requests. Threads don't
+# survive fork, so under gunicorn --preload starting it at import would
+# leave it running only in the master.
+scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def start_background_jobs():
+    global scheduler
+    with _scheduler_lock:
+        if scheduler is None:
+            scheduler = BackgroundScheduler()
+            scheduler.add_job(scheduled_cleanup, "interval", minutes=5)
+            scheduler.add_job(compact_outlet_indexes, "interval", minutes=10)
+            scheduler.start()
+    WARM_UP.start()
+
+
+def warm_outlet(document_outlet_name):
+    """Warm one popular outlet in this worker: its index (unless an index node holds it) and command table."""
+    if owner(document_outlet_name) is None:
+        try:
+            outlet_texts(document_outlet_name)
+        except LookupError:
+            pass  # commands but no documents
+    warm_outlet_commands(document_outlet_name)
+
+
+# Started with the background jobs: by gunicorn's post_fork, else the first request
+WARM_UP = WarmUp(warm_outlet)
+
+
+@app.before_request
+def ensure_background_jobs():
+    if scheduler is None:
+        start_background_jobs()
+
+
+@app.route("/ready", methods=["GET"])
+def readiness():
+    """200 once this worker's warm-up is done (load balancer health check), else 503."""
+    status = WARM_UP.snapshot()
+    return jsonify(status), 200 if status["ready"] else 503
+
+
+@app.route("/warmup", methods=["POST"])
+def warmup_models():
+    """Load models ahead of traffic, e.g. {"models": ["embedder", "ocr"]} (default: all)."""
+    data = request.get_json(silent=True) or {}
+    try:
+        timings = warm_up(data.get("models"))
+    except KeyError as e:
+        return jsonify({"error": f"Unknown model {e}"}), 400
+    return jsonify({"warmed": timings, "loaded": loaded_models()})
+
+# LLM queue too deep: tell the client when to come back
+@app.errorhandler(QueueFull)
+def handle_queue_full(e):
+    response = jsonify({"error": "Server is busy, please retry shortly", "retry_after": e.retry_after})
+    response.status_code = 429
+    response.headers["Retry-After"] = str(e.retry_after)
+    return response
+
+
+@app.after_request
+def add_queue_position_header(response):
+    # How many LLM requests were ahead of this one when it queued (0 = none)
+    if "llm_queue_position" in g:
+        response.headers["X-LLM-Queue-Position"] = str(g.llm_queue_position)
+    return response
+
+
+@app.route("/stats/llm-queue", methods=["GET"])
+def llm_queue_stats():
+    return jsonify(SCHEDULER.snapshot())
+
+
+@app.after_request
+def add_server_timing(response):
+    # Per-stage breakdown for this request (also recorded for /metrics)
+    timings = metrics.finish_request()
+    if timings is not None:
+        response.headers["Server-Timing"] = metrics.server_timing(timings)
+    return response
+
+
+@app.route("/metrics", methods=["GET"])
+def prometheus_metrics():
+    """Request / stage latency histograms and cache lookups, Prometheus text format."""
+    body, content_type = metrics.render()
+    return Response(body, content_type=content_type)
+
+
+# Opt-in sampling profiler (see profiling.py). Registered on the app, so it
+# covers the blueprints' routes as well.
+@app.before_request
+def start_profiling():
+    if profiling.CONTINUOUS is not None:
+        profiling.CONTINUOUS.start()
+        profiling.CONTINUOUS.enter(request.endpoint)
+    mode = profiling.requested_mode(request.headers, request.args)
+    if mode:
+        g.profile_mode = mode
+        g.profiler = profiling.RequestProfiler(request.endpoint).start()
+
+
+@app.after_request
+def attach_profile(response):
+    profiler = g.pop("profiler", None)
+    if profiler is None:
+        return response
+    profiler.stop()
+    if g.profile_mode == "inline":
+        response.headers["X-Profile-Status"] = str(response.status_code)
+        response.status_code = 200
+        response.set_data(profiler.text())
+        response.mimetype = "text/plain"
+    else:
+        response.headers["X-Profile-File"] = profiler.save()
+    response.headers["X-Profile-Samples"] = str(profiler.samples)
+    return response
+
+
+@app.teardown_request
+def stop_profiling(exc):
+    if profiling.CONTINUOUS is not None:
+        profiling.CONTINUOUS.exit()
+    profiler = g.pop("profiler", None)
+    if profiler is not None:  # the request failed before after_request
+        profiler.stop().save()
 
-# Start scheduler
-scheduler = BackgroundScheduler()
-scheduler.add_job(scheduled_delete_documents, "interval", minutes=5)
-scheduler.add_job(scheduled_delete_images, "interval", minutes=5)
-scheduler.start()
 
 # Allow iframe embedding
 @app.after_request
@@ -608,5 +874,4 @@ app.register_blueprint(user_bp)
 app.register_blueprint(command_bp)
 
 if __name__ == "__main__":
-    threading.Thread(target=cleanup_job, daemon=True).start()
     app.run(host="0.0.0.0", port=8015, debug=True)
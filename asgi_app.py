@@ -0,0 +1,432 @@
+# asgi_app.py
+"""
+Async serving mode for the Q&A endpoints.
+
+    uvicorn asgi_app:app --host 0.0.0.0 --port 8016 --workers 2
+
+/ask, /ask-outlet, /ask-outlet-command-slots, /ask-menu and the image
+endpoints are served here with the same request/response shapes as app_new.
+A request waiting on the LLM is a suspended coroutine rather than a pinned
+gunicorn thread, so one worker can hold hundreds of them; CPU work
+(embedding, OCR, FAISS builds) runs in the default thread pool. Every other
+route falls through to the Flask app.
+"""
+import asyncio
+import contextvars
+from contextlib import asynccontextmanager
+import httpx
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.wsgi import WSGIMiddleware
+from starlette.responses import JSONResponse
+from starlette.routing import Mount, Route
+from werkzeug.datastructures import FileStorage
+
+import async_db
+from app_new import (
+    app as flask_app,
+    start_background_jobs,
+    chunk_text,
+    build_index,
+    clean_output,
+    STRICT_SYSTEM_PROMPT,
+    NOT_AVAILABLE_ANSWER,
+    OPEN_SYSTEM_PROMPT,
+    OUTLET_SYSTEM_TEMPLATE,
+)
+from ask_image import run_ocr, decode_image_upload, explanation_messages
+from ask_menu import PRODUCTS_URL, plan_menu_query, product_answer, clean_menu_output
+from prompt_builder import REQUEST_LABELS, build_messages, context_budget, likely_fits
+from llm_client import achat
+from llm_scheduler import ASYNC_SCHEDULER, INTERACTIVE, BACKGROUND, QueueFull
+from index_cache import get_image_index, put_image_index, aget_document_index, put_document_index
+from session_store import aload_session, asave_session
+from models import embed
+from keyword_index import KeywordIndex, hybrid_search
+from index_shards import aoutlet_texts, asearch_outlet
+from outlet_warmup import record_outlet_activity_soon
+from spreadsheet import answer_from_tables
+import metrics
+from metrics import stage
+
+# Deepest LLM queue position seen while serving the current request
+QUEUE_POSITION = contextvars.ContextVar("llm_queue_position", default=None)
+
+
+def start_request(route, document_outlet_name=None):
+    """Label prompt accounting / scheduling for this request and reset its queue position."""
+    REQUEST_LABELS.set((route, document_outlet_name))
+    QUEUE_POSITION.set(None)
+    metrics.start_request(route, document_outlet_name)
+    record_outlet_activity_soon(document_outlet_name)
+
+
+def respond(body, status_code=200):
+    response = JSONResponse(body, status_code=status_code)
+    position = QUEUE_POSITION.get()
+    if position is not None:
+        response.headers["X-LLM-Queue-Position"] = str(position)
+    timings = metrics.finish_request()
+    if timings is not None:
+        response.headers["Server-Timing"] = metrics.server_timing(timings)
+    # Same embedding headers as app_new.add_iframe_headers
+    response.headers["X-Frame-Options"] = "ALLOWALL"
+    response.headers["Content-Security-Policy"] = "frame-ancestors *"
+    return response
+
+
+async def run_llama(messages, model="llama3.2:3b", priority=INTERACTIVE):
+    content, _, position = await achat(messages, model=model, priority=priority)
+    QUEUE_POSITION.set(max(position, QUEUE_POSITION.get() or 0))
+    return clean_output(content)
+
+
+async def embed_question(question):
+    return await asyncio.to_thread(lambda: embed([question]))
+
+
+async def query_llama(context, question, model="llama3.2:3b"):
+    """Async app_new.query_llama."""
+    if isinstance(context, str):
+        context = [context] if context.strip() else []
+
+    if context:
+        messages = build_messages(
+            STRICT_SYSTEM_PROMPT,
+            "Context:\n{context}\n\nQuestion: {question}",
+            context=context, question=question,
+        )
+    else:
+        messages = build_messages(OPEN_SYSTEM_PROMPT, "Question: {question}", question=question)
+
+    return await run_llama(messages, model)
+
+
+async def query_llama_with_no_slots(context, question):
+    messages = build_messages(
+        OUTLET_SYSTEM_TEMPLATE, "Question: {question}", context=context, question=question
+    )
+    return await run_llama(messages)
+
+
+async def outlet_context_chunks(document_outlet_name, question):
+    """Async app_new.outlet_context_chunks."""
+    chunks = await aoutlet_texts(document_outlet_name)
+    budget = context_budget(OUTLET_SYSTEM_TEMPLATE, "Question: {question}", question=question)
+    if likely_fits(chunks, budget):
+        return chunks
+    q_embed = await embed_question(question)
+    return await asearch_outlet(document_outlet_name, question, q_embed, k=None)
+
+
+# ------------------------------
+# Routes
+# ------------------------------
+async def ask_question(request):
+    try:
+        data = await request.json()
+        question = data.get("question")
+        doc_id = data.get("doc_id")
+        document_outlet_name = data.get("document_outlet_name", None)
+        start_request("ask_question", document_outlet_name)
+        if not question:
+            return respond({"error": "Question is required"}, 400)
+
+        table_answer = await asyncio.to_thread(answer_from_tables, question, [doc_id]) if doc_id else None
+        if table_answer is not None:
+            return respond({
+                "question": question,
+                "doc_id": doc_id,
+                "document_outlet_name": document_outlet_name,
+                "answer": table_answer
+            })
+
+        context = []
+        if doc_id:
+            try:
+                cached = await aget_document_index(doc_id, document_outlet_name)
+                if cached:
+                    chunks, index, keyword_index = cached
+                else:
+                    chunks, index = await async_db.load_document_from_db(doc_id, document_outlet_name)
+                    keyword_index = await asyncio.to_thread(KeywordIndex.build, chunks)
+                    put_document_index(doc_id, document_outlet_name, chunks, index, keyword_index)
+                q_embed = await embed_question(question)
+                context = await asyncio.to_thread(hybrid_search, question, q_embed, chunks, index, keyword_index, k=3)
+            except Exception as e:
+                print(e)
+                return respond({"error": "Document not found or failed to load"}, 404)
+
+        if doc_id and not context:
+            metrics.record_llm_skipped()
+            answer = NOT_AVAILABLE_ANSWER
+        else:
+            answer = await query_llama(context, question, model="llama3.2:3b")
+
+        return respond({
+            "question": question,
+            "doc_id": doc_id,
+            "document_outlet_name": document_outlet_name,
+            "answer": answer
+        })
+    except QueueFull:
+        raise  # answered with 429 by handle_queue_full
+    except Exception as e:
+        return respond({"error": str(e)}, 500)
+
+
+async def ask_question_outlet(request):
+    try:
+        data = await request.json()
+        question = data.get("question")
+        document_outlet_name = data.get("document_outlet_name", None)
+        start_request("ask_question_outlet", document_outlet_name)
+        if not question:
+            return respond({"error": "Question is required"}, 400)
+
+        if document_outlet_name:
+            doc_ids = await async_db.load_outlet_spreadsheet_ids(document_outlet_name)
+            table_answer = await asyncio.to_thread(answer_from_tables, question, doc_ids)
+            if table_answer is not None:
+                return respond({
+                    "question": question,
+                    "document_outlet_name": document_outlet_name,
+                    "answer": table_answer
+                })
+
+        context = []
+        if document_outlet_name:
+            try:
+                q_embed = await embed_question(question)
+                context = await asearch_outlet(document_outlet_name, question, q_embed, k=3)
+            except Exception as e:
+                print(e)
+                return respond({"error": "Document not found or failed to load"}, 404)
+
+        if document_outlet_name and not context:
+            metrics.record_llm_skipped()
+            answer = NOT_AVAILABLE_ANSWER
+        else:
+            answer = await query_llama(context, question, model="llama3.2:3b")
+
+        return respond({
+            "question": question,
+            "document_outlet_name": document_outlet_name,
+            "answer": answer
+        })
+    except QueueFull:
+        raise  # answered with 429 by handle_queue_full
+    except Exception as e:
+        return respond({"error": str(e)}, 500)
+
+
+async def ask_outlet_command_slots(request):
+    try:
+        data = await request.json()
+        document_outlet_name = data.get("document_outlet_name")
+        user_id = data.get("user_id")
+        command_id = data.get("command_id")  # can be None
+        user_slots = data.get("slots", {})   # optional new slot values
+        question = data.get("question", "")  # user question for LLaMA
+        start_request("ask_outlet_command_slots", document_outlet_name)
+
+        if not document_outlet_name or not user_id:
+            return respond({"error": "document_outlet_name and user_id are required"}, 400)
+
+        # General question flow (no command_id)
+        if not command_id and question:
+            try:
+                context = await outlet_context_chunks(document_outlet_name, question)
+                llama_answer = await query_llama_with_no_slots(context, question)
+            except QueueFull:
+                raise  # answered with 429 by handle_queue_full
+            except Exception as e:
+                llama_answer = f"No document context found: {str(e)}"
+
+            return respond({
+                "document_outlet_name": document_outlet_name,
+                "command_id": None,
+                "slots": {},
+                "ready_to_call_api": True,
+                "is_last_command": True,
+                "llama_answer": llama_answer
+            })
+
+        # Normal command flow
+        session_slots, meta = await aload_session(document_outlet_name, user_id, command_id)
+        if meta is None:
+            meta = {"slots": [], "is_leaf": True, "command_text": None}
+
+        session_slots.update(user_slots)
+        slots_dict = {slot["slot_name"]: session_slots.get(slot["slot_name"]) for slot in meta["slots"]}
+        ready_to_call_api = all(v is not None and v != "" for v in slots_dict.values())
+        is_last_command = meta["is_leaf"]
+
+        llama_answer = None
+        if is_last_command and not slots_dict:
+            if meta["command_text"] and not question:
+                question = meta["command_text"]
+
+            try:
+                context = await outlet_context_chunks(document_outlet_name, question)
+                llama_answer = await query_llama_with_no_slots(context, question)
+            except QueueFull:
+                raise  # answered with 429 by handle_queue_full
+            except Exception as e:
+                llama_answer = f"No document context found: {str(e)}"
+
+        await asave_session(document_outlet_name, user_id, command_id, slots_dict)
+
+        return respond({
+            "document_outlet_name": document_outlet_name,
+            "command_id": command_id,
+            "slots": slots_dict,
+            "ready_to_call_api": ready_to_call_api,
+            "is_last_command": is_last_command,
+            "llama_answer": llama_answer
+        })
+
+    except QueueFull:
+        raise  # answered with 429 by handle_queue_full
+    except Exception as e:
+        return respond({"error": str(e)}, 500)
+
+
+async def ask_menu_endpoint(request):
+    data = await request.json()
+    question = data.get("question")
+    start_request("ask_menu_endpoint")
+    if not question:
+        return respond({"error": "Question is required"}, 400)
+
+    try:
+        async with httpx.AsyncClient(timeout=10) as client:
+            response = await client.get(PRODUCTS_URL)
+        products = response.json().get("products", []) if response.status_code == 200 else []
+    except (httpx.HTTPError, ValueError):
+        products = []
+
+    plan = plan_menu_query(question, products)
+    answer = clean_menu_output(await run_llama(plan["messages"]))
+
+    if plan["mode"] == "product":
+        return respond(product_answer(question, products, plan["mentioned_products"], answer))
+    return respond({"mode": "general", "question": question, "answer": answer})
+
+
+async def explain_text(detected_text):
+    """Background-priority explanation; None rather than failing the upload when busy."""
+    try:
+        return await run_llama(explanation_messages(detected_text), priority=BACKGROUND)
+    except QueueFull:
+        return None
+
+
+async def ask_image_upload(request):
+    start_request("ask_image_upload")
+    async with request.form() as form:
+        if "file" not in form or "username" not in form:
+            return respond({"error": "File and username are required"}, 400)
+
+        upload = form["file"]
+        username = form["username"]
+        image = await asyncio.to_thread(
+            decode_image_upload, FileStorage(stream=upload.file, filename=upload.filename)
+        )
+    if image is None:
+        return respond({"error": "Could not read image"}, 400)
+
+    detected_text = await asyncio.to_thread(run_ocr, image)
+    if not detected_text:
+        return respond({"error": "No text detected in image"}, 400)
+
+    # The explanation waits on the LLM; chunk + embed the OCR text meanwhile
+    chunks = await asyncio.to_thread(chunk_text, detected_text)
+    explanation, (index, embeddings) = await asyncio.gather(
+        explain_text(detected_text), asyncio.to_thread(build_index, chunks)
+    )
+
+    image_id = await async_db.save_image_text(username, upload.filename, detected_text, chunks, embeddings)
+    put_image_index(image_id, chunks, index)
+
+    return respond({
+        "image_id": image_id,
+        "detected_text": detected_text,
+        "explanation": explanation,
+        "message": "Image processed and stored successfully"
+    })
+
+
+async def ask_image_question(request):
+    data = await request.json()
+    image_id = data.get("image_id")
+    question = data.get("question")
+    start_request("ask_image_question")
+
+    if not image_id or not question:
+        return respond({"error": "image_id and question are required"}, 400)
+
+    cached = get_image_index(image_id)
+    if cached:
+        chunks, index = cached
+    else:
+        chunks, index, created_at = await async_db.load_image_index_from_db(image_id)
+        if index is not None:
+            put_image_index(image_id, chunks, index, created_at)
+
+    if index is not None:
+        q_embed = await embed_question(question)
+        with stage("search"):
+            D, I = index.search(q_embed, k=min(3, index.ntotal))
+        context = [chunks[i] for i in I[0]]
+    else:
+        # Images stored before OCR chunking: fall back to the full text
+        context = await async_db.load_image_text(image_id)
+        if not context:
+            return respond({"error": "Image not found"}, 404)
+
+    answer = await query_llama(context, question, model="llama3.2:3b")
+    return respond({
+        "image_id": image_id,
+        "question": question,
+        "answer": answer
+    })
+
+
+async def llm_queue_stats(request):
+    return JSONResponse(ASYNC_SCHEDULER.snapshot())
+
+
+async def handle_queue_full(request, exc):
+    metrics.finish_request()
+    return JSONResponse(
+        {"error": "Server is busy, please retry shortly", "retry_after": exc.retry_after},
+        status_code=429,
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
+@asynccontextmanager
+async def lifespan(app):
+    start_background_jobs()
+    yield
+    await async_db.close_pool()
+
+
+app = Starlette(
+    routes=[
+        Route("/ask", ask_question, methods=["POST"]),
+        Route("/ask-outlet", ask_question_outlet, methods=["POST"]),
+        Route("/ask-outlet-command-slots", ask_outlet_command_slots, methods=["POST"]),
+        Route("/ask-menu", ask_menu_endpoint, methods=["POST"]),
+        Route("/ask-image-upload", ask_image_upload, methods=["POST"]),
+        Route("/ask-image-question", ask_image_question, methods=["POST"]),
+        Route("/stats/llm-queue", llm_queue_stats, methods=["GET"]),
+        # Uploads, command editing, users, stats: unchanged Flask handlers
+        Mount("/", app=WSGIMiddleware(flask_app)),
+    ],
+    middleware=[Middleware(CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"])],
+    exception_handlers={QueueFull: handle_queue_full},
+    lifespan=lifespan,
+)
@@ -1,11 +1,31 @@
-import easyocr
-import subprocess
 import re
+import cv2
+import numpy as np
+import os
+import shutil
+import tempfile
+from prompt_builder import build_messages
+from llm_client import chat
+from llm_scheduler import BACKGROUND, QueueFull
+from models import get_ocr_reader
+from metrics import stage
 
-OLLAMA_PATH = "/usr/local/bin/ollama"
+# ------------------------------
+# Preprocessing config
+# ------------------------------
+# OCR time grows with pixel count, so phone photos are shrunk and simplified
+# before they reach easyocr. Any key can be overridden per call.
+PREPROCESS_CONFIG = {
+    "max_dimension": 1600,       # longest side in pixels (None = keep original size)
+    "grayscale": True,           # drop colour channels
+    "normalize_contrast": True,  # CLAHE on the lightness channel
+    "crop_text_region": False,   # crop to the area that looks like text
+    "crop_padding": 16,          # pixels kept around the detected text region
+}
 
-# Initialize OCR reader (supports multiple languages, e.g., ['en', 'ch_sim'])
-reader = easyocr.Reader(['en'])
+# Uploads up to this size are decoded straight from memory; bigger ones are
+# spooled to a uniquely named temp file that is deleted once decoded.
+MAX_IN_MEMORY_UPLOAD = 8 * 1024 * 1024  # 8 MB
 
 
 def clean_output(output: str) -> str:
@@ -15,32 +35,141 @@ def clean_output(output: str) -> str:
     return output.strip()
 
 
+def explanation_messages(text):
+    return build_messages(
+        "You are a helpful assistant. Explain clearly what the user's text means.",
+        "Text:\n{context}\n\nExplanation:",
+        context=text,
+    )
+
+
 def query_deepseek(text, model="llama3.2:3b"):
     """Send detected text to Llama for explanation (name kept for compatibility)."""
-    prompt = (
-        f"You are a helpful assistant. Explain clearly what this text means:\n\n"
-        f"Text:\n{text}\n\n"
-        f"Explanation:"
-    )
+    messages = explanation_messages(text)
+    # The user already has the OCR text; the explanation can wait behind questions
+    content, _ = chat(messages, model=model, priority=BACKGROUND)
+    return clean_output(content)
+
+
+# ------------------------------
+# Preprocessing
+# ------------------------------
+def resize_to_max_dimension(image, max_dimension):
+    """Downscale so the longest side is at most max_dimension (never upscales)."""
+    height, width = image.shape[:2]
+    longest = max(height, width)
+    if not max_dimension or longest <= max_dimension:
+        return image
+    scale = max_dimension / longest
+    return cv2.resize(image, (int(width * scale), int(height * scale)), interpolation=cv2.INTER_AREA)
 
-    result = subprocess.run(
-        [OLLAMA_PATH, "run", model],
-        input=prompt.encode("utf-8"),
-        capture_output=True
+
+def detect_text_region(gray, padding=16):
+    """Return (x, y, w, h) of the area containing text-like structure, or None."""
+    # Text strokes give strong local gradients; join them into blocks
+    kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3))
+    gradient = cv2.morphologyEx(gray, cv2.MORPH_GRADIENT, kernel)
+    _, binary = cv2.threshold(gradient, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+    joined = cv2.morphologyEx(
+        binary, cv2.MORPH_CLOSE, cv2.getStructuringElement(cv2.MORPH_RECT, (25, 5))
     )
-    return clean_output(result.stdout.decode("utf-8"))
+    contours, _ = cv2.findContours(joined, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+
+    # Ignore specks; keep boxes that are wider than tall like lines of text
+    boxes = [cv2.boundingRect(c) for c in contours]
+    boxes = [(x, y, w, h) for x, y, w, h in boxes if w >= 20 and h >= 8 and w >= h]
+    if not boxes:
+        return None
+
+    height, width = gray.shape[:2]
+    x0 = max(min(x for x, _, _, _ in boxes) - padding, 0)
+    y0 = max(min(y for _, y, _, _ in boxes) - padding, 0)
+    x1 = min(max(x + w for x, _, w, _ in boxes) + padding, width)
+    y1 = min(max(y + h for _, y, _, h in boxes) + padding, height)
+    return x0, y0, x1 - x0, y1 - y0
+
+
+def preprocess_image(image, config=None):
+    """
+    Apply the configured resize / grayscale / contrast / crop steps.
+    `image` is a BGR numpy array as returned by cv2.imread.
+    """
+    cfg = {**PREPROCESS_CONFIG, **(config or {})}
+
+    image = resize_to_max_dimension(image, cfg["max_dimension"])
+    clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+
+    if image.ndim == 3 and cfg["grayscale"]:
+        image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
+    if cfg["normalize_contrast"]:
+        if image.ndim == 2:
+            image = clahe.apply(image)
+        else:
+            # Equalise lightness only so colours are preserved
+            lab = cv2.cvtColor(image, cv2.COLOR_BGR2LAB)
+            lab[:, :, 0] = clahe.apply(lab[:, :, 0])
+            image = cv2.cvtColor(lab, cv2.COLOR_LAB2BGR)
+
+    if cfg["crop_text_region"]:
+        gray = image if image.ndim == 2 else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        region = detect_text_region(gray, cfg["crop_padding"])
+        if region:
+            x, y, w, h = region
+            image = image[y:y + h, x:x + w]
+
+    return image
+
+
+def run_ocr(image, config=None):
+    """Preprocess a BGR image array and return the detected text."""
+    with stage("ocr"):
+        prepared = preprocess_image(image, config)
+        results = get_ocr_reader().readtext(prepared, detail=0)  # detail=0 gives just the text list
+    return " ".join(results).strip()
+
+
+# ------------------------------
+# Upload decoding
+# ------------------------------
+def decode_image_upload(file_storage):
+    """Decode an uploaded image (werkzeug FileStorage) into a BGR array, or None."""
+    stream = file_storage.stream
+    data = stream.read(MAX_IN_MEMORY_UPLOAD + 1)
+    if not data:
+        return None  # cv2.imdecode raises on an empty buffer
+
+    if len(data) <= MAX_IN_MEMORY_UPLOAD:
+        return cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
+
+    # Large file: spill to a private temp file instead of holding it all in memory
+    suffix = os.path.splitext(file_storage.filename or "")[1]
+    with tempfile.NamedTemporaryFile(suffix=suffix) as tmp:
+        tmp.write(data)
+        del data
+        shutil.copyfileobj(stream, tmp)
+        tmp.flush()
+        return cv2.imread(tmp.name)
+
 
+def ask_image(image, preprocess=None):
+    """OCR an image (BGR array or file path) and explain the detected text."""
+    if isinstance(image, str):
+        image = cv2.imread(image)
+    if image is None:
+        return {"error": "Could not read image"}
 
-def ask_image(image_path: str):
     # OCR step
-    results = reader.readtext(image_path, detail=0)  # detail=0 gives just the text list
-    detected_text = " ".join(results).strip()
+    detected_text = run_ocr(image, preprocess)
 
     if not detected_text:
         return {"error": "No text detected in image"}
 
-    # Send to Llama for explanation
-    explanation = query_deepseek(detected_text)
+    # Send to Llama for explanation (skipped rather than failing the upload when busy)
+    try:
+        explanation = query_deepseek(detected_text)
+    except QueueFull:
+        explanation = None
 
     return {
         "detected_text": detected_text,
@@ -0,0 +1,170 @@
+# async_db.py
+import asyncio
+import uuid
+import aiomysql
+from metrics import stage
+from helper_func import (
+    index_from_rows,
+    keyword_segments_from_rows,
+    command_meta_from_rows,
+    serialize_embedding,
+    KEYWORD_SEGMENTS_SQL,
+    OUTLET_COMMAND_META_SQL,
+    OUTLET_SPREADSHEETS_SQL,
+    OUTLET_ROWS_AFTER_SQL,
+    OUTLET_ROW_COUNT_SQL,
+    OUTLET_ROW_IDS_SQL,
+    SPREADSHEET_PATTERNS,
+    DB_NAME,
+)
+
+# aiomysql versions of the helper_func loaders used by asgi_app. Same
+# queries; FAISS builds run in a thread so they don't block the event loop.
+DB_CONFIG = dict(host="localhost", user="root", password="", db=DB_NAME)
+POOL_MIN_SIZE = 1
+POOL_MAX_SIZE = 10
+
+_pool = None
+_pool_lock = None
+
+
+async def get_pool():
+    global _pool, _pool_lock
+    if _pool_lock is None:
+        _pool_lock = asyncio.Lock()
+    if _pool is None:
+        async with _pool_lock:
+            if _pool is None:
+                _pool = await aiomysql.create_pool(minsize=POOL_MIN_SIZE, maxsize=POOL_MAX_SIZE, **DB_CONFIG)
+    return _pool
+
+
+async def close_pool():
+    global _pool
+    if _pool is not None:
+        _pool.close()
+        await _pool.wait_closed()
+        _pool = None
+
+
+async def fetchall(sql, params=()):
+    with stage("db_fetch"):
+        pool = await get_pool()
+        async with pool.acquire() as conn:
+            async with conn.cursor(aiomysql.DictCursor) as cursor:
+                await cursor.execute(sql, params)
+                return await cursor.fetchall()
+
+
+async def fetchone(sql, params=()):
+    with stage("db_fetch"):
+        pool = await get_pool()
+        async with pool.acquire() as conn:
+            async with conn.cursor(aiomysql.DictCursor) as cursor:
+                await cursor.execute(sql, params)
+                return await cursor.fetchone()
+
+
+# ------------------------------
+# Loaders
+# ------------------------------
+async def load_document_from_db(doc_id, document_outlet_name):
+    if document_outlet_name is None:
+        rows = await fetchall("""
+            SELECT chunk_text, embedding
+            FROM embeddings
+            WHERE document_id=%s AND document_outlet_name IS NULL
+            ORDER BY chunk_index ASC
+        """, (doc_id,))
+    else:
+        rows = await fetchall("""
+            SELECT chunk_text, embedding
+            FROM embeddings
+            WHERE document_id=%s AND document_outlet_name=%s
+            ORDER BY chunk_index ASC
+        """, (doc_id, document_outlet_name))
+    return await asyncio.to_thread(index_from_rows, rows)
+
+
+async def load_outlet_rows_after(document_outlet_name, after_id):
+    return await fetchall(OUTLET_ROWS_AFTER_SQL, (document_outlet_name, after_id))
+
+
+async def load_outlet_rows_by_ids(ids, batch_size=500):
+    ids, rows = sorted(ids), []
+    for start in range(0, len(ids), batch_size):
+        batch = ids[start:start + batch_size]
+        placeholders = ",".join(["%s"] * len(batch))
+        rows.extend(await fetchall(
+            f"SELECT id, chunk_text, embedding FROM embeddings WHERE id IN ({placeholders})", tuple(batch)
+        ))
+    return rows
+
+
+async def count_outlet_rows(document_outlet_name, up_to_id):
+    row = await fetchone(OUTLET_ROW_COUNT_SQL, (document_outlet_name, up_to_id))
+    return row["row_count"]
+
+
+async def load_outlet_row_ids(document_outlet_name, up_to_id):
+    rows = await fetchall(OUTLET_ROW_IDS_SQL, (document_outlet_name, up_to_id))
+    return [row["id"] for row in rows]
+
+async def load_image_text(image_id):
+    row = await fetchone("SELECT detected_text FROM image_ocr WHERE id=%s", (image_id,))
+    if row:
+        return row["detected_text"]
+    return None
+
+
+async def load_image_index_from_db(image_id):
+    """Returns (chunks, index, created_at) or (None, None, None)."""
+    rows = await fetchall("""
+        SELECT e.chunk_text, e.embedding, UNIX_TIMESTAMP(i.created_at) AS created_ts
+        FROM image_ocr_embeddings e
+        JOIN image_ocr i ON i.id = e.image_id
+        WHERE e.image_id=%s
+        ORDER BY e.chunk_index ASC
+        """, (image_id,))
+    if not rows:
+        return None, None, None
+
+    chunks, index = await asyncio.to_thread(index_from_rows, rows)
+    return chunks, index, float(rows[0]['created_ts'])
+
+
+async def load_keyword_segments(document_outlet_name, after_id=0):
+    """Async helper_func.load_keyword_segments."""
+    rows = await fetchall(KEYWORD_SEGMENTS_SQL, (document_outlet_name, after_id))
+    return await asyncio.to_thread(keyword_segments_from_rows, rows)
+
+
+async def load_outlet_spreadsheet_ids(document_outlet_name):
+    rows = await fetchall(OUTLET_SPREADSHEETS_SQL, (document_outlet_name, *SPREADSHEET_PATTERNS))
+    return [row["id"] for row in rows]
+
+
+async def load_outlet_command_meta(document_outlet_name):
+    rows = await fetchall(OUTLET_COMMAND_META_SQL, (document_outlet_name,))
+    return command_meta_from_rows(rows)
+
+
+# ------------------------------
+# Writers
+# ------------------------------
+async def save_image_text(username, filename, detected_text, chunks=None, embeddings=None):
+    image_id = str(uuid.uuid4())
+    pool = await get_pool()
+    async with pool.acquire() as conn:
+        async with conn.cursor() as cursor:
+            await cursor.execute(
+                "INSERT INTO image_ocr (id, username, filename, detected_text) VALUES (%s, %s, %s, %s)",
+                (image_id, username, filename, detected_text)
+            )
+            if chunks is not None and embeddings is not None:
+                await cursor.executemany(
+                    "INSERT INTO image_ocr_embeddings (image_id, chunk_index, chunk_text, embedding) VALUES (%s, %s, %s, %s)",
+                    [(image_id, idx, chunk, serialize_embedding(emb)) for idx, (chunk, emb) in enumerate(zip(chunks, embeddings))]
+                )
+        await conn.commit()
+    return image_id
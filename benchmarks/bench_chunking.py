@@ -0,0 +1,135 @@
+# bench_chunking.py
+"""
+Retrieval hit-rate and index size: 500-word windows vs token-aware sentence chunks.
+
+Usage:
+    python benchmarks/bench_chunking.py DOC_DIR [--qa qa.jsonl] [--k 3] [--max-tokens 240 180] [--json out.json]
+
+DOC_DIR holds *.txt files. qa.jsonl has one {"question": ..., "answer": ...}
+per line; a question is a hit when a top-k chunk contains the answer text.
+"embedded hit" only counts the part of the chunk inside the embedder's
+256-token window, i.e. what the vector search can actually see. Without
+--qa, random sentences from the documents are used as both question and
+answer (an optimistic upper bound, but fine for comparing chunkers).
+"""
+import argparse
+import glob
+import json
+import os
+import random
+import re
+import statistics
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import faiss
+from chunking import (
+    EMBEDDER_MAX_TOKENS,
+    WORD_CHUNK_PARAMS,
+    chunk_document,
+    chunk_params,
+    split_sentences,
+)
+from models import get_embedder
+
+
+def normalise(text):
+    return re.sub(r"[^a-z0-9]+", " ", text.lower()).strip()
+
+
+def synthetic_qa(docs, count, seed=7):
+    sentences = [s for text in docs for s, _ in split_sentences(text) if len(s.split()) >= 8]
+    random.Random(seed).shuffle(sentences)
+    return [{"question": s, "answer": s} for s in sentences[:count]]
+
+
+def evaluate(name, params, docs, qa, k):
+    embedder = get_embedder()
+    tokenizer = embedder.tokenizer
+    window = EMBEDDER_MAX_TOKENS - 2  # CLS + SEP
+
+    chunks = [chunk for text in docs for chunk in chunk_document(text, params)]
+    token_counts = [len(tokenizer.encode(c, add_special_tokens=False)) for c in chunks]
+    # What the embedder actually sees of each chunk
+    embedded = [
+        normalise(tokenizer.decode(tokenizer.encode(c, add_special_tokens=False)[:window]))
+        for c in chunks
+    ]
+
+    embeddings = embedder.encode(chunks)
+    index = faiss.IndexFlatL2(embeddings.shape[1])
+    index.add(embeddings)
+
+    q_embed = embedder.encode([item["question"] for item in qa])
+    D, I = index.search(q_embed, k=min(k, index.ntotal))
+    hits = embedded_hits = 0
+    for item, row in zip(qa, I):
+        answer = normalise(item["answer"])
+        hits += any(answer in normalise(chunks[i]) for i in row)
+        embedded_hits += any(answer in embedded[i] for i in row)
+
+    over = [t for t in token_counts if t > window]
+    return {
+        "chunker": name,
+        "params": params,
+        "chunks": len(chunks),
+        "mean_tokens": round(statistics.mean(token_counts), 1),
+        "over_limit_chunks": len(over),
+        "unembedded_token_share": round(sum(t - window for t in over) / sum(token_counts), 3),
+        "index_bytes": index.ntotal * index.d * 4,
+        "text_bytes": sum(len(c.encode("utf-8")) for c in chunks),
+        f"hit_rate@{k}": round(hits / len(qa), 3),
+        f"embedded_hit_rate@{k}": round(embedded_hits / len(qa), 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("doc_dir")
+    parser.add_argument("--qa")
+    parser.add_argument("--synthetic", type=int, default=200, help="questions to sample when --qa is not given")
+    parser.add_argument("--k", type=int, default=3)
+    parser.add_argument("--max-tokens", type=int, nargs="+", default=[240])
+    parser.add_argument("--overlap-tokens", type=int, default=40)
+    parser.add_argument("--json", dest="json_path")
+    args = parser.parse_args()
+
+    paths = sorted(glob.glob(os.path.join(args.doc_dir, "*.txt")))
+    if not paths:
+        sys.exit(f"No .txt documents found in {args.doc_dir}")
+    docs = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            docs.append(f.read())
+
+    if args.qa:
+        with open(args.qa, encoding="utf-8") as f:
+            qa = [json.loads(line) for line in f if line.strip()]
+    else:
+        qa = synthetic_qa(docs, args.synthetic)
+    if not qa:
+        sys.exit("No questions to evaluate")
+
+    configs = [("words 500/50", WORD_CHUNK_PARAMS)]
+    for max_tokens in args.max_tokens:
+        params = chunk_params("sentences", max_tokens, args.overlap_tokens)
+        configs.append((f"sentences {params['max_tokens']}/{params['overlap_tokens']}", params))
+
+    results = [evaluate(name, params, docs, qa, args.k) for name, params in configs]
+
+    hit_key, embedded_key = f"hit_rate@{args.k}", f"embedded_hit_rate@{args.k}"
+    print(f"{len(docs)} documents, {len(qa)} questions\n")
+    print(f"{'chunker':<20} {'chunks':>7} {'tokens':>7} {'>limit':>7} {'lost':>6} {'index KB':>9} {'hit':>6} {'emb hit':>8}")
+    for row in results:
+        print(f"{row['chunker']:<20} {row['chunks']:>7} {row['mean_tokens']:>7.0f} {row['over_limit_chunks']:>7} "
+              f"{row['unembedded_token_share']:>6.1%} {row['index_bytes'] / 1024:>9.0f} "
+              f"{row[hit_key]:>6.3f} {row[embedded_key]:>8.3f}")
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# bench_import.py
+"""
+Worker start-up cost: time to import the app, and to load each model on first use.
+
+Usage:
+    python benchmarks/bench_import.py [--module app_new] [--runs 3] [--top 15] [--models] [--json out.json]
+
+Each run imports the module in a fresh interpreter, the way a gunicorn
+worker starts without --preload. --top lists the slowest imports from
+`python -X importtime`. --models also times models.warm_up per model in a
+fresh interpreter (load + one inference).
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+IMPORT_SNIPPET = (
+    "import time; start = time.perf_counter(); import {module}; "
+    "print(time.perf_counter() - start)"
+)
+WARM_SNIPPET = "import json, models; print(json.dumps(models.warm_up([{name!r}])))"
+
+
+def run_python(code, *flags):
+    result = subprocess.run(
+        [sys.executable, *flags, "-c", code], cwd=ROOT, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        sys.exit(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "import failed")
+    return result
+
+
+def import_seconds(module, runs):
+    return [float(run_python(IMPORT_SNIPPET.format(module=module)).stdout.strip().splitlines()[-1]) for _ in range(runs)]
+
+
+def slowest_imports(module, top):
+    """Parse -X importtime output into [(cumulative_seconds, module)]."""
+    stderr = run_python(f"import {module}", "-X", "importtime").stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        rows.append((int(cumulative) / 1e6, name.strip()))
+    # Only top-level packages, so nested submodules don't repeat their parent
+    rows = [row for row in rows if "." not in row[1]]
+    return sorted(rows, reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="app_new")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--models", action="store_true")
+    parser.add_argument("--json", dest="json_path")
+    args = parser.parse_args()
+
+    seconds = import_seconds(args.module, args.runs)
+    report = {
+        "module": args.module,
+        "runs": args.runs,
+        "mean_import_s": statistics.mean(seconds),
+        "min_import_s": min(seconds),
+        "slowest_imports": slowest_imports(args.module, args.top),
+    }
+    print(f"import {args.module}: mean {report['mean_import_s']:.2f}s  min {report['min_import_s']:.2f}s  ({args.runs} runs)")
+    print(f"\n{'cumulative s':>12}  module")
+    for cumulative, name in report["slowest_imports"]:
+        print(f"{cumulative:>12.3f}  {name}")
+
+    if args.models:
+        sys.path.insert(0, ROOT)
+        from models import LOADERS
+        report["first_use_s"] = {}
+        print(f"\n{'model':<10} {'first use s':>11}")
+        for name in LOADERS:
+            timings = json.loads(run_python(WARM_SNIPPET.format(name=name)).stdout.strip().splitlines()[-1])
+            report["first_use_s"][name] = timings[name]
+            print(f"{name:<10} {timings[name]:>11.2f}")
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
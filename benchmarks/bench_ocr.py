@@ -0,0 +1,105 @@
+# bench_ocr.py
+"""
+OCR latency vs character accuracy for the ask_image preprocessing presets.
+
+Usage:
+    python benchmarks/bench_ocr.py [IMAGE_DIR] [--repeat N] [--json out.json]
+
+Every *.jpg/*.jpeg/*.png in IMAGE_DIR is OCR'd with each preset. If a
+`<image name>.txt` file sits next to an image it is used as ground truth,
+otherwise the unprocessed OCR output is the reference.
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import cv2
+from ask_image import run_ocr
+
+PRESETS = {
+    "raw": {"max_dimension": None, "grayscale": False, "normalize_contrast": False, "crop_text_region": False},
+    "resize": {"grayscale": False, "normalize_contrast": False, "crop_text_region": False},
+    "resize+gray+clahe": {"crop_text_region": False},
+    "resize+gray+clahe+crop": {"crop_text_region": True},
+    "small(1024)+gray+clahe": {"max_dimension": 1024, "crop_text_region": False},
+}
+
+
+def edit_distance(a, b):
+    """Levenshtein distance, O(len(a) * len(b)) with two rows."""
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        cur = [i]
+        for j, cb in enumerate(b, 1):
+            cur.append(min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (ca != cb)))
+        prev = cur
+    return prev[-1]
+
+
+def char_accuracy(predicted, reference):
+    predicted = " ".join(predicted.lower().split())
+    reference = " ".join(reference.lower().split())
+    if not reference:
+        return 1.0 if not predicted else 0.0
+    return max(0.0, 1 - edit_distance(predicted, reference) / len(reference))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("image_dir", nargs="?", default=os.path.join(os.path.dirname(__file__), ".."))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", dest="json_path")
+    args = parser.parse_args()
+
+    paths = sorted(
+        p for ext in ("jpg", "jpeg", "png") for p in glob.glob(os.path.join(args.image_dir, f"*.{ext}"))
+    )
+    if not paths:
+        sys.exit(f"No images found in {args.image_dir}")
+
+    images = {p: cv2.imread(p) for p in paths}
+    references = {}
+    for path, image in images.items():
+        truth_path = os.path.splitext(path)[0] + ".txt"
+        if os.path.exists(truth_path):
+            with open(truth_path, encoding="utf-8") as f:
+                references[path] = f.read()
+        else:
+            references[path] = run_ocr(image, PRESETS["raw"])
+
+    # Warm the reader once so model load isn't counted in the first preset
+    run_ocr(images[paths[0]], PRESETS["resize+gray+clahe"])
+
+    results = []
+    for name, preset in PRESETS.items():
+        latencies, accuracies = [], []
+        for path, image in images.items():
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                text = run_ocr(image, preset)
+                latencies.append(time.perf_counter() - start)
+            accuracies.append(char_accuracy(text, references[path]))
+        results.append({
+            "preset": name,
+            "images": len(paths),
+            "mean_latency_s": sum(latencies) / len(latencies),
+            "max_latency_s": max(latencies),
+            "char_accuracy": sum(accuracies) / len(accuracies),
+        })
+
+    print(f"{'preset':<26} {'mean s':>8} {'max s':>8} {'accuracy':>9}")
+    for row in results:
+        print(f"{row['preset']:<26} {row['mean_latency_s']:>8.3f} {row['max_latency_s']:>8.3f} {row['char_accuracy']:>9.3f}")
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# bench_prompt_cache.py
+"""
+Prompt-eval time with and without Ollama prompt (KV) cache reuse.
+
+Usage:
+    python benchmarks/bench_prompt_cache.py [--context-file FILE] [--questions N] [--json out.json]
+
+"stable-prefix" sends the outlet context in an identical system message for
+every question, as app_new does for whole-outlet prompts. "no-reuse" sends
+the same content but starts each system message with a unique marker, so
+no prefix can be shared. Needs a running Ollama server (llm_client.OLLAMA_URL).
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import uuid
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from llm_client import chat, DEFAULT_MODEL
+from prompt_builder import build_messages
+
+# Mirrors app_new.OUTLET_SYSTEM_TEMPLATE (importing app_new would load every model)
+OUTLET_SYSTEM_TEMPLATE = (
+    "You are a helpful assistant. Answer the user's question using the context.\n"
+    "If information is not available, say 'No information provided'.\n\n"
+    "Context:\n{context}"
+)
+
+QUESTIONS = [
+    "What are the opening hours?",
+    "How much does the house special cost?",
+    "Do you offer delivery?",
+    "Which items are vegetarian?",
+    "What is the phone number?",
+    "Is there a student discount?",
+    "Can I book a table for ten people?",
+    "What desserts are available?",
+]
+
+
+def synthetic_context(items=60):
+    lines = []
+    for i in range(items):
+        lines.append(
+            f"Item {i}: Dish number {i} served with rice and salad. "
+            f"Price Rs. {150 + i * 10}. Code ITM{i:04d}. Available daily from 10am to 9pm."
+        )
+    return " ".join(lines)
+
+
+def run(mode, context, questions, model):
+    results = []
+    for question in questions:
+        system = OUTLET_SYSTEM_TEMPLATE
+        if mode == "no-reuse":
+            system = f"[request {uuid.uuid4()}]\n" + system
+        messages = build_messages(system, "Question: {question}", context=context, question=question)
+        _, stats = chat(messages, model=model, options={"num_predict": 1})
+        results.append(stats)
+    # The first request of each mode is cold either way
+    warm = results[1:] or results
+    return {
+        "mode": mode,
+        "requests": len(results),
+        "mean_prompt_eval_ms": statistics.mean(r["prompt_eval_ms"] for r in warm),
+        "mean_prompt_eval_tokens": statistics.mean(r["prompt_eval_count"] for r in warm),
+        "mean_total_ms": statistics.mean(r["total_ms"] for r in warm),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--context-file")
+    parser.add_argument("--questions", type=int, default=len(QUESTIONS))
+    parser.add_argument("--model", default=DEFAULT_MODEL)
+    parser.add_argument("--json", dest="json_path")
+    args = parser.parse_args()
+
+    if args.context_file:
+        with open(args.context_file, encoding="utf-8") as f:
+            context = f.read()
+    else:
+        context = synthetic_context()
+    questions = (QUESTIONS * (args.questions // len(QUESTIONS) + 1))[:args.questions]
+
+    results = [run(mode, context, questions, args.model) for mode in ("no-reuse", "stable-prefix")]
+
+    print(f"{'mode':<14} {'prompt eval ms':>15} {'evaluated tokens':>17} {'total ms':>9}")
+    for row in results:
+        print(f"{row['mode']:<14} {row['mean_prompt_eval_ms']:>15.0f} "
+              f"{row['mean_prompt_eval_tokens']:>17.0f} {row['mean_total_ms']:>9.0f}")
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
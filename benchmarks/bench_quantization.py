@@ -0,0 +1,112 @@
+# bench_quantization.py
+"""
+Recall and size of float16 / int8 embedding storage against float32.
+
+Usage:
+    python benchmarks/bench_quantization.py DOC_DIR [--qa qa.jsonl] [--k 3 10] [--json out.json]
+
+DOC_DIR holds *.txt files, chunked as an upload would be. Every chunk
+embedding goes through serialize_embedding / deserialize_embedding for
+each EMBEDDING_STORAGE mode and into that mode's FAISS index.
+"recall@k" is the share of the float32 top-k the mode also returns;
+"hit_rate@k" is the share of questions whose answer text is in a top-k
+chunk. Without --qa, random sentences from the documents are used as
+both question and answer.
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import faiss
+import numpy as np
+from bench_chunking import normalise, synthetic_qa
+from chunking import chunk_document
+from helper_func import (
+    EMBEDDING_STORAGE_MODES,
+    deserialize_embedding,
+    new_faiss_index,
+    serialize_embedding,
+)
+from models import embed
+
+
+def evaluate(storage, embeddings, q_embed, truth, chunks, qa, ks):
+    blobs = [serialize_embedding(e, storage) for e in embeddings]
+    vectors = np.array([deserialize_embedding(b) for b in blobs], dtype="float32")
+    index = new_faiss_index(vectors.shape[1], storage)
+    index.add(vectors)
+
+    k_max = max(ks)
+    _, I = index.search(q_embed, k_max)
+    result = {
+        "storage": storage,
+        "blob_bytes": round(sum(len(b) for b in blobs) / len(blobs)),
+        "db_bytes": sum(len(b) for b in blobs),
+        "index_bytes": len(faiss.serialize_index(index)),
+    }
+    for k in ks:
+        overlap = [len(set(row[:k]) & set(expected[:k])) / k for row, expected in zip(I, truth)]
+        result[f"recall@{k}"] = round(float(np.mean(overlap)), 4)
+        hits = sum(any(normalise(item["answer"]) in normalise(chunks[i]) for i in row[:k]) for item, row in zip(qa, I))
+        result[f"hit_rate@{k}"] = round(hits / len(qa), 3)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("doc_dir")
+    parser.add_argument("--qa")
+    parser.add_argument("--synthetic", type=int, default=200, help="questions to sample when --qa is not given")
+    parser.add_argument("--k", type=int, nargs="+", default=[3, 10])
+    parser.add_argument("--json", dest="json_path")
+    args = parser.parse_args()
+
+    paths = sorted(glob.glob(os.path.join(args.doc_dir, "*.txt")))
+    if not paths:
+        sys.exit(f"No .txt documents found in {args.doc_dir}")
+    docs = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            docs.append(f.read())
+
+    if args.qa:
+        with open(args.qa, encoding="utf-8") as f:
+            qa = [json.loads(line) for line in f if line.strip()]
+    else:
+        qa = synthetic_qa(docs, args.synthetic)
+    if not qa:
+        sys.exit("No questions to evaluate")
+
+    chunks = [chunk for text in docs for chunk in chunk_document(text)]
+    ks = [k for k in args.k if k <= len(chunks)]
+    if not ks:
+        sys.exit(f"Only {len(chunks)} chunks; lower --k")
+    embeddings = np.asarray(embed(chunks), dtype="float32")
+    q_embed = np.asarray(embed([item["question"] for item in qa]), dtype="float32")
+
+    exact = faiss.IndexFlatL2(embeddings.shape[1])
+    exact.add(embeddings)
+    _, truth = exact.search(q_embed, max(ks))
+
+    results = [evaluate(storage, embeddings, q_embed, truth, chunks, qa, ks) for storage in EMBEDDING_STORAGE_MODES]
+
+    print(f"{len(docs)} documents, {len(chunks)} chunks, {len(qa)} questions\n")
+    header = f"{'storage':<9} {'blob B':>7} {'DB KB':>8} {'index KB':>9}"
+    header += "".join(f" {'recall@' + str(k):>10} {'hit@' + str(k):>7}" for k in ks)
+    print(header)
+    for row in results:
+        line = f"{row['storage']:<9} {row['blob_bytes']:>7} {row['db_bytes'] / 1024:>8.0f} {row['index_bytes'] / 1024:>9.0f}"
+        line += "".join(f" {row[f'recall@{k}']:>10.4f} {row[f'hit_rate@{k}']:>7.3f}" for k in ks)
+        print(line)
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+# bench_rag.py
+"""
+Offline benchmark of the RAG request path: ingest throughput, /ask-outlet
+latency percentiles and worker memory, as JSON for comparing versions.
+
+Usage:
+    python benchmarks/bench_rag.py [--db llm_bench] [--init-db] [--outlets 2] [--docs 20]
+        [--paragraphs 30] [--questions 200] [--concurrency 4] [--llm-latency-ms 800]
+        [--llm-in-flight 1] [--seed 7] [--keep] [--json out.json]
+
+app_new runs in-process (one worker, Flask test client) against a scratch
+MariaDB database and a stub Ollama server that waits --llm-latency-ms and
+returns a canned answer, so timings only depend on the code under test.
+--init-db creates the scratch database with the table definitions from
+--schema-from (default: llm). Synthetic outlets come from a fixed seed and
+are deleted afterwards unless --keep. The embedder must already be in the
+local Hugging Face cache.
+
+Per-stage medians are read from each response's Server-Timing header.
+"""
+import argparse
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+import numpy as np
+import psutil
+from stub_ollama import start_stub_llm
+
+OUTLET_PREFIX = "bench-outlet-"
+BENCH_TABLES = ("documents", "embeddings", "outlet_keyword_segments")
+FILLER = (
+    "delivery kitchen order table staff menu customer fresh daily special service weekend "
+    "counter booking payment receipt discount offer combo portion spicy mild sweet sour "
+    "starter main dessert beverage vegetarian branch timing holiday parking takeaway"
+).split()
+
+
+# ------------------------------
+# Synthetic outlets
+# ------------------------------
+def sentence(rng, items):
+    if rng.random() < 0.3:
+        code, price = rng.choice(items)
+        return f"Item {code} costs Rs. {price} and is served {rng.choice(FILLER)}."
+    words = rng.sample(FILLER, rng.randint(8, 16))
+    return " ".join(words).capitalize() + "."
+
+
+def synthetic_outlet(rng, outlet_no, docs, paragraphs):
+    """([(filename, text)], [question]) for one outlet."""
+    items = [(f"ITM{outlet_no:02d}{n:04d}", rng.randint(50, 2000)) for n in range(docs * paragraphs)]
+    files = []
+    for doc_no in range(docs):
+        text = "\n\n".join(
+            " ".join(sentence(rng, items) for _ in range(rng.randint(3, 7)))
+            for _ in range(paragraphs)
+        )
+        files.append((f"bench_{outlet_no}_{doc_no}.txt", text))
+    questions = [f"How much does {code} cost?" for code, _ in rng.sample(items, min(len(items), 50))]
+    questions += [f"Do you have {rng.choice(FILLER)} {rng.choice(FILLER)} options?" for _ in range(50)]
+    return files, questions
+
+
+# ------------------------------
+# Database
+# ------------------------------
+def init_db(db, source):
+    import mysql.connector
+
+    conn = mysql.connector.connect(host="localhost", user="root", password="")
+    cursor = conn.cursor()
+    cursor.execute(f"CREATE DATABASE IF NOT EXISTS `{db}`")
+    for table in BENCH_TABLES:
+        cursor.execute(f"CREATE TABLE IF NOT EXISTS `{db}`.`{table}` LIKE `{source}`.`{table}`")
+    conn.commit()
+    cursor.close()
+    conn.close()
+
+
+def delete_outlets(outlets):
+    from helper_func import get_db_connection
+
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    placeholders = ",".join(["%s"] * len(outlets))
+    cursor.execute(f"DELETE FROM embeddings WHERE document_outlet_name IN ({placeholders})", tuple(outlets))
+    cursor.execute(f"DELETE FROM documents WHERE document_outlet_name IN ({placeholders})", tuple(outlets))
+    cursor.execute(f"DELETE FROM outlet_keyword_segments WHERE document_outlet_name IN ({placeholders})", tuple(outlets))
+    conn.commit()
+    cursor.close()
+    conn.close()
+
+
+# ------------------------------
+# Measurement
+# ------------------------------
+def rss_mb():
+    return round(psutil.Process().memory_info().rss / 2**20, 1)
+
+
+def percentiles(values):
+    if not values:
+        return {}
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {
+        "p50_ms": round(float(p50), 1),
+        "p95_ms": round(float(p95), 1),
+        "p99_ms": round(float(p99), 1),
+        "mean_ms": round(float(np.mean(values)), 1),
+        "max_ms": round(float(np.max(values)), 1),
+    }
+
+
+def parse_server_timing(header):
+    """{stage: ms} from 'db_fetch;dur=12.5, embed;dur=30.1, total;dur=48.0' (total dropped)."""
+    stages = {}
+    for part in (header or "").split(","):
+        name, _, dur = part.strip().partition(";dur=")
+        if name and dur and name != "total":
+            stages[name] = float(dur)
+    return stages
+
+
+def timed_post(client, path, **kwargs):
+    start = time.perf_counter()
+    response = client.post(path, **kwargs)
+    return response, (time.perf_counter() - start) * 1000
+
+
+def ingest(client, outlets):
+    upload_ms, chunks = [], 0
+    start = time.perf_counter()
+    for outlet, (files, _) in outlets.items():
+        for filename, text in files:
+            response, ms = timed_post(client, "/upload", data={
+                "username": "bench",
+                "document_outlet_name": outlet,
+                "file": (BytesIO(text.encode("utf-8")), filename),
+            }, content_type="multipart/form-data")
+            body = response.get_json() or {}
+            if response.status_code != 200:
+                sys.exit(f"Upload failed ({response.status_code}): {body}")
+            upload_ms.append(ms)
+            chunks += body.get("new_chunks", 0)
+    seconds = time.perf_counter() - start
+    return {
+        "documents": len(upload_ms),
+        "chunks": chunks,
+        "seconds": round(seconds, 2),
+        "docs_per_s": round(len(upload_ms) / seconds, 2),
+        "chunks_per_s": round(chunks / seconds, 1),
+        "upload": percentiles(upload_ms),
+    }
+
+
+def ask_outlets(client, outlets, total, concurrency, seed):
+    # First question per outlet builds its index: reported apart from the steady state
+    cold_ms = {}
+    for outlet, (_, questions) in outlets.items():
+        _, cold_ms[outlet] = timed_post(client, "/ask-outlet", json={
+            "question": questions[0], "document_outlet_name": outlet,
+        })
+
+    rng = random.Random(seed)
+    jobs = []
+    for _ in range(total):
+        outlet = rng.choice(list(outlets))
+        jobs.append((outlet, rng.choice(outlets[outlet][1])))
+
+    def ask(job):
+        outlet, question = job
+        response, ms = timed_post(client, "/ask-outlet", json={
+            "question": question, "document_outlet_name": outlet,
+        })
+        return response.status_code, ms, parse_server_timing(response.headers.get("Server-Timing"))
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(ask, jobs))
+    seconds = time.perf_counter() - start
+
+    ok_ms = [ms for status, ms, _ in results if status == 200]
+    stages = {}
+    for status, _, timings in results:
+        if status == 200:
+            for name, ms in timings.items():
+                stages.setdefault(name, []).append(ms)
+    return {
+        "requests": total,
+        "status_counts": dict(Counter(status for status, _, _ in results)),
+        "throughput_rps": round(total / seconds, 2),
+        "cold_ms": {outlet: round(ms, 1) for outlet, ms in cold_ms.items()},
+        **percentiles(ok_ms),
+        "stage_p50_ms": {name: round(float(np.percentile(values, 50)), 1) for name, values in stages.items()},
+    }
+
+
+def git_version():
+    try:
+        return subprocess.run(
+            ["git", "describe", "--always", "--dirty"], cwd=ROOT, capture_output=True, text=True
+        ).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db", default="llm_bench")
+    parser.add_argument("--init-db", action="store_true")
+    parser.add_argument("--schema-from", default="llm")
+    parser.add_argument("--outlets", type=int, default=2)
+    parser.add_argument("--docs", type=int, default=20, help="documents per outlet")
+    parser.add_argument("--paragraphs", type=int, default=30, help="paragraphs per document")
+    parser.add_argument("--questions", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--llm-latency-ms", type=float, default=800)
+    parser.add_argument("--llm-in-flight", type=int, default=1, help="LLM_MAX_IN_FLIGHT for the run")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--keep", action="store_true", help="leave the synthetic outlets in the database")
+    parser.add_argument("--json", dest="json_path")
+    args = parser.parse_args()
+
+    if args.db == args.schema_from:
+        sys.exit("Refusing to benchmark against the schema source database; pass a scratch --db")
+    if args.init_db:
+        init_db(args.db, args.schema_from)
+
+    server, llm_url = start_stub_llm(args.llm_latency_ms)
+    # Read by helper_func / llm_client / llm_scheduler at import
+    os.environ["LLM_DB_NAME"] = args.db
+    os.environ["OLLAMA_URL"] = llm_url
+    os.environ["PRODUCTS_URL"] = f"{llm_url}/products"
+    os.environ["LLM_MAX_IN_FLIGHT"] = str(args.llm_in_flight)
+    os.environ["LLM_MAX_QUEUE"] = str(max(args.concurrency, 8))
+
+    memory = {"start": rss_mb()}
+    from app_new import app
+    from models import warm_up
+    memory["imported"] = rss_mb()
+    warm_up(["embedder", "tokenizer"])
+    memory["models_loaded"] = rss_mb()
+
+    rng = random.Random(args.seed)
+    outlets = {
+        f"{OUTLET_PREFIX}{n}": synthetic_outlet(rng, n, args.docs, args.paragraphs)
+        for n in range(args.outlets)
+    }
+    delete_outlets(list(outlets))  # leftovers of an interrupted --keep run
+
+    client = app.test_client()
+    try:
+        ingest_report = ingest(client, outlets)
+        memory["after_ingest"] = rss_mb()
+        ask_report = ask_outlets(client, outlets, args.questions, args.concurrency, args.seed)
+        memory["after_queries"] = rss_mb()
+    finally:
+        if not args.keep:
+            delete_outlets(list(outlets))
+        server.shutdown()
+    memory["peak"] = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+
+    report = {
+        "version": git_version(),
+        "config": {k: v for k, v in vars(args).items() if k not in ("json_path", "keep", "init_db")},
+        "ingest": ingest_report,
+        "ask_outlet": ask_report,
+        "memory_mb": memory,
+    }
+
+    print(f"ingest: {ingest_report['documents']} docs / {ingest_report['chunks']} chunks in "
+          f"{ingest_report['seconds']}s ({ingest_report['docs_per_s']} docs/s, {ingest_report['chunks_per_s']} chunks/s)")
+    print(f"/ask-outlet: {args.questions} requests x{args.concurrency}, {ask_report['throughput_rps']} req/s, "
+          f"p50 {ask_report.get('p50_ms')}ms  p95 {ask_report.get('p95_ms')}ms  p99 {ask_report.get('p99_ms')}ms  "
+          f"status {ask_report['status_counts']}")
+    print("stage p50 ms: " + "  ".join(f"{k}={v}" for k, v in ask_report["stage_p50_ms"].items()))
+    print("memory MB: " + "  ".join(f"{k}={v}" for k, v in memory.items()))
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+# load_widget.py
+"""
+Load test that replays the widget's conversational sessions against a
+running instance and reports throughput and tail latency per step.
+
+Usage:
+    python benchmarks/load_widget.py --outlet OUTLET [--base-url http://127.0.0.1:8015]
+        [--sessions 200] [--concurrency 16] [--slot-turns 3] [--menu-share 0.1]
+        [--question-share 0.1] [--think-ms 0] [--seed 7] [--seed-commands] [--json out.json]
+
+One session is what the iframe widget does:
+    GET  /commands/rootcommands?document_outlet_name=   pick a root command
+    GET  /commands/<outlet>?parent_id=                   walk down to a leaf
+    POST /ask-outlet-command-slots                       one turn per slot, up to --slot-turns
+plus, in some sessions, a free-text question (no command_id) and a
+POST /ask-menu.
+
+Point the instance at the stubs first so the LLM latency is fixed:
+    python benchmarks/stub_ollama.py --port 11500 --latency-ms 800
+    OLLAMA_URL=http://127.0.0.1:11500 PRODUCTS_URL=http://127.0.0.1:11500/products \\
+        gunicorn -c gunicorn.conf.py app_new:app
+--seed-commands creates a synthetic command tree for --outlet through
+POST /commands/ and deletes it afterwards.
+"""
+import argparse
+import json
+import random
+import sys
+import time
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from bench_rag import percentiles, git_version
+
+STEPS = ("rootcommands", "subcommands", "command_slots", "general_question", "ask_menu")
+MAX_DEPTH = 4
+REQUEST_TIMEOUT = 300
+SLOT_VALUES = {
+    "name": ["Asha", "Ravi", "Meera", "John"],
+    "date": ["2026-11-02", "tomorrow", "next friday"],
+    "time": ["7pm", "12:30", "8 pm"],
+    "phone": ["9876543210", "9123456780"],
+    "guests": ["2", "4", "6"],
+}
+QUESTIONS = [
+    "What are your opening hours?",
+    "Do you deliver to my area?",
+    "Which dishes are vegetarian?",
+    "Is there parking nearby?",
+]
+MENU_QUESTIONS = ["Show me all products", "What is the price of Product 3?", "Show me 5 products"]
+
+
+def synthetic_commands():
+    """Two-level tree: root -> subcommands, leaves with 0-3 slots."""
+    slot_sets = [[], ["name"], ["name", "date", "time"], ["phone", "guests"]]
+    return [
+        {
+            "command_text": f"Load test {root}",
+            "slots": [],
+            "subcommands": [
+                {"command_text": f"Load test {root}.{sub}", "slots": slot_sets[(root + sub) % len(slot_sets)]}
+                for sub in range(3)
+            ],
+        }
+        for root in range(4)
+    ]
+
+
+class Recorder:
+    def __init__(self):
+        self.samples = {step: [] for step in STEPS}  # [(status, ms)]
+
+    def call(self, step, session, method, url, **kwargs):
+        start = time.perf_counter()
+        try:
+            response = session.request(method, url, timeout=REQUEST_TIMEOUT, **kwargs)
+            status = response.status_code
+        except requests.RequestException:
+            response, status = None, "error"
+        self.samples[step].append((status, (time.perf_counter() - start) * 1000))
+        return response if status == 200 else None
+
+
+def slot_value(name, rng):
+    return rng.choice(SLOT_VALUES.get(name.lower(), ["test value"]))
+
+
+def run_session(base_url, outlet, args, recorder, seed):
+    rng = random.Random(seed)
+    http = requests.Session()
+    user_id = f"load-{uuid.uuid4()}"
+
+    def pause():
+        if args.think_ms:
+            time.sleep(args.think_ms / 1000)
+
+    response = recorder.call("rootcommands", http, "GET", f"{base_url}/commands/rootcommands",
+                             params={"document_outlet_name": outlet})
+    roots = (response.json().get("rootcommands") if response is not None else None) or []
+    if roots:
+        command_id = rng.choice(roots)["parent_id"]
+        for _ in range(MAX_DEPTH):
+            pause()
+            response = recorder.call("subcommands", http, "GET", f"{base_url}/commands/{outlet}",
+                                     params={"parent_id": command_id})
+            children = (response.json().get("commands") if response is not None else None) or []
+            if not children:
+                break
+            command_id = rng.choice(children)["command_id"]
+
+        # First turn asks for the command's slots; later turns fill one each
+        slots = {}
+        for _ in range(1 + args.slot_turns):
+            pause()
+            response = recorder.call("command_slots", http, "POST", f"{base_url}/ask-outlet-command-slots", json={
+                "document_outlet_name": outlet, "user_id": user_id, "command_id": command_id, "slots": slots,
+            })
+            if response is None:
+                break
+            body = response.json()
+            missing = [name for name, value in (body.get("slots") or {}).items() if value in (None, "")]
+            if body.get("ready_to_call_api") or not missing:
+                break
+            slots = {missing[0]: slot_value(missing[0], rng)}
+
+    if rng.random() < args.question_share:
+        pause()
+        recorder.call("general_question", http, "POST", f"{base_url}/ask-outlet-command-slots", json={
+            "document_outlet_name": outlet, "user_id": user_id, "question": rng.choice(QUESTIONS),
+        })
+    if rng.random() < args.menu_share:
+        pause()
+        recorder.call("ask_menu", http, "POST", f"{base_url}/ask-menu", json={"question": rng.choice(MENU_QUESTIONS)})
+
+
+def seed_commands(base_url, outlet):
+    response = requests.post(f"{base_url}/commands/", json={
+        "document_outlet_name": outlet, "commands": synthetic_commands(),
+    }, timeout=REQUEST_TIMEOUT)
+    if response.status_code != 201:
+        sys.exit(f"Could not create commands ({response.status_code}): {response.text}")
+
+
+def delete_seeded_commands(base_url, outlet):
+    response = requests.get(f"{base_url}/commands/rootcommands", params={"document_outlet_name": outlet},
+                            timeout=REQUEST_TIMEOUT)
+    for root in response.json().get("rootcommands", []):
+        if root["command_text"].startswith("Load test "):
+            requests.delete(f"{base_url}/commands/delete/{root['parent_id']}", timeout=REQUEST_TIMEOUT)
+
+
+def report(recorder, seconds):
+    steps = {}
+    for step, samples in recorder.samples.items():
+        if not samples:
+            continue
+        ok_ms = [ms for status, ms in samples if status == 200]
+        steps[step] = {
+            "requests": len(samples),
+            "status_counts": {str(k): v for k, v in Counter(status for status, _ in samples).items()},
+            "throughput_rps": round(len(samples) / seconds, 2),
+            **percentiles(ok_ms),
+        }
+    return steps
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://127.0.0.1:8015")
+    parser.add_argument("--outlet", required=True)
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--slot-turns", type=int, default=3, help="slot-filling turns after the first")
+    parser.add_argument("--menu-share", type=float, default=0.1, help="share of sessions that also call /ask-menu")
+    parser.add_argument("--question-share", type=float, default=0.1, help="share with a free-text question")
+    parser.add_argument("--think-ms", type=float, default=0, help="pause between a session's steps")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--seed-commands", action="store_true")
+    parser.add_argument("--json", dest="json_path")
+    args = parser.parse_args()
+    base_url = args.base_url.rstrip("/")
+
+    if args.seed_commands:
+        seed_commands(base_url, args.outlet)
+
+    recorder = Recorder()
+    start = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            list(pool.map(
+                lambda n: run_session(base_url, args.outlet, args, recorder, args.seed + n),
+                range(args.sessions),
+            ))
+    finally:
+        if args.seed_commands:
+            delete_seeded_commands(base_url, args.outlet)
+    seconds = time.perf_counter() - start
+
+    steps = report(recorder, seconds)
+    result = {
+        "version": git_version(),
+        "config": {k: v for k, v in vars(args).items() if k != "json_path"},
+        "seconds": round(seconds, 2),
+        "sessions_per_s": round(args.sessions / seconds, 2),
+        "steps": steps,
+    }
+
+    print(f"{args.sessions} sessions x{args.concurrency} in {seconds:.1f}s ({result['sessions_per_s']} sessions/s)\n")
+    print(f"{'step':<18} {'reqs':>6} {'req/s':>7} {'p50':>8} {'p95':>8} {'p99':>8}  status")
+    for step, row in steps.items():
+        print(f"{step:<18} {row['requests']:>6} {row['throughput_rps']:>7} {row.get('p50_ms', '-'):>8} "
+              f"{row.get('p95_ms', '-'):>8} {row.get('p99_ms', '-'):>8}  {row['status_counts']}")
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
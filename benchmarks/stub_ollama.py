@@ -0,0 +1,82 @@
+# stub_ollama.py
+"""
+Stand-ins for the external services the app calls, for offline benchmarks.
+
+    python benchmarks/stub_ollama.py [--port 11500] [--latency-ms 800]
+
+POST /api/chat answers like Ollama after --latency-ms with a canned reply;
+GET /products returns a small DummyJSON-style catalogue for /ask-menu.
+Start the app with OLLAMA_URL=http://127.0.0.1:PORT and
+PRODUCTS_URL=http://127.0.0.1:PORT/products to use it.
+"""
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+STUB_ANSWER = "This is a canned benchmark answer."
+STUB_PRODUCTS = [
+    {
+        "title": f"Product {n}",
+        "description": f"Synthetic product number {n} for load tests.",
+        "price": 5 + n,
+        "thumbnail": f"https://example.invalid/products/{n}.png",
+    }
+    for n in range(30)
+]
+
+
+class StubOllama(BaseHTTPRequestHandler):
+    latency = 0.0
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        time.sleep(self.latency)
+        prompt_chars = sum(len(m.get("content", "")) for m in body.get("messages", []))
+        self.send_json({
+            "message": {"role": "assistant", "content": STUB_ANSWER},
+            "prompt_eval_count": prompt_chars // 4,
+            "prompt_eval_duration": 0,
+            "eval_count": 8,
+            "total_duration": int(self.latency * 1e9),
+            "done": True,
+        })
+
+    def do_GET(self):
+        if self.path.startswith("/products"):
+            self.send_json({"products": STUB_PRODUCTS})
+        else:
+            self.send_error(404)
+
+    def send_json(self, payload):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_stub_llm(latency_ms, port=0):
+    """Serve the stubs on a background thread; returns (server, base_url)."""
+    StubOllama.latency = latency_ms / 1000
+    server = ThreadingHTTPServer(("127.0.0.1", port), StubOllama)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=11500)
+    parser.add_argument("--latency-ms", type=float, default=800)
+    args = parser.parse_args()
+    server, url = start_stub_llm(args.latency_ms, args.port)
+    print(f"Stub Ollama on {url} (latency {args.latency_ms:.0f}ms); Ctrl-C to stop")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
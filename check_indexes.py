@@ -0,0 +1,150 @@
+# check_indexes.py
+"""
+EXPLAIN every hot query from helper_func.py / command paths and fail if any
+of them scans a whole table or filesorts.
+
+    python check_indexes.py
+
+Run it against a database with realistic row counts: on near-empty tables
+the optimizer may legitimately prefer a full scan.
+"""
+import sys
+from helper_func import get_db_connection
+
+SAMPLE_DOC = "00000000-0000-0000-0000-000000000000"
+SAMPLE_OUTLET = "sample-outlet"
+
+# (name, query, params, expected index)
+HOT_QUERIES = [
+    (
+        "load_outlet_rows_after",
+        "SELECT id, chunk_text, embedding FROM embeddings WHERE document_outlet_name=%s AND id > %s ORDER BY id",
+        (SAMPLE_OUTLET, 0),
+        "outlet_id",
+    ),
+    (
+        "count_outlet_rows",
+        "SELECT COUNT(*) AS row_count FROM embeddings WHERE document_outlet_name=%s AND id <= %s",
+        (SAMPLE_OUTLET, 1000),
+        "outlet_id",
+    ),
+    (
+        "load_outlet_row_ids",
+        "SELECT id FROM embeddings WHERE document_outlet_name=%s AND id <= %s",
+        (SAMPLE_OUTLET, 1000),
+        "outlet_id",
+    ),
+    (
+        "insert_keyword_segment (first build)",
+        "SELECT chunk_text FROM embeddings WHERE document_outlet_name=%s ORDER BY chunk_index ASC",
+        (SAMPLE_OUTLET,),
+        "outlet_chunk",
+    ),
+    (
+        "load_document_from_db",
+        "SELECT chunk_text, embedding FROM embeddings WHERE document_id=%s AND document_outlet_name=%s ORDER BY chunk_index ASC",
+        (SAMPLE_DOC, SAMPLE_OUTLET),
+        "document_outlet_chunk",
+    ),
+    (
+        "load_document_from_db (no outlet)",
+        "SELECT chunk_text, embedding FROM embeddings WHERE document_id=%s AND document_outlet_name IS NULL ORDER BY chunk_index ASC",
+        (SAMPLE_DOC,),
+        "document_outlet_chunk",
+    ),
+    (
+        "load_image_index_from_db",
+        "SELECT chunk_text, embedding FROM image_ocr_embeddings WHERE image_id=%s ORDER BY chunk_index ASC",
+        (SAMPLE_DOC,),
+        "image_id_chunk_index",
+    ),
+    (
+        "delete_old_documents",
+        "SELECT id FROM documents WHERE document_outlet_name IS NULL AND created_at < NOW() - INTERVAL 30 MINUTE ORDER BY created_at LIMIT 500",
+        (),
+        "outlet_created_at",
+    ),
+    (
+        "delete_old_images",
+        "SELECT id FROM image_ocr WHERE created_at < NOW() - INTERVAL 30 MINUTE ORDER BY created_at LIMIT 500",
+        (),
+        "created_at",
+    ),
+    (
+        "get_command_slots",
+        "SELECT slot_name FROM outlet_command_slots WHERE command_id=%s AND required=1",
+        (1,),
+        "command_required",
+    ),
+    (
+        "get_root_commands",
+        "SELECT command_id, command_text FROM outlet_commands WHERE parent_command_id IS NULL AND document_outlet_name=%s ORDER BY command_text",
+        (SAMPLE_OUTLET,),
+        "outlet_parent_text",
+    ),
+    (
+        "get_outlet_commands (children)",
+        "SELECT command_id, command_text, parent_command_id FROM outlet_commands WHERE document_outlet_name=%s AND parent_command_id=%s",
+        (SAMPLE_OUTLET, 1),
+        "outlet_parent_text",
+    ),
+    (
+        "load_outlet_spreadsheet_ids",
+        "SELECT id FROM documents WHERE document_outlet_name=%s AND (filename LIKE %s OR filename LIKE %s) ORDER BY created_at",
+        (SAMPLE_OUTLET, "%.xls", "%.xlsx"),
+        "outlet_created_at",
+    ),
+    (
+        "reuse_document",
+        "SELECT id FROM documents WHERE content_hash=%s AND document_outlet_name <=> %s AND chunk_params <=> %s LIMIT 1",
+        ("0" * 64, SAMPLE_OUTLET, "{}"),
+        "content_hash",
+    ),
+    (
+        "load_outlet_chunk_embeddings",
+        "SELECT chunk_hash, MIN(id) FROM embeddings WHERE document_outlet_name=%s AND chunk_hash IN (%s, %s) GROUP BY chunk_hash",
+        (SAMPLE_OUTLET, "0" * 64, "1" * 64),
+        "outlet_chunk_hash",
+    ),
+    (
+        "load_keyword_segments",
+        "SELECT id, segment_blob FROM outlet_keyword_segments WHERE document_outlet_name=%s AND id > %s ORDER BY id",
+        (SAMPLE_OUTLET, 0),
+        "outlet_id",
+    ),
+]
+
+
+def explain(cursor, query, params):
+    cursor.execute("EXPLAIN " + query, params)
+    return cursor.fetchall()
+
+
+def check():
+    conn = get_db_connection()
+    cursor = conn.cursor(dictionary=True)
+    failures = []
+
+    for name, query, params, expected in HOT_QUERIES:
+        for row in explain(cursor, query, params):
+            extra = row.get("Extra") or ""
+            problems = []
+            if row.get("type") == "ALL" or not row.get("key"):
+                problems.append("full scan")
+            if "Using filesort" in extra:
+                problems.append("filesort")
+            if row.get("key") and row["key"] != expected:
+                problems.append(f"uses {row['key']}, expected {expected}")
+
+            status = "FAIL" if problems else "ok"
+            print(f"[{status:>4}] {name:<36} key={row.get('key')} type={row.get('type')} {', '.join(problems)}")
+            if problems:
+                failures.append(name)
+
+    cursor.close()
+    conn.close()
+    return failures
+
+
+if __name__ == "__main__":
+    sys.exit(1 if check() else 0)
@@ -0,0 +1,129 @@
+# chunking.py
+import json
+import re
+
+# all-MiniLM-L6-v2 truncates input at 256 word pieces (CLS/SEP included), so
+# anything past that in a chunk is never embedded. Chunks are packed from
+# whole sentences up to a token budget below that limit instead.
+EMBEDDER_MAX_TOKENS = 256
+DEFAULT_CHUNK_PARAMS = {"strategy": "sentences", "max_tokens": 240, "overlap_tokens": 40}
+# The original fixed word windows, kept for comparison (bench_chunking)
+WORD_CHUNK_PARAMS = {"strategy": "words", "chunk_size": 500, "overlap": 50}
+ROW_CHUNK_PARAMS = {"strategy": "rows"}  # spreadsheets (spreadsheet.row_chunks)
+
+PARAGRAPH_RE = re.compile(r"\n\s*\n|\r\n\s*\r\n")
+SENTENCE_RE = re.compile(r"(?<=[.!?;])\s+(?=[\"'(\[]?[A-Z0-9])|\n+")
+
+
+def chunk_params(strategy=None, max_tokens=None, overlap_tokens=None):
+    """Validated params for chunk_document; None fields take the defaults."""
+    params = dict(DEFAULT_CHUNK_PARAMS)
+    if strategy == "words":
+        return dict(WORD_CHUNK_PARAMS)
+    if strategy not in (None, "sentences"):
+        raise ValueError(f"Unknown chunking strategy: {strategy}")
+    if max_tokens is not None:
+        params["max_tokens"] = max(16, min(int(max_tokens), EMBEDDER_MAX_TOKENS - 2))
+    if overlap_tokens is not None:
+        params["overlap_tokens"] = max(0, min(int(overlap_tokens), params["max_tokens"] // 2))
+    return params
+
+
+def params_to_json(params):
+    return json.dumps(params, sort_keys=True)
+
+
+# ------------------------------
+# Token counting (the embedder's own tokenizer)
+# ------------------------------
+def embedder_token_counter():
+    """count(text) -> word pieces as the embedder sees them, without special tokens."""
+    from models import get_embedder
+
+    tokenizer = get_embedder().tokenizer
+    return lambda text: len(tokenizer.encode(text, add_special_tokens=False))
+
+
+# ------------------------------
+# Strategies
+# ------------------------------
+def word_chunks(text, chunk_size=500, overlap=50):
+    words = text.split()
+    chunks = []
+    for i in range(0, len(words), chunk_size - overlap):
+        chunks.append(" ".join(words[i:i+chunk_size]))
+    return chunks
+
+
+def split_sentences(text):
+    """[(sentence, starts_paragraph)] with whitespace normalised."""
+    units = []
+    for paragraph in PARAGRAPH_RE.split(text):
+        first = True
+        for sentence in SENTENCE_RE.split(paragraph):
+            sentence = " ".join(sentence.split())
+            if sentence:
+                units.append((sentence, first))
+                first = False
+    return units
+
+
+def _split_long_sentence(sentence, max_tokens, count):
+    """Word windows for a single sentence that is over budget on its own."""
+    # WordPiece splits on whitespace first, so per-word counts add up exactly
+    pieces, current, used = [], [], 0
+    for word in sentence.split():
+        tokens = count(word)
+        if current and used + tokens > max_tokens:
+            pieces.append(" ".join(current))
+            current, used = [], 0
+        current.append(word)
+        used += tokens
+    if current:
+        pieces.append(" ".join(current))
+    return pieces
+
+
+def sentence_chunks(text, max_tokens=240, overlap_tokens=40, count=None):
+    """
+    Pack whole sentences into chunks of at most max_tokens embedder tokens.
+    A chunk is closed early at a paragraph break once it is half full, and
+    the next chunk repeats trailing sentences worth up to overlap_tokens.
+    """
+    count = count or embedder_token_counter()
+    units = []
+    for sentence, starts_paragraph in split_sentences(text):
+        tokens = count(sentence)
+        if tokens <= max_tokens:
+            units.append((sentence, tokens, starts_paragraph))
+        else:
+            for i, piece in enumerate(_split_long_sentence(sentence, max_tokens, count)):
+                units.append((piece, count(piece), starts_paragraph and i == 0))
+
+    chunks, current, used = [], [], 0
+    for sentence, tokens, starts_paragraph in units:
+        paragraph_break = starts_paragraph and used >= max_tokens // 2
+        if current and (used + tokens > max_tokens or paragraph_break):
+            chunks.append(" ".join(s for s, _ in current))
+            # Carry the tail over so facts spanning the boundary stay retrievable
+            carried, carried_tokens = [], 0
+            if not paragraph_break:
+                for s, t in reversed(current):
+                    if carried_tokens + t > overlap_tokens or carried_tokens + t + tokens > max_tokens:
+                        break
+                    carried.insert(0, (s, t))
+                    carried_tokens += t
+            current, used = carried, carried_tokens
+        current.append((sentence, tokens))
+        used += tokens
+    if current:
+        chunks.append(" ".join(s for s, _ in current))
+    return chunks
+
+
+def chunk_document(text, params=None, count=None):
+    """Split text with the given params (see chunk_params); defaults to sentence chunks."""
+    params = params or DEFAULT_CHUNK_PARAMS
+    if params["strategy"] == "words":
+        return word_chunks(text, params["chunk_size"], params["overlap"])
+    return sentence_chunks(text, params["max_tokens"], params["overlap_tokens"], count)
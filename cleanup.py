@@ -0,0 +1,70 @@
+# cleanup.py
+import time
+from helper_func import get_db_connection, delete_old_documents, delete_old_images
+from index_cache import evict_document_index, evict_image_index, mark_documents_deleted
+from file_utils import remove_document_artifacts
+
+# Every gunicorn worker schedules the job; a MariaDB named lock makes sure
+# only one of them actually runs it at a time.
+CLEANUP_LOCK_NAME = "llm_cleanup"
+CLEANUP_BATCH_SIZE = 500
+CLEANUP_MAX_BATCHES = 50  # per run; whatever is left goes to the next run
+
+
+def _delete_in_batches(conn, cursor, delete_batch, evict, on_batch=None):
+    """Run delete_batch until it returns nothing. Returns (parent_rows, child_rows)."""
+    parents = children = 0
+    for _ in range(CLEANUP_MAX_BATCHES):
+        ids, child_rows = delete_batch(cursor, CLEANUP_BATCH_SIZE)
+        if not ids:
+            break
+        conn.commit()
+        parents += len(ids)
+        children += child_rows
+        if on_batch is not None:
+            on_batch(ids)
+        for item_id in ids:
+            evict(item_id)
+        if len(ids) < CLEANUP_BATCH_SIZE:
+            break
+    return parents, children
+
+
+def _evict_document(doc_id):
+    evict_document_index(doc_id)
+    remove_document_artifacts(doc_id)
+
+
+def run_cleanup():
+    """
+    Delete expired documents and images if this process wins the cleanup lock.
+    Returns a dict of rows deleted, or None if another process holds the lock.
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT GET_LOCK(%s, 0)", (CLEANUP_LOCK_NAME,))
+        if cursor.fetchone()[0] != 1:
+            return None
+
+        try:
+            start = time.perf_counter()
+            documents, embeddings = _delete_in_batches(
+                conn, cursor, delete_old_documents, _evict_document, on_batch=mark_documents_deleted
+            )
+            images, image_chunks = _delete_in_batches(conn, cursor, delete_old_images, evict_image_index)
+            report = {
+                "documents": documents,
+                "embeddings": embeddings,
+                "images": images,
+                "image_chunks": image_chunks,
+                "seconds": round(time.perf_counter() - start, 3),
+            }
+            print(f"[CLEANUP] {report}")
+            return report
+        finally:
+            cursor.execute("SELECT RELEASE_LOCK(%s)", (CLEANUP_LOCK_NAME,))
+            cursor.fetchone()
+    finally:
+        cursor.close()
+        conn.close()
@@ -0,0 +1,69 @@
+# command_meta.py
+import threading
+from helper_func import load_outlet_command_meta
+from redis_client import get_redis
+from metrics import record_cache
+
+# Per-outlet command metadata, loaded with one query and kept in process.
+# Edits bump a per-outlet version in Redis so every worker reloads.
+# {document_outlet_name: (version, {command_id: {"slots", "is_leaf", "command_text"}})}
+_tables = {}
+_lock = threading.Lock()
+
+
+def version_key(document_outlet_name):
+    return f"command_meta_version:{document_outlet_name}"
+
+
+def lookup_command(commands, command_id):
+    try:
+        return commands.get(int(command_id))
+    except (TypeError, ValueError):
+        return None
+
+
+def cached_outlet_commands(document_outlet_name, version):
+    """The outlet's table if it is loaded and current, else None."""
+    with _lock:
+        entry = _tables.get(document_outlet_name)
+    hit = entry is not None and entry[0] == version
+    record_cache("command_meta", hit)
+    return entry[1] if hit else None
+
+
+def store_outlet_commands(document_outlet_name, version, commands):
+    with _lock:
+        _tables[document_outlet_name] = (version, commands)
+    return commands
+
+
+def get_command_meta(document_outlet_name, command_id, version):
+    """
+    O(1) lookup of a command's slot list, leaf flag and text.
+    `version` is the outlet's current value of version_key (None if never edited).
+    Returns None for commands that don't belong to the outlet.
+    """
+    commands = cached_outlet_commands(document_outlet_name, version)
+    if commands is None:
+        commands = store_outlet_commands(
+            document_outlet_name, version, load_outlet_command_meta(document_outlet_name)
+        )
+    return lookup_command(commands, command_id)
+
+
+def warm_outlet_commands(document_outlet_name):
+    """Load the outlet's table ahead of its first request (outlet_warmup)."""
+    version = get_redis().get(version_key(document_outlet_name))
+    commands = store_outlet_commands(
+        document_outlet_name, version, load_outlet_command_meta(document_outlet_name)
+    )
+    return len(commands)
+
+
+def invalidate_outlet_commands(document_outlet_name):
+    """Call after any command or slot edit for the outlet."""
+    if not document_outlet_name:
+        return
+    get_redis().incr(version_key(document_outlet_name))
+    with _lock:
+        _tables.pop(document_outlet_name, None)
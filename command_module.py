@@ -1,6 +1,7 @@
 # command_module.py
 from flask import Blueprint, request, jsonify
 from helper_func import get_db_connection   # same as in user_module
+from command_meta import invalidate_outlet_commands
 
 command_bp = Blueprint("command", __name__, url_prefix="/commands")
 
@@ -59,6 +60,8 @@ def add_outlet_commands_with_slots():
         cursor.close()
         conn.close()
 
+        invalidate_outlet_commands(document_outlet_name)
+
         return jsonify({
             "message": "Commands with slots (and subcommands) added successfully",
             "document_outlet_name": document_outlet_name
@@ -369,6 +372,14 @@ def delete_command(command_id):
         conn = get_db_connection()
         cursor = conn.cursor()
 
+        # Needed to invalidate the outlet's cached command metadata
+        cursor.execute(
+            "SELECT document_outlet_name FROM outlet_commands WHERE command_id = %s",
+            (command_id,)
+        )
+        row = cursor.fetchone()
+        document_outlet_name = row[0] if row else None
+
         # Delete slots first
         cursor.execute(
             "DELETE FROM outlet_command_slots WHERE command_id = %s",
@@ -385,6 +396,8 @@ def delete_command(command_id):
         cursor.close()
         conn.close()
 
+        invalidate_outlet_commands(document_outlet_name)
+
         return jsonify({
             "message": f"Command {command_id} and its subcommands (if any) deleted successfully."
         }), 200
@@ -414,6 +427,16 @@ def delete_slots():
 
         # Delete all slots in one query
         format_strings = ','.join(['%s'] * len(slot_ids))
+        cursor.execute(
+            f"""
+            SELECT DISTINCT c.document_outlet_name
+            FROM outlet_command_slots s
+            JOIN outlet_commands c ON c.command_id = s.command_id
+            WHERE s.slot_id IN ({format_strings})
+            """,
+            tuple(slot_ids)
+        )
+        affected_outlets = [row[0] for row in cursor.fetchall()]
         cursor.execute(
             f"DELETE FROM outlet_command_slots WHERE slot_id IN ({format_strings})",
             tuple(slot_ids)
@@ -423,6 +446,9 @@ def delete_slots():
         cursor.close()
         conn.close()
 
+        for outlet in affected_outlets:
+            invalidate_outlet_commands(outlet)
+
         return jsonify({
             "message": f"Slots {slot_ids} deleted successfully."
         }), 200
@@ -546,6 +572,9 @@ def add_subcommand_with_slots():
         cursor.close()
         conn.close()
 
+        # Parent is no longer a leaf
+        invalidate_outlet_commands(document_outlet_name)
+
         return jsonify({
             "message": "Subcommand with slots added successfully",
             "parent_command_id": parent_command_id,
@@ -571,9 +600,11 @@ def add_slots_to_command():
         cursor = conn.cursor()
 
         # Check if command exists
-        cursor.execute("SELECT command_id FROM outlet_commands WHERE command_id = %s", (command_id,))
-        if not cursor.fetchone():
+        cursor.execute("SELECT document_outlet_name FROM outlet_commands WHERE command_id = %s", (command_id,))
+        command = cursor.fetchone()
+        if not command:
             return jsonify({"error": "Command not found"}), 404
+        document_outlet_name = command[0]
 
         # Insert new slots
         for slot_name in slots:
@@ -589,6 +620,8 @@ def add_slots_to_command():
         cursor.close()
         conn.close()
 
+        invalidate_outlet_commands(document_outlet_name)
+
         return jsonify({
             "message": "Slots added successfully",
             "command_id": command_id,
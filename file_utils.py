@@ -9,3 +9,16 @@ os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
 def allowed_file(filename):
     return "." in filename and filename.rsplit(".", 1)[1].lower() in ALLOWED_EXTENSIONS
+
+# Derived per-document files (parsed tables, sparse indexes, ...)
+ARTIFACT_FOLDER = "uploads/artifacts"
+os.makedirs(ARTIFACT_FOLDER, exist_ok=True)
+
+def remove_document_artifacts(doc_id):
+    """Delete every artifact file written for doc_id. Returns the number removed."""
+    removed = 0
+    for name in os.listdir(ARTIFACT_FOLDER):
+        if name.startswith(f"{doc_id}."):
+            os.remove(os.path.join(ARTIFACT_FOLDER, name))
+            removed += 1
+    return removed
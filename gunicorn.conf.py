@@ -0,0 +1,62 @@
+# gunicorn.conf.py
+#
+#     gunicorn -c gunicorn.conf.py app_new:app
+#
+# app_new is imported once in the master (preload_app) and the models named
+# in PRELOAD_MODELS are loaded there too, so the forked workers share the
+# weights copy-on-write instead of each loading their own copy.
+import gc
+import os
+import shutil
+
+bind = "0.0.0.0:8015"
+workers = 4
+threads = 2
+timeout = 300
+preload_app = True
+
+# Workers write metrics here so GET /metrics (metrics.render) sums all of
+# them. Set up before the app (and prometheus_client) is preloaded; samples
+# left by a previous run are cleared.
+PROMETHEUS_DIR = os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/tmp/llm_prometheus")
+shutil.rmtree(PROMETHEUS_DIR, ignore_errors=True)
+os.makedirs(PROMETHEUS_DIR, exist_ok=True)
+
+# Comma-separated models.LOADERS names; "" to load everything lazily per worker
+PRELOAD_MODELS = os.environ.get("PRELOAD_MODELS", "embedder")
+# Run one inference per worker after fork so the first request isn't the slow one
+WARM_UP_WORKERS = os.environ.get("WARM_UP_WORKERS", "0") == "1"
+# Keep a new worker from accepting requests until its outlet warm-up
+# (outlet_warmup.py) is done; otherwise it serves while warming and only
+# GET /ready reports the difference
+WARM_UP_BLOCKING = os.environ.get("WARM_UP_BLOCKING", "0") == "1"
+
+
+def when_ready(server):
+    from models import warm_up
+
+    names = [name.strip() for name in PRELOAD_MODELS.split(",") if name.strip()]
+    if names:
+        # Load only: running inference here would start torch/OpenMP thread
+        # pools in the master, which forked workers can deadlock on
+        server.log.info("Preloaded models: %s", warm_up(names, exercise=False))
+    # Keep the cycle collector from touching (and so copying) the shared pages
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    if WARM_UP_WORKERS:
+        from models import loaded_models, warm_up
+        server.log.info("Worker %s warm-up: %s", worker.pid, warm_up(loaded_models()))
+
+    # Scheduler jobs and the outlet warm-up start here, in the worker
+    from app_new import WARM_UP, start_background_jobs
+    start_background_jobs()
+    if WARM_UP_BLOCKING:
+        WARM_UP.wait()
+        server.log.info("Worker %s outlet warm-up: %s", worker.pid, WARM_UP.snapshot())
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid)
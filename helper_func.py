@@ -1,91 +1,250 @@
 import mysql.connector
 import numpy as np
 import io
+import os
+import hashlib
 from uuid import uuid4
 import faiss
+from keyword_index import KeywordIndex
+from metrics import stage
+
+# Connect to MariaDB (LLM_DB_NAME points tools such as benchmarks at a scratch database)
+DB_NAME = os.environ.get("LLM_DB_NAME", "llm")
 
-# Connect to MariaDB
 def get_db_connection():
     return mysql.connector.connect(
         host="localhost",
         user="root",
         password="",
-        database="llm"
+        database=DB_NAME
     )
 
+# ------------------------------
+# Embedding storage
+# ------------------------------
+# How new embeddings are written and how FAISS holds them in memory:
+#   float32  .npy blob (1664 bytes for 384 dims), IndexFlatL2
+#   float16  tag + half floats (772 bytes), IndexScalarQuantizer QT_fp16
+#   int8     tag + scale + one byte per dimension (392 bytes), IndexScalarQuantizer QT_8bit
+# Blobs carry their format, so rows written under any mode stay readable
+# after switching. benchmarks/bench_quantization.py compares recall.
+EMBEDDING_STORAGE_MODES = ("float32", "float16", "int8")
+EMBEDDING_STORAGE = os.environ.get("EMBEDDING_STORAGE", "float32")
+if EMBEDDING_STORAGE not in EMBEDDING_STORAGE_MODES:
+    raise ValueError(f"EMBEDDING_STORAGE must be one of {EMBEDDING_STORAGE_MODES}, not {EMBEDDING_STORAGE!r}")
+
+FLOAT16_TAG = b"\x00F16"  # .npy blobs start with b"\x93NUMPY"
+INT8_TAG = b"\x00Q8\x00"
+# MiniLM vectors are unit length, so every component is in [-1, 1]: QT_8bit
+# gets that fixed range instead of one learned from whichever rows come first
+INT8_RANGE = (-1.0, 1.0)
+
+
 # Serialize numpy array to bytes
-def serialize_embedding(embedding):
+def serialize_embedding(embedding, storage=None):
+    storage = storage or EMBEDDING_STORAGE
+    embedding = np.asarray(embedding, dtype="float32")
+    if storage == "float16":
+        return FLOAT16_TAG + embedding.astype("<f2").tobytes()
+    if storage == "int8":
+        # Symmetric per-vector scale: the largest component maps to +-127
+        scale = float(np.abs(embedding).max()) / 127 or 1.0
+        codes = np.clip(np.rint(embedding / scale), -127, 127).astype("int8")
+        return INT8_TAG + np.array([scale], dtype="<f4").tobytes() + codes.tobytes()
     buf = io.BytesIO()
     np.save(buf, embedding)
     return buf.getvalue()
 
-# Deserialize bytes to numpy array
+# Deserialize bytes to a float32 numpy array
 def deserialize_embedding(blob):
+    blob = bytes(blob)
+    if blob.startswith(FLOAT16_TAG):
+        return np.frombuffer(blob, dtype="<f2", offset=len(FLOAT16_TAG)).astype("float32")
+    if blob.startswith(INT8_TAG):
+        start = len(INT8_TAG) + 4
+        scale = np.frombuffer(blob, dtype="<f4", count=1, offset=len(INT8_TAG))[0]
+        return np.frombuffer(blob, dtype="int8", offset=start).astype("float32") * scale
     buf = io.BytesIO(blob)
-    return np.load(buf)
+    return np.load(buf).astype("float32", copy=False)
+
+def new_faiss_index(dimension, storage=None):
+    """Empty, ready-to-add L2 index for the storage mode (see EMBEDDING_STORAGE)."""
+    storage = storage or EMBEDDING_STORAGE
+    if storage == "float16":
+        return faiss.IndexScalarQuantizer(dimension, faiss.ScalarQuantizer.QT_fp16, faiss.METRIC_L2)
+    if storage == "int8":
+        index = faiss.IndexScalarQuantizer(dimension, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_L2)
+        # Min-max training on the two corners sets every dimension's range to INT8_RANGE
+        index.train(np.array([[INT8_RANGE[0]] * dimension, [INT8_RANGE[1]] * dimension], dtype="float32"))
+        return index
+    return faiss.IndexFlatL2(dimension)
+
+# Build (chunks, FAISS index) from rows with chunk_text + embedding columns
+def index_from_rows(rows):
+    chunks = [row['chunk_text'] for row in rows]
+    with stage("decode"):
+        embeddings = np.array([deserialize_embedding(row['embedding']) for row in rows], dtype="float32")
+
+    # Build FAISS index
+    with stage("index_build"):
+        index = new_faiss_index(embeddings.shape[1])
+        index.add(embeddings)
+    return chunks, index
+
 
 
-def save_document_to_db(username, filename, chunks, embeddings, document_outlet_name):
+def save_document_to_db(username, filename, chunks, embeddings, document_outlet_name,
+                        chunk_params=None, file_hash=None, chunk_indexes=None, keyword_chunks=None):
+    """
+    Insert a document and its chunk embeddings. An embedding may be an
+    already serialized blob (reused from another row). `chunk_indexes`
+    gives each chunk's position in the document (default: 0..n-1).
+    `keyword_chunks` (texts new to the outlet) are added to the outlet's
+    keyword index in the same transaction, so rows and postings commit
+    together.
+    """
     doc_id = str(uuid4())
     conn = get_db_connection()
     cursor = conn.cursor()
 
-    # Save document metadata
+    # Save document metadata (chunk_params: how `chunks` were cut, as JSON)
     cursor.execute(
-        "INSERT INTO documents (id, username, filename, document_outlet_name) VALUES (%s, %s, %s, %s)",
-        (doc_id, username, filename, document_outlet_name)
+        "INSERT INTO documents (id, username, filename, document_outlet_name, chunk_params, content_hash) VALUES (%s, %s, %s, %s, %s, %s)",
+        (doc_id, username, filename, document_outlet_name, chunk_params, file_hash)
     )
 
     # Save embeddings per chunk
-    for idx, (chunk, emb) in enumerate(zip(chunks, embeddings)):
-        cursor.execute(
-            "INSERT INTO embeddings (document_id, chunk_index, chunk_text, embedding, document_outlet_name) VALUES (%s, %s, %s, %s, %s)",
-            (doc_id, idx, chunk, serialize_embedding(emb), document_outlet_name)
-        )
+    if chunk_indexes is None:
+        chunk_indexes = range(len(chunks))
+    cursor.executemany(
+        "INSERT INTO embeddings (document_id, chunk_index, chunk_text, embedding, document_outlet_name, chunk_hash) VALUES (%s, %s, %s, %s, %s, %s)",
+        [(doc_id, idx, chunk, bytes(emb) if isinstance(emb, (bytes, bytearray)) else serialize_embedding(emb),
+          document_outlet_name, content_hash(chunk))
+         for idx, chunk, emb in zip(chunk_indexes, chunks, embeddings)]
+    )
 
-    conn.commit()
-    cursor.close()
-    conn.close()
+    keyword_segment = bool(document_outlet_name) and keyword_chunks is not None
+    try:
+        if keyword_segment:
+            lock_keyword_index(cursor, document_outlet_name)
+            insert_keyword_segment(cursor, document_outlet_name, keyword_chunks)
+        conn.commit()
+    finally:
+        if keyword_segment:
+            unlock_keyword_index(cursor, document_outlet_name)
+        cursor.close()
+        conn.close()
     return doc_id
 
-def load_document_from_db(doc_id, document_outlet_name):
-    conn = get_db_connection()
-    cursor = conn.cursor(dictionary=True)
+# ------------------------------
+# Content hashing (dedup)
+# ------------------------------
+def content_hash(data):
+    """sha256 hex of bytes or text; for text it equals MariaDB SHA2(text, 256)."""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
 
-    # cursor.execute("SELECT chunk_text, embedding FROM embeddings WHERE document_id=%s and document_outlet_name=%s ORDER BY chunk_index ASC", (doc_id, document_outlet_name))
+def file_content_hash(file_storage, block_size=1024 * 1024):
+    """Hash an uploaded file's bytes and rewind it for parsing."""
+    digest = hashlib.sha256()
+    stream = file_storage.stream
+    for block in iter(lambda: stream.read(block_size), b""):
+        digest.update(block)
+    stream.seek(0)
+    return digest.hexdigest()
 
-    if document_outlet_name is None:
+def reuse_document(file_hash, document_outlet_name, chunk_params):
+    """
+    doc_id of an existing upload with the same bytes, outlet and chunking,
+    or None. A reused temporary (non-outlet) document gets a fresh
+    created_at so cleanup treats it as just uploaded.
+    """
+    with stage("db_fetch"):
+        conn = get_db_connection()
+        cursor = conn.cursor()
         cursor.execute("""
-            SELECT chunk_text, embedding 
-            FROM embeddings 
-            WHERE document_id=%s AND document_outlet_name IS NULL
-            ORDER BY chunk_index ASC
-        """, (doc_id,))
-    else:
-        cursor.execute("""
-            SELECT chunk_text, embedding 
-            FROM embeddings 
-            WHERE document_id=%s AND document_outlet_name=%s
-            ORDER BY chunk_index ASC
-        """, (doc_id, document_outlet_name))
+            SELECT id FROM documents
+            WHERE content_hash=%s AND document_outlet_name <=> %s AND chunk_params <=> %s
+            LIMIT 1
+            """, (file_hash, document_outlet_name, chunk_params))
+        row = cursor.fetchone()
+        if row and document_outlet_name is None:
+            cursor.execute("UPDATE documents SET created_at=NOW() WHERE id=%s", (row[0],))
+            conn.commit()
+        cursor.close()
+        conn.close()
+    return row[0] if row else None
 
-    rows = cursor.fetchall()
-    chunks = [row['chunk_text'] for row in rows]
-    embeddings = np.array([deserialize_embedding(row['embedding']) for row in rows])
-    
-    cursor.close()
-    conn.close()
-    
-    # Build FAISS index
-    dimension = embeddings.shape[1]
-    index = faiss.IndexFlatL2(dimension)
-    index.add(embeddings)
-    return chunks, index
+def load_outlet_chunk_embeddings(document_outlet_name, hashes, batch_size=500):
+    """{chunk_hash: embedding blob} for the `hashes` the outlet already has (one row each)."""
+    hashes = list(set(hashes))
+    if not hashes:
+        return {}
+    with stage("db_fetch"):
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        first_ids = {}
+        for start in range(0, len(hashes), batch_size):
+            batch = hashes[start:start + batch_size]
+            placeholders = ",".join(["%s"] * len(batch))
+            cursor.execute(
+                f"SELECT chunk_hash, MIN(id) FROM embeddings WHERE document_outlet_name=%s AND chunk_hash IN ({placeholders}) GROUP BY chunk_hash",
+                (document_outlet_name, *batch)
+            )
+            first_ids.update({row_id: chunk_hash for chunk_hash, row_id in cursor.fetchall()})
+        cursor.close()
+        conn.close()
+    return {first_ids[row['id']]: row['embedding'] for row in load_outlet_rows_by_ids(first_ids)}
+
+def new_chunks(chunks, known_hashes=()):
+    """
+    (chunk_indexes, chunks) that still need embedding: the first copy of
+    each chunk whose hash is not in known_hashes.
+    """
+    seen = set(known_hashes)
+    indexes, kept = [], []
+    for idx, chunk in enumerate(chunks):
+        digest = content_hash(chunk)
+        if digest in seen:
+            continue
+        seen.add(digest)
+        indexes.append(idx)
+        kept.append(chunk)
+    return indexes, kept
+
+def load_document_from_db(doc_id, document_outlet_name):
+    with stage("db_fetch"):
+        conn = get_db_connection()
+        cursor = conn.cursor(dictionary=True)
+
+        # cursor.execute("SELECT chunk_text, embedding FROM embeddings WHERE document_id=%s and document_outlet_name=%s ORDER BY chunk_index ASC", (doc_id, document_outlet_name))
+
+        if document_outlet_name is None:
+            cursor.execute("""
+                SELECT chunk_text, embedding 
+                FROM embeddings 
+                WHERE document_id=%s AND document_outlet_name IS NULL
+                ORDER BY chunk_index ASC
+            """, (doc_id,))
+        else:
+            cursor.execute("""
+                SELECT chunk_text, embedding 
+                FROM embeddings 
+                WHERE document_id=%s AND document_outlet_name=%s
+                ORDER BY chunk_index ASC
+            """, (doc_id, document_outlet_name))
+
+        rows = cursor.fetchall()
+        cursor.close()
+        conn.close()
+
+    return index_from_rows(rows)
 
 import mysql.connector
 import uuid
 
-def save_image_text(username, filename, detected_text):
+def save_image_text(username, filename, detected_text, chunks=None, embeddings=None):
     image_id = str(uuid.uuid4())
     conn = get_db_connection()
     cursor = conn.cursor()
@@ -93,89 +252,320 @@ def save_image_text(username, filename, detected_text):
         "INSERT INTO image_ocr (id, username, filename, detected_text) VALUES (%s, %s, %s, %s)",
         (image_id, username, filename, detected_text)
     )
+
+    # Save embeddings per OCR chunk (removed with the image via ON DELETE CASCADE)
+    if chunks is not None and embeddings is not None:
+        cursor.executemany(
+            "INSERT INTO image_ocr_embeddings (image_id, chunk_index, chunk_text, embedding) VALUES (%s, %s, %s, %s)",
+            [(image_id, idx, chunk, serialize_embedding(emb)) for idx, (chunk, emb) in enumerate(zip(chunks, embeddings))]
+        )
+
     conn.commit()
     cursor.close()
     conn.close()
     return image_id
 
 def load_image_text(image_id):
-    conn = get_db_connection()
-    cursor = conn.cursor(dictionary=True)
-    cursor.execute("SELECT detected_text FROM image_ocr WHERE id=%s", (image_id,))
-    row = cursor.fetchone()
-    cursor.close()
-    conn.close()
+    with stage("db_fetch"):
+        conn = get_db_connection()
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute("SELECT detected_text FROM image_ocr WHERE id=%s", (image_id,))
+        row = cursor.fetchone()
+        cursor.close()
+        conn.close()
     if row:
         return row["detected_text"]
     return None
 
-def delete_old_documents():
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute("DELETE FROM documents WHERE do created_at < NOW() - INTERVAL 30 MINUTE AND document_outlet_name IS NULL")
-    conn.commit()
-    cursor.close()
-    conn.close()
+def load_image_index_from_db(image_id):
+    """
+    Return (chunks, index, created_at) for an image's OCR chunks,
+    or (None, None, None) if the image has no stored chunks.
+    """
+    with stage("db_fetch"):
+        conn = get_db_connection()
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute("""
+            SELECT e.chunk_text, e.embedding, UNIX_TIMESTAMP(i.created_at) AS created_ts
+            FROM image_ocr_embeddings e
+            JOIN image_ocr i ON i.id = e.image_id
+            WHERE e.image_id=%s
+            ORDER BY e.chunk_index ASC
+            """, (image_id,))
+        rows = cursor.fetchall()
+        cursor.close()
+        conn.close()
 
-def delete_old_images():
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute("DELETE FROM image_ocr WHERE created_at < NOW() - INTERVAL 30 MINUTE")
-    conn.commit()
-    cursor.close()
-    conn.close()
+    if not rows:
+        return None, None, None
 
+    chunks, index = index_from_rows(rows)
+    return chunks, index, float(rows[0]['created_ts'])
 
-def load_document_from_db_outletwise(document_outlet_name):
-    conn = get_db_connection()
-    cursor = conn.cursor(dictionary=True)
+def delete_old_documents(cursor, batch_size=500):
+    """
+    Delete one batch of expired (non-outlet) documents and their embeddings.
+    Returns (deleted_doc_ids, deleted_embedding_rows). Caller commits.
+    """
+    cursor.execute("""
+        SELECT id FROM documents
+        WHERE document_outlet_name IS NULL AND created_at < NOW() - INTERVAL 30 MINUTE
+        ORDER BY created_at
+        LIMIT %s
+        """, (batch_size,))
+    doc_ids = [row[0] for row in cursor.fetchall()]
+    if not doc_ids:
+        return [], 0
 
-    # cursor.execute("SELECT chunk_text, embedding FROM embeddings WHERE document_id=%s and document_outlet_name=%s ORDER BY chunk_index ASC", (doc_id, document_outlet_name))
+    # Delete children explicitly so each batch's cascade stays bounded
+    placeholders = ",".join(["%s"] * len(doc_ids))
+    cursor.execute(f"DELETE FROM embeddings WHERE document_id IN ({placeholders})", tuple(doc_ids))
+    embedding_rows = cursor.rowcount
+    cursor.execute(f"DELETE FROM documents WHERE id IN ({placeholders})", tuple(doc_ids))
+    return doc_ids, embedding_rows
 
+def delete_old_images(cursor, batch_size=500):
+    """
+    Delete one batch of expired OCR images and their chunk embeddings.
+    Returns (deleted_image_ids, deleted_chunk_rows). Caller commits.
+    """
     cursor.execute("""
-        SELECT chunk_text, embedding 
-        FROM embeddings 
-        WHERE document_outlet_name=%s
-        ORDER BY chunk_index ASC
-        """, (document_outlet_name,))
+        SELECT id FROM image_ocr
+        WHERE created_at < NOW() - INTERVAL 30 MINUTE
+        ORDER BY created_at
+        LIMIT %s
+        """, (batch_size,))
+    image_ids = [row[0] for row in cursor.fetchall()]
+    if not image_ids:
+        return [], 0
 
-    rows = cursor.fetchall()
-    chunks = [row['chunk_text'] for row in rows]
-    embeddings = np.array([deserialize_embedding(row['embedding']) for row in rows])
-    
-    cursor.close()
-    conn.close()
-    
-    # Build FAISS index
-    dimension = embeddings.shape[1]
-    index = faiss.IndexFlatL2(dimension)
-    index.add(embeddings)
-    return chunks, index
+    placeholders = ",".join(["%s"] * len(image_ids))
+    cursor.execute(f"DELETE FROM image_ocr_embeddings WHERE image_id IN ({placeholders})", tuple(image_ids))
+    chunk_rows = cursor.rowcount
+    cursor.execute(f"DELETE FROM image_ocr WHERE id IN ({placeholders})", tuple(image_ids))
+    return image_ids, chunk_rows
 
 
-def get_command_slots(command_id):
+# ------------------------------
+# Incremental outlet index (outlet_index.py); ids come from the `outlet_id` key
+# ------------------------------
+OUTLET_ROWS_AFTER_SQL = """
+    SELECT id, chunk_text, embedding
+    FROM embeddings
+    WHERE document_outlet_name=%s AND id > %s
+    ORDER BY id
+"""
+OUTLET_ROW_COUNT_SQL = "SELECT COUNT(*) AS row_count FROM embeddings WHERE document_outlet_name=%s AND id <= %s"
+OUTLET_ROW_IDS_SQL = "SELECT id FROM embeddings WHERE document_outlet_name=%s AND id <= %s"
+
+def load_outlet_rows_after(document_outlet_name, after_id):
+    """Outlet embedding rows with id > after_id, oldest first."""
+    with stage("db_fetch"):
+        conn = get_db_connection()
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute(OUTLET_ROWS_AFTER_SQL, (document_outlet_name, after_id))
+        rows = cursor.fetchall()
+        cursor.close()
+        conn.close()
+    return rows
+
+def load_outlet_rows_by_ids(ids, batch_size=500):
+    ids = sorted(ids)
+    with stage("db_fetch"):
+        conn = get_db_connection()
+        cursor = conn.cursor(dictionary=True)
+        rows = []
+        for start in range(0, len(ids), batch_size):
+            batch = ids[start:start + batch_size]
+            placeholders = ",".join(["%s"] * len(batch))
+            cursor.execute(f"SELECT id, chunk_text, embedding FROM embeddings WHERE id IN ({placeholders})", tuple(batch))
+            rows.extend(cursor.fetchall())
+        cursor.close()
+        conn.close()
+    return rows
+
+def count_outlet_rows(document_outlet_name, up_to_id):
+    with stage("db_fetch"):
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        cursor.execute(OUTLET_ROW_COUNT_SQL, (document_outlet_name, up_to_id))
+        count = cursor.fetchone()[0]
+        cursor.close()
+        conn.close()
+    return count
+
+def load_outlet_row_ids(document_outlet_name, up_to_id):
+    with stage("db_fetch"):
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        cursor.execute(OUTLET_ROW_IDS_SQL, (document_outlet_name, up_to_id))
+        ids = [row[0] for row in cursor.fetchall()]
+        cursor.close()
+        conn.close()
+    return ids
+
+
+OUTLET_SPREADSHEETS_SQL = """
+    SELECT id FROM documents
+    WHERE document_outlet_name=%s AND (filename LIKE %s OR filename LIKE %s)
+    ORDER BY created_at
+"""
+SPREADSHEET_PATTERNS = ("%.xls", "%.xlsx")
+
+def load_outlet_spreadsheet_ids(document_outlet_name):
+    """Ids of the outlet's Excel documents (their tables live in uploads/artifacts)."""
+    with stage("db_fetch"):
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        cursor.execute(OUTLET_SPREADSHEETS_SQL, (document_outlet_name, *SPREADSHEET_PATTERNS))
+        doc_ids = [row[0] for row in cursor.fetchall()]
+        cursor.close()
+        conn.close()
+    return doc_ids
+
+
+# ------------------------------
+# Per-outlet BM25 keyword index
+# ------------------------------
+# Stored as segments, one per upload, each the KeywordIndex of that upload's
+# new chunks. An upload writes only its own segment; readers merge an
+# outlet's segments in id order.
+KEYWORD_SEGMENTS_SQL = """
+    SELECT id, segment_blob
+    FROM outlet_keyword_segments
+    WHERE document_outlet_name=%s AND id > %s
+    ORDER BY id
+"""
+
+def keyword_segments_from_rows(rows):
+    """[(segment id, KeywordIndex)] from KEYWORD_SEGMENTS_SQL rows."""
+    with stage("decode"):
+        return [(row["id"], KeywordIndex.from_blob(row["segment_blob"])) for row in rows]
+
+def load_keyword_segments(document_outlet_name, after_id=0):
+    """The outlet's keyword index segments with an id above after_id, in order."""
+    with stage("db_fetch"):
+        conn = get_db_connection()
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute(KEYWORD_SEGMENTS_SQL, (document_outlet_name, after_id))
+        rows = cursor.fetchall()
+        cursor.close()
+        conn.close()
+    return keyword_segments_from_rows(rows)
+
+def lock_keyword_index(cursor, document_outlet_name):
+    """Named lock serialising keyword segment writers, so segment ids commit in order."""
+    cursor.execute("SELECT GET_LOCK(%s, 30)", (f"keyword_index:{document_outlet_name}",))
+    cursor.fetchone()
+
+def unlock_keyword_index(cursor, document_outlet_name):
+    cursor.execute("SELECT RELEASE_LOCK(%s)", (f"keyword_index:{document_outlet_name}",))
+    cursor.fetchone()
+
+def insert_keyword_segment(cursor, document_outlet_name, chunks=()):
+    """
+    Store chunks as one segment of the outlet's keyword index; only they are
+    tokenized, so an upload costs O(new chunks). An outlet without segments
+    gets a first one built from all of its stored chunks instead (rows this
+    transaction inserted included). Caller holds lock_keyword_index and commits.
+    """
+    cursor.execute(
+        "SELECT id FROM outlet_keyword_segments WHERE document_outlet_name=%s LIMIT 1",
+        (document_outlet_name,)
+    )
+    if cursor.fetchone() is None:
+        cursor.execute("""
+            SELECT chunk_text
+            FROM embeddings
+            WHERE document_outlet_name=%s
+            ORDER BY chunk_index ASC
+            """, (document_outlet_name,))
+        # Each text once, as uploads store them
+        segment = KeywordIndex.build(list(dict.fromkeys(row[0] or "" for row in cursor.fetchall())))
+    else:
+        segment = KeywordIndex.build(chunks)
+    if len(segment):
+        cursor.execute("""
+            INSERT INTO outlet_keyword_segments (document_outlet_name, chunk_count, segment_blob)
+            VALUES (%s, %s, %s)
+            """, (document_outlet_name, len(segment), segment.to_blob()))
+
+def append_keyword_segment(document_outlet_name, chunks=()):
+    """insert_keyword_segment in its own transaction (chunks=(): only the first segment)."""
     conn = get_db_connection()
-    cursor = conn.cursor(dictionary=True)
-    cursor.execute("""
-        SELECT slot_name 
-        FROM outlet_command_slots 
-        WHERE command_id=%s AND required=1
-    """, (command_id,))
-    rows = cursor.fetchall()
-    cursor.close()
-    conn.close()
+    cursor = conn.cursor()
+    lock_keyword_index(cursor, document_outlet_name)
+    try:
+        insert_keyword_segment(cursor, document_outlet_name, chunks)
+        conn.commit()
+    finally:
+        unlock_keyword_index(cursor, document_outlet_name)
+        cursor.close()
+        conn.close()
+
+
+def get_command_slots(command_id):
+    with stage("db_fetch"):
+        conn = get_db_connection()
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute("""
+            SELECT slot_name 
+            FROM outlet_command_slots 
+            WHERE command_id=%s AND required=1
+        """, (command_id,))
+        rows = cursor.fetchall()
+        cursor.close()
+        conn.close()
     # Return a dictionary with slot names initialized to None
     return {row['slot_name']: None for row in rows}
 
 def match_command(document_outlet_name, question):
-    conn = get_db_connection()
-    cursor = conn.cursor(dictionary=True)
-    cursor.execute("SELECT command_id, command_text FROM outlet_commands WHERE document_outlet_name=%s", (document_outlet_name,))
-    rows = cursor.fetchall()
-    cursor.close()
-    conn.close()
+    with stage("db_fetch"):
+        conn = get_db_connection()
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute("SELECT command_id, command_text FROM outlet_commands WHERE document_outlet_name=%s", (document_outlet_name,))
+        rows = cursor.fetchall()
+        cursor.close()
+        conn.close()
 
     for row in rows:
         if row['command_text'].lower() in question.lower():
             return row['command_id'], row['command_text']
-    return None, None
\ No newline at end of file
+    return None, None
+
+OUTLET_COMMAND_META_SQL = """
+    SELECT c.command_id, c.command_text,
+           (SELECT COUNT(*) FROM outlet_commands sc WHERE sc.parent_command_id = c.command_id) AS subcommand_count,
+           s.slot_id, s.slot_name, s.required
+    FROM outlet_commands c
+    LEFT JOIN outlet_command_slots s ON s.command_id = c.command_id
+    WHERE c.document_outlet_name = %s
+    ORDER BY c.command_id, s.slot_id
+"""
+
+def load_outlet_command_meta(document_outlet_name):
+    """
+    Slot schema, leaf flag and text for every command of an outlet, in one query.
+    Returns {command_id: {"slots": [...], "is_leaf": bool, "command_text": str}}.
+    """
+    with stage("db_fetch"):
+        conn = get_db_connection()
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute(OUTLET_COMMAND_META_SQL, (document_outlet_name,))
+        rows = cursor.fetchall()
+        cursor.close()
+        conn.close()
+    return command_meta_from_rows(rows)
+
+def command_meta_from_rows(rows):
+    """Fold OUTLET_COMMAND_META_SQL rows into {command_id: meta}."""
+    commands = {}
+    for row in rows:
+        meta = commands.setdefault(row["command_id"], {
+            "slots": [],
+            "is_leaf": row["subcommand_count"] == 0,
+            "command_text": row["command_text"],
+        })
+        if row["slot_id"] is not None:
+            meta["slots"].append({"slot_id": row["slot_id"], "slot_name": row["slot_name"], "required": row["required"]})
+    return commands
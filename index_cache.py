@@ -0,0 +1,143 @@
+# index_cache.py
+import threading
+import time
+from cachetools import TLRUCache, TTLCache
+from redis.exceptions import RedisError
+from metrics import record_cache
+from redis_client import get_redis, get_async_redis
+
+# Uploaded images (and their OCR rows) are deleted 30 minutes after upload,
+# so a cached image index expires at the same moment its image does.
+IMAGE_LIFETIME = 1800  # seconds
+IMAGE_INDEX_MAXSIZE = 256
+
+# {image_id: (chunks, faiss_index, expires_at)}
+_image_indexes = TLRUCache(
+    maxsize=IMAGE_INDEX_MAXSIZE,
+    ttu=lambda _key, value, _now: value[2],
+    timer=time.time,
+)
+_image_lock = threading.Lock()
+
+
+def get_image_index(image_id):
+    """Return cached (chunks, index) for an image, or None."""
+    with _image_lock:
+        entry = _image_indexes.get(image_id)
+    record_cache("image_index", entry is not None)
+    return entry[:2] if entry else None
+
+
+def put_image_index(image_id, chunks, index, created_at=None):
+    """Cache an image index until `created_at` (unix time) + IMAGE_LIFETIME."""
+    expires_at = (created_at or time.time()) + IMAGE_LIFETIME
+    with _image_lock:
+        _image_indexes[image_id] = (chunks, index, expires_at)
+
+
+def evict_image_index(image_id):
+    with _image_lock:
+        _image_indexes.pop(image_id, None)
+
+
+# ------------------------------
+# Per-document indexes (/ask with doc_id)
+# ------------------------------
+DOCUMENT_INDEX_TTL = 1800  # seconds
+DOCUMENT_INDEX_MAXSIZE = 128
+
+# Cleanup runs in one worker only, so deleting a document also leaves a
+# marker in Redis that every worker checks on a cache hit. The marker
+# outlives any entry cached before the delete.
+DELETED_DOCUMENT_KEY = "deleted_document:{doc_id}"
+DELETED_DOCUMENT_TTL = 2 * DOCUMENT_INDEX_TTL
+
+# {(doc_id, document_outlet_name): (chunks, faiss_index, keyword_index)}
+_document_indexes = TTLCache(maxsize=DOCUMENT_INDEX_MAXSIZE, ttl=DOCUMENT_INDEX_TTL)
+_document_lock = threading.Lock()
+
+
+def mark_documents_deleted(doc_ids):
+    """Tell every worker to drop its cached copies of doc_ids (best effort)."""
+    if not doc_ids:
+        return
+    try:
+        pipe = get_redis().pipeline(transaction=False)
+        for doc_id in doc_ids:
+            pipe.set(DELETED_DOCUMENT_KEY.format(doc_id=doc_id), 1, ex=DELETED_DOCUMENT_TTL)
+        pipe.execute()
+    except RedisError as e:
+        print(f"[INDEX CACHE] could not mark {len(doc_ids)} document(s) deleted: {e}")
+
+
+def _is_deleted(doc_id):
+    # Without Redis the database decides: a deleted document then fails to load
+    try:
+        return bool(get_redis().exists(DELETED_DOCUMENT_KEY.format(doc_id=doc_id)))
+    except RedisError:
+        return True
+
+
+async def _ais_deleted(doc_id):
+    try:
+        return bool(await get_async_redis().exists(DELETED_DOCUMENT_KEY.format(doc_id=doc_id)))
+    except RedisError:
+        return True
+
+
+def get_document_index(doc_id, document_outlet_name):
+    with _document_lock:
+        entry = _document_indexes.get((doc_id, document_outlet_name))
+    if entry is not None and _is_deleted(doc_id):
+        evict_document_index(doc_id)
+        entry = None
+    record_cache("document_index", entry is not None)
+    return entry
+
+
+async def aget_document_index(doc_id, document_outlet_name):
+    """Async get_document_index."""
+    with _document_lock:
+        entry = _document_indexes.get((doc_id, document_outlet_name))
+    if entry is not None and await _ais_deleted(doc_id):
+        evict_document_index(doc_id)
+        entry = None
+    record_cache("document_index", entry is not None)
+    return entry
+
+
+def put_document_index(doc_id, document_outlet_name, chunks, index, keyword_index):
+    with _document_lock:
+        _document_indexes[(doc_id, document_outlet_name)] = (chunks, index, keyword_index)
+
+
+def evict_document_index(doc_id):
+    """Drop every cached index (and table) for doc_id, whatever outlet it was loaded under."""
+    with _document_lock:
+        for key in [k for k in _document_indexes.keys() if k[0] == doc_id]:
+            _document_indexes.pop(key, None)
+        _document_tables.pop(doc_id, None)
+
+
+# ------------------------------
+# Parsed spreadsheets (spreadsheet.load_table)
+# ------------------------------
+DOCUMENT_TABLE_MAXSIZE = 32
+
+# {doc_id: DataFrame}
+_document_tables = TTLCache(maxsize=DOCUMENT_TABLE_MAXSIZE, ttl=DOCUMENT_INDEX_TTL)
+
+
+def get_document_table(doc_id):
+    with _document_lock:
+        table = _document_tables.get(doc_id)
+    if table is not None and _is_deleted(doc_id):
+        evict_document_index(doc_id)
+        table = None
+    record_cache("document_table", table is not None)
+    return table
+
+
+def put_document_table(doc_id, table):
+    with _document_lock:
+        _document_tables[doc_id] = table
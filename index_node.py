@@ -0,0 +1,153 @@
+# index_node.py
+"""
+Index node: owns the outlet indexes of one shard (see index_shards.py).
+
+    gunicorn -w 1 --threads 8 -b 0.0.0.0:8101 --timeout 300 index_node:app
+
+Run one worker per node so each outlet's index is held once per node.
+Nodes need the database but not the models: the web tier embeds the
+question and sends the vector.
+
+Several nodes on one machine, for testing:
+    INDEX_NODE_URL=http://127.0.0.1:8101 python index_node.py --port 8101
+    INDEX_NODE_URL=http://127.0.0.1:8102 python index_node.py --port 8102
+    INDEX_NODE_URL=http://127.0.0.1:8103 python index_node.py --port 8103
+    INDEX_NODES=http://127.0.0.1:8101,http://127.0.0.1:8102,http://127.0.0.1:8103 \\
+        gunicorn -c gunicorn.conf.py app_new:app
+GET /health on each node lists the outlets it has cached. On start a node
+builds the indexes of the most active outlets it owns (outlet_warmup.py);
+GET /ready answers 503 until they are in.
+"""
+import argparse
+import os
+import threading
+import numpy as np
+from flask import Flask, Response, request, jsonify
+import metrics
+from index_shards import owner
+from outlet_warmup import WarmUp
+from outlet_index import (
+    cached_outlets,
+    compact_outlet_indexes,
+    get_outlet_index,
+    refresh_cached_outlet_index,
+    search_outlet_index,
+)
+
+# This node's own entry in INDEX_NODES, to notice outlets it was sent but doesn't own
+INDEX_NODE_URL = os.environ.get("INDEX_NODE_URL", "").rstrip("/")
+
+app = Flask(__name__)
+
+
+def outlet_from_request():
+    data = request.get_json(silent=True) or {}
+    document_outlet_name = data.get("document_outlet_name")
+    if not document_outlet_name:
+        return data, None
+    if INDEX_NODE_URL and owner(document_outlet_name) not in (None, INDEX_NODE_URL):
+        # Owner down (we are its fallback) or the rings disagree during a change
+        print(f"[INDEX NODE] serving {document_outlet_name}, owned by {owner(document_outlet_name)}")
+    return data, document_outlet_name
+
+
+@app.before_request
+def start_timing():
+    data = request.get_json(silent=True) or {}
+    metrics.start_request(request.endpoint, data.get("document_outlet_name"))
+
+
+@app.after_request
+def finish_timing(response):
+    timings = metrics.finish_request()
+    if timings is not None:
+        response.headers["Server-Timing"] = metrics.server_timing(timings)
+    return response
+
+
+@app.route("/outlet/search", methods=["POST"])
+def outlet_search():
+    data, document_outlet_name = outlet_from_request()
+    if not document_outlet_name or not data.get("question") or not data.get("embedding"):
+        return jsonify({"error": "document_outlet_name, question and embedding are required"}), 400
+    q_embed = np.array([data["embedding"]], dtype="float32")
+    try:
+        chunks = search_outlet_index(document_outlet_name, data["question"], q_embed, data.get("k", 3))
+    except LookupError as e:
+        return jsonify({"error": str(e)}), 404
+    return jsonify({"chunks": chunks})
+
+
+@app.route("/outlet/texts", methods=["POST"])
+def outlet_texts():
+    _, document_outlet_name = outlet_from_request()
+    if not document_outlet_name:
+        return jsonify({"error": "document_outlet_name is required"}), 400
+    try:
+        chunks = get_outlet_index(document_outlet_name).texts()
+    except LookupError as e:
+        return jsonify({"error": str(e)}), 404
+    return jsonify({"chunks": chunks})
+
+
+@app.route("/outlet/refresh", methods=["POST"])
+def outlet_refresh():
+    _, document_outlet_name = outlet_from_request()
+    if not document_outlet_name:
+        return jsonify({"error": "document_outlet_name is required"}), 400
+    refresh_cached_outlet_index(document_outlet_name)
+    return jsonify({"refreshed": document_outlet_name})
+
+
+@app.route("/health", methods=["GET"])
+def health():
+    return jsonify({"node": INDEX_NODE_URL or None, "outlets": cached_outlets()})
+
+
+@app.route("/ready", methods=["GET"])
+def readiness():
+    status = WARM_UP.snapshot()
+    return jsonify(status), 200 if status["ready"] else 503
+
+
+@app.route("/metrics", methods=["GET"])
+def prometheus_metrics():
+    body, content_type = metrics.render()
+    return Response(body, content_type=content_type)
+
+
+# Compaction runs in the process that holds the indexes (started on first request, after fork)
+scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+@app.before_request
+def ensure_background_jobs():
+    global scheduler
+    if scheduler is None:
+        from apscheduler.schedulers.background import BackgroundScheduler
+        with _scheduler_lock:
+            if scheduler is None:
+                scheduler = BackgroundScheduler()
+                scheduler.add_job(compact_outlet_indexes, "interval", minutes=10)
+                scheduler.start()
+
+
+def warm_owned_outlet(document_outlet_name):
+    try:
+        get_outlet_index(document_outlet_name)
+    except LookupError:
+        pass  # commands but no documents
+
+
+# Only outlets this node owns; nothing without INDEX_NODE_URL. gunicorn runs
+# index_node without --preload, so importing it already happens in the worker.
+WARM_UP = WarmUp(warm_owned_outlet, select=lambda name: owner(name) == INDEX_NODE_URL, models=())
+WARM_UP.start()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", type=int, default=8101)
+    args = parser.parse_args()
+    app.run(host="0.0.0.0", port=args.port, threaded=True)
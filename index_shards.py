@@ -0,0 +1,194 @@
+# index_shards.py
+"""
+Outlet retrieval, local or on the index node that owns the outlet.
+
+With INDEX_NODES unset every worker keeps its own outlet indexes
+(outlet_index.py). With INDEX_NODES=http://node-a:8101,http://node-b:8101,...
+outlets are partitioned across index nodes (index_node.py) by consistent
+hashing of document_outlet_name: only the owner builds and caches an
+outlet's index, and the web tier sends it the question and its embedding.
+Adding or removing a node moves about 1/N of the outlets. If the owner is
+unreachable the next node on the ring answers (building the index from the
+shared database).
+
+    python index_shards.py OUTLET [OUTLET ...]   # which node owns each outlet
+"""
+import bisect
+import hashlib
+import os
+import sys
+import httpx
+import numpy as np
+import requests
+from metrics import stage
+from outlet_index import (
+    aget_outlet_index,
+    asearch_outlet_index,
+    get_outlet_index,
+    refresh_cached_outlet_index,
+    search_outlet_index,
+)
+
+INDEX_NODES = [url.strip().rstrip("/") for url in os.environ.get("INDEX_NODES", "").split(",") if url.strip()]
+INDEX_NODE_TIMEOUT = float(os.environ.get("INDEX_NODE_TIMEOUT", "10"))  # seconds; a cold build of a large outlet
+INDEX_NODE_ATTEMPTS = 2  # owner, then the next node on the ring
+VIRTUAL_NODES = 64       # points per node on the ring, evens out the share each one owns
+
+
+class IndexNodeError(RuntimeError):
+    """No index node could answer."""
+
+
+class HashRing:
+    def __init__(self, nodes, virtual_nodes=VIRTUAL_NODES):
+        self.nodes = list(nodes)
+        points = sorted(
+            (self._hash(f"{node}#{n}"), node) for node in self.nodes for n in range(virtual_nodes)
+        )
+        self._hashes = [h for h, _ in points]
+        self._owners = [node for _, node in points]
+
+    @staticmethod
+    def _hash(key):
+        return int.from_bytes(hashlib.md5(key.encode("utf-8")).digest()[:8], "big")
+
+    def owners(self, key, count=1):
+        """Up to count distinct nodes for key, owner first."""
+        if not self._hashes:
+            return []
+        start = bisect.bisect(self._hashes, self._hash(key))
+        found = []
+        for n in range(len(self._owners)):
+            node = self._owners[(start + n) % len(self._owners)]
+            if node not in found:
+                found.append(node)
+                if len(found) == count:
+                    break
+        return found
+
+    def owner(self, key):
+        owners = self.owners(key)
+        return owners[0] if owners else None
+
+
+RING = HashRing(INDEX_NODES) if INDEX_NODES else None
+
+
+def owner(document_outlet_name):
+    """URL of the index node that owns the outlet, or None when indexes are local."""
+    return RING.owner(document_outlet_name) if RING is not None else None
+
+
+def _raise_for(response):
+    if response.status_code == 404:
+        raise LookupError(response.json().get("error", "Outlet not found"))
+    response.raise_for_status()
+    return response.json()
+
+
+# ------------------------------
+# Sync client (app_new)
+# ------------------------------
+_session = requests.Session()
+
+
+def _post(document_outlet_name, path, payload):
+    last_error = None
+    for node in RING.owners(document_outlet_name, INDEX_NODE_ATTEMPTS):
+        try:
+            response = _session.post(f"{node}{path}", json=payload, timeout=INDEX_NODE_TIMEOUT)
+            if response.status_code >= 500:
+                last_error = f"{node}: HTTP {response.status_code}"
+                continue
+            return _raise_for(response)
+        except requests.RequestException as e:
+            last_error = f"{node}: {e}"
+    raise IndexNodeError(f"No index node answered for {document_outlet_name} ({last_error})")
+
+
+def outlet_texts(document_outlet_name):
+    """The outlet's chunk texts in upload order. Raises LookupError when it has none."""
+    if RING is None:
+        return get_outlet_index(document_outlet_name).texts()
+    return _post(document_outlet_name, "/outlet/texts", {"document_outlet_name": document_outlet_name})["chunks"]
+
+
+def search_outlet(document_outlet_name, question, q_embed, k=3):
+    """Best k chunks for the question (k=None: every chunk, ranked). Raises LookupError when it has none."""
+    if RING is None:
+        return search_outlet_index(document_outlet_name, question, q_embed, k)
+    with stage("search"):
+        return _post(document_outlet_name, "/outlet/search", {
+            "document_outlet_name": document_outlet_name,
+            "question": question,
+            "embedding": np.asarray(q_embed, dtype="float32").reshape(-1).tolist(),
+            "k": k,
+        })["chunks"]
+
+
+def refresh_outlet(document_outlet_name):
+    """After an upload: have the outlet's index pick up the new rows now."""
+    if RING is None:
+        refresh_cached_outlet_index(document_outlet_name)
+        return
+    try:
+        _post(document_outlet_name, "/outlet/refresh", {"document_outlet_name": document_outlet_name})
+    except IndexNodeError as e:
+        # The owner refreshes on its own within OUTLET_INDEX_REFRESH_SECONDS
+        print(f"[INDEX SHARDS] refresh failed: {e}")
+
+
+# ------------------------------
+# Async client (asgi_app)
+# ------------------------------
+_async_client = None
+
+
+def get_async_client():
+    global _async_client
+    if _async_client is None:
+        _async_client = httpx.AsyncClient(timeout=INDEX_NODE_TIMEOUT)
+    return _async_client
+
+
+async def _apost(document_outlet_name, path, payload):
+    last_error = None
+    for node in RING.owners(document_outlet_name, INDEX_NODE_ATTEMPTS):
+        try:
+            response = await get_async_client().post(f"{node}{path}", json=payload)
+            if response.status_code >= 500:
+                last_error = f"{node}: HTTP {response.status_code}"
+                continue
+            return _raise_for(response)
+        except httpx.HTTPError as e:
+            last_error = f"{node}: {e}"
+    raise IndexNodeError(f"No index node answered for {document_outlet_name} ({last_error})")
+
+
+async def aoutlet_texts(document_outlet_name):
+    """Async outlet_texts."""
+    if RING is None:
+        return (await aget_outlet_index(document_outlet_name)).texts()
+    body = await _apost(document_outlet_name, "/outlet/texts", {"document_outlet_name": document_outlet_name})
+    return body["chunks"]
+
+
+async def asearch_outlet(document_outlet_name, question, q_embed, k=3):
+    """Async search_outlet."""
+    if RING is None:
+        return await asearch_outlet_index(document_outlet_name, question, q_embed, k)
+    with stage("search"):
+        body = await _apost(document_outlet_name, "/outlet/search", {
+            "document_outlet_name": document_outlet_name,
+            "question": question,
+            "embedding": np.asarray(q_embed, dtype="float32").reshape(-1).tolist(),
+            "k": k,
+        })
+    return body["chunks"]
+
+
+if __name__ == "__main__":
+    if RING is None:
+        sys.exit("INDEX_NODES is not set: every worker indexes every outlet locally")
+    for outlet in sys.argv[1:]:
+        print(f"{outlet}\t{' -> '.join(RING.owners(outlet, len(INDEX_NODES)))}")
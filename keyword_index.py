@@ -0,0 +1,196 @@
+# keyword_index.py
+import json
+import math
+import re
+import zlib
+from collections import Counter
+from metrics import stage
+
+# MiniLM embeddings blur exact tokens (item codes, prices, phone numbers),
+# so retrieval also ranks chunks with BM25 and fuses both lists with
+# reciprocal rank fusion.
+BM25_K1 = 1.5
+BM25_B = 0.75
+RRF_K = 60               # standard RRF damping constant
+HYBRID_CANDIDATES = 20   # depth taken from each ranking before fusing
+EXACT_HIT_K = 2          # chunks sent when the top keyword hit has every code/number in the question
+# Score-aware depth. MiniLM vectors are unit length, so FAISS's squared L2
+# distance is 2 - 2 * cosine. Vector hits count only within MAX_DISTANCE
+# (cosine >= 0.3) and within DISTANCE_MARGIN of the best hit: one strong
+# match sends one chunk, several close ones send up to k. With no vector
+# hit and no exact keyword hit the question is off-topic and nothing is
+# returned (the routes then answer without the LLM).
+MAX_DISTANCE = 1.4
+DISTANCE_MARGIN = 0.25
+
+# Words joined by . - / : stay one token ("itm0042", "98-765-4321", "12.50")
+TOKEN_RE = re.compile(r"[a-z0-9]+(?:[.\-/:][a-z0-9]+)*")
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "how", "in", "is", "it",
+    "of", "on", "or", "the", "to", "what", "when", "where", "which", "who", "with", "you",
+}
+
+
+def tokenize(text):
+    """Lowercase terms; compound tokens are also indexed by their parts."""
+    terms = []
+    for token in TOKEN_RE.findall(text.lower()):
+        if token in STOPWORDS:
+            continue
+        terms.append(token)
+        if not token.isalnum():
+            terms.extend(part for part in re.split(r"[.\-/:]", token) if part)
+    return terms
+
+
+def exact_terms(text):
+    """Query terms that must match literally: anything containing a digit."""
+    return {term for term in tokenize(text) if any(ch.isdigit() for ch in term)}
+
+
+class KeywordIndex:
+    """BM25 over a list of chunk texts. Serialises to a compressed blob for the DB."""
+
+    def __init__(self, chunks, postings, lengths):
+        self.chunks = chunks
+        self.postings = postings      # {term: [[chunk_pos, term_frequency], ...]}
+        self.lengths = lengths        # tokens per chunk
+        self.avg_length = (sum(lengths) / len(lengths)) if lengths else 0.0
+
+    @classmethod
+    def build(cls, chunks):
+        keyword_index = cls([], {}, [])
+        keyword_index.add(chunks)
+        return keyword_index
+
+    def add(self, chunks):
+        """Append chunks; only they are tokenized, existing postings are kept."""
+        for chunk in chunks:
+            pos = len(self.chunks)
+            counts = Counter(tokenize(chunk))
+            self.chunks.append(chunk)
+            self.lengths.append(sum(counts.values()))
+            for term, tf in counts.items():
+                self.postings.setdefault(term, []).append([pos, tf])
+        self.avg_length = (sum(self.lengths) / len(self.lengths)) if self.lengths else 0.0
+
+    def extend(self, other):
+        """Append another index's chunks and postings (a stored segment) without re-tokenizing."""
+        offset = len(self.chunks)
+        self.lengths.extend(other.lengths)
+        self.chunks.extend(other.chunks)
+        for term, postings in other.postings.items():
+            self.postings.setdefault(term, []).extend([pos + offset, tf] for pos, tf in postings)
+        self.avg_length = (sum(self.lengths) / len(self.lengths)) if self.lengths else 0.0
+
+    @classmethod
+    def merge(cls, segments):
+        keyword_index = cls([], {}, [])
+        for segment in segments:
+            keyword_index.extend(segment)
+        return keyword_index
+
+    def __len__(self):
+        return len(self.chunks)
+
+    def search(self, query, k=HYBRID_CANDIDATES):
+        """Returns [(chunk_pos, score)] best first; only chunks sharing a term with the query."""
+        n = len(self.chunks)
+        scores = {}
+        for term in set(tokenize(query)):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+            for pos, tf in postings:
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self.lengths[pos] / (self.avg_length or 1))
+                scores[pos] = scores.get(pos, 0.0) + idf * tf * (BM25_K1 + 1) / (tf + norm)
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        return ranked[:k] if k else ranked
+
+    def to_blob(self):
+        data = {"chunks": self.chunks, "postings": self.postings, "lengths": self.lengths}
+        return zlib.compress(json.dumps(data, separators=(",", ":")).encode("utf-8"))
+
+    @classmethod
+    def from_blob(cls, blob):
+        data = json.loads(zlib.decompress(blob).decode("utf-8"))
+        return cls(data["chunks"], data["postings"], data["lengths"])
+
+
+# ------------------------------
+# Fusion
+# ------------------------------
+def reciprocal_rank_fusion(rankings, rrf_k=RRF_K):
+    """Merge ranked lists of keys; a key's score is sum(1 / (rrf_k + rank))."""
+    scores = {}
+    for ranking in rankings:
+        for rank, key in enumerate(ranking, start=1):
+            scores[key] = scores.get(key, 0.0) + 1.0 / (rrf_k + rank)
+    return sorted(scores, key=scores.get, reverse=True)
+
+
+def relevant_hits(distances, ids, k, max_distance=MAX_DISTANCE, margin=DISTANCE_MARGIN):
+    """Ids of the vector hits worth sending: up to k, close to the best and under max_distance."""
+    kept = []
+    for distance, i in zip(distances, ids):
+        if i < 0 or len(kept) == k:
+            break
+        if distance > max_distance or (kept and distance > distances[0] + margin):
+            break
+        kept.append(i)
+    return kept
+
+
+def _chunk_at(chunks, i):
+    """chunks[i], or None for FAISS padding (-1) and rows an outlet index dropped mid-search."""
+    if i < 0:
+        return None
+    try:
+        return chunks[i]
+    except (KeyError, IndexError):
+        return None
+
+
+def hybrid_search(question, q_embed, chunks, index, keyword_index, k=3, candidates=HYBRID_CANDIDATES,
+                  max_distance=MAX_DISTANCE, live_texts=None):
+    """
+    Chunk texts ranked by RRF over FAISS (L2) and BM25 results, best first.
+    Chunks are fused by text, so identical chunks count once. k=None returns
+    every chunk (candidates is widened to cover the whole index).
+    Otherwise k is an upper bound: only chunks whose vector distance passes
+    relevant_hits, plus the top keyword hit when it contains every
+    code/number in the question, are returned, so the result may be empty.
+    live_texts: texts still in the index; keyword hits on others (rows
+    removed after their keyword segment was stored) are dropped.
+    """
+    if k is None:
+        candidates = max(index.ntotal, len(keyword_index))
+    with stage("search"):
+        D, I = index.search(q_embed, k=min(candidates, index.ntotal))
+        # A concurrent refresh can remove outlet rows after the search; skip them
+        distances, ids, vector_ranking = [], [], []
+        for distance, i in zip(D[0], I[0]):
+            text = _chunk_at(chunks, i)
+            if text is not None:
+                distances.append(distance)
+                ids.append(i)
+                vector_ranking.append(text)
+
+        keyword_hits = keyword_index.search(question, candidates)
+        keyword_ranking = [keyword_index.chunks[pos] for pos, _ in keyword_hits]
+        if live_texts is not None:
+            keyword_ranking = [chunk for chunk in keyword_ranking if chunk in live_texts]
+
+        fused = reciprocal_rank_fusion([vector_ranking, keyword_ranking])
+    if k is None:
+        return fused
+
+    found = dict(zip(ids, vector_ranking))
+    relevant = {found[i] for i in relevant_hits(distances, ids, k, max_distance)}
+    required = exact_terms(question)
+    if required and keyword_ranking and required <= set(tokenize(keyword_ranking[0])):
+        exact = keyword_ranking[0]
+        fused = [exact] + [chunk for chunk in fused if chunk != exact and chunk in relevant]
+        return fused[:min(k, EXACT_HIT_K)]
+    return [chunk for chunk in fused if chunk in relevant][:k]
@@ -28,7 +28,11 @@ CREATE TABLE `documents` (
   `filename` varchar(255) DEFAULT NULL,
   `created_at` timestamp NULL DEFAULT current_timestamp(),
   `document_outlet_name` varchar(255) DEFAULT NULL,
-  PRIMARY KEY (`id`)
+  `chunk_params` text DEFAULT NULL,
+  `content_hash` char(64) DEFAULT NULL,
+  PRIMARY KEY (`id`),
+  KEY `outlet_created_at` (`document_outlet_name`,`created_at`),
+  KEY `content_hash` (`content_hash`,`document_outlet_name`)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
 /*!40101 SET character_set_client = @saved_cs_client */;
 
@@ -38,7 +42,7 @@ CREATE TABLE `documents` (
 
 LOCK TABLES `documents` WRITE;
 /*!40000 ALTER TABLE `documents` DISABLE KEYS */;
-INSERT INTO `documents` VALUES ('0b8a7f62-04e4-4f6a-b79f-1004f7564f19','auto','document.docx','2025-09-24 04:58:15',NULL),('33cb2e46-777c-47de-bd74-834ad8992f0f','file','json_10_Txt.txt','2025-09-23 08:53:07',''),('44a57c9b-8b5a-45df-97ef-1fd58c8e37ba','auto','document.docx','2025-09-24 10:09:10',NULL),('4fb4ff17-d459-4223-a739-fed0bab0bd44','auto','document.docx','2025-09-23 10:38:05',NULL),('5dc74b21-17fa-4a69-b5c1-02ca12686a60','test789','test_doc.txt','2025-09-25 05:58:57','e582dbe1-68b0-471d-b4e2-49b47816f0ae'),('61b765e5-ae10-4594-beff-e88be67efe3c','iframe_user','User Manual.docx','2025-09-24 08:38:24','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),('9d0b6ec8-8f95-4df5-8fea-6fe8a33c9ae2','iframe_user','User Manual.docx','2025-09-23 10:31:18','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),('aea3a964-72a4-4fb6-a2a1-b792c0f64e57','file','managerReport.txt','2025-09-24 10:04:53',NULL),('b0fea813-cf69-455c-b7c8-3d0e42ad61f0','file','User Manual (1).docx','2025-09-23 10:36:36',NULL),('ec8ac072-fd4f-4840-9937-d7f598c20e2f','auto','document.docx','2025-09-24 04:58:20',NULL);
+INSERT INTO `documents` (`id`, `username`, `filename`, `created_at`, `document_outlet_name`, `chunk_params`) VALUES ('0b8a7f62-04e4-4f6a-b79f-1004f7564f19','auto','document.docx','2025-09-24 04:58:15',NULL,NULL),('33cb2e46-777c-47de-bd74-834ad8992f0f','file','json_10_Txt.txt','2025-09-23 08:53:07','',NULL),('44a57c9b-8b5a-45df-97ef-1fd58c8e37ba','auto','document.docx','2025-09-24 10:09:10',NULL,NULL),('4fb4ff17-d459-4223-a739-fed0bab0bd44','auto','document.docx','2025-09-23 10:38:05',NULL,NULL),('5dc74b21-17fa-4a69-b5c1-02ca12686a60','test789','test_doc.txt','2025-09-25 05:58:57','e582dbe1-68b0-471d-b4e2-49b47816f0ae',NULL),('61b765e5-ae10-4594-beff-e88be67efe3c','iframe_user','User Manual.docx','2025-09-24 08:38:24','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e',NULL),('9d0b6ec8-8f95-4df5-8fea-6fe8a33c9ae2','iframe_user','User Manual.docx','2025-09-23 10:31:18','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e',NULL),('aea3a964-72a4-4fb6-a2a1-b792c0f64e57','file','managerReport.txt','2025-09-24 10:04:53',NULL,NULL),('b0fea813-cf69-455c-b7c8-3d0e42ad61f0','file','User Manual (1).docx','2025-09-23 10:36:36',NULL,NULL),('ec8ac072-fd4f-4840-9937-d7f598c20e2f','auto','document.docx','2025-09-24 04:58:20',NULL,NULL);
 /*!40000 ALTER TABLE `documents` ENABLE KEYS */;
 UNLOCK TABLES;
 
@@ -56,8 +60,12 @@ CREATE TABLE `embeddings` (
   `chunk_text` text DEFAULT NULL,
   `embedding` longblob DEFAULT NULL,
   `document_outlet_name` varchar(255) DEFAULT NULL,
+  `chunk_hash` char(64) DEFAULT NULL,
   PRIMARY KEY (`id`),
-  KEY `document_id` (`document_id`),
+  KEY `outlet_chunk` (`document_outlet_name`,`chunk_index`),
+  KEY `document_outlet_chunk` (`document_id`,`document_outlet_name`,`chunk_index`),
+  KEY `outlet_chunk_hash` (`document_outlet_name`,`chunk_hash`),
+  KEY `outlet_id` (`document_outlet_name`,`id`),
   CONSTRAINT `embeddings_ibfk_1` FOREIGN KEY (`document_id`) REFERENCES `documents` (`id`) ON DELETE CASCADE
 ) ENGINE=InnoDB AUTO_INCREMENT=3192 DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
 /*!40101 SET character_set_client = @saved_cs_client */;
@@ -68,7 +76,7 @@ CREATE TABLE `embeddings` (
 
 LOCK TABLES `embeddings` WRITE;
 /*!40000 ALTER TABLE `embeddings` DISABLE KEYS */;
-INSERT INTO `embeddings` VALUES (3083,'33cb2e46-777c-47de-bd74-834ad8992f0f',0,'{\"PurchaseRequistionID\":10,\"RequisitionType\":\"Smooth Operation\",\"Date\":\"2025-09-17T00:00:00\",\"TotalAmount\":140.00,\"TaxAmount\":0.00,\"Company_Name\":\"New Company\",\"State\":\"Received\",\"ReceivedDate\":\"2025-09-17T00:00:00\",\"purchaseBillNumber\":222,\"DiscountAmount\":0.00,\"Outlet_Name\":\"Alice Restaurant, Gairidhara\",\"GRN\":9,\"RequisitionDetailsList\":[{\"ItemID\":188,\"UnitsOrdered\":1.00,\"PurchaseReqID\":10,\"Rate\":40.00,\"Name\":\"Radish\",\"BrandName\":\"\",\"Code\":\"\",\"UOM\":\"Kg\",\"StockType\":\"Non-Stockable\",\"Department\":\"Food\",\"GroupName\":\"Vegetables\",\"ExpDate\":\"\",\"Status\":\"In Stock\",\"Taxable\":\"No\"},{\"ItemID\":176,\"UnitsOrdered\":1.00,\"PurchaseReqID\":10,\"Rate\":100.00,\"Name\":\"Carrot\",\"BrandName\":\"\",\"Code\":\"\",\"UOM\":\"Kg\",\"StockType\":\"Stockable\",\"Department\":\"Food\",\"GroupName\":\"Vegetables\",\"ExpDate\":\"\",\"Status\":\"In Stock\",\"Taxable\":\"No\"}]}',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n*\aת=њS<tӽϾ<>\\Z=M\[<=8<\=Z/T1x43٫<f+Z U\\#\q/\<D=µ:h9w:d\n:\4=/\%\cQ=,뼄d/p;5,=ʺ=ʟ=<wF1\;\Hc!t=ȵ=\V2<4g(=9\\<+\=?\=tbE\\<9=\0dXl\n+&\櫽=T$Fv\:\\S`ǽU(\\\4=\0l\\(_=c<&^\.\pTh\=\$%lD6\vX\<2i;R\\<))<dBZAr<\9;\+-*_<V=Epu\\\[O9e\=l\S=\<\/<^\"|\U=o<f=#wy\nֽ@=PK,k<}\6_\\y=kJ?\=G=M󭺼!!`D=#1	\\޼\S@$N\#\\A=.ڼ$M<\nx7=1ڼX1=O\ҼąȍLH\׼\=\\=uR\\\ջ;#\<4LvlU\0^=#м)2^=`=`\";$(<E\<\\\RA,\Ni=ky~<I輴\<@\\<\<\\=ιk\<t-<t<\"dS;V\<%-W,\4=:v=c\ \q!~Z=J#~<`=sli<7f\"\\=U=7=Ճ=5	=v`\n=\=U5=\\<[CO\Y,Ң=PK\\=Z=;羼(=*=b\ʒ=ih@WQ\<Tn8u<;}$>ĸ-\"\\\Z=\\03=\\\_=n=E=<`Z\IN\P==:<\nP=ʽ\{>\\=	\p\\\<.6q]\ٸ=݁&=.7No3y\n>\@Z;H\=\M\=PpBH=p_<\R%=>H߼\<ń=ta.=U<\\<]:440l=\ꓼH\=>M=\2=\<\d@d\(AY<Rwa;0C=\\">\\wjD4N\\<4)\no?;Q=#p\o=\<D<\K:\Zl=q`1k=\\=\>bP}1d]=q\\<\w\?C=}oX2O\p==i<\t\^\ɽmK<0\=\\=6=\T-ļ\\<\A>=\\/GUOD\=\\\\E=R=?Q\r<{W=\\3i	=5\J<5\8=\"#=\<(W=c\Cˈ<=S0`\	\E\\;=\tu\\1\\<x=\=\E%l\e;R\r=\\ռ :AT \s=tG\\:@\\U<A(z<=\=oSK\[=',''),(3084,'9d0b6ec8-8f95-4df5-8fea-6fe8a33c9ae2',0,'Teaching Manual For SilverLine Dot Connector Version: S.10111 By SilverLine System Integrators Pvt. Ltd. Tables of Content. Introduction to SilverLine Dot Connector. Modules. Main Screen. Front Office. Point of Sale (POS). House Keeping. Maintenance. Functions. 3.1 Front Office Functions. 3.1.1 Check In 3.1.1.1 FIT Check In 3.1.1.2 Group Check In 3.1.2 Check Out 3.1.2.1 FIT Check Out 3.1.2.2 Group Check Out 3.1.3 Start Reservation 3.1.3.1 FIT Reservation 3.1.3.2 Group Reservation 3.2 Point of Sale Functions. 3.2.1 Start a Table 3.2.2 Add more item to an existing table 3.2.3 Settle a Table 3.2.4 Split a bill 3.2.5 Add Modifications 3.2.6 Void Items 3.2.8 Room Post 3.3 House Keeping Functions. Reports. Introduction to SilverLine Dot Connector. SilverLine Dot Connector (SDC) is a Property Management System (PMS) which is built for the purpose of managing different departmental operations of a hotel making it convenient to keep track of its day to day activities. With the arrival of computers into the scene, the old ways of maintaining logs of everything manually is long gone. In today’s competitive market its everyone’s aim to stay ahead of the game and one way of doing that is my having a system that helps you do just that. SDC is a system built towards addressing that need of a hotel where all the information needed to run a hotel efficiently is easily accessible with just a few clicks! More than that it integrates the functionality of all different departments of a hotel such as accounting, inventory, housekeeping etc reducing the time, energy and effort into managing all of them from one single point. SDC is one of the most efficient and easy to use PMS in the market. Build with the latest technology in software engineering, SDC provides a very efficient and user friendly operations making it very convenient for hotel staff to meet with the requirements of its daily operation. Some of its key features are as follows: SDC is a state of the art system that is capable of handling reservations for a hotel of any size. It is intelligent enough to interconnect different departments of a hotel, keeping them all informed about their duties and tasks in hand. The front office module gives an over view of the different states of different rooms (such as vacant-dirty or out-of-order), and these states are denoted by different color indexes helping the staff know everything they want with just a click. The reservation module is a full proof and fully tested part of the software that handles different information about the incoming guests such as their likes, and dislikes, room preferences and meal-plan, flight information. The guest history tracking system in the software makes reservations for repeated guests very simple and effective. The house keeping module also provides a visual over view for different rooms to be cleaned. The system provides a mechanism to clear the status of different rooms floor by floor or room by room as the situation demands. A maintenance module constantly keeps the maintenance',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n> :\4=y\;%\\<GK\<=ɖ;<2=trj=<jz=\<8)|=^\?<bBW<;\\=\;\-实= \rd=\\"<\Zf\<)\\uy=~6H:\r<.6=*z=.\\U=q\=\\>\0\h\(FP2&=\<̏XRb=\\<pe=Ůљ=\<J=z=\&\E\\;\c\?fo\<9Ҽ\i4\=WQB=ȋ12DGt-~=$=Ix=\\0<s=#ŽǓ\ >3^μF\r;\\9	i=\B=<oQ;\Z\MO=\j=[\L&;\MEg\Z\T9=:A<L=Fi=?\]a)f\\o\)B\:NF<:\#Tj\\	m\h5h\Q\S.t	=L).<=qS=3\0<C\;\+\<L=i	GZ\Tb9YGN=RL\<=\ϋ=;\"K=!tdL~\㬻y\;C\Ρ=|s=W6\:u\ѼS\2\Q=[ɼ~p=#L<xn=n=\/={<u=2=l\"ۼ0\\`=\x\r=0\?#\0Ϣ	US\Y.\]ӻ>#=)d\$=A =\=@ȉ\0A=DI\D<;;\<\\	{$$RkKؼ/_\Ol\1(3<J0x<KNL=$uG\=R\rd+ku;)*\<\'N<]:a&Gҍ<7=\\=RVO\<\r\\\;ː<\\N5UW=\뽱\"\n\}<t⡼C?7\_>\Z\<2_8=\\n=Av\>/8VVX<\p<[n\=\(=	\6/\\;=,>;O\r<\>a\"\L\0\<\=!;mx=2_\<q\7<_\"+ۋ6\z\oQ\ {@=)<+Tә%\;V^t=\=g~\;{=\=O%P=ʣ2qKy=\1>e=\j\n/^><C1 W\Ż\\k=\żpYH=\z=ȩ`rvr6\\\0=v=\=\=7	Q4=\\p3&H<SCN<\"H켃8\~\Z=\F~^=\`ӼȄ\G\"=\q\<䟯=\<\n\L<\I=\?9\=\L`=\_K\=\QƖו\ri$<<W\E\Z>=\J.Ҽ=HE\r<ߺ8=~]7=\\8\#)Y=\;b=\q\<s\=l.J;\\;f=p\吽\'\=\*=\<Ǎ==\=팻\0v=\aB<]=+\==\"h>ŁEn\:*>\Z;7\=θ5=xD%vz?C8(\0\:<\=`;<,4=&+t=','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3085,'9d0b6ec8-8f95-4df5-8fea-6fe8a33c9ae2',1,'very simple and effective. The house keeping module also provides a visual over view for different rooms to be cleaned. The system provides a mechanism to clear the status of different rooms floor by floor or room by room as the situation demands. A maintenance module constantly keeps the maintenance department at its toes with its constant reminder of the things that need to be addressed. Housekeeping department notifies the maintenance department instantly about any breakages or failures noticed during a cleaning procedure there by reducing the reaction time. A state of the art POS system is also a part of this software that takes care of all the restaurant management needs. The POS provides a visual overview of the entire restaurant with its exact floor plan and table numbering to help the manager and the servers know the status of different tables. Different color codes are used to signify different status of tables, such as Vacant or Occupied, which helps to know which tables are available for the guests walking in. The POS is best utilized with a touch screen monitor as the ordering process will be faster. Each menu item is listed under its own course list, helping servers or managers to know where to look for any particular menu item as needed. After the ordering is complete the order is sent with a push of a button. Upon doing so, all the bar items get printed in the bar and the kitchen items get printed in the kitchen reducing the need of having to send someone to the kitchen or the bar to inform the respective stations. Once the order is sent, it cannot be voided unless approved by the manager. Any alterations or special requests from the guests regarding any items ordered are entered into the system at the time of ordering which is printed at the respective terminals along with the items ordered so that the respective terminals are informed about such modifications. A bill splitting feature allows the bill to be split as requested by the customer which can be printed accordingly. A bill printing system is also a part of the software that prints the bills as necessary. Room posting for different guests according to their meal plan is also incorporated into the system. Reporting includes daily arrival, departure and stay-over reports. The end of the day report is also available with the exact cash count of both the local and foreign currencies. Any further reporting options preferred can also be incorporated upon request. These are just some of the general features of the PMS. Let us now go deeper into its individual module operations. Modules Just like any other PMS in the market, SDC covers all the basic modules required to run a successful hotel business. 70% of the revenue generated by a hotel comes from the guests that come to stay in the hotel, therefore a system as such requires every attention to details as far as guests are concerned. SDC',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\\ZE<\$Gv+Q \1\=eU;\U=np\n+8==%-=	툼J?[7W=\"\<\_*5);HI¼\9\vC=<\d< \t<t\Ľ5}e<׺j\=<U<\\T<1s=\n}L(j$w##\\\'x\<\\=֫eGG(xFA\\F\H=\"N=}M=T=L=\͊ZʌK=$]\P<+%\r=1<<9\0=eS\\:C\<Λ=\"nGu\<N\\\\2<ks^;\>\n\3<.G<l3`d\ZQGҘ\k=wH_;v9=*`\><\0}<\=Z	<Z\<\\!=Ti<\Ɏ<\\\!<\\<Z.=鐜n\<=?\\d\r*ls\< <\Z=/;rB=\IĻJ8;bpH=KG===\}9	5LC\lhG\\<q/;\=<N59\{\g>\v=R\Z=	\=\z<`O=	\Z\nD=\=\\n\r;\\(<;<vO<>\<wA<\>|=9<o=R\oj;2\=-=Ud<\\нnJ\n\'ӂ!mk9\fdTm\rd=\\<0sq{=Т7=\<Yuj\Z_\\<dzJͼ׏=getA=-<.;yg<z8<k2[=\noD\<w;1=g\|=Us\0=fz;\#\VG}\s#ڼ\\=2j\:%5\0\\<-GC</l=Go\'U=I \<<̼9=K\\n\\0=i\0l\Cg\ԶϽEW<D,\Z\\<5ɽtL=fqs<|!=\y\T[ýQ=\\}[\=/JJ1<\\\A-L=](ú\:^5D+\c⾻?f:<\\}=:=gW=\'==Ⓖ-><R$\I=)D\ؽ\*;By{\G\YT	<+k,=\'Aru(<\8\\m8=@\5ʙ:=\U\=	Ui?=Ē޼+ =$~\޼\#\<0!$=\G9(.\ZH;~$;LD,\=¼=Q==ǁ1=g\ȟ=\\&<kFVU\aC2=\lFL<Ppܽ|3F<5=W=5=;=\:\܍=g\Z|=Փ=_\W@=:E;+ﺦ<=)2=fDzt<:\'=Y\<=1s\=߭<\\<sqx<uP=\\"<t/P{5=\\\<\\}{۽&L\r=d,=a\\<\e`S\S=_T\K\w=,#\>K\>\<\\'<\\'=\\\"~','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3086,'9d0b6ec8-8f95-4df5-8fea-6fe8a33c9ae2',2,'market, SDC covers all the basic modules required to run a successful hotel business. 70% of the revenue generated by a hotel comes from the guests that come to stay in the hotel, therefore a system as such requires every attention to details as far as guests are concerned. SDC provides a state of the art front office reservation system that allows to know everything about a guest including any preferences in regards to dinning, lodging or any special requests that guests might have. Main Screen (fig 2.1) Apart from that house keeping also plays an important part in serving the guests as per their need. Restaurants are another place where the guests need to be served in a very professional manner. All of these operations are carried out by SDC which help the hotel staff to address the needed of the guest in a very professional and timely manner. Lets look at the operations of each of these modules. The above is a screen shot of SDC main screen. This is the main entry point of the system. On a first glace it gives all the statistics of the hotel that is relevant to the day. Values such as occupancy percentage and rooms to sell are very closely watched throughout the day as that determines the total revenue generated at the end of the day and also gives an idea of how many more guests can a hotel accommodate if new guests arrive as walk ins. Clicking in one of these parameters will give use more details pertaining to the parameters, such as if we double click “Total VIP’s” then a list of all the VIP’s with their room numbers will be seen on the screen. Shown below are 5 buttons which are the entry point to each of the mentioned modules. They are as follows: Front Office: By clicking in the above button in the SDC main screen, the front office of a hotel is seen. Front office module covers all the reservations together with the status of all the different rooms of a hotel. Settlement and viewing guest folio is also done from this module. Point of sale (POS): By clicking in the above button in the SDC, the POS can be accessed. POS is a module that serves as a restaurant management system for the hotels. Each restaurant of a hotel has its own terminal or POS from where it is accessed and used. House Keeping : By clicking on the above button, the House Keeping module can be accessed. House keeping module provides the house keeping department with the status of different rooms where by they know which rooms have to be cleaned or cleared. Accounting : By clicking on the above button, accounting module is viewed. Inventory Management : By clicking on the above button, Inventory Management module is accessed. Apart from accessing many different modules, SDC main screen also gives an over view of different time zones of different parts of the world,',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\<\\ἰ\rq<#80u=Wy=Ẻ7ʔ=\\\;IS.S<]<WDp(b=fQŽ=r7|oN=\I\B\ Ѻyo<\\\*<+\;{±< &{B=/˖=\Z!>3\<\'-=qλ\`ؽz`<}<Zi<Լ?\AλzaJKݡ=Ȕ\ޟ=Z=bs=0=o\=	\b̓\<fd=!s\<v<\[<\Z<야ns\:5\<W.<fs\pļ<\ZJ֐8\=20z\<:!=\'jMI\<>\{mdb=yx\\r<|=㶙<)E0=\\=\Ž\'&\y=ώ<\\_=T=q=\\Z\g\a>DI=S\Ż9X5a\˽	a=);\ļȖ\{]=l\\=\0ܼs<Õ\Z\\<\Zc(ҏ:H{H=̾\	f\ýļ&oM\y<\\<\C\n/5=jA<0먼&l\<E\<U\s=ޣ<\<\m=g\\0=\,\\<\\\<@\=: <\`P=ڃ<(\<K=j<<>p=!<<v\Z=g=^\\<yt=Ħ\ƻ;\Sv\\\<gJE=\۽	=Z\\X\<aH\=\	\Z\0\\=(gpf[;씽<`Q׽@\\G\<q~}\\n\jK#[<8i:\$xԻR=(k\\ro< <\<H\0<v\\\f\"%:\=]	#=|ݓ< \H`}b=ʉ\'_D\<\\\<.1=:7#<\\\`	&<3\Zik\=_\n\'쫅\\\<f?\ܺ樽\D\=U;ZCڂ=\"\;\=\˼\'𼆶\'\==Y[=\\ΏeU|\q:d==\Z=\\<L<nT=\=x\lFcVB=\n;>*>1Br\<\xX#6(7i~\m<Ê\w|<\=m=&\*=Ҩ<f\=\+\\v;\=\`3O{=}\,q 0wWJ\<\Jҽ\\Z\Ɗ;\L=\p\#\?ezμ \H\ޖtE<\Ha\"<\nOͽ<l\\Z=\Κ\⇳RnF\A0<\<8X0\\'g<X!=\J<\\Z=~*r=\j<\^]A;#Eǻ\W>x|B<\<B:IZ#=P5\6\<cl25%=L7;ǟ;\=+=\9=$>\=32<y><ݼD=\z/=ڐ<*+\<\Z=\D~<\n<\LB<7[k=\<<T\\׃=n)\=\=8Z!\k=\\<\6\=\"/o\\<','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3087,'9d0b6ec8-8f95-4df5-8fea-6fe8a33c9ae2',3,'Accounting : By clicking on the above button, accounting module is viewed. Inventory Management : By clicking on the above button, Inventory Management module is accessed. Apart from accessing many different modules, SDC main screen also gives an over view of different time zones of different parts of the world, and also a small calendar which is helpful in many different areas. Now let us go deeper into each of the modules of SDC. 2.2 Front Office. 2.2.1 Overview : The screen shot seen above is from the front office screen. Individual rectangles denote individual rooms of a hotel with their current status being represented by the color of these rectangles. For example, rooms 701 and 702 are out of order therefore they appear in a grey color, and the legend present in the right hand corner represents exactly just that. On the upper right hand corner there are 5 buttons. They are: 2.2.2 Refresh Button: Refreshes the display screen and updates the current house status. 2.2.3 Find Button: Upon entering guest room number in the highlighted textbox the user can press the Find button or press ‘Enter’ to view the room details. 2.2.4 Rates Button: Pressing the Rates Button will display the different rates offered in the hotel . Rates such as CP, MAP, BB can be seen with their individual breakdown of their room rates and meal plan rates. 2.2.5 View Report Button: Clicking on the View Report button, different reports can be seen. Details of different reports are covered in further sections. 2.2.6 Drop Down Menu Functions: Fig 2.2 Buttons Fig 2.3 Room State Fig 2.4 Room Type There are three Drop Down menus present in the front office screens which are highlighted above. The first one gives you the list of different room types present in the hotel such as Single, Double, Suite etc. The second one contains different room states as such Vacant, Out-of-order, Occupied etc. Selecting (Fig 2.5) different combinations of room states and room types and pressing the Find button or enter, the user can view the desired room having the selected states and types. For example in figure 2.2 and 2.3 user wishes to view all the single rooms in a hotel that are vacant. (Fig 2.5) Given below is a screen shot of the result where different room number and their corresponding states are seen. Fig (2.6) 2.2.7 View Room Button: In the above figure if one clicked room number 605 which is highlighted with the blue shade (indicating that the room is occupied), one would also be able to view the details of the room. The Figure is given below. 2.2.8 Reservation. Overview Fig (2.7) The figure above is from the Registration screen of the SDC. There are two types of reservations namely FIT Reservation and Group Reservation, which can be viewed by selecting the respective buttons shown below in figures 2.8 and 2.9. (FIT Reservation button or Group Reservation button). The result of the desired query can be seen',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \nF<-~vMY=tt=\\=\C<hV9=Z&O=x^li2=\`\\n;j͇\$<s 4<\\8<	{»rbb¼\e\a<aY\ZM=\<췽 \Z\<=i+=Cr=\A=F!n\\[\=l|ru\"\<иZF;\0<~+l׼u\0<\={=\P<B\=^7<,	><f\Ѽ\\;]E\;\0*\<\\l\<<jL+=`ۼ\v=v\';˸-\\\\N<}0<<\\\<7AbFq<\\@WJ=x*!v=<^i<\E<ߜ\Z<\ջF(= \':+\̼k<P#:|Bae==M\`n1=,=\\<=Q_c<Σ\=|\<A1\0\\r+0r=/%\Ģ:@;,\<\rG=Z\.\=\q`dN:g\K+u\H=Q\	u&Ė#CҪ<\">\&<\.\Ӹ;\_=o\<_e<~=\#K !\2Jָ\=bﺻ&i(YY=\ּ\=u^&>\_=~\=6\<s;v;=\C=jc=M<b{5=O	;H\	<\\<\(FmkQ\Nm=\\nU=X\<QX=\Nq=Pj\\(ܧ\]꼖Q<іŽ^<q\55Q;-=c7=M\Aj=V^\\r=S\⼳\"=\nA\&Sn/[=:\\\;>1fϼeX\q\;	\"\\ZЩ&=f\\0pp=NZ\弳Opa\\Z\r8.=*=\\Z=\q\\Sيؽ\[Nk\9S\<l<س<\<vݟ<<]\^<*PSu==*<lܽr\'<wdZ\`={7.\"O\|&\=\G[=\\\;<tE\7*q\0\=8[=P.-<\r=Itj^h=\`=\>0&ͽr<.5U\:Y=\<N+<ZŻች\\7 Eļ!\ս\\=\\\:\\d\=ȩ<ܯ\<c;\h=\}X:w=~ZP\Z=Ͳ\r޼ԝ\\1HW\Xz\uC.[o8ҍ;Tsj\&7z:?\\\\8j<;	-\=g=̼󲁳\Tk@\:\}*=fvBc=\\\=OW\\=	-缧\"=.\=*<qrI\Z=7=oW;GDZƼc=c}Tc=1@o<MMK>=[F\=ʉ=\O=(G¼}Y=؆5<bTjt\=PY@=\ަ=I0Ca⎱u=-<Òu\]CBU<!}\.\\%Ǽ[\=\Ql\̼\nw\;\\<\Z\<\\<\<5k=ե{Y<','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3088,'9d0b6ec8-8f95-4df5-8fea-6fe8a33c9ae2',4,'the Registration screen of the SDC. There are two types of reservations namely FIT Reservation and Group Reservation, which can be viewed by selecting the respective buttons shown below in figures 2.8 and 2.9. (FIT Reservation button or Group Reservation button). The result of the desired query can be seen in the box presented above. Fig (2.8) Fig (2.9) Fig (2.10) By clicking on the In House Guest button (Figure 2.10), the list of in house guests can be viewed. Fig (2.11) One can also perform any search that is based towards the guest’s first name, last name or the reservation ID that is provided at the time of reservation. Any such queries can be typed in the box located right below the reservation buttons shown in Figure 2.12. Fig (2.12) On the upper right hand corner of the Reservation/Registration window, there is a cluster of different buttons that provide access to different functionality to the user. Let us view each of these in detail. 2.2.9 REFRESH Button: The REFRESH button refreshes the view of either FIT reservation list or the Group reservation list or the in house guest list, depending upon which button is clicked, i.e. FIT Reservation Button or the Group Reservation Button or In House Guest Button (Refer to Figure 2.8, 2.9, 2.10). 2.2.10 START Button: By clicking the START Button, one can start making a reservation for either an FIT or a group. The details of how to create a reservation is described in later chapters. 2.2.11 CANCEL Button: By clicking the CANCEL Button, one can cancel a reservation. 2.2.12 GROUP CONTRACTS Button: The GROUP CONTRACTS button gives us access to information pertaining to different group reservation contracts a hotel may have with companies and travel agencies. Without any such contracts, a hotel may not choose to do any business with other companies. A contract includes important figures such as number and types of room, rates and dates at which the contract ends. The details are described in later chapters of how to create a group contract. 2.2.13 UPGRADE Button: The UPGRADE button takes us to the window where a reservation can be upgraded to other options provided by the hotel. 2.2.17 ADD ROOMS Button: The ADD ROOMS button adds more rooms to a reservation. 2.2.15 DEPOSITE Button: During the time of check in, guests may be asked for some deposits which can be entered in a window that is accessed by clicking in on the DEPOSITE button. The details are coming later in the chapters. 2.2.16 TODAY’S ARRIVAL Button: By clicking on the TODAY’S ARRIVAL button, one can view all the reservations that are arriving on the date it is clicked. 2.2.17 CHECK-IN Button: The CHECK-IN button takes us to the window where a guest that has a reservation and who is arriving today can be checked in. There are other information that is gathered from the guest at the time of check in which needs to be entered into the software. The guest check',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \noBv)+\W=\=G\= =[\H!̭K=ͯNu\<I$m\\<@!;7=\ok{?<\Lt<\}=Ͱ<R\X!MO\tYeJ=:=,=:@>u5=L̽\5Vv	GC]VFlè<\\"\;D\Z==5%=t^;\k\;=/\r>ur@\Ȼ:Q=Tm<\"=\JkN~\2.=c\o=lA.*Q==ZN\F+t\\\\=.	<w\=\\0<\}&\(\<n=w\\d;2%=Mc<-\'<\`6^\\\\\lt=MJ\$Ƽ=\\<\\?\pO=Ib=e\\n=-ϼJV\=!\,=}/Ey\\1\=\1/u:8\r\ݽ=<\rּc =&o,h4=i`	=\}r<\YE	Y\`5gkY;\n6\G\z\n9WZ\;\bȼ=l^\A=t+<\\n5y=\g%\ջ;\\k\=pyD=K=[&=(\<h=O<=/H=\\<\\E=lp{<\ͼ2rἴL;\\b\g=M\<}a=d\m\ܼ\x1=x\=\l\\<:%\'J==ZG<\o;\s\<H2=MZ[]\ȟ\b\n*=}\4>1=vspH?<P%t\f\";fk\'\\<H\Ͻ3\\=|(Ys<#\q=Q\nT`\mt44<K\\M=\<a1c\1=H9KlM\r=t$\\"T\<\\=L\B=KH1ꉷ\9=\y۹\\\<\0o=<7\0c<p\켷\n\\\P=4;N!H<>ae=ɝ;>{=W4\=k\Q<\\</=*si=\-=@\Z\ֵ;<M\dNJ=H=(ּ\oGo<x̽ ĺ=<\Ar\w\n;K\\z=F=\p|ЃA=\V<ùu\L8?d<ċ\oYi=\L=t?\D=\a<¼\\<\=1;mUAu<ٝ\\Լ\|\<\8X\\:=&\0=\o(<㺣D?=\8\'=K̼8<\\=\=%F!=Ӫ;u\>\<_\\\<\cg(;{n/\mvY*p;\JR\V=鲪_\\\=ěJ\=\Ź<v=Ac:Oj\j=\\=K;D;ʼ\\\ܼ\\\<,;&/\Z=\{<\r><m=\ ==7=>\\]\0\\=`\\\=p\;<\\l=aHy=NX=E7=s&\<~K	aP|׽\\}<\\S	=q۹\=f!<HgĻ@=\֟w<','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3089,'9d0b6ec8-8f95-4df5-8fea-6fe8a33c9ae2',5,'CHECK-IN button takes us to the window where a guest that has a reservation and who is arriving today can be checked in. There are other information that is gathered from the guest at the time of check in which needs to be entered into the software. The guest check in process is described in detail in later chapters. 2.2.18 VIEW DETAILS Button: The VIEW DETAILS button shows details such as guest details pertaining to either FIT reservation or Group reservation. When the in house guest list is viewed by clicking the In House Guest button (Figure 2.10), the details of each guest can be viewed by clicking the respective guest and after that then VIEW DETAILS Button. 2.2.19 EDIT Button: The EDIT button takes us to the window from where reservation details are edited. This feature, together with many other features is password protected so that only the person with the authorized privilege can make such changes. 2.2.20 ARRIVAL/DEPARTURE Button: The ARRIVAL/DEPARTURE button leads us to a command centre from where we are view the arrival and departure records. These records can be viewed according to their dates. Below is an example of such logs. 2.3 Point of Sale The point of sale (POS) of the SDC is concerned with the day to day activities of a particular restaurant and billing. The POS handles operations like ordering, notifying the kitchen, settling a table or posting the charge to the room of the in guest. Below is a screen shot of the POS main. The main screen of the POS represents the exact floor plan of the restaurant with its table numbers and other details regarding the location of its exits and bars. When trying to access the POS from the main screen of SDC, a prompt is generated asking which restaurant is to be entered. Upon selecting the desired restaurant its corresponding floor plan is fetched and shown on the screen. The main screen provides some valuable information such as which tables are occupied or vacant or which tables are departing making it easier for servers and managers alike to be better prepared for their service. The POS and all of its functions are described in detail in the further sections on POS Functions. 2.4 House Keeping. The house keeping module in the SDC is designed so that the house keeping department of a hotel is fully notified at all times, the different statuses a room may have during any particular time of day so that everyone working in and around is kept notified. Below is a screen shot of the house keeping module. Shown above is a listing of different rooms and their respective status. Just looking at the above screen the house keeping department is made aware of how many rooms are checking out, how many rooms are occupied and dirty and so on so that as soon as the rooms become available they are cleaned and made ready for future guests. Rooms of different categories can',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\0\<p\<!@&<}|=\\==O\z\<\_=\\u<P\;\\<\n\"\μ\Ƚ\\\r=HO=rM=|hm==䢼]p\\Z;\h:\W=\\ö==G\&S`ꋼ\0h\;R><ws\<Fa\<\=\>\'v{\\sn\=\f\<g|=SVM=\*wS֩=<\'qtnkJB=EK;\?+:=%Km\,ݼ\5=!\\T\\t=0W>\nc,\H\<\,}=\-~ͫ7\\n=\晽q\]<n<\\<<\<j\<\\c\\\;=<\\\μ\~޼n\<;8<-.1aL==*>=N̳<B=\|7=K	\	>O<\<5\ͼF}{@*=bA=U\\<\N<\f=\u=\s=O`-=F;Ҽ\`q쳽?)t==	\U*\\rRmSx@p_=2<V2\\nü:p;\\<=\۽/=삽\\<ZV=ݺ\n\\=r˶;ќ<ސ(=\\U\;R\=\0Ү;\Y=\*=1	=\ȅ<\'\e;ͼ\B\\\\<b<4V\>\\_<6Ѫ\\69l̉YE}4\PT\\\"\=跕<h\<ˡ!=\=mwL͏<6\]I\>yȫ<@>\0u\"=\_݈<\\pU/Hk\?{kVQ\=;#l,<($+<1<w\8\w\</=\;{#=Fg=Ǖ[= /A\u<<9&}\'z`<\nἯ|@gh2	<\\\E[=\.<\"م=\a\\\=z\;d\n\ʽ?\߱<ɼ\ګ\\r\8\\ʽMw_ \<oxȐV=U?=ѻO=d_<X=\(<5\<=\"=\L={ͼB\_<tcŒ=]L=ۦ=\U=n%{5=j6f=\\\n=\.7.\=L\<:=nÇˇ=h\gP\\;+\=\\_=k<%)\\=[\\\y=\:=ާ1znC(=\===\p=\	)\<ۈ;\{=#\\=Z\m\s:V\.;)\<\^h\xj\TR$<虛%\|;2%Lz)<\½T;S=\\<aQ=L\zƙ:l;\<\r,<;w<?=(\\̽\&=a֢=\'5Z\\\ީj2\<*2ݻ\r^=\cK<2\y<Z\5=\n9h2@= S=\=_LJ=\=\<F=$=\\\;\f=\	=\\=n<k\f\\\=as	<6\ܻ5)^༫P,ygP=7C(==x鷽\'e>A$):`<\س=$(','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3090,'9d0b6ec8-8f95-4df5-8fea-6fe8a33c9ae2',6,'the above screen the house keeping department is made aware of how many rooms are checking out, how many rooms are occupied and dirty and so on so that as soon as the rooms become available they are cleaned and made ready for future guests. Rooms of different categories can be searched by clicking on the respective buttons and clicking the ‘Find’ button. The complete function of house keeping is explained in the House keeping function section. Functions The numerous functions available in SDC enable one to better understand how a hotel operates on a day to day basis. From tracking guest folio, to viewing extra charges occurred during the guest’s stay, SDC provides the simplest of interfaces to carry out all the operations of a hotel in a very convenient and efficient manner. SDC also supports the flexibility of posting the charges from a restaurant to the guest’s room. Hence the operation capabilities of SDC expand into integrating different departmental functions of a hotel so that various tasks can be accomplished quicker. Let us look deeper into these different functionalities. 3.1 Front Office Funtions. 3.1.1 Guest Check In. Front Office is a place where the guests interact with the hotel formally for the first time, therefore it is very important for anyone working in the front office to be prepared with all the necessary details one might need during check in. On clicking the ‘Today’s Arrival’ button shown in the figure below, the user is able to view all the reservation details of all the guests or groups arriving today depending upon the selected reservation view. (FIT or Group) The procedure of checking in guests belonging to FIT or Group reservation is slightly different with one another. Let us go deeper into each of the following. 3.1.1.1 FIT Check In. As mentioned above, the list of reservations that are arriving today can be viewed by selecting the FIT reservation and clicking the Today’s Arrival button on the top. The reservation system searches for all the reservations that are arriving today and gives the result as shown below. The figure above shows two reservations that are currently scheduled to arrive today. By clicking on the individual listings we can view the details on the right side of the screen. We can see that for reservation 19, the assigned room number is shown as 0 and for reservation 20 the room number is shown as 602. This means that for the reservations having their room number as 0, individual room(s) will be selected at the time of check in and for the reservation with a room number other than 0, 602 in this case, a separate room is kept reserved. This is usually the case if the reservation is for a VIP guest. The above figure shows the details of the selected reservation whose arrival date is today. To check in guests, click the button ‘Check-In’ which is shown below. If the arrival date in the selected reservation matches with today’s',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n5\W<\v,@N\<\=߾\'=\"=j3\\<|<yY <U\\;*+4ƹ\r=]\	z=ܔh=s`tcp:<z:e&<Լ	&\0L(Ͻkj=@\=~=,6G<G3W\%<\'\<m<e\|\,F<wLe=c\ \\"|\;I=ʝ=sZW=\%k=\^<=\-=L܋Y\fZ\B;=4=\<Yd.:]>F=\"\=\\Zd )=|`i<\ʷf\\<3ح^my31=s\<Qc=K\γ=\'\0@;R\<c7:ûŨ=R\'=\\n\=W\\z$ɜa<Ë=j <\\\<-\<7Q=A;C..>\<\]\;4Ioc=;=.@\(!OP_O=-\\=lRy?=\\ȺF#=\Qt\<\阽M\\=\\	퀼[n<\ =2<0:=\Ԑ=]=tnZV)=\c\8\y`=Y\0Y<\W<\w=L<\H\,=\?6F=a\\<h=*d<x=\=d<JZ<\<G\:\<=$OV-=\{O\\Wa<M\,˽Gԙ<W`Y<.=I\Z<J<\\=ϼ\\\=ZNf\!&=?f;jP9r=7Qɽ{%e=\a;^\n\,=ؐ\p<:c\G;=g\WN\.rA<\"sMsO0\r=@`QUߪ\"@A\}\<E\<y)<em7qh=\}Il5=zQ{ꪭ=\Z\&==\\R<C^0\\9`i\\=y^9ݽ\\Dm\^M\Q<q0a=\j4D\0>\h=ڨf\\\!\"=\;剎<6<GOWp\Խ\y9M=\9===wxD=\b\\*=\0!=|\\0$b?=F@/\z<nŽ9\<gURuU\υ\4r\\>=OW<R\\:z\"=\0M=<\;<$\s=\\=FX\Z\Q=\\4\~g=p=\fO_KaE\r<\<v:^O\\\d;L\z\_<\;ﱼT\~\Ҽ#\BiLV\C;t@<LI\}?,= r_U=򿌼qhZ2\H<!<=ev\drO\B.!<7=\0\0;3\\r=\'+=\=:M\\ȽS=i=<|<Dkv.m.p=C׼v\ =%<e<ScĻ.=&QK=]6=$>9=l\\<\m;6_=ߞ\=3 =Å_=Q\=s\"\&\qӽ?\;	˼\S<\r<bs<+c\5&w=}fs<H|=,%$=ð=5\\\r=\Ze\i<','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3091,'9d0b6ec8-8f95-4df5-8fea-6fe8a33c9ae2',7,'is usually the case if the reservation is for a VIP guest. The above figure shows the details of the selected reservation whose arrival date is today. To check in guests, click the button ‘Check-In’ which is shown below. If the arrival date in the selected reservation matches with today’s date only then a check-in window is presented to the user. The figure below shows the window from where we can check in the guests. The figure above shows the terminal from where guests are checked into their rooms. As mentioned before if the room hasn’t been selected during the process of saving the reservation, then 0 appears as the selected room number and the system will ask the user to select a room first before entering any guest information. The system searches for available rooms based on the room type which was requested at the time of reservation and presents the options in the right hand corner of the screen. The figure above shows the interface from where a room is selected by just clicking the room number. (Note: Guest check-in is only possible after a room as has been assigned). When a room number is selected, a prompt is presented to make sure that the user intended to select that particular room. After pressing ‘Ok’, the selected room appears in Red as shown below. Now we are ready to enter guest information into the system so that the check in procedure can be completed and keys can be issued to the guest. The figure shown above is the terminal from where we enter all the guest information during the process of check-in. The entered information of the guest is saved by the system and it can be retrieved again in the future if the same guest decides to pay another visit. This type of guest tracking technology is found across all different PMS’s around the world and is one of the most helpful tool with which a hotel can understand more about its relationship with its guests. Let’s move in deeper into the details of the final stage of guest check in. Upon clicking the ‘Check-In’ button the above terminal is seen. The ‘Enter Guest Information’ box is already filled by the system since the guest information was already saved during the creation of the reservation. To save the information, just click ‘Add Guest’. The system only lets the user check in a specified number of guests, which was entered at the time of saving the reservation hence it keeps count of the number of guests entered. If the number of guests entered equals to the number of guests specified, a prompt is generated to let the user know that the guest assignment has been completed and that the FIT check in process is complete. 3.1.1.2 Group Check In. Group check in is quite similar to FIT check in with minor difference. Below is a screen shot of the group check in module which can be accessed by',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\j\=\<ȚibCI=)=L=T\=ݣy\\=Z\<T\<)6ɼ\E<\<=%ؼ|ӽI/=ME=\\<\dH<`	\@߼2<<1莽G=<6=)kMX\\=W=\S:=t=ޏ\H\AAǜ\ȺE$厽UY|\1;\=\r\0K\<\s֊=C<;V=r<\<\ƦU\=1e	usƼrмD\!\\nh\'\x<p\ag=~콫͞=\;#\\r\_o:\\DTP\.g+=0πp)!Q\'ʬ+\h;x\<\y=\\;P@\)&$=\U\yt4O=ę#=wR6=?a\=\\_\<\=\\=\:K.T=\<M6\\=\r\<$&:=JKV\r<\;\	>\;\a\!=yr=\=:Y<>4!=Kcw<=_Un\D\bq=ռ\	ʉ:\$kb	<\lv\<L-<s\r)t\;<N3\\\=u\R6r\\=Z<\>5\=\=8=h=Sļ_<&<=_%=o\j:T=:>Hǆ#%m\"\3F==x=\\R\'<\Z\|ņ7\\n<\\XV<	Wf\<\r=\\=\\\\j=`9c<bۃ\`\<\w+<eyƼq$\$=\\\ٗᄕ\"RX\"f7L=\̤\ғ<	\<Fw<\(\^ζ\\=k-NPq=]I\*<an<\b<yviMP\<W7-=\I\<\'2=%=?Aѥ=t\9\j\Nac^\]ma_*v\0=\=H~;\==-V=V;(\\Z=M\<\N#=z\uj̼\\U;9֎=b=t>\(8ػ\;=\W\=\!\y==\b\\=L,X<4\\ڌ<\ʓ\j=\=eC=e{;22\<\'ֻ/:Fm2<\=Z;_\0H|>G=V+dýM=\;w\˽\\8==Ϝ=Q$;?/%y.ʀS=Y\0/y<\Zz<=*PK^>6\\0{<\\\~5%b\\<\Z{\\f<O5\nFY9\EӼ﫼:VT\D⽬K\"A|/C\Z̼8\<\\E=\U%;\\ǻ<tP2\A<\\0<|v<4ߚ\=}b=tOy<#U\ZYB\e=tX_;4<T0=cT*ui=a|<BC<i`=V!=9;o\Z\A<\0=!\"\=O\Λ<\lڌn߼?d\<=\Ѽ=<S{VqG\8=\<\\ <b^>Tih=P\qA>\GE{\%;HV=h]','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3092,'9d0b6ec8-8f95-4df5-8fea-6fe8a33c9ae2',8,'know that the guest assignment has been completed and that the FIT check in process is complete. 3.1.1.2 Group Check In. Group check in is quite similar to FIT check in with minor difference. Below is a screen shot of the group check in module which can be accessed by clicking on ‘Group Reservations’ and selecting a group that is arriving today or simply by clicking the ‘Today’s Arrival’ button and clicking the ‘Check-In’ button. The first step in checking in a group is entering the individual guest information into the system and selecting a room for the guest to stay in. Group reservations are handled by the sales department of a hotel and therefore a list of rooms, their type and their rates are negotiated within a formal written contract between the travels agencies and the hotel. Each contract has a start date and a cut off date, total number of rooms, their respective types and their rates. The hotel sets aside specific rooms that fall under the categories requested in the contract known as ‘Blocks’ and only the rooms that belong to a certain block which are assigned to the guests during check in. Hence the system only allows the user to assign the rooms that fall under a particular block making it easy for the front office staff to handle the check in process. Upon selecting any room the box appears in red and at this point guest information is entered into the respective fields. If the guest is a group leader, ‘Assign as Group Leader’ should be checked and ‘Add Guest’ button should be clicked. Upon doing so a prompt is generated to make sure that the guest was intended to be appointed as group leader. After pressing ‘Ok’, the guest information is saved and the information of the next guest is to be entered after selecting a room. If more than one guest is to be entered into a room then the respective room number has to be selected from the drop down box presented below and entering the guest information, ‘Add Guest’ button has to be clicked. When total number of entered guests equals the total number of guests specified in the group, the system generates a prompt notifying the user that the guest check in process is complete and requests to check in the guests into their specific rooms. After the user clicks ‘Yes’ the check in process is complete. 3.1.2 Guest Check Out The figure above shows the status of different rooms and with that we see there are 4 rooms which are due to check- out. We can also see that of the 4 rooms 3 belong to a group and one belongs to FIT. There are numerous differences between the two types of check out procedures hence they are addressed as follows. 3.1.2.1 FIT Check Out The hotel personnel working at the front office should be well aware of the room that are due out therefore they stay prepared for',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n&=9=\hWi=\<ia<	=hյ== /=j$0NPB<\@*<ǿ\<:m\W@<o%<#<w!Q\Hzr\+<y<K0@\np\L\:%\0>Lm=\!k=\{/==$\FᩴHįߍa\=x\	=e\;\r;\<؃\\=\b=\\n=\fO=\nє<?=ĵ+PZ\<\5\<nE\kQ\\<d<\\\`\\\\;Y0 \<c;%H3<=\=\'=vZ\\\A<o\=`۽{N;ϼz\{)\ɻ`a%\0^\=L©\\\L<u\=Y}=B<=\nպ\Ǽⰲ=\ZB<9ى0=\\=!=\0\<=X=B)$l<#崃o\\0>!h<n<Ɋ\rc\<\>O;&\.=\=>==O=\R<R\A=h\3į;lS<\=	14&I)\0<OU=\Q#\\4n=\A<m=b|=\]=A>x<;\\<k\=I\;D<%&<8\ּlQ=\Z=\=r=-\an =k\'/+<^<G-s=s\ָ\;=[I%=\\'R+=\-0L\'X\Zw>;\7\=\\D(=\\<4\=]C	\<,\~\'	<5G`</A<ށ<QEf=\\<1O<UX\<&Q\\9\y8\=\r\ܖ5==8vI=Ar>#<n\<=\@`J\'LL<r<y&\s\\7=S\һע\Z}@v,Ҽ[=FO=h>\n\J<j<dS\0\Ǫ^\=\\ܼ?\\h\=\K\Z=)ǽ2\n:f=Bǝё,F\ =b\qx\<`\=YK;Fa=CNK_(G=\\C;a=FBR\H߼\/5=S\;vY\\ϽI=T\=@\;\>,n2x=Rݑ=\\\\xy\O0=<z=qq\z<RCo\NT<I^;KF=g4\(=Z̒=\.3i}x=\K=%ЂXfʀ<óEQ\=\h=>^\\0<\S\<\I<\ďy<\!\H\	\\5];lR<~j\9<\-<S\\\0<0X$^cT<tP\\zVyR/\A\ZF=J؆\i;r<UWL=K=5\<5	<\r\\<8=N*!\<y\0X<Kzq$T-<Y\\=.dM:uE=\<\Z\<\k=*&= \<\ <<<!&=9\cH\)=/\i=G\+=PӼC4\\⫻a]74\ҟUB+z].\<ft=m\\eN=H<\>b\ü.\oN=\','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3093,'9d0b6ec8-8f95-4df5-8fea-6fe8a33c9ae2',9,'one belongs to FIT. There are numerous differences between the two types of check out procedures hence they are addressed as follows. 3.1.2.1 FIT Check Out The hotel personnel working at the front office should be well aware of the room that are due out therefore they stay prepared for any guests who arrive at the desk to check out of the hotel. Upon confirming the room from the guest click on the particular room on the front office panel to access the detailed view of the reservation. Upon entering the detailed view click ‘Open’ in the financial information tab and click ‘Settlement’ to access the settlement window. Upon accessing the settlement window, the entire folio history will be available on the screen together with the charged rate, the total service charge and VAT shown in the figure below. On the right hand corner of the screen the reservation details can be seen such as the check in date and the check out date and most importantly the payment method highlighted in bold. If the payment method is cash then the ‘Cash’ should be selected in the ‘Payment Method’ box shown below. Since cash could be received in any currency that too should be documented by entering the right curreny in the next box together with the amount and press ‘Enter’. If the entered amount is less than the required amount then the system will generate a message prompting the user to enter more amount. If the amount entered is more than the required amount then the system will highlight the change that must be given back in NC. When all the monetary transactions are complete click the ‘Accept’ button. Upon clicking the button a prompt is generated to confirm the check out of the guest from the hotel. Upon clicking ‘Yes’ the FIT is checked out of the system. Then the house keeping department is notified about the departure by changing the room status to ‘Vacant – Dirty’. 3.1.2.2 Group Check Out The screen above shows 3 rooms that are checking out and that all the three rooms belong to the same group. The method to access the check out screen is the same as FIT (by clicking ‘Open’ and then ‘Settlement’) but the screen can only be accessed through the group leader’s room which is highlighted in white (room 402). Below is the screen shot of the settlement window for group check out. The rates that are charged is automatically picked by the system which was chosen at the time of reservation. On the top right hand corner we can see the list of extra charges that needs to be settled before the check out procedure can be taken forward. The extra charges if present, can be settled is a very easy manner. Since the charges are posted in individuals of the group, they are the ones responsible for paying their extra charges. Therefore each of the rooms need to be selected from the ‘Select Room’ box and',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n<>۩=\Z6ܽH׮\\<ƾ==|=\$=\>=\<Kİ=\(\\0=#W;n\\s7\66<u\=\\T`ݼkSٝ>=\\߮2<O=\\\)G\I=\\=x\<\\\$8	`\UD?A\0@H;g\\q=\)=\&;捘<x2=\r8\=@\<*5<\a#;\k=fܤ8=\nE=1\<NH\\V\O\r)$<dH\Zޫ<+<d\\\<S<\}!#k\mڽ>-;\ʼ\@<Q\\"\i**=\\<\J<\\н\<S=i)В\n=E5=M7F8ၽ\\\=DQ=*\\\Q\=\Zmm=\><\\=ֹ=!d;6\%=r\<*\\%s=Ӈ=؊=\h򡇽F=֠=D\3bG+= =3=\昼\=\\<m	`;aw&\<l=<\	m\ڼ\'ۂ\Qm\"\~q=T`\Q=C=.ʣ=ZVK;Y:)/|;9YpI=\4=׹<oK=\2<4\r\r=ۏ\<f$~=aw=&=Fj=h\\߼Oգ=\G\y<0<m\\< Ȁ<\2=+\ݼ\L@3*9<X\3=\\ıLPm=`2ռ[=\Ϋ=\50l\ȹk<J[v\<h!<\\=;\\	\6 [Ƚ߷d=NZ^C^=TRp=Is\=j=Z\v<w\<)\s<%q\\ؼɽn\^=\'\e\=SeJ0\=,\\"=\oku\n$=\\\n;̅=\\s\ٛ<6Lj%MQ=L^;̮V^=\H\<+\Ｏ6<\fkd:D:\<\n@<\U\Nc=\z<<\h$<1<J\P=`\=v\I\	=\\]Z?Vy=uȼѽ\O&=nC=X=ϣ:\"\<;\"k=[Ubv\w߻𼲊<\@/vA-<\b\"<e<R>~+=^\_t\)ռ\\\\<;j7=\n\e<B\;%f=/\<\\\\x۽K=\sK=\'<a=ｕ\b\\\}<~\\na\꼾Uј&ab\\b2C\K<U\<\|pNq;\o=$;=&۽x	uC=^3+\\;\\˽\'\?\<\\\<_=\$<\6\½\I\:\\s\nջbe\N$>9<V<F<\0\=b\:@6\<ۏ=\\<@\a=TS\=MS;ʽә`1P\<\\\0=ՉG[c{Zm֘̽K\\R#\X=\<ʻV&5\"\<\&==X=2ٻ\B=;','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3094,'9d0b6ec8-8f95-4df5-8fea-6fe8a33c9ae2',10,'taken forward. The extra charges if present, can be settled is a very easy manner. Since the charges are posted in individuals of the group, they are the ones responsible for paying their extra charges. Therefore each of the rooms need to be selected from the ‘Select Room’ box and their individual bills need to be settled. After entering the payment method and the amount press ‘Enter’ to save the information. If there is another room with an extra charge posted to it then it can also be selected from the ‘Select Room’ box following the same procedure of settlement explained above. When the required amount has been entered and also all the extra charges have been settled click ‘Settle Bill’. A prompt is generated to confirm the action. After clicking ‘Yes’ the bills are settled and now the check out procedure can be initiated. To go ahead with the check out procedure the billing instruction needs to be checked. If the billing instruction says ‘Bill to Travel Agent’ then ‘TA Voucher’ should be selected as the Payment Method. If ‘Payment at Check Out’ is the billing instruction then the amount, currency and mode (cash/credit card) needs to be entered. When the parameters entered are accepted by the system click ‘Check-Out Group’ button. Upon clicking ‘Yes’ at the prompt the group is successfully checked out of the system and out of the hotel. 3.2 Point of Sale Functions 3.2.1 Start a Table The figure above is a screen shot of the main screen of the POS. The numbers on each of the green buttons represent a table number and the color represents its present state. To start a table one must click on the respective table where the current state is vacant. Upon clicking any of the vacant tables a prompt is generated for the server/manager password. After entering the passwords the system asks for the total number of guests being served on that table. Upon entering the required information and pressing ‘Ok’, the ordering panel becomes available from where we can select the items that were ordered by the guest. After the ordering is complete the kitchen is to be notified hence the ‘Send’ button needs to be clicked for the order to be sent to the kitchen. Below is a screen shot of the ordering panel. When the ‘Send’ button is clicked, a printer placed in the kitchen prints the KOT’s together with all the information such as the table number, ordering server, order time and order details in that KOT. The table status also changes from vacant to occupied. 3.2.2 Add more items to an existing Table To add more items to an existing table just click on the respective table to open it. When the ordering screen is screen after entering the right server password, select the items being ordered just as before by clicking their names on the screen and when you’re done click ‘Send’ for the kitchen to be notified. 3.2.3 Settle a Table',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\\k<7\=\xz_<\0Q\\=\¼QQ=^(=\n|=) \Zz<\"rf =Ľ\2\.l=~JQ@l\\(t(#λ\$9;[H7<4\"+=\\=\Zd\<\o\\==\\\;\Gkkl\]<\'͌!\;\n\y\y=t[<\\\hp=ˊ0\}=\f=\8\$<Q\?=ӑI+;\=/Y:Q0꽼^L[<J,\0=E+\L=\5\:8\n=U<WPE1\<E>=<sȏ=9\=r\\Zp9\=t\\\<\,֫5	<`=t\\t\\;c\=\=);Ī=\n\9{lnDܖ=\0\:1F=o\<e@ټ^/D\=O\nNt\=\\;8=\$T>T Ld?=\Iz\=zK\<ؗc<=9q$F=s%=~\d*//=\"G=]\,=\˛	\o|\rlY=\C\n\d߼\\U=\\U\Z=\4OJٽ\5=\})\9R\r\C=C=3\;*˻p==N\=<\I<t\\<jX;=q<Q<x=ۯN\\=\\\<\d;q\W=<\r1\O.Ǽ\w\<(\7r/H=\x91Ȑ=\\=KPR<eԽd\~\\n\fý\\G3;0\^~\;\\eU:ONF\:qf\1\'A=E؅\)R=+>\h=\쨼Ȅz=^B+<M\n=yR5jb=ZZK@T:=;=)=:<c\ pT\\eW]\\@\=sWQ\<b=+Z^;Ө?`<0=\\\\!\=\=3<oF=\]\'=j\Z~=L׼\<;ǮZ==Eo4=\'輿;?\<C=/KH=y2<e@\\\Z=\'\r=\Y=Kýd=_~<\ZNc=\N\=!x=@ɼ\!\Oj=\\#;\zɽ#FлTJWEѕ\\E̼6g鼍\!\u<\?Cd	>a=Bͼ;;<mR\3P#=ڄ1:،=Y|;T\{\=\\C=B\y]}A=0\r6\\=\f=3˫C\ͼ]Ƽ)<\\=Br\;!\:\nj<-=[ⒽBϻ\Ծ=\(]*\I%\\C\0==\׽ \=[\E;\<<\ZM<㠽G\y]<\L5()3_!<P\	<\+K\}\<\nv<^e0\=Ud<]\`	Y3=K:]\\}OA&=\F<)>=n\<=[¢+\Kg5<zzѽiP\K%\ѻ\]=\1f=P3Q-\<\&<o==\"<Ml\;̫\0<\\','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3095,'9d0b6ec8-8f95-4df5-8fea-6fe8a33c9ae2',11,'on the respective table to open it. When the ordering screen is screen after entering the right server password, select the items being ordered just as before by clicking their names on the screen and when you’re done click ‘Send’ for the kitchen to be notified. 3.2.3 Settle a Table Open the table which needs to be settled and click ‘Settlement’. Below is the screen shot of the settlement window. A guest may desire to settle a bill in numerous ways such as cash, credit card or post it to the room. After selecting the appropriate payment mode, the amount is to be entered using the keyboard or the key pad provided in the panel. When the correct amount is entered the ‘Amount Tended’ button is to be clicked which will calculate the change that needs to be handed to the customer. To end the table click ‘Accept’. When the ‘Accept’ button is clicked the system makes sure that the entered amount has covered the amount due and only then closes the table and saves all the necessary data for accounting purposes or for any other future reference. 3.2.4 Split a bill Splitting a bill is one of the most important features in a POS that is used for a variety of functions making its application quite handy at times. A bill can be spliced for a minimum of 2 ways and a maximum of the number of items in the bill. For example an order that contains 5 items can only be split 5 ways. To split any order, open the table and click ‘Split’ after which the figure above can be seen. Then click on the individual item that needs to be spliced. When selected, the item appears on the left hand side of the screen. If ‘Split’ button is clicked at this point then the system will split the bill two ways with the selected ‘Red label 30’ appearing as Check 2. Below is a screen shot of splitting the bill in the manner mentioned above. When the bill has been spliced as per the need, ‘Done’ button needs to be clicked which closes the split window and takes us back to the ordering screen but now with an option of selecting which check/bill we want to view shown in figure below on the right. By selecting either Check 1 or Check 2 we can settle them individually as if they were separate tables. The un-splitting of the bill can also be performed at any time by clicking on the ‘Un-Split’ button presented above in the figure on the left. 3.2.5 Add modifications How the food is ordered by the guest might not always be the same even if the same entrée is ordered as different people prefer different way of enjoying their meals and as a hotel/restaurant guests have every right to demand things the way they prefer. Adding modifications as such means informing the kitchen regarding any special requests made by the guest so that',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\\x[=\"rtѼ\\Ľ/M<=p\;HMq=\\={\<!x^uj\"\<m=\\\)\u: =N\<\;$ߔ6=\\<U\n`<N\]:G8=\=\m)$\gSܻ۶߼9\0ۛ<s\/\K<(i\0=?\;&==4:u0=\r*<\´\=\?8f)=\\>:<\d*F\41]=\"\\:p,=Ђ\;]<\䎼:x-=\rN: >oqǽ鐼-QS<&\"<\?<\v4<a=\L;	e\n?h\wi=\?h*\=\n\=	\"=j=a89\;k\\=^=3=O=|<=\ʼ=\^@=wy!_f=\	ݍgX\<6=\-{ע&~=\~ȼ\;\\\=ahH<+Kx=kА;\=g,\<\'!Q*뮽5<`]M\=Pl<x?=7A7\t=]<=ZM@=\q;BK⑽\˻H=?\V=[$P\r>7I=\\=,$=])}<=s<q=X&\C9<\ټ3\<kq\"\U=ĭmʍ\':缇w<<tҽ\K=\[F73s=\6=p=\ra\\\0<\1X}嵽\l?<kvRo󦽲J\rߋ<\#=9\n84=#Rͼ#=\0J\˽ī===\ⒼA\nҼ\n=V	Ua=.\<.h\<!g\2=cl;H=\Z\,<\Z<HC<>7=Q\;љ\n>c\"yDm=1~b\ļ\g<=\\\$mF=8\=)\½i=K\"#@n0˻\/9=\=\nZ<>XK=5<~=*/;kn<\\P\sK\0\=ռu\dZ=\nE=	hUR=j=\v-\=yd<\l9h=:H;i|f;\Oȼ\e/<O;:>{<\\u\n?\=-=x\<\]LYe轉2=\\=\=Y;%<v	=mH6\\<0\n<t뽠=I	>ռ_>i<iX|_^ý\ƼnML=\<7QYtM=PK&\=8.Ű6\Hq<[޽Xl<5=TUT=ryQdjĪE㚽\\ټ\H\<Le\<Zgڼ\=[CjP9;\n=6\2=\\\=b^\\+<\\'\<NE\k;=\;ӭ߼4s\<,=&+P<5H><3@\3<Id=`u<\\\y<m/ϻ\=\Z\r=_=\5=h\g؜H\?L\\<\Z^\;\@^\\ؼq\<\e=\=z=\\\\s\=;\P=\\\w=<\;Zz<\<)\0+T\\','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3096,'9d0b6ec8-8f95-4df5-8fea-6fe8a33c9ae2',12,'even if the same entrée is ordered as different people prefer different way of enjoying their meals and as a hotel/restaurant guests have every right to demand things the way they prefer. Adding modifications as such means informing the kitchen regarding any special requests made by the guest so that there are no complications later when the food is delivered to the guest. To access the modification screen the ‘Modification’ button needs to be clicked and the modification can be entered only after the menu item has been selected. Below is a screen shot of the modification window. Any modification can be sent to the kitchen by typing in the requirements either by keyboard or from the screen itself. When the modification is typed, click ‘Done’. This will take us now to the ordering screen where the modification appears in the box presented below. Upon clicking the ‘Send’ button the new order will be sent to the kitchen with the specified instruction. 3.2.6 Void Items Items need to be voided at times for numerous reasons such as for a mistake that the server committed while ordering the wrong item or at other times the guest didn’t necessarily like the food hence he/she decides to change their mind and order some thing else. Therefore to address these issues and many more the system provides for a way to void items. However voiding items as such is not a very good practice as it might create problems with the tax officials during auditing if done frequently. Therefore it is encouraged that the users be alert and calm while entering the order and double check it before sending it over to the kitchen. To void any item select the item from the ordering screen and click ‘Void’. Voiding credentials are only provided to the manager hence a manager password is required to enter the voiding screen. When the correct manager password is entered, the screen below will be seen. Before voiding any item a reason has to be selected. This information will later show up in the managers report so that a close eye can be kept regarding the use of this option. When the reason is selected, ‘Void’ button needs to be clicked which voids the selected item and takes us back to the ordering screen with the revised order list. 3.2.7 Room Post Room Post pertains to posting the restaurant bill into the guest folio so that the guest can pay all the bills at the time of check out. A guest may also be entitled to a meal as per the meal plan purchased hence the server/managers need to be aware of how the bill is to be settled. To complete a Room Post click on ‘Settlement’ and in the settlement window click ‘Room Post’. Below is the screen shot of the room post window. Before posting anything to the room the server/manager should ask the guest his/her room number. The room number is to be cross referenced by entering',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\rL\<p\=Pe<;U=\\_\<E<\I^$\<h-=\4\<\\\\Wׅݫ<@kE\=!;\`Z\K୘<V֨;g\\<\ MlL(4\;=+O<><=}\<\\< c.Z^H-as+w\<8*.$Yȵ\}jWiwK_-\\Ry\ \cҼ=a\q<\\RMQ#k_=|{=\n3;,8:>(8]=~<1ݻq<\=6<\\.=\MWTPfS<9\RBZ\CR<_*\|p=7VK໭Ol<eN\yȠ\</]|=\C=\\\<F*p:[jn?K=]6<]\\}&5+p</=<g\L=o<+=ꉘ=\/(|=P\輑׻\k1\=<w\ݽ\\\\Z#\}=v\n<=P`=D/\=\x\Q\=!\n9sO\jd8=ޒ<\;>h -KH콻	YC5=f\A=\4\63=	bO<f=v\=Ur(=\<ż@!q9\\1</_<+s@=\ք\=l;\qV\r=\"z_ K<<\5>\"U</&B<s̶\'pH\Zj=\Ζ`K=<=\J:A<\\l<c=&\g=\W8=!\g8;	O\\<\:\0=$[=~m=¼\9zwn<n\<\?+<z\\Y=v\;X<\E=Ȕ6;h	\eǼ\\<@x\\'\\<\9;\Z;=\\\#\'\v˼/=k=8<M:\;ޑ;2Rj=cTm=@=*\3ϋR+\Lr<\(=gB&ǽy\\<f#\h\ф<\4<ࡽ@wD\=M7\<M\0v^b;4\=\{=t\'Z\\;CM=_\=\x;:oѽT\¡Gh\Z%`==\'B\<%=F[>H=S\<\J̻=S\= <\0ʼ\衽Ǵ<_T=!&Ċ<[\96%p(=Db=V>IWGfX:\;Q=-=M\;`!~*4տ=\\;\_~\\Z=j:\\\=!w`\=v\\\<\0k=\<\<\"x\\U-3\?=ҍ==\ =&.\\<\w=IW=_w<Q+\=J=L|[Ic>5\:i4FJdL=/={O;a\,F<3\I,ʼK1[<-\<\r4;v=F_<(\=UBRJt\I~<7<]\=\e=1\r_\	=s3>\,\g)\rs[<,<\zM>hGҽa\=DuZ%<SMFP^\Ⱥ.Pw\;\l{=5<៌a<?\=\)A<PC>\	=_<\\\=\䠼F8\"','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3097,'9d0b6ec8-8f95-4df5-8fea-6fe8a33c9ae2',13,'complete a Room Post click on ‘Settlement’ and in the settlement window click ‘Room Post’. Below is the screen shot of the room post window. Before posting anything to the room the server/manager should ask the guest his/her room number. The room number is to be cross referenced by entering it in the respective box and pressing the enter key in the keyboard. The figure above shows the information of the guest staying in the room 605 with their respective arrival and departure dates, meal plans and the total amount due. As mentioned before there are two ways to settle the bill. One is to post the bill as a charge so that the bill maybe settled during check out or it can be posted as a meal plan so that the guest is not charged. If ‘Post as Charge’ button is click then the bill will be charged to the guest folio but if the ‘Post as Meal Plan’ button is clicked then bill will be settled as a meal plan. However across different parts of the world including Nepal, alcoholic and other certain beverages are not covered under the meal plan. Hence in that case only the items applicable will be charged as meal plan and a separate bill is created for the other items which cannot be covered by the meal plan. But this new bill can be charged to the room as a charge. 3.3 House Keeping Fuctions The house keeping department of the hotel is constantly made aware of its rooms and its status by the house keeping module of the SDC which provides all the information in real time. During the busy season of a hotel the house keeping department is at its busiest therefore they clean the rooms from floor to floor and during slow seasons the rooms are cleaned as necessary. SDC also provides this similar functionality where the status of rooms can be changed individually or by the floor. Some of the basic functions of house keeping module is explained below. 3.3.1 Change Status Individually. To change the status of any room individually just click on the particular room from the screen shown above. For example we are selecting a room with room number 604 who’s current state is Vacant and Dirty. A room which is Vacant and Dirty can only be made Vacant or Out-of-Order, therefore these are the only two options available. To change the room to a vacant state, just select the option ‘Vacant’ and click on Change Status. 3.3.2 Change Status Floor Wise. To change the status floor wise click ‘Change Status’ button presented below. Upon click it, the above screen is seen. The house keeping provides a way to search the room according to their state and floor. The two screen shots below show where those options are available on the screen. By selecting a particular floor and a particular room state we can search for all the rooms that satisfies our criteria. In the figure',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n<\=r+Y^<\\ټ%=:\.<==y<+Խ\\<\==ELdʼ\$=\\0\<^v=q<Ӏ=%}\'>=jʺ\\`p=\N=P=ˇ9<\\0;\\R\=j^ƣ	̳;\Ǽ\r;\*\|<O=tb?z=k4=:\\;ұ:=\8%m\20=*]sv\09<SM,C\/%uM>\<K<ܞN=TLYcD~g<:<2\=~?<\\0H\<\\;\><\B=s\"\hJ^v];9~ws\'7=2\;j\@SU=d\=]\<p=2X=\%/T\b=\H= >=a=\\r%t;\9=a\n\=!p=_5=E2\\b\F4$=\[*<\{<Z?=]h>d\\P=\<\\^댽\b)y7#=	#)B\q\=ϾjMќ\<鹚=3<A\=+\u=%h~\B[=&<&s>(:H?{6\=\j=\\qh)=	=\9=c=^\Z7\\<?U<JI=ԕ<\\%\=\̻U\I5\<A\<\U\\<\䶽k\=\\\<,K߰<l=\:\<Zҽ7\'\ڽ\r%qFn\6=\|l\I\\\b<^q\\\<\W%=aO17\5~^idt=C\bǯ/=+;=\"a9=))5v=c\¼u;{<k=\jۼa2V.\a<6=\n<Zs<\7\;Ȣ;=:<tǼYݼ^<p\\\>7\0V\к|܌;7\Z=0\(6W=<6_\}^=\ZZ\ة<7\<>=Ђ=\n<W=7=C}#P<\_ai<rV=:c:=\\~4\:=V:װԽb<\\^\\<\\<\i\G=w\=\\)\\Ƽ	z=C&<ͬ콽z\K\Z;><	\:T\Om.G\d=l\g=y:=-F8z=;5=l<D\<=s==^y;Ko=<|ŝ=E\\<[O=A;$C,X4eQǼ;%M4\G=J	:;u<͞B\;TD9d7vPl:4\\|G<\"k</x\I<\\r\}\m2=sW<;Pb=9p˼\\rcǰ=\0=cdlbS\?Mr<u=@Xf:<\>8ҟ=AɇWt=rߐ\a3=XxGK<.J%}N=jU=\^Zy2|ڻ	E=c#1\k\SuAعS\\N+\Ի(\X=\\j=>w9(\q\=n\'h=ŉ<\\=;	(V*s','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3098,'9d0b6ec8-8f95-4df5-8fea-6fe8a33c9ae2',14,'a way to search the room according to their state and floor. The two screen shots below show where those options are available on the screen. By selecting a particular floor and a particular room state we can search for all the rooms that satisfies our criteria. In the figure below, we have selected all the rooms in the 6th floor that are currently Vacant and Dirty. The result of our search is seen on the box which is pointed by the arrow . We can individually select the desired rooms by checking them off or if we wish to select all of the rooms at once then ‘Select All’ has to be checked. Now the selected rooms can be either made vacant, out of order or occupied-dirty which is presented on the left top corner of the screen shot presented above. To change the status click ‘Change Status’. A prompt is generated asking if the user is sure of the operation. When clicked ‘Yes’ the status of the rooms get changed. 3.3.3 Maintenance. The maintenance function provided with SDC is not a separate module but just a functionality which enhances the capabilities of the house keeping department. When the house keeping department notices something not working in a room such as the mini bar or the television, they notify the maintenance department regarding the nature of the defect filling out a form which is presented in the above figure under ‘Send Response Request’. After receiving the task the maintenance department on the other hand mobilizes its crews to take the right course of action based upon the information that was passed from the house keeping. Upon completion of the task in hand the maintenance notifies the house keeping and only then the house keeping change the status of the room to its respective state. Below is a screen shot of the form from where the maintenance is notified. After filling out the appropriate fields shown above the task is sent to maintenance by clicking ‘Dispatch to Maintenance’. When maintenance sees the task and completes it as requested, they resolve the task by clicking ‘Set Resolved Time’ which marks the task as Resolved. Below is a screen shot of the Maintenance which can be accessed by clicking ‘View History’ in the figure above.',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \nn;\0ټ\\<\?r=/`=Ln;e[=ce9<t!<\4=\\\<>\y᥼\=\\\}sZ.#(7F=b\J<S\r8r=*/\\<\vT<\\RO<\'==M\w=\\=6~kxVq<\=\\\	@<\H:(YO@\\<\\٨=\=+t\\"<\r=\\=%Q\=v\V=6`=X=&H3$%gG=SN]4\2<\$:i=t]@<_6\\d=wfiXr=K{=\c=	\d=1J˼Ǉ;\6C=Sֽ\).эJ\ =ꊼ\\\<\Lf&\h=\0_Z<0=_2`\;AH6+6?\<sƃ<\<5;6<L\?\7=b<t\<<w\)M7ͽ\v<D=P\19\\\'<M\=);~ؼ\zü:=ܓ,V\\\'\' =\0!(<\=d	 Nz=K,;/\=Ꮌ\`;%0;ƥ=c\x<m\<*=\Aq =j<;Z=5i=7=.<\=:\ixy=X=+\=q+\<\A	\<QD\WV=\--S,=\#\<[=]=g2ͼY6pPV^<%i=ŧ0</\!z=i2g\pG=4cH=d\'=*2̝<h<庻Ov!H\՛<\\&=*!!\\\\\<wO<7\P\<\nS\Pu=>4\gt^(\\=\\<μ\\qRKo<1+6ij3/Sl_+==\#ev;\r\<~Gv7=77ϼ\N=\|<۲=v_F;J.=c\\=G)-y\)C\\\M\=\X<<nP2Nv\>=),F\=\\\p=ht޽\v<ⓗ\"=@<\\\=Tx<DIA!T\\-\\=:\nf=b~<9/YUq=)=^v\F=X:@ŏަ>PU<ӨJ=Pq=ך.RZ;>7<>\'\\\c<l\=Z<[\\<\Ļ;F=.8aM<1[=ǧ<^=y\\nBg<ʒ2\:\<zH<Tgf;Z\S<%н;\7_\\\\\0<\|+֔=\[=M\)	3S\<ftE\n\t7o\R$R\b\\=`\\%\Z=\=F\= T<k\<\\Z<\2Za=:{;l\uC\_\"5<3J=L?a\><=A=7BQe\\F\-=3\=\\&=Q=fO=\b~\5=_1=\ْa.=!?=\1\	Ǽ+<l;jt?\"U=ĕ\\@<	y`ܒ]-L=\q\;\=ǳ1=\<\c<\=\1\<','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3099,'b0fea813-cf69-455c-b7c8-3d0e42ad61f0',0,'Teaching Manual For SilverLine Dot Connector Version: S.10111 By SilverLine System Integrators Pvt. Ltd. Tables of Content. Introduction to SilverLine Dot Connector. Modules. Main Screen. Front Office. Point of Sale (POS). House Keeping. Maintenance. Functions. 3.1 Front Office Functions. 3.1.1 Check In 3.1.1.1 FIT Check In 3.1.1.2 Group Check In 3.1.2 Check Out 3.1.2.1 FIT Check Out 3.1.2.2 Group Check Out 3.1.3 Start Reservation 3.1.3.1 FIT Reservation 3.1.3.2 Group Reservation 3.2 Point of Sale Functions. 3.2.1 Start a Table 3.2.2 Add more item to an existing table 3.2.3 Settle a Table 3.2.4 Split a bill 3.2.5 Add Modifications 3.2.6 Void Items 3.2.8 Room Post 3.3 House Keeping Functions. Reports. Introduction to SilverLine Dot Connector. SilverLine Dot Connector (SDC) is a Property Management System (PMS) which is built for the purpose of managing different departmental operations of a hotel making it convenient to keep track of its day to day activities. With the arrival of computers into the scene, the old ways of maintaining logs of everything manually is long gone. In today’s competitive market its everyone’s aim to stay ahead of the game and one way of doing that is my having a system that helps you do just that. SDC is a system built towards addressing that need of a hotel where all the information needed to run a hotel efficiently is easily accessible with just a few clicks! More than that it integrates the functionality of all different departments of a hotel such as accounting, inventory, housekeeping etc reducing the time, energy and effort into managing all of them from one single point. SDC is one of the most efficient and easy to use PMS in the market. Build with the latest technology in software engineering, SDC provides a very efficient and user friendly operations making it very convenient for hotel staff to meet with the requirements of its daily operation. Some of its key features are as follows: SDC is a state of the art system that is capable of handling reservations for a hotel of any size. It is intelligent enough to interconnect different departments of a hotel, keeping them all informed about their duties and tasks in hand. The front office module gives an over view of the different states of different rooms (such as vacant-dirty or out-of-order), and these states are denoted by different color indexes helping the staff know everything they want with just a click. The reservation module is a full proof and fully tested part of the software that handles different information about the incoming guests such as their likes, and dislikes, room preferences and meal-plan, flight information. The guest history tracking system in the software makes reservations for repeated guests very simple and effective. The house keeping module also provides a visual over view for different rooms to be cleaned. The system provides a mechanism to clear the status of different rooms floor by floor or room by room as the situation demands. A maintenance module constantly keeps the maintenance',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n> :\4=y\;%\\<GK\<=ɖ;<2=trj=<jz=\<8)|=^\?<bBW<;\\=\;\-实= \rd=\\"<\Zf\<)\\uy=~6H:\r<.6=*z=.\\U=q\=\\>\0\h\(FP2&=\<̏XRb=\\<pe=Ůљ=\<J=z=\&\E\\;\c\?fo\<9Ҽ\i4\=WQB=ȋ12DGt-~=$=Ix=\\0<s=#ŽǓ\ >3^μF\r;\\9	i=\B=<oQ;\Z\MO=\j=[\L&;\MEg\Z\T9=:A<L=Fi=?\]a)f\\o\)B\:NF<:\#Tj\\	m\h5h\Q\S.t	=L).<=qS=3\0<C\;\+\<L=i	GZ\Tb9YGN=RL\<=\ϋ=;\"K=!tdL~\㬻y\;C\Ρ=|s=W6\:u\ѼS\2\Q=[ɼ~p=#L<xn=n=\/={<u=2=l\"ۼ0\\`=\x\r=0\?#\0Ϣ	US\Y.\]ӻ>#=)d\$=A =\=@ȉ\0A=DI\D<;;\<\\	{$$RkKؼ/_\Ol\1(3<J0x<KNL=$uG\=R\rd+ku;)*\<\'N<]:a&Gҍ<7=\\=RVO\<\r\\\;ː<\\N5UW=\뽱\"\n\}<t⡼C?7\_>\Z\<2_8=\\n=Av\>/8VVX<\p<[n\=\(=	\6/\\;=,>;O\r<\>a\"\L\0\<\=!;mx=2_\<q\7<_\"+ۋ6\z\oQ\ {@=)<+Tә%\;V^t=\=g~\;{=\=O%P=ʣ2qKy=\1>e=\j\n/^><C1 W\Ż\\k=\żpYH=\z=ȩ`rvr6\\\0=v=\=\=7	Q4=\\p3&H<SCN<\"H켃8\~\Z=\F~^=\`ӼȄ\G\"=\q\<䟯=\<\n\L<\I=\?9\=\L`=\_K\=\QƖו\ri$<<W\E\Z>=\J.Ҽ=HE\r<ߺ8=~]7=\\8\#)Y=\;b=\q\<s\=l.J;\\;f=p\吽\'\=\*=\<Ǎ==\=팻\0v=\aB<]=+\==\"h>ŁEn\:*>\Z;7\=θ5=xD%vz?C8(\0\:<\=`;<,4=&+t=',NULL),(3100,'b0fea813-cf69-455c-b7c8-3d0e42ad61f0',1,'very simple and effective. The house keeping module also provides a visual over view for different rooms to be cleaned. The system provides a mechanism to clear the status of different rooms floor by floor or room by room as the situation demands. A maintenance module constantly keeps the maintenance department at its toes with its constant reminder of the things that need to be addressed. Housekeeping department notifies the maintenance department instantly about any breakages or failures noticed during a cleaning procedure there by reducing the reaction time. A state of the art POS system is also a part of this software that takes care of all the restaurant management needs. The POS provides a visual overview of the entire restaurant with its exact floor plan and table numbering to help the manager and the servers know the status of different tables. Different color codes are used to signify different status of tables, such as Vacant or Occupied, which helps to know which tables are available for the guests walking in. The POS is best utilized with a touch screen monitor as the ordering process will be faster. Each menu item is listed under its own course list, helping servers or managers to know where to look for any particular menu item as needed. After the ordering is complete the order is sent with a push of a button. Upon doing so, all the bar items get printed in the bar and the kitchen items get printed in the kitchen reducing the need of having to send someone to the kitchen or the bar to inform the respective stations. Once the order is sent, it cannot be voided unless approved by the manager. Any alterations or special requests from the guests regarding any items ordered are entered into the system at the time of ordering which is printed at the respective terminals along with the items ordered so that the respective terminals are informed about such modifications. A bill splitting feature allows the bill to be split as requested by the customer which can be printed accordingly. A bill printing system is also a part of the software that prints the bills as necessary. Room posting for different guests according to their meal plan is also incorporated into the system. Reporting includes daily arrival, departure and stay-over reports. The end of the day report is also available with the exact cash count of both the local and foreign currencies. Any further reporting options preferred can also be incorporated upon request. These are just some of the general features of the PMS. Let us now go deeper into its individual module operations. Modules Just like any other PMS in the market, SDC covers all the basic modules required to run a successful hotel business. 70% of the revenue generated by a hotel comes from the guests that come to stay in the hotel, therefore a system as such requires every attention to details as far as guests are concerned. SDC',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\\ZE<\$Gv+Q \1\=eU;\U=np\n+8==%-=	툼J?[7W=\"\<\_*5);HI¼\9\vC=<\d< \t<t\Ľ5}e<׺j\=<U<\\T<1s=\n}L(j$w##\\\'x\<\\=֫eGG(xFA\\F\H=\"N=}M=T=L=\͊ZʌK=$]\P<+%\r=1<<9\0=eS\\:C\<Λ=\"nGu\<N\\\\2<ks^;\>\n\3<.G<l3`d\ZQGҘ\k=wH_;v9=*`\><\0}<\=Z	<Z\<\\!=Ti<\Ɏ<\\\!<\\<Z.=鐜n\<=?\\d\r*ls\< <\Z=/;rB=\IĻJ8;bpH=KG===\}9	5LC\lhG\\<q/;\=<N59\{\g>\v=R\Z=	\=\z<`O=	\Z\nD=\=\\n\r;\\(<;<vO<>\<wA<\>|=9<o=R\oj;2\=-=Ud<\\нnJ\n\'ӂ!mk9\fdTm\rd=\\<0sq{=Т7=\<Yuj\Z_\\<dzJͼ׏=getA=-<.;yg<z8<k2[=\noD\<w;1=g\|=Us\0=fz;\#\VG}\s#ڼ\\=2j\:%5\0\\<-GC</l=Go\'U=I \<<̼9=K\\n\\0=i\0l\Cg\ԶϽEW<D,\Z\\<5ɽtL=fqs<|!=\y\T[ýQ=\\}[\=/JJ1<\\\A-L=](ú\:^5D+\c⾻?f:<\\}=:=gW=\'==Ⓖ-><R$\I=)D\ؽ\*;By{\G\YT	<+k,=\'Aru(<\8\\m8=@\5ʙ:=\U\=	Ui?=Ē޼+ =$~\޼\#\<0!$=\G9(.\ZH;~$;LD,\=¼=Q==ǁ1=g\ȟ=\\&<kFVU\aC2=\lFL<Ppܽ|3F<5=W=5=;=\:\܍=g\Z|=Փ=_\W@=:E;+ﺦ<=)2=fDzt<:\'=Y\<=1s\=߭<\\<sqx<uP=\\"<t/P{5=\\\<\\}{۽&L\r=d,=a\\<\e`S\S=_T\K\w=,#\>K\>\<\\'<\\'=\\\"~',NULL),(3101,'b0fea813-cf69-455c-b7c8-3d0e42ad61f0',2,'market, SDC covers all the basic modules required to run a successful hotel business. 70% of the revenue generated by a hotel comes from the guests that come to stay in the hotel, therefore a system as such requires every attention to details as far as guests are concerned. SDC provides a state of the art front office reservation system that allows to know everything about a guest including any preferences in regards to dinning, lodging or any special requests that guests might have. Main Screen (fig 2.1) Apart from that house keeping also plays an important part in serving the guests as per their need. Restaurants are another place where the guests need to be served in a very professional manner. All of these operations are carried out by SDC which help the hotel staff to address the needed of the guest in a very professional and timely manner. Lets look at the operations of each of these modules. The above is a screen shot of SDC main screen. This is the main entry point of the system. On a first glace it gives all the statistics of the hotel that is relevant to the day. Values such as occupancy percentage and rooms to sell are very closely watched throughout the day as that determines the total revenue generated at the end of the day and also gives an idea of how many more guests can a hotel accommodate if new guests arrive as walk ins. Clicking in one of these parameters will give use more details pertaining to the parameters, such as if we double click “Total VIP’s” then a list of all the VIP’s with their room numbers will be seen on the screen. Shown below are 5 buttons which are the entry point to each of the mentioned modules. They are as follows: Front Office: By clicking in the above button in the SDC main screen, the front office of a hotel is seen. Front office module covers all the reservations together with the status of all the different rooms of a hotel. Settlement and viewing guest folio is also done from this module. Point of sale (POS): By clicking in the above button in the SDC, the POS can be accessed. POS is a module that serves as a restaurant management system for the hotels. Each restaurant of a hotel has its own terminal or POS from where it is accessed and used. House Keeping : By clicking on the above button, the House Keeping module can be accessed. House keeping module provides the house keeping department with the status of different rooms where by they know which rooms have to be cleaned or cleared. Accounting : By clicking on the above button, accounting module is viewed. Inventory Management : By clicking on the above button, Inventory Management module is accessed. Apart from accessing many different modules, SDC main screen also gives an over view of different time zones of different parts of the world,',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\<\\ἰ\rq<#80u=Wy=Ẻ7ʔ=\\\;IS.S<]<WDp(b=fQŽ=r7|oN=\I\B\ Ѻyo<\\\*<+\;{±< &{B=/˖=\Z!>3\<\'-=qλ\`ؽz`<}<Zi<Լ?\AλzaJKݡ=Ȕ\ޟ=Z=bs=0=o\=	\b̓\<fd=!s\<v<\[<\Z<야ns\:5\<W.<fs\pļ<\ZJ֐8\=20z\<:!=\'jMI\<>\{mdb=yx\\r<|=㶙<)E0=\\=\Ž\'&\y=ώ<\\_=T=q=\\Z\g\a>DI=S\Ż9X5a\˽	a=);\ļȖ\{]=l\\=\0ܼs<Õ\Z\\<\Zc(ҏ:H{H=̾\	f\ýļ&oM\y<\\<\C\n/5=jA<0먼&l\<E\<U\s=ޣ<\<\m=g\\0=\,\\<\\\<@\=: <\`P=ڃ<(\<K=j<<>p=!<<v\Z=g=^\\<yt=Ħ\ƻ;\Sv\\\<gJE=\۽	=Z\\X\<aH\=\	\Z\0\\=(gpf[;씽<`Q׽@\\G\<q~}\\n\jK#[<8i:\$xԻR=(k\\ro< <\<H\0<v\\\f\"%:\=]	#=|ݓ< \H`}b=ʉ\'_D\<\\\<.1=:7#<\\\`	&<3\Zik\=_\n\'쫅\\\<f?\ܺ樽\D\=U;ZCڂ=\"\;\=\˼\'𼆶\'\==Y[=\\ΏeU|\q:d==\Z=\\<L<nT=\=x\lFcVB=\n;>*>1Br\<\xX#6(7i~\m<Ê\w|<\=m=&\*=Ҩ<f\=\+\\v;\=\`3O{=}\,q 0wWJ\<\Jҽ\\Z\Ɗ;\L=\p\#\?ezμ \H\ޖtE<\Ha\"<\nOͽ<l\\Z=\Κ\⇳RnF\A0<\<8X0\\'g<X!=\J<\\Z=~*r=\j<\^]A;#Eǻ\W>x|B<\<B:IZ#=P5\6\<cl25%=L7;ǟ;\=+=\9=$>\=32<y><ݼD=\z/=ڐ<*+\<\Z=\D~<\n<\LB<7[k=\<<T\\׃=n)\=\=8Z!\k=\\<\6\=\"/o\\<',NULL),(3102,'b0fea813-cf69-455c-b7c8-3d0e42ad61f0',3,'Accounting : By clicking on the above button, accounting module is viewed. Inventory Management : By clicking on the above button, Inventory Management module is accessed. Apart from accessing many different modules, SDC main screen also gives an over view of different time zones of different parts of the world, and also a small calendar which is helpful in many different areas. Now let us go deeper into each of the modules of SDC. 2.2 Front Office. 2.2.1 Overview : The screen shot seen above is from the front office screen. Individual rectangles denote individual rooms of a hotel with their current status being represented by the color of these rectangles. For example, rooms 701 and 702 are out of order therefore they appear in a grey color, and the legend present in the right hand corner represents exactly just that. On the upper right hand corner there are 5 buttons. They are: 2.2.2 Refresh Button: Refreshes the display screen and updates the current house status. 2.2.3 Find Button: Upon entering guest room number in the highlighted textbox the user can press the Find button or press ‘Enter’ to view the room details. 2.2.4 Rates Button: Pressing the Rates Button will display the different rates offered in the hotel . Rates such as CP, MAP, BB can be seen with their individual breakdown of their room rates and meal plan rates. 2.2.5 View Report Button: Clicking on the View Report button, different reports can be seen. Details of different reports are covered in further sections. 2.2.6 Drop Down Menu Functions: Fig 2.2 Buttons Fig 2.3 Room State Fig 2.4 Room Type There are three Drop Down menus present in the front office screens which are highlighted above. The first one gives you the list of different room types present in the hotel such as Single, Double, Suite etc. The second one contains different room states as such Vacant, Out-of-order, Occupied etc. Selecting (Fig 2.5) different combinations of room states and room types and pressing the Find button or enter, the user can view the desired room having the selected states and types. For example in figure 2.2 and 2.3 user wishes to view all the single rooms in a hotel that are vacant. (Fig 2.5) Given below is a screen shot of the result where different room number and their corresponding states are seen. Fig (2.6) 2.2.7 View Room Button: In the above figure if one clicked room number 605 which is highlighted with the blue shade (indicating that the room is occupied), one would also be able to view the details of the room. The Figure is given below. 2.2.8 Reservation. Overview Fig (2.7) The figure above is from the Registration screen of the SDC. There are two types of reservations namely FIT Reservation and Group Reservation, which can be viewed by selecting the respective buttons shown below in figures 2.8 and 2.9. (FIT Reservation button or Group Reservation button). The result of the desired query can be seen',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \nF<-~vMY=tt=\\=\C<hV9=Z&O=x^li2=\`\\n;j͇\$<s 4<\\8<	{»rbb¼\e\a<aY\ZM=\<췽 \Z\<=i+=Cr=\A=F!n\\[\=l|ru\"\<иZF;\0<~+l׼u\0<\={=\P<B\=^7<,	><f\Ѽ\\;]E\;\0*\<\\l\<<jL+=`ۼ\v=v\';˸-\\\\N<}0<<\\\<7AbFq<\\@WJ=x*!v=<^i<\E<ߜ\Z<\ջF(= \':+\̼k<P#:|Bae==M\`n1=,=\\<=Q_c<Σ\=|\<A1\0\\r+0r=/%\Ģ:@;,\<\rG=Z\.\=\q`dN:g\K+u\H=Q\	u&Ė#CҪ<\">\&<\.\Ӹ;\_=o\<_e<~=\#K !\2Jָ\=bﺻ&i(YY=\ּ\=u^&>\_=~\=6\<s;v;=\C=jc=M<b{5=O	;H\	<\\<\(FmkQ\Nm=\\nU=X\<QX=\Nq=Pj\\(ܧ\]꼖Q<іŽ^<q\55Q;-=c7=M\Aj=V^\\r=S\⼳\"=\nA\&Sn/[=:\\\;>1fϼeX\q\;	\"\\ZЩ&=f\\0pp=NZ\弳Opa\\Z\r8.=*=\\Z=\q\\Sيؽ\[Nk\9S\<l<س<\<vݟ<<]\^<*PSu==*<lܽr\'<wdZ\`={7.\"O\|&\=\G[=\\\;<tE\7*q\0\=8[=P.-<\r=Itj^h=\`=\>0&ͽr<.5U\:Y=\<N+<ZŻች\\7 Eļ!\ս\\=\\\:\\d\=ȩ<ܯ\<c;\h=\}X:w=~ZP\Z=Ͳ\r޼ԝ\\1HW\Xz\uC.[o8ҍ;Tsj\&7z:?\\\\8j<;	-\=g=̼󲁳\Tk@\:\}*=fvBc=\\\=OW\\=	-缧\"=.\=*<qrI\Z=7=oW;GDZƼc=c}Tc=1@o<MMK>=[F\=ʉ=\O=(G¼}Y=؆5<bTjt\=PY@=\ަ=I0Ca⎱u=-<Òu\]CBU<!}\.\\%Ǽ[\=\Ql\̼\nw\;\\<\Z\<\\<\<5k=ե{Y<',NULL),(3103,'b0fea813-cf69-455c-b7c8-3d0e42ad61f0',4,'the Registration screen of the SDC. There are two types of reservations namely FIT Reservation and Group Reservation, which can be viewed by selecting the respective buttons shown below in figures 2.8 and 2.9. (FIT Reservation button or Group Reservation button). The result of the desired query can be seen in the box presented above. Fig (2.8) Fig (2.9) Fig (2.10) By clicking on the In House Guest button (Figure 2.10), the list of in house guests can be viewed. Fig (2.11) One can also perform any search that is based towards the guest’s first name, last name or the reservation ID that is provided at the time of reservation. Any such queries can be typed in the box located right below the reservation buttons shown in Figure 2.12. Fig (2.12) On the upper right hand corner of the Reservation/Registration window, there is a cluster of different buttons that provide access to different functionality to the user. Let us view each of these in detail. 2.2.9 REFRESH Button: The REFRESH button refreshes the view of either FIT reservation list or the Group reservation list or the in house guest list, depending upon which button is clicked, i.e. FIT Reservation Button or the Group Reservation Button or In House Guest Button (Refer to Figure 2.8, 2.9, 2.10). 2.2.10 START Button: By clicking the START Button, one can start making a reservation for either an FIT or a group. The details of how to create a reservation is described in later chapters. 2.2.11 CANCEL Button: By clicking the CANCEL Button, one can cancel a reservation. 2.2.12 GROUP CONTRACTS Button: The GROUP CONTRACTS button gives us access to information pertaining to different group reservation contracts a hotel may have with companies and travel agencies. Without any such contracts, a hotel may not choose to do any business with other companies. A contract includes important figures such as number and types of room, rates and dates at which the contract ends. The details are described in later chapters of how to create a group contract. 2.2.13 UPGRADE Button: The UPGRADE button takes us to the window where a reservation can be upgraded to other options provided by the hotel. 2.2.17 ADD ROOMS Button: The ADD ROOMS button adds more rooms to a reservation. 2.2.15 DEPOSITE Button: During the time of check in, guests may be asked for some deposits which can be entered in a window that is accessed by clicking in on the DEPOSITE button. The details are coming later in the chapters. 2.2.16 TODAY’S ARRIVAL Button: By clicking on the TODAY’S ARRIVAL button, one can view all the reservations that are arriving on the date it is clicked. 2.2.17 CHECK-IN Button: The CHECK-IN button takes us to the window where a guest that has a reservation and who is arriving today can be checked in. There are other information that is gathered from the guest at the time of check in which needs to be entered into the software. The guest check',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \noBv)+\W=\=G\= =[\H!̭K=ͯNu\<I$m\\<@!;7=\ok{?<\Lt<\}=Ͱ<R\X!MO\tYeJ=:=,=:@>u5=L̽\5Vv	GC]VFlè<\\"\;D\Z==5%=t^;\k\;=/\r>ur@\Ȼ:Q=Tm<\"=\JkN~\2.=c\o=lA.*Q==ZN\F+t\\\\=.	<w\=\\0<\}&\(\<n=w\\d;2%=Mc<-\'<\`6^\\\\\lt=MJ\$Ƽ=\\<\\?\pO=Ib=e\\n=-ϼJV\=!\,=}/Ey\\1\=\1/u:8\r\ݽ=<\rּc =&o,h4=i`	=\}r<\YE	Y\`5gkY;\n6\G\z\n9WZ\;\bȼ=l^\A=t+<\\n5y=\g%\ջ;\\k\=pyD=K=[&=(\<h=O<=/H=\\<\\E=lp{<\ͼ2rἴL;\\b\g=M\<}a=d\m\ܼ\x1=x\=\l\\<:%\'J==ZG<\o;\s\<H2=MZ[]\ȟ\b\n*=}\4>1=vspH?<P%t\f\";fk\'\\<H\Ͻ3\\=|(Ys<#\q=Q\nT`\mt44<K\\M=\<a1c\1=H9KlM\r=t$\\"T\<\\=L\B=KH1ꉷ\9=\y۹\\\<\0o=<7\0c<p\켷\n\\\P=4;N!H<>ae=ɝ;>{=W4\=k\Q<\\</=*si=\-=@\Z\ֵ;<M\dNJ=H=(ּ\oGo<x̽ ĺ=<\Ar\w\n;K\\z=F=\p|ЃA=\V<ùu\L8?d<ċ\oYi=\L=t?\D=\a<¼\\<\=1;mUAu<ٝ\\Լ\|\<\8X\\:=&\0=\o(<㺣D?=\8\'=K̼8<\\=\=%F!=Ӫ;u\>\<_\\\<\cg(;{n/\mvY*p;\JR\V=鲪_\\\=ěJ\=\Ź<v=Ac:Oj\j=\\=K;D;ʼ\\\ܼ\\\<,;&/\Z=\{<\r><m=\ ==7=>\\]\0\\=`\\\=p\;<\\l=aHy=NX=E7=s&\<~K	aP|׽\\}<\\S	=q۹\=f!<HgĻ@=\֟w<',NULL),(3104,'b0fea813-cf69-455c-b7c8-3d0e42ad61f0',5,'CHECK-IN button takes us to the window where a guest that has a reservation and who is arriving today can be checked in. There are other information that is gathered from the guest at the time of check in which needs to be entered into the software. The guest check in process is described in detail in later chapters. 2.2.18 VIEW DETAILS Button: The VIEW DETAILS button shows details such as guest details pertaining to either FIT reservation or Group reservation. When the in house guest list is viewed by clicking the In House Guest button (Figure 2.10), the details of each guest can be viewed by clicking the respective guest and after that then VIEW DETAILS Button. 2.2.19 EDIT Button: The EDIT button takes us to the window from where reservation details are edited. This feature, together with many other features is password protected so that only the person with the authorized privilege can make such changes. 2.2.20 ARRIVAL/DEPARTURE Button: The ARRIVAL/DEPARTURE button leads us to a command centre from where we are view the arrival and departure records. These records can be viewed according to their dates. Below is an example of such logs. 2.3 Point of Sale The point of sale (POS) of the SDC is concerned with the day to day activities of a particular restaurant and billing. The POS handles operations like ordering, notifying the kitchen, settling a table or posting the charge to the room of the in guest. Below is a screen shot of the POS main. The main screen of the POS represents the exact floor plan of the restaurant with its table numbers and other details regarding the location of its exits and bars. When trying to access the POS from the main screen of SDC, a prompt is generated asking which restaurant is to be entered. Upon selecting the desired restaurant its corresponding floor plan is fetched and shown on the screen. The main screen provides some valuable information such as which tables are occupied or vacant or which tables are departing making it easier for servers and managers alike to be better prepared for their service. The POS and all of its functions are described in detail in the further sections on POS Functions. 2.4 House Keeping. The house keeping module in the SDC is designed so that the house keeping department of a hotel is fully notified at all times, the different statuses a room may have during any particular time of day so that everyone working in and around is kept notified. Below is a screen shot of the house keeping module. Shown above is a listing of different rooms and their respective status. Just looking at the above screen the house keeping department is made aware of how many rooms are checking out, how many rooms are occupied and dirty and so on so that as soon as the rooms become available they are cleaned and made ready for future guests. Rooms of different categories can',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\0\<p\<!@&<}|=\\==O\z\<\_=\\u<P\;\\<\n\"\μ\Ƚ\\\r=HO=rM=|hm==䢼]p\\Z;\h:\W=\\ö==G\&S`ꋼ\0h\;R><ws\<Fa\<\=\>\'v{\\sn\=\f\<g|=SVM=\*wS֩=<\'qtnkJB=EK;\?+:=%Km\,ݼ\5=!\\T\\t=0W>\nc,\H\<\,}=\-~ͫ7\\n=\晽q\]<n<\\<<\<j\<\\c\\\;=<\\\μ\~޼n\<;8<-.1aL==*>=N̳<B=\|7=K	\	>O<\<5\ͼF}{@*=bA=U\\<\N<\f=\u=\s=O`-=F;Ҽ\`q쳽?)t==	\U*\\rRmSx@p_=2<V2\\nü:p;\\<=\۽/=삽\\<ZV=ݺ\n\\=r˶;ќ<ސ(=\\U\;R\=\0Ү;\Y=\*=1	=\ȅ<\'\e;ͼ\B\\\\<b<4V\>\\_<6Ѫ\\69l̉YE}4\PT\\\"\=跕<h\<ˡ!=\=mwL͏<6\]I\>yȫ<@>\0u\"=\_݈<\\pU/Hk\?{kVQ\=;#l,<($+<1<w\8\w\</=\;{#=Fg=Ǖ[= /A\u<<9&}\'z`<\nἯ|@gh2	<\\\E[=\.<\"م=\a\\\=z\;d\n\ʽ?\߱<ɼ\ګ\\r\8\\ʽMw_ \<oxȐV=U?=ѻO=d_<X=\(<5\<=\"=\L={ͼB\_<tcŒ=]L=ۦ=\U=n%{5=j6f=\\\n=\.7.\=L\<:=nÇˇ=h\gP\\;+\=\\_=k<%)\\=[\\\y=\:=ާ1znC(=\===\p=\	)\<ۈ;\{=#\\=Z\m\s:V\.;)\<\^h\xj\TR$<虛%\|;2%Lz)<\½T;S=\\<aQ=L\zƙ:l;\<\r,<;w<?=(\\̽\&=a֢=\'5Z\\\ީj2\<*2ݻ\r^=\cK<2\y<Z\5=\n9h2@= S=\=_LJ=\=\<F=$=\\\;\f=\	=\\=n<k\f\\\=as	<6\ܻ5)^༫P,ygP=7C(==x鷽\'e>A$):`<\س=$(',NULL),(3105,'b0fea813-cf69-455c-b7c8-3d0e42ad61f0',6,'the above screen the house keeping department is made aware of how many rooms are checking out, how many rooms are occupied and dirty and so on so that as soon as the rooms become available they are cleaned and made ready for future guests. Rooms of different categories can be searched by clicking on the respective buttons and clicking the ‘Find’ button. The complete function of house keeping is explained in the House keeping function section. Functions The numerous functions available in SDC enable one to better understand how a hotel operates on a day to day basis. From tracking guest folio, to viewing extra charges occurred during the guest’s stay, SDC provides the simplest of interfaces to carry out all the operations of a hotel in a very convenient and efficient manner. SDC also supports the flexibility of posting the charges from a restaurant to the guest’s room. Hence the operation capabilities of SDC expand into integrating different departmental functions of a hotel so that various tasks can be accomplished quicker. Let us look deeper into these different functionalities. 3.1 Front Office Funtions. 3.1.1 Guest Check In. Front Office is a place where the guests interact with the hotel formally for the first time, therefore it is very important for anyone working in the front office to be prepared with all the necessary details one might need during check in. On clicking the ‘Today’s Arrival’ button shown in the figure below, the user is able to view all the reservation details of all the guests or groups arriving today depending upon the selected reservation view. (FIT or Group) The procedure of checking in guests belonging to FIT or Group reservation is slightly different with one another. Let us go deeper into each of the following. 3.1.1.1 FIT Check In. As mentioned above, the list of reservations that are arriving today can be viewed by selecting the FIT reservation and clicking the Today’s Arrival button on the top. The reservation system searches for all the reservations that are arriving today and gives the result as shown below. The figure above shows two reservations that are currently scheduled to arrive today. By clicking on the individual listings we can view the details on the right side of the screen. We can see that for reservation 19, the assigned room number is shown as 0 and for reservation 20 the room number is shown as 602. This means that for the reservations having their room number as 0, individual room(s) will be selected at the time of check in and for the reservation with a room number other than 0, 602 in this case, a separate room is kept reserved. This is usually the case if the reservation is for a VIP guest. The above figure shows the details of the selected reservation whose arrival date is today. To check in guests, click the button ‘Check-In’ which is shown below. If the arrival date in the selected reservation matches with today’s',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n5\W<\v,@N\<\=߾\'=\"=j3\\<|<yY <U\\;*+4ƹ\r=]\	z=ܔh=s`tcp:<z:e&<Լ	&\0L(Ͻkj=@\=~=,6G<G3W\%<\'\<m<e\|\,F<wLe=c\ \\"|\;I=ʝ=sZW=\%k=\^<=\-=L܋Y\fZ\B;=4=\<Yd.:]>F=\"\=\\Zd )=|`i<\ʷf\\<3ح^my31=s\<Qc=K\γ=\'\0@;R\<c7:ûŨ=R\'=\\n\=W\\z$ɜa<Ë=j <\\\<-\<7Q=A;C..>\<\]\;4Ioc=;=.@\(!OP_O=-\\=lRy?=\\ȺF#=\Qt\<\阽M\\=\\	퀼[n<\ =2<0:=\Ԑ=]=tnZV)=\c\8\y`=Y\0Y<\W<\w=L<\H\,=\?6F=a\\<h=*d<x=\=d<JZ<\<G\:\<=$OV-=\{O\\Wa<M\,˽Gԙ<W`Y<.=I\Z<J<\\=ϼ\\\=ZNf\!&=?f;jP9r=7Qɽ{%e=\a;^\n\,=ؐ\p<:c\G;=g\WN\.rA<\"sMsO0\r=@`QUߪ\"@A\}\<E\<y)<em7qh=\}Il5=zQ{ꪭ=\Z\&==\\R<C^0\\9`i\\=y^9ݽ\\Dm\^M\Q<q0a=\j4D\0>\h=ڨf\\\!\"=\;剎<6<GOWp\Խ\y9M=\9===wxD=\b\\*=\0!=|\\0$b?=F@/\z<nŽ9\<gURuU\υ\4r\\>=OW<R\\:z\"=\0M=<\;<$\s=\\=FX\Z\Q=\\4\~g=p=\fO_KaE\r<\<v:^O\\\d;L\z\_<\;ﱼT\~\Ҽ#\BiLV\C;t@<LI\}?,= r_U=򿌼qhZ2\H<!<=ev\drO\B.!<7=\0\0;3\\r=\'+=\=:M\\ȽS=i=<|<Dkv.m.p=C׼v\ =%<e<ScĻ.=&QK=]6=$>9=l\\<\m;6_=ߞ\=3 =Å_=Q\=s\"\&\qӽ?\;	˼\S<\r<bs<+c\5&w=}fs<H|=,%$=ð=5\\\r=\Ze\i<',NULL),(3106,'b0fea813-cf69-455c-b7c8-3d0e42ad61f0',7,'is usually the case if the reservation is for a VIP guest. The above figure shows the details of the selected reservation whose arrival date is today. To check in guests, click the button ‘Check-In’ which is shown below. If the arrival date in the selected reservation matches with today’s date only then a check-in window is presented to the user. The figure below shows the window from where we can check in the guests. The figure above shows the terminal from where guests are checked into their rooms. As mentioned before if the room hasn’t been selected during the process of saving the reservation, then 0 appears as the selected room number and the system will ask the user to select a room first before entering any guest information. The system searches for available rooms based on the room type which was requested at the time of reservation and presents the options in the right hand corner of the screen. The figure above shows the interface from where a room is selected by just clicking the room number. (Note: Guest check-in is only possible after a room as has been assigned). When a room number is selected, a prompt is presented to make sure that the user intended to select that particular room. After pressing ‘Ok’, the selected room appears in Red as shown below. Now we are ready to enter guest information into the system so that the check in procedure can be completed and keys can be issued to the guest. The figure shown above is the terminal from where we enter all the guest information during the process of check-in. The entered information of the guest is saved by the system and it can be retrieved again in the future if the same guest decides to pay another visit. This type of guest tracking technology is found across all different PMS’s around the world and is one of the most helpful tool with which a hotel can understand more about its relationship with its guests. Let’s move in deeper into the details of the final stage of guest check in. Upon clicking the ‘Check-In’ button the above terminal is seen. The ‘Enter Guest Information’ box is already filled by the system since the guest information was already saved during the creation of the reservation. To save the information, just click ‘Add Guest’. The system only lets the user check in a specified number of guests, which was entered at the time of saving the reservation hence it keeps count of the number of guests entered. If the number of guests entered equals to the number of guests specified, a prompt is generated to let the user know that the guest assignment has been completed and that the FIT check in process is complete. 3.1.1.2 Group Check In. Group check in is quite similar to FIT check in with minor difference. Below is a screen shot of the group check in module which can be accessed by',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\j\=\<ȚibCI=)=L=T\=ݣy\\=Z\<T\<)6ɼ\E<\<=%ؼ|ӽI/=ME=\\<\dH<`	\@߼2<<1莽G=<6=)kMX\\=W=\S:=t=ޏ\H\AAǜ\ȺE$厽UY|\1;\=\r\0K\<\s֊=C<;V=r<\<\ƦU\=1e	usƼrмD\!\\nh\'\x<p\ag=~콫͞=\;#\\r\_o:\\DTP\.g+=0πp)!Q\'ʬ+\h;x\<\y=\\;P@\)&$=\U\yt4O=ę#=wR6=?a\=\\_\<\=\\=\:K.T=\<M6\\=\r\<$&:=JKV\r<\;\	>\;\a\!=yr=\=:Y<>4!=Kcw<=_Un\D\bq=ռ\	ʉ:\$kb	<\lv\<L-<s\r)t\;<N3\\\=u\R6r\\=Z<\>5\=\=8=h=Sļ_<&<=_%=o\j:T=:>Hǆ#%m\"\3F==x=\\R\'<\Z\|ņ7\\n<\\XV<	Wf\<\r=\\=\\\\j=`9c<bۃ\`\<\w+<eyƼq$\$=\\\ٗᄕ\"RX\"f7L=\̤\ғ<	\<Fw<\(\^ζ\\=k-NPq=]I\*<an<\b<yviMP\<W7-=\I\<\'2=%=?Aѥ=t\9\j\Nac^\]ma_*v\0=\=H~;\==-V=V;(\\Z=M\<\N#=z\uj̼\\U;9֎=b=t>\(8ػ\;=\W\=\!\y==\b\\=L,X<4\\ڌ<\ʓ\j=\=eC=e{;22\<\'ֻ/:Fm2<\=Z;_\0H|>G=V+dýM=\;w\˽\\8==Ϝ=Q$;?/%y.ʀS=Y\0/y<\Zz<=*PK^>6\\0{<\\\~5%b\\<\Z{\\f<O5\nFY9\EӼ﫼:VT\D⽬K\"A|/C\Z̼8\<\\E=\U%;\\ǻ<tP2\A<\\0<|v<4ߚ\=}b=tOy<#U\ZYB\e=tX_;4<T0=cT*ui=a|<BC<i`=V!=9;o\Z\A<\0=!\"\=O\Λ<\lڌn߼?d\<=\Ѽ=<S{VqG\8=\<\\ <b^>Tih=P\qA>\GE{\%;HV=h]',NULL),(3107,'b0fea813-cf69-455c-b7c8-3d0e42ad61f0',8,'know that the guest assignment has been completed and that the FIT check in process is complete. 3.1.1.2 Group Check In. Group check in is quite similar to FIT check in with minor difference. Below is a screen shot of the group check in module which can be accessed by clicking on ‘Group Reservations’ and selecting a group that is arriving today or simply by clicking the ‘Today’s Arrival’ button and clicking the ‘Check-In’ button. The first step in checking in a group is entering the individual guest information into the system and selecting a room for the guest to stay in. Group reservations are handled by the sales department of a hotel and therefore a list of rooms, their type and their rates are negotiated within a formal written contract between the travels agencies and the hotel. Each contract has a start date and a cut off date, total number of rooms, their respective types and their rates. The hotel sets aside specific rooms that fall under the categories requested in the contract known as ‘Blocks’ and only the rooms that belong to a certain block which are assigned to the guests during check in. Hence the system only allows the user to assign the rooms that fall under a particular block making it easy for the front office staff to handle the check in process. Upon selecting any room the box appears in red and at this point guest information is entered into the respective fields. If the guest is a group leader, ‘Assign as Group Leader’ should be checked and ‘Add Guest’ button should be clicked. Upon doing so a prompt is generated to make sure that the guest was intended to be appointed as group leader. After pressing ‘Ok’, the guest information is saved and the information of the next guest is to be entered after selecting a room. If more than one guest is to be entered into a room then the respective room number has to be selected from the drop down box presented below and entering the guest information, ‘Add Guest’ button has to be clicked. When total number of entered guests equals the total number of guests specified in the group, the system generates a prompt notifying the user that the guest check in process is complete and requests to check in the guests into their specific rooms. After the user clicks ‘Yes’ the check in process is complete. 3.1.2 Guest Check Out The figure above shows the status of different rooms and with that we see there are 4 rooms which are due to check- out. We can also see that of the 4 rooms 3 belong to a group and one belongs to FIT. There are numerous differences between the two types of check out procedures hence they are addressed as follows. 3.1.2.1 FIT Check Out The hotel personnel working at the front office should be well aware of the room that are due out therefore they stay prepared for',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n&=9=\hWi=\<ia<	=hյ== /=j$0NPB<\@*<ǿ\<:m\W@<o%<#<w!Q\Hzr\+<y<K0@\np\L\:%\0>Lm=\!k=\{/==$\FᩴHįߍa\=x\	=e\;\r;\<؃\\=\b=\\n=\fO=\nє<?=ĵ+PZ\<\5\<nE\kQ\\<d<\\\`\\\\;Y0 \<c;%H3<=\=\'=vZ\\\A<o\=`۽{N;ϼz\{)\ɻ`a%\0^\=L©\\\L<u\=Y}=B<=\nպ\Ǽⰲ=\ZB<9ى0=\\=!=\0\<=X=B)$l<#崃o\\0>!h<n<Ɋ\rc\<\>O;&\.=\=>==O=\R<R\A=h\3į;lS<\=	14&I)\0<OU=\Q#\\4n=\A<m=b|=\]=A>x<;\\<k\=I\;D<%&<8\ּlQ=\Z=\=r=-\an =k\'/+<^<G-s=s\ָ\;=[I%=\\'R+=\-0L\'X\Zw>;\7\=\\D(=\\<4\=]C	\<,\~\'	<5G`</A<ށ<QEf=\\<1O<UX\<&Q\\9\y8\=\r\ܖ5==8vI=Ar>#<n\<=\@`J\'LL<r<y&\s\\7=S\һע\Z}@v,Ҽ[=FO=h>\n\J<j<dS\0\Ǫ^\=\\ܼ?\\h\=\K\Z=)ǽ2\n:f=Bǝё,F\ =b\qx\<`\=YK;Fa=CNK_(G=\\C;a=FBR\H߼\/5=S\;vY\\ϽI=T\=@\;\>,n2x=Rݑ=\\\\xy\O0=<z=qq\z<RCo\NT<I^;KF=g4\(=Z̒=\.3i}x=\K=%ЂXfʀ<óEQ\=\h=>^\\0<\S\<\I<\ďy<\!\H\	\\5];lR<~j\9<\-<S\\\0<0X$^cT<tP\\zVyR/\A\ZF=J؆\i;r<UWL=K=5\<5	<\r\\<8=N*!\<y\0X<Kzq$T-<Y\\=.dM:uE=\<\Z\<\k=*&= \<\ <<<!&=9\cH\)=/\i=G\+=PӼC4\\⫻a]74\ҟUB+z].\<ft=m\\eN=H<\>b\ü.\oN=\',NULL),(3108,'b0fea813-cf69-455c-b7c8-3d0e42ad61f0',9,'one belongs to FIT. There are numerous differences between the two types of check out procedures hence they are addressed as follows. 3.1.2.1 FIT Check Out The hotel personnel working at the front office should be well aware of the room that are due out therefore they stay prepared for any guests who arrive at the desk to check out of the hotel. Upon confirming the room from the guest click on the particular room on the front office panel to access the detailed view of the reservation. Upon entering the detailed view click ‘Open’ in the financial information tab and click ‘Settlement’ to access the settlement window. Upon accessing the settlement window, the entire folio history will be available on the screen together with the charged rate, the total service charge and VAT shown in the figure below. On the right hand corner of the screen the reservation details can be seen such as the check in date and the check out date and most importantly the payment method highlighted in bold. If the payment method is cash then the ‘Cash’ should be selected in the ‘Payment Method’ box shown below. Since cash could be received in any currency that too should be documented by entering the right curreny in the next box together with the amount and press ‘Enter’. If the entered amount is less than the required amount then the system will generate a message prompting the user to enter more amount. If the amount entered is more than the required amount then the system will highlight the change that must be given back in NC. When all the monetary transactions are complete click the ‘Accept’ button. Upon clicking the button a prompt is generated to confirm the check out of the guest from the hotel. Upon clicking ‘Yes’ the FIT is checked out of the system. Then the house keeping department is notified about the departure by changing the room status to ‘Vacant – Dirty’. 3.1.2.2 Group Check Out The screen above shows 3 rooms that are checking out and that all the three rooms belong to the same group. The method to access the check out screen is the same as FIT (by clicking ‘Open’ and then ‘Settlement’) but the screen can only be accessed through the group leader’s room which is highlighted in white (room 402). Below is the screen shot of the settlement window for group check out. The rates that are charged is automatically picked by the system which was chosen at the time of reservation. On the top right hand corner we can see the list of extra charges that needs to be settled before the check out procedure can be taken forward. The extra charges if present, can be settled is a very easy manner. Since the charges are posted in individuals of the group, they are the ones responsible for paying their extra charges. Therefore each of the rooms need to be selected from the ‘Select Room’ box and',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n<>۩=\Z6ܽH׮\\<ƾ==|=\$=\>=\<Kİ=\(\\0=#W;n\\s7\66<u\=\\T`ݼkSٝ>=\\߮2<O=\\\)G\I=\\=x\<\\\$8	`\UD?A\0@H;g\\q=\)=\&;捘<x2=\r8\=@\<*5<\a#;\k=fܤ8=\nE=1\<NH\\V\O\r)$<dH\Zޫ<+<d\\\<S<\}!#k\mڽ>-;\ʼ\@<Q\\"\i**=\\<\J<\\н\<S=i)В\n=E5=M7F8ၽ\\\=DQ=*\\\Q\=\Zmm=\><\\=ֹ=!d;6\%=r\<*\\%s=Ӈ=؊=\h򡇽F=֠=D\3bG+= =3=\昼\=\\<m	`;aw&\<l=<\	m\ڼ\'ۂ\Qm\"\~q=T`\Q=C=.ʣ=ZVK;Y:)/|;9YpI=\4=׹<oK=\2<4\r\r=ۏ\<f$~=aw=&=Fj=h\\߼Oգ=\G\y<0<m\\< Ȁ<\2=+\ݼ\L@3*9<X\3=\\ıLPm=`2ռ[=\Ϋ=\50l\ȹk<J[v\<h!<\\=;\\	\6 [Ƚ߷d=NZ^C^=TRp=Is\=j=Z\v<w\<)\s<%q\\ؼɽn\^=\'\e\=SeJ0\=,\\"=\oku\n$=\\\n;̅=\\s\ٛ<6Lj%MQ=L^;̮V^=\H\<+\Ｏ6<\fkd:D:\<\n@<\U\Nc=\z<<\h$<1<J\P=`\=v\I\	=\\]Z?Vy=uȼѽ\O&=nC=X=ϣ:\"\<;\"k=[Ubv\w߻𼲊<\@/vA-<\b\"<e<R>~+=^\_t\)ռ\\\\<;j7=\n\e<B\;%f=/\<\\\\x۽K=\sK=\'<a=ｕ\b\\\}<~\\na\꼾Uј&ab\\b2C\K<U\<\|pNq;\o=$;=&۽x	uC=^3+\\;\\˽\'\?\<\\\<_=\$<\6\½\I\:\\s\nջbe\N$>9<V<F<\0\=b\:@6\<ۏ=\\<@\a=TS\=MS;ʽә`1P\<\\\0=ՉG[c{Zm֘̽K\\R#\X=\<ʻV&5\"\<\&==X=2ٻ\B=;',NULL),(3109,'b0fea813-cf69-455c-b7c8-3d0e42ad61f0',10,'taken forward. The extra charges if present, can be settled is a very easy manner. Since the charges are posted in individuals of the group, they are the ones responsible for paying their extra charges. Therefore each of the rooms need to be selected from the ‘Select Room’ box and their individual bills need to be settled. After entering the payment method and the amount press ‘Enter’ to save the information. If there is another room with an extra charge posted to it then it can also be selected from the ‘Select Room’ box following the same procedure of settlement explained above. When the required amount has been entered and also all the extra charges have been settled click ‘Settle Bill’. A prompt is generated to confirm the action. After clicking ‘Yes’ the bills are settled and now the check out procedure can be initiated. To go ahead with the check out procedure the billing instruction needs to be checked. If the billing instruction says ‘Bill to Travel Agent’ then ‘TA Voucher’ should be selected as the Payment Method. If ‘Payment at Check Out’ is the billing instruction then the amount, currency and mode (cash/credit card) needs to be entered. When the parameters entered are accepted by the system click ‘Check-Out Group’ button. Upon clicking ‘Yes’ at the prompt the group is successfully checked out of the system and out of the hotel. 3.2 Point of Sale Functions 3.2.1 Start a Table The figure above is a screen shot of the main screen of the POS. The numbers on each of the green buttons represent a table number and the color represents its present state. To start a table one must click on the respective table where the current state is vacant. Upon clicking any of the vacant tables a prompt is generated for the server/manager password. After entering the passwords the system asks for the total number of guests being served on that table. Upon entering the required information and pressing ‘Ok’, the ordering panel becomes available from where we can select the items that were ordered by the guest. After the ordering is complete the kitchen is to be notified hence the ‘Send’ button needs to be clicked for the order to be sent to the kitchen. Below is a screen shot of the ordering panel. When the ‘Send’ button is clicked, a printer placed in the kitchen prints the KOT’s together with all the information such as the table number, ordering server, order time and order details in that KOT. The table status also changes from vacant to occupied. 3.2.2 Add more items to an existing Table To add more items to an existing table just click on the respective table to open it. When the ordering screen is screen after entering the right server password, select the items being ordered just as before by clicking their names on the screen and when you’re done click ‘Send’ for the kitchen to be notified. 3.2.3 Settle a Table',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\\k<7\=\xz_<\0Q\\=\¼QQ=^(=\n|=) \Zz<\"rf =Ľ\2\.l=~JQ@l\\(t(#λ\$9;[H7<4\"+=\\=\Zd\<\o\\==\\\;\Gkkl\]<\'͌!\;\n\y\y=t[<\\\hp=ˊ0\}=\f=\8\$<Q\?=ӑI+;\=/Y:Q0꽼^L[<J,\0=E+\L=\5\:8\n=U<WPE1\<E>=<sȏ=9\=r\\Zp9\=t\\\<\,֫5	<`=t\\t\\;c\=\=);Ī=\n\9{lnDܖ=\0\:1F=o\<e@ټ^/D\=O\nNt\=\\;8=\$T>T Ld?=\Iz\=zK\<ؗc<=9q$F=s%=~\d*//=\"G=]\,=\˛	\o|\rlY=\C\n\d߼\\U=\\U\Z=\4OJٽ\5=\})\9R\r\C=C=3\;*˻p==N\=<\I<t\\<jX;=q<Q<x=ۯN\\=\\\<\d;q\W=<\r1\O.Ǽ\w\<(\7r/H=\x91Ȑ=\\=KPR<eԽd\~\\n\fý\\G3;0\^~\;\\eU:ONF\:qf\1\'A=E؅\)R=+>\h=\쨼Ȅz=^B+<M\n=yR5jb=ZZK@T:=;=)=:<c\ pT\\eW]\\@\=sWQ\<b=+Z^;Ө?`<0=\\\\!\=\=3<oF=\]\'=j\Z~=L׼\<;ǮZ==Eo4=\'輿;?\<C=/KH=y2<e@\\\Z=\'\r=\Y=Kýd=_~<\ZNc=\N\=!x=@ɼ\!\Oj=\\#;\zɽ#FлTJWEѕ\\E̼6g鼍\!\u<\?Cd	>a=Bͼ;;<mR\3P#=ڄ1:،=Y|;T\{\=\\C=B\y]}A=0\r6\\=\f=3˫C\ͼ]Ƽ)<\\=Br\;!\:\nj<-=[ⒽBϻ\Ծ=\(]*\I%\\C\0==\׽ \=[\E;\<<\ZM<㠽G\y]<\L5()3_!<P\	<\+K\}\<\nv<^e0\=Ud<]\`	Y3=K:]\\}OA&=\F<)>=n\<=[¢+\Kg5<zzѽiP\K%\ѻ\]=\1f=P3Q-\<\&<o==\"<Ml\;̫\0<\\',NULL),(3110,'b0fea813-cf69-455c-b7c8-3d0e42ad61f0',11,'on the respective table to open it. When the ordering screen is screen after entering the right server password, select the items being ordered just as before by clicking their names on the screen and when you’re done click ‘Send’ for the kitchen to be notified. 3.2.3 Settle a Table Open the table which needs to be settled and click ‘Settlement’. Below is the screen shot of the settlement window. A guest may desire to settle a bill in numerous ways such as cash, credit card or post it to the room. After selecting the appropriate payment mode, the amount is to be entered using the keyboard or the key pad provided in the panel. When the correct amount is entered the ‘Amount Tended’ button is to be clicked which will calculate the change that needs to be handed to the customer. To end the table click ‘Accept’. When the ‘Accept’ button is clicked the system makes sure that the entered amount has covered the amount due and only then closes the table and saves all the necessary data for accounting purposes or for any other future reference. 3.2.4 Split a bill Splitting a bill is one of the most important features in a POS that is used for a variety of functions making its application quite handy at times. A bill can be spliced for a minimum of 2 ways and a maximum of the number of items in the bill. For example an order that contains 5 items can only be split 5 ways. To split any order, open the table and click ‘Split’ after which the figure above can be seen. Then click on the individual item that needs to be spliced. When selected, the item appears on the left hand side of the screen. If ‘Split’ button is clicked at this point then the system will split the bill two ways with the selected ‘Red label 30’ appearing as Check 2. Below is a screen shot of splitting the bill in the manner mentioned above. When the bill has been spliced as per the need, ‘Done’ button needs to be clicked which closes the split window and takes us back to the ordering screen but now with an option of selecting which check/bill we want to view shown in figure below on the right. By selecting either Check 1 or Check 2 we can settle them individually as if they were separate tables. The un-splitting of the bill can also be performed at any time by clicking on the ‘Un-Split’ button presented above in the figure on the left. 3.2.5 Add modifications How the food is ordered by the guest might not always be the same even if the same entrée is ordered as different people prefer different way of enjoying their meals and as a hotel/restaurant guests have every right to demand things the way they prefer. Adding modifications as such means informing the kitchen regarding any special requests made by the guest so that',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\\x[=\"rtѼ\\Ľ/M<=p\;HMq=\\={\<!x^uj\"\<m=\\\)\u: =N\<\;$ߔ6=\\<U\n`<N\]:G8=\=\m)$\gSܻ۶߼9\0ۛ<s\/\K<(i\0=?\;&==4:u0=\r*<\´\=\?8f)=\\>:<\d*F\41]=\"\\:p,=Ђ\;]<\䎼:x-=\rN: >oqǽ鐼-QS<&\"<\?<\v4<a=\L;	e\n?h\wi=\?h*\=\n\=	\"=j=a89\;k\\=^=3=O=|<=\ʼ=\^@=wy!_f=\	ݍgX\<6=\-{ע&~=\~ȼ\;\\\=ahH<+Kx=kА;\=g,\<\'!Q*뮽5<`]M\=Pl<x?=7A7\t=]<=ZM@=\q;BK⑽\˻H=?\V=[$P\r>7I=\\=,$=])}<=s<q=X&\C9<\ټ3\<kq\"\U=ĭmʍ\':缇w<<tҽ\K=\[F73s=\6=p=\ra\\\0<\1X}嵽\l?<kvRo󦽲J\rߋ<\#=9\n84=#Rͼ#=\0J\˽ī===\ⒼA\nҼ\n=V	Ua=.\<.h\<!g\2=cl;H=\Z\,<\Z<HC<>7=Q\;љ\n>c\"yDm=1~b\ļ\g<=\\\$mF=8\=)\½i=K\"#@n0˻\/9=\=\nZ<>XK=5<~=*/;kn<\\P\sK\0\=ռu\dZ=\nE=	hUR=j=\v-\=yd<\l9h=:H;i|f;\Oȼ\e/<O;:>{<\\u\n?\=-=x\<\]LYe轉2=\\=\=Y;%<v	=mH6\\<0\n<t뽠=I	>ռ_>i<iX|_^ý\ƼnML=\<7QYtM=PK&\=8.Ű6\Hq<[޽Xl<5=TUT=ryQdjĪE㚽\\ټ\H\<Le\<Zgڼ\=[CjP9;\n=6\2=\\\=b^\\+<\\'\<NE\k;=\;ӭ߼4s\<,=&+P<5H><3@\3<Id=`u<\\\y<m/ϻ\=\Z\r=_=\5=h\g؜H\?L\\<\Z^\;\@^\\ؼq\<\e=\=z=\\\\s\=;\P=\\\w=<\;Zz<\<)\0+T\\',NULL),(3111,'b0fea813-cf69-455c-b7c8-3d0e42ad61f0',12,'even if the same entrée is ordered as different people prefer different way of enjoying their meals and as a hotel/restaurant guests have every right to demand things the way they prefer. Adding modifications as such means informing the kitchen regarding any special requests made by the guest so that there are no complications later when the food is delivered to the guest. To access the modification screen the ‘Modification’ button needs to be clicked and the modification can be entered only after the menu item has been selected. Below is a screen shot of the modification window. Any modification can be sent to the kitchen by typing in the requirements either by keyboard or from the screen itself. When the modification is typed, click ‘Done’. This will take us now to the ordering screen where the modification appears in the box presented below. Upon clicking the ‘Send’ button the new order will be sent to the kitchen with the specified instruction. 3.2.6 Void Items Items need to be voided at times for numerous reasons such as for a mistake that the server committed while ordering the wrong item or at other times the guest didn’t necessarily like the food hence he/she decides to change their mind and order some thing else. Therefore to address these issues and many more the system provides for a way to void items. However voiding items as such is not a very good practice as it might create problems with the tax officials during auditing if done frequently. Therefore it is encouraged that the users be alert and calm while entering the order and double check it before sending it over to the kitchen. To void any item select the item from the ordering screen and click ‘Void’. Voiding credentials are only provided to the manager hence a manager password is required to enter the voiding screen. When the correct manager password is entered, the screen below will be seen. Before voiding any item a reason has to be selected. This information will later show up in the managers report so that a close eye can be kept regarding the use of this option. When the reason is selected, ‘Void’ button needs to be clicked which voids the selected item and takes us back to the ordering screen with the revised order list. 3.2.7 Room Post Room Post pertains to posting the restaurant bill into the guest folio so that the guest can pay all the bills at the time of check out. A guest may also be entitled to a meal as per the meal plan purchased hence the server/managers need to be aware of how the bill is to be settled. To complete a Room Post click on ‘Settlement’ and in the settlement window click ‘Room Post’. Below is the screen shot of the room post window. Before posting anything to the room the server/manager should ask the guest his/her room number. The room number is to be cross referenced by entering',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\rL\<p\=Pe<;U=\\_\<E<\I^$\<h-=\4\<\\\\Wׅݫ<@kE\=!;\`Z\K୘<V֨;g\\<\ MlL(4\;=+O<><=}\<\\< c.Z^H-as+w\<8*.$Yȵ\}jWiwK_-\\Ry\ \cҼ=a\q<\\RMQ#k_=|{=\n3;,8:>(8]=~<1ݻq<\=6<\\.=\MWTPfS<9\RBZ\CR<_*\|p=7VK໭Ol<eN\yȠ\</]|=\C=\\\<F*p:[jn?K=]6<]\\}&5+p</=<g\L=o<+=ꉘ=\/(|=P\輑׻\k1\=<w\ݽ\\\\Z#\}=v\n<=P`=D/\=\x\Q\=!\n9sO\jd8=ޒ<\;>h -KH콻	YC5=f\A=\4\63=	bO<f=v\=Ur(=\<ż@!q9\\1</_<+s@=\ք\=l;\qV\r=\"z_ K<<\5>\"U</&B<s̶\'pH\Zj=\Ζ`K=<=\J:A<\\l<c=&\g=\W8=!\g8;	O\\<\:\0=$[=~m=¼\9zwn<n\<\?+<z\\Y=v\;X<\E=Ȕ6;h	\eǼ\\<@x\\'\\<\9;\Z;=\\\#\'\v˼/=k=8<M:\;ޑ;2Rj=cTm=@=*\3ϋR+\Lr<\(=gB&ǽy\\<f#\h\ф<\4<ࡽ@wD\=M7\<M\0v^b;4\=\{=t\'Z\\;CM=_\=\x;:oѽT\¡Gh\Z%`==\'B\<%=F[>H=S\<\J̻=S\= <\0ʼ\衽Ǵ<_T=!&Ċ<[\96%p(=Db=V>IWGfX:\;Q=-=M\;`!~*4տ=\\;\_~\\Z=j:\\\=!w`\=v\\\<\0k=\<\<\"x\\U-3\?=ҍ==\ =&.\\<\w=IW=_w<Q+\=J=L|[Ic>5\:i4FJdL=/={O;a\,F<3\I,ʼK1[<-\<\r4;v=F_<(\=UBRJt\I~<7<]\=\e=1\r_\	=s3>\,\g)\rs[<,<\zM>hGҽa\=DuZ%<SMFP^\Ⱥ.Pw\;\l{=5<៌a<?\=\)A<PC>\	=_<\\\=\䠼F8\"',NULL),(3112,'b0fea813-cf69-455c-b7c8-3d0e42ad61f0',13,'complete a Room Post click on ‘Settlement’ and in the settlement window click ‘Room Post’. Below is the screen shot of the room post window. Before posting anything to the room the server/manager should ask the guest his/her room number. The room number is to be cross referenced by entering it in the respective box and pressing the enter key in the keyboard. The figure above shows the information of the guest staying in the room 605 with their respective arrival and departure dates, meal plans and the total amount due. As mentioned before there are two ways to settle the bill. One is to post the bill as a charge so that the bill maybe settled during check out or it can be posted as a meal plan so that the guest is not charged. If ‘Post as Charge’ button is click then the bill will be charged to the guest folio but if the ‘Post as Meal Plan’ button is clicked then bill will be settled as a meal plan. However across different parts of the world including Nepal, alcoholic and other certain beverages are not covered under the meal plan. Hence in that case only the items applicable will be charged as meal plan and a separate bill is created for the other items which cannot be covered by the meal plan. But this new bill can be charged to the room as a charge. 3.3 House Keeping Fuctions The house keeping department of the hotel is constantly made aware of its rooms and its status by the house keeping module of the SDC which provides all the information in real time. During the busy season of a hotel the house keeping department is at its busiest therefore they clean the rooms from floor to floor and during slow seasons the rooms are cleaned as necessary. SDC also provides this similar functionality where the status of rooms can be changed individually or by the floor. Some of the basic functions of house keeping module is explained below. 3.3.1 Change Status Individually. To change the status of any room individually just click on the particular room from the screen shown above. For example we are selecting a room with room number 604 who’s current state is Vacant and Dirty. A room which is Vacant and Dirty can only be made Vacant or Out-of-Order, therefore these are the only two options available. To change the room to a vacant state, just select the option ‘Vacant’ and click on Change Status. 3.3.2 Change Status Floor Wise. To change the status floor wise click ‘Change Status’ button presented below. Upon click it, the above screen is seen. The house keeping provides a way to search the room according to their state and floor. The two screen shots below show where those options are available on the screen. By selecting a particular floor and a particular room state we can search for all the rooms that satisfies our criteria. In the figure',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n<\=r+Y^<\\ټ%=:\.<==y<+Խ\\<\==ELdʼ\$=\\0\<^v=q<Ӏ=%}\'>=jʺ\\`p=\N=P=ˇ9<\\0;\\R\=j^ƣ	̳;\Ǽ\r;\*\|<O=tb?z=k4=:\\;ұ:=\8%m\20=*]sv\09<SM,C\/%uM>\<K<ܞN=TLYcD~g<:<2\=~?<\\0H\<\\;\><\B=s\"\hJ^v];9~ws\'7=2\;j\@SU=d\=]\<p=2X=\%/T\b=\H= >=a=\\r%t;\9=a\n\=!p=_5=E2\\b\F4$=\[*<\{<Z?=]h>d\\P=\<\\^댽\b)y7#=	#)B\q\=ϾjMќ\<鹚=3<A\=+\u=%h~\B[=&<&s>(:H?{6\=\j=\\qh)=	=\9=c=^\Z7\\<?U<JI=ԕ<\\%\=\̻U\I5\<A\<\U\\<\䶽k\=\\\<,K߰<l=\:\<Zҽ7\'\ڽ\r%qFn\6=\|l\I\\\b<^q\\\<\W%=aO17\5~^idt=C\bǯ/=+;=\"a9=))5v=c\¼u;{<k=\jۼa2V.\a<6=\n<Zs<\7\;Ȣ;=:<tǼYݼ^<p\\\>7\0V\к|܌;7\Z=0\(6W=<6_\}^=\ZZ\ة<7\<>=Ђ=\n<W=7=C}#P<\_ai<rV=:c:=\\~4\:=V:װԽb<\\^\\<\\<\i\G=w\=\\)\\Ƽ	z=C&<ͬ콽z\K\Z;><	\:T\Om.G\d=l\g=y:=-F8z=;5=l<D\<=s==^y;Ko=<|ŝ=E\\<[O=A;$C,X4eQǼ;%M4\G=J	:;u<͞B\;TD9d7vPl:4\\|G<\"k</x\I<\\r\}\m2=sW<;Pb=9p˼\\rcǰ=\0=cdlbS\?Mr<u=@Xf:<\>8ҟ=AɇWt=rߐ\a3=XxGK<.J%}N=jU=\^Zy2|ڻ	E=c#1\k\SuAعS\\N+\Ի(\X=\\j=>w9(\q\=n\'h=ŉ<\\=;	(V*s',NULL),(3113,'b0fea813-cf69-455c-b7c8-3d0e42ad61f0',14,'a way to search the room according to their state and floor. The two screen shots below show where those options are available on the screen. By selecting a particular floor and a particular room state we can search for all the rooms that satisfies our criteria. In the figure below, we have selected all the rooms in the 6th floor that are currently Vacant and Dirty. The result of our search is seen on the box which is pointed by the arrow . We can individually select the desired rooms by checking them off or if we wish to select all of the rooms at once then ‘Select All’ has to be checked. Now the selected rooms can be either made vacant, out of order or occupied-dirty which is presented on the left top corner of the screen shot presented above. To change the status click ‘Change Status’. A prompt is generated asking if the user is sure of the operation. When clicked ‘Yes’ the status of the rooms get changed. 3.3.3 Maintenance. The maintenance function provided with SDC is not a separate module but just a functionality which enhances the capabilities of the house keeping department. When the house keeping department notices something not working in a room such as the mini bar or the television, they notify the maintenance department regarding the nature of the defect filling out a form which is presented in the above figure under ‘Send Response Request’. After receiving the task the maintenance department on the other hand mobilizes its crews to take the right course of action based upon the information that was passed from the house keeping. Upon completion of the task in hand the maintenance notifies the house keeping and only then the house keeping change the status of the room to its respective state. Below is a screen shot of the form from where the maintenance is notified. After filling out the appropriate fields shown above the task is sent to maintenance by clicking ‘Dispatch to Maintenance’. When maintenance sees the task and completes it as requested, they resolve the task by clicking ‘Set Resolved Time’ which marks the task as Resolved. Below is a screen shot of the Maintenance which can be accessed by clicking ‘View History’ in the figure above.',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \nn;\0ټ\\<\?r=/`=Ln;e[=ce9<t!<\4=\\\<>\y᥼\=\\\}sZ.#(7F=b\J<S\r8r=*/\\<\vT<\\RO<\'==M\w=\\=6~kxVq<\=\\\	@<\H:(YO@\\<\\٨=\=+t\\"<\r=\\=%Q\=v\V=6`=X=&H3$%gG=SN]4\2<\$:i=t]@<_6\\d=wfiXr=K{=\c=	\d=1J˼Ǉ;\6C=Sֽ\).эJ\ =ꊼ\\\<\Lf&\h=\0_Z<0=_2`\;AH6+6?\<sƃ<\<5;6<L\?\7=b<t\<<w\)M7ͽ\v<D=P\19\\\'<M\=);~ؼ\zü:=ܓ,V\\\'\' =\0!(<\=d	 Nz=K,;/\=Ꮌ\`;%0;ƥ=c\x<m\<*=\Aq =j<;Z=5i=7=.<\=:\ixy=X=+\=q+\<\A	\<QD\WV=\--S,=\#\<[=]=g2ͼY6pPV^<%i=ŧ0</\!z=i2g\pG=4cH=d\'=*2̝<h<庻Ov!H\՛<\\&=*!!\\\\\<wO<7\P\<\nS\Pu=>4\gt^(\\=\\<μ\\qRKo<1+6ij3/Sl_+==\#ev;\r\<~Gv7=77ϼ\N=\|<۲=v_F;J.=c\\=G)-y\)C\\\M\=\X<<nP2Nv\>=),F\=\\\p=ht޽\v<ⓗ\"=@<\\\=Tx<DIA!T\\-\\=:\nf=b~<9/YUq=)=^v\F=X:@ŏަ>PU<ӨJ=Pq=ך.RZ;>7<>\'\\\c<l\=Z<[\\<\Ļ;F=.8aM<1[=ǧ<^=y\\nBg<ʒ2\:\<zH<Tgf;Z\S<%н;\7_\\\\\0<\|+֔=\[=M\)	3S\<ftE\n\t7o\R$R\b\\=`\\%\Z=\=F\= T<k\<\\Z<\2Za=:{;l\uC\_\"5<3J=L?a\><=A=7BQe\\F\-=3\=\\&=Q=fO=\b~\5=_1=\ْa.=!?=\1\	Ǽ+<l;jt?\"U=ĕ\\@<	y`ܒ]-L=\q\;\=ǳ1=\<\c<\=\1\<',NULL),(3114,'4fb4ff17-d459-4223-a739-fed0bab0bd44',0,'Teaching Manual For SilverLine Dot Connector Version: S.10111 By SilverLine System Integrators Pvt. Ltd. Tables of Content. Introduction to SilverLine Dot Connector. Modules. Main Screen. Front Office. Point of Sale (POS). House Keeping. Maintenance. Functions. 3.1 Front Office Functions. 3.1.1 Check In 3.1.1.1 FIT Check In 3.1.1.2 Group Check In 3.1.2 Check Out 3.1.2.1 FIT Check Out 3.1.2.2 Group Check Out 3.1.3 Start Reservation 3.1.3.1 FIT Reservation 3.1.3.2 Group Reservation 3.2 Point of Sale Functions. 3.2.1 Start a Table 3.2.2 Add more item to an existing table 3.2.3 Settle a Table 3.2.4 Split a bill 3.2.5 Add Modifications 3.2.6 Void Items 3.2.8 Room Post 3.3 House Keeping Functions. Reports. Introduction to SilverLine Dot Connector. SilverLine Dot Connector (SDC) is a Property Management System (PMS) which is built for the purpose of managing different departmental operations of a hotel making it convenient to keep track of its day to day activities. With the arrival of computers into the scene, the old ways of maintaining logs of everything manually is long gone. In today’s competitive market its everyone’s aim to stay ahead of the game and one way of doing that is my having a system that helps you do just that. SDC is a system built towards addressing that need of a hotel where all the information needed to run a hotel efficiently is easily accessible with just a few clicks! More than that it integrates the functionality of all different departments of a hotel such as accounting, inventory, housekeeping etc reducing the time, energy and effort into managing all of them from one single point. SDC is one of the most efficient and easy to use PMS in the market. Build with the latest technology in software engineering, SDC provides a very efficient and user friendly operations making it very convenient for hotel staff to meet with the requirements of its daily operation. Some of its key features are as follows: SDC is a state of the art system that is capable of handling reservations for a hotel of any size. It is intelligent enough to interconnect different departments of a hotel, keeping them all informed about their duties and tasks in hand. The front office module gives an over view of the different states of different rooms (such as vacant-dirty or out-of-order), and these states are denoted by different color indexes helping the staff know everything they want with just a click. The reservation module is a full proof and fully tested part of the software that handles different information about the incoming guests such as their likes, and dislikes, room preferences and meal-plan, flight information. The guest history tracking system in the software makes reservations for repeated guests very simple and effective. The house keeping module also provides a visual over view for different rooms to be cleaned. The system provides a mechanism to clear the status of different rooms floor by floor or room by room as the situation demands. A maintenance module constantly keeps the maintenance',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n> :\4=y\;%\\<GK\<=ɖ;<2=trj=<jz=\<8)|=^\?<bBW<;\\=\;\-实= \rd=\\"<\Zf\<)\\uy=~6H:\r<.6=*z=.\\U=q\=\\>\0\h\(FP2&=\<̏XRb=\\<pe=Ůљ=\<J=z=\&\E\\;\c\?fo\<9Ҽ\i4\=WQB=ȋ12DGt-~=$=Ix=\\0<s=#ŽǓ\ >3^μF\r;\\9	i=\B=<oQ;\Z\MO=\j=[\L&;\MEg\Z\T9=:A<L=Fi=?\]a)f\\o\)B\:NF<:\#Tj\\	m\h5h\Q\S.t	=L).<=qS=3\0<C\;\+\<L=i	GZ\Tb9YGN=RL\<=\ϋ=;\"K=!tdL~\㬻y\;C\Ρ=|s=W6\:u\ѼS\2\Q=[ɼ~p=#L<xn=n=\/={<u=2=l\"ۼ0\\`=\x\r=0\?#\0Ϣ	US\Y.\]ӻ>#=)d\$=A =\=@ȉ\0A=DI\D<;;\<\\	{$$RkKؼ/_\Ol\1(3<J0x<KNL=$uG\=R\rd+ku;)*\<\'N<]:a&Gҍ<7=\\=RVO\<\r\\\;ː<\\N5UW=\뽱\"\n\}<t⡼C?7\_>\Z\<2_8=\\n=Av\>/8VVX<\p<[n\=\(=	\6/\\;=,>;O\r<\>a\"\L\0\<\=!;mx=2_\<q\7<_\"+ۋ6\z\oQ\ {@=)<+Tә%\;V^t=\=g~\;{=\=O%P=ʣ2qKy=\1>e=\j\n/^><C1 W\Ż\\k=\żpYH=\z=ȩ`rvr6\\\0=v=\=\=7	Q4=\\p3&H<SCN<\"H켃8\~\Z=\F~^=\`ӼȄ\G\"=\q\<䟯=\<\n\L<\I=\?9\=\L`=\_K\=\QƖו\ri$<<W\E\Z>=\J.Ҽ=HE\r<ߺ8=~]7=\\8\#)Y=\;b=\q\<s\=l.J;\\;f=p\吽\'\=\*=\<Ǎ==\=팻\0v=\aB<]=+\==\"h>ŁEn\:*>\Z;7\=θ5=xD%vz?C8(\0\:<\=`;<,4=&+t=',NULL),(3115,'4fb4ff17-d459-4223-a739-fed0bab0bd44',1,'very simple and effective. The house keeping module also provides a visual over view for different rooms to be cleaned. The system provides a mechanism to clear the status of different rooms floor by floor or room by room as the situation demands. A maintenance module constantly keeps the maintenance department at its toes with its constant reminder of the things that need to be addressed. Housekeeping department notifies the maintenance department instantly about any breakages or failures noticed during a cleaning procedure there by reducing the reaction time. A state of the art POS system is also a part of this software that takes care of all the restaurant management needs. The POS provides a visual overview of the entire restaurant with its exact floor plan and table numbering to help the manager and the servers know the status of different tables. Different color codes are used to signify different status of tables, such as Vacant or Occupied, which helps to know which tables are available for the guests walking in. The POS is best utilized with a touch screen monitor as the ordering process will be faster. Each menu item is listed under its own course list, helping servers or managers to know where to look for any particular menu item as needed. After the ordering is complete the order is sent with a push of a button. Upon doing so, all the bar items get printed in the bar and the kitchen items get printed in the kitchen reducing the need of having to send someone to the kitchen or the bar to inform the respective stations. Once the order is sent, it cannot be voided unless approved by the manager. Any alterations or special requests from the guests regarding any items ordered are entered into the system at the time of ordering which is printed at the respective terminals along with the items ordered so that the respective terminals are informed about such modifications. A bill splitting feature allows the bill to be split as requested by the customer which can be printed accordingly. A bill printing system is also a part of the software that prints the bills as necessary. Room posting for different guests according to their meal plan is also incorporated into the system. Reporting includes daily arrival, departure and stay-over reports. The end of the day report is also available with the exact cash count of both the local and foreign currencies. Any further reporting options preferred can also be incorporated upon request. These are just some of the general features of the PMS. Let us now go deeper into its individual module operations. Modules Just like any other PMS in the market, SDC covers all the basic modules required to run a successful hotel business. 70% of the revenue generated by a hotel comes from the guests that come to stay in the hotel, therefore a system as such requires every attention to details as far as guests are concerned. SDC',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\\ZE<\$Gv+Q \1\=eU;\U=np\n+8==%-=	툼J?[7W=\"\<\_*5);HI¼\9\vC=<\d< \t<t\Ľ5}e<׺j\=<U<\\T<1s=\n}L(j$w##\\\'x\<\\=֫eGG(xFA\\F\H=\"N=}M=T=L=\͊ZʌK=$]\P<+%\r=1<<9\0=eS\\:C\<Λ=\"nGu\<N\\\\2<ks^;\>\n\3<.G<l3`d\ZQGҘ\k=wH_;v9=*`\><\0}<\=Z	<Z\<\\!=Ti<\Ɏ<\\\!<\\<Z.=鐜n\<=?\\d\r*ls\< <\Z=/;rB=\IĻJ8;bpH=KG===\}9	5LC\lhG\\<q/;\=<N59\{\g>\v=R\Z=	\=\z<`O=	\Z\nD=\=\\n\r;\\(<;<vO<>\<wA<\>|=9<o=R\oj;2\=-=Ud<\\нnJ\n\'ӂ!mk9\fdTm\rd=\\<0sq{=Т7=\<Yuj\Z_\\<dzJͼ׏=getA=-<.;yg<z8<k2[=\noD\<w;1=g\|=Us\0=fz;\#\VG}\s#ڼ\\=2j\:%5\0\\<-GC</l=Go\'U=I \<<̼9=K\\n\\0=i\0l\Cg\ԶϽEW<D,\Z\\<5ɽtL=fqs<|!=\y\T[ýQ=\\}[\=/JJ1<\\\A-L=](ú\:^5D+\c⾻?f:<\\}=:=gW=\'==Ⓖ-><R$\I=)D\ؽ\*;By{\G\YT	<+k,=\'Aru(<\8\\m8=@\5ʙ:=\U\=	Ui?=Ē޼+ =$~\޼\#\<0!$=\G9(.\ZH;~$;LD,\=¼=Q==ǁ1=g\ȟ=\\&<kFVU\aC2=\lFL<Ppܽ|3F<5=W=5=;=\:\܍=g\Z|=Փ=_\W@=:E;+ﺦ<=)2=fDzt<:\'=Y\<=1s\=߭<\\<sqx<uP=\\"<t/P{5=\\\<\\}{۽&L\r=d,=a\\<\e`S\S=_T\K\w=,#\>K\>\<\\'<\\'=\\\"~',NULL),(3116,'4fb4ff17-d459-4223-a739-fed0bab0bd44',2,'market, SDC covers all the basic modules required to run a successful hotel business. 70% of the revenue generated by a hotel comes from the guests that come to stay in the hotel, therefore a system as such requires every attention to details as far as guests are concerned. SDC provides a state of the art front office reservation system that allows to know everything about a guest including any preferences in regards to dinning, lodging or any special requests that guests might have. Main Screen (fig 2.1) Apart from that house keeping also plays an important part in serving the guests as per their need. Restaurants are another place where the guests need to be served in a very professional manner. All of these operations are carried out by SDC which help the hotel staff to address the needed of the guest in a very professional and timely manner. Lets look at the operations of each of these modules. The above is a screen shot of SDC main screen. This is the main entry point of the system. On a first glace it gives all the statistics of the hotel that is relevant to the day. Values such as occupancy percentage and rooms to sell are very closely watched throughout the day as that determines the total revenue generated at the end of the day and also gives an idea of how many more guests can a hotel accommodate if new guests arrive as walk ins. Clicking in one of these parameters will give use more details pertaining to the parameters, such as if we double click “Total VIP’s” then a list of all the VIP’s with their room numbers will be seen on the screen. Shown below are 5 buttons which are the entry point to each of the mentioned modules. They are as follows: Front Office: By clicking in the above button in the SDC main screen, the front office of a hotel is seen. Front office module covers all the reservations together with the status of all the different rooms of a hotel. Settlement and viewing guest folio is also done from this module. Point of sale (POS): By clicking in the above button in the SDC, the POS can be accessed. POS is a module that serves as a restaurant management system for the hotels. Each restaurant of a hotel has its own terminal or POS from where it is accessed and used. House Keeping : By clicking on the above button, the House Keeping module can be accessed. House keeping module provides the house keeping department with the status of different rooms where by they know which rooms have to be cleaned or cleared. Accounting : By clicking on the above button, accounting module is viewed. Inventory Management : By clicking on the above button, Inventory Management module is accessed. Apart from accessing many different modules, SDC main screen also gives an over view of different time zones of different parts of the world,',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\<\\ἰ\rq<#80u=Wy=Ẻ7ʔ=\\\;IS.S<]<WDp(b=fQŽ=r7|oN=\I\B\ Ѻyo<\\\*<+\;{±< &{B=/˖=\Z!>3\<\'-=qλ\`ؽz`<}<Zi<Լ?\AλzaJKݡ=Ȕ\ޟ=Z=bs=0=o\=	\b̓\<fd=!s\<v<\[<\Z<야ns\:5\<W.<fs\pļ<\ZJ֐8\=20z\<:!=\'jMI\<>\{mdb=yx\\r<|=㶙<)E0=\\=\Ž\'&\y=ώ<\\_=T=q=\\Z\g\a>DI=S\Ż9X5a\˽	a=);\ļȖ\{]=l\\=\0ܼs<Õ\Z\\<\Zc(ҏ:H{H=̾\	f\ýļ&oM\y<\\<\C\n/5=jA<0먼&l\<E\<U\s=ޣ<\<\m=g\\0=\,\\<\\\<@\=: <\`P=ڃ<(\<K=j<<>p=!<<v\Z=g=^\\<yt=Ħ\ƻ;\Sv\\\<gJE=\۽	=Z\\X\<aH\=\	\Z\0\\=(gpf[;씽<`Q׽@\\G\<q~}\\n\jK#[<8i:\$xԻR=(k\\ro< <\<H\0<v\\\f\"%:\=]	#=|ݓ< \H`}b=ʉ\'_D\<\\\<.1=:7#<\\\`	&<3\Zik\=_\n\'쫅\\\<f?\ܺ樽\D\=U;ZCڂ=\"\;\=\˼\'𼆶\'\==Y[=\\ΏeU|\q:d==\Z=\\<L<nT=\=x\lFcVB=\n;>*>1Br\<\xX#6(7i~\m<Ê\w|<\=m=&\*=Ҩ<f\=\+\\v;\=\`3O{=}\,q 0wWJ\<\Jҽ\\Z\Ɗ;\L=\p\#\?ezμ \H\ޖtE<\Ha\"<\nOͽ<l\\Z=\Κ\⇳RnF\A0<\<8X0\\'g<X!=\J<\\Z=~*r=\j<\^]A;#Eǻ\W>x|B<\<B:IZ#=P5\6\<cl25%=L7;ǟ;\=+=\9=$>\=32<y><ݼD=\z/=ڐ<*+\<\Z=\D~<\n<\LB<7[k=\<<T\\׃=n)\=\=8Z!\k=\\<\6\=\"/o\\<',NULL),(3117,'4fb4ff17-d459-4223-a739-fed0bab0bd44',3,'Accounting : By clicking on the above button, accounting module is viewed. Inventory Management : By clicking on the above button, Inventory Management module is accessed. Apart from accessing many different modules, SDC main screen also gives an over view of different time zones of different parts of the world, and also a small calendar which is helpful in many different areas. Now let us go deeper into each of the modules of SDC. 2.2 Front Office. 2.2.1 Overview : The screen shot seen above is from the front office screen. Individual rectangles denote individual rooms of a hotel with their current status being represented by the color of these rectangles. For example, rooms 701 and 702 are out of order therefore they appear in a grey color, and the legend present in the right hand corner represents exactly just that. On the upper right hand corner there are 5 buttons. They are: 2.2.2 Refresh Button: Refreshes the display screen and updates the current house status. 2.2.3 Find Button: Upon entering guest room number in the highlighted textbox the user can press the Find button or press ‘Enter’ to view the room details. 2.2.4 Rates Button: Pressing the Rates Button will display the different rates offered in the hotel . Rates such as CP, MAP, BB can be seen with their individual breakdown of their room rates and meal plan rates. 2.2.5 View Report Button: Clicking on the View Report button, different reports can be seen. Details of different reports are covered in further sections. 2.2.6 Drop Down Menu Functions: Fig 2.2 Buttons Fig 2.3 Room State Fig 2.4 Room Type There are three Drop Down menus present in the front office screens which are highlighted above. The first one gives you the list of different room types present in the hotel such as Single, Double, Suite etc. The second one contains different room states as such Vacant, Out-of-order, Occupied etc. Selecting (Fig 2.5) different combinations of room states and room types and pressing the Find button or enter, the user can view the desired room having the selected states and types. For example in figure 2.2 and 2.3 user wishes to view all the single rooms in a hotel that are vacant. (Fig 2.5) Given below is a screen shot of the result where different room number and their corresponding states are seen. Fig (2.6) 2.2.7 View Room Button: In the above figure if one clicked room number 605 which is highlighted with the blue shade (indicating that the room is occupied), one would also be able to view the details of the room. The Figure is given below. 2.2.8 Reservation. Overview Fig (2.7) The figure above is from the Registration screen of the SDC. There are two types of reservations namely FIT Reservation and Group Reservation, which can be viewed by selecting the respective buttons shown below in figures 2.8 and 2.9. (FIT Reservation button or Group Reservation button). The result of the desired query can be seen',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \nF<-~vMY=tt=\\=\C<hV9=Z&O=x^li2=\`\\n;j͇\$<s 4<\\8<	{»rbb¼\e\a<aY\ZM=\<췽 \Z\<=i+=Cr=\A=F!n\\[\=l|ru\"\<иZF;\0<~+l׼u\0<\={=\P<B\=^7<,	><f\Ѽ\\;]E\;\0*\<\\l\<<jL+=`ۼ\v=v\';˸-\\\\N<}0<<\\\<7AbFq<\\@WJ=x*!v=<^i<\E<ߜ\Z<\ջF(= \':+\̼k<P#:|Bae==M\`n1=,=\\<=Q_c<Σ\=|\<A1\0\\r+0r=/%\Ģ:@;,\<\rG=Z\.\=\q`dN:g\K+u\H=Q\	u&Ė#CҪ<\">\&<\.\Ӹ;\_=o\<_e<~=\#K !\2Jָ\=bﺻ&i(YY=\ּ\=u^&>\_=~\=6\<s;v;=\C=jc=M<b{5=O	;H\	<\\<\(FmkQ\Nm=\\nU=X\<QX=\Nq=Pj\\(ܧ\]꼖Q<іŽ^<q\55Q;-=c7=M\Aj=V^\\r=S\⼳\"=\nA\&Sn/[=:\\\;>1fϼeX\q\;	\"\\ZЩ&=f\\0pp=NZ\弳Opa\\Z\r8.=*=\\Z=\q\\Sيؽ\[Nk\9S\<l<س<\<vݟ<<]\^<*PSu==*<lܽr\'<wdZ\`={7.\"O\|&\=\G[=\\\;<tE\7*q\0\=8[=P.-<\r=Itj^h=\`=\>0&ͽr<.5U\:Y=\<N+<ZŻች\\7 Eļ!\ս\\=\\\:\\d\=ȩ<ܯ\<c;\h=\}X:w=~ZP\Z=Ͳ\r޼ԝ\\1HW\Xz\uC.[o8ҍ;Tsj\&7z:?\\\\8j<;	-\=g=̼󲁳\Tk@\:\}*=fvBc=\\\=OW\\=	-缧\"=.\=*<qrI\Z=7=oW;GDZƼc=c}Tc=1@o<MMK>=[F\=ʉ=\O=(G¼}Y=؆5<bTjt\=PY@=\ަ=I0Ca⎱u=-<Òu\]CBU<!}\.\\%Ǽ[\=\Ql\̼\nw\;\\<\Z\<\\<\<5k=ե{Y<',NULL),(3118,'4fb4ff17-d459-4223-a739-fed0bab0bd44',4,'the Registration screen of the SDC. There are two types of reservations namely FIT Reservation and Group Reservation, which can be viewed by selecting the respective buttons shown below in figures 2.8 and 2.9. (FIT Reservation button or Group Reservation button). The result of the desired query can be seen in the box presented above. Fig (2.8) Fig (2.9) Fig (2.10) By clicking on the In House Guest button (Figure 2.10), the list of in house guests can be viewed. Fig (2.11) One can also perform any search that is based towards the guest’s first name, last name or the reservation ID that is provided at the time of reservation. Any such queries can be typed in the box located right below the reservation buttons shown in Figure 2.12. Fig (2.12) On the upper right hand corner of the Reservation/Registration window, there is a cluster of different buttons that provide access to different functionality to the user. Let us view each of these in detail. 2.2.9 REFRESH Button: The REFRESH button refreshes the view of either FIT reservation list or the Group reservation list or the in house guest list, depending upon which button is clicked, i.e. FIT Reservation Button or the Group Reservation Button or In House Guest Button (Refer to Figure 2.8, 2.9, 2.10). 2.2.10 START Button: By clicking the START Button, one can start making a reservation for either an FIT or a group. The details of how to create a reservation is described in later chapters. 2.2.11 CANCEL Button: By clicking the CANCEL Button, one can cancel a reservation. 2.2.12 GROUP CONTRACTS Button: The GROUP CONTRACTS button gives us access to information pertaining to different group reservation contracts a hotel may have with companies and travel agencies. Without any such contracts, a hotel may not choose to do any business with other companies. A contract includes important figures such as number and types of room, rates and dates at which the contract ends. The details are described in later chapters of how to create a group contract. 2.2.13 UPGRADE Button: The UPGRADE button takes us to the window where a reservation can be upgraded to other options provided by the hotel. 2.2.17 ADD ROOMS Button: The ADD ROOMS button adds more rooms to a reservation. 2.2.15 DEPOSITE Button: During the time of check in, guests may be asked for some deposits which can be entered in a window that is accessed by clicking in on the DEPOSITE button. The details are coming later in the chapters. 2.2.16 TODAY’S ARRIVAL Button: By clicking on the TODAY’S ARRIVAL button, one can view all the reservations that are arriving on the date it is clicked. 2.2.17 CHECK-IN Button: The CHECK-IN button takes us to the window where a guest that has a reservation and who is arriving today can be checked in. There are other information that is gathered from the guest at the time of check in which needs to be entered into the software. The guest check',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \noBv)+\W=\=G\= =[\H!̭K=ͯNu\<I$m\\<@!;7=\ok{?<\Lt<\}=Ͱ<R\X!MO\tYeJ=:=,=:@>u5=L̽\5Vv	GC]VFlè<\\"\;D\Z==5%=t^;\k\;=/\r>ur@\Ȼ:Q=Tm<\"=\JkN~\2.=c\o=lA.*Q==ZN\F+t\\\\=.	<w\=\\0<\}&\(\<n=w\\d;2%=Mc<-\'<\`6^\\\\\lt=MJ\$Ƽ=\\<\\?\pO=Ib=e\\n=-ϼJV\=!\,=}/Ey\\1\=\1/u:8\r\ݽ=<\rּc =&o,h4=i`	=\}r<\YE	Y\`5gkY;\n6\G\z\n9WZ\;\bȼ=l^\A=t+<\\n5y=\g%\ջ;\\k\=pyD=K=[&=(\<h=O<=/H=\\<\\E=lp{<\ͼ2rἴL;\\b\g=M\<}a=d\m\ܼ\x1=x\=\l\\<:%\'J==ZG<\o;\s\<H2=MZ[]\ȟ\b\n*=}\4>1=vspH?<P%t\f\";fk\'\\<H\Ͻ3\\=|(Ys<#\q=Q\nT`\mt44<K\\M=\<a1c\1=H9KlM\r=t$\\"T\<\\=L\B=KH1ꉷ\9=\y۹\\\<\0o=<7\0c<p\켷\n\\\P=4;N!H<>ae=ɝ;>{=W4\=k\Q<\\</=*si=\-=@\Z\ֵ;<M\dNJ=H=(ּ\oGo<x̽ ĺ=<\Ar\w\n;K\\z=F=\p|ЃA=\V<ùu\L8?d<ċ\oYi=\L=t?\D=\a<¼\\<\=1;mUAu<ٝ\\Լ\|\<\8X\\:=&\0=\o(<㺣D?=\8\'=K̼8<\\=\=%F!=Ӫ;u\>\<_\\\<\cg(;{n/\mvY*p;\JR\V=鲪_\\\=ěJ\=\Ź<v=Ac:Oj\j=\\=K;D;ʼ\\\ܼ\\\<,;&/\Z=\{<\r><m=\ ==7=>\\]\0\\=`\\\=p\;<\\l=aHy=NX=E7=s&\<~K	aP|׽\\}<\\S	=q۹\=f!<HgĻ@=\֟w<',NULL),(3119,'4fb4ff17-d459-4223-a739-fed0bab0bd44',5,'CHECK-IN button takes us to the window where a guest that has a reservation and who is arriving today can be checked in. There are other information that is gathered from the guest at the time of check in which needs to be entered into the software. The guest check in process is described in detail in later chapters. 2.2.18 VIEW DETAILS Button: The VIEW DETAILS button shows details such as guest details pertaining to either FIT reservation or Group reservation. When the in house guest list is viewed by clicking the In House Guest button (Figure 2.10), the details of each guest can be viewed by clicking the respective guest and after that then VIEW DETAILS Button. 2.2.19 EDIT Button: The EDIT button takes us to the window from where reservation details are edited. This feature, together with many other features is password protected so that only the person with the authorized privilege can make such changes. 2.2.20 ARRIVAL/DEPARTURE Button: The ARRIVAL/DEPARTURE button leads us to a command centre from where we are view the arrival and departure records. These records can be viewed according to their dates. Below is an example of such logs. 2.3 Point of Sale The point of sale (POS) of the SDC is concerned with the day to day activities of a particular restaurant and billing. The POS handles operations like ordering, notifying the kitchen, settling a table or posting the charge to the room of the in guest. Below is a screen shot of the POS main. The main screen of the POS represents the exact floor plan of the restaurant with its table numbers and other details regarding the location of its exits and bars. When trying to access the POS from the main screen of SDC, a prompt is generated asking which restaurant is to be entered. Upon selecting the desired restaurant its corresponding floor plan is fetched and shown on the screen. The main screen provides some valuable information such as which tables are occupied or vacant or which tables are departing making it easier for servers and managers alike to be better prepared for their service. The POS and all of its functions are described in detail in the further sections on POS Functions. 2.4 House Keeping. The house keeping module in the SDC is designed so that the house keeping department of a hotel is fully notified at all times, the different statuses a room may have during any particular time of day so that everyone working in and around is kept notified. Below is a screen shot of the house keeping module. Shown above is a listing of different rooms and their respective status. Just looking at the above screen the house keeping department is made aware of how many rooms are checking out, how many rooms are occupied and dirty and so on so that as soon as the rooms become available they are cleaned and made ready for future guests. Rooms of different categories can',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\0\<p\<!@&<}|=\\==O\z\<\_=\\u<P\;\\<\n\"\μ\Ƚ\\\r=HO=rM=|hm==䢼]p\\Z;\h:\W=\\ö==G\&S`ꋼ\0h\;R><ws\<Fa\<\=\>\'v{\\sn\=\f\<g|=SVM=\*wS֩=<\'qtnkJB=EK;\?+:=%Km\,ݼ\5=!\\T\\t=0W>\nc,\H\<\,}=\-~ͫ7\\n=\晽q\]<n<\\<<\<j\<\\c\\\;=<\\\μ\~޼n\<;8<-.1aL==*>=N̳<B=\|7=K	\	>O<\<5\ͼF}{@*=bA=U\\<\N<\f=\u=\s=O`-=F;Ҽ\`q쳽?)t==	\U*\\rRmSx@p_=2<V2\\nü:p;\\<=\۽/=삽\\<ZV=ݺ\n\\=r˶;ќ<ސ(=\\U\;R\=\0Ү;\Y=\*=1	=\ȅ<\'\e;ͼ\B\\\\<b<4V\>\\_<6Ѫ\\69l̉YE}4\PT\\\"\=跕<h\<ˡ!=\=mwL͏<6\]I\>yȫ<@>\0u\"=\_݈<\\pU/Hk\?{kVQ\=;#l,<($+<1<w\8\w\</=\;{#=Fg=Ǖ[= /A\u<<9&}\'z`<\nἯ|@gh2	<\\\E[=\.<\"م=\a\\\=z\;d\n\ʽ?\߱<ɼ\ګ\\r\8\\ʽMw_ \<oxȐV=U?=ѻO=d_<X=\(<5\<=\"=\L={ͼB\_<tcŒ=]L=ۦ=\U=n%{5=j6f=\\\n=\.7.\=L\<:=nÇˇ=h\gP\\;+\=\\_=k<%)\\=[\\\y=\:=ާ1znC(=\===\p=\	)\<ۈ;\{=#\\=Z\m\s:V\.;)\<\^h\xj\TR$<虛%\|;2%Lz)<\½T;S=\\<aQ=L\zƙ:l;\<\r,<;w<?=(\\̽\&=a֢=\'5Z\\\ީj2\<*2ݻ\r^=\cK<2\y<Z\5=\n9h2@= S=\=_LJ=\=\<F=$=\\\;\f=\	=\\=n<k\f\\\=as	<6\ܻ5)^༫P,ygP=7C(==x鷽\'e>A$):`<\س=$(',NULL),(3120,'4fb4ff17-d459-4223-a739-fed0bab0bd44',6,'the above screen the house keeping department is made aware of how many rooms are checking out, how many rooms are occupied and dirty and so on so that as soon as the rooms become available they are cleaned and made ready for future guests. Rooms of different categories can be searched by clicking on the respective buttons and clicking the ‘Find’ button. The complete function of house keeping is explained in the House keeping function section. Functions The numerous functions available in SDC enable one to better understand how a hotel operates on a day to day basis. From tracking guest folio, to viewing extra charges occurred during the guest’s stay, SDC provides the simplest of interfaces to carry out all the operations of a hotel in a very convenient and efficient manner. SDC also supports the flexibility of posting the charges from a restaurant to the guest’s room. Hence the operation capabilities of SDC expand into integrating different departmental functions of a hotel so that various tasks can be accomplished quicker. Let us look deeper into these different functionalities. 3.1 Front Office Funtions. 3.1.1 Guest Check In. Front Office is a place where the guests interact with the hotel formally for the first time, therefore it is very important for anyone working in the front office to be prepared with all the necessary details one might need during check in. On clicking the ‘Today’s Arrival’ button shown in the figure below, the user is able to view all the reservation details of all the guests or groups arriving today depending upon the selected reservation view. (FIT or Group) The procedure of checking in guests belonging to FIT or Group reservation is slightly different with one another. Let us go deeper into each of the following. 3.1.1.1 FIT Check In. As mentioned above, the list of reservations that are arriving today can be viewed by selecting the FIT reservation and clicking the Today’s Arrival button on the top. The reservation system searches for all the reservations that are arriving today and gives the result as shown below. The figure above shows two reservations that are currently scheduled to arrive today. By clicking on the individual listings we can view the details on the right side of the screen. We can see that for reservation 19, the assigned room number is shown as 0 and for reservation 20 the room number is shown as 602. This means that for the reservations having their room number as 0, individual room(s) will be selected at the time of check in and for the reservation with a room number other than 0, 602 in this case, a separate room is kept reserved. This is usually the case if the reservation is for a VIP guest. The above figure shows the details of the selected reservation whose arrival date is today. To check in guests, click the button ‘Check-In’ which is shown below. If the arrival date in the selected reservation matches with today’s',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n5\W<\v,@N\<\=߾\'=\"=j3\\<|<yY <U\\;*+4ƹ\r=]\	z=ܔh=s`tcp:<z:e&<Լ	&\0L(Ͻkj=@\=~=,6G<G3W\%<\'\<m<e\|\,F<wLe=c\ \\"|\;I=ʝ=sZW=\%k=\^<=\-=L܋Y\fZ\B;=4=\<Yd.:]>F=\"\=\\Zd )=|`i<\ʷf\\<3ح^my31=s\<Qc=K\γ=\'\0@;R\<c7:ûŨ=R\'=\\n\=W\\z$ɜa<Ë=j <\\\<-\<7Q=A;C..>\<\]\;4Ioc=;=.@\(!OP_O=-\\=lRy?=\\ȺF#=\Qt\<\阽M\\=\\	퀼[n<\ =2<0:=\Ԑ=]=tnZV)=\c\8\y`=Y\0Y<\W<\w=L<\H\,=\?6F=a\\<h=*d<x=\=d<JZ<\<G\:\<=$OV-=\{O\\Wa<M\,˽Gԙ<W`Y<.=I\Z<J<\\=ϼ\\\=ZNf\!&=?f;jP9r=7Qɽ{%e=\a;^\n\,=ؐ\p<:c\G;=g\WN\.rA<\"sMsO0\r=@`QUߪ\"@A\}\<E\<y)<em7qh=\}Il5=zQ{ꪭ=\Z\&==\\R<C^0\\9`i\\=y^9ݽ\\Dm\^M\Q<q0a=\j4D\0>\h=ڨf\\\!\"=\;剎<6<GOWp\Խ\y9M=\9===wxD=\b\\*=\0!=|\\0$b?=F@/\z<nŽ9\<gURuU\υ\4r\\>=OW<R\\:z\"=\0M=<\;<$\s=\\=FX\Z\Q=\\4\~g=p=\fO_KaE\r<\<v:^O\\\d;L\z\_<\;ﱼT\~\Ҽ#\BiLV\C;t@<LI\}?,= r_U=򿌼qhZ2\H<!<=ev\drO\B.!<7=\0\0;3\\r=\'+=\=:M\\ȽS=i=<|<Dkv.m.p=C׼v\ =%<e<ScĻ.=&QK=]6=$>9=l\\<\m;6_=ߞ\=3 =Å_=Q\=s\"\&\qӽ?\;	˼\S<\r<bs<+c\5&w=}fs<H|=,%$=ð=5\\\r=\Ze\i<',NULL),(3121,'4fb4ff17-d459-4223-a739-fed0bab0bd44',7,'is usually the case if the reservation is for a VIP guest. The above figure shows the details of the selected reservation whose arrival date is today. To check in guests, click the button ‘Check-In’ which is shown below. If the arrival date in the selected reservation matches with today’s date only then a check-in window is presented to the user. The figure below shows the window from where we can check in the guests. The figure above shows the terminal from where guests are checked into their rooms. As mentioned before if the room hasn’t been selected during the process of saving the reservation, then 0 appears as the selected room number and the system will ask the user to select a room first before entering any guest information. The system searches for available rooms based on the room type which was requested at the time of reservation and presents the options in the right hand corner of the screen. The figure above shows the interface from where a room is selected by just clicking the room number. (Note: Guest check-in is only possible after a room as has been assigned). When a room number is selected, a prompt is presented to make sure that the user intended to select that particular room. After pressing ‘Ok’, the selected room appears in Red as shown below. Now we are ready to enter guest information into the system so that the check in procedure can be completed and keys can be issued to the guest. The figure shown above is the terminal from where we enter all the guest information during the process of check-in. The entered information of the guest is saved by the system and it can be retrieved again in the future if the same guest decides to pay another visit. This type of guest tracking technology is found across all different PMS’s around the world and is one of the most helpful tool with which a hotel can understand more about its relationship with its guests. Let’s move in deeper into the details of the final stage of guest check in. Upon clicking the ‘Check-In’ button the above terminal is seen. The ‘Enter Guest Information’ box is already filled by the system since the guest information was already saved during the creation of the reservation. To save the information, just click ‘Add Guest’. The system only lets the user check in a specified number of guests, which was entered at the time of saving the reservation hence it keeps count of the number of guests entered. If the number of guests entered equals to the number of guests specified, a prompt is generated to let the user know that the guest assignment has been completed and that the FIT check in process is complete. 3.1.1.2 Group Check In. Group check in is quite similar to FIT check in with minor difference. Below is a screen shot of the group check in module which can be accessed by',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\j\=\<ȚibCI=)=L=T\=ݣy\\=Z\<T\<)6ɼ\E<\<=%ؼ|ӽI/=ME=\\<\dH<`	\@߼2<<1莽G=<6=)kMX\\=W=\S:=t=ޏ\H\AAǜ\ȺE$厽UY|\1;\=\r\0K\<\s֊=C<;V=r<\<\ƦU\=1e	usƼrмD\!\\nh\'\x<p\ag=~콫͞=\;#\\r\_o:\\DTP\.g+=0πp)!Q\'ʬ+\h;x\<\y=\\;P@\)&$=\U\yt4O=ę#=wR6=?a\=\\_\<\=\\=\:K.T=\<M6\\=\r\<$&:=JKV\r<\;\	>\;\a\!=yr=\=:Y<>4!=Kcw<=_Un\D\bq=ռ\	ʉ:\$kb	<\lv\<L-<s\r)t\;<N3\\\=u\R6r\\=Z<\>5\=\=8=h=Sļ_<&<=_%=o\j:T=:>Hǆ#%m\"\3F==x=\\R\'<\Z\|ņ7\\n<\\XV<	Wf\<\r=\\=\\\\j=`9c<bۃ\`\<\w+<eyƼq$\$=\\\ٗᄕ\"RX\"f7L=\̤\ғ<	\<Fw<\(\^ζ\\=k-NPq=]I\*<an<\b<yviMP\<W7-=\I\<\'2=%=?Aѥ=t\9\j\Nac^\]ma_*v\0=\=H~;\==-V=V;(\\Z=M\<\N#=z\uj̼\\U;9֎=b=t>\(8ػ\;=\W\=\!\y==\b\\=L,X<4\\ڌ<\ʓ\j=\=eC=e{;22\<\'ֻ/:Fm2<\=Z;_\0H|>G=V+dýM=\;w\˽\\8==Ϝ=Q$;?/%y.ʀS=Y\0/y<\Zz<=*PK^>6\\0{<\\\~5%b\\<\Z{\\f<O5\nFY9\EӼ﫼:VT\D⽬K\"A|/C\Z̼8\<\\E=\U%;\\ǻ<tP2\A<\\0<|v<4ߚ\=}b=tOy<#U\ZYB\e=tX_;4<T0=cT*ui=a|<BC<i`=V!=9;o\Z\A<\0=!\"\=O\Λ<\lڌn߼?d\<=\Ѽ=<S{VqG\8=\<\\ <b^>Tih=P\qA>\GE{\%;HV=h]',NULL),(3122,'4fb4ff17-d459-4223-a739-fed0bab0bd44',8,'know that the guest assignment has been completed and that the FIT check in process is complete. 3.1.1.2 Group Check In. Group check in is quite similar to FIT check in with minor difference. Below is a screen shot of the group check in module which can be accessed by clicking on ‘Group Reservations’ and selecting a group that is arriving today or simply by clicking the ‘Today’s Arrival’ button and clicking the ‘Check-In’ button. The first step in checking in a group is entering the individual guest information into the system and selecting a room for the guest to stay in. Group reservations are handled by the sales department of a hotel and therefore a list of rooms, their type and their rates are negotiated within a formal written contract between the travels agencies and the hotel. Each contract has a start date and a cut off date, total number of rooms, their respective types and their rates. The hotel sets aside specific rooms that fall under the categories requested in the contract known as ‘Blocks’ and only the rooms that belong to a certain block which are assigned to the guests during check in. Hence the system only allows the user to assign the rooms that fall under a particular block making it easy for the front office staff to handle the check in process. Upon selecting any room the box appears in red and at this point guest information is entered into the respective fields. If the guest is a group leader, ‘Assign as Group Leader’ should be checked and ‘Add Guest’ button should be clicked. Upon doing so a prompt is generated to make sure that the guest was intended to be appointed as group leader. After pressing ‘Ok’, the guest information is saved and the information of the next guest is to be entered after selecting a room. If more than one guest is to be entered into a room then the respective room number has to be selected from the drop down box presented below and entering the guest information, ‘Add Guest’ button has to be clicked. When total number of entered guests equals the total number of guests specified in the group, the system generates a prompt notifying the user that the guest check in process is complete and requests to check in the guests into their specific rooms. After the user clicks ‘Yes’ the check in process is complete. 3.1.2 Guest Check Out The figure above shows the status of different rooms and with that we see there are 4 rooms which are due to check- out. We can also see that of the 4 rooms 3 belong to a group and one belongs to FIT. There are numerous differences between the two types of check out procedures hence they are addressed as follows. 3.1.2.1 FIT Check Out The hotel personnel working at the front office should be well aware of the room that are due out therefore they stay prepared for',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n&=9=\hWi=\<ia<	=hյ== /=j$0NPB<\@*<ǿ\<:m\W@<o%<#<w!Q\Hzr\+<y<K0@\np\L\:%\0>Lm=\!k=\{/==$\FᩴHįߍa\=x\	=e\;\r;\<؃\\=\b=\\n=\fO=\nє<?=ĵ+PZ\<\5\<nE\kQ\\<d<\\\`\\\\;Y0 \<c;%H3<=\=\'=vZ\\\A<o\=`۽{N;ϼz\{)\ɻ`a%\0^\=L©\\\L<u\=Y}=B<=\nպ\Ǽⰲ=\ZB<9ى0=\\=!=\0\<=X=B)$l<#崃o\\0>!h<n<Ɋ\rc\<\>O;&\.=\=>==O=\R<R\A=h\3į;lS<\=	14&I)\0<OU=\Q#\\4n=\A<m=b|=\]=A>x<;\\<k\=I\;D<%&<8\ּlQ=\Z=\=r=-\an =k\'/+<^<G-s=s\ָ\;=[I%=\\'R+=\-0L\'X\Zw>;\7\=\\D(=\\<4\=]C	\<,\~\'	<5G`</A<ށ<QEf=\\<1O<UX\<&Q\\9\y8\=\r\ܖ5==8vI=Ar>#<n\<=\@`J\'LL<r<y&\s\\7=S\һע\Z}@v,Ҽ[=FO=h>\n\J<j<dS\0\Ǫ^\=\\ܼ?\\h\=\K\Z=)ǽ2\n:f=Bǝё,F\ =b\qx\<`\=YK;Fa=CNK_(G=\\C;a=FBR\H߼\/5=S\;vY\\ϽI=T\=@\;\>,n2x=Rݑ=\\\\xy\O0=<z=qq\z<RCo\NT<I^;KF=g4\(=Z̒=\.3i}x=\K=%ЂXfʀ<óEQ\=\h=>^\\0<\S\<\I<\ďy<\!\H\	\\5];lR<~j\9<\-<S\\\0<0X$^cT<tP\\zVyR/\A\ZF=J؆\i;r<UWL=K=5\<5	<\r\\<8=N*!\<y\0X<Kzq$T-<Y\\=.dM:uE=\<\Z\<\k=*&= \<\ <<<!&=9\cH\)=/\i=G\+=PӼC4\\⫻a]74\ҟUB+z].\<ft=m\\eN=H<\>b\ü.\oN=\',NULL),(3123,'4fb4ff17-d459-4223-a739-fed0bab0bd44',9,'one belongs to FIT. There are numerous differences between the two types of check out procedures hence they are addressed as follows. 3.1.2.1 FIT Check Out The hotel personnel working at the front office should be well aware of the room that are due out therefore they stay prepared for any guests who arrive at the desk to check out of the hotel. Upon confirming the room from the guest click on the particular room on the front office panel to access the detailed view of the reservation. Upon entering the detailed view click ‘Open’ in the financial information tab and click ‘Settlement’ to access the settlement window. Upon accessing the settlement window, the entire folio history will be available on the screen together with the charged rate, the total service charge and VAT shown in the figure below. On the right hand corner of the screen the reservation details can be seen such as the check in date and the check out date and most importantly the payment method highlighted in bold. If the payment method is cash then the ‘Cash’ should be selected in the ‘Payment Method’ box shown below. Since cash could be received in any currency that too should be documented by entering the right curreny in the next box together with the amount and press ‘Enter’. If the entered amount is less than the required amount then the system will generate a message prompting the user to enter more amount. If the amount entered is more than the required amount then the system will highlight the change that must be given back in NC. When all the monetary transactions are complete click the ‘Accept’ button. Upon clicking the button a prompt is generated to confirm the check out of the guest from the hotel. Upon clicking ‘Yes’ the FIT is checked out of the system. Then the house keeping department is notified about the departure by changing the room status to ‘Vacant – Dirty’. 3.1.2.2 Group Check Out The screen above shows 3 rooms that are checking out and that all the three rooms belong to the same group. The method to access the check out screen is the same as FIT (by clicking ‘Open’ and then ‘Settlement’) but the screen can only be accessed through the group leader’s room which is highlighted in white (room 402). Below is the screen shot of the settlement window for group check out. The rates that are charged is automatically picked by the system which was chosen at the time of reservation. On the top right hand corner we can see the list of extra charges that needs to be settled before the check out procedure can be taken forward. The extra charges if present, can be settled is a very easy manner. Since the charges are posted in individuals of the group, they are the ones responsible for paying their extra charges. Therefore each of the rooms need to be selected from the ‘Select Room’ box and',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n<>۩=\Z6ܽH׮\\<ƾ==|=\$=\>=\<Kİ=\(\\0=#W;n\\s7\66<u\=\\T`ݼkSٝ>=\\߮2<O=\\\)G\I=\\=x\<\\\$8	`\UD?A\0@H;g\\q=\)=\&;捘<x2=\r8\=@\<*5<\a#;\k=fܤ8=\nE=1\<NH\\V\O\r)$<dH\Zޫ<+<d\\\<S<\}!#k\mڽ>-;\ʼ\@<Q\\"\i**=\\<\J<\\н\<S=i)В\n=E5=M7F8ၽ\\\=DQ=*\\\Q\=\Zmm=\><\\=ֹ=!d;6\%=r\<*\\%s=Ӈ=؊=\h򡇽F=֠=D\3bG+= =3=\昼\=\\<m	`;aw&\<l=<\	m\ڼ\'ۂ\Qm\"\~q=T`\Q=C=.ʣ=ZVK;Y:)/|;9YpI=\4=׹<oK=\2<4\r\r=ۏ\<f$~=aw=&=Fj=h\\߼Oգ=\G\y<0<m\\< Ȁ<\2=+\ݼ\L@3*9<X\3=\\ıLPm=`2ռ[=\Ϋ=\50l\ȹk<J[v\<h!<\\=;\\	\6 [Ƚ߷d=NZ^C^=TRp=Is\=j=Z\v<w\<)\s<%q\\ؼɽn\^=\'\e\=SeJ0\=,\\"=\oku\n$=\\\n;̅=\\s\ٛ<6Lj%MQ=L^;̮V^=\H\<+\Ｏ6<\fkd:D:\<\n@<\U\Nc=\z<<\h$<1<J\P=`\=v\I\	=\\]Z?Vy=uȼѽ\O&=nC=X=ϣ:\"\<;\"k=[Ubv\w߻𼲊<\@/vA-<\b\"<e<R>~+=^\_t\)ռ\\\\<;j7=\n\e<B\;%f=/\<\\\\x۽K=\sK=\'<a=ｕ\b\\\}<~\\na\꼾Uј&ab\\b2C\K<U\<\|pNq;\o=$;=&۽x	uC=^3+\\;\\˽\'\?\<\\\<_=\$<\6\½\I\:\\s\nջbe\N$>9<V<F<\0\=b\:@6\<ۏ=\\<@\a=TS\=MS;ʽә`1P\<\\\0=ՉG[c{Zm֘̽K\\R#\X=\<ʻV&5\"\<\&==X=2ٻ\B=;',NULL),(3124,'4fb4ff17-d459-4223-a739-fed0bab0bd44',10,'taken forward. The extra charges if present, can be settled is a very easy manner. Since the charges are posted in individuals of the group, they are the ones responsible for paying their extra charges. Therefore each of the rooms need to be selected from the ‘Select Room’ box and their individual bills need to be settled. After entering the payment method and the amount press ‘Enter’ to save the information. If there is another room with an extra charge posted to it then it can also be selected from the ‘Select Room’ box following the same procedure of settlement explained above. When the required amount has been entered and also all the extra charges have been settled click ‘Settle Bill’. A prompt is generated to confirm the action. After clicking ‘Yes’ the bills are settled and now the check out procedure can be initiated. To go ahead with the check out procedure the billing instruction needs to be checked. If the billing instruction says ‘Bill to Travel Agent’ then ‘TA Voucher’ should be selected as the Payment Method. If ‘Payment at Check Out’ is the billing instruction then the amount, currency and mode (cash/credit card) needs to be entered. When the parameters entered are accepted by the system click ‘Check-Out Group’ button. Upon clicking ‘Yes’ at the prompt the group is successfully checked out of the system and out of the hotel. 3.2 Point of Sale Functions 3.2.1 Start a Table The figure above is a screen shot of the main screen of the POS. The numbers on each of the green buttons represent a table number and the color represents its present state. To start a table one must click on the respective table where the current state is vacant. Upon clicking any of the vacant tables a prompt is generated for the server/manager password. After entering the passwords the system asks for the total number of guests being served on that table. Upon entering the required information and pressing ‘Ok’, the ordering panel becomes available from where we can select the items that were ordered by the guest. After the ordering is complete the kitchen is to be notified hence the ‘Send’ button needs to be clicked for the order to be sent to the kitchen. Below is a screen shot of the ordering panel. When the ‘Send’ button is clicked, a printer placed in the kitchen prints the KOT’s together with all the information such as the table number, ordering server, order time and order details in that KOT. The table status also changes from vacant to occupied. 3.2.2 Add more items to an existing Table To add more items to an existing table just click on the respective table to open it. When the ordering screen is screen after entering the right server password, select the items being ordered just as before by clicking their names on the screen and when you’re done click ‘Send’ for the kitchen to be notified. 3.2.3 Settle a Table',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\\k<7\=\xz_<\0Q\\=\¼QQ=^(=\n|=) \Zz<\"rf =Ľ\2\.l=~JQ@l\\(t(#λ\$9;[H7<4\"+=\\=\Zd\<\o\\==\\\;\Gkkl\]<\'͌!\;\n\y\y=t[<\\\hp=ˊ0\}=\f=\8\$<Q\?=ӑI+;\=/Y:Q0꽼^L[<J,\0=E+\L=\5\:8\n=U<WPE1\<E>=<sȏ=9\=r\\Zp9\=t\\\<\,֫5	<`=t\\t\\;c\=\=);Ī=\n\9{lnDܖ=\0\:1F=o\<e@ټ^/D\=O\nNt\=\\;8=\$T>T Ld?=\Iz\=zK\<ؗc<=9q$F=s%=~\d*//=\"G=]\,=\˛	\o|\rlY=\C\n\d߼\\U=\\U\Z=\4OJٽ\5=\})\9R\r\C=C=3\;*˻p==N\=<\I<t\\<jX;=q<Q<x=ۯN\\=\\\<\d;q\W=<\r1\O.Ǽ\w\<(\7r/H=\x91Ȑ=\\=KPR<eԽd\~\\n\fý\\G3;0\^~\;\\eU:ONF\:qf\1\'A=E؅\)R=+>\h=\쨼Ȅz=^B+<M\n=yR5jb=ZZK@T:=;=)=:<c\ pT\\eW]\\@\=sWQ\<b=+Z^;Ө?`<0=\\\\!\=\=3<oF=\]\'=j\Z~=L׼\<;ǮZ==Eo4=\'輿;?\<C=/KH=y2<e@\\\Z=\'\r=\Y=Kýd=_~<\ZNc=\N\=!x=@ɼ\!\Oj=\\#;\zɽ#FлTJWEѕ\\E̼6g鼍\!\u<\?Cd	>a=Bͼ;;<mR\3P#=ڄ1:،=Y|;T\{\=\\C=B\y]}A=0\r6\\=\f=3˫C\ͼ]Ƽ)<\\=Br\;!\:\nj<-=[ⒽBϻ\Ծ=\(]*\I%\\C\0==\׽ \=[\E;\<<\ZM<㠽G\y]<\L5()3_!<P\	<\+K\}\<\nv<^e0\=Ud<]\`	Y3=K:]\\}OA&=\F<)>=n\<=[¢+\Kg5<zzѽiP\K%\ѻ\]=\1f=P3Q-\<\&<o==\"<Ml\;̫\0<\\',NULL),(3125,'4fb4ff17-d459-4223-a739-fed0bab0bd44',11,'on the respective table to open it. When the ordering screen is screen after entering the right server password, select the items being ordered just as before by clicking their names on the screen and when you’re done click ‘Send’ for the kitchen to be notified. 3.2.3 Settle a Table Open the table which needs to be settled and click ‘Settlement’. Below is the screen shot of the settlement window. A guest may desire to settle a bill in numerous ways such as cash, credit card or post it to the room. After selecting the appropriate payment mode, the amount is to be entered using the keyboard or the key pad provided in the panel. When the correct amount is entered the ‘Amount Tended’ button is to be clicked which will calculate the change that needs to be handed to the customer. To end the table click ‘Accept’. When the ‘Accept’ button is clicked the system makes sure that the entered amount has covered the amount due and only then closes the table and saves all the necessary data for accounting purposes or for any other future reference. 3.2.4 Split a bill Splitting a bill is one of the most important features in a POS that is used for a variety of functions making its application quite handy at times. A bill can be spliced for a minimum of 2 ways and a maximum of the number of items in the bill. For example an order that contains 5 items can only be split 5 ways. To split any order, open the table and click ‘Split’ after which the figure above can be seen. Then click on the individual item that needs to be spliced. When selected, the item appears on the left hand side of the screen. If ‘Split’ button is clicked at this point then the system will split the bill two ways with the selected ‘Red label 30’ appearing as Check 2. Below is a screen shot of splitting the bill in the manner mentioned above. When the bill has been spliced as per the need, ‘Done’ button needs to be clicked which closes the split window and takes us back to the ordering screen but now with an option of selecting which check/bill we want to view shown in figure below on the right. By selecting either Check 1 or Check 2 we can settle them individually as if they were separate tables. The un-splitting of the bill can also be performed at any time by clicking on the ‘Un-Split’ button presented above in the figure on the left. 3.2.5 Add modifications How the food is ordered by the guest might not always be the same even if the same entrée is ordered as different people prefer different way of enjoying their meals and as a hotel/restaurant guests have every right to demand things the way they prefer. Adding modifications as such means informing the kitchen regarding any special requests made by the guest so that',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\\x[=\"rtѼ\\Ľ/M<=p\;HMq=\\={\<!x^uj\"\<m=\\\)\u: =N\<\;$ߔ6=\\<U\n`<N\]:G8=\=\m)$\gSܻ۶߼9\0ۛ<s\/\K<(i\0=?\;&==4:u0=\r*<\´\=\?8f)=\\>:<\d*F\41]=\"\\:p,=Ђ\;]<\䎼:x-=\rN: >oqǽ鐼-QS<&\"<\?<\v4<a=\L;	e\n?h\wi=\?h*\=\n\=	\"=j=a89\;k\\=^=3=O=|<=\ʼ=\^@=wy!_f=\	ݍgX\<6=\-{ע&~=\~ȼ\;\\\=ahH<+Kx=kА;\=g,\<\'!Q*뮽5<`]M\=Pl<x?=7A7\t=]<=ZM@=\q;BK⑽\˻H=?\V=[$P\r>7I=\\=,$=])}<=s<q=X&\C9<\ټ3\<kq\"\U=ĭmʍ\':缇w<<tҽ\K=\[F73s=\6=p=\ra\\\0<\1X}嵽\l?<kvRo󦽲J\rߋ<\#=9\n84=#Rͼ#=\0J\˽ī===\ⒼA\nҼ\n=V	Ua=.\<.h\<!g\2=cl;H=\Z\,<\Z<HC<>7=Q\;љ\n>c\"yDm=1~b\ļ\g<=\\\$mF=8\=)\½i=K\"#@n0˻\/9=\=\nZ<>XK=5<~=*/;kn<\\P\sK\0\=ռu\dZ=\nE=	hUR=j=\v-\=yd<\l9h=:H;i|f;\Oȼ\e/<O;:>{<\\u\n?\=-=x\<\]LYe轉2=\\=\=Y;%<v	=mH6\\<0\n<t뽠=I	>ռ_>i<iX|_^ý\ƼnML=\<7QYtM=PK&\=8.Ű6\Hq<[޽Xl<5=TUT=ryQdjĪE㚽\\ټ\H\<Le\<Zgڼ\=[CjP9;\n=6\2=\\\=b^\\+<\\'\<NE\k;=\;ӭ߼4s\<,=&+P<5H><3@\3<Id=`u<\\\y<m/ϻ\=\Z\r=_=\5=h\g؜H\?L\\<\Z^\;\@^\\ؼq\<\e=\=z=\\\\s\=;\P=\\\w=<\;Zz<\<)\0+T\\',NULL),(3126,'4fb4ff17-d459-4223-a739-fed0bab0bd44',12,'even if the same entrée is ordered as different people prefer different way of enjoying their meals and as a hotel/restaurant guests have every right to demand things the way they prefer. Adding modifications as such means informing the kitchen regarding any special requests made by the guest so that there are no complications later when the food is delivered to the guest. To access the modification screen the ‘Modification’ button needs to be clicked and the modification can be entered only after the menu item has been selected. Below is a screen shot of the modification window. Any modification can be sent to the kitchen by typing in the requirements either by keyboard or from the screen itself. When the modification is typed, click ‘Done’. This will take us now to the ordering screen where the modification appears in the box presented below. Upon clicking the ‘Send’ button the new order will be sent to the kitchen with the specified instruction. 3.2.6 Void Items Items need to be voided at times for numerous reasons such as for a mistake that the server committed while ordering the wrong item or at other times the guest didn’t necessarily like the food hence he/she decides to change their mind and order some thing else. Therefore to address these issues and many more the system provides for a way to void items. However voiding items as such is not a very good practice as it might create problems with the tax officials during auditing if done frequently. Therefore it is encouraged that the users be alert and calm while entering the order and double check it before sending it over to the kitchen. To void any item select the item from the ordering screen and click ‘Void’. Voiding credentials are only provided to the manager hence a manager password is required to enter the voiding screen. When the correct manager password is entered, the screen below will be seen. Before voiding any item a reason has to be selected. This information will later show up in the managers report so that a close eye can be kept regarding the use of this option. When the reason is selected, ‘Void’ button needs to be clicked which voids the selected item and takes us back to the ordering screen with the revised order list. 3.2.7 Room Post Room Post pertains to posting the restaurant bill into the guest folio so that the guest can pay all the bills at the time of check out. A guest may also be entitled to a meal as per the meal plan purchased hence the server/managers need to be aware of how the bill is to be settled. To complete a Room Post click on ‘Settlement’ and in the settlement window click ‘Room Post’. Below is the screen shot of the room post window. Before posting anything to the room the server/manager should ask the guest his/her room number. The room number is to be cross referenced by entering',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\rL\<p\=Pe<;U=\\_\<E<\I^$\<h-=\4\<\\\\Wׅݫ<@kE\=!;\`Z\K୘<V֨;g\\<\ MlL(4\;=+O<><=}\<\\< c.Z^H-as+w\<8*.$Yȵ\}jWiwK_-\\Ry\ \cҼ=a\q<\\RMQ#k_=|{=\n3;,8:>(8]=~<1ݻq<\=6<\\.=\MWTPfS<9\RBZ\CR<_*\|p=7VK໭Ol<eN\yȠ\</]|=\C=\\\<F*p:[jn?K=]6<]\\}&5+p</=<g\L=o<+=ꉘ=\/(|=P\輑׻\k1\=<w\ݽ\\\\Z#\}=v\n<=P`=D/\=\x\Q\=!\n9sO\jd8=ޒ<\;>h -KH콻	YC5=f\A=\4\63=	bO<f=v\=Ur(=\<ż@!q9\\1</_<+s@=\ք\=l;\qV\r=\"z_ K<<\5>\"U</&B<s̶\'pH\Zj=\Ζ`K=<=\J:A<\\l<c=&\g=\W8=!\g8;	O\\<\:\0=$[=~m=¼\9zwn<n\<\?+<z\\Y=v\;X<\E=Ȕ6;h	\eǼ\\<@x\\'\\<\9;\Z;=\\\#\'\v˼/=k=8<M:\;ޑ;2Rj=cTm=@=*\3ϋR+\Lr<\(=gB&ǽy\\<f#\h\ф<\4<ࡽ@wD\=M7\<M\0v^b;4\=\{=t\'Z\\;CM=_\=\x;:oѽT\¡Gh\Z%`==\'B\<%=F[>H=S\<\J̻=S\= <\0ʼ\衽Ǵ<_T=!&Ċ<[\96%p(=Db=V>IWGfX:\;Q=-=M\;`!~*4տ=\\;\_~\\Z=j:\\\=!w`\=v\\\<\0k=\<\<\"x\\U-3\?=ҍ==\ =&.\\<\w=IW=_w<Q+\=J=L|[Ic>5\:i4FJdL=/={O;a\,F<3\I,ʼK1[<-\<\r4;v=F_<(\=UBRJt\I~<7<]\=\e=1\r_\	=s3>\,\g)\rs[<,<\zM>hGҽa\=DuZ%<SMFP^\Ⱥ.Pw\;\l{=5<៌a<?\=\)A<PC>\	=_<\\\=\䠼F8\"',NULL),(3127,'4fb4ff17-d459-4223-a739-fed0bab0bd44',13,'complete a Room Post click on ‘Settlement’ and in the settlement window click ‘Room Post’. Below is the screen shot of the room post window. Before posting anything to the room the server/manager should ask the guest his/her room number. The room number is to be cross referenced by entering it in the respective box and pressing the enter key in the keyboard. The figure above shows the information of the guest staying in the room 605 with their respective arrival and departure dates, meal plans and the total amount due. As mentioned before there are two ways to settle the bill. One is to post the bill as a charge so that the bill maybe settled during check out or it can be posted as a meal plan so that the guest is not charged. If ‘Post as Charge’ button is click then the bill will be charged to the guest folio but if the ‘Post as Meal Plan’ button is clicked then bill will be settled as a meal plan. However across different parts of the world including Nepal, alcoholic and other certain beverages are not covered under the meal plan. Hence in that case only the items applicable will be charged as meal plan and a separate bill is created for the other items which cannot be covered by the meal plan. But this new bill can be charged to the room as a charge. 3.3 House Keeping Fuctions The house keeping department of the hotel is constantly made aware of its rooms and its status by the house keeping module of the SDC which provides all the information in real time. During the busy season of a hotel the house keeping department is at its busiest therefore they clean the rooms from floor to floor and during slow seasons the rooms are cleaned as necessary. SDC also provides this similar functionality where the status of rooms can be changed individually or by the floor. Some of the basic functions of house keeping module is explained below. 3.3.1 Change Status Individually. To change the status of any room individually just click on the particular room from the screen shown above. For example we are selecting a room with room number 604 who’s current state is Vacant and Dirty. A room which is Vacant and Dirty can only be made Vacant or Out-of-Order, therefore these are the only two options available. To change the room to a vacant state, just select the option ‘Vacant’ and click on Change Status. 3.3.2 Change Status Floor Wise. To change the status floor wise click ‘Change Status’ button presented below. Upon click it, the above screen is seen. The house keeping provides a way to search the room according to their state and floor. The two screen shots below show where those options are available on the screen. By selecting a particular floor and a particular room state we can search for all the rooms that satisfies our criteria. In the figure',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n<\=r+Y^<\\ټ%=:\.<==y<+Խ\\<\==ELdʼ\$=\\0\<^v=q<Ӏ=%}\'>=jʺ\\`p=\N=P=ˇ9<\\0;\\R\=j^ƣ	̳;\Ǽ\r;\*\|<O=tb?z=k4=:\\;ұ:=\8%m\20=*]sv\09<SM,C\/%uM>\<K<ܞN=TLYcD~g<:<2\=~?<\\0H\<\\;\><\B=s\"\hJ^v];9~ws\'7=2\;j\@SU=d\=]\<p=2X=\%/T\b=\H= >=a=\\r%t;\9=a\n\=!p=_5=E2\\b\F4$=\[*<\{<Z?=]h>d\\P=\<\\^댽\b)y7#=	#)B\q\=ϾjMќ\<鹚=3<A\=+\u=%h~\B[=&<&s>(:H?{6\=\j=\\qh)=	=\9=c=^\Z7\\<?U<JI=ԕ<\\%\=\̻U\I5\<A\<\U\\<\䶽k\=\\\<,K߰<l=\:\<Zҽ7\'\ڽ\r%qFn\6=\|l\I\\\b<^q\\\<\W%=aO17\5~^idt=C\bǯ/=+;=\"a9=))5v=c\¼u;{<k=\jۼa2V.\a<6=\n<Zs<\7\;Ȣ;=:<tǼYݼ^<p\\\>7\0V\к|܌;7\Z=0\(6W=<6_\}^=\ZZ\ة<7\<>=Ђ=\n<W=7=C}#P<\_ai<rV=:c:=\\~4\:=V:װԽb<\\^\\<\\<\i\G=w\=\\)\\Ƽ	z=C&<ͬ콽z\K\Z;><	\:T\Om.G\d=l\g=y:=-F8z=;5=l<D\<=s==^y;Ko=<|ŝ=E\\<[O=A;$C,X4eQǼ;%M4\G=J	:;u<͞B\;TD9d7vPl:4\\|G<\"k</x\I<\\r\}\m2=sW<;Pb=9p˼\\rcǰ=\0=cdlbS\?Mr<u=@Xf:<\>8ҟ=AɇWt=rߐ\a3=XxGK<.J%}N=jU=\^Zy2|ڻ	E=c#1\k\SuAعS\\N+\Ի(\X=\\j=>w9(\q\=n\'h=ŉ<\\=;	(V*s',NULL),(3128,'4fb4ff17-d459-4223-a739-fed0bab0bd44',14,'a way to search the room according to their state and floor. The two screen shots below show where those options are available on the screen. By selecting a particular floor and a particular room state we can search for all the rooms that satisfies our criteria. In the figure below, we have selected all the rooms in the 6th floor that are currently Vacant and Dirty. The result of our search is seen on the box which is pointed by the arrow . We can individually select the desired rooms by checking them off or if we wish to select all of the rooms at once then ‘Select All’ has to be checked. Now the selected rooms can be either made vacant, out of order or occupied-dirty which is presented on the left top corner of the screen shot presented above. To change the status click ‘Change Status’. A prompt is generated asking if the user is sure of the operation. When clicked ‘Yes’ the status of the rooms get changed. 3.3.3 Maintenance. The maintenance function provided with SDC is not a separate module but just a functionality which enhances the capabilities of the house keeping department. When the house keeping department notices something not working in a room such as the mini bar or the television, they notify the maintenance department regarding the nature of the defect filling out a form which is presented in the above figure under ‘Send Response Request’. After receiving the task the maintenance department on the other hand mobilizes its crews to take the right course of action based upon the information that was passed from the house keeping. Upon completion of the task in hand the maintenance notifies the house keeping and only then the house keeping change the status of the room to its respective state. Below is a screen shot of the form from where the maintenance is notified. After filling out the appropriate fields shown above the task is sent to maintenance by clicking ‘Dispatch to Maintenance’. When maintenance sees the task and completes it as requested, they resolve the task by clicking ‘Set Resolved Time’ which marks the task as Resolved. Below is a screen shot of the Maintenance which can be accessed by clicking ‘View History’ in the figure above.',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \nn;\0ټ\\<\?r=/`=Ln;e[=ce9<t!<\4=\\\<>\y᥼\=\\\}sZ.#(7F=b\J<S\r8r=*/\\<\vT<\\RO<\'==M\w=\\=6~kxVq<\=\\\	@<\H:(YO@\\<\\٨=\=+t\\"<\r=\\=%Q\=v\V=6`=X=&H3$%gG=SN]4\2<\$:i=t]@<_6\\d=wfiXr=K{=\c=	\d=1J˼Ǉ;\6C=Sֽ\).эJ\ =ꊼ\\\<\Lf&\h=\0_Z<0=_2`\;AH6+6?\<sƃ<\<5;6<L\?\7=b<t\<<w\)M7ͽ\v<D=P\19\\\'<M\=);~ؼ\zü:=ܓ,V\\\'\' =\0!(<\=d	 Nz=K,;/\=Ꮌ\`;%0;ƥ=c\x<m\<*=\Aq =j<;Z=5i=7=.<\=:\ixy=X=+\=q+\<\A	\<QD\WV=\--S,=\#\<[=]=g2ͼY6pPV^<%i=ŧ0</\!z=i2g\pG=4cH=d\'=*2̝<h<庻Ov!H\՛<\\&=*!!\\\\\<wO<7\P\<\nS\Pu=>4\gt^(\\=\\<μ\\qRKo<1+6ij3/Sl_+==\#ev;\r\<~Gv7=77ϼ\N=\|<۲=v_F;J.=c\\=G)-y\)C\\\M\=\X<<nP2Nv\>=),F\=\\\p=ht޽\v<ⓗ\"=@<\\\=Tx<DIA!T\\-\\=:\nf=b~<9/YUq=)=^v\F=X:@ŏަ>PU<ӨJ=Pq=ך.RZ;>7<>\'\\\c<l\=Z<[\\<\Ļ;F=.8aM<1[=ǧ<^=y\\nBg<ʒ2\:\<zH<Tgf;Z\S<%н;\7_\\\\\0<\|+֔=\[=M\)	3S\<ftE\n\t7o\R$R\b\\=`\\%\Z=\=F\= T<k\<\\Z<\2Za=:{;l\uC\_\"5<3J=L?a\><=A=7BQe\\F\-=3\=\\&=Q=fO=\b~\5=_1=\ْa.=!?=\1\	Ǽ+<l;jt?\"U=ĕ\\@<	y`ܒ]-L=\q\;\=ǳ1=\<\c<\=\1\<',NULL),(3129,'0b8a7f62-04e4-4f6a-b79f-1004f7564f19',0,'Teaching Manual For SilverLine Dot Connector Version: S.10111 By SilverLine System Integrators Pvt. Ltd. Tables of Content. Introduction to SilverLine Dot Connector. Modules. Main Screen. Front Office. Point of Sale (POS). House Keeping. Maintenance. Functions. 3.1 Front Office Functions. 3.1.1 Check In 3.1.1.1 FIT Check In 3.1.1.2 Group Check In 3.1.2 Check Out 3.1.2.1 FIT Check Out 3.1.2.2 Group Check Out 3.1.3 Start Reservation 3.1.3.1 FIT Reservation 3.1.3.2 Group Reservation 3.2 Point of Sale Functions. 3.2.1 Start a Table 3.2.2 Add more item to an existing table 3.2.3 Settle a Table 3.2.4 Split a bill 3.2.5 Add Modifications 3.2.6 Void Items 3.2.8 Room Post 3.3 House Keeping Functions. Reports. Introduction to SilverLine Dot Connector. SilverLine Dot Connector (SDC) is a Property Management System (PMS) which is built for the purpose of managing different departmental operations of a hotel making it convenient to keep track of its day to day activities. With the arrival of computers into the scene, the old ways of maintaining logs of everything manually is long gone. In today’s competitive market its everyone’s aim to stay ahead of the game and one way of doing that is my having a system that helps you do just that. SDC is a system built towards addressing that need of a hotel where all the information needed to run a hotel efficiently is easily accessible with just a few clicks! More than that it integrates the functionality of all different departments of a hotel such as accounting, inventory, housekeeping etc reducing the time, energy and effort into managing all of them from one single point. SDC is one of the most efficient and easy to use PMS in the market. Build with the latest technology in software engineering, SDC provides a very efficient and user friendly operations making it very convenient for hotel staff to meet with the requirements of its daily operation. Some of its key features are as follows: SDC is a state of the art system that is capable of handling reservations for a hotel of any size. It is intelligent enough to interconnect different departments of a hotel, keeping them all informed about their duties and tasks in hand. The front office module gives an over view of the different states of different rooms (such as vacant-dirty or out-of-order), and these states are denoted by different color indexes helping the staff know everything they want with just a click. The reservation module is a full proof and fully tested part of the software that handles different information about the incoming guests such as their likes, and dislikes, room preferences and meal-plan, flight information. The guest history tracking system in the software makes reservations for repeated guests very simple and effective. The house keeping module also provides a visual over view for different rooms to be cleaned. The system provides a mechanism to clear the status of different rooms floor by floor or room by room as the situation demands. A maintenance module constantly keeps the maintenance',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n> :\4=y\;%\\<GK\<=ɖ;<2=trj=<jz=\<8)|=^\?<bBW<;\\=\;\-实= \rd=\\"<\Zf\<)\\uy=~6H:\r<.6=*z=.\\U=q\=\\>\0\h\(FP2&=\<̏XRb=\\<pe=Ůљ=\<J=z=\&\E\\;\c\?fo\<9Ҽ\i4\=WQB=ȋ12DGt-~=$=Ix=\\0<s=#ŽǓ\ >3^μF\r;\\9	i=\B=<oQ;\Z\MO=\j=[\L&;\MEg\Z\T9=:A<L=Fi=?\]a)f\\o\)B\:NF<:\#Tj\\	m\h5h\Q\S.t	=L).<=qS=3\0<C\;\+\<L=i	GZ\Tb9YGN=RL\<=\ϋ=;\"K=!tdL~\㬻y\;C\Ρ=|s=W6\:u\ѼS\2\Q=[ɼ~p=#L<xn=n=\/={<u=2=l\"ۼ0\\`=\x\r=0\?#\0Ϣ	US\Y.\]ӻ>#=)d\$=A =\=@ȉ\0A=DI\D<;;\<\\	{$$RkKؼ/_\Ol\1(3<J0x<KNL=$uG\=R\rd+ku;)*\<\'N<]:a&Gҍ<7=\\=RVO\<\r\\\;ː<\\N5UW=\뽱\"\n\}<t⡼C?7\_>\Z\<2_8=\\n=Av\>/8VVX<\p<[n\=\(=	\6/\\;=,>;O\r<\>a\"\L\0\<\=!;mx=2_\<q\7<_\"+ۋ6\z\oQ\ {@=)<+Tә%\;V^t=\=g~\;{=\=O%P=ʣ2qKy=\1>e=\j\n/^><C1 W\Ż\\k=\żpYH=\z=ȩ`rvr6\\\0=v=\=\=7	Q4=\\p3&H<SCN<\"H켃8\~\Z=\F~^=\`ӼȄ\G\"=\q\<䟯=\<\n\L<\I=\?9\=\L`=\_K\=\QƖו\ri$<<W\E\Z>=\J.Ҽ=HE\r<ߺ8=~]7=\\8\#)Y=\;b=\q\<s\=l.J;\\;f=p\吽\'\=\*=\<Ǎ==\=팻\0v=\aB<]=+\==\"h>ŁEn\:*>\Z;7\=θ5=xD%vz?C8(\0\:<\=`;<,4=&+t=',NULL),(3130,'0b8a7f62-04e4-4f6a-b79f-1004f7564f19',1,'very simple and effective. The house keeping module also provides a visual over view for different rooms to be cleaned. The system provides a mechanism to clear the status of different rooms floor by floor or room by room as the situation demands. A maintenance module constantly keeps the maintenance department at its toes with its constant reminder of the things that need to be addressed. Housekeeping department notifies the maintenance department instantly about any breakages or failures noticed during a cleaning procedure there by reducing the reaction time. A state of the art POS system is also a part of this software that takes care of all the restaurant management needs. The POS provides a visual overview of the entire restaurant with its exact floor plan and table numbering to help the manager and the servers know the status of different tables. Different color codes are used to signify different status of tables, such as Vacant or Occupied, which helps to know which tables are available for the guests walking in. The POS is best utilized with a touch screen monitor as the ordering process will be faster. Each menu item is listed under its own course list, helping servers or managers to know where to look for any particular menu item as needed. After the ordering is complete the order is sent with a push of a button. Upon doing so, all the bar items get printed in the bar and the kitchen items get printed in the kitchen reducing the need of having to send someone to the kitchen or the bar to inform the respective stations. Once the order is sent, it cannot be voided unless approved by the manager. Any alterations or special requests from the guests regarding any items ordered are entered into the system at the time of ordering which is printed at the respective terminals along with the items ordered so that the respective terminals are informed about such modifications. A bill splitting feature allows the bill to be split as requested by the customer which can be printed accordingly. A bill printing system is also a part of the software that prints the bills as necessary. Room posting for different guests according to their meal plan is also incorporated into the system. Reporting includes daily arrival, departure and stay-over reports. The end of the day report is also available with the exact cash count of both the local and foreign currencies. Any further reporting options preferred can also be incorporated upon request. These are just some of the general features of the PMS. Let us now go deeper into its individual module operations. Modules Just like any other PMS in the market, SDC covers all the basic modules required to run a successful hotel business. 70% of the revenue generated by a hotel comes from the guests that come to stay in the hotel, therefore a system as such requires every attention to details as far as guests are concerned. SDC',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\\ZE<\$Gv+Q \1\=eU;\U=np\n+8==%-=	툼J?[7W=\"\<\_*5);HI¼\9\vC=<\d< \t<t\Ľ5}e<׺j\=<U<\\T<1s=\n}L(j$w##\\\'x\<\\=֫eGG(xFA\\F\H=\"N=}M=T=L=\͊ZʌK=$]\P<+%\r=1<<9\0=eS\\:C\<Λ=\"nGu\<N\\\\2<ks^;\>\n\3<.G<l3`d\ZQGҘ\k=wH_;v9=*`\><\0}<\=Z	<Z\<\\!=Ti<\Ɏ<\\\!<\\<Z.=鐜n\<=?\\d\r*ls\< <\Z=/;rB=\IĻJ8;bpH=KG===\}9	5LC\lhG\\<q/;\=<N59\{\g>\v=R\Z=	\=\z<`O=	\Z\nD=\=\\n\r;\\(<;<vO<>\<wA<\>|=9<o=R\oj;2\=-=Ud<\\нnJ\n\'ӂ!mk9\fdTm\rd=\\<0sq{=Т7=\<Yuj\Z_\\<dzJͼ׏=getA=-<.;yg<z8<k2[=\noD\<w;1=g\|=Us\0=fz;\#\VG}\s#ڼ\\=2j\:%5\0\\<-GC</l=Go\'U=I \<<̼9=K\\n\\0=i\0l\Cg\ԶϽEW<D,\Z\\<5ɽtL=fqs<|!=\y\T[ýQ=\\}[\=/JJ1<\\\A-L=](ú\:^5D+\c⾻?f:<\\}=:=gW=\'==Ⓖ-><R$\I=)D\ؽ\*;By{\G\YT	<+k,=\'Aru(<\8\\m8=@\5ʙ:=\U\=	Ui?=Ē޼+ =$~\޼\#\<0!$=\G9(.\ZH;~$;LD,\=¼=Q==ǁ1=g\ȟ=\\&<kFVU\aC2=\lFL<Ppܽ|3F<5=W=5=;=\:\܍=g\Z|=Փ=_\W@=:E;+ﺦ<=)2=fDzt<:\'=Y\<=1s\=߭<\\<sqx<uP=\\"<t/P{5=\\\<\\}{۽&L\r=d,=a\\<\e`S\S=_T\K\w=,#\>K\>\<\\'<\\'=\\\"~',NULL),(3131,'0b8a7f62-04e4-4f6a-b79f-1004f7564f19',2,'market, SDC covers all the basic modules required to run a successful hotel business. 70% of the revenue generated by a hotel comes from the guests that come to stay in the hotel, therefore a system as such requires every attention to details as far as guests are concerned. SDC provides a state of the art front office reservation system that allows to know everything about a guest including any preferences in regards to dinning, lodging or any special requests that guests might have. Main Screen (fig 2.1) Apart from that house keeping also plays an important part in serving the guests as per their need. Restaurants are another place where the guests need to be served in a very professional manner. All of these operations are carried out by SDC which help the hotel staff to address the needed of the guest in a very professional and timely manner. Lets look at the operations of each of these modules. The above is a screen shot of SDC main screen. This is the main entry point of the system. On a first glace it gives all the statistics of the hotel that is relevant to the day. Values such as occupancy percentage and rooms to sell are very closely watched throughout the day as that determines the total revenue generated at the end of the day and also gives an idea of how many more guests can a hotel accommodate if new guests arrive as walk ins. Clicking in one of these parameters will give use more details pertaining to the parameters, such as if we double click “Total VIP’s” then a list of all the VIP’s with their room numbers will be seen on the screen. Shown below are 5 buttons which are the entry point to each of the mentioned modules. They are as follows: Front Office: By clicking in the above button in the SDC main screen, the front office of a hotel is seen. Front office module covers all the reservations together with the status of all the different rooms of a hotel. Settlement and viewing guest folio is also done from this module. Point of sale (POS): By clicking in the above button in the SDC, the POS can be accessed. POS is a module that serves as a restaurant management system for the hotels. Each restaurant of a hotel has its own terminal or POS from where it is accessed and used. House Keeping : By clicking on the above button, the House Keeping module can be accessed. House keeping module provides the house keeping department with the status of different rooms where by they know which rooms have to be cleaned or cleared. Accounting : By clicking on the above button, accounting module is viewed. Inventory Management : By clicking on the above button, Inventory Management module is accessed. Apart from accessing many different modules, SDC main screen also gives an over view of different time zones of different parts of the world,',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\<\\ἰ\rq<#80u=Wy=Ẻ7ʔ=\\\;IS.S<]<WDp(b=fQŽ=r7|oN=\I\B\ Ѻyo<\\\*<+\;{±< &{B=/˖=\Z!>3\<\'-=qλ\`ؽz`<}<Zi<Լ?\AλzaJKݡ=Ȕ\ޟ=Z=bs=0=o\=	\b̓\<fd=!s\<v<\[<\Z<야ns\:5\<W.<fs\pļ<\ZJ֐8\=20z\<:!=\'jMI\<>\{mdb=yx\\r<|=㶙<)E0=\\=\Ž\'&\y=ώ<\\_=T=q=\\Z\g\a>DI=S\Ż9X5a\˽	a=);\ļȖ\{]=l\\=\0ܼs<Õ\Z\\<\Zc(ҏ:H{H=̾\	f\ýļ&oM\y<\\<\C\n/5=jA<0먼&l\<E\<U\s=ޣ<\<\m=g\\0=\,\\<\\\<@\=: <\`P=ڃ<(\<K=j<<>p=!<<v\Z=g=^\\<yt=Ħ\ƻ;\Sv\\\<gJE=\۽	=Z\\X\<aH\=\	\Z\0\\=(gpf[;씽<`Q׽@\\G\<q~}\\n\jK#[<8i:\$xԻR=(k\\ro< <\<H\0<v\\\f\"%:\=]	#=|ݓ< \H`}b=ʉ\'_D\<\\\<.1=:7#<\\\`	&<3\Zik\=_\n\'쫅\\\<f?\ܺ樽\D\=U;ZCڂ=\"\;\=\˼\'𼆶\'\==Y[=\\ΏeU|\q:d==\Z=\\<L<nT=\=x\lFcVB=\n;>*>1Br\<\xX#6(7i~\m<Ê\w|<\=m=&\*=Ҩ<f\=\+\\v;\=\`3O{=}\,q 0wWJ\<\Jҽ\\Z\Ɗ;\L=\p\#\?ezμ \H\ޖtE<\Ha\"<\nOͽ<l\\Z=\Κ\⇳RnF\A0<\<8X0\\'g<X!=\J<\\Z=~*r=\j<\^]A;#Eǻ\W>x|B<\<B:IZ#=P5\6\<cl25%=L7;ǟ;\=+=\9=$>\=32<y><ݼD=\z/=ڐ<*+\<\Z=\D~<\n<\LB<7[k=\<<T\\׃=n)\=\=8Z!\k=\\<\6\=\"/o\\<',NULL),(3132,'0b8a7f62-04e4-4f6a-b79f-1004f7564f19',3,'Accounting : By clicking on the above button, accounting module is viewed. Inventory Management : By clicking on the above button, Inventory Management module is accessed. Apart from accessing many different modules, SDC main screen also gives an over view of different time zones of different parts of the world, and also a small calendar which is helpful in many different areas. Now let us go deeper into each of the modules of SDC. 2.2 Front Office. 2.2.1 Overview : The screen shot seen above is from the front office screen. Individual rectangles denote individual rooms of a hotel with their current status being represented by the color of these rectangles. For example, rooms 701 and 702 are out of order therefore they appear in a grey color, and the legend present in the right hand corner represents exactly just that. On the upper right hand corner there are 5 buttons. They are: 2.2.2 Refresh Button: Refreshes the display screen and updates the current house status. 2.2.3 Find Button: Upon entering guest room number in the highlighted textbox the user can press the Find button or press ‘Enter’ to view the room details. 2.2.4 Rates Button: Pressing the Rates Button will display the different rates offered in the hotel . Rates such as CP, MAP, BB can be seen with their individual breakdown of their room rates and meal plan rates. 2.2.5 View Report Button: Clicking on the View Report button, different reports can be seen. Details of different reports are covered in further sections. 2.2.6 Drop Down Menu Functions: Fig 2.2 Buttons Fig 2.3 Room State Fig 2.4 Room Type There are three Drop Down menus present in the front office screens which are highlighted above. The first one gives you the list of different room types present in the hotel such as Single, Double, Suite etc. The second one contains different room states as such Vacant, Out-of-order, Occupied etc. Selecting (Fig 2.5) different combinations of room states and room types and pressing the Find button or enter, the user can view the desired room having the selected states and types. For example in figure 2.2 and 2.3 user wishes to view all the single rooms in a hotel that are vacant. (Fig 2.5) Given below is a screen shot of the result where different room number and their corresponding states are seen. Fig (2.6) 2.2.7 View Room Button: In the above figure if one clicked room number 605 which is highlighted with the blue shade (indicating that the room is occupied), one would also be able to view the details of the room. The Figure is given below. 2.2.8 Reservation. Overview Fig (2.7) The figure above is from the Registration screen of the SDC. There are two types of reservations namely FIT Reservation and Group Reservation, which can be viewed by selecting the respective buttons shown below in figures 2.8 and 2.9. (FIT Reservation button or Group Reservation button). The result of the desired query can be seen',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \nF<-~vMY=tt=\\=\C<hV9=Z&O=x^li2=\`\\n;j͇\$<s 4<\\8<	{»rbb¼\e\a<aY\ZM=\<췽 \Z\<=i+=Cr=\A=F!n\\[\=l|ru\"\<иZF;\0<~+l׼u\0<\={=\P<B\=^7<,	><f\Ѽ\\;]E\;\0*\<\\l\<<jL+=`ۼ\v=v\';˸-\\\\N<}0<<\\\<7AbFq<\\@WJ=x*!v=<^i<\E<ߜ\Z<\ջF(= \':+\̼k<P#:|Bae==M\`n1=,=\\<=Q_c<Σ\=|\<A1\0\\r+0r=/%\Ģ:@;,\<\rG=Z\.\=\q`dN:g\K+u\H=Q\	u&Ė#CҪ<\">\&<\.\Ӹ;\_=o\<_e<~=\#K !\2Jָ\=bﺻ&i(YY=\ּ\=u^&>\_=~\=6\<s;v;=\C=jc=M<b{5=O	;H\	<\\<\(FmkQ\Nm=\\nU=X\<QX=\Nq=Pj\\(ܧ\]꼖Q<іŽ^<q\55Q;-=c7=M\Aj=V^\\r=S\⼳\"=\nA\&Sn/[=:\\\;>1fϼeX\q\;	\"\\ZЩ&=f\\0pp=NZ\弳Opa\\Z\r8.=*=\\Z=\q\\Sيؽ\[Nk\9S\<l<س<\<vݟ<<]\^<*PSu==*<lܽr\'<wdZ\`={7.\"O\|&\=\G[=\\\;<tE\7*q\0\=8[=P.-<\r=Itj^h=\`=\>0&ͽr<.5U\:Y=\<N+<ZŻች\\7 Eļ!\ս\\=\\\:\\d\=ȩ<ܯ\<c;\h=\}X:w=~ZP\Z=Ͳ\r޼ԝ\\1HW\Xz\uC.[o8ҍ;Tsj\&7z:?\\\\8j<;	-\=g=̼󲁳\Tk@\:\}*=fvBc=\\\=OW\\=	-缧\"=.\=*<qrI\Z=7=oW;GDZƼc=c}Tc=1@o<MMK>=[F\=ʉ=\O=(G¼}Y=؆5<bTjt\=PY@=\ަ=I0Ca⎱u=-<Òu\]CBU<!}\.\\%Ǽ[\=\Ql\̼\nw\;\\<\Z\<\\<\<5k=ե{Y<',NULL),(3133,'0b8a7f62-04e4-4f6a-b79f-1004f7564f19',4,'the Registration screen of the SDC. There are two types of reservations namely FIT Reservation and Group Reservation, which can be viewed by selecting the respective buttons shown below in figures 2.8 and 2.9. (FIT Reservation button or Group Reservation button). The result of the desired query can be seen in the box presented above. Fig (2.8) Fig (2.9) Fig (2.10) By clicking on the In House Guest button (Figure 2.10), the list of in house guests can be viewed. Fig (2.11) One can also perform any search that is based towards the guest’s first name, last name or the reservation ID that is provided at the time of reservation. Any such queries can be typed in the box located right below the reservation buttons shown in Figure 2.12. Fig (2.12) On the upper right hand corner of the Reservation/Registration window, there is a cluster of different buttons that provide access to different functionality to the user. Let us view each of these in detail. 2.2.9 REFRESH Button: The REFRESH button refreshes the view of either FIT reservation list or the Group reservation list or the in house guest list, depending upon which button is clicked, i.e. FIT Reservation Button or the Group Reservation Button or In House Guest Button (Refer to Figure 2.8, 2.9, 2.10). 2.2.10 START Button: By clicking the START Button, one can start making a reservation for either an FIT or a group. The details of how to create a reservation is described in later chapters. 2.2.11 CANCEL Button: By clicking the CANCEL Button, one can cancel a reservation. 2.2.12 GROUP CONTRACTS Button: The GROUP CONTRACTS button gives us access to information pertaining to different group reservation contracts a hotel may have with companies and travel agencies. Without any such contracts, a hotel may not choose to do any business with other companies. A contract includes important figures such as number and types of room, rates and dates at which the contract ends. The details are described in later chapters of how to create a group contract. 2.2.13 UPGRADE Button: The UPGRADE button takes us to the window where a reservation can be upgraded to other options provided by the hotel. 2.2.17 ADD ROOMS Button: The ADD ROOMS button adds more rooms to a reservation. 2.2.15 DEPOSITE Button: During the time of check in, guests may be asked for some deposits which can be entered in a window that is accessed by clicking in on the DEPOSITE button. The details are coming later in the chapters. 2.2.16 TODAY’S ARRIVAL Button: By clicking on the TODAY’S ARRIVAL button, one can view all the reservations that are arriving on the date it is clicked. 2.2.17 CHECK-IN Button: The CHECK-IN button takes us to the window where a guest that has a reservation and who is arriving today can be checked in. There are other information that is gathered from the guest at the time of check in which needs to be entered into the software. The guest check',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \noBv)+\W=\=G\= =[\H!̭K=ͯNu\<I$m\\<@!;7=\ok{?<\Lt<\}=Ͱ<R\X!MO\tYeJ=:=,=:@>u5=L̽\5Vv	GC]VFlè<\\"\;D\Z==5%=t^;\k\;=/\r>ur@\Ȼ:Q=Tm<\"=\JkN~\2.=c\o=lA.*Q==ZN\F+t\\\\=.	<w\=\\0<\}&\(\<n=w\\d;2%=Mc<-\'<\`6^\\\\\lt=MJ\$Ƽ=\\<\\?\pO=Ib=e\\n=-ϼJV\=!\,=}/Ey\\1\=\1/u:8\r\ݽ=<\rּc =&o,h4=i`	=\}r<\YE	Y\`5gkY;\n6\G\z\n9WZ\;\bȼ=l^\A=t+<\\n5y=\g%\ջ;\\k\=pyD=K=[&=(\<h=O<=/H=\\<\\E=lp{<\ͼ2rἴL;\\b\g=M\<}a=d\m\ܼ\x1=x\=\l\\<:%\'J==ZG<\o;\s\<H2=MZ[]\ȟ\b\n*=}\4>1=vspH?<P%t\f\";fk\'\\<H\Ͻ3\\=|(Ys<#\q=Q\nT`\mt44<K\\M=\<a1c\1=H9KlM\r=t$\\"T\<\\=L\B=KH1ꉷ\9=\y۹\\\<\0o=<7\0c<p\켷\n\\\P=4;N!H<>ae=ɝ;>{=W4\=k\Q<\\</=*si=\-=@\Z\ֵ;<M\dNJ=H=(ּ\oGo<x̽ ĺ=<\Ar\w\n;K\\z=F=\p|ЃA=\V<ùu\L8?d<ċ\oYi=\L=t?\D=\a<¼\\<\=1;mUAu<ٝ\\Լ\|\<\8X\\:=&\0=\o(<㺣D?=\8\'=K̼8<\\=\=%F!=Ӫ;u\>\<_\\\<\cg(;{n/\mvY*p;\JR\V=鲪_\\\=ěJ\=\Ź<v=Ac:Oj\j=\\=K;D;ʼ\\\ܼ\\\<,;&/\Z=\{<\r><m=\ ==7=>\\]\0\\=`\\\=p\;<\\l=aHy=NX=E7=s&\<~K	aP|׽\\}<\\S	=q۹\=f!<HgĻ@=\֟w<',NULL),(3134,'0b8a7f62-04e4-4f6a-b79f-1004f7564f19',5,'CHECK-IN button takes us to the window where a guest that has a reservation and who is arriving today can be checked in. There are other information that is gathered from the guest at the time of check in which needs to be entered into the software. The guest check in process is described in detail in later chapters. 2.2.18 VIEW DETAILS Button: The VIEW DETAILS button shows details such as guest details pertaining to either FIT reservation or Group reservation. When the in house guest list is viewed by clicking the In House Guest button (Figure 2.10), the details of each guest can be viewed by clicking the respective guest and after that then VIEW DETAILS Button. 2.2.19 EDIT Button: The EDIT button takes us to the window from where reservation details are edited. This feature, together with many other features is password protected so that only the person with the authorized privilege can make such changes. 2.2.20 ARRIVAL/DEPARTURE Button: The ARRIVAL/DEPARTURE button leads us to a command centre from where we are view the arrival and departure records. These records can be viewed according to their dates. Below is an example of such logs. 2.3 Point of Sale The point of sale (POS) of the SDC is concerned with the day to day activities of a particular restaurant and billing. The POS handles operations like ordering, notifying the kitchen, settling a table or posting the charge to the room of the in guest. Below is a screen shot of the POS main. The main screen of the POS represents the exact floor plan of the restaurant with its table numbers and other details regarding the location of its exits and bars. When trying to access the POS from the main screen of SDC, a prompt is generated asking which restaurant is to be entered. Upon selecting the desired restaurant its corresponding floor plan is fetched and shown on the screen. The main screen provides some valuable information such as which tables are occupied or vacant or which tables are departing making it easier for servers and managers alike to be better prepared for their service. The POS and all of its functions are described in detail in the further sections on POS Functions. 2.4 House Keeping. The house keeping module in the SDC is designed so that the house keeping department of a hotel is fully notified at all times, the different statuses a room may have during any particular time of day so that everyone working in and around is kept notified. Below is a screen shot of the house keeping module. Shown above is a listing of different rooms and their respective status. Just looking at the above screen the house keeping department is made aware of how many rooms are checking out, how many rooms are occupied and dirty and so on so that as soon as the rooms become available they are cleaned and made ready for future guests. Rooms of different categories can',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\0\<p\<!@&<}|=\\==O\z\<\_=\\u<P\;\\<\n\"\μ\Ƚ\\\r=HO=rM=|hm==䢼]p\\Z;\h:\W=\\ö==G\&S`ꋼ\0h\;R><ws\<Fa\<\=\>\'v{\\sn\=\f\<g|=SVM=\*wS֩=<\'qtnkJB=EK;\?+:=%Km\,ݼ\5=!\\T\\t=0W>\nc,\H\<\,}=\-~ͫ7\\n=\晽q\]<n<\\<<\<j\<\\c\\\;=<\\\μ\~޼n\<;8<-.1aL==*>=N̳<B=\|7=K	\	>O<\<5\ͼF}{@*=bA=U\\<\N<\f=\u=\s=O`-=F;Ҽ\`q쳽?)t==	\U*\\rRmSx@p_=2<V2\\nü:p;\\<=\۽/=삽\\<ZV=ݺ\n\\=r˶;ќ<ސ(=\\U\;R\=\0Ү;\Y=\*=1	=\ȅ<\'\e;ͼ\B\\\\<b<4V\>\\_<6Ѫ\\69l̉YE}4\PT\\\"\=跕<h\<ˡ!=\=mwL͏<6\]I\>yȫ<@>\0u\"=\_݈<\\pU/Hk\?{kVQ\=;#l,<($+<1<w\8\w\</=\;{#=Fg=Ǖ[= /A\u<<9&}\'z`<\nἯ|@gh2	<\\\E[=\.<\"م=\a\\\=z\;d\n\ʽ?\߱<ɼ\ګ\\r\8\\ʽMw_ \<oxȐV=U?=ѻO=d_<X=\(<5\<=\"=\L={ͼB\_<tcŒ=]L=ۦ=\U=n%{5=j6f=\\\n=\.7.\=L\<:=nÇˇ=h\gP\\;+\=\\_=k<%)\\=[\\\y=\:=ާ1znC(=\===\p=\	)\<ۈ;\{=#\\=Z\m\s:V\.;)\<\^h\xj\TR$<虛%\|;2%Lz)<\½T;S=\\<aQ=L\zƙ:l;\<\r,<;w<?=(\\̽\&=a֢=\'5Z\\\ީj2\<*2ݻ\r^=\cK<2\y<Z\5=\n9h2@= S=\=_LJ=\=\<F=$=\\\;\f=\	=\\=n<k\f\\\=as	<6\ܻ5)^༫P,ygP=7C(==x鷽\'e>A$):`<\س=$(',NULL),(3135,'0b8a7f62-04e4-4f6a-b79f-1004f7564f19',6,'the above screen the house keeping department is made aware of how many rooms are checking out, how many rooms are occupied and dirty and so on so that as soon as the rooms become available they are cleaned and made ready for future guests. Rooms of different categories can be searched by clicking on the respective buttons and clicking the ‘Find’ button. The complete function of house keeping is explained in the House keeping function section. Functions The numerous functions available in SDC enable one to better understand how a hotel operates on a day to day basis. From tracking guest folio, to viewing extra charges occurred during the guest’s stay, SDC provides the simplest of interfaces to carry out all the operations of a hotel in a very convenient and efficient manner. SDC also supports the flexibility of posting the charges from a restaurant to the guest’s room. Hence the operation capabilities of SDC expand into integrating different departmental functions of a hotel so that various tasks can be accomplished quicker. Let us look deeper into these different functionalities. 3.1 Front Office Funtions. 3.1.1 Guest Check In. Front Office is a place where the guests interact with the hotel formally for the first time, therefore it is very important for anyone working in the front office to be prepared with all the necessary details one might need during check in. On clicking the ‘Today’s Arrival’ button shown in the figure below, the user is able to view all the reservation details of all the guests or groups arriving today depending upon the selected reservation view. (FIT or Group) The procedure of checking in guests belonging to FIT or Group reservation is slightly different with one another. Let us go deeper into each of the following. 3.1.1.1 FIT Check In. As mentioned above, the list of reservations that are arriving today can be viewed by selecting the FIT reservation and clicking the Today’s Arrival button on the top. The reservation system searches for all the reservations that are arriving today and gives the result as shown below. The figure above shows two reservations that are currently scheduled to arrive today. By clicking on the individual listings we can view the details on the right side of the screen. We can see that for reservation 19, the assigned room number is shown as 0 and for reservation 20 the room number is shown as 602. This means that for the reservations having their room number as 0, individual room(s) will be selected at the time of check in and for the reservation with a room number other than 0, 602 in this case, a separate room is kept reserved. This is usually the case if the reservation is for a VIP guest. The above figure shows the details of the selected reservation whose arrival date is today. To check in guests, click the button ‘Check-In’ which is shown below. If the arrival date in the selected reservation matches with today’s',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n5\W<\v,@N\<\=߾\'=\"=j3\\<|<yY <U\\;*+4ƹ\r=]\	z=ܔh=s`tcp:<z:e&<Լ	&\0L(Ͻkj=@\=~=,6G<G3W\%<\'\<m<e\|\,F<wLe=c\ \\"|\;I=ʝ=sZW=\%k=\^<=\-=L܋Y\fZ\B;=4=\<Yd.:]>F=\"\=\\Zd )=|`i<\ʷf\\<3ح^my31=s\<Qc=K\γ=\'\0@;R\<c7:ûŨ=R\'=\\n\=W\\z$ɜa<Ë=j <\\\<-\<7Q=A;C..>\<\]\;4Ioc=;=.@\(!OP_O=-\\=lRy?=\\ȺF#=\Qt\<\阽M\\=\\	퀼[n<\ =2<0:=\Ԑ=]=tnZV)=\c\8\y`=Y\0Y<\W<\w=L<\H\,=\?6F=a\\<h=*d<x=\=d<JZ<\<G\:\<=$OV-=\{O\\Wa<M\,˽Gԙ<W`Y<.=I\Z<J<\\=ϼ\\\=ZNf\!&=?f;jP9r=7Qɽ{%e=\a;^\n\,=ؐ\p<:c\G;=g\WN\.rA<\"sMsO0\r=@`QUߪ\"@A\}\<E\<y)<em7qh=\}Il5=zQ{ꪭ=\Z\&==\\R<C^0\\9`i\\=y^9ݽ\\Dm\^M\Q<q0a=\j4D\0>\h=ڨf\\\!\"=\;剎<6<GOWp\Խ\y9M=\9===wxD=\b\\*=\0!=|\\0$b?=F@/\z<nŽ9\<gURuU\υ\4r\\>=OW<R\\:z\"=\0M=<\;<$\s=\\=FX\Z\Q=\\4\~g=p=\fO_KaE\r<\<v:^O\\\d;L\z\_<\;ﱼT\~\Ҽ#\BiLV\C;t@<LI\}?,= r_U=򿌼qhZ2\H<!<=ev\drO\B.!<7=\0\0;3\\r=\'+=\=:M\\ȽS=i=<|<Dkv.m.p=C׼v\ =%<e<ScĻ.=&QK=]6=$>9=l\\<\m;6_=ߞ\=3 =Å_=Q\=s\"\&\qӽ?\;	˼\S<\r<bs<+c\5&w=}fs<H|=,%$=ð=5\\\r=\Ze\i<',NULL),(3136,'0b8a7f62-04e4-4f6a-b79f-1004f7564f19',7,'is usually the case if the reservation is for a VIP guest. The above figure shows the details of the selected reservation whose arrival date is today. To check in guests, click the button ‘Check-In’ which is shown below. If the arrival date in the selected reservation matches with today’s date only then a check-in window is presented to the user. The figure below shows the window from where we can check in the guests. The figure above shows the terminal from where guests are checked into their rooms. As mentioned before if the room hasn’t been selected during the process of saving the reservation, then 0 appears as the selected room number and the system will ask the user to select a room first before entering any guest information. The system searches for available rooms based on the room type which was requested at the time of reservation and presents the options in the right hand corner of the screen. The figure above shows the interface from where a room is selected by just clicking the room number. (Note: Guest check-in is only possible after a room as has been assigned). When a room number is selected, a prompt is presented to make sure that the user intended to select that particular room. After pressing ‘Ok’, the selected room appears in Red as shown below. Now we are ready to enter guest information into the system so that the check in procedure can be completed and keys can be issued to the guest. The figure shown above is the terminal from where we enter all the guest information during the process of check-in. The entered information of the guest is saved by the system and it can be retrieved again in the future if the same guest decides to pay another visit. This type of guest tracking technology is found across all different PMS’s around the world and is one of the most helpful tool with which a hotel can understand more about its relationship with its guests. Let’s move in deeper into the details of the final stage of guest check in. Upon clicking the ‘Check-In’ button the above terminal is seen. The ‘Enter Guest Information’ box is already filled by the system since the guest information was already saved during the creation of the reservation. To save the information, just click ‘Add Guest’. The system only lets the user check in a specified number of guests, which was entered at the time of saving the reservation hence it keeps count of the number of guests entered. If the number of guests entered equals to the number of guests specified, a prompt is generated to let the user know that the guest assignment has been completed and that the FIT check in process is complete. 3.1.1.2 Group Check In. Group check in is quite similar to FIT check in with minor difference. Below is a screen shot of the group check in module which can be accessed by',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\j\=\<ȚibCI=)=L=T\=ݣy\\=Z\<T\<)6ɼ\E<\<=%ؼ|ӽI/=ME=\\<\dH<`	\@߼2<<1莽G=<6=)kMX\\=W=\S:=t=ޏ\H\AAǜ\ȺE$厽UY|\1;\=\r\0K\<\s֊=C<;V=r<\<\ƦU\=1e	usƼrмD\!\\nh\'\x<p\ag=~콫͞=\;#\\r\_o:\\DTP\.g+=0πp)!Q\'ʬ+\h;x\<\y=\\;P@\)&$=\U\yt4O=ę#=wR6=?a\=\\_\<\=\\=\:K.T=\<M6\\=\r\<$&:=JKV\r<\;\	>\;\a\!=yr=\=:Y<>4!=Kcw<=_Un\D\bq=ռ\	ʉ:\$kb	<\lv\<L-<s\r)t\;<N3\\\=u\R6r\\=Z<\>5\=\=8=h=Sļ_<&<=_%=o\j:T=:>Hǆ#%m\"\3F==x=\\R\'<\Z\|ņ7\\n<\\XV<	Wf\<\r=\\=\\\\j=`9c<bۃ\`\<\w+<eyƼq$\$=\\\ٗᄕ\"RX\"f7L=\̤\ғ<	\<Fw<\(\^ζ\\=k-NPq=]I\*<an<\b<yviMP\<W7-=\I\<\'2=%=?Aѥ=t\9\j\Nac^\]ma_*v\0=\=H~;\==-V=V;(\\Z=M\<\N#=z\uj̼\\U;9֎=b=t>\(8ػ\;=\W\=\!\y==\b\\=L,X<4\\ڌ<\ʓ\j=\=eC=e{;22\<\'ֻ/:Fm2<\=Z;_\0H|>G=V+dýM=\;w\˽\\8==Ϝ=Q$;?/%y.ʀS=Y\0/y<\Zz<=*PK^>6\\0{<\\\~5%b\\<\Z{\\f<O5\nFY9\EӼ﫼:VT\D⽬K\"A|/C\Z̼8\<\\E=\U%;\\ǻ<tP2\A<\\0<|v<4ߚ\=}b=tOy<#U\ZYB\e=tX_;4<T0=cT*ui=a|<BC<i`=V!=9;o\Z\A<\0=!\"\=O\Λ<\lڌn߼?d\<=\Ѽ=<S{VqG\8=\<\\ <b^>Tih=P\qA>\GE{\%;HV=h]',NULL),(3137,'0b8a7f62-04e4-4f6a-b79f-1004f7564f19',8,'know that the guest assignment has been completed and that the FIT check in process is complete. 3.1.1.2 Group Check In. Group check in is quite similar to FIT check in with minor difference. Below is a screen shot of the group check in module which can be accessed by clicking on ‘Group Reservations’ and selecting a group that is arriving today or simply by clicking the ‘Today’s Arrival’ button and clicking the ‘Check-In’ button. The first step in checking in a group is entering the individual guest information into the system and selecting a room for the guest to stay in. Group reservations are handled by the sales department of a hotel and therefore a list of rooms, their type and their rates are negotiated within a formal written contract between the travels agencies and the hotel. Each contract has a start date and a cut off date, total number of rooms, their respective types and their rates. The hotel sets aside specific rooms that fall under the categories requested in the contract known as ‘Blocks’ and only the rooms that belong to a certain block which are assigned to the guests during check in. Hence the system only allows the user to assign the rooms that fall under a particular block making it easy for the front office staff to handle the check in process. Upon selecting any room the box appears in red and at this point guest information is entered into the respective fields. If the guest is a group leader, ‘Assign as Group Leader’ should be checked and ‘Add Guest’ button should be clicked. Upon doing so a prompt is generated to make sure that the guest was intended to be appointed as group leader. After pressing ‘Ok’, the guest information is saved and the information of the next guest is to be entered after selecting a room. If more than one guest is to be entered into a room then the respective room number has to be selected from the drop down box presented below and entering the guest information, ‘Add Guest’ button has to be clicked. When total number of entered guests equals the total number of guests specified in the group, the system generates a prompt notifying the user that the guest check in process is complete and requests to check in the guests into their specific rooms. After the user clicks ‘Yes’ the check in process is complete. 3.1.2 Guest Check Out The figure above shows the status of different rooms and with that we see there are 4 rooms which are due to check- out. We can also see that of the 4 rooms 3 belong to a group and one belongs to FIT. There are numerous differences between the two types of check out procedures hence they are addressed as follows. 3.1.2.1 FIT Check Out The hotel personnel working at the front office should be well aware of the room that are due out therefore they stay prepared for',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n&=9=\hWi=\<ia<	=hյ== /=j$0NPB<\@*<ǿ\<:m\W@<o%<#<w!Q\Hzr\+<y<K0@\np\L\:%\0>Lm=\!k=\{/==$\FᩴHįߍa\=x\	=e\;\r;\<؃\\=\b=\\n=\fO=\nє<?=ĵ+PZ\<\5\<nE\kQ\\<d<\\\`\\\\;Y0 \<c;%H3<=\=\'=vZ\\\A<o\=`۽{N;ϼz\{)\ɻ`a%\0^\=L©\\\L<u\=Y}=B<=\nպ\Ǽⰲ=\ZB<9ى0=\\=!=\0\<=X=B)$l<#崃o\\0>!h<n<Ɋ\rc\<\>O;&\.=\=>==O=\R<R\A=h\3į;lS<\=	14&I)\0<OU=\Q#\\4n=\A<m=b|=\]=A>x<;\\<k\=I\;D<%&<8\ּlQ=\Z=\=r=-\an =k\'/+<^<G-s=s\ָ\;=[I%=\\'R+=\-0L\'X\Zw>;\7\=\\D(=\\<4\=]C	\<,\~\'	<5G`</A<ށ<QEf=\\<1O<UX\<&Q\\9\y8\=\r\ܖ5==8vI=Ar>#<n\<=\@`J\'LL<r<y&\s\\7=S\һע\Z}@v,Ҽ[=FO=h>\n\J<j<dS\0\Ǫ^\=\\ܼ?\\h\=\K\Z=)ǽ2\n:f=Bǝё,F\ =b\qx\<`\=YK;Fa=CNK_(G=\\C;a=FBR\H߼\/5=S\;vY\\ϽI=T\=@\;\>,n2x=Rݑ=\\\\xy\O0=<z=qq\z<RCo\NT<I^;KF=g4\(=Z̒=\.3i}x=\K=%ЂXfʀ<óEQ\=\h=>^\\0<\S\<\I<\ďy<\!\H\	\\5];lR<~j\9<\-<S\\\0<0X$^cT<tP\\zVyR/\A\ZF=J؆\i;r<UWL=K=5\<5	<\r\\<8=N*!\<y\0X<Kzq$T-<Y\\=.dM:uE=\<\Z\<\k=*&= \<\ <<<!&=9\cH\)=/\i=G\+=PӼC4\\⫻a]74\ҟUB+z].\<ft=m\\eN=H<\>b\ü.\oN=\',NULL),(3138,'0b8a7f62-04e4-4f6a-b79f-1004f7564f19',9,'one belongs to FIT. There are numerous differences between the two types of check out procedures hence they are addressed as follows. 3.1.2.1 FIT Check Out The hotel personnel working at the front office should be well aware of the room that are due out therefore they stay prepared for any guests who arrive at the desk to check out of the hotel. Upon confirming the room from the guest click on the particular room on the front office panel to access the detailed view of the reservation. Upon entering the detailed view click ‘Open’ in the financial information tab and click ‘Settlement’ to access the settlement window. Upon accessing the settlement window, the entire folio history will be available on the screen together with the charged rate, the total service charge and VAT shown in the figure below. On the right hand corner of the screen the reservation details can be seen such as the check in date and the check out date and most importantly the payment method highlighted in bold. If the payment method is cash then the ‘Cash’ should be selected in the ‘Payment Method’ box shown below. Since cash could be received in any currency that too should be documented by entering the right curreny in the next box together with the amount and press ‘Enter’. If the entered amount is less than the required amount then the system will generate a message prompting the user to enter more amount. If the amount entered is more than the required amount then the system will highlight the change that must be given back in NC. When all the monetary transactions are complete click the ‘Accept’ button. Upon clicking the button a prompt is generated to confirm the check out of the guest from the hotel. Upon clicking ‘Yes’ the FIT is checked out of the system. Then the house keeping department is notified about the departure by changing the room status to ‘Vacant – Dirty’. 3.1.2.2 Group Check Out The screen above shows 3 rooms that are checking out and that all the three rooms belong to the same group. The method to access the check out screen is the same as FIT (by clicking ‘Open’ and then ‘Settlement’) but the screen can only be accessed through the group leader’s room which is highlighted in white (room 402). Below is the screen shot of the settlement window for group check out. The rates that are charged is automatically picked by the system which was chosen at the time of reservation. On the top right hand corner we can see the list of extra charges that needs to be settled before the check out procedure can be taken forward. The extra charges if present, can be settled is a very easy manner. Since the charges are posted in individuals of the group, they are the ones responsible for paying their extra charges. Therefore each of the rooms need to be selected from the ‘Select Room’ box and',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n<>۩=\Z6ܽH׮\\<ƾ==|=\$=\>=\<Kİ=\(\\0=#W;n\\s7\66<u\=\\T`ݼkSٝ>=\\߮2<O=\\\)G\I=\\=x\<\\\$8	`\UD?A\0@H;g\\q=\)=\&;捘<x2=\r8\=@\<*5<\a#;\k=fܤ8=\nE=1\<NH\\V\O\r)$<dH\Zޫ<+<d\\\<S<\}!#k\mڽ>-;\ʼ\@<Q\\"\i**=\\<\J<\\н\<S=i)В\n=E5=M7F8ၽ\\\=DQ=*\\\Q\=\Zmm=\><\\=ֹ=!d;6\%=r\<*\\%s=Ӈ=؊=\h򡇽F=֠=D\3bG+= =3=\昼\=\\<m	`;aw&\<l=<\	m\ڼ\'ۂ\Qm\"\~q=T`\Q=C=.ʣ=ZVK;Y:)/|;9YpI=\4=׹<oK=\2<4\r\r=ۏ\<f$~=aw=&=Fj=h\\߼Oգ=\G\y<0<m\\< Ȁ<\2=+\ݼ\L@3*9<X\3=\\ıLPm=`2ռ[=\Ϋ=\50l\ȹk<J[v\<h!<\\=;\\	\6 [Ƚ߷d=NZ^C^=TRp=Is\=j=Z\v<w\<)\s<%q\\ؼɽn\^=\'\e\=SeJ0\=,\\"=\oku\n$=\\\n;̅=\\s\ٛ<6Lj%MQ=L^;̮V^=\H\<+\Ｏ6<\fkd:D:\<\n@<\U\Nc=\z<<\h$<1<J\P=`\=v\I\	=\\]Z?Vy=uȼѽ\O&=nC=X=ϣ:\"\<;\"k=[Ubv\w߻𼲊<\@/vA-<\b\"<e<R>~+=^\_t\)ռ\\\\<;j7=\n\e<B\;%f=/\<\\\\x۽K=\sK=\'<a=ｕ\b\\\}<~\\na\꼾Uј&ab\\b2C\K<U\<\|pNq;\o=$;=&۽x	uC=^3+\\;\\˽\'\?\<\\\<_=\$<\6\½\I\:\\s\nջbe\N$>9<V<F<\0\=b\:@6\<ۏ=\\<@\a=TS\=MS;ʽә`1P\<\\\0=ՉG[c{Zm֘̽K\\R#\X=\<ʻV&5\"\<\&==X=2ٻ\B=;',NULL),(3139,'0b8a7f62-04e4-4f6a-b79f-1004f7564f19',10,'taken forward. The extra charges if present, can be settled is a very easy manner. Since the charges are posted in individuals of the group, they are the ones responsible for paying their extra charges. Therefore each of the rooms need to be selected from the ‘Select Room’ box and their individual bills need to be settled. After entering the payment method and the amount press ‘Enter’ to save the information. If there is another room with an extra charge posted to it then it can also be selected from the ‘Select Room’ box following the same procedure of settlement explained above. When the required amount has been entered and also all the extra charges have been settled click ‘Settle Bill’. A prompt is generated to confirm the action. After clicking ‘Yes’ the bills are settled and now the check out procedure can be initiated. To go ahead with the check out procedure the billing instruction needs to be checked. If the billing instruction says ‘Bill to Travel Agent’ then ‘TA Voucher’ should be selected as the Payment Method. If ‘Payment at Check Out’ is the billing instruction then the amount, currency and mode (cash/credit card) needs to be entered. When the parameters entered are accepted by the system click ‘Check-Out Group’ button. Upon clicking ‘Yes’ at the prompt the group is successfully checked out of the system and out of the hotel. 3.2 Point of Sale Functions 3.2.1 Start a Table The figure above is a screen shot of the main screen of the POS. The numbers on each of the green buttons represent a table number and the color represents its present state. To start a table one must click on the respective table where the current state is vacant. Upon clicking any of the vacant tables a prompt is generated for the server/manager password. After entering the passwords the system asks for the total number of guests being served on that table. Upon entering the required information and pressing ‘Ok’, the ordering panel becomes available from where we can select the items that were ordered by the guest. After the ordering is complete the kitchen is to be notified hence the ‘Send’ button needs to be clicked for the order to be sent to the kitchen. Below is a screen shot of the ordering panel. When the ‘Send’ button is clicked, a printer placed in the kitchen prints the KOT’s together with all the information such as the table number, ordering server, order time and order details in that KOT. The table status also changes from vacant to occupied. 3.2.2 Add more items to an existing Table To add more items to an existing table just click on the respective table to open it. When the ordering screen is screen after entering the right server password, select the items being ordered just as before by clicking their names on the screen and when you’re done click ‘Send’ for the kitchen to be notified. 3.2.3 Settle a Table',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\\k<7\=\xz_<\0Q\\=\¼QQ=^(=\n|=) \Zz<\"rf =Ľ\2\.l=~JQ@l\\(t(#λ\$9;[H7<4\"+=\\=\Zd\<\o\\==\\\;\Gkkl\]<\'͌!\;\n\y\y=t[<\\\hp=ˊ0\}=\f=\8\$<Q\?=ӑI+;\=/Y:Q0꽼^L[<J,\0=E+\L=\5\:8\n=U<WPE1\<E>=<sȏ=9\=r\\Zp9\=t\\\<\,֫5	<`=t\\t\\;c\=\=);Ī=\n\9{lnDܖ=\0\:1F=o\<e@ټ^/D\=O\nNt\=\\;8=\$T>T Ld?=\Iz\=zK\<ؗc<=9q$F=s%=~\d*//=\"G=]\,=\˛	\o|\rlY=\C\n\d߼\\U=\\U\Z=\4OJٽ\5=\})\9R\r\C=C=3\;*˻p==N\=<\I<t\\<jX;=q<Q<x=ۯN\\=\\\<\d;q\W=<\r1\O.Ǽ\w\<(\7r/H=\x91Ȑ=\\=KPR<eԽd\~\\n\fý\\G3;0\^~\;\\eU:ONF\:qf\1\'A=E؅\)R=+>\h=\쨼Ȅz=^B+<M\n=yR5jb=ZZK@T:=;=)=:<c\ pT\\eW]\\@\=sWQ\<b=+Z^;Ө?`<0=\\\\!\=\=3<oF=\]\'=j\Z~=L׼\<;ǮZ==Eo4=\'輿;?\<C=/KH=y2<e@\\\Z=\'\r=\Y=Kýd=_~<\ZNc=\N\=!x=@ɼ\!\Oj=\\#;\zɽ#FлTJWEѕ\\E̼6g鼍\!\u<\?Cd	>a=Bͼ;;<mR\3P#=ڄ1:،=Y|;T\{\=\\C=B\y]}A=0\r6\\=\f=3˫C\ͼ]Ƽ)<\\=Br\;!\:\nj<-=[ⒽBϻ\Ծ=\(]*\I%\\C\0==\׽ \=[\E;\<<\ZM<㠽G\y]<\L5()3_!<P\	<\+K\}\<\nv<^e0\=Ud<]\`	Y3=K:]\\}OA&=\F<)>=n\<=[¢+\Kg5<zzѽiP\K%\ѻ\]=\1f=P3Q-\<\&<o==\"<Ml\;̫\0<\\',NULL),(3140,'0b8a7f62-04e4-4f6a-b79f-1004f7564f19',11,'on the respective table to open it. When the ordering screen is screen after entering the right server password, select the items being ordered just as before by clicking their names on the screen and when you’re done click ‘Send’ for the kitchen to be notified. 3.2.3 Settle a Table Open the table which needs to be settled and click ‘Settlement’. Below is the screen shot of the settlement window. A guest may desire to settle a bill in numerous ways such as cash, credit card or post it to the room. After selecting the appropriate payment mode, the amount is to be entered using the keyboard or the key pad provided in the panel. When the correct amount is entered the ‘Amount Tended’ button is to be clicked which will calculate the change that needs to be handed to the customer. To end the table click ‘Accept’. When the ‘Accept’ button is clicked the system makes sure that the entered amount has covered the amount due and only then closes the table and saves all the necessary data for accounting purposes or for any other future reference. 3.2.4 Split a bill Splitting a bill is one of the most important features in a POS that is used for a variety of functions making its application quite handy at times. A bill can be spliced for a minimum of 2 ways and a maximum of the number of items in the bill. For example an order that contains 5 items can only be split 5 ways. To split any order, open the table and click ‘Split’ after which the figure above can be seen. Then click on the individual item that needs to be spliced. When selected, the item appears on the left hand side of the screen. If ‘Split’ button is clicked at this point then the system will split the bill two ways with the selected ‘Red label 30’ appearing as Check 2. Below is a screen shot of splitting the bill in the manner mentioned above. When the bill has been spliced as per the need, ‘Done’ button needs to be clicked which closes the split window and takes us back to the ordering screen but now with an option of selecting which check/bill we want to view shown in figure below on the right. By selecting either Check 1 or Check 2 we can settle them individually as if they were separate tables. The un-splitting of the bill can also be performed at any time by clicking on the ‘Un-Split’ button presented above in the figure on the left. 3.2.5 Add modifications How the food is ordered by the guest might not always be the same even if the same entrée is ordered as different people prefer different way of enjoying their meals and as a hotel/restaurant guests have every right to demand things the way they prefer. Adding modifications as such means informing the kitchen regarding any special requests made by the guest so that',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\\x[=\"rtѼ\\Ľ/M<=p\;HMq=\\={\<!x^uj\"\<m=\\\)\u: =N\<\;$ߔ6=\\<U\n`<N\]:G8=\=\m)$\gSܻ۶߼9\0ۛ<s\/\K<(i\0=?\;&==4:u0=\r*<\´\=\?8f)=\\>:<\d*F\41]=\"\\:p,=Ђ\;]<\䎼:x-=\rN: >oqǽ鐼-QS<&\"<\?<\v4<a=\L;	e\n?h\wi=\?h*\=\n\=	\"=j=a89\;k\\=^=3=O=|<=\ʼ=\^@=wy!_f=\	ݍgX\<6=\-{ע&~=\~ȼ\;\\\=ahH<+Kx=kА;\=g,\<\'!Q*뮽5<`]M\=Pl<x?=7A7\t=]<=ZM@=\q;BK⑽\˻H=?\V=[$P\r>7I=\\=,$=])}<=s<q=X&\C9<\ټ3\<kq\"\U=ĭmʍ\':缇w<<tҽ\K=\[F73s=\6=p=\ra\\\0<\1X}嵽\l?<kvRo󦽲J\rߋ<\#=9\n84=#Rͼ#=\0J\˽ī===\ⒼA\nҼ\n=V	Ua=.\<.h\<!g\2=cl;H=\Z\,<\Z<HC<>7=Q\;љ\n>c\"yDm=1~b\ļ\g<=\\\$mF=8\=)\½i=K\"#@n0˻\/9=\=\nZ<>XK=5<~=*/;kn<\\P\sK\0\=ռu\dZ=\nE=	hUR=j=\v-\=yd<\l9h=:H;i|f;\Oȼ\e/<O;:>{<\\u\n?\=-=x\<\]LYe轉2=\\=\=Y;%<v	=mH6\\<0\n<t뽠=I	>ռ_>i<iX|_^ý\ƼnML=\<7QYtM=PK&\=8.Ű6\Hq<[޽Xl<5=TUT=ryQdjĪE㚽\\ټ\H\<Le\<Zgڼ\=[CjP9;\n=6\2=\\\=b^\\+<\\'\<NE\k;=\;ӭ߼4s\<,=&+P<5H><3@\3<Id=`u<\\\y<m/ϻ\=\Z\r=_=\5=h\g؜H\?L\\<\Z^\;\@^\\ؼq\<\e=\=z=\\\\s\=;\P=\\\w=<\;Zz<\<)\0+T\\',NULL),(3141,'0b8a7f62-04e4-4f6a-b79f-1004f7564f19',12,'even if the same entrée is ordered as different people prefer different way of enjoying their meals and as a hotel/restaurant guests have every right to demand things the way they prefer. Adding modifications as such means informing the kitchen regarding any special requests made by the guest so that there are no complications later when the food is delivered to the guest. To access the modification screen the ‘Modification’ button needs to be clicked and the modification can be entered only after the menu item has been selected. Below is a screen shot of the modification window. Any modification can be sent to the kitchen by typing in the requirements either by keyboard or from the screen itself. When the modification is typed, click ‘Done’. This will take us now to the ordering screen where the modification appears in the box presented below. Upon clicking the ‘Send’ button the new order will be sent to the kitchen with the specified instruction. 3.2.6 Void Items Items need to be voided at times for numerous reasons such as for a mistake that the server committed while ordering the wrong item or at other times the guest didn’t necessarily like the food hence he/she decides to change their mind and order some thing else. Therefore to address these issues and many more the system provides for a way to void items. However voiding items as such is not a very good practice as it might create problems with the tax officials during auditing if done frequently. Therefore it is encouraged that the users be alert and calm while entering the order and double check it before sending it over to the kitchen. To void any item select the item from the ordering screen and click ‘Void’. Voiding credentials are only provided to the manager hence a manager password is required to enter the voiding screen. When the correct manager password is entered, the screen below will be seen. Before voiding any item a reason has to be selected. This information will later show up in the managers report so that a close eye can be kept regarding the use of this option. When the reason is selected, ‘Void’ button needs to be clicked which voids the selected item and takes us back to the ordering screen with the revised order list. 3.2.7 Room Post Room Post pertains to posting the restaurant bill into the guest folio so that the guest can pay all the bills at the time of check out. A guest may also be entitled to a meal as per the meal plan purchased hence the server/managers need to be aware of how the bill is to be settled. To complete a Room Post click on ‘Settlement’ and in the settlement window click ‘Room Post’. Below is the screen shot of the room post window. Before posting anything to the room the server/manager should ask the guest his/her room number. The room number is to be cross referenced by entering',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\rL\<p\=Pe<;U=\\_\<E<\I^$\<h-=\4\<\\\\Wׅݫ<@kE\=!;\`Z\K୘<V֨;g\\<\ MlL(4\;=+O<><=}\<\\< c.Z^H-as+w\<8*.$Yȵ\}jWiwK_-\\Ry\ \cҼ=a\q<\\RMQ#k_=|{=\n3;,8:>(8]=~<1ݻq<\=6<\\.=\MWTPfS<9\RBZ\CR<_*\|p=7VK໭Ol<eN\yȠ\</]|=\C=\\\<F*p:[jn?K=]6<]\\}&5+p</=<g\L=o<+=ꉘ=\/(|=P\輑׻\k1\=<w\ݽ\\\\Z#\}=v\n<=P`=D/\=\x\Q\=!\n9sO\jd8=ޒ<\;>h -KH콻	YC5=f\A=\4\63=	bO<f=v\=Ur(=\<ż@!q9\\1</_<+s@=\ք\=l;\qV\r=\"z_ K<<\5>\"U</&B<s̶\'pH\Zj=\Ζ`K=<=\J:A<\\l<c=&\g=\W8=!\g8;	O\\<\:\0=$[=~m=¼\9zwn<n\<\?+<z\\Y=v\;X<\E=Ȕ6;h	\eǼ\\<@x\\'\\<\9;\Z;=\\\#\'\v˼/=k=8<M:\;ޑ;2Rj=cTm=@=*\3ϋR+\Lr<\(=gB&ǽy\\<f#\h\ф<\4<ࡽ@wD\=M7\<M\0v^b;4\=\{=t\'Z\\;CM=_\=\x;:oѽT\¡Gh\Z%`==\'B\<%=F[>H=S\<\J̻=S\= <\0ʼ\衽Ǵ<_T=!&Ċ<[\96%p(=Db=V>IWGfX:\;Q=-=M\;`!~*4տ=\\;\_~\\Z=j:\\\=!w`\=v\\\<\0k=\<\<\"x\\U-3\?=ҍ==\ =&.\\<\w=IW=_w<Q+\=J=L|[Ic>5\:i4FJdL=/={O;a\,F<3\I,ʼK1[<-\<\r4;v=F_<(\=UBRJt\I~<7<]\=\e=1\r_\	=s3>\,\g)\rs[<,<\zM>hGҽa\=DuZ%<SMFP^\Ⱥ.Pw\;\l{=5<៌a<?\=\)A<PC>\	=_<\\\=\䠼F8\"',NULL),(3142,'0b8a7f62-04e4-4f6a-b79f-1004f7564f19',13,'complete a Room Post click on ‘Settlement’ and in the settlement window click ‘Room Post’. Below is the screen shot of the room post window. Before posting anything to the room the server/manager should ask the guest his/her room number. The room number is to be cross referenced by entering it in the respective box and pressing the enter key in the keyboard. The figure above shows the information of the guest staying in the room 605 with their respective arrival and departure dates, meal plans and the total amount due. As mentioned before there are two ways to settle the bill. One is to post the bill as a charge so that the bill maybe settled during check out or it can be posted as a meal plan so that the guest is not charged. If ‘Post as Charge’ button is click then the bill will be charged to the guest folio but if the ‘Post as Meal Plan’ button is clicked then bill will be settled as a meal plan. However across different parts of the world including Nepal, alcoholic and other certain beverages are not covered under the meal plan. Hence in that case only the items applicable will be charged as meal plan and a separate bill is created for the other items which cannot be covered by the meal plan. But this new bill can be charged to the room as a charge. 3.3 House Keeping Fuctions The house keeping department of the hotel is constantly made aware of its rooms and its status by the house keeping module of the SDC which provides all the information in real time. During the busy season of a hotel the house keeping department is at its busiest therefore they clean the rooms from floor to floor and during slow seasons the rooms are cleaned as necessary. SDC also provides this similar functionality where the status of rooms can be changed individually or by the floor. Some of the basic functions of house keeping module is explained below. 3.3.1 Change Status Individually. To change the status of any room individually just click on the particular room from the screen shown above. For example we are selecting a room with room number 604 who’s current state is Vacant and Dirty. A room which is Vacant and Dirty can only be made Vacant or Out-of-Order, therefore these are the only two options available. To change the room to a vacant state, just select the option ‘Vacant’ and click on Change Status. 3.3.2 Change Status Floor Wise. To change the status floor wise click ‘Change Status’ button presented below. Upon click it, the above screen is seen. The house keeping provides a way to search the room according to their state and floor. The two screen shots below show where those options are available on the screen. By selecting a particular floor and a particular room state we can search for all the rooms that satisfies our criteria. In the figure',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n<\=r+Y^<\\ټ%=:\.<==y<+Խ\\<\==ELdʼ\$=\\0\<^v=q<Ӏ=%}\'>=jʺ\\`p=\N=P=ˇ9<\\0;\\R\=j^ƣ	̳;\Ǽ\r;\*\|<O=tb?z=k4=:\\;ұ:=\8%m\20=*]sv\09<SM,C\/%uM>\<K<ܞN=TLYcD~g<:<2\=~?<\\0H\<\\;\><\B=s\"\hJ^v];9~ws\'7=2\;j\@SU=d\=]\<p=2X=\%/T\b=\H= >=a=\\r%t;\9=a\n\=!p=_5=E2\\b\F4$=\[*<\{<Z?=]h>d\\P=\<\\^댽\b)y7#=	#)B\q\=ϾjMќ\<鹚=3<A\=+\u=%h~\B[=&<&s>(:H?{6\=\j=\\qh)=	=\9=c=^\Z7\\<?U<JI=ԕ<\\%\=\̻U\I5\<A\<\U\\<\䶽k\=\\\<,K߰<l=\:\<Zҽ7\'\ڽ\r%qFn\6=\|l\I\\\b<^q\\\<\W%=aO17\5~^idt=C\bǯ/=+;=\"a9=))5v=c\¼u;{<k=\jۼa2V.\a<6=\n<Zs<\7\;Ȣ;=:<tǼYݼ^<p\\\>7\0V\к|܌;7\Z=0\(6W=<6_\}^=\ZZ\ة<7\<>=Ђ=\n<W=7=C}#P<\_ai<rV=:c:=\\~4\:=V:װԽb<\\^\\<\\<\i\G=w\=\\)\\Ƽ	z=C&<ͬ콽z\K\Z;><	\:T\Om.G\d=l\g=y:=-F8z=;5=l<D\<=s==^y;Ko=<|ŝ=E\\<[O=A;$C,X4eQǼ;%M4\G=J	:;u<͞B\;TD9d7vPl:4\\|G<\"k</x\I<\\r\}\m2=sW<;Pb=9p˼\\rcǰ=\0=cdlbS\?Mr<u=@Xf:<\>8ҟ=AɇWt=rߐ\a3=XxGK<.J%}N=jU=\^Zy2|ڻ	E=c#1\k\SuAعS\\N+\Ի(\X=\\j=>w9(\q\=n\'h=ŉ<\\=;	(V*s',NULL),(3143,'0b8a7f62-04e4-4f6a-b79f-1004f7564f19',14,'a way to search the room according to their state and floor. The two screen shots below show where those options are available on the screen. By selecting a particular floor and a particular room state we can search for all the rooms that satisfies our criteria. In the figure below, we have selected all the rooms in the 6th floor that are currently Vacant and Dirty. The result of our search is seen on the box which is pointed by the arrow . We can individually select the desired rooms by checking them off or if we wish to select all of the rooms at once then ‘Select All’ has to be checked. Now the selected rooms can be either made vacant, out of order or occupied-dirty which is presented on the left top corner of the screen shot presented above. To change the status click ‘Change Status’. A prompt is generated asking if the user is sure of the operation. When clicked ‘Yes’ the status of the rooms get changed. 3.3.3 Maintenance. The maintenance function provided with SDC is not a separate module but just a functionality which enhances the capabilities of the house keeping department. When the house keeping department notices something not working in a room such as the mini bar or the television, they notify the maintenance department regarding the nature of the defect filling out a form which is presented in the above figure under ‘Send Response Request’. After receiving the task the maintenance department on the other hand mobilizes its crews to take the right course of action based upon the information that was passed from the house keeping. Upon completion of the task in hand the maintenance notifies the house keeping and only then the house keeping change the status of the room to its respective state. Below is a screen shot of the form from where the maintenance is notified. After filling out the appropriate fields shown above the task is sent to maintenance by clicking ‘Dispatch to Maintenance’. When maintenance sees the task and completes it as requested, they resolve the task by clicking ‘Set Resolved Time’ which marks the task as Resolved. Below is a screen shot of the Maintenance which can be accessed by clicking ‘View History’ in the figure above.',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \nn;\0ټ\\<\?r=/`=Ln;e[=ce9<t!<\4=\\\<>\y᥼\=\\\}sZ.#(7F=b\J<S\r8r=*/\\<\vT<\\RO<\'==M\w=\\=6~kxVq<\=\\\	@<\H:(YO@\\<\\٨=\=+t\\"<\r=\\=%Q\=v\V=6`=X=&H3$%gG=SN]4\2<\$:i=t]@<_6\\d=wfiXr=K{=\c=	\d=1J˼Ǉ;\6C=Sֽ\).эJ\ =ꊼ\\\<\Lf&\h=\0_Z<0=_2`\;AH6+6?\<sƃ<\<5;6<L\?\7=b<t\<<w\)M7ͽ\v<D=P\19\\\'<M\=);~ؼ\zü:=ܓ,V\\\'\' =\0!(<\=d	 Nz=K,;/\=Ꮌ\`;%0;ƥ=c\x<m\<*=\Aq =j<;Z=5i=7=.<\=:\ixy=X=+\=q+\<\A	\<QD\WV=\--S,=\#\<[=]=g2ͼY6pPV^<%i=ŧ0</\!z=i2g\pG=4cH=d\'=*2̝<h<庻Ov!H\՛<\\&=*!!\\\\\<wO<7\P\<\nS\Pu=>4\gt^(\\=\\<μ\\qRKo<1+6ij3/Sl_+==\#ev;\r\<~Gv7=77ϼ\N=\|<۲=v_F;J.=c\\=G)-y\)C\\\M\=\X<<nP2Nv\>=),F\=\\\p=ht޽\v<ⓗ\"=@<\\\=Tx<DIA!T\\-\\=:\nf=b~<9/YUq=)=^v\F=X:@ŏަ>PU<ӨJ=Pq=ך.RZ;>7<>\'\\\c<l\=Z<[\\<\Ļ;F=.8aM<1[=ǧ<^=y\\nBg<ʒ2\:\<zH<Tgf;Z\S<%н;\7_\\\\\0<\|+֔=\[=M\)	3S\<ftE\n\t7o\R$R\b\\=`\\%\Z=\=F\= T<k\<\\Z<\2Za=:{;l\uC\_\"5<3J=L?a\><=A=7BQe\\F\-=3\=\\&=Q=fO=\b~\5=_1=\ْa.=!?=\1\	Ǽ+<l;jt?\"U=ĕ\\@<	y`ܒ]-L=\q\;\=ǳ1=\<\c<\=\1\<',NULL),(3144,'ec8ac072-fd4f-4840-9937-d7f598c20e2f',0,'Teaching Manual For SilverLine Dot Connector Version: S.10111 By SilverLine System Integrators Pvt. Ltd. Tables of Content. Introduction to SilverLine Dot Connector. Modules. Main Screen. Front Office. Point of Sale (POS). House Keeping. Maintenance. Functions. 3.1 Front Office Functions. 3.1.1 Check In 3.1.1.1 FIT Check In 3.1.1.2 Group Check In 3.1.2 Check Out 3.1.2.1 FIT Check Out 3.1.2.2 Group Check Out 3.1.3 Start Reservation 3.1.3.1 FIT Reservation 3.1.3.2 Group Reservation 3.2 Point of Sale Functions. 3.2.1 Start a Table 3.2.2 Add more item to an existing table 3.2.3 Settle a Table 3.2.4 Split a bill 3.2.5 Add Modifications 3.2.6 Void Items 3.2.8 Room Post 3.3 House Keeping Functions. Reports. Introduction to SilverLine Dot Connector. SilverLine Dot Connector (SDC) is a Property Management System (PMS) which is built for the purpose of managing different departmental operations of a hotel making it convenient to keep track of its day to day activities. With the arrival of computers into the scene, the old ways of maintaining logs of everything manually is long gone. In today’s competitive market its everyone’s aim to stay ahead of the game and one way of doing that is my having a system that helps you do just that. SDC is a system built towards addressing that need of a hotel where all the information needed to run a hotel efficiently is easily accessible with just a few clicks! More than that it integrates the functionality of all different departments of a hotel such as accounting, inventory, housekeeping etc reducing the time, energy and effort into managing all of them from one single point. SDC is one of the most efficient and easy to use PMS in the market. Build with the latest technology in software engineering, SDC provides a very efficient and user friendly operations making it very convenient for hotel staff to meet with the requirements of its daily operation. Some of its key features are as follows: SDC is a state of the art system that is capable of handling reservations for a hotel of any size. It is intelligent enough to interconnect different departments of a hotel, keeping them all informed about their duties and tasks in hand. The front office module gives an over view of the different states of different rooms (such as vacant-dirty or out-of-order), and these states are denoted by different color indexes helping the staff know everything they want with just a click. The reservation module is a full proof and fully tested part of the software that handles different information about the incoming guests such as their likes, and dislikes, room preferences and meal-plan, flight information. The guest history tracking system in the software makes reservations for repeated guests very simple and effective. The house keeping module also provides a visual over view for different rooms to be cleaned. The system provides a mechanism to clear the status of different rooms floor by floor or room by room as the situation demands. A maintenance module constantly keeps the maintenance',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n> :\4=y\;%\\<GK\<=ɖ;<2=trj=<jz=\<8)|=^\?<bBW<;\\=\;\-实= \rd=\\"<\Zf\<)\\uy=~6H:\r<.6=*z=.\\U=q\=\\>\0\h\(FP2&=\<̏XRb=\\<pe=Ůљ=\<J=z=\&\E\\;\c\?fo\<9Ҽ\i4\=WQB=ȋ12DGt-~=$=Ix=\\0<s=#ŽǓ\ >3^μF\r;\\9	i=\B=<oQ;\Z\MO=\j=[\L&;\MEg\Z\T9=:A<L=Fi=?\]a)f\\o\)B\:NF<:\#Tj\\	m\h5h\Q\S.t	=L).<=qS=3\0<C\;\+\<L=i	GZ\Tb9YGN=RL\<=\ϋ=;\"K=!tdL~\㬻y\;C\Ρ=|s=W6\:u\ѼS\2\Q=[ɼ~p=#L<xn=n=\/={<u=2=l\"ۼ0\\`=\x\r=0\?#\0Ϣ	US\Y.\]ӻ>#=)d\$=A =\=@ȉ\0A=DI\D<;;\<\\	{$$RkKؼ/_\Ol\1(3<J0x<KNL=$uG\=R\rd+ku;)*\<\'N<]:a&Gҍ<7=\\=RVO\<\r\\\;ː<\\N5UW=\뽱\"\n\}<t⡼C?7\_>\Z\<2_8=\\n=Av\>/8VVX<\p<[n\=\(=	\6/\\;=,>;O\r<\>a\"\L\0\<\=!;mx=2_\<q\7<_\"+ۋ6\z\oQ\ {@=)<+Tә%\;V^t=\=g~\;{=\=O%P=ʣ2qKy=\1>e=\j\n/^><C1 W\Ż\\k=\żpYH=\z=ȩ`rvr6\\\0=v=\=\=7	Q4=\\p3&H<SCN<\"H켃8\~\Z=\F~^=\`ӼȄ\G\"=\q\<䟯=\<\n\L<\I=\?9\=\L`=\_K\=\QƖו\ri$<<W\E\Z>=\J.Ҽ=HE\r<ߺ8=~]7=\\8\#)Y=\;b=\q\<s\=l.J;\\;f=p\吽\'\=\*=\<Ǎ==\=팻\0v=\aB<]=+\==\"h>ŁEn\:*>\Z;7\=θ5=xD%vz?C8(\0\:<\=`;<,4=&+t=',NULL),(3145,'ec8ac072-fd4f-4840-9937-d7f598c20e2f',1,'very simple and effective. The house keeping module also provides a visual over view for different rooms to be cleaned. The system provides a mechanism to clear the status of different rooms floor by floor or room by room as the situation demands. A maintenance module constantly keeps the maintenance department at its toes with its constant reminder of the things that need to be addressed. Housekeeping department notifies the maintenance department instantly about any breakages or failures noticed during a cleaning procedure there by reducing the reaction time. A state of the art POS system is also a part of this software that takes care of all the restaurant management needs. The POS provides a visual overview of the entire restaurant with its exact floor plan and table numbering to help the manager and the servers know the status of different tables. Different color codes are used to signify different status of tables, such as Vacant or Occupied, which helps to know which tables are available for the guests walking in. The POS is best utilized with a touch screen monitor as the ordering process will be faster. Each menu item is listed under its own course list, helping servers or managers to know where to look for any particular menu item as needed. After the ordering is complete the order is sent with a push of a button. Upon doing so, all the bar items get printed in the bar and the kitchen items get printed in the kitchen reducing the need of having to send someone to the kitchen or the bar to inform the respective stations. Once the order is sent, it cannot be voided unless approved by the manager. Any alterations or special requests from the guests regarding any items ordered are entered into the system at the time of ordering which is printed at the respective terminals along with the items ordered so that the respective terminals are informed about such modifications. A bill splitting feature allows the bill to be split as requested by the customer which can be printed accordingly. A bill printing system is also a part of the software that prints the bills as necessary. Room posting for different guests according to their meal plan is also incorporated into the system. Reporting includes daily arrival, departure and stay-over reports. The end of the day report is also available with the exact cash count of both the local and foreign currencies. Any further reporting options preferred can also be incorporated upon request. These are just some of the general features of the PMS. Let us now go deeper into its individual module operations. Modules Just like any other PMS in the market, SDC covers all the basic modules required to run a successful hotel business. 70% of the revenue generated by a hotel comes from the guests that come to stay in the hotel, therefore a system as such requires every attention to details as far as guests are concerned. SDC',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\\ZE<\$Gv+Q \1\=eU;\U=np\n+8==%-=	툼J?[7W=\"\<\_*5);HI¼\9\vC=<\d< \t<t\Ľ5}e<׺j\=<U<\\T<1s=\n}L(j$w##\\\'x\<\\=֫eGG(xFA\\F\H=\"N=}M=T=L=\͊ZʌK=$]\P<+%\r=1<<9\0=eS\\:C\<Λ=\"nGu\<N\\\\2<ks^;\>\n\3<.G<l3`d\ZQGҘ\k=wH_;v9=*`\><\0}<\=Z	<Z\<\\!=Ti<\Ɏ<\\\!<\\<Z.=鐜n\<=?\\d\r*ls\< <\Z=/;rB=\IĻJ8;bpH=KG===\}9	5LC\lhG\\<q/;\=<N59\{\g>\v=R\Z=	\=\z<`O=	\Z\nD=\=\\n\r;\\(<;<vO<>\<wA<\>|=9<o=R\oj;2\=-=Ud<\\нnJ\n\'ӂ!mk9\fdTm\rd=\\<0sq{=Т7=\<Yuj\Z_\\<dzJͼ׏=getA=-<.;yg<z8<k2[=\noD\<w;1=g\|=Us\0=fz;\#\VG}\s#ڼ\\=2j\:%5\0\\<-GC</l=Go\'U=I \<<̼9=K\\n\\0=i\0l\Cg\ԶϽEW<D,\Z\\<5ɽtL=fqs<|!=\y\T[ýQ=\\}[\=/JJ1<\\\A-L=](ú\:^5D+\c⾻?f:<\\}=:=gW=\'==Ⓖ-><R$\I=)D\ؽ\*;By{\G\YT	<+k,=\'Aru(<\8\\m8=@\5ʙ:=\U\=	Ui?=Ē޼+ =$~\޼\#\<0!$=\G9(.\ZH;~$;LD,\=¼=Q==ǁ1=g\ȟ=\\&<kFVU\aC2=\lFL<Ppܽ|3F<5=W=5=;=\:\܍=g\Z|=Փ=_\W@=:E;+ﺦ<=)2=fDzt<:\'=Y\<=1s\=߭<\\<sqx<uP=\\"<t/P{5=\\\<\\}{۽&L\r=d,=a\\<\e`S\S=_T\K\w=,#\>K\>\<\\'<\\'=\\\"~',NULL),(3146,'ec8ac072-fd4f-4840-9937-d7f598c20e2f',2,'market, SDC covers all the basic modules required to run a successful hotel business. 70% of the revenue generated by a hotel comes from the guests that come to stay in the hotel, therefore a system as such requires every attention to details as far as guests are concerned. SDC provides a state of the art front office reservation system that allows to know everything about a guest including any preferences in regards to dinning, lodging or any special requests that guests might have. Main Screen (fig 2.1) Apart from that house keeping also plays an important part in serving the guests as per their need. Restaurants are another place where the guests need to be served in a very professional manner. All of these operations are carried out by SDC which help the hotel staff to address the needed of the guest in a very professional and timely manner. Lets look at the operations of each of these modules. The above is a screen shot of SDC main screen. This is the main entry point of the system. On a first glace it gives all the statistics of the hotel that is relevant to the day. Values such as occupancy percentage and rooms to sell are very closely watched throughout the day as that determines the total revenue generated at the end of the day and also gives an idea of how many more guests can a hotel accommodate if new guests arrive as walk ins. Clicking in one of these parameters will give use more details pertaining to the parameters, such as if we double click “Total VIP’s” then a list of all the VIP’s with their room numbers will be seen on the screen. Shown below are 5 buttons which are the entry point to each of the mentioned modules. They are as follows: Front Office: By clicking in the above button in the SDC main screen, the front office of a hotel is seen. Front office module covers all the reservations together with the status of all the different rooms of a hotel. Settlement and viewing guest folio is also done from this module. Point of sale (POS): By clicking in the above button in the SDC, the POS can be accessed. POS is a module that serves as a restaurant management system for the hotels. Each restaurant of a hotel has its own terminal or POS from where it is accessed and used. House Keeping : By clicking on the above button, the House Keeping module can be accessed. House keeping module provides the house keeping department with the status of different rooms where by they know which rooms have to be cleaned or cleared. Accounting : By clicking on the above button, accounting module is viewed. Inventory Management : By clicking on the above button, Inventory Management module is accessed. Apart from accessing many different modules, SDC main screen also gives an over view of different time zones of different parts of the world,',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\<\\ἰ\rq<#80u=Wy=Ẻ7ʔ=\\\;IS.S<]<WDp(b=fQŽ=r7|oN=\I\B\ Ѻyo<\\\*<+\;{±< &{B=/˖=\Z!>3\<\'-=qλ\`ؽz`<}<Zi<Լ?\AλzaJKݡ=Ȕ\ޟ=Z=bs=0=o\=	\b̓\<fd=!s\<v<\[<\Z<야ns\:5\<W.<fs\pļ<\ZJ֐8\=20z\<:!=\'jMI\<>\{mdb=yx\\r<|=㶙<)E0=\\=\Ž\'&\y=ώ<\\_=T=q=\\Z\g\a>DI=S\Ż9X5a\˽	a=);\ļȖ\{]=l\\=\0ܼs<Õ\Z\\<\Zc(ҏ:H{H=̾\	f\ýļ&oM\y<\\<\C\n/5=jA<0먼&l\<E\<U\s=ޣ<\<\m=g\\0=\,\\<\\\<@\=: <\`P=ڃ<(\<K=j<<>p=!<<v\Z=g=^\\<yt=Ħ\ƻ;\Sv\\\<gJE=\۽	=Z\\X\<aH\=\	\Z\0\\=(gpf[;씽<`Q׽@\\G\<q~}\\n\jK#[<8i:\$xԻR=(k\\ro< <\<H\0<v\\\f\"%:\=]	#=|ݓ< \H`}b=ʉ\'_D\<\\\<.1=:7#<\\\`	&<3\Zik\=_\n\'쫅\\\<f?\ܺ樽\D\=U;ZCڂ=\"\;\=\˼\'𼆶\'\==Y[=\\ΏeU|\q:d==\Z=\\<L<nT=\=x\lFcVB=\n;>*>1Br\<\xX#6(7i~\m<Ê\w|<\=m=&\*=Ҩ<f\=\+\\v;\=\`3O{=}\,q 0wWJ\<\Jҽ\\Z\Ɗ;\L=\p\#\?ezμ \H\ޖtE<\Ha\"<\nOͽ<l\\Z=\Κ\⇳RnF\A0<\<8X0\\'g<X!=\J<\\Z=~*r=\j<\^]A;#Eǻ\W>x|B<\<B:IZ#=P5\6\<cl25%=L7;ǟ;\=+=\9=$>\=32<y><ݼD=\z/=ڐ<*+\<\Z=\D~<\n<\LB<7[k=\<<T\\׃=n)\=\=8Z!\k=\\<\6\=\"/o\\<',NULL),(3147,'ec8ac072-fd4f-4840-9937-d7f598c20e2f',3,'Accounting : By clicking on the above button, accounting module is viewed. Inventory Management : By clicking on the above button, Inventory Management module is accessed. Apart from accessing many different modules, SDC main screen also gives an over view of different time zones of different parts of the world, and also a small calendar which is helpful in many different areas. Now let us go deeper into each of the modules of SDC. 2.2 Front Office. 2.2.1 Overview : The screen shot seen above is from the front office screen. Individual rectangles denote individual rooms of a hotel with their current status being represented by the color of these rectangles. For example, rooms 701 and 702 are out of order therefore they appear in a grey color, and the legend present in the right hand corner represents exactly just that. On the upper right hand corner there are 5 buttons. They are: 2.2.2 Refresh Button: Refreshes the display screen and updates the current house status. 2.2.3 Find Button: Upon entering guest room number in the highlighted textbox the user can press the Find button or press ‘Enter’ to view the room details. 2.2.4 Rates Button: Pressing the Rates Button will display the different rates offered in the hotel . Rates such as CP, MAP, BB can be seen with their individual breakdown of their room rates and meal plan rates. 2.2.5 View Report Button: Clicking on the View Report button, different reports can be seen. Details of different reports are covered in further sections. 2.2.6 Drop Down Menu Functions: Fig 2.2 Buttons Fig 2.3 Room State Fig 2.4 Room Type There are three Drop Down menus present in the front office screens which are highlighted above. The first one gives you the list of different room types present in the hotel such as Single, Double, Suite etc. The second one contains different room states as such Vacant, Out-of-order, Occupied etc. Selecting (Fig 2.5) different combinations of room states and room types and pressing the Find button or enter, the user can view the desired room having the selected states and types. For example in figure 2.2 and 2.3 user wishes to view all the single rooms in a hotel that are vacant. (Fig 2.5) Given below is a screen shot of the result where different room number and their corresponding states are seen. Fig (2.6) 2.2.7 View Room Button: In the above figure if one clicked room number 605 which is highlighted with the blue shade (indicating that the room is occupied), one would also be able to view the details of the room. The Figure is given below. 2.2.8 Reservation. Overview Fig (2.7) The figure above is from the Registration screen of the SDC. There are two types of reservations namely FIT Reservation and Group Reservation, which can be viewed by selecting the respective buttons shown below in figures 2.8 and 2.9. (FIT Reservation button or Group Reservation button). The result of the desired query can be seen',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \nF<-~vMY=tt=\\=\C<hV9=Z&O=x^li2=\`\\n;j͇\$<s 4<\\8<	{»rbb¼\e\a<aY\ZM=\<췽 \Z\<=i+=Cr=\A=F!n\\[\=l|ru\"\<иZF;\0<~+l׼u\0<\={=\P<B\=^7<,	><f\Ѽ\\;]E\;\0*\<\\l\<<jL+=`ۼ\v=v\';˸-\\\\N<}0<<\\\<7AbFq<\\@WJ=x*!v=<^i<\E<ߜ\Z<\ջF(= \':+\̼k<P#:|Bae==M\`n1=,=\\<=Q_c<Σ\=|\<A1\0\\r+0r=/%\Ģ:@;,\<\rG=Z\.\=\q`dN:g\K+u\H=Q\	u&Ė#CҪ<\">\&<\.\Ӹ;\_=o\<_e<~=\#K !\2Jָ\=bﺻ&i(YY=\ּ\=u^&>\_=~\=6\<s;v;=\C=jc=M<b{5=O	;H\	<\\<\(FmkQ\Nm=\\nU=X\<QX=\Nq=Pj\\(ܧ\]꼖Q<іŽ^<q\55Q;-=c7=M\Aj=V^\\r=S\⼳\"=\nA\&Sn/[=:\\\;>1fϼeX\q\;	\"\\ZЩ&=f\\0pp=NZ\弳Opa\\Z\r8.=*=\\Z=\q\\Sيؽ\[Nk\9S\<l<س<\<vݟ<<]\^<*PSu==*<lܽr\'<wdZ\`={7.\"O\|&\=\G[=\\\;<tE\7*q\0\=8[=P.-<\r=Itj^h=\`=\>0&ͽr<.5U\:Y=\<N+<ZŻች\\7 Eļ!\ս\\=\\\:\\d\=ȩ<ܯ\<c;\h=\}X:w=~ZP\Z=Ͳ\r޼ԝ\\1HW\Xz\uC.[o8ҍ;Tsj\&7z:?\\\\8j<;	-\=g=̼󲁳\Tk@\:\}*=fvBc=\\\=OW\\=	-缧\"=.\=*<qrI\Z=7=oW;GDZƼc=c}Tc=1@o<MMK>=[F\=ʉ=\O=(G¼}Y=؆5<bTjt\=PY@=\ަ=I0Ca⎱u=-<Òu\]CBU<!}\.\\%Ǽ[\=\Ql\̼\nw\;\\<\Z\<\\<\<5k=ե{Y<',NULL),(3148,'ec8ac072-fd4f-4840-9937-d7f598c20e2f',4,'the Registration screen of the SDC. There are two types of reservations namely FIT Reservation and Group Reservation, which can be viewed by selecting the respective buttons shown below in figures 2.8 and 2.9. (FIT Reservation button or Group Reservation button). The result of the desired query can be seen in the box presented above. Fig (2.8) Fig (2.9) Fig (2.10) By clicking on the In House Guest button (Figure 2.10), the list of in house guests can be viewed. Fig (2.11) One can also perform any search that is based towards the guest’s first name, last name or the reservation ID that is provided at the time of reservation. Any such queries can be typed in the box located right below the reservation buttons shown in Figure 2.12. Fig (2.12) On the upper right hand corner of the Reservation/Registration window, there is a cluster of different buttons that provide access to different functionality to the user. Let us view each of these in detail. 2.2.9 REFRESH Button: The REFRESH button refreshes the view of either FIT reservation list or the Group reservation list or the in house guest list, depending upon which button is clicked, i.e. FIT Reservation Button or the Group Reservation Button or In House Guest Button (Refer to Figure 2.8, 2.9, 2.10). 2.2.10 START Button: By clicking the START Button, one can start making a reservation for either an FIT or a group. The details of how to create a reservation is described in later chapters. 2.2.11 CANCEL Button: By clicking the CANCEL Button, one can cancel a reservation. 2.2.12 GROUP CONTRACTS Button: The GROUP CONTRACTS button gives us access to information pertaining to different group reservation contracts a hotel may have with companies and travel agencies. Without any such contracts, a hotel may not choose to do any business with other companies. A contract includes important figures such as number and types of room, rates and dates at which the contract ends. The details are described in later chapters of how to create a group contract. 2.2.13 UPGRADE Button: The UPGRADE button takes us to the window where a reservation can be upgraded to other options provided by the hotel. 2.2.17 ADD ROOMS Button: The ADD ROOMS button adds more rooms to a reservation. 2.2.15 DEPOSITE Button: During the time of check in, guests may be asked for some deposits which can be entered in a window that is accessed by clicking in on the DEPOSITE button. The details are coming later in the chapters. 2.2.16 TODAY’S ARRIVAL Button: By clicking on the TODAY’S ARRIVAL button, one can view all the reservations that are arriving on the date it is clicked. 2.2.17 CHECK-IN Button: The CHECK-IN button takes us to the window where a guest that has a reservation and who is arriving today can be checked in. There are other information that is gathered from the guest at the time of check in which needs to be entered into the software. The guest check',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \noBv)+\W=\=G\= =[\H!̭K=ͯNu\<I$m\\<@!;7=\ok{?<\Lt<\}=Ͱ<R\X!MO\tYeJ=:=,=:@>u5=L̽\5Vv	GC]VFlè<\\"\;D\Z==5%=t^;\k\;=/\r>ur@\Ȼ:Q=Tm<\"=\JkN~\2.=c\o=lA.*Q==ZN\F+t\\\\=.	<w\=\\0<\}&\(\<n=w\\d;2%=Mc<-\'<\`6^\\\\\lt=MJ\$Ƽ=\\<\\?\pO=Ib=e\\n=-ϼJV\=!\,=}/Ey\\1\=\1/u:8\r\ݽ=<\rּc =&o,h4=i`	=\}r<\YE	Y\`5gkY;\n6\G\z\n9WZ\;\bȼ=l^\A=t+<\\n5y=\g%\ջ;\\k\=pyD=K=[&=(\<h=O<=/H=\\<\\E=lp{<\ͼ2rἴL;\\b\g=M\<}a=d\m\ܼ\x1=x\=\l\\<:%\'J==ZG<\o;\s\<H2=MZ[]\ȟ\b\n*=}\4>1=vspH?<P%t\f\";fk\'\\<H\Ͻ3\\=|(Ys<#\q=Q\nT`\mt44<K\\M=\<a1c\1=H9KlM\r=t$\\"T\<\\=L\B=KH1ꉷ\9=\y۹\\\<\0o=<7\0c<p\켷\n\\\P=4;N!H<>ae=ɝ;>{=W4\=k\Q<\\</=*si=\-=@\Z\ֵ;<M\dNJ=H=(ּ\oGo<x̽ ĺ=<\Ar\w\n;K\\z=F=\p|ЃA=\V<ùu\L8?d<ċ\oYi=\L=t?\D=\a<¼\\<\=1;mUAu<ٝ\\Լ\|\<\8X\\:=&\0=\o(<㺣D?=\8\'=K̼8<\\=\=%F!=Ӫ;u\>\<_\\\<\cg(;{n/\mvY*p;\JR\V=鲪_\\\=ěJ\=\Ź<v=Ac:Oj\j=\\=K;D;ʼ\\\ܼ\\\<,;&/\Z=\{<\r><m=\ ==7=>\\]\0\\=`\\\=p\;<\\l=aHy=NX=E7=s&\<~K	aP|׽\\}<\\S	=q۹\=f!<HgĻ@=\֟w<',NULL),(3149,'ec8ac072-fd4f-4840-9937-d7f598c20e2f',5,'CHECK-IN button takes us to the window where a guest that has a reservation and who is arriving today can be checked in. There are other information that is gathered from the guest at the time of check in which needs to be entered into the software. The guest check in process is described in detail in later chapters. 2.2.18 VIEW DETAILS Button: The VIEW DETAILS button shows details such as guest details pertaining to either FIT reservation or Group reservation. When the in house guest list is viewed by clicking the In House Guest button (Figure 2.10), the details of each guest can be viewed by clicking the respective guest and after that then VIEW DETAILS Button. 2.2.19 EDIT Button: The EDIT button takes us to the window from where reservation details are edited. This feature, together with many other features is password protected so that only the person with the authorized privilege can make such changes. 2.2.20 ARRIVAL/DEPARTURE Button: The ARRIVAL/DEPARTURE button leads us to a command centre from where we are view the arrival and departure records. These records can be viewed according to their dates. Below is an example of such logs. 2.3 Point of Sale The point of sale (POS) of the SDC is concerned with the day to day activities of a particular restaurant and billing. The POS handles operations like ordering, notifying the kitchen, settling a table or posting the charge to the room of the in guest. Below is a screen shot of the POS main. The main screen of the POS represents the exact floor plan of the restaurant with its table numbers and other details regarding the location of its exits and bars. When trying to access the POS from the main screen of SDC, a prompt is generated asking which restaurant is to be entered. Upon selecting the desired restaurant its corresponding floor plan is fetched and shown on the screen. The main screen provides some valuable information such as which tables are occupied or vacant or which tables are departing making it easier for servers and managers alike to be better prepared for their service. The POS and all of its functions are described in detail in the further sections on POS Functions. 2.4 House Keeping. The house keeping module in the SDC is designed so that the house keeping department of a hotel is fully notified at all times, the different statuses a room may have during any particular time of day so that everyone working in and around is kept notified. Below is a screen shot of the house keeping module. Shown above is a listing of different rooms and their respective status. Just looking at the above screen the house keeping department is made aware of how many rooms are checking out, how many rooms are occupied and dirty and so on so that as soon as the rooms become available they are cleaned and made ready for future guests. Rooms of different categories can',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\0\<p\<!@&<}|=\\==O\z\<\_=\\u<P\;\\<\n\"\μ\Ƚ\\\r=HO=rM=|hm==䢼]p\\Z;\h:\W=\\ö==G\&S`ꋼ\0h\;R><ws\<Fa\<\=\>\'v{\\sn\=\f\<g|=SVM=\*wS֩=<\'qtnkJB=EK;\?+:=%Km\,ݼ\5=!\\T\\t=0W>\nc,\H\<\,}=\-~ͫ7\\n=\晽q\]<n<\\<<\<j\<\\c\\\;=<\\\μ\~޼n\<;8<-.1aL==*>=N̳<B=\|7=K	\	>O<\<5\ͼF}{@*=bA=U\\<\N<\f=\u=\s=O`-=F;Ҽ\`q쳽?)t==	\U*\\rRmSx@p_=2<V2\\nü:p;\\<=\۽/=삽\\<ZV=ݺ\n\\=r˶;ќ<ސ(=\\U\;R\=\0Ү;\Y=\*=1	=\ȅ<\'\e;ͼ\B\\\\<b<4V\>\\_<6Ѫ\\69l̉YE}4\PT\\\"\=跕<h\<ˡ!=\=mwL͏<6\]I\>yȫ<@>\0u\"=\_݈<\\pU/Hk\?{kVQ\=;#l,<($+<1<w\8\w\</=\;{#=Fg=Ǖ[= /A\u<<9&}\'z`<\nἯ|@gh2	<\\\E[=\.<\"م=\a\\\=z\;d\n\ʽ?\߱<ɼ\ګ\\r\8\\ʽMw_ \<oxȐV=U?=ѻO=d_<X=\(<5\<=\"=\L={ͼB\_<tcŒ=]L=ۦ=\U=n%{5=j6f=\\\n=\.7.\=L\<:=nÇˇ=h\gP\\;+\=\\_=k<%)\\=[\\\y=\:=ާ1znC(=\===\p=\	)\<ۈ;\{=#\\=Z\m\s:V\.;)\<\^h\xj\TR$<虛%\|;2%Lz)<\½T;S=\\<aQ=L\zƙ:l;\<\r,<;w<?=(\\̽\&=a֢=\'5Z\\\ީj2\<*2ݻ\r^=\cK<2\y<Z\5=\n9h2@= S=\=_LJ=\=\<F=$=\\\;\f=\	=\\=n<k\f\\\=as	<6\ܻ5)^༫P,ygP=7C(==x鷽\'e>A$):`<\س=$(',NULL),(3150,'ec8ac072-fd4f-4840-9937-d7f598c20e2f',6,'the above screen the house keeping department is made aware of how many rooms are checking out, how many rooms are occupied and dirty and so on so that as soon as the rooms become available they are cleaned and made ready for future guests. Rooms of different categories can be searched by clicking on the respective buttons and clicking the ‘Find’ button. The complete function of house keeping is explained in the House keeping function section. Functions The numerous functions available in SDC enable one to better understand how a hotel operates on a day to day basis. From tracking guest folio, to viewing extra charges occurred during the guest’s stay, SDC provides the simplest of interfaces to carry out all the operations of a hotel in a very convenient and efficient manner. SDC also supports the flexibility of posting the charges from a restaurant to the guest’s room. Hence the operation capabilities of SDC expand into integrating different departmental functions of a hotel so that various tasks can be accomplished quicker. Let us look deeper into these different functionalities. 3.1 Front Office Funtions. 3.1.1 Guest Check In. Front Office is a place where the guests interact with the hotel formally for the first time, therefore it is very important for anyone working in the front office to be prepared with all the necessary details one might need during check in. On clicking the ‘Today’s Arrival’ button shown in the figure below, the user is able to view all the reservation details of all the guests or groups arriving today depending upon the selected reservation view. (FIT or Group) The procedure of checking in guests belonging to FIT or Group reservation is slightly different with one another. Let us go deeper into each of the following. 3.1.1.1 FIT Check In. As mentioned above, the list of reservations that are arriving today can be viewed by selecting the FIT reservation and clicking the Today’s Arrival button on the top. The reservation system searches for all the reservations that are arriving today and gives the result as shown below. The figure above shows two reservations that are currently scheduled to arrive today. By clicking on the individual listings we can view the details on the right side of the screen. We can see that for reservation 19, the assigned room number is shown as 0 and for reservation 20 the room number is shown as 602. This means that for the reservations having their room number as 0, individual room(s) will be selected at the time of check in and for the reservation with a room number other than 0, 602 in this case, a separate room is kept reserved. This is usually the case if the reservation is for a VIP guest. The above figure shows the details of the selected reservation whose arrival date is today. To check in guests, click the button ‘Check-In’ which is shown below. If the arrival date in the selected reservation matches with today’s',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n5\W<\v,@N\<\=߾\'=\"=j3\\<|<yY <U\\;*+4ƹ\r=]\	z=ܔh=s`tcp:<z:e&<Լ	&\0L(Ͻkj=@\=~=,6G<G3W\%<\'\<m<e\|\,F<wLe=c\ \\"|\;I=ʝ=sZW=\%k=\^<=\-=L܋Y\fZ\B;=4=\<Yd.:]>F=\"\=\\Zd )=|`i<\ʷf\\<3ح^my31=s\<Qc=K\γ=\'\0@;R\<c7:ûŨ=R\'=\\n\=W\\z$ɜa<Ë=j <\\\<-\<7Q=A;C..>\<\]\;4Ioc=;=.@\(!OP_O=-\\=lRy?=\\ȺF#=\Qt\<\阽M\\=\\	퀼[n<\ =2<0:=\Ԑ=]=tnZV)=\c\8\y`=Y\0Y<\W<\w=L<\H\,=\?6F=a\\<h=*d<x=\=d<JZ<\<G\:\<=$OV-=\{O\\Wa<M\,˽Gԙ<W`Y<.=I\Z<J<\\=ϼ\\\=ZNf\!&=?f;jP9r=7Qɽ{%e=\a;^\n\,=ؐ\p<:c\G;=g\WN\.rA<\"sMsO0\r=@`QUߪ\"@A\}\<E\<y)<em7qh=\}Il5=zQ{ꪭ=\Z\&==\\R<C^0\\9`i\\=y^9ݽ\\Dm\^M\Q<q0a=\j4D\0>\h=ڨf\\\!\"=\;剎<6<GOWp\Խ\y9M=\9===wxD=\b\\*=\0!=|\\0$b?=F@/\z<nŽ9\<gURuU\υ\4r\\>=OW<R\\:z\"=\0M=<\;<$\s=\\=FX\Z\Q=\\4\~g=p=\fO_KaE\r<\<v:^O\\\d;L\z\_<\;ﱼT\~\Ҽ#\BiLV\C;t@<LI\}?,= r_U=򿌼qhZ2\H<!<=ev\drO\B.!<7=\0\0;3\\r=\'+=\=:M\\ȽS=i=<|<Dkv.m.p=C׼v\ =%<e<ScĻ.=&QK=]6=$>9=l\\<\m;6_=ߞ\=3 =Å_=Q\=s\"\&\qӽ?\;	˼\S<\r<bs<+c\5&w=}fs<H|=,%$=ð=5\\\r=\Ze\i<',NULL),(3151,'ec8ac072-fd4f-4840-9937-d7f598c20e2f',7,'is usually the case if the reservation is for a VIP guest. The above figure shows the details of the selected reservation whose arrival date is today. To check in guests, click the button ‘Check-In’ which is shown below. If the arrival date in the selected reservation matches with today’s date only then a check-in window is presented to the user. The figure below shows the window from where we can check in the guests. The figure above shows the terminal from where guests are checked into their rooms. As mentioned before if the room hasn’t been selected during the process of saving the reservation, then 0 appears as the selected room number and the system will ask the user to select a room first before entering any guest information. The system searches for available rooms based on the room type which was requested at the time of reservation and presents the options in the right hand corner of the screen. The figure above shows the interface from where a room is selected by just clicking the room number. (Note: Guest check-in is only possible after a room as has been assigned). When a room number is selected, a prompt is presented to make sure that the user intended to select that particular room. After pressing ‘Ok’, the selected room appears in Red as shown below. Now we are ready to enter guest information into the system so that the check in procedure can be completed and keys can be issued to the guest. The figure shown above is the terminal from where we enter all the guest information during the process of check-in. The entered information of the guest is saved by the system and it can be retrieved again in the future if the same guest decides to pay another visit. This type of guest tracking technology is found across all different PMS’s around the world and is one of the most helpful tool with which a hotel can understand more about its relationship with its guests. Let’s move in deeper into the details of the final stage of guest check in. Upon clicking the ‘Check-In’ button the above terminal is seen. The ‘Enter Guest Information’ box is already filled by the system since the guest information was already saved during the creation of the reservation. To save the information, just click ‘Add Guest’. The system only lets the user check in a specified number of guests, which was entered at the time of saving the reservation hence it keeps count of the number of guests entered. If the number of guests entered equals to the number of guests specified, a prompt is generated to let the user know that the guest assignment has been completed and that the FIT check in process is complete. 3.1.1.2 Group Check In. Group check in is quite similar to FIT check in with minor difference. Below is a screen shot of the group check in module which can be accessed by',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\j\=\<ȚibCI=)=L=T\=ݣy\\=Z\<T\<)6ɼ\E<\<=%ؼ|ӽI/=ME=\\<\dH<`	\@߼2<<1莽G=<6=)kMX\\=W=\S:=t=ޏ\H\AAǜ\ȺE$厽UY|\1;\=\r\0K\<\s֊=C<;V=r<\<\ƦU\=1e	usƼrмD\!\\nh\'\x<p\ag=~콫͞=\;#\\r\_o:\\DTP\.g+=0πp)!Q\'ʬ+\h;x\<\y=\\;P@\)&$=\U\yt4O=ę#=wR6=?a\=\\_\<\=\\=\:K.T=\<M6\\=\r\<$&:=JKV\r<\;\	>\;\a\!=yr=\=:Y<>4!=Kcw<=_Un\D\bq=ռ\	ʉ:\$kb	<\lv\<L-<s\r)t\;<N3\\\=u\R6r\\=Z<\>5\=\=8=h=Sļ_<&<=_%=o\j:T=:>Hǆ#%m\"\3F==x=\\R\'<\Z\|ņ7\\n<\\XV<	Wf\<\r=\\=\\\\j=`9c<bۃ\`\<\w+<eyƼq$\$=\\\ٗᄕ\"RX\"f7L=\̤\ғ<	\<Fw<\(\^ζ\\=k-NPq=]I\*<an<\b<yviMP\<W7-=\I\<\'2=%=?Aѥ=t\9\j\Nac^\]ma_*v\0=\=H~;\==-V=V;(\\Z=M\<\N#=z\uj̼\\U;9֎=b=t>\(8ػ\;=\W\=\!\y==\b\\=L,X<4\\ڌ<\ʓ\j=\=eC=e{;22\<\'ֻ/:Fm2<\=Z;_\0H|>G=V+dýM=\;w\˽\\8==Ϝ=Q$;?/%y.ʀS=Y\0/y<\Zz<=*PK^>6\\0{<\\\~5%b\\<\Z{\\f<O5\nFY9\EӼ﫼:VT\D⽬K\"A|/C\Z̼8\<\\E=\U%;\\ǻ<tP2\A<\\0<|v<4ߚ\=}b=tOy<#U\ZYB\e=tX_;4<T0=cT*ui=a|<BC<i`=V!=9;o\Z\A<\0=!\"\=O\Λ<\lڌn߼?d\<=\Ѽ=<S{VqG\8=\<\\ <b^>Tih=P\qA>\GE{\%;HV=h]',NULL),(3152,'ec8ac072-fd4f-4840-9937-d7f598c20e2f',8,'know that the guest assignment has been completed and that the FIT check in process is complete. 3.1.1.2 Group Check In. Group check in is quite similar to FIT check in with minor difference. Below is a screen shot of the group check in module which can be accessed by clicking on ‘Group Reservations’ and selecting a group that is arriving today or simply by clicking the ‘Today’s Arrival’ button and clicking the ‘Check-In’ button. The first step in checking in a group is entering the individual guest information into the system and selecting a room for the guest to stay in. Group reservations are handled by the sales department of a hotel and therefore a list of rooms, their type and their rates are negotiated within a formal written contract between the travels agencies and the hotel. Each contract has a start date and a cut off date, total number of rooms, their respective types and their rates. The hotel sets aside specific rooms that fall under the categories requested in the contract known as ‘Blocks’ and only the rooms that belong to a certain block which are assigned to the guests during check in. Hence the system only allows the user to assign the rooms that fall under a particular block making it easy for the front office staff to handle the check in process. Upon selecting any room the box appears in red and at this point guest information is entered into the respective fields. If the guest is a group leader, ‘Assign as Group Leader’ should be checked and ‘Add Guest’ button should be clicked. Upon doing so a prompt is generated to make sure that the guest was intended to be appointed as group leader. After pressing ‘Ok’, the guest information is saved and the information of the next guest is to be entered after selecting a room. If more than one guest is to be entered into a room then the respective room number has to be selected from the drop down box presented below and entering the guest information, ‘Add Guest’ button has to be clicked. When total number of entered guests equals the total number of guests specified in the group, the system generates a prompt notifying the user that the guest check in process is complete and requests to check in the guests into their specific rooms. After the user clicks ‘Yes’ the check in process is complete. 3.1.2 Guest Check Out The figure above shows the status of different rooms and with that we see there are 4 rooms which are due to check- out. We can also see that of the 4 rooms 3 belong to a group and one belongs to FIT. There are numerous differences between the two types of check out procedures hence they are addressed as follows. 3.1.2.1 FIT Check Out The hotel personnel working at the front office should be well aware of the room that are due out therefore they stay prepared for',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n&=9=\hWi=\<ia<	=hյ== /=j$0NPB<\@*<ǿ\<:m\W@<o%<#<w!Q\Hzr\+<y<K0@\np\L\:%\0>Lm=\!k=\{/==$\FᩴHįߍa\=x\	=e\;\r;\<؃\\=\b=\\n=\fO=\nє<?=ĵ+PZ\<\5\<nE\kQ\\<d<\\\`\\\\;Y0 \<c;%H3<=\=\'=vZ\\\A<o\=`۽{N;ϼz\{)\ɻ`a%\0^\=L©\\\L<u\=Y}=B<=\nպ\Ǽⰲ=\ZB<9ى0=\\=!=\0\<=X=B)$l<#崃o\\0>!h<n<Ɋ\rc\<\>O;&\.=\=>==O=\R<R\A=h\3į;lS<\=	14&I)\0<OU=\Q#\\4n=\A<m=b|=\]=A>x<;\\<k\=I\;D<%&<8\ּlQ=\Z=\=r=-\an =k\'/+<^<G-s=s\ָ\;=[I%=\\'R+=\-0L\'X\Zw>;\7\=\\D(=\\<4\=]C	\<,\~\'	<5G`</A<ށ<QEf=\\<1O<UX\<&Q\\9\y8\=\r\ܖ5==8vI=Ar>#<n\<=\@`J\'LL<r<y&\s\\7=S\һע\Z}@v,Ҽ[=FO=h>\n\J<j<dS\0\Ǫ^\=\\ܼ?\\h\=\K\Z=)ǽ2\n:f=Bǝё,F\ =b\qx\<`\=YK;Fa=CNK_(G=\\C;a=FBR\H߼\/5=S\;vY\\ϽI=T\=@\;\>,n2x=Rݑ=\\\\xy\O0=<z=qq\z<RCo\NT<I^;KF=g4\(=Z̒=\.3i}x=\K=%ЂXfʀ<óEQ\=\h=>^\\0<\S\<\I<\ďy<\!\H\	\\5];lR<~j\9<\-<S\\\0<0X$^cT<tP\\zVyR/\A\ZF=J؆\i;r<UWL=K=5\<5	<\r\\<8=N*!\<y\0X<Kzq$T-<Y\\=.dM:uE=\<\Z\<\k=*&= \<\ <<<!&=9\cH\)=/\i=G\+=PӼC4\\⫻a]74\ҟUB+z].\<ft=m\\eN=H<\>b\ü.\oN=\',NULL),(3153,'ec8ac072-fd4f-4840-9937-d7f598c20e2f',9,'one belongs to FIT. There are numerous differences between the two types of check out procedures hence they are addressed as follows. 3.1.2.1 FIT Check Out The hotel personnel working at the front office should be well aware of the room that are due out therefore they stay prepared for any guests who arrive at the desk to check out of the hotel. Upon confirming the room from the guest click on the particular room on the front office panel to access the detailed view of the reservation. Upon entering the detailed view click ‘Open’ in the financial information tab and click ‘Settlement’ to access the settlement window. Upon accessing the settlement window, the entire folio history will be available on the screen together with the charged rate, the total service charge and VAT shown in the figure below. On the right hand corner of the screen the reservation details can be seen such as the check in date and the check out date and most importantly the payment method highlighted in bold. If the payment method is cash then the ‘Cash’ should be selected in the ‘Payment Method’ box shown below. Since cash could be received in any currency that too should be documented by entering the right curreny in the next box together with the amount and press ‘Enter’. If the entered amount is less than the required amount then the system will generate a message prompting the user to enter more amount. If the amount entered is more than the required amount then the system will highlight the change that must be given back in NC. When all the monetary transactions are complete click the ‘Accept’ button. Upon clicking the button a prompt is generated to confirm the check out of the guest from the hotel. Upon clicking ‘Yes’ the FIT is checked out of the system. Then the house keeping department is notified about the departure by changing the room status to ‘Vacant – Dirty’. 3.1.2.2 Group Check Out The screen above shows 3 rooms that are checking out and that all the three rooms belong to the same group. The method to access the check out screen is the same as FIT (by clicking ‘Open’ and then ‘Settlement’) but the screen can only be accessed through the group leader’s room which is highlighted in white (room 402). Below is the screen shot of the settlement window for group check out. The rates that are charged is automatically picked by the system which was chosen at the time of reservation. On the top right hand corner we can see the list of extra charges that needs to be settled before the check out procedure can be taken forward. The extra charges if present, can be settled is a very easy manner. Since the charges are posted in individuals of the group, they are the ones responsible for paying their extra charges. Therefore each of the rooms need to be selected from the ‘Select Room’ box and',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n<>۩=\Z6ܽH׮\\<ƾ==|=\$=\>=\<Kİ=\(\\0=#W;n\\s7\66<u\=\\T`ݼkSٝ>=\\߮2<O=\\\)G\I=\\=x\<\\\$8	`\UD?A\0@H;g\\q=\)=\&;捘<x2=\r8\=@\<*5<\a#;\k=fܤ8=\nE=1\<NH\\V\O\r)$<dH\Zޫ<+<d\\\<S<\}!#k\mڽ>-;\ʼ\@<Q\\"\i**=\\<\J<\\н\<S=i)В\n=E5=M7F8ၽ\\\=DQ=*\\\Q\=\Zmm=\><\\=ֹ=!d;6\%=r\<*\\%s=Ӈ=؊=\h򡇽F=֠=D\3bG+= =3=\昼\=\\<m	`;aw&\<l=<\	m\ڼ\'ۂ\Qm\"\~q=T`\Q=C=.ʣ=ZVK;Y:)/|;9YpI=\4=׹<oK=\2<4\r\r=ۏ\<f$~=aw=&=Fj=h\\߼Oգ=\G\y<0<m\\< Ȁ<\2=+\ݼ\L@3*9<X\3=\\ıLPm=`2ռ[=\Ϋ=\50l\ȹk<J[v\<h!<\\=;\\	\6 [Ƚ߷d=NZ^C^=TRp=Is\=j=Z\v<w\<)\s<%q\\ؼɽn\^=\'\e\=SeJ0\=,\\"=\oku\n$=\\\n;̅=\\s\ٛ<6Lj%MQ=L^;̮V^=\H\<+\Ｏ6<\fkd:D:\<\n@<\U\Nc=\z<<\h$<1<J\P=`\=v\I\	=\\]Z?Vy=uȼѽ\O&=nC=X=ϣ:\"\<;\"k=[Ubv\w߻𼲊<\@/vA-<\b\"<e<R>~+=^\_t\)ռ\\\\<;j7=\n\e<B\;%f=/\<\\\\x۽K=\sK=\'<a=ｕ\b\\\}<~\\na\꼾Uј&ab\\b2C\K<U\<\|pNq;\o=$;=&۽x	uC=^3+\\;\\˽\'\?\<\\\<_=\$<\6\½\I\:\\s\nջbe\N$>9<V<F<\0\=b\:@6\<ۏ=\\<@\a=TS\=MS;ʽә`1P\<\\\0=ՉG[c{Zm֘̽K\\R#\X=\<ʻV&5\"\<\&==X=2ٻ\B=;',NULL),(3154,'ec8ac072-fd4f-4840-9937-d7f598c20e2f',10,'taken forward. The extra charges if present, can be settled is a very easy manner. Since the charges are posted in individuals of the group, they are the ones responsible for paying their extra charges. Therefore each of the rooms need to be selected from the ‘Select Room’ box and their individual bills need to be settled. After entering the payment method and the amount press ‘Enter’ to save the information. If there is another room with an extra charge posted to it then it can also be selected from the ‘Select Room’ box following the same procedure of settlement explained above. When the required amount has been entered and also all the extra charges have been settled click ‘Settle Bill’. A prompt is generated to confirm the action. After clicking ‘Yes’ the bills are settled and now the check out procedure can be initiated. To go ahead with the check out procedure the billing instruction needs to be checked. If the billing instruction says ‘Bill to Travel Agent’ then ‘TA Voucher’ should be selected as the Payment Method. If ‘Payment at Check Out’ is the billing instruction then the amount, currency and mode (cash/credit card) needs to be entered. When the parameters entered are accepted by the system click ‘Check-Out Group’ button. Upon clicking ‘Yes’ at the prompt the group is successfully checked out of the system and out of the hotel. 3.2 Point of Sale Functions 3.2.1 Start a Table The figure above is a screen shot of the main screen of the POS. The numbers on each of the green buttons represent a table number and the color represents its present state. To start a table one must click on the respective table where the current state is vacant. Upon clicking any of the vacant tables a prompt is generated for the server/manager password. After entering the passwords the system asks for the total number of guests being served on that table. Upon entering the required information and pressing ‘Ok’, the ordering panel becomes available from where we can select the items that were ordered by the guest. After the ordering is complete the kitchen is to be notified hence the ‘Send’ button needs to be clicked for the order to be sent to the kitchen. Below is a screen shot of the ordering panel. When the ‘Send’ button is clicked, a printer placed in the kitchen prints the KOT’s together with all the information such as the table number, ordering server, order time and order details in that KOT. The table status also changes from vacant to occupied. 3.2.2 Add more items to an existing Table To add more items to an existing table just click on the respective table to open it. When the ordering screen is screen after entering the right server password, select the items being ordered just as before by clicking their names on the screen and when you’re done click ‘Send’ for the kitchen to be notified. 3.2.3 Settle a Table',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\\k<7\=\xz_<\0Q\\=\¼QQ=^(=\n|=) \Zz<\"rf =Ľ\2\.l=~JQ@l\\(t(#λ\$9;[H7<4\"+=\\=\Zd\<\o\\==\\\;\Gkkl\]<\'͌!\;\n\y\y=t[<\\\hp=ˊ0\}=\f=\8\$<Q\?=ӑI+;\=/Y:Q0꽼^L[<J,\0=E+\L=\5\:8\n=U<WPE1\<E>=<sȏ=9\=r\\Zp9\=t\\\<\,֫5	<`=t\\t\\;c\=\=);Ī=\n\9{lnDܖ=\0\:1F=o\<e@ټ^/D\=O\nNt\=\\;8=\$T>T Ld?=\Iz\=zK\<ؗc<=9q$F=s%=~\d*//=\"G=]\,=\˛	\o|\rlY=\C\n\d߼\\U=\\U\Z=\4OJٽ\5=\})\9R\r\C=C=3\;*˻p==N\=<\I<t\\<jX;=q<Q<x=ۯN\\=\\\<\d;q\W=<\r1\O.Ǽ\w\<(\7r/H=\x91Ȑ=\\=KPR<eԽd\~\\n\fý\\G3;0\^~\;\\eU:ONF\:qf\1\'A=E؅\)R=+>\h=\쨼Ȅz=^B+<M\n=yR5jb=ZZK@T:=;=)=:<c\ pT\\eW]\\@\=sWQ\<b=+Z^;Ө?`<0=\\\\!\=\=3<oF=\]\'=j\Z~=L׼\<;ǮZ==Eo4=\'輿;?\<C=/KH=y2<e@\\\Z=\'\r=\Y=Kýd=_~<\ZNc=\N\=!x=@ɼ\!\Oj=\\#;\zɽ#FлTJWEѕ\\E̼6g鼍\!\u<\?Cd	>a=Bͼ;;<mR\3P#=ڄ1:،=Y|;T\{\=\\C=B\y]}A=0\r6\\=\f=3˫C\ͼ]Ƽ)<\\=Br\;!\:\nj<-=[ⒽBϻ\Ծ=\(]*\I%\\C\0==\׽ \=[\E;\<<\ZM<㠽G\y]<\L5()3_!<P\	<\+K\}\<\nv<^e0\=Ud<]\`	Y3=K:]\\}OA&=\F<)>=n\<=[¢+\Kg5<zzѽiP\K%\ѻ\]=\1f=P3Q-\<\&<o==\"<Ml\;̫\0<\\',NULL),(3155,'ec8ac072-fd4f-4840-9937-d7f598c20e2f',11,'on the respective table to open it. When the ordering screen is screen after entering the right server password, select the items being ordered just as before by clicking their names on the screen and when you’re done click ‘Send’ for the kitchen to be notified. 3.2.3 Settle a Table Open the table which needs to be settled and click ‘Settlement’. Below is the screen shot of the settlement window. A guest may desire to settle a bill in numerous ways such as cash, credit card or post it to the room. After selecting the appropriate payment mode, the amount is to be entered using the keyboard or the key pad provided in the panel. When the correct amount is entered the ‘Amount Tended’ button is to be clicked which will calculate the change that needs to be handed to the customer. To end the table click ‘Accept’. When the ‘Accept’ button is clicked the system makes sure that the entered amount has covered the amount due and only then closes the table and saves all the necessary data for accounting purposes or for any other future reference. 3.2.4 Split a bill Splitting a bill is one of the most important features in a POS that is used for a variety of functions making its application quite handy at times. A bill can be spliced for a minimum of 2 ways and a maximum of the number of items in the bill. For example an order that contains 5 items can only be split 5 ways. To split any order, open the table and click ‘Split’ after which the figure above can be seen. Then click on the individual item that needs to be spliced. When selected, the item appears on the left hand side of the screen. If ‘Split’ button is clicked at this point then the system will split the bill two ways with the selected ‘Red label 30’ appearing as Check 2. Below is a screen shot of splitting the bill in the manner mentioned above. When the bill has been spliced as per the need, ‘Done’ button needs to be clicked which closes the split window and takes us back to the ordering screen but now with an option of selecting which check/bill we want to view shown in figure below on the right. By selecting either Check 1 or Check 2 we can settle them individually as if they were separate tables. The un-splitting of the bill can also be performed at any time by clicking on the ‘Un-Split’ button presented above in the figure on the left. 3.2.5 Add modifications How the food is ordered by the guest might not always be the same even if the same entrée is ordered as different people prefer different way of enjoying their meals and as a hotel/restaurant guests have every right to demand things the way they prefer. Adding modifications as such means informing the kitchen regarding any special requests made by the guest so that',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\\x[=\"rtѼ\\Ľ/M<=p\;HMq=\\={\<!x^uj\"\<m=\\\)\u: =N\<\;$ߔ6=\\<U\n`<N\]:G8=\=\m)$\gSܻ۶߼9\0ۛ<s\/\K<(i\0=?\;&==4:u0=\r*<\´\=\?8f)=\\>:<\d*F\41]=\"\\:p,=Ђ\;]<\䎼:x-=\rN: >oqǽ鐼-QS<&\"<\?<\v4<a=\L;	e\n?h\wi=\?h*\=\n\=	\"=j=a89\;k\\=^=3=O=|<=\ʼ=\^@=wy!_f=\	ݍgX\<6=\-{ע&~=\~ȼ\;\\\=ahH<+Kx=kА;\=g,\<\'!Q*뮽5<`]M\=Pl<x?=7A7\t=]<=ZM@=\q;BK⑽\˻H=?\V=[$P\r>7I=\\=,$=])}<=s<q=X&\C9<\ټ3\<kq\"\U=ĭmʍ\':缇w<<tҽ\K=\[F73s=\6=p=\ra\\\0<\1X}嵽\l?<kvRo󦽲J\rߋ<\#=9\n84=#Rͼ#=\0J\˽ī===\ⒼA\nҼ\n=V	Ua=.\<.h\<!g\2=cl;H=\Z\,<\Z<HC<>7=Q\;љ\n>c\"yDm=1~b\ļ\g<=\\\$mF=8\=)\½i=K\"#@n0˻\/9=\=\nZ<>XK=5<~=*/;kn<\\P\sK\0\=ռu\dZ=\nE=	hUR=j=\v-\=yd<\l9h=:H;i|f;\Oȼ\e/<O;:>{<\\u\n?\=-=x\<\]LYe轉2=\\=\=Y;%<v	=mH6\\<0\n<t뽠=I	>ռ_>i<iX|_^ý\ƼnML=\<7QYtM=PK&\=8.Ű6\Hq<[޽Xl<5=TUT=ryQdjĪE㚽\\ټ\H\<Le\<Zgڼ\=[CjP9;\n=6\2=\\\=b^\\+<\\'\<NE\k;=\;ӭ߼4s\<,=&+P<5H><3@\3<Id=`u<\\\y<m/ϻ\=\Z\r=_=\5=h\g؜H\?L\\<\Z^\;\@^\\ؼq\<\e=\=z=\\\\s\=;\P=\\\w=<\;Zz<\<)\0+T\\',NULL),(3156,'ec8ac072-fd4f-4840-9937-d7f598c20e2f',12,'even if the same entrée is ordered as different people prefer different way of enjoying their meals and as a hotel/restaurant guests have every right to demand things the way they prefer. Adding modifications as such means informing the kitchen regarding any special requests made by the guest so that there are no complications later when the food is delivered to the guest. To access the modification screen the ‘Modification’ button needs to be clicked and the modification can be entered only after the menu item has been selected. Below is a screen shot of the modification window. Any modification can be sent to the kitchen by typing in the requirements either by keyboard or from the screen itself. When the modification is typed, click ‘Done’. This will take us now to the ordering screen where the modification appears in the box presented below. Upon clicking the ‘Send’ button the new order will be sent to the kitchen with the specified instruction. 3.2.6 Void Items Items need to be voided at times for numerous reasons such as for a mistake that the server committed while ordering the wrong item or at other times the guest didn’t necessarily like the food hence he/she decides to change their mind and order some thing else. Therefore to address these issues and many more the system provides for a way to void items. However voiding items as such is not a very good practice as it might create problems with the tax officials during auditing if done frequently. Therefore it is encouraged that the users be alert and calm while entering the order and double check it before sending it over to the kitchen. To void any item select the item from the ordering screen and click ‘Void’. Voiding credentials are only provided to the manager hence a manager password is required to enter the voiding screen. When the correct manager password is entered, the screen below will be seen. Before voiding any item a reason has to be selected. This information will later show up in the managers report so that a close eye can be kept regarding the use of this option. When the reason is selected, ‘Void’ button needs to be clicked which voids the selected item and takes us back to the ordering screen with the revised order list. 3.2.7 Room Post Room Post pertains to posting the restaurant bill into the guest folio so that the guest can pay all the bills at the time of check out. A guest may also be entitled to a meal as per the meal plan purchased hence the server/managers need to be aware of how the bill is to be settled. To complete a Room Post click on ‘Settlement’ and in the settlement window click ‘Room Post’. Below is the screen shot of the room post window. Before posting anything to the room the server/manager should ask the guest his/her room number. The room number is to be cross referenced by entering',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\rL\<p\=Pe<;U=\\_\<E<\I^$\<h-=\4\<\\\\Wׅݫ<@kE\=!;\`Z\K୘<V֨;g\\<\ MlL(4\;=+O<><=}\<\\< c.Z^H-as+w\<8*.$Yȵ\}jWiwK_-\\Ry\ \cҼ=a\q<\\RMQ#k_=|{=\n3;,8:>(8]=~<1ݻq<\=6<\\.=\MWTPfS<9\RBZ\CR<_*\|p=7VK໭Ol<eN\yȠ\</]|=\C=\\\<F*p:[jn?K=]6<]\\}&5+p</=<g\L=o<+=ꉘ=\/(|=P\輑׻\k1\=<w\ݽ\\\\Z#\}=v\n<=P`=D/\=\x\Q\=!\n9sO\jd8=ޒ<\;>h -KH콻	YC5=f\A=\4\63=	bO<f=v\=Ur(=\<ż@!q9\\1</_<+s@=\ք\=l;\qV\r=\"z_ K<<\5>\"U</&B<s̶\'pH\Zj=\Ζ`K=<=\J:A<\\l<c=&\g=\W8=!\g8;	O\\<\:\0=$[=~m=¼\9zwn<n\<\?+<z\\Y=v\;X<\E=Ȕ6;h	\eǼ\\<@x\\'\\<\9;\Z;=\\\#\'\v˼/=k=8<M:\;ޑ;2Rj=cTm=@=*\3ϋR+\Lr<\(=gB&ǽy\\<f#\h\ф<\4<ࡽ@wD\=M7\<M\0v^b;4\=\{=t\'Z\\;CM=_\=\x;:oѽT\¡Gh\Z%`==\'B\<%=F[>H=S\<\J̻=S\= <\0ʼ\衽Ǵ<_T=!&Ċ<[\96%p(=Db=V>IWGfX:\;Q=-=M\;`!~*4տ=\\;\_~\\Z=j:\\\=!w`\=v\\\<\0k=\<\<\"x\\U-3\?=ҍ==\ =&.\\<\w=IW=_w<Q+\=J=L|[Ic>5\:i4FJdL=/={O;a\,F<3\I,ʼK1[<-\<\r4;v=F_<(\=UBRJt\I~<7<]\=\e=1\r_\	=s3>\,\g)\rs[<,<\zM>hGҽa\=DuZ%<SMFP^\Ⱥ.Pw\;\l{=5<៌a<?\=\)A<PC>\	=_<\\\=\䠼F8\"',NULL),(3157,'ec8ac072-fd4f-4840-9937-d7f598c20e2f',13,'complete a Room Post click on ‘Settlement’ and in the settlement window click ‘Room Post’. Below is the screen shot of the room post window. Before posting anything to the room the server/manager should ask the guest his/her room number. The room number is to be cross referenced by entering it in the respective box and pressing the enter key in the keyboard. The figure above shows the information of the guest staying in the room 605 with their respective arrival and departure dates, meal plans and the total amount due. As mentioned before there are two ways to settle the bill. One is to post the bill as a charge so that the bill maybe settled during check out or it can be posted as a meal plan so that the guest is not charged. If ‘Post as Charge’ button is click then the bill will be charged to the guest folio but if the ‘Post as Meal Plan’ button is clicked then bill will be settled as a meal plan. However across different parts of the world including Nepal, alcoholic and other certain beverages are not covered under the meal plan. Hence in that case only the items applicable will be charged as meal plan and a separate bill is created for the other items which cannot be covered by the meal plan. But this new bill can be charged to the room as a charge. 3.3 House Keeping Fuctions The house keeping department of the hotel is constantly made aware of its rooms and its status by the house keeping module of the SDC which provides all the information in real time. During the busy season of a hotel the house keeping department is at its busiest therefore they clean the rooms from floor to floor and during slow seasons the rooms are cleaned as necessary. SDC also provides this similar functionality where the status of rooms can be changed individually or by the floor. Some of the basic functions of house keeping module is explained below. 3.3.1 Change Status Individually. To change the status of any room individually just click on the particular room from the screen shown above. For example we are selecting a room with room number 604 who’s current state is Vacant and Dirty. A room which is Vacant and Dirty can only be made Vacant or Out-of-Order, therefore these are the only two options available. To change the room to a vacant state, just select the option ‘Vacant’ and click on Change Status. 3.3.2 Change Status Floor Wise. To change the status floor wise click ‘Change Status’ button presented below. Upon click it, the above screen is seen. The house keeping provides a way to search the room according to their state and floor. The two screen shots below show where those options are available on the screen. By selecting a particular floor and a particular room state we can search for all the rooms that satisfies our criteria. In the figure',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n<\=r+Y^<\\ټ%=:\.<==y<+Խ\\<\==ELdʼ\$=\\0\<^v=q<Ӏ=%}\'>=jʺ\\`p=\N=P=ˇ9<\\0;\\R\=j^ƣ	̳;\Ǽ\r;\*\|<O=tb?z=k4=:\\;ұ:=\8%m\20=*]sv\09<SM,C\/%uM>\<K<ܞN=TLYcD~g<:<2\=~?<\\0H\<\\;\><\B=s\"\hJ^v];9~ws\'7=2\;j\@SU=d\=]\<p=2X=\%/T\b=\H= >=a=\\r%t;\9=a\n\=!p=_5=E2\\b\F4$=\[*<\{<Z?=]h>d\\P=\<\\^댽\b)y7#=	#)B\q\=ϾjMќ\<鹚=3<A\=+\u=%h~\B[=&<&s>(:H?{6\=\j=\\qh)=	=\9=c=^\Z7\\<?U<JI=ԕ<\\%\=\̻U\I5\<A\<\U\\<\䶽k\=\\\<,K߰<l=\:\<Zҽ7\'\ڽ\r%qFn\6=\|l\I\\\b<^q\\\<\W%=aO17\5~^idt=C\bǯ/=+;=\"a9=))5v=c\¼u;{<k=\jۼa2V.\a<6=\n<Zs<\7\;Ȣ;=:<tǼYݼ^<p\\\>7\0V\к|܌;7\Z=0\(6W=<6_\}^=\ZZ\ة<7\<>=Ђ=\n<W=7=C}#P<\_ai<rV=:c:=\\~4\:=V:װԽb<\\^\\<\\<\i\G=w\=\\)\\Ƽ	z=C&<ͬ콽z\K\Z;><	\:T\Om.G\d=l\g=y:=-F8z=;5=l<D\<=s==^y;Ko=<|ŝ=E\\<[O=A;$C,X4eQǼ;%M4\G=J	:;u<͞B\;TD9d7vPl:4\\|G<\"k</x\I<\\r\}\m2=sW<;Pb=9p˼\\rcǰ=\0=cdlbS\?Mr<u=@Xf:<\>8ҟ=AɇWt=rߐ\a3=XxGK<.J%}N=jU=\^Zy2|ڻ	E=c#1\k\SuAعS\\N+\Ի(\X=\\j=>w9(\q\=n\'h=ŉ<\\=;	(V*s',NULL),(3158,'ec8ac072-fd4f-4840-9937-d7f598c20e2f',14,'a way to search the room according to their state and floor. The two screen shots below show where those options are available on the screen. By selecting a particular floor and a particular room state we can search for all the rooms that satisfies our criteria. In the figure below, we have selected all the rooms in the 6th floor that are currently Vacant and Dirty. The result of our search is seen on the box which is pointed by the arrow . We can individually select the desired rooms by checking them off or if we wish to select all of the rooms at once then ‘Select All’ has to be checked. Now the selected rooms can be either made vacant, out of order or occupied-dirty which is presented on the left top corner of the screen shot presented above. To change the status click ‘Change Status’. A prompt is generated asking if the user is sure of the operation. When clicked ‘Yes’ the status of the rooms get changed. 3.3.3 Maintenance. The maintenance function provided with SDC is not a separate module but just a functionality which enhances the capabilities of the house keeping department. When the house keeping department notices something not working in a room such as the mini bar or the television, they notify the maintenance department regarding the nature of the defect filling out a form which is presented in the above figure under ‘Send Response Request’. After receiving the task the maintenance department on the other hand mobilizes its crews to take the right course of action based upon the information that was passed from the house keeping. Upon completion of the task in hand the maintenance notifies the house keeping and only then the house keeping change the status of the room to its respective state. Below is a screen shot of the form from where the maintenance is notified. After filling out the appropriate fields shown above the task is sent to maintenance by clicking ‘Dispatch to Maintenance’. When maintenance sees the task and completes it as requested, they resolve the task by clicking ‘Set Resolved Time’ which marks the task as Resolved. Below is a screen shot of the Maintenance which can be accessed by clicking ‘View History’ in the figure above.',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \nn;\0ټ\\<\?r=/`=Ln;e[=ce9<t!<\4=\\\<>\y᥼\=\\\}sZ.#(7F=b\J<S\r8r=*/\\<\vT<\\RO<\'==M\w=\\=6~kxVq<\=\\\	@<\H:(YO@\\<\\٨=\=+t\\"<\r=\\=%Q\=v\V=6`=X=&H3$%gG=SN]4\2<\$:i=t]@<_6\\d=wfiXr=K{=\c=	\d=1J˼Ǉ;\6C=Sֽ\).эJ\ =ꊼ\\\<\Lf&\h=\0_Z<0=_2`\;AH6+6?\<sƃ<\<5;6<L\?\7=b<t\<<w\)M7ͽ\v<D=P\19\\\'<M\=);~ؼ\zü:=ܓ,V\\\'\' =\0!(<\=d	 Nz=K,;/\=Ꮌ\`;%0;ƥ=c\x<m\<*=\Aq =j<;Z=5i=7=.<\=:\ixy=X=+\=q+\<\A	\<QD\WV=\--S,=\#\<[=]=g2ͼY6pPV^<%i=ŧ0</\!z=i2g\pG=4cH=d\'=*2̝<h<庻Ov!H\՛<\\&=*!!\\\\\<wO<7\P\<\nS\Pu=>4\gt^(\\=\\<μ\\qRKo<1+6ij3/Sl_+==\#ev;\r\<~Gv7=77ϼ\N=\|<۲=v_F;J.=c\\=G)-y\)C\\\M\=\X<<nP2Nv\>=),F\=\\\p=ht޽\v<ⓗ\"=@<\\\=Tx<DIA!T\\-\\=:\nf=b~<9/YUq=)=^v\F=X:@ŏަ>PU<ӨJ=Pq=ך.RZ;>7<>\'\\\c<l\=Z<[\\<\Ļ;F=.8aM<1[=ǧ<^=y\\nBg<ʒ2\:\<zH<Tgf;Z\S<%н;\7_\\\\\0<\|+֔=\[=M\)	3S\<ftE\n\t7o\R$R\b\\=`\\%\Z=\=F\= T<k\<\\Z<\2Za=:{;l\uC\_\"5<3J=L?a\><=A=7BQe\\F\-=3\=\\&=Q=fO=\b~\5=_1=\ْa.=!?=\1\	Ǽ+<l;jt?\"U=ĕ\\@<	y`ܒ]-L=\q\;\=ǳ1=\<\c<\=\1\<',NULL),(3160,'61b765e5-ae10-4594-beff-e88be67efe3c',0,'Teaching Manual For SilverLine Dot Connector Version: S.10111 By SilverLine System Integrators Pvt. Ltd. Tables of Content. Introduction to SilverLine Dot Connector. Modules. Main Screen. Front Office. Point of Sale (POS). House Keeping. Maintenance. Functions. 3.1 Front Office Functions. 3.1.1 Check In 3.1.1.1 FIT Check In 3.1.1.2 Group Check In 3.1.2 Check Out 3.1.2.1 FIT Check Out 3.1.2.2 Group Check Out 3.1.3 Start Reservation 3.1.3.1 FIT Reservation 3.1.3.2 Group Reservation 3.2 Point of Sale Functions. 3.2.1 Start a Table 3.2.2 Add more item to an existing table 3.2.3 Settle a Table 3.2.4 Split a bill 3.2.5 Add Modifications 3.2.6 Void Items 3.2.8 Room Post 3.3 House Keeping Functions. Reports. Introduction to SilverLine Dot Connector. SilverLine Dot Connector (SDC) is a Property Management System (PMS) which is built for the purpose of managing different departmental operations of a hotel making it convenient to keep track of its day to day activities. With the arrival of computers into the scene, the old ways of maintaining logs of everything manually is long gone. In today’s competitive market its everyone’s aim to stay ahead of the game and one way of doing that is my having a system that helps you do just that. SDC is a system built towards addressing that need of a hotel where all the information needed to run a hotel efficiently is easily accessible with just a few clicks! More than that it integrates the functionality of all different departments of a hotel such as accounting, inventory, housekeeping etc reducing the time, energy and effort into managing all of them from one single point. SDC is one of the most efficient and easy to use PMS in the market. Build with the latest technology in software engineering, SDC provides a very efficient and user friendly operations making it very convenient for hotel staff to meet with the requirements of its daily operation. Some of its key features are as follows: SDC is a state of the art system that is capable of handling reservations for a hotel of any size. It is intelligent enough to interconnect different departments of a hotel, keeping them all informed about their duties and tasks in hand. The front office module gives an over view of the different states of different rooms (such as vacant-dirty or out-of-order), and these states are denoted by different color indexes helping the staff know everything they want with just a click. The reservation module is a full proof and fully tested part of the software that handles different information about the incoming guests such as their likes, and dislikes, room preferences and meal-plan, flight information. The guest history tracking system in the software makes reservations for repeated guests very simple and effective. The house keeping module also provides a visual over view for different rooms to be cleaned. The system provides a mechanism to clear the status of different rooms floor by floor or room by room as the situation demands. A maintenance module constantly keeps the maintenance',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n> :\4=y\;%\\<GK\<=ɖ;<2=trj=<jz=\<8)|=^\?<bBW<;\\=\;\-实= \rd=\\"<\Zf\<)\\uy=~6H:\r<.6=*z=.\\U=q\=\\>\0\h\(FP2&=\<̏XRb=\\<pe=Ůљ=\<J=z=\&\E\\;\c\?fo\<9Ҽ\i4\=WQB=ȋ12DGt-~=$=Ix=\\0<s=#ŽǓ\ >3^μF\r;\\9	i=\B=<oQ;\Z\MO=\j=[\L&;\MEg\Z\T9=:A<L=Fi=?\]a)f\\o\)B\:NF<:\#Tj\\	m\h5h\Q\S.t	=L).<=qS=3\0<C\;\+\<L=i	GZ\Tb9YGN=RL\<=\ϋ=;\"K=!tdL~\㬻y\;C\Ρ=|s=W6\:u\ѼS\2\Q=[ɼ~p=#L<xn=n=\/={<u=2=l\"ۼ0\\`=\x\r=0\?#\0Ϣ	US\Y.\]ӻ>#=)d\$=A =\=@ȉ\0A=DI\D<;;\<\\	{$$RkKؼ/_\Ol\1(3<J0x<KNL=$uG\=R\rd+ku;)*\<\'N<]:a&Gҍ<7=\\=RVO\<\r\\\;ː<\\N5UW=\뽱\"\n\}<t⡼C?7\_>\Z\<2_8=\\n=Av\>/8VVX<\p<[n\=\(=	\6/\\;=,>;O\r<\>a\"\L\0\<\=!;mx=2_\<q\7<_\"+ۋ6\z\oQ\ {@=)<+Tә%\;V^t=\=g~\;{=\=O%P=ʣ2qKy=\1>e=\j\n/^><C1 W\Ż\\k=\żpYH=\z=ȩ`rvr6\\\0=v=\=\=7	Q4=\\p3&H<SCN<\"H켃8\~\Z=\F~^=\`ӼȄ\G\"=\q\<䟯=\<\n\L<\I=\?9\=\L`=\_K\=\QƖו\ri$<<W\E\Z>=\J.Ҽ=HE\r<ߺ8=~]7=\\8\#)Y=\;b=\q\<s\=l.J;\\;f=p\吽\'\=\*=\<Ǎ==\=팻\0v=\aB<]=+\==\"h>ŁEn\:*>\Z;7\=θ5=xD%vz?C8(\0\:<\=`;<,4=&+t=','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3161,'61b765e5-ae10-4594-beff-e88be67efe3c',1,'very simple and effective. The house keeping module also provides a visual over view for different rooms to be cleaned. The system provides a mechanism to clear the status of different rooms floor by floor or room by room as the situation demands. A maintenance module constantly keeps the maintenance department at its toes with its constant reminder of the things that need to be addressed. Housekeeping department notifies the maintenance department instantly about any breakages or failures noticed during a cleaning procedure there by reducing the reaction time. A state of the art POS system is also a part of this software that takes care of all the restaurant management needs. The POS provides a visual overview of the entire restaurant with its exact floor plan and table numbering to help the manager and the servers know the status of different tables. Different color codes are used to signify different status of tables, such as Vacant or Occupied, which helps to know which tables are available for the guests walking in. The POS is best utilized with a touch screen monitor as the ordering process will be faster. Each menu item is listed under its own course list, helping servers or managers to know where to look for any particular menu item as needed. After the ordering is complete the order is sent with a push of a button. Upon doing so, all the bar items get printed in the bar and the kitchen items get printed in the kitchen reducing the need of having to send someone to the kitchen or the bar to inform the respective stations. Once the order is sent, it cannot be voided unless approved by the manager. Any alterations or special requests from the guests regarding any items ordered are entered into the system at the time of ordering which is printed at the respective terminals along with the items ordered so that the respective terminals are informed about such modifications. A bill splitting feature allows the bill to be split as requested by the customer which can be printed accordingly. A bill printing system is also a part of the software that prints the bills as necessary. Room posting for different guests according to their meal plan is also incorporated into the system. Reporting includes daily arrival, departure and stay-over reports. The end of the day report is also available with the exact cash count of both the local and foreign currencies. Any further reporting options preferred can also be incorporated upon request. These are just some of the general features of the PMS. Let us now go deeper into its individual module operations. Modules Just like any other PMS in the market, SDC covers all the basic modules required to run a successful hotel business. 70% of the revenue generated by a hotel comes from the guests that come to stay in the hotel, therefore a system as such requires every attention to details as far as guests are concerned. SDC',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\\ZE<\$Gv+Q \1\=eU;\U=np\n+8==%-=	툼J?[7W=\"\<\_*5);HI¼\9\vC=<\d< \t<t\Ľ5}e<׺j\=<U<\\T<1s=\n}L(j$w##\\\'x\<\\=֫eGG(xFA\\F\H=\"N=}M=T=L=\͊ZʌK=$]\P<+%\r=1<<9\0=eS\\:C\<Λ=\"nGu\<N\\\\2<ks^;\>\n\3<.G<l3`d\ZQGҘ\k=wH_;v9=*`\><\0}<\=Z	<Z\<\\!=Ti<\Ɏ<\\\!<\\<Z.=鐜n\<=?\\d\r*ls\< <\Z=/;rB=\IĻJ8;bpH=KG===\}9	5LC\lhG\\<q/;\=<N59\{\g>\v=R\Z=	\=\z<`O=	\Z\nD=\=\\n\r;\\(<;<vO<>\<wA<\>|=9<o=R\oj;2\=-=Ud<\\нnJ\n\'ӂ!mk9\fdTm\rd=\\<0sq{=Т7=\<Yuj\Z_\\<dzJͼ׏=getA=-<.;yg<z8<k2[=\noD\<w;1=g\|=Us\0=fz;\#\VG}\s#ڼ\\=2j\:%5\0\\<-GC</l=Go\'U=I \<<̼9=K\\n\\0=i\0l\Cg\ԶϽEW<D,\Z\\<5ɽtL=fqs<|!=\y\T[ýQ=\\}[\=/JJ1<\\\A-L=](ú\:^5D+\c⾻?f:<\\}=:=gW=\'==Ⓖ-><R$\I=)D\ؽ\*;By{\G\YT	<+k,=\'Aru(<\8\\m8=@\5ʙ:=\U\=	Ui?=Ē޼+ =$~\޼\#\<0!$=\G9(.\ZH;~$;LD,\=¼=Q==ǁ1=g\ȟ=\\&<kFVU\aC2=\lFL<Ppܽ|3F<5=W=5=;=\:\܍=g\Z|=Փ=_\W@=:E;+ﺦ<=)2=fDzt<:\'=Y\<=1s\=߭<\\<sqx<uP=\\"<t/P{5=\\\<\\}{۽&L\r=d,=a\\<\e`S\S=_T\K\w=,#\>K\>\<\\'<\\'=\\\"~','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3162,'61b765e5-ae10-4594-beff-e88be67efe3c',2,'market, SDC covers all the basic modules required to run a successful hotel business. 70% of the revenue generated by a hotel comes from the guests that come to stay in the hotel, therefore a system as such requires every attention to details as far as guests are concerned. SDC provides a state of the art front office reservation system that allows to know everything about a guest including any preferences in regards to dinning, lodging or any special requests that guests might have. Main Screen (fig 2.1) Apart from that house keeping also plays an important part in serving the guests as per their need. Restaurants are another place where the guests need to be served in a very professional manner. All of these operations are carried out by SDC which help the hotel staff to address the needed of the guest in a very professional and timely manner. Lets look at the operations of each of these modules. The above is a screen shot of SDC main screen. This is the main entry point of the system. On a first glace it gives all the statistics of the hotel that is relevant to the day. Values such as occupancy percentage and rooms to sell are very closely watched throughout the day as that determines the total revenue generated at the end of the day and also gives an idea of how many more guests can a hotel accommodate if new guests arrive as walk ins. Clicking in one of these parameters will give use more details pertaining to the parameters, such as if we double click “Total VIP’s” then a list of all the VIP’s with their room numbers will be seen on the screen. Shown below are 5 buttons which are the entry point to each of the mentioned modules. They are as follows: Front Office: By clicking in the above button in the SDC main screen, the front office of a hotel is seen. Front office module covers all the reservations together with the status of all the different rooms of a hotel. Settlement and viewing guest folio is also done from this module. Point of sale (POS): By clicking in the above button in the SDC, the POS can be accessed. POS is a module that serves as a restaurant management system for the hotels. Each restaurant of a hotel has its own terminal or POS from where it is accessed and used. House Keeping : By clicking on the above button, the House Keeping module can be accessed. House keeping module provides the house keeping department with the status of different rooms where by they know which rooms have to be cleaned or cleared. Accounting : By clicking on the above button, accounting module is viewed. Inventory Management : By clicking on the above button, Inventory Management module is accessed. Apart from accessing many different modules, SDC main screen also gives an over view of different time zones of different parts of the world,',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\<\\ἰ\rq<#80u=Wy=Ẻ7ʔ=\\\;IS.S<]<WDp(b=fQŽ=r7|oN=\I\B\ Ѻyo<\\\*<+\;{±< &{B=/˖=\Z!>3\<\'-=qλ\`ؽz`<}<Zi<Լ?\AλzaJKݡ=Ȕ\ޟ=Z=bs=0=o\=	\b̓\<fd=!s\<v<\[<\Z<야ns\:5\<W.<fs\pļ<\ZJ֐8\=20z\<:!=\'jMI\<>\{mdb=yx\\r<|=㶙<)E0=\\=\Ž\'&\y=ώ<\\_=T=q=\\Z\g\a>DI=S\Ż9X5a\˽	a=);\ļȖ\{]=l\\=\0ܼs<Õ\Z\\<\Zc(ҏ:H{H=̾\	f\ýļ&oM\y<\\<\C\n/5=jA<0먼&l\<E\<U\s=ޣ<\<\m=g\\0=\,\\<\\\<@\=: <\`P=ڃ<(\<K=j<<>p=!<<v\Z=g=^\\<yt=Ħ\ƻ;\Sv\\\<gJE=\۽	=Z\\X\<aH\=\	\Z\0\\=(gpf[;씽<`Q׽@\\G\<q~}\\n\jK#[<8i:\$xԻR=(k\\ro< <\<H\0<v\\\f\"%:\=]	#=|ݓ< \H`}b=ʉ\'_D\<\\\<.1=:7#<\\\`	&<3\Zik\=_\n\'쫅\\\<f?\ܺ樽\D\=U;ZCڂ=\"\;\=\˼\'𼆶\'\==Y[=\\ΏeU|\q:d==\Z=\\<L<nT=\=x\lFcVB=\n;>*>1Br\<\xX#6(7i~\m<Ê\w|<\=m=&\*=Ҩ<f\=\+\\v;\=\`3O{=}\,q 0wWJ\<\Jҽ\\Z\Ɗ;\L=\p\#\?ezμ \H\ޖtE<\Ha\"<\nOͽ<l\\Z=\Κ\⇳RnF\A0<\<8X0\\'g<X!=\J<\\Z=~*r=\j<\^]A;#Eǻ\W>x|B<\<B:IZ#=P5\6\<cl25%=L7;ǟ;\=+=\9=$>\=32<y><ݼD=\z/=ڐ<*+\<\Z=\D~<\n<\LB<7[k=\<<T\\׃=n)\=\=8Z!\k=\\<\6\=\"/o\\<','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3163,'61b765e5-ae10-4594-beff-e88be67efe3c',3,'Accounting : By clicking on the above button, accounting module is viewed. Inventory Management : By clicking on the above button, Inventory Management module is accessed. Apart from accessing many different modules, SDC main screen also gives an over view of different time zones of different parts of the world, and also a small calendar which is helpful in many different areas. Now let us go deeper into each of the modules of SDC. 2.2 Front Office. 2.2.1 Overview : The screen shot seen above is from the front office screen. Individual rectangles denote individual rooms of a hotel with their current status being represented by the color of these rectangles. For example, rooms 701 and 702 are out of order therefore they appear in a grey color, and the legend present in the right hand corner represents exactly just that. On the upper right hand corner there are 5 buttons. They are: 2.2.2 Refresh Button: Refreshes the display screen and updates the current house status. 2.2.3 Find Button: Upon entering guest room number in the highlighted textbox the user can press the Find button or press ‘Enter’ to view the room details. 2.2.4 Rates Button: Pressing the Rates Button will display the different rates offered in the hotel . Rates such as CP, MAP, BB can be seen with their individual breakdown of their room rates and meal plan rates. 2.2.5 View Report Button: Clicking on the View Report button, different reports can be seen. Details of different reports are covered in further sections. 2.2.6 Drop Down Menu Functions: Fig 2.2 Buttons Fig 2.3 Room State Fig 2.4 Room Type There are three Drop Down menus present in the front office screens which are highlighted above. The first one gives you the list of different room types present in the hotel such as Single, Double, Suite etc. The second one contains different room states as such Vacant, Out-of-order, Occupied etc. Selecting (Fig 2.5) different combinations of room states and room types and pressing the Find button or enter, the user can view the desired room having the selected states and types. For example in figure 2.2 and 2.3 user wishes to view all the single rooms in a hotel that are vacant. (Fig 2.5) Given below is a screen shot of the result where different room number and their corresponding states are seen. Fig (2.6) 2.2.7 View Room Button: In the above figure if one clicked room number 605 which is highlighted with the blue shade (indicating that the room is occupied), one would also be able to view the details of the room. The Figure is given below. 2.2.8 Reservation. Overview Fig (2.7) The figure above is from the Registration screen of the SDC. There are two types of reservations namely FIT Reservation and Group Reservation, which can be viewed by selecting the respective buttons shown below in figures 2.8 and 2.9. (FIT Reservation button or Group Reservation button). The result of the desired query can be seen',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \nF<-~vMY=tt=\\=\C<hV9=Z&O=x^li2=\`\\n;j͇\$<s 4<\\8<	{»rbb¼\e\a<aY\ZM=\<췽 \Z\<=i+=Cr=\A=F!n\\[\=l|ru\"\<иZF;\0<~+l׼u\0<\={=\P<B\=^7<,	><f\Ѽ\\;]E\;\0*\<\\l\<<jL+=`ۼ\v=v\';˸-\\\\N<}0<<\\\<7AbFq<\\@WJ=x*!v=<^i<\E<ߜ\Z<\ջF(= \':+\̼k<P#:|Bae==M\`n1=,=\\<=Q_c<Σ\=|\<A1\0\\r+0r=/%\Ģ:@;,\<\rG=Z\.\=\q`dN:g\K+u\H=Q\	u&Ė#CҪ<\">\&<\.\Ӹ;\_=o\<_e<~=\#K !\2Jָ\=bﺻ&i(YY=\ּ\=u^&>\_=~\=6\<s;v;=\C=jc=M<b{5=O	;H\	<\\<\(FmkQ\Nm=\\nU=X\<QX=\Nq=Pj\\(ܧ\]꼖Q<іŽ^<q\55Q;-=c7=M\Aj=V^\\r=S\⼳\"=\nA\&Sn/[=:\\\;>1fϼeX\q\;	\"\\ZЩ&=f\\0pp=NZ\弳Opa\\Z\r8.=*=\\Z=\q\\Sيؽ\[Nk\9S\<l<س<\<vݟ<<]\^<*PSu==*<lܽr\'<wdZ\`={7.\"O\|&\=\G[=\\\;<tE\7*q\0\=8[=P.-<\r=Itj^h=\`=\>0&ͽr<.5U\:Y=\<N+<ZŻች\\7 Eļ!\ս\\=\\\:\\d\=ȩ<ܯ\<c;\h=\}X:w=~ZP\Z=Ͳ\r޼ԝ\\1HW\Xz\uC.[o8ҍ;Tsj\&7z:?\\\\8j<;	-\=g=̼󲁳\Tk@\:\}*=fvBc=\\\=OW\\=	-缧\"=.\=*<qrI\Z=7=oW;GDZƼc=c}Tc=1@o<MMK>=[F\=ʉ=\O=(G¼}Y=؆5<bTjt\=PY@=\ަ=I0Ca⎱u=-<Òu\]CBU<!}\.\\%Ǽ[\=\Ql\̼\nw\;\\<\Z\<\\<\<5k=ե{Y<','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3164,'61b765e5-ae10-4594-beff-e88be67efe3c',4,'the Registration screen of the SDC. There are two types of reservations namely FIT Reservation and Group Reservation, which can be viewed by selecting the respective buttons shown below in figures 2.8 and 2.9. (FIT Reservation button or Group Reservation button). The result of the desired query can be seen in the box presented above. Fig (2.8) Fig (2.9) Fig (2.10) By clicking on the In House Guest button (Figure 2.10), the list of in house guests can be viewed. Fig (2.11) One can also perform any search that is based towards the guest’s first name, last name or the reservation ID that is provided at the time of reservation. Any such queries can be typed in the box located right below the reservation buttons shown in Figure 2.12. Fig (2.12) On the upper right hand corner of the Reservation/Registration window, there is a cluster of different buttons that provide access to different functionality to the user. Let us view each of these in detail. 2.2.9 REFRESH Button: The REFRESH button refreshes the view of either FIT reservation list or the Group reservation list or the in house guest list, depending upon which button is clicked, i.e. FIT Reservation Button or the Group Reservation Button or In House Guest Button (Refer to Figure 2.8, 2.9, 2.10). 2.2.10 START Button: By clicking the START Button, one can start making a reservation for either an FIT or a group. The details of how to create a reservation is described in later chapters. 2.2.11 CANCEL Button: By clicking the CANCEL Button, one can cancel a reservation. 2.2.12 GROUP CONTRACTS Button: The GROUP CONTRACTS button gives us access to information pertaining to different group reservation contracts a hotel may have with companies and travel agencies. Without any such contracts, a hotel may not choose to do any business with other companies. A contract includes important figures such as number and types of room, rates and dates at which the contract ends. The details are described in later chapters of how to create a group contract. 2.2.13 UPGRADE Button: The UPGRADE button takes us to the window where a reservation can be upgraded to other options provided by the hotel. 2.2.17 ADD ROOMS Button: The ADD ROOMS button adds more rooms to a reservation. 2.2.15 DEPOSITE Button: During the time of check in, guests may be asked for some deposits which can be entered in a window that is accessed by clicking in on the DEPOSITE button. The details are coming later in the chapters. 2.2.16 TODAY’S ARRIVAL Button: By clicking on the TODAY’S ARRIVAL button, one can view all the reservations that are arriving on the date it is clicked. 2.2.17 CHECK-IN Button: The CHECK-IN button takes us to the window where a guest that has a reservation and who is arriving today can be checked in. There are other information that is gathered from the guest at the time of check in which needs to be entered into the software. The guest check',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \noBv)+\W=\=G\= =[\H!̭K=ͯNu\<I$m\\<@!;7=\ok{?<\Lt<\}=Ͱ<R\X!MO\tYeJ=:=,=:@>u5=L̽\5Vv	GC]VFlè<\\"\;D\Z==5%=t^;\k\;=/\r>ur@\Ȼ:Q=Tm<\"=\JkN~\2.=c\o=lA.*Q==ZN\F+t\\\\=.	<w\=\\0<\}&\(\<n=w\\d;2%=Mc<-\'<\`6^\\\\\lt=MJ\$Ƽ=\\<\\?\pO=Ib=e\\n=-ϼJV\=!\,=}/Ey\\1\=\1/u:8\r\ݽ=<\rּc =&o,h4=i`	=\}r<\YE	Y\`5gkY;\n6\G\z\n9WZ\;\bȼ=l^\A=t+<\\n5y=\g%\ջ;\\k\=pyD=K=[&=(\<h=O<=/H=\\<\\E=lp{<\ͼ2rἴL;\\b\g=M\<}a=d\m\ܼ\x1=x\=\l\\<:%\'J==ZG<\o;\s\<H2=MZ[]\ȟ\b\n*=}\4>1=vspH?<P%t\f\";fk\'\\<H\Ͻ3\\=|(Ys<#\q=Q\nT`\mt44<K\\M=\<a1c\1=H9KlM\r=t$\\"T\<\\=L\B=KH1ꉷ\9=\y۹\\\<\0o=<7\0c<p\켷\n\\\P=4;N!H<>ae=ɝ;>{=W4\=k\Q<\\</=*si=\-=@\Z\ֵ;<M\dNJ=H=(ּ\oGo<x̽ ĺ=<\Ar\w\n;K\\z=F=\p|ЃA=\V<ùu\L8?d<ċ\oYi=\L=t?\D=\a<¼\\<\=1;mUAu<ٝ\\Լ\|\<\8X\\:=&\0=\o(<㺣D?=\8\'=K̼8<\\=\=%F!=Ӫ;u\>\<_\\\<\cg(;{n/\mvY*p;\JR\V=鲪_\\\=ěJ\=\Ź<v=Ac:Oj\j=\\=K;D;ʼ\\\ܼ\\\<,;&/\Z=\{<\r><m=\ ==7=>\\]\0\\=`\\\=p\;<\\l=aHy=NX=E7=s&\<~K	aP|׽\\}<\\S	=q۹\=f!<HgĻ@=\֟w<','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3165,'61b765e5-ae10-4594-beff-e88be67efe3c',5,'CHECK-IN button takes us to the window where a guest that has a reservation and who is arriving today can be checked in. There are other information that is gathered from the guest at the time of check in which needs to be entered into the software. The guest check in process is described in detail in later chapters. 2.2.18 VIEW DETAILS Button: The VIEW DETAILS button shows details such as guest details pertaining to either FIT reservation or Group reservation. When the in house guest list is viewed by clicking the In House Guest button (Figure 2.10), the details of each guest can be viewed by clicking the respective guest and after that then VIEW DETAILS Button. 2.2.19 EDIT Button: The EDIT button takes us to the window from where reservation details are edited. This feature, together with many other features is password protected so that only the person with the authorized privilege can make such changes. 2.2.20 ARRIVAL/DEPARTURE Button: The ARRIVAL/DEPARTURE button leads us to a command centre from where we are view the arrival and departure records. These records can be viewed according to their dates. Below is an example of such logs. 2.3 Point of Sale The point of sale (POS) of the SDC is concerned with the day to day activities of a particular restaurant and billing. The POS handles operations like ordering, notifying the kitchen, settling a table or posting the charge to the room of the in guest. Below is a screen shot of the POS main. The main screen of the POS represents the exact floor plan of the restaurant with its table numbers and other details regarding the location of its exits and bars. When trying to access the POS from the main screen of SDC, a prompt is generated asking which restaurant is to be entered. Upon selecting the desired restaurant its corresponding floor plan is fetched and shown on the screen. The main screen provides some valuable information such as which tables are occupied or vacant or which tables are departing making it easier for servers and managers alike to be better prepared for their service. The POS and all of its functions are described in detail in the further sections on POS Functions. 2.4 House Keeping. The house keeping module in the SDC is designed so that the house keeping department of a hotel is fully notified at all times, the different statuses a room may have during any particular time of day so that everyone working in and around is kept notified. Below is a screen shot of the house keeping module. Shown above is a listing of different rooms and their respective status. Just looking at the above screen the house keeping department is made aware of how many rooms are checking out, how many rooms are occupied and dirty and so on so that as soon as the rooms become available they are cleaned and made ready for future guests. Rooms of different categories can',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\0\<p\<!@&<}|=\\==O\z\<\_=\\u<P\;\\<\n\"\μ\Ƚ\\\r=HO=rM=|hm==䢼]p\\Z;\h:\W=\\ö==G\&S`ꋼ\0h\;R><ws\<Fa\<\=\>\'v{\\sn\=\f\<g|=SVM=\*wS֩=<\'qtnkJB=EK;\?+:=%Km\,ݼ\5=!\\T\\t=0W>\nc,\H\<\,}=\-~ͫ7\\n=\晽q\]<n<\\<<\<j\<\\c\\\;=<\\\μ\~޼n\<;8<-.1aL==*>=N̳<B=\|7=K	\	>O<\<5\ͼF}{@*=bA=U\\<\N<\f=\u=\s=O`-=F;Ҽ\`q쳽?)t==	\U*\\rRmSx@p_=2<V2\\nü:p;\\<=\۽/=삽\\<ZV=ݺ\n\\=r˶;ќ<ސ(=\\U\;R\=\0Ү;\Y=\*=1	=\ȅ<\'\e;ͼ\B\\\\<b<4V\>\\_<6Ѫ\\69l̉YE}4\PT\\\"\=跕<h\<ˡ!=\=mwL͏<6\]I\>yȫ<@>\0u\"=\_݈<\\pU/Hk\?{kVQ\=;#l,<($+<1<w\8\w\</=\;{#=Fg=Ǖ[= /A\u<<9&}\'z`<\nἯ|@gh2	<\\\E[=\.<\"م=\a\\\=z\;d\n\ʽ?\߱<ɼ\ګ\\r\8\\ʽMw_ \<oxȐV=U?=ѻO=d_<X=\(<5\<=\"=\L={ͼB\_<tcŒ=]L=ۦ=\U=n%{5=j6f=\\\n=\.7.\=L\<:=nÇˇ=h\gP\\;+\=\\_=k<%)\\=[\\\y=\:=ާ1znC(=\===\p=\	)\<ۈ;\{=#\\=Z\m\s:V\.;)\<\^h\xj\TR$<虛%\|;2%Lz)<\½T;S=\\<aQ=L\zƙ:l;\<\r,<;w<?=(\\̽\&=a֢=\'5Z\\\ީj2\<*2ݻ\r^=\cK<2\y<Z\5=\n9h2@= S=\=_LJ=\=\<F=$=\\\;\f=\	=\\=n<k\f\\\=as	<6\ܻ5)^༫P,ygP=7C(==x鷽\'e>A$):`<\س=$(','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3166,'61b765e5-ae10-4594-beff-e88be67efe3c',6,'the above screen the house keeping department is made aware of how many rooms are checking out, how many rooms are occupied and dirty and so on so that as soon as the rooms become available they are cleaned and made ready for future guests. Rooms of different categories can be searched by clicking on the respective buttons and clicking the ‘Find’ button. The complete function of house keeping is explained in the House keeping function section. Functions The numerous functions available in SDC enable one to better understand how a hotel operates on a day to day basis. From tracking guest folio, to viewing extra charges occurred during the guest’s stay, SDC provides the simplest of interfaces to carry out all the operations of a hotel in a very convenient and efficient manner. SDC also supports the flexibility of posting the charges from a restaurant to the guest’s room. Hence the operation capabilities of SDC expand into integrating different departmental functions of a hotel so that various tasks can be accomplished quicker. Let us look deeper into these different functionalities. 3.1 Front Office Funtions. 3.1.1 Guest Check In. Front Office is a place where the guests interact with the hotel formally for the first time, therefore it is very important for anyone working in the front office to be prepared with all the necessary details one might need during check in. On clicking the ‘Today’s Arrival’ button shown in the figure below, the user is able to view all the reservation details of all the guests or groups arriving today depending upon the selected reservation view. (FIT or Group) The procedure of checking in guests belonging to FIT or Group reservation is slightly different with one another. Let us go deeper into each of the following. 3.1.1.1 FIT Check In. As mentioned above, the list of reservations that are arriving today can be viewed by selecting the FIT reservation and clicking the Today’s Arrival button on the top. The reservation system searches for all the reservations that are arriving today and gives the result as shown below. The figure above shows two reservations that are currently scheduled to arrive today. By clicking on the individual listings we can view the details on the right side of the screen. We can see that for reservation 19, the assigned room number is shown as 0 and for reservation 20 the room number is shown as 602. This means that for the reservations having their room number as 0, individual room(s) will be selected at the time of check in and for the reservation with a room number other than 0, 602 in this case, a separate room is kept reserved. This is usually the case if the reservation is for a VIP guest. The above figure shows the details of the selected reservation whose arrival date is today. To check in guests, click the button ‘Check-In’ which is shown below. If the arrival date in the selected reservation matches with today’s',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n5\W<\v,@N\<\=߾\'=\"=j3\\<|<yY <U\\;*+4ƹ\r=]\	z=ܔh=s`tcp:<z:e&<Լ	&\0L(Ͻkj=@\=~=,6G<G3W\%<\'\<m<e\|\,F<wLe=c\ \\"|\;I=ʝ=sZW=\%k=\^<=\-=L܋Y\fZ\B;=4=\<Yd.:]>F=\"\=\\Zd )=|`i<\ʷf\\<3ح^my31=s\<Qc=K\γ=\'\0@;R\<c7:ûŨ=R\'=\\n\=W\\z$ɜa<Ë=j <\\\<-\<7Q=A;C..>\<\]\;4Ioc=;=.@\(!OP_O=-\\=lRy?=\\ȺF#=\Qt\<\阽M\\=\\	퀼[n<\ =2<0:=\Ԑ=]=tnZV)=\c\8\y`=Y\0Y<\W<\w=L<\H\,=\?6F=a\\<h=*d<x=\=d<JZ<\<G\:\<=$OV-=\{O\\Wa<M\,˽Gԙ<W`Y<.=I\Z<J<\\=ϼ\\\=ZNf\!&=?f;jP9r=7Qɽ{%e=\a;^\n\,=ؐ\p<:c\G;=g\WN\.rA<\"sMsO0\r=@`QUߪ\"@A\}\<E\<y)<em7qh=\}Il5=zQ{ꪭ=\Z\&==\\R<C^0\\9`i\\=y^9ݽ\\Dm\^M\Q<q0a=\j4D\0>\h=ڨf\\\!\"=\;剎<6<GOWp\Խ\y9M=\9===wxD=\b\\*=\0!=|\\0$b?=F@/\z<nŽ9\<gURuU\υ\4r\\>=OW<R\\:z\"=\0M=<\;<$\s=\\=FX\Z\Q=\\4\~g=p=\fO_KaE\r<\<v:^O\\\d;L\z\_<\;ﱼT\~\Ҽ#\BiLV\C;t@<LI\}?,= r_U=򿌼qhZ2\H<!<=ev\drO\B.!<7=\0\0;3\\r=\'+=\=:M\\ȽS=i=<|<Dkv.m.p=C׼v\ =%<e<ScĻ.=&QK=]6=$>9=l\\<\m;6_=ߞ\=3 =Å_=Q\=s\"\&\qӽ?\;	˼\S<\r<bs<+c\5&w=}fs<H|=,%$=ð=5\\\r=\Ze\i<','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3167,'61b765e5-ae10-4594-beff-e88be67efe3c',7,'is usually the case if the reservation is for a VIP guest. The above figure shows the details of the selected reservation whose arrival date is today. To check in guests, click the button ‘Check-In’ which is shown below. If the arrival date in the selected reservation matches with today’s date only then a check-in window is presented to the user. The figure below shows the window from where we can check in the guests. The figure above shows the terminal from where guests are checked into their rooms. As mentioned before if the room hasn’t been selected during the process of saving the reservation, then 0 appears as the selected room number and the system will ask the user to select a room first before entering any guest information. The system searches for available rooms based on the room type which was requested at the time of reservation and presents the options in the right hand corner of the screen. The figure above shows the interface from where a room is selected by just clicking the room number. (Note: Guest check-in is only possible after a room as has been assigned). When a room number is selected, a prompt is presented to make sure that the user intended to select that particular room. After pressing ‘Ok’, the selected room appears in Red as shown below. Now we are ready to enter guest information into the system so that the check in procedure can be completed and keys can be issued to the guest. The figure shown above is the terminal from where we enter all the guest information during the process of check-in. The entered information of the guest is saved by the system and it can be retrieved again in the future if the same guest decides to pay another visit. This type of guest tracking technology is found across all different PMS’s around the world and is one of the most helpful tool with which a hotel can understand more about its relationship with its guests. Let’s move in deeper into the details of the final stage of guest check in. Upon clicking the ‘Check-In’ button the above terminal is seen. The ‘Enter Guest Information’ box is already filled by the system since the guest information was already saved during the creation of the reservation. To save the information, just click ‘Add Guest’. The system only lets the user check in a specified number of guests, which was entered at the time of saving the reservation hence it keeps count of the number of guests entered. If the number of guests entered equals to the number of guests specified, a prompt is generated to let the user know that the guest assignment has been completed and that the FIT check in process is complete. 3.1.1.2 Group Check In. Group check in is quite similar to FIT check in with minor difference. Below is a screen shot of the group check in module which can be accessed by',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\j\=\<ȚibCI=)=L=T\=ݣy\\=Z\<T\<)6ɼ\E<\<=%ؼ|ӽI/=ME=\\<\dH<`	\@߼2<<1莽G=<6=)kMX\\=W=\S:=t=ޏ\H\AAǜ\ȺE$厽UY|\1;\=\r\0K\<\s֊=C<;V=r<\<\ƦU\=1e	usƼrмD\!\\nh\'\x<p\ag=~콫͞=\;#\\r\_o:\\DTP\.g+=0πp)!Q\'ʬ+\h;x\<\y=\\;P@\)&$=\U\yt4O=ę#=wR6=?a\=\\_\<\=\\=\:K.T=\<M6\\=\r\<$&:=JKV\r<\;\	>\;\a\!=yr=\=:Y<>4!=Kcw<=_Un\D\bq=ռ\	ʉ:\$kb	<\lv\<L-<s\r)t\;<N3\\\=u\R6r\\=Z<\>5\=\=8=h=Sļ_<&<=_%=o\j:T=:>Hǆ#%m\"\3F==x=\\R\'<\Z\|ņ7\\n<\\XV<	Wf\<\r=\\=\\\\j=`9c<bۃ\`\<\w+<eyƼq$\$=\\\ٗᄕ\"RX\"f7L=\̤\ғ<	\<Fw<\(\^ζ\\=k-NPq=]I\*<an<\b<yviMP\<W7-=\I\<\'2=%=?Aѥ=t\9\j\Nac^\]ma_*v\0=\=H~;\==-V=V;(\\Z=M\<\N#=z\uj̼\\U;9֎=b=t>\(8ػ\;=\W\=\!\y==\b\\=L,X<4\\ڌ<\ʓ\j=\=eC=e{;22\<\'ֻ/:Fm2<\=Z;_\0H|>G=V+dýM=\;w\˽\\8==Ϝ=Q$;?/%y.ʀS=Y\0/y<\Zz<=*PK^>6\\0{<\\\~5%b\\<\Z{\\f<O5\nFY9\EӼ﫼:VT\D⽬K\"A|/C\Z̼8\<\\E=\U%;\\ǻ<tP2\A<\\0<|v<4ߚ\=}b=tOy<#U\ZYB\e=tX_;4<T0=cT*ui=a|<BC<i`=V!=9;o\Z\A<\0=!\"\=O\Λ<\lڌn߼?d\<=\Ѽ=<S{VqG\8=\<\\ <b^>Tih=P\qA>\GE{\%;HV=h]','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3168,'61b765e5-ae10-4594-beff-e88be67efe3c',8,'know that the guest assignment has been completed and that the FIT check in process is complete. 3.1.1.2 Group Check In. Group check in is quite similar to FIT check in with minor difference. Below is a screen shot of the group check in module which can be accessed by clicking on ‘Group Reservations’ and selecting a group that is arriving today or simply by clicking the ‘Today’s Arrival’ button and clicking the ‘Check-In’ button. The first step in checking in a group is entering the individual guest information into the system and selecting a room for the guest to stay in. Group reservations are handled by the sales department of a hotel and therefore a list of rooms, their type and their rates are negotiated within a formal written contract between the travels agencies and the hotel. Each contract has a start date and a cut off date, total number of rooms, their respective types and their rates. The hotel sets aside specific rooms that fall under the categories requested in the contract known as ‘Blocks’ and only the rooms that belong to a certain block which are assigned to the guests during check in. Hence the system only allows the user to assign the rooms that fall under a particular block making it easy for the front office staff to handle the check in process. Upon selecting any room the box appears in red and at this point guest information is entered into the respective fields. If the guest is a group leader, ‘Assign as Group Leader’ should be checked and ‘Add Guest’ button should be clicked. Upon doing so a prompt is generated to make sure that the guest was intended to be appointed as group leader. After pressing ‘Ok’, the guest information is saved and the information of the next guest is to be entered after selecting a room. If more than one guest is to be entered into a room then the respective room number has to be selected from the drop down box presented below and entering the guest information, ‘Add Guest’ button has to be clicked. When total number of entered guests equals the total number of guests specified in the group, the system generates a prompt notifying the user that the guest check in process is complete and requests to check in the guests into their specific rooms. After the user clicks ‘Yes’ the check in process is complete. 3.1.2 Guest Check Out The figure above shows the status of different rooms and with that we see there are 4 rooms which are due to check- out. We can also see that of the 4 rooms 3 belong to a group and one belongs to FIT. There are numerous differences between the two types of check out procedures hence they are addressed as follows. 3.1.2.1 FIT Check Out The hotel personnel working at the front office should be well aware of the room that are due out therefore they stay prepared for',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n&=9=\hWi=\<ia<	=hյ== /=j$0NPB<\@*<ǿ\<:m\W@<o%<#<w!Q\Hzr\+<y<K0@\np\L\:%\0>Lm=\!k=\{/==$\FᩴHįߍa\=x\	=e\;\r;\<؃\\=\b=\\n=\fO=\nє<?=ĵ+PZ\<\5\<nE\kQ\\<d<\\\`\\\\;Y0 \<c;%H3<=\=\'=vZ\\\A<o\=`۽{N;ϼz\{)\ɻ`a%\0^\=L©\\\L<u\=Y}=B<=\nպ\Ǽⰲ=\ZB<9ى0=\\=!=\0\<=X=B)$l<#崃o\\0>!h<n<Ɋ\rc\<\>O;&\.=\=>==O=\R<R\A=h\3į;lS<\=	14&I)\0<OU=\Q#\\4n=\A<m=b|=\]=A>x<;\\<k\=I\;D<%&<8\ּlQ=\Z=\=r=-\an =k\'/+<^<G-s=s\ָ\;=[I%=\\'R+=\-0L\'X\Zw>;\7\=\\D(=\\<4\=]C	\<,\~\'	<5G`</A<ށ<QEf=\\<1O<UX\<&Q\\9\y8\=\r\ܖ5==8vI=Ar>#<n\<=\@`J\'LL<r<y&\s\\7=S\һע\Z}@v,Ҽ[=FO=h>\n\J<j<dS\0\Ǫ^\=\\ܼ?\\h\=\K\Z=)ǽ2\n:f=Bǝё,F\ =b\qx\<`\=YK;Fa=CNK_(G=\\C;a=FBR\H߼\/5=S\;vY\\ϽI=T\=@\;\>,n2x=Rݑ=\\\\xy\O0=<z=qq\z<RCo\NT<I^;KF=g4\(=Z̒=\.3i}x=\K=%ЂXfʀ<óEQ\=\h=>^\\0<\S\<\I<\ďy<\!\H\	\\5];lR<~j\9<\-<S\\\0<0X$^cT<tP\\zVyR/\A\ZF=J؆\i;r<UWL=K=5\<5	<\r\\<8=N*!\<y\0X<Kzq$T-<Y\\=.dM:uE=\<\Z\<\k=*&= \<\ <<<!&=9\cH\)=/\i=G\+=PӼC4\\⫻a]74\ҟUB+z].\<ft=m\\eN=H<\>b\ü.\oN=\','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3169,'61b765e5-ae10-4594-beff-e88be67efe3c',9,'one belongs to FIT. There are numerous differences between the two types of check out procedures hence they are addressed as follows. 3.1.2.1 FIT Check Out The hotel personnel working at the front office should be well aware of the room that are due out therefore they stay prepared for any guests who arrive at the desk to check out of the hotel. Upon confirming the room from the guest click on the particular room on the front office panel to access the detailed view of the reservation. Upon entering the detailed view click ‘Open’ in the financial information tab and click ‘Settlement’ to access the settlement window. Upon accessing the settlement window, the entire folio history will be available on the screen together with the charged rate, the total service charge and VAT shown in the figure below. On the right hand corner of the screen the reservation details can be seen such as the check in date and the check out date and most importantly the payment method highlighted in bold. If the payment method is cash then the ‘Cash’ should be selected in the ‘Payment Method’ box shown below. Since cash could be received in any currency that too should be documented by entering the right curreny in the next box together with the amount and press ‘Enter’. If the entered amount is less than the required amount then the system will generate a message prompting the user to enter more amount. If the amount entered is more than the required amount then the system will highlight the change that must be given back in NC. When all the monetary transactions are complete click the ‘Accept’ button. Upon clicking the button a prompt is generated to confirm the check out of the guest from the hotel. Upon clicking ‘Yes’ the FIT is checked out of the system. Then the house keeping department is notified about the departure by changing the room status to ‘Vacant – Dirty’. 3.1.2.2 Group Check Out The screen above shows 3 rooms that are checking out and that all the three rooms belong to the same group. The method to access the check out screen is the same as FIT (by clicking ‘Open’ and then ‘Settlement’) but the screen can only be accessed through the group leader’s room which is highlighted in white (room 402). Below is the screen shot of the settlement window for group check out. The rates that are charged is automatically picked by the system which was chosen at the time of reservation. On the top right hand corner we can see the list of extra charges that needs to be settled before the check out procedure can be taken forward. The extra charges if present, can be settled is a very easy manner. Since the charges are posted in individuals of the group, they are the ones responsible for paying their extra charges. Therefore each of the rooms need to be selected from the ‘Select Room’ box and',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n<>۩=\Z6ܽH׮\\<ƾ==|=\$=\>=\<Kİ=\(\\0=#W;n\\s7\66<u\=\\T`ݼkSٝ>=\\߮2<O=\\\)G\I=\\=x\<\\\$8	`\UD?A\0@H;g\\q=\)=\&;捘<x2=\r8\=@\<*5<\a#;\k=fܤ8=\nE=1\<NH\\V\O\r)$<dH\Zޫ<+<d\\\<S<\}!#k\mڽ>-;\ʼ\@<Q\\"\i**=\\<\J<\\н\<S=i)В\n=E5=M7F8ၽ\\\=DQ=*\\\Q\=\Zmm=\><\\=ֹ=!d;6\%=r\<*\\%s=Ӈ=؊=\h򡇽F=֠=D\3bG+= =3=\昼\=\\<m	`;aw&\<l=<\	m\ڼ\'ۂ\Qm\"\~q=T`\Q=C=.ʣ=ZVK;Y:)/|;9YpI=\4=׹<oK=\2<4\r\r=ۏ\<f$~=aw=&=Fj=h\\߼Oգ=\G\y<0<m\\< Ȁ<\2=+\ݼ\L@3*9<X\3=\\ıLPm=`2ռ[=\Ϋ=\50l\ȹk<J[v\<h!<\\=;\\	\6 [Ƚ߷d=NZ^C^=TRp=Is\=j=Z\v<w\<)\s<%q\\ؼɽn\^=\'\e\=SeJ0\=,\\"=\oku\n$=\\\n;̅=\\s\ٛ<6Lj%MQ=L^;̮V^=\H\<+\Ｏ6<\fkd:D:\<\n@<\U\Nc=\z<<\h$<1<J\P=`\=v\I\	=\\]Z?Vy=uȼѽ\O&=nC=X=ϣ:\"\<;\"k=[Ubv\w߻𼲊<\@/vA-<\b\"<e<R>~+=^\_t\)ռ\\\\<;j7=\n\e<B\;%f=/\<\\\\x۽K=\sK=\'<a=ｕ\b\\\}<~\\na\꼾Uј&ab\\b2C\K<U\<\|pNq;\o=$;=&۽x	uC=^3+\\;\\˽\'\?\<\\\<_=\$<\6\½\I\:\\s\nջbe\N$>9<V<F<\0\=b\:@6\<ۏ=\\<@\a=TS\=MS;ʽә`1P\<\\\0=ՉG[c{Zm֘̽K\\R#\X=\<ʻV&5\"\<\&==X=2ٻ\B=;','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3170,'61b765e5-ae10-4594-beff-e88be67efe3c',10,'taken forward. The extra charges if present, can be settled is a very easy manner. Since the charges are posted in individuals of the group, they are the ones responsible for paying their extra charges. Therefore each of the rooms need to be selected from the ‘Select Room’ box and their individual bills need to be settled. After entering the payment method and the amount press ‘Enter’ to save the information. If there is another room with an extra charge posted to it then it can also be selected from the ‘Select Room’ box following the same procedure of settlement explained above. When the required amount has been entered and also all the extra charges have been settled click ‘Settle Bill’. A prompt is generated to confirm the action. After clicking ‘Yes’ the bills are settled and now the check out procedure can be initiated. To go ahead with the check out procedure the billing instruction needs to be checked. If the billing instruction says ‘Bill to Travel Agent’ then ‘TA Voucher’ should be selected as the Payment Method. If ‘Payment at Check Out’ is the billing instruction then the amount, currency and mode (cash/credit card) needs to be entered. When the parameters entered are accepted by the system click ‘Check-Out Group’ button. Upon clicking ‘Yes’ at the prompt the group is successfully checked out of the system and out of the hotel. 3.2 Point of Sale Functions 3.2.1 Start a Table The figure above is a screen shot of the main screen of the POS. The numbers on each of the green buttons represent a table number and the color represents its present state. To start a table one must click on the respective table where the current state is vacant. Upon clicking any of the vacant tables a prompt is generated for the server/manager password. After entering the passwords the system asks for the total number of guests being served on that table. Upon entering the required information and pressing ‘Ok’, the ordering panel becomes available from where we can select the items that were ordered by the guest. After the ordering is complete the kitchen is to be notified hence the ‘Send’ button needs to be clicked for the order to be sent to the kitchen. Below is a screen shot of the ordering panel. When the ‘Send’ button is clicked, a printer placed in the kitchen prints the KOT’s together with all the information such as the table number, ordering server, order time and order details in that KOT. The table status also changes from vacant to occupied. 3.2.2 Add more items to an existing Table To add more items to an existing table just click on the respective table to open it. When the ordering screen is screen after entering the right server password, select the items being ordered just as before by clicking their names on the screen and when you’re done click ‘Send’ for the kitchen to be notified. 3.2.3 Settle a Table',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\\k<7\=\xz_<\0Q\\=\¼QQ=^(=\n|=) \Zz<\"rf =Ľ\2\.l=~JQ@l\\(t(#λ\$9;[H7<4\"+=\\=\Zd\<\o\\==\\\;\Gkkl\]<\'͌!\;\n\y\y=t[<\\\hp=ˊ0\}=\f=\8\$<Q\?=ӑI+;\=/Y:Q0꽼^L[<J,\0=E+\L=\5\:8\n=U<WPE1\<E>=<sȏ=9\=r\\Zp9\=t\\\<\,֫5	<`=t\\t\\;c\=\=);Ī=\n\9{lnDܖ=\0\:1F=o\<e@ټ^/D\=O\nNt\=\\;8=\$T>T Ld?=\Iz\=zK\<ؗc<=9q$F=s%=~\d*//=\"G=]\,=\˛	\o|\rlY=\C\n\d߼\\U=\\U\Z=\4OJٽ\5=\})\9R\r\C=C=3\;*˻p==N\=<\I<t\\<jX;=q<Q<x=ۯN\\=\\\<\d;q\W=<\r1\O.Ǽ\w\<(\7r/H=\x91Ȑ=\\=KPR<eԽd\~\\n\fý\\G3;0\^~\;\\eU:ONF\:qf\1\'A=E؅\)R=+>\h=\쨼Ȅz=^B+<M\n=yR5jb=ZZK@T:=;=)=:<c\ pT\\eW]\\@\=sWQ\<b=+Z^;Ө?`<0=\\\\!\=\=3<oF=\]\'=j\Z~=L׼\<;ǮZ==Eo4=\'輿;?\<C=/KH=y2<e@\\\Z=\'\r=\Y=Kýd=_~<\ZNc=\N\=!x=@ɼ\!\Oj=\\#;\zɽ#FлTJWEѕ\\E̼6g鼍\!\u<\?Cd	>a=Bͼ;;<mR\3P#=ڄ1:،=Y|;T\{\=\\C=B\y]}A=0\r6\\=\f=3˫C\ͼ]Ƽ)<\\=Br\;!\:\nj<-=[ⒽBϻ\Ծ=\(]*\I%\\C\0==\׽ \=[\E;\<<\ZM<㠽G\y]<\L5()3_!<P\	<\+K\}\<\nv<^e0\=Ud<]\`	Y3=K:]\\}OA&=\F<)>=n\<=[¢+\Kg5<zzѽiP\K%\ѻ\]=\1f=P3Q-\<\&<o==\"<Ml\;̫\0<\\','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3171,'61b765e5-ae10-4594-beff-e88be67efe3c',11,'on the respective table to open it. When the ordering screen is screen after entering the right server password, select the items being ordered just as before by clicking their names on the screen and when you’re done click ‘Send’ for the kitchen to be notified. 3.2.3 Settle a Table Open the table which needs to be settled and click ‘Settlement’. Below is the screen shot of the settlement window. A guest may desire to settle a bill in numerous ways such as cash, credit card or post it to the room. After selecting the appropriate payment mode, the amount is to be entered using the keyboard or the key pad provided in the panel. When the correct amount is entered the ‘Amount Tended’ button is to be clicked which will calculate the change that needs to be handed to the customer. To end the table click ‘Accept’. When the ‘Accept’ button is clicked the system makes sure that the entered amount has covered the amount due and only then closes the table and saves all the necessary data for accounting purposes or for any other future reference. 3.2.4 Split a bill Splitting a bill is one of the most important features in a POS that is used for a variety of functions making its application quite handy at times. A bill can be spliced for a minimum of 2 ways and a maximum of the number of items in the bill. For example an order that contains 5 items can only be split 5 ways. To split any order, open the table and click ‘Split’ after which the figure above can be seen. Then click on the individual item that needs to be spliced. When selected, the item appears on the left hand side of the screen. If ‘Split’ button is clicked at this point then the system will split the bill two ways with the selected ‘Red label 30’ appearing as Check 2. Below is a screen shot of splitting the bill in the manner mentioned above. When the bill has been spliced as per the need, ‘Done’ button needs to be clicked which closes the split window and takes us back to the ordering screen but now with an option of selecting which check/bill we want to view shown in figure below on the right. By selecting either Check 1 or Check 2 we can settle them individually as if they were separate tables. The un-splitting of the bill can also be performed at any time by clicking on the ‘Un-Split’ button presented above in the figure on the left. 3.2.5 Add modifications How the food is ordered by the guest might not always be the same even if the same entrée is ordered as different people prefer different way of enjoying their meals and as a hotel/restaurant guests have every right to demand things the way they prefer. Adding modifications as such means informing the kitchen regarding any special requests made by the guest so that',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\\x[=\"rtѼ\\Ľ/M<=p\;HMq=\\={\<!x^uj\"\<m=\\\)\u: =N\<\;$ߔ6=\\<U\n`<N\]:G8=\=\m)$\gSܻ۶߼9\0ۛ<s\/\K<(i\0=?\;&==4:u0=\r*<\´\=\?8f)=\\>:<\d*F\41]=\"\\:p,=Ђ\;]<\䎼:x-=\rN: >oqǽ鐼-QS<&\"<\?<\v4<a=\L;	e\n?h\wi=\?h*\=\n\=	\"=j=a89\;k\\=^=3=O=|<=\ʼ=\^@=wy!_f=\	ݍgX\<6=\-{ע&~=\~ȼ\;\\\=ahH<+Kx=kА;\=g,\<\'!Q*뮽5<`]M\=Pl<x?=7A7\t=]<=ZM@=\q;BK⑽\˻H=?\V=[$P\r>7I=\\=,$=])}<=s<q=X&\C9<\ټ3\<kq\"\U=ĭmʍ\':缇w<<tҽ\K=\[F73s=\6=p=\ra\\\0<\1X}嵽\l?<kvRo󦽲J\rߋ<\#=9\n84=#Rͼ#=\0J\˽ī===\ⒼA\nҼ\n=V	Ua=.\<.h\<!g\2=cl;H=\Z\,<\Z<HC<>7=Q\;љ\n>c\"yDm=1~b\ļ\g<=\\\$mF=8\=)\½i=K\"#@n0˻\/9=\=\nZ<>XK=5<~=*/;kn<\\P\sK\0\=ռu\dZ=\nE=	hUR=j=\v-\=yd<\l9h=:H;i|f;\Oȼ\e/<O;:>{<\\u\n?\=-=x\<\]LYe轉2=\\=\=Y;%<v	=mH6\\<0\n<t뽠=I	>ռ_>i<iX|_^ý\ƼnML=\<7QYtM=PK&\=8.Ű6\Hq<[޽Xl<5=TUT=ryQdjĪE㚽\\ټ\H\<Le\<Zgڼ\=[CjP9;\n=6\2=\\\=b^\\+<\\'\<NE\k;=\;ӭ߼4s\<,=&+P<5H><3@\3<Id=`u<\\\y<m/ϻ\=\Z\r=_=\5=h\g؜H\?L\\<\Z^\;\@^\\ؼq\<\e=\=z=\\\\s\=;\P=\\\w=<\;Zz<\<)\0+T\\','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3172,'61b765e5-ae10-4594-beff-e88be67efe3c',12,'even if the same entrée is ordered as different people prefer different way of enjoying their meals and as a hotel/restaurant guests have every right to demand things the way they prefer. Adding modifications as such means informing the kitchen regarding any special requests made by the guest so that there are no complications later when the food is delivered to the guest. To access the modification screen the ‘Modification’ button needs to be clicked and the modification can be entered only after the menu item has been selected. Below is a screen shot of the modification window. Any modification can be sent to the kitchen by typing in the requirements either by keyboard or from the screen itself. When the modification is typed, click ‘Done’. This will take us now to the ordering screen where the modification appears in the box presented below. Upon clicking the ‘Send’ button the new order will be sent to the kitchen with the specified instruction. 3.2.6 Void Items Items need to be voided at times for numerous reasons such as for a mistake that the server committed while ordering the wrong item or at other times the guest didn’t necessarily like the food hence he/she decides to change their mind and order some thing else. Therefore to address these issues and many more the system provides for a way to void items. However voiding items as such is not a very good practice as it might create problems with the tax officials during auditing if done frequently. Therefore it is encouraged that the users be alert and calm while entering the order and double check it before sending it over to the kitchen. To void any item select the item from the ordering screen and click ‘Void’. Voiding credentials are only provided to the manager hence a manager password is required to enter the voiding screen. When the correct manager password is entered, the screen below will be seen. Before voiding any item a reason has to be selected. This information will later show up in the managers report so that a close eye can be kept regarding the use of this option. When the reason is selected, ‘Void’ button needs to be clicked which voids the selected item and takes us back to the ordering screen with the revised order list. 3.2.7 Room Post Room Post pertains to posting the restaurant bill into the guest folio so that the guest can pay all the bills at the time of check out. A guest may also be entitled to a meal as per the meal plan purchased hence the server/managers need to be aware of how the bill is to be settled. To complete a Room Post click on ‘Settlement’ and in the settlement window click ‘Room Post’. Below is the screen shot of the room post window. Before posting anything to the room the server/manager should ask the guest his/her room number. The room number is to be cross referenced by entering',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\rL\<p\=Pe<;U=\\_\<E<\I^$\<h-=\4\<\\\\Wׅݫ<@kE\=!;\`Z\K୘<V֨;g\\<\ MlL(4\;=+O<><=}\<\\< c.Z^H-as+w\<8*.$Yȵ\}jWiwK_-\\Ry\ \cҼ=a\q<\\RMQ#k_=|{=\n3;,8:>(8]=~<1ݻq<\=6<\\.=\MWTPfS<9\RBZ\CR<_*\|p=7VK໭Ol<eN\yȠ\</]|=\C=\\\<F*p:[jn?K=]6<]\\}&5+p</=<g\L=o<+=ꉘ=\/(|=P\輑׻\k1\=<w\ݽ\\\\Z#\}=v\n<=P`=D/\=\x\Q\=!\n9sO\jd8=ޒ<\;>h -KH콻	YC5=f\A=\4\63=	bO<f=v\=Ur(=\<ż@!q9\\1</_<+s@=\ք\=l;\qV\r=\"z_ K<<\5>\"U</&B<s̶\'pH\Zj=\Ζ`K=<=\J:A<\\l<c=&\g=\W8=!\g8;	O\\<\:\0=$[=~m=¼\9zwn<n\<\?+<z\\Y=v\;X<\E=Ȕ6;h	\eǼ\\<@x\\'\\<\9;\Z;=\\\#\'\v˼/=k=8<M:\;ޑ;2Rj=cTm=@=*\3ϋR+\Lr<\(=gB&ǽy\\<f#\h\ф<\4<ࡽ@wD\=M7\<M\0v^b;4\=\{=t\'Z\\;CM=_\=\x;:oѽT\¡Gh\Z%`==\'B\<%=F[>H=S\<\J̻=S\= <\0ʼ\衽Ǵ<_T=!&Ċ<[\96%p(=Db=V>IWGfX:\;Q=-=M\;`!~*4տ=\\;\_~\\Z=j:\\\=!w`\=v\\\<\0k=\<\<\"x\\U-3\?=ҍ==\ =&.\\<\w=IW=_w<Q+\=J=L|[Ic>5\:i4FJdL=/={O;a\,F<3\I,ʼK1[<-\<\r4;v=F_<(\=UBRJt\I~<7<]\=\e=1\r_\	=s3>\,\g)\rs[<,<\zM>hGҽa\=DuZ%<SMFP^\Ⱥ.Pw\;\l{=5<៌a<?\=\)A<PC>\	=_<\\\=\䠼F8\"','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3173,'61b765e5-ae10-4594-beff-e88be67efe3c',13,'complete a Room Post click on ‘Settlement’ and in the settlement window click ‘Room Post’. Below is the screen shot of the room post window. Before posting anything to the room the server/manager should ask the guest his/her room number. The room number is to be cross referenced by entering it in the respective box and pressing the enter key in the keyboard. The figure above shows the information of the guest staying in the room 605 with their respective arrival and departure dates, meal plans and the total amount due. As mentioned before there are two ways to settle the bill. One is to post the bill as a charge so that the bill maybe settled during check out or it can be posted as a meal plan so that the guest is not charged. If ‘Post as Charge’ button is click then the bill will be charged to the guest folio but if the ‘Post as Meal Plan’ button is clicked then bill will be settled as a meal plan. However across different parts of the world including Nepal, alcoholic and other certain beverages are not covered under the meal plan. Hence in that case only the items applicable will be charged as meal plan and a separate bill is created for the other items which cannot be covered by the meal plan. But this new bill can be charged to the room as a charge. 3.3 House Keeping Fuctions The house keeping department of the hotel is constantly made aware of its rooms and its status by the house keeping module of the SDC which provides all the information in real time. During the busy season of a hotel the house keeping department is at its busiest therefore they clean the rooms from floor to floor and during slow seasons the rooms are cleaned as necessary. SDC also provides this similar functionality where the status of rooms can be changed individually or by the floor. Some of the basic functions of house keeping module is explained below. 3.3.1 Change Status Individually. To change the status of any room individually just click on the particular room from the screen shown above. For example we are selecting a room with room number 604 who’s current state is Vacant and Dirty. A room which is Vacant and Dirty can only be made Vacant or Out-of-Order, therefore these are the only two options available. To change the room to a vacant state, just select the option ‘Vacant’ and click on Change Status. 3.3.2 Change Status Floor Wise. To change the status floor wise click ‘Change Status’ button presented below. Upon click it, the above screen is seen. The house keeping provides a way to search the room according to their state and floor. The two screen shots below show where those options are available on the screen. By selecting a particular floor and a particular room state we can search for all the rooms that satisfies our criteria. In the figure',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n<\=r+Y^<\\ټ%=:\.<==y<+Խ\\<\==ELdʼ\$=\\0\<^v=q<Ӏ=%}\'>=jʺ\\`p=\N=P=ˇ9<\\0;\\R\=j^ƣ	̳;\Ǽ\r;\*\|<O=tb?z=k4=:\\;ұ:=\8%m\20=*]sv\09<SM,C\/%uM>\<K<ܞN=TLYcD~g<:<2\=~?<\\0H\<\\;\><\B=s\"\hJ^v];9~ws\'7=2\;j\@SU=d\=]\<p=2X=\%/T\b=\H= >=a=\\r%t;\9=a\n\=!p=_5=E2\\b\F4$=\[*<\{<Z?=]h>d\\P=\<\\^댽\b)y7#=	#)B\q\=ϾjMќ\<鹚=3<A\=+\u=%h~\B[=&<&s>(:H?{6\=\j=\\qh)=	=\9=c=^\Z7\\<?U<JI=ԕ<\\%\=\̻U\I5\<A\<\U\\<\䶽k\=\\\<,K߰<l=\:\<Zҽ7\'\ڽ\r%qFn\6=\|l\I\\\b<^q\\\<\W%=aO17\5~^idt=C\bǯ/=+;=\"a9=))5v=c\¼u;{<k=\jۼa2V.\a<6=\n<Zs<\7\;Ȣ;=:<tǼYݼ^<p\\\>7\0V\к|܌;7\Z=0\(6W=<6_\}^=\ZZ\ة<7\<>=Ђ=\n<W=7=C}#P<\_ai<rV=:c:=\\~4\:=V:װԽb<\\^\\<\\<\i\G=w\=\\)\\Ƽ	z=C&<ͬ콽z\K\Z;><	\:T\Om.G\d=l\g=y:=-F8z=;5=l<D\<=s==^y;Ko=<|ŝ=E\\<[O=A;$C,X4eQǼ;%M4\G=J	:;u<͞B\;TD9d7vPl:4\\|G<\"k</x\I<\\r\}\m2=sW<;Pb=9p˼\\rcǰ=\0=cdlbS\?Mr<u=@Xf:<\>8ҟ=AɇWt=rߐ\a3=XxGK<.J%}N=jU=\^Zy2|ڻ	E=c#1\k\SuAعS\\N+\Ի(\X=\\j=>w9(\q\=n\'h=ŉ<\\=;	(V*s','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3174,'61b765e5-ae10-4594-beff-e88be67efe3c',14,'a way to search the room according to their state and floor. The two screen shots below show where those options are available on the screen. By selecting a particular floor and a particular room state we can search for all the rooms that satisfies our criteria. In the figure below, we have selected all the rooms in the 6th floor that are currently Vacant and Dirty. The result of our search is seen on the box which is pointed by the arrow . We can individually select the desired rooms by checking them off or if we wish to select all of the rooms at once then ‘Select All’ has to be checked. Now the selected rooms can be either made vacant, out of order or occupied-dirty which is presented on the left top corner of the screen shot presented above. To change the status click ‘Change Status’. A prompt is generated asking if the user is sure of the operation. When clicked ‘Yes’ the status of the rooms get changed. 3.3.3 Maintenance. The maintenance function provided with SDC is not a separate module but just a functionality which enhances the capabilities of the house keeping department. When the house keeping department notices something not working in a room such as the mini bar or the television, they notify the maintenance department regarding the nature of the defect filling out a form which is presented in the above figure under ‘Send Response Request’. After receiving the task the maintenance department on the other hand mobilizes its crews to take the right course of action based upon the information that was passed from the house keeping. Upon completion of the task in hand the maintenance notifies the house keeping and only then the house keeping change the status of the room to its respective state. Below is a screen shot of the form from where the maintenance is notified. After filling out the appropriate fields shown above the task is sent to maintenance by clicking ‘Dispatch to Maintenance’. When maintenance sees the task and completes it as requested, they resolve the task by clicking ‘Set Resolved Time’ which marks the task as Resolved. Below is a screen shot of the Maintenance which can be accessed by clicking ‘View History’ in the figure above.',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \nn;\0ټ\\<\?r=/`=Ln;e[=ce9<t!<\4=\\\<>\y᥼\=\\\}sZ.#(7F=b\J<S\r8r=*/\\<\vT<\\RO<\'==M\w=\\=6~kxVq<\=\\\	@<\H:(YO@\\<\\٨=\=+t\\"<\r=\\=%Q\=v\V=6`=X=&H3$%gG=SN]4\2<\$:i=t]@<_6\\d=wfiXr=K{=\c=	\d=1J˼Ǉ;\6C=Sֽ\).эJ\ =ꊼ\\\<\Lf&\h=\0_Z<0=_2`\;AH6+6?\<sƃ<\<5;6<L\?\7=b<t\<<w\)M7ͽ\v<D=P\19\\\'<M\=);~ؼ\zü:=ܓ,V\\\'\' =\0!(<\=d	 Nz=K,;/\=Ꮌ\`;%0;ƥ=c\x<m\<*=\Aq =j<;Z=5i=7=.<\=:\ixy=X=+\=q+\<\A	\<QD\WV=\--S,=\#\<[=]=g2ͼY6pPV^<%i=ŧ0</\!z=i2g\pG=4cH=d\'=*2̝<h<庻Ov!H\՛<\\&=*!!\\\\\<wO<7\P\<\nS\Pu=>4\gt^(\\=\\<μ\\qRKo<1+6ij3/Sl_+==\#ev;\r\<~Gv7=77ϼ\N=\|<۲=v_F;J.=c\\=G)-y\)C\\\M\=\X<<nP2Nv\>=),F\=\\\p=ht޽\v<ⓗ\"=@<\\\=Tx<DIA!T\\-\\=:\nf=b~<9/YUq=)=^v\F=X:@ŏަ>PU<ӨJ=Pq=ך.RZ;>7<>\'\\\c<l\=Z<[\\<\Ļ;F=.8aM<1[=ǧ<^=y\\nBg<ʒ2\:\<zH<Tgf;Z\S<%н;\7_\\\\\0<\|+֔=\[=M\)	3S\<ftE\n\t7o\R$R\b\\=`\\%\Z=\=F\= T<k\<\\Z<\2Za=:{;l\uC\_\"5<3J=L?a\><=A=7BQe\\F\-=3\=\\&=Q=fO=\b~\5=_1=\ْa.=!?=\1\	Ǽ+<l;jt?\"U=ĕ\\@<	y`ܒ]-L=\q\;\=ǳ1=\<\c<\=\1\<','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3175,'aea3a964-72a4-4fb6-a2a1-b792c0f64e57',0,'Aavani Food Pvt. Ltd., KaryaBinayak, Bhaisipati Date : Saturday, September 20, 2025 CONDUCTED AT 9:01 PM --------------------------------------------------------- Total Sale : 38465.09 Dine - In : 20408.96 Take Away : 18056.13 Banquet : ---------------------------------------------------------- Total Net Sale : 34039.89 Dine - In : 18061.02 Take Away : 15978.87 Banquet : 0.00 ---------------------------------------------------------- VAT : 4425.20 Dine - In : 2347.94 Take Away : 2077.26 Banquet : 0.00 ---------------------------------------------------------- Service Charge : 0.00 Dine - In : 0.00 Banquet : 0.00 ---------------------------------------------------------- Food Sale : 33271.68 Beverage Sale : 1395.55 Other : Banquet Sales : Credit Card : 4345 Mobile Payment : 12210.08 Cash : 17745.97 Total No. Of Guests : 52 Discount Amount : 627.35 Credit Sale : 4164.04 **********Credit Bills************* ------------------------------------ BillNo Name Total ------ --------------- ------- 1495 Foodmandu 896.99 1496 Foodmandu 1592.03 1500 Foodmandu 398.01 ------- 2887.03 ------------------------------------- 1494 Pathao Food 679.01 1497 Pathao Food 598.00 ------- 1277.01 ------------------------------------- ************************************** **********DISCOUNT LIST************** ------------------------------------- Guest Name: Roma AcHarya Bill No: 1473 Discount : 10, 10.00% Discount Amt: 45.13 ------------------------------------- Guest Name: Vinayak C80 Bill No: 1476 Discount : 10, 10.00% Discount Amt: 190.09 ------------------------------------- Guest Name: Vinayak C54 (Priyanka Karki) Bill No: 1478 Discount : 10, 10.00% Discount Amt: 114.69 ------------------------------------- Guest Name: vinayak c17 Bill No: 1481 Discount : 10, 10.00% Discount Amt: 105.84 ------------------------------------- Guest Name: Sundar Man Dangol Sir Bill No: 1492 Discount : 10, 10.00% Discount Amt: 111.86 ------------------------------------- Guest Name: Vinayak A5 Bill No: 1506 Discount : 10, 10.00% Discount Amt: 59.74 ------------------------------------- ************************************** **********Complimentary/NC************* ------------------------------------- ------------------------------------- Total :0 ************************************** Starting Bill # : 1469 Ending Bill # : 1508 ------------------------------------ *******BILL TRANSFERS******* ------------------------------------ ****Void Details**** ------------------------------------ Employee : Barun tamang Item : CHICKEN MOMO STEAM Quantity : 1 Reason : Wrong Item Ordered Order ID : 1518 ------------------------------------- ------------------------------------ Employee : Barun tamang Item : CURLY FRIES T.A Quantity : 1 Reason : Wrong Item Ordered Order ID : 1518 ------------------------------------- *********************************** ***********END OF REPORT*********** ***********************************',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \nu\̼B\=\x</Vw=\=\ڼ^d<ۭܻ٣=\Z\rDiVX\/\<S/ȼ&\\HWq9+l㶼;E\+=&qټ{<\蝲q\\":=ޡ>G9=\@=\\<;O\=\kE}=v\\ڻy}U[=u7绚½ϻ:=;<\Z<9=\\t\0\<\"I;\"0\\=눮J\Z.<-:\\<\܂=ֽp<s~\l\n\=\Po<>\\Q<\=t7Ƶڃ\;ã\Ҁ\\‼\(\㼭<\< =\Nm9=\ZP<?ϼ\~>\DԷ\-=\t=Q\=\r=ʉ=\0\|0ƵlUYI\<׼џ\\\u=\5IL&=Ԟ0`!\0ʼ<N=6b\=S\\\\O9a=\k\׽\y;\\ypk\=O:iHhm\0\:<\Fօͽ뼷\<\&P:w=rmP_<,\$ͷ<#\'G\f]<<=t\\<W\5=\]=n==\\=~=4\§14\/\R\B4(\\"\6+=!S\6=l\e:.\=FPE\9	<=U<)=nxٌ<\\\;\0=j\-\Z\Rh\ց\\\\$<r|c=W=4Iۉ[Pr;ι\?~ȷӛ\\<R=O;ʟ<\ȇ<A\=<6\\f=g#=3\\\<\4=\h\=\\=IS\<\\\n\0l%m;\\u=J]kP\;\<\r=\F=r\ nL=6\^<QN^ζ\qٖ\=F=\v5*缲{+ea\=\tS-\;HC=v,=\<A?Bb gҦ.~>=Bc\Z\\=g֩:qR\\<(<5%=\\\=;1\\`t=z\nq\d=eP=\ }0>x=9?գ\W;`=	=\\;\=Ǥ=7c<_%=zM\=Aᒽ\~\<9Q\(*\<<\KY=mW\9=\\Ӻ\7ļY)<\\tԼk|\gh\hA=E%<\<\໸W\'=x<Pb=1]\Lz=+݂1=\M=\E[\<,\\<\㘼\$~=\~[Y\\<iG<\rl\N6h\֊f3=V3=A>=\SK3o/<˻g\=TH=ŋ\5L\<\n\\rƂ5C\Z=\c=\\ͽv=&D<\[<8U\lip\==\<\nm\<\0\n\\;\/\<<1:UذZ=7Hy<\\'fq+|/64y/=\O*P=',NULL),(3176,'44a57c9b-8b5a-45df-97ef-1fd58c8e37ba',0,'Teaching Manual For SilverLine Dot Connector Version: S.10111 By SilverLine System Integrators Pvt. Ltd. Tables of Content. Introduction to SilverLine Dot Connector. Modules. Main Screen. Front Office. Point of Sale (POS). House Keeping. Maintenance. Functions. 3.1 Front Office Functions. 3.1.1 Check In 3.1.1.1 FIT Check In 3.1.1.2 Group Check In 3.1.2 Check Out 3.1.2.1 FIT Check Out 3.1.2.2 Group Check Out 3.1.3 Start Reservation 3.1.3.1 FIT Reservation 3.1.3.2 Group Reservation 3.2 Point of Sale Functions. 3.2.1 Start a Table 3.2.2 Add more item to an existing table 3.2.3 Settle a Table 3.2.4 Split a bill 3.2.5 Add Modifications 3.2.6 Void Items 3.2.8 Room Post 3.3 House Keeping Functions. Reports. Introduction to SilverLine Dot Connector. SilverLine Dot Connector (SDC) is a Property Management System (PMS) which is built for the purpose of managing different departmental operations of a hotel making it convenient to keep track of its day to day activities. With the arrival of computers into the scene, the old ways of maintaining logs of everything manually is long gone. In today’s competitive market its everyone’s aim to stay ahead of the game and one way of doing that is my having a system that helps you do just that. SDC is a system built towards addressing that need of a hotel where all the information needed to run a hotel efficiently is easily accessible with just a few clicks! More than that it integrates the functionality of all different departments of a hotel such as accounting, inventory, housekeeping etc reducing the time, energy and effort into managing all of them from one single point. SDC is one of the most efficient and easy to use PMS in the market. Build with the latest technology in software engineering, SDC provides a very efficient and user friendly operations making it very convenient for hotel staff to meet with the requirements of its daily operation. Some of its key features are as follows: SDC is a state of the art system that is capable of handling reservations for a hotel of any size. It is intelligent enough to interconnect different departments of a hotel, keeping them all informed about their duties and tasks in hand. The front office module gives an over view of the different states of different rooms (such as vacant-dirty or out-of-order), and these states are denoted by different color indexes helping the staff know everything they want with just a click. The reservation module is a full proof and fully tested part of the software that handles different information about the incoming guests such as their likes, and dislikes, room preferences and meal-plan, flight information. The guest history tracking system in the software makes reservations for repeated guests very simple and effective. The house keeping module also provides a visual over view for different rooms to be cleaned. The system provides a mechanism to clear the status of different rooms floor by floor or room by room as the situation demands. A maintenance module constantly keeps the maintenance',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n> :\4=y\;%\\<GK\<=ɖ;<2=trj=<jz=\<8)|=^\?<bBW<;\\=\;\-实= \rd=\\"<\Zf\<)\\uy=~6H:\r<.6=*z=.\\U=q\=\\>\0\h\(FP2&=\<̏XRb=\\<pe=Ůљ=\<J=z=\&\E\\;\c\?fo\<9Ҽ\i4\=WQB=ȋ12DGt-~=$=Ix=\\0<s=#ŽǓ\ >3^μF\r;\\9	i=\B=<oQ;\Z\MO=\j=[\L&;\MEg\Z\T9=:A<L=Fi=?\]a)f\\o\)B\:NF<:\#Tj\\	m\h5h\Q\S.t	=L).<=qS=3\0<C\;\+\<L=i	GZ\Tb9YGN=RL\<=\ϋ=;\"K=!tdL~\㬻y\;C\Ρ=|s=W6\:u\ѼS\2\Q=[ɼ~p=#L<xn=n=\/={<u=2=l\"ۼ0\\`=\x\r=0\?#\0Ϣ	US\Y.\]ӻ>#=)d\$=A =\=@ȉ\0A=DI\D<;;\<\\	{$$RkKؼ/_\Ol\1(3<J0x<KNL=$uG\=R\rd+ku;)*\<\'N<]:a&Gҍ<7=\\=RVO\<\r\\\;ː<\\N5UW=\뽱\"\n\}<t⡼C?7\_>\Z\<2_8=\\n=Av\>/8VVX<\p<[n\=\(=	\6/\\;=,>;O\r<\>a\"\L\0\<\=!;mx=2_\<q\7<_\"+ۋ6\z\oQ\ {@=)<+Tә%\;V^t=\=g~\;{=\=O%P=ʣ2qKy=\1>e=\j\n/^><C1 W\Ż\\k=\żpYH=\z=ȩ`rvr6\\\0=v=\=\=7	Q4=\\p3&H<SCN<\"H켃8\~\Z=\F~^=\`ӼȄ\G\"=\q\<䟯=\<\n\L<\I=\?9\=\L`=\_K\=\QƖו\ri$<<W\E\Z>=\J.Ҽ=HE\r<ߺ8=~]7=\\8\#)Y=\;b=\q\<s\=l.J;\\;f=p\吽\'\=\*=\<Ǎ==\=팻\0v=\aB<]=+\==\"h>ŁEn\:*>\Z;7\=θ5=xD%vz?C8(\0\:<\=`;<,4=&+t=',NULL),(3177,'44a57c9b-8b5a-45df-97ef-1fd58c8e37ba',1,'very simple and effective. The house keeping module also provides a visual over view for different rooms to be cleaned. The system provides a mechanism to clear the status of different rooms floor by floor or room by room as the situation demands. A maintenance module constantly keeps the maintenance department at its toes with its constant reminder of the things that need to be addressed. Housekeeping department notifies the maintenance department instantly about any breakages or failures noticed during a cleaning procedure there by reducing the reaction time. A state of the art POS system is also a part of this software that takes care of all the restaurant management needs. The POS provides a visual overview of the entire restaurant with its exact floor plan and table numbering to help the manager and the servers know the status of different tables. Different color codes are used to signify different status of tables, such as Vacant or Occupied, which helps to know which tables are available for the guests walking in. The POS is best utilized with a touch screen monitor as the ordering process will be faster. Each menu item is listed under its own course list, helping servers or managers to know where to look for any particular menu item as needed. After the ordering is complete the order is sent with a push of a button. Upon doing so, all the bar items get printed in the bar and the kitchen items get printed in the kitchen reducing the need of having to send someone to the kitchen or the bar to inform the respective stations. Once the order is sent, it cannot be voided unless approved by the manager. Any alterations or special requests from the guests regarding any items ordered are entered into the system at the time of ordering which is printed at the respective terminals along with the items ordered so that the respective terminals are informed about such modifications. A bill splitting feature allows the bill to be split as requested by the customer which can be printed accordingly. A bill printing system is also a part of the software that prints the bills as necessary. Room posting for different guests according to their meal plan is also incorporated into the system. Reporting includes daily arrival, departure and stay-over reports. The end of the day report is also available with the exact cash count of both the local and foreign currencies. Any further reporting options preferred can also be incorporated upon request. These are just some of the general features of the PMS. Let us now go deeper into its individual module operations. Modules Just like any other PMS in the market, SDC covers all the basic modules required to run a successful hotel business. 70% of the revenue generated by a hotel comes from the guests that come to stay in the hotel, therefore a system as such requires every attention to details as far as guests are concerned. SDC',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\\ZE<\$Gv+Q \1\=eU;\U=np\n+8==%-=	툼J?[7W=\"\<\_*5);HI¼\9\vC=<\d< \t<t\Ľ5}e<׺j\=<U<\\T<1s=\n}L(j$w##\\\'x\<\\=֫eGG(xFA\\F\H=\"N=}M=T=L=\͊ZʌK=$]\P<+%\r=1<<9\0=eS\\:C\<Λ=\"nGu\<N\\\\2<ks^;\>\n\3<.G<l3`d\ZQGҘ\k=wH_;v9=*`\><\0}<\=Z	<Z\<\\!=Ti<\Ɏ<\\\!<\\<Z.=鐜n\<=?\\d\r*ls\< <\Z=/;rB=\IĻJ8;bpH=KG===\}9	5LC\lhG\\<q/;\=<N59\{\g>\v=R\Z=	\=\z<`O=	\Z\nD=\=\\n\r;\\(<;<vO<>\<wA<\>|=9<o=R\oj;2\=-=Ud<\\нnJ\n\'ӂ!mk9\fdTm\rd=\\<0sq{=Т7=\<Yuj\Z_\\<dzJͼ׏=getA=-<.;yg<z8<k2[=\noD\<w;1=g\|=Us\0=fz;\#\VG}\s#ڼ\\=2j\:%5\0\\<-GC</l=Go\'U=I \<<̼9=K\\n\\0=i\0l\Cg\ԶϽEW<D,\Z\\<5ɽtL=fqs<|!=\y\T[ýQ=\\}[\=/JJ1<\\\A-L=](ú\:^5D+\c⾻?f:<\\}=:=gW=\'==Ⓖ-><R$\I=)D\ؽ\*;By{\G\YT	<+k,=\'Aru(<\8\\m8=@\5ʙ:=\U\=	Ui?=Ē޼+ =$~\޼\#\<0!$=\G9(.\ZH;~$;LD,\=¼=Q==ǁ1=g\ȟ=\\&<kFVU\aC2=\lFL<Ppܽ|3F<5=W=5=;=\:\܍=g\Z|=Փ=_\W@=:E;+ﺦ<=)2=fDzt<:\'=Y\<=1s\=߭<\\<sqx<uP=\\"<t/P{5=\\\<\\}{۽&L\r=d,=a\\<\e`S\S=_T\K\w=,#\>K\>\<\\'<\\'=\\\"~',NULL),(3178,'44a57c9b-8b5a-45df-97ef-1fd58c8e37ba',2,'market, SDC covers all the basic modules required to run a successful hotel business. 70% of the revenue generated by a hotel comes from the guests that come to stay in the hotel, therefore a system as such requires every attention to details as far as guests are concerned. SDC provides a state of the art front office reservation system that allows to know everything about a guest including any preferences in regards to dinning, lodging or any special requests that guests might have. Main Screen (fig 2.1) Apart from that house keeping also plays an important part in serving the guests as per their need. Restaurants are another place where the guests need to be served in a very professional manner. All of these operations are carried out by SDC which help the hotel staff to address the needed of the guest in a very professional and timely manner. Lets look at the operations of each of these modules. The above is a screen shot of SDC main screen. This is the main entry point of the system. On a first glace it gives all the statistics of the hotel that is relevant to the day. Values such as occupancy percentage and rooms to sell are very closely watched throughout the day as that determines the total revenue generated at the end of the day and also gives an idea of how many more guests can a hotel accommodate if new guests arrive as walk ins. Clicking in one of these parameters will give use more details pertaining to the parameters, such as if we double click “Total VIP’s” then a list of all the VIP’s with their room numbers will be seen on the screen. Shown below are 5 buttons which are the entry point to each of the mentioned modules. They are as follows: Front Office: By clicking in the above button in the SDC main screen, the front office of a hotel is seen. Front office module covers all the reservations together with the status of all the different rooms of a hotel. Settlement and viewing guest folio is also done from this module. Point of sale (POS): By clicking in the above button in the SDC, the POS can be accessed. POS is a module that serves as a restaurant management system for the hotels. Each restaurant of a hotel has its own terminal or POS from where it is accessed and used. House Keeping : By clicking on the above button, the House Keeping module can be accessed. House keeping module provides the house keeping department with the status of different rooms where by they know which rooms have to be cleaned or cleared. Accounting : By clicking on the above button, accounting module is viewed. Inventory Management : By clicking on the above button, Inventory Management module is accessed. Apart from accessing many different modules, SDC main screen also gives an over view of different time zones of different parts of the world,',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\<\\ἰ\rq<#80u=Wy=Ẻ7ʔ=\\\;IS.S<]<WDp(b=fQŽ=r7|oN=\I\B\ Ѻyo<\\\*<+\;{±< &{B=/˖=\Z!>3\<\'-=qλ\`ؽz`<}<Zi<Լ?\AλzaJKݡ=Ȕ\ޟ=Z=bs=0=o\=	\b̓\<fd=!s\<v<\[<\Z<야ns\:5\<W.<fs\pļ<\ZJ֐8\=20z\<:!=\'jMI\<>\{mdb=yx\\r<|=㶙<)E0=\\=\Ž\'&\y=ώ<\\_=T=q=\\Z\g\a>DI=S\Ż9X5a\˽	a=);\ļȖ\{]=l\\=\0ܼs<Õ\Z\\<\Zc(ҏ:H{H=̾\	f\ýļ&oM\y<\\<\C\n/5=jA<0먼&l\<E\<U\s=ޣ<\<\m=g\\0=\,\\<\\\<@\=: <\`P=ڃ<(\<K=j<<>p=!<<v\Z=g=^\\<yt=Ħ\ƻ;\Sv\\\<gJE=\۽	=Z\\X\<aH\=\	\Z\0\\=(gpf[;씽<`Q׽@\\G\<q~}\\n\jK#[<8i:\$xԻR=(k\\ro< <\<H\0<v\\\f\"%:\=]	#=|ݓ< \H`}b=ʉ\'_D\<\\\<.1=:7#<\\\`	&<3\Zik\=_\n\'쫅\\\<f?\ܺ樽\D\=U;ZCڂ=\"\;\=\˼\'𼆶\'\==Y[=\\ΏeU|\q:d==\Z=\\<L<nT=\=x\lFcVB=\n;>*>1Br\<\xX#6(7i~\m<Ê\w|<\=m=&\*=Ҩ<f\=\+\\v;\=\`3O{=}\,q 0wWJ\<\Jҽ\\Z\Ɗ;\L=\p\#\?ezμ \H\ޖtE<\Ha\"<\nOͽ<l\\Z=\Κ\⇳RnF\A0<\<8X0\\'g<X!=\J<\\Z=~*r=\j<\^]A;#Eǻ\W>x|B<\<B:IZ#=P5\6\<cl25%=L7;ǟ;\=+=\9=$>\=32<y><ݼD=\z/=ڐ<*+\<\Z=\D~<\n<\LB<7[k=\<<T\\׃=n)\=\=8Z!\k=\\<\6\=\"/o\\<',NULL),(3179,'44a57c9b-8b5a-45df-97ef-1fd58c8e37ba',3,'Accounting : By clicking on the above button, accounting module is viewed. Inventory Management : By clicking on the above button, Inventory Management module is accessed. Apart from accessing many different modules, SDC main screen also gives an over view of different time zones of different parts of the world, and also a small calendar which is helpful in many different areas. Now let us go deeper into each of the modules of SDC. 2.2 Front Office. 2.2.1 Overview : The screen shot seen above is from the front office screen. Individual rectangles denote individual rooms of a hotel with their current status being represented by the color of these rectangles. For example, rooms 701 and 702 are out of order therefore they appear in a grey color, and the legend present in the right hand corner represents exactly just that. On the upper right hand corner there are 5 buttons. They are: 2.2.2 Refresh Button: Refreshes the display screen and updates the current house status. 2.2.3 Find Button: Upon entering guest room number in the highlighted textbox the user can press the Find button or press ‘Enter’ to view the room details. 2.2.4 Rates Button: Pressing the Rates Button will display the different rates offered in the hotel . Rates such as CP, MAP, BB can be seen with their individual breakdown of their room rates and meal plan rates. 2.2.5 View Report Button: Clicking on the View Report button, different reports can be seen. Details of different reports are covered in further sections. 2.2.6 Drop Down Menu Functions: Fig 2.2 Buttons Fig 2.3 Room State Fig 2.4 Room Type There are three Drop Down menus present in the front office screens which are highlighted above. The first one gives you the list of different room types present in the hotel such as Single, Double, Suite etc. The second one contains different room states as such Vacant, Out-of-order, Occupied etc. Selecting (Fig 2.5) different combinations of room states and room types and pressing the Find button or enter, the user can view the desired room having the selected states and types. For example in figure 2.2 and 2.3 user wishes to view all the single rooms in a hotel that are vacant. (Fig 2.5) Given below is a screen shot of the result where different room number and their corresponding states are seen. Fig (2.6) 2.2.7 View Room Button: In the above figure if one clicked room number 605 which is highlighted with the blue shade (indicating that the room is occupied), one would also be able to view the details of the room. The Figure is given below. 2.2.8 Reservation. Overview Fig (2.7) The figure above is from the Registration screen of the SDC. There are two types of reservations namely FIT Reservation and Group Reservation, which can be viewed by selecting the respective buttons shown below in figures 2.8 and 2.9. (FIT Reservation button or Group Reservation button). The result of the desired query can be seen',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \nF<-~vMY=tt=\\=\C<hV9=Z&O=x^li2=\`\\n;j͇\$<s 4<\\8<	{»rbb¼\e\a<aY\ZM=\<췽 \Z\<=i+=Cr=\A=F!n\\[\=l|ru\"\<иZF;\0<~+l׼u\0<\={=\P<B\=^7<,	><f\Ѽ\\;]E\;\0*\<\\l\<<jL+=`ۼ\v=v\';˸-\\\\N<}0<<\\\<7AbFq<\\@WJ=x*!v=<^i<\E<ߜ\Z<\ջF(= \':+\̼k<P#:|Bae==M\`n1=,=\\<=Q_c<Σ\=|\<A1\0\\r+0r=/%\Ģ:@;,\<\rG=Z\.\=\q`dN:g\K+u\H=Q\	u&Ė#CҪ<\">\&<\.\Ӹ;\_=o\<_e<~=\#K !\2Jָ\=bﺻ&i(YY=\ּ\=u^&>\_=~\=6\<s;v;=\C=jc=M<b{5=O	;H\	<\\<\(FmkQ\Nm=\\nU=X\<QX=\Nq=Pj\\(ܧ\]꼖Q<іŽ^<q\55Q;-=c7=M\Aj=V^\\r=S\⼳\"=\nA\&Sn/[=:\\\;>1fϼeX\q\;	\"\\ZЩ&=f\\0pp=NZ\弳Opa\\Z\r8.=*=\\Z=\q\\Sيؽ\[Nk\9S\<l<س<\<vݟ<<]\^<*PSu==*<lܽr\'<wdZ\`={7.\"O\|&\=\G[=\\\;<tE\7*q\0\=8[=P.-<\r=Itj^h=\`=\>0&ͽr<.5U\:Y=\<N+<ZŻች\\7 Eļ!\ս\\=\\\:\\d\=ȩ<ܯ\<c;\h=\}X:w=~ZP\Z=Ͳ\r޼ԝ\\1HW\Xz\uC.[o8ҍ;Tsj\&7z:?\\\\8j<;	-\=g=̼󲁳\Tk@\:\}*=fvBc=\\\=OW\\=	-缧\"=.\=*<qrI\Z=7=oW;GDZƼc=c}Tc=1@o<MMK>=[F\=ʉ=\O=(G¼}Y=؆5<bTjt\=PY@=\ަ=I0Ca⎱u=-<Òu\]CBU<!}\.\\%Ǽ[\=\Ql\̼\nw\;\\<\Z\<\\<\<5k=ե{Y<',NULL),(3180,'44a57c9b-8b5a-45df-97ef-1fd58c8e37ba',4,'the Registration screen of the SDC. There are two types of reservations namely FIT Reservation and Group Reservation, which can be viewed by selecting the respective buttons shown below in figures 2.8 and 2.9. (FIT Reservation button or Group Reservation button). The result of the desired query can be seen in the box presented above. Fig (2.8) Fig (2.9) Fig (2.10) By clicking on the In House Guest button (Figure 2.10), the list of in house guests can be viewed. Fig (2.11) One can also perform any search that is based towards the guest’s first name, last name or the reservation ID that is provided at the time of reservation. Any such queries can be typed in the box located right below the reservation buttons shown in Figure 2.12. Fig (2.12) On the upper right hand corner of the Reservation/Registration window, there is a cluster of different buttons that provide access to different functionality to the user. Let us view each of these in detail. 2.2.9 REFRESH Button: The REFRESH button refreshes the view of either FIT reservation list or the Group reservation list or the in house guest list, depending upon which button is clicked, i.e. FIT Reservation Button or the Group Reservation Button or In House Guest Button (Refer to Figure 2.8, 2.9, 2.10). 2.2.10 START Button: By clicking the START Button, one can start making a reservation for either an FIT or a group. The details of how to create a reservation is described in later chapters. 2.2.11 CANCEL Button: By clicking the CANCEL Button, one can cancel a reservation. 2.2.12 GROUP CONTRACTS Button: The GROUP CONTRACTS button gives us access to information pertaining to different group reservation contracts a hotel may have with companies and travel agencies. Without any such contracts, a hotel may not choose to do any business with other companies. A contract includes important figures such as number and types of room, rates and dates at which the contract ends. The details are described in later chapters of how to create a group contract. 2.2.13 UPGRADE Button: The UPGRADE button takes us to the window where a reservation can be upgraded to other options provided by the hotel. 2.2.17 ADD ROOMS Button: The ADD ROOMS button adds more rooms to a reservation. 2.2.15 DEPOSITE Button: During the time of check in, guests may be asked for some deposits which can be entered in a window that is accessed by clicking in on the DEPOSITE button. The details are coming later in the chapters. 2.2.16 TODAY’S ARRIVAL Button: By clicking on the TODAY’S ARRIVAL button, one can view all the reservations that are arriving on the date it is clicked. 2.2.17 CHECK-IN Button: The CHECK-IN button takes us to the window where a guest that has a reservation and who is arriving today can be checked in. There are other information that is gathered from the guest at the time of check in which needs to be entered into the software. The guest check',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \noBv)+\W=\=G\= =[\H!̭K=ͯNu\<I$m\\<@!;7=\ok{?<\Lt<\}=Ͱ<R\X!MO\tYeJ=:=,=:@>u5=L̽\5Vv	GC]VFlè<\\"\;D\Z==5%=t^;\k\;=/\r>ur@\Ȼ:Q=Tm<\"=\JkN~\2.=c\o=lA.*Q==ZN\F+t\\\\=.	<w\=\\0<\}&\(\<n=w\\d;2%=Mc<-\'<\`6^\\\\\lt=MJ\$Ƽ=\\<\\?\pO=Ib=e\\n=-ϼJV\=!\,=}/Ey\\1\=\1/u:8\r\ݽ=<\rּc =&o,h4=i`	=\}r<\YE	Y\`5gkY;\n6\G\z\n9WZ\;\bȼ=l^\A=t+<\\n5y=\g%\ջ;\\k\=pyD=K=[&=(\<h=O<=/H=\\<\\E=lp{<\ͼ2rἴL;\\b\g=M\<}a=d\m\ܼ\x1=x\=\l\\<:%\'J==ZG<\o;\s\<H2=MZ[]\ȟ\b\n*=}\4>1=vspH?<P%t\f\";fk\'\\<H\Ͻ3\\=|(Ys<#\q=Q\nT`\mt44<K\\M=\<a1c\1=H9KlM\r=t$\\"T\<\\=L\B=KH1ꉷ\9=\y۹\\\<\0o=<7\0c<p\켷\n\\\P=4;N!H<>ae=ɝ;>{=W4\=k\Q<\\</=*si=\-=@\Z\ֵ;<M\dNJ=H=(ּ\oGo<x̽ ĺ=<\Ar\w\n;K\\z=F=\p|ЃA=\V<ùu\L8?d<ċ\oYi=\L=t?\D=\a<¼\\<\=1;mUAu<ٝ\\Լ\|\<\8X\\:=&\0=\o(<㺣D?=\8\'=K̼8<\\=\=%F!=Ӫ;u\>\<_\\\<\cg(;{n/\mvY*p;\JR\V=鲪_\\\=ěJ\=\Ź<v=Ac:Oj\j=\\=K;D;ʼ\\\ܼ\\\<,;&/\Z=\{<\r><m=\ ==7=>\\]\0\\=`\\\=p\;<\\l=aHy=NX=E7=s&\<~K	aP|׽\\}<\\S	=q۹\=f!<HgĻ@=\֟w<',NULL),(3181,'44a57c9b-8b5a-45df-97ef-1fd58c8e37ba',5,'CHECK-IN button takes us to the window where a guest that has a reservation and who is arriving today can be checked in. There are other information that is gathered from the guest at the time of check in which needs to be entered into the software. The guest check in process is described in detail in later chapters. 2.2.18 VIEW DETAILS Button: The VIEW DETAILS button shows details such as guest details pertaining to either FIT reservation or Group reservation. When the in house guest list is viewed by clicking the In House Guest button (Figure 2.10), the details of each guest can be viewed by clicking the respective guest and after that then VIEW DETAILS Button. 2.2.19 EDIT Button: The EDIT button takes us to the window from where reservation details are edited. This feature, together with many other features is password protected so that only the person with the authorized privilege can make such changes. 2.2.20 ARRIVAL/DEPARTURE Button: The ARRIVAL/DEPARTURE button leads us to a command centre from where we are view the arrival and departure records. These records can be viewed according to their dates. Below is an example of such logs. 2.3 Point of Sale The point of sale (POS) of the SDC is concerned with the day to day activities of a particular restaurant and billing. The POS handles operations like ordering, notifying the kitchen, settling a table or posting the charge to the room of the in guest. Below is a screen shot of the POS main. The main screen of the POS represents the exact floor plan of the restaurant with its table numbers and other details regarding the location of its exits and bars. When trying to access the POS from the main screen of SDC, a prompt is generated asking which restaurant is to be entered. Upon selecting the desired restaurant its corresponding floor plan is fetched and shown on the screen. The main screen provides some valuable information such as which tables are occupied or vacant or which tables are departing making it easier for servers and managers alike to be better prepared for their service. The POS and all of its functions are described in detail in the further sections on POS Functions. 2.4 House Keeping. The house keeping module in the SDC is designed so that the house keeping department of a hotel is fully notified at all times, the different statuses a room may have during any particular time of day so that everyone working in and around is kept notified. Below is a screen shot of the house keeping module. Shown above is a listing of different rooms and their respective status. Just looking at the above screen the house keeping department is made aware of how many rooms are checking out, how many rooms are occupied and dirty and so on so that as soon as the rooms become available they are cleaned and made ready for future guests. Rooms of different categories can',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\0\<p\<!@&<}|=\\==O\z\<\_=\\u<P\;\\<\n\"\μ\Ƚ\\\r=HO=rM=|hm==䢼]p\\Z;\h:\W=\\ö==G\&S`ꋼ\0h\;R><ws\<Fa\<\=\>\'v{\\sn\=\f\<g|=SVM=\*wS֩=<\'qtnkJB=EK;\?+:=%Km\,ݼ\5=!\\T\\t=0W>\nc,\H\<\,}=\-~ͫ7\\n=\晽q\]<n<\\<<\<j\<\\c\\\;=<\\\μ\~޼n\<;8<-.1aL==*>=N̳<B=\|7=K	\	>O<\<5\ͼF}{@*=bA=U\\<\N<\f=\u=\s=O`-=F;Ҽ\`q쳽?)t==	\U*\\rRmSx@p_=2<V2\\nü:p;\\<=\۽/=삽\\<ZV=ݺ\n\\=r˶;ќ<ސ(=\\U\;R\=\0Ү;\Y=\*=1	=\ȅ<\'\e;ͼ\B\\\\<b<4V\>\\_<6Ѫ\\69l̉YE}4\PT\\\"\=跕<h\<ˡ!=\=mwL͏<6\]I\>yȫ<@>\0u\"=\_݈<\\pU/Hk\?{kVQ\=;#l,<($+<1<w\8\w\</=\;{#=Fg=Ǖ[= /A\u<<9&}\'z`<\nἯ|@gh2	<\\\E[=\.<\"م=\a\\\=z\;d\n\ʽ?\߱<ɼ\ګ\\r\8\\ʽMw_ \<oxȐV=U?=ѻO=d_<X=\(<5\<=\"=\L={ͼB\_<tcŒ=]L=ۦ=\U=n%{5=j6f=\\\n=\.7.\=L\<:=nÇˇ=h\gP\\;+\=\\_=k<%)\\=[\\\y=\:=ާ1znC(=\===\p=\	)\<ۈ;\{=#\\=Z\m\s:V\.;)\<\^h\xj\TR$<虛%\|;2%Lz)<\½T;S=\\<aQ=L\zƙ:l;\<\r,<;w<?=(\\̽\&=a֢=\'5Z\\\ީj2\<*2ݻ\r^=\cK<2\y<Z\5=\n9h2@= S=\=_LJ=\=\<F=$=\\\;\f=\	=\\=n<k\f\\\=as	<6\ܻ5)^༫P,ygP=7C(==x鷽\'e>A$):`<\س=$(',NULL),(3182,'44a57c9b-8b5a-45df-97ef-1fd58c8e37ba',6,'the above screen the house keeping department is made aware of how many rooms are checking out, how many rooms are occupied and dirty and so on so that as soon as the rooms become available they are cleaned and made ready for future guests. Rooms of different categories can be searched by clicking on the respective buttons and clicking the ‘Find’ button. The complete function of house keeping is explained in the House keeping function section. Functions The numerous functions available in SDC enable one to better understand how a hotel operates on a day to day basis. From tracking guest folio, to viewing extra charges occurred during the guest’s stay, SDC provides the simplest of interfaces to carry out all the operations of a hotel in a very convenient and efficient manner. SDC also supports the flexibility of posting the charges from a restaurant to the guest’s room. Hence the operation capabilities of SDC expand into integrating different departmental functions of a hotel so that various tasks can be accomplished quicker. Let us look deeper into these different functionalities. 3.1 Front Office Funtions. 3.1.1 Guest Check In. Front Office is a place where the guests interact with the hotel formally for the first time, therefore it is very important for anyone working in the front office to be prepared with all the necessary details one might need during check in. On clicking the ‘Today’s Arrival’ button shown in the figure below, the user is able to view all the reservation details of all the guests or groups arriving today depending upon the selected reservation view. (FIT or Group) The procedure of checking in guests belonging to FIT or Group reservation is slightly different with one another. Let us go deeper into each of the following. 3.1.1.1 FIT Check In. As mentioned above, the list of reservations that are arriving today can be viewed by selecting the FIT reservation and clicking the Today’s Arrival button on the top. The reservation system searches for all the reservations that are arriving today and gives the result as shown below. The figure above shows two reservations that are currently scheduled to arrive today. By clicking on the individual listings we can view the details on the right side of the screen. We can see that for reservation 19, the assigned room number is shown as 0 and for reservation 20 the room number is shown as 602. This means that for the reservations having their room number as 0, individual room(s) will be selected at the time of check in and for the reservation with a room number other than 0, 602 in this case, a separate room is kept reserved. This is usually the case if the reservation is for a VIP guest. The above figure shows the details of the selected reservation whose arrival date is today. To check in guests, click the button ‘Check-In’ which is shown below. If the arrival date in the selected reservation matches with today’s',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n5\W<\v,@N\<\=߾\'=\"=j3\\<|<yY <U\\;*+4ƹ\r=]\	z=ܔh=s`tcp:<z:e&<Լ	&\0L(Ͻkj=@\=~=,6G<G3W\%<\'\<m<e\|\,F<wLe=c\ \\"|\;I=ʝ=sZW=\%k=\^<=\-=L܋Y\fZ\B;=4=\<Yd.:]>F=\"\=\\Zd )=|`i<\ʷf\\<3ح^my31=s\<Qc=K\γ=\'\0@;R\<c7:ûŨ=R\'=\\n\=W\\z$ɜa<Ë=j <\\\<-\<7Q=A;C..>\<\]\;4Ioc=;=.@\(!OP_O=-\\=lRy?=\\ȺF#=\Qt\<\阽M\\=\\	퀼[n<\ =2<0:=\Ԑ=]=tnZV)=\c\8\y`=Y\0Y<\W<\w=L<\H\,=\?6F=a\\<h=*d<x=\=d<JZ<\<G\:\<=$OV-=\{O\\Wa<M\,˽Gԙ<W`Y<.=I\Z<J<\\=ϼ\\\=ZNf\!&=?f;jP9r=7Qɽ{%e=\a;^\n\,=ؐ\p<:c\G;=g\WN\.rA<\"sMsO0\r=@`QUߪ\"@A\}\<E\<y)<em7qh=\}Il5=zQ{ꪭ=\Z\&==\\R<C^0\\9`i\\=y^9ݽ\\Dm\^M\Q<q0a=\j4D\0>\h=ڨf\\\!\"=\;剎<6<GOWp\Խ\y9M=\9===wxD=\b\\*=\0!=|\\0$b?=F@/\z<nŽ9\<gURuU\υ\4r\\>=OW<R\\:z\"=\0M=<\;<$\s=\\=FX\Z\Q=\\4\~g=p=\fO_KaE\r<\<v:^O\\\d;L\z\_<\;ﱼT\~\Ҽ#\BiLV\C;t@<LI\}?,= r_U=򿌼qhZ2\H<!<=ev\drO\B.!<7=\0\0;3\\r=\'+=\=:M\\ȽS=i=<|<Dkv.m.p=C׼v\ =%<e<ScĻ.=&QK=]6=$>9=l\\<\m;6_=ߞ\=3 =Å_=Q\=s\"\&\qӽ?\;	˼\S<\r<bs<+c\5&w=}fs<H|=,%$=ð=5\\\r=\Ze\i<',NULL),(3183,'44a57c9b-8b5a-45df-97ef-1fd58c8e37ba',7,'is usually the case if the reservation is for a VIP guest. The above figure shows the details of the selected reservation whose arrival date is today. To check in guests, click the button ‘Check-In’ which is shown below. If the arrival date in the selected reservation matches with today’s date only then a check-in window is presented to the user. The figure below shows the window from where we can check in the guests. The figure above shows the terminal from where guests are checked into their rooms. As mentioned before if the room hasn’t been selected during the process of saving the reservation, then 0 appears as the selected room number and the system will ask the user to select a room first before entering any guest information. The system searches for available rooms based on the room type which was requested at the time of reservation and presents the options in the right hand corner of the screen. The figure above shows the interface from where a room is selected by just clicking the room number. (Note: Guest check-in is only possible after a room as has been assigned). When a room number is selected, a prompt is presented to make sure that the user intended to select that particular room. After pressing ‘Ok’, the selected room appears in Red as shown below. Now we are ready to enter guest information into the system so that the check in procedure can be completed and keys can be issued to the guest. The figure shown above is the terminal from where we enter all the guest information during the process of check-in. The entered information of the guest is saved by the system and it can be retrieved again in the future if the same guest decides to pay another visit. This type of guest tracking technology is found across all different PMS’s around the world and is one of the most helpful tool with which a hotel can understand more about its relationship with its guests. Let’s move in deeper into the details of the final stage of guest check in. Upon clicking the ‘Check-In’ button the above terminal is seen. The ‘Enter Guest Information’ box is already filled by the system since the guest information was already saved during the creation of the reservation. To save the information, just click ‘Add Guest’. The system only lets the user check in a specified number of guests, which was entered at the time of saving the reservation hence it keeps count of the number of guests entered. If the number of guests entered equals to the number of guests specified, a prompt is generated to let the user know that the guest assignment has been completed and that the FIT check in process is complete. 3.1.1.2 Group Check In. Group check in is quite similar to FIT check in with minor difference. Below is a screen shot of the group check in module which can be accessed by',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\j\=\<ȚibCI=)=L=T\=ݣy\\=Z\<T\<)6ɼ\E<\<=%ؼ|ӽI/=ME=\\<\dH<`	\@߼2<<1莽G=<6=)kMX\\=W=\S:=t=ޏ\H\AAǜ\ȺE$厽UY|\1;\=\r\0K\<\s֊=C<;V=r<\<\ƦU\=1e	usƼrмD\!\\nh\'\x<p\ag=~콫͞=\;#\\r\_o:\\DTP\.g+=0πp)!Q\'ʬ+\h;x\<\y=\\;P@\)&$=\U\yt4O=ę#=wR6=?a\=\\_\<\=\\=\:K.T=\<M6\\=\r\<$&:=JKV\r<\;\	>\;\a\!=yr=\=:Y<>4!=Kcw<=_Un\D\bq=ռ\	ʉ:\$kb	<\lv\<L-<s\r)t\;<N3\\\=u\R6r\\=Z<\>5\=\=8=h=Sļ_<&<=_%=o\j:T=:>Hǆ#%m\"\3F==x=\\R\'<\Z\|ņ7\\n<\\XV<	Wf\<\r=\\=\\\\j=`9c<bۃ\`\<\w+<eyƼq$\$=\\\ٗᄕ\"RX\"f7L=\̤\ғ<	\<Fw<\(\^ζ\\=k-NPq=]I\*<an<\b<yviMP\<W7-=\I\<\'2=%=?Aѥ=t\9\j\Nac^\]ma_*v\0=\=H~;\==-V=V;(\\Z=M\<\N#=z\uj̼\\U;9֎=b=t>\(8ػ\;=\W\=\!\y==\b\\=L,X<4\\ڌ<\ʓ\j=\=eC=e{;22\<\'ֻ/:Fm2<\=Z;_\0H|>G=V+dýM=\;w\˽\\8==Ϝ=Q$;?/%y.ʀS=Y\0/y<\Zz<=*PK^>6\\0{<\\\~5%b\\<\Z{\\f<O5\nFY9\EӼ﫼:VT\D⽬K\"A|/C\Z̼8\<\\E=\U%;\\ǻ<tP2\A<\\0<|v<4ߚ\=}b=tOy<#U\ZYB\e=tX_;4<T0=cT*ui=a|<BC<i`=V!=9;o\Z\A<\0=!\"\=O\Λ<\lڌn߼?d\<=\Ѽ=<S{VqG\8=\<\\ <b^>Tih=P\qA>\GE{\%;HV=h]',NULL),(3184,'44a57c9b-8b5a-45df-97ef-1fd58c8e37ba',8,'know that the guest assignment has been completed and that the FIT check in process is complete. 3.1.1.2 Group Check In. Group check in is quite similar to FIT check in with minor difference. Below is a screen shot of the group check in module which can be accessed by clicking on ‘Group Reservations’ and selecting a group that is arriving today or simply by clicking the ‘Today’s Arrival’ button and clicking the ‘Check-In’ button. The first step in checking in a group is entering the individual guest information into the system and selecting a room for the guest to stay in. Group reservations are handled by the sales department of a hotel and therefore a list of rooms, their type and their rates are negotiated within a formal written contract between the travels agencies and the hotel. Each contract has a start date and a cut off date, total number of rooms, their respective types and their rates. The hotel sets aside specific rooms that fall under the categories requested in the contract known as ‘Blocks’ and only the rooms that belong to a certain block which are assigned to the guests during check in. Hence the system only allows the user to assign the rooms that fall under a particular block making it easy for the front office staff to handle the check in process. Upon selecting any room the box appears in red and at this point guest information is entered into the respective fields. If the guest is a group leader, ‘Assign as Group Leader’ should be checked and ‘Add Guest’ button should be clicked. Upon doing so a prompt is generated to make sure that the guest was intended to be appointed as group leader. After pressing ‘Ok’, the guest information is saved and the information of the next guest is to be entered after selecting a room. If more than one guest is to be entered into a room then the respective room number has to be selected from the drop down box presented below and entering the guest information, ‘Add Guest’ button has to be clicked. When total number of entered guests equals the total number of guests specified in the group, the system generates a prompt notifying the user that the guest check in process is complete and requests to check in the guests into their specific rooms. After the user clicks ‘Yes’ the check in process is complete. 3.1.2 Guest Check Out The figure above shows the status of different rooms and with that we see there are 4 rooms which are due to check- out. We can also see that of the 4 rooms 3 belong to a group and one belongs to FIT. There are numerous differences between the two types of check out procedures hence they are addressed as follows. 3.1.2.1 FIT Check Out The hotel personnel working at the front office should be well aware of the room that are due out therefore they stay prepared for',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n&=9=\hWi=\<ia<	=hյ== /=j$0NPB<\@*<ǿ\<:m\W@<o%<#<w!Q\Hzr\+<y<K0@\np\L\:%\0>Lm=\!k=\{/==$\FᩴHįߍa\=x\	=e\;\r;\<؃\\=\b=\\n=\fO=\nє<?=ĵ+PZ\<\5\<nE\kQ\\<d<\\\`\\\\;Y0 \<c;%H3<=\=\'=vZ\\\A<o\=`۽{N;ϼz\{)\ɻ`a%\0^\=L©\\\L<u\=Y}=B<=\nպ\Ǽⰲ=\ZB<9ى0=\\=!=\0\<=X=B)$l<#崃o\\0>!h<n<Ɋ\rc\<\>O;&\.=\=>==O=\R<R\A=h\3į;lS<\=	14&I)\0<OU=\Q#\\4n=\A<m=b|=\]=A>x<;\\<k\=I\;D<%&<8\ּlQ=\Z=\=r=-\an =k\'/+<^<G-s=s\ָ\;=[I%=\\'R+=\-0L\'X\Zw>;\7\=\\D(=\\<4\=]C	\<,\~\'	<5G`</A<ށ<QEf=\\<1O<UX\<&Q\\9\y8\=\r\ܖ5==8vI=Ar>#<n\<=\@`J\'LL<r<y&\s\\7=S\һע\Z}@v,Ҽ[=FO=h>\n\J<j<dS\0\Ǫ^\=\\ܼ?\\h\=\K\Z=)ǽ2\n:f=Bǝё,F\ =b\qx\<`\=YK;Fa=CNK_(G=\\C;a=FBR\H߼\/5=S\;vY\\ϽI=T\=@\;\>,n2x=Rݑ=\\\\xy\O0=<z=qq\z<RCo\NT<I^;KF=g4\(=Z̒=\.3i}x=\K=%ЂXfʀ<óEQ\=\h=>^\\0<\S\<\I<\ďy<\!\H\	\\5];lR<~j\9<\-<S\\\0<0X$^cT<tP\\zVyR/\A\ZF=J؆\i;r<UWL=K=5\<5	<\r\\<8=N*!\<y\0X<Kzq$T-<Y\\=.dM:uE=\<\Z\<\k=*&= \<\ <<<!&=9\cH\)=/\i=G\+=PӼC4\\⫻a]74\ҟUB+z].\<ft=m\\eN=H<\>b\ü.\oN=\',NULL),(3185,'44a57c9b-8b5a-45df-97ef-1fd58c8e37ba',9,'one belongs to FIT. There are numerous differences between the two types of check out procedures hence they are addressed as follows. 3.1.2.1 FIT Check Out The hotel personnel working at the front office should be well aware of the room that are due out therefore they stay prepared for any guests who arrive at the desk to check out of the hotel. Upon confirming the room from the guest click on the particular room on the front office panel to access the detailed view of the reservation. Upon entering the detailed view click ‘Open’ in the financial information tab and click ‘Settlement’ to access the settlement window. Upon accessing the settlement window, the entire folio history will be available on the screen together with the charged rate, the total service charge and VAT shown in the figure below. On the right hand corner of the screen the reservation details can be seen such as the check in date and the check out date and most importantly the payment method highlighted in bold. If the payment method is cash then the ‘Cash’ should be selected in the ‘Payment Method’ box shown below. Since cash could be received in any currency that too should be documented by entering the right curreny in the next box together with the amount and press ‘Enter’. If the entered amount is less than the required amount then the system will generate a message prompting the user to enter more amount. If the amount entered is more than the required amount then the system will highlight the change that must be given back in NC. When all the monetary transactions are complete click the ‘Accept’ button. Upon clicking the button a prompt is generated to confirm the check out of the guest from the hotel. Upon clicking ‘Yes’ the FIT is checked out of the system. Then the house keeping department is notified about the departure by changing the room status to ‘Vacant – Dirty’. 3.1.2.2 Group Check Out The screen above shows 3 rooms that are checking out and that all the three rooms belong to the same group. The method to access the check out screen is the same as FIT (by clicking ‘Open’ and then ‘Settlement’) but the screen can only be accessed through the group leader’s room which is highlighted in white (room 402). Below is the screen shot of the settlement window for group check out. The rates that are charged is automatically picked by the system which was chosen at the time of reservation. On the top right hand corner we can see the list of extra charges that needs to be settled before the check out procedure can be taken forward. The extra charges if present, can be settled is a very easy manner. Since the charges are posted in individuals of the group, they are the ones responsible for paying their extra charges. Therefore each of the rooms need to be selected from the ‘Select Room’ box and',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n<>۩=\Z6ܽH׮\\<ƾ==|=\$=\>=\<Kİ=\(\\0=#W;n\\s7\66<u\=\\T`ݼkSٝ>=\\߮2<O=\\\)G\I=\\=x\<\\\$8	`\UD?A\0@H;g\\q=\)=\&;捘<x2=\r8\=@\<*5<\a#;\k=fܤ8=\nE=1\<NH\\V\O\r)$<dH\Zޫ<+<d\\\<S<\}!#k\mڽ>-;\ʼ\@<Q\\"\i**=\\<\J<\\н\<S=i)В\n=E5=M7F8ၽ\\\=DQ=*\\\Q\=\Zmm=\><\\=ֹ=!d;6\%=r\<*\\%s=Ӈ=؊=\h򡇽F=֠=D\3bG+= =3=\昼\=\\<m	`;aw&\<l=<\	m\ڼ\'ۂ\Qm\"\~q=T`\Q=C=.ʣ=ZVK;Y:)/|;9YpI=\4=׹<oK=\2<4\r\r=ۏ\<f$~=aw=&=Fj=h\\߼Oգ=\G\y<0<m\\< Ȁ<\2=+\ݼ\L@3*9<X\3=\\ıLPm=`2ռ[=\Ϋ=\50l\ȹk<J[v\<h!<\\=;\\	\6 [Ƚ߷d=NZ^C^=TRp=Is\=j=Z\v<w\<)\s<%q\\ؼɽn\^=\'\e\=SeJ0\=,\\"=\oku\n$=\\\n;̅=\\s\ٛ<6Lj%MQ=L^;̮V^=\H\<+\Ｏ6<\fkd:D:\<\n@<\U\Nc=\z<<\h$<1<J\P=`\=v\I\	=\\]Z?Vy=uȼѽ\O&=nC=X=ϣ:\"\<;\"k=[Ubv\w߻𼲊<\@/vA-<\b\"<e<R>~+=^\_t\)ռ\\\\<;j7=\n\e<B\;%f=/\<\\\\x۽K=\sK=\'<a=ｕ\b\\\}<~\\na\꼾Uј&ab\\b2C\K<U\<\|pNq;\o=$;=&۽x	uC=^3+\\;\\˽\'\?\<\\\<_=\$<\6\½\I\:\\s\nջbe\N$>9<V<F<\0\=b\:@6\<ۏ=\\<@\a=TS\=MS;ʽә`1P\<\\\0=ՉG[c{Zm֘̽K\\R#\X=\<ʻV&5\"\<\&==X=2ٻ\B=;',NULL),(3186,'44a57c9b-8b5a-45df-97ef-1fd58c8e37ba',10,'taken forward. The extra charges if present, can be settled is a very easy manner. Since the charges are posted in individuals of the group, they are the ones responsible for paying their extra charges. Therefore each of the rooms need to be selected from the ‘Select Room’ box and their individual bills need to be settled. After entering the payment method and the amount press ‘Enter’ to save the information. If there is another room with an extra charge posted to it then it can also be selected from the ‘Select Room’ box following the same procedure of settlement explained above. When the required amount has been entered and also all the extra charges have been settled click ‘Settle Bill’. A prompt is generated to confirm the action. After clicking ‘Yes’ the bills are settled and now the check out procedure can be initiated. To go ahead with the check out procedure the billing instruction needs to be checked. If the billing instruction says ‘Bill to Travel Agent’ then ‘TA Voucher’ should be selected as the Payment Method. If ‘Payment at Check Out’ is the billing instruction then the amount, currency and mode (cash/credit card) needs to be entered. When the parameters entered are accepted by the system click ‘Check-Out Group’ button. Upon clicking ‘Yes’ at the prompt the group is successfully checked out of the system and out of the hotel. 3.2 Point of Sale Functions 3.2.1 Start a Table The figure above is a screen shot of the main screen of the POS. The numbers on each of the green buttons represent a table number and the color represents its present state. To start a table one must click on the respective table where the current state is vacant. Upon clicking any of the vacant tables a prompt is generated for the server/manager password. After entering the passwords the system asks for the total number of guests being served on that table. Upon entering the required information and pressing ‘Ok’, the ordering panel becomes available from where we can select the items that were ordered by the guest. After the ordering is complete the kitchen is to be notified hence the ‘Send’ button needs to be clicked for the order to be sent to the kitchen. Below is a screen shot of the ordering panel. When the ‘Send’ button is clicked, a printer placed in the kitchen prints the KOT’s together with all the information such as the table number, ordering server, order time and order details in that KOT. The table status also changes from vacant to occupied. 3.2.2 Add more items to an existing Table To add more items to an existing table just click on the respective table to open it. When the ordering screen is screen after entering the right server password, select the items being ordered just as before by clicking their names on the screen and when you’re done click ‘Send’ for the kitchen to be notified. 3.2.3 Settle a Table',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\\k<7\=\xz_<\0Q\\=\¼QQ=^(=\n|=) \Zz<\"rf =Ľ\2\.l=~JQ@l\\(t(#λ\$9;[H7<4\"+=\\=\Zd\<\o\\==\\\;\Gkkl\]<\'͌!\;\n\y\y=t[<\\\hp=ˊ0\}=\f=\8\$<Q\?=ӑI+;\=/Y:Q0꽼^L[<J,\0=E+\L=\5\:8\n=U<WPE1\<E>=<sȏ=9\=r\\Zp9\=t\\\<\,֫5	<`=t\\t\\;c\=\=);Ī=\n\9{lnDܖ=\0\:1F=o\<e@ټ^/D\=O\nNt\=\\;8=\$T>T Ld?=\Iz\=zK\<ؗc<=9q$F=s%=~\d*//=\"G=]\,=\˛	\o|\rlY=\C\n\d߼\\U=\\U\Z=\4OJٽ\5=\})\9R\r\C=C=3\;*˻p==N\=<\I<t\\<jX;=q<Q<x=ۯN\\=\\\<\d;q\W=<\r1\O.Ǽ\w\<(\7r/H=\x91Ȑ=\\=KPR<eԽd\~\\n\fý\\G3;0\^~\;\\eU:ONF\:qf\1\'A=E؅\)R=+>\h=\쨼Ȅz=^B+<M\n=yR5jb=ZZK@T:=;=)=:<c\ pT\\eW]\\@\=sWQ\<b=+Z^;Ө?`<0=\\\\!\=\=3<oF=\]\'=j\Z~=L׼\<;ǮZ==Eo4=\'輿;?\<C=/KH=y2<e@\\\Z=\'\r=\Y=Kýd=_~<\ZNc=\N\=!x=@ɼ\!\Oj=\\#;\zɽ#FлTJWEѕ\\E̼6g鼍\!\u<\?Cd	>a=Bͼ;;<mR\3P#=ڄ1:،=Y|;T\{\=\\C=B\y]}A=0\r6\\=\f=3˫C\ͼ]Ƽ)<\\=Br\;!\:\nj<-=[ⒽBϻ\Ծ=\(]*\I%\\C\0==\׽ \=[\E;\<<\ZM<㠽G\y]<\L5()3_!<P\	<\+K\}\<\nv<^e0\=Ud<]\`	Y3=K:]\\}OA&=\F<)>=n\<=[¢+\Kg5<zzѽiP\K%\ѻ\]=\1f=P3Q-\<\&<o==\"<Ml\;̫\0<\\',NULL),(3187,'44a57c9b-8b5a-45df-97ef-1fd58c8e37ba',11,'on the respective table to open it. When the ordering screen is screen after entering the right server password, select the items being ordered just as before by clicking their names on the screen and when you’re done click ‘Send’ for the kitchen to be notified. 3.2.3 Settle a Table Open the table which needs to be settled and click ‘Settlement’. Below is the screen shot of the settlement window. A guest may desire to settle a bill in numerous ways such as cash, credit card or post it to the room. After selecting the appropriate payment mode, the amount is to be entered using the keyboard or the key pad provided in the panel. When the correct amount is entered the ‘Amount Tended’ button is to be clicked which will calculate the change that needs to be handed to the customer. To end the table click ‘Accept’. When the ‘Accept’ button is clicked the system makes sure that the entered amount has covered the amount due and only then closes the table and saves all the necessary data for accounting purposes or for any other future reference. 3.2.4 Split a bill Splitting a bill is one of the most important features in a POS that is used for a variety of functions making its application quite handy at times. A bill can be spliced for a minimum of 2 ways and a maximum of the number of items in the bill. For example an order that contains 5 items can only be split 5 ways. To split any order, open the table and click ‘Split’ after which the figure above can be seen. Then click on the individual item that needs to be spliced. When selected, the item appears on the left hand side of the screen. If ‘Split’ button is clicked at this point then the system will split the bill two ways with the selected ‘Red label 30’ appearing as Check 2. Below is a screen shot of splitting the bill in the manner mentioned above. When the bill has been spliced as per the need, ‘Done’ button needs to be clicked which closes the split window and takes us back to the ordering screen but now with an option of selecting which check/bill we want to view shown in figure below on the right. By selecting either Check 1 or Check 2 we can settle them individually as if they were separate tables. The un-splitting of the bill can also be performed at any time by clicking on the ‘Un-Split’ button presented above in the figure on the left. 3.2.5 Add modifications How the food is ordered by the guest might not always be the same even if the same entrée is ordered as different people prefer different way of enjoying their meals and as a hotel/restaurant guests have every right to demand things the way they prefer. Adding modifications as such means informing the kitchen regarding any special requests made by the guest so that',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\\x[=\"rtѼ\\Ľ/M<=p\;HMq=\\={\<!x^uj\"\<m=\\\)\u: =N\<\;$ߔ6=\\<U\n`<N\]:G8=\=\m)$\gSܻ۶߼9\0ۛ<s\/\K<(i\0=?\;&==4:u0=\r*<\´\=\?8f)=\\>:<\d*F\41]=\"\\:p,=Ђ\;]<\䎼:x-=\rN: >oqǽ鐼-QS<&\"<\?<\v4<a=\L;	e\n?h\wi=\?h*\=\n\=	\"=j=a89\;k\\=^=3=O=|<=\ʼ=\^@=wy!_f=\	ݍgX\<6=\-{ע&~=\~ȼ\;\\\=ahH<+Kx=kА;\=g,\<\'!Q*뮽5<`]M\=Pl<x?=7A7\t=]<=ZM@=\q;BK⑽\˻H=?\V=[$P\r>7I=\\=,$=])}<=s<q=X&\C9<\ټ3\<kq\"\U=ĭmʍ\':缇w<<tҽ\K=\[F73s=\6=p=\ra\\\0<\1X}嵽\l?<kvRo󦽲J\rߋ<\#=9\n84=#Rͼ#=\0J\˽ī===\ⒼA\nҼ\n=V	Ua=.\<.h\<!g\2=cl;H=\Z\,<\Z<HC<>7=Q\;љ\n>c\"yDm=1~b\ļ\g<=\\\$mF=8\=)\½i=K\"#@n0˻\/9=\=\nZ<>XK=5<~=*/;kn<\\P\sK\0\=ռu\dZ=\nE=	hUR=j=\v-\=yd<\l9h=:H;i|f;\Oȼ\e/<O;:>{<\\u\n?\=-=x\<\]LYe轉2=\\=\=Y;%<v	=mH6\\<0\n<t뽠=I	>ռ_>i<iX|_^ý\ƼnML=\<7QYtM=PK&\=8.Ű6\Hq<[޽Xl<5=TUT=ryQdjĪE㚽\\ټ\H\<Le\<Zgڼ\=[CjP9;\n=6\2=\\\=b^\\+<\\'\<NE\k;=\;ӭ߼4s\<,=&+P<5H><3@\3<Id=`u<\\\y<m/ϻ\=\Z\r=_=\5=h\g؜H\?L\\<\Z^\;\@^\\ؼq\<\e=\=z=\\\\s\=;\P=\\\w=<\;Zz<\<)\0+T\\',NULL),(3188,'44a57c9b-8b5a-45df-97ef-1fd58c8e37ba',12,'even if the same entrée is ordered as different people prefer different way of enjoying their meals and as a hotel/restaurant guests have every right to demand things the way they prefer. Adding modifications as such means informing the kitchen regarding any special requests made by the guest so that there are no complications later when the food is delivered to the guest. To access the modification screen the ‘Modification’ button needs to be clicked and the modification can be entered only after the menu item has been selected. Below is a screen shot of the modification window. Any modification can be sent to the kitchen by typing in the requirements either by keyboard or from the screen itself. When the modification is typed, click ‘Done’. This will take us now to the ordering screen where the modification appears in the box presented below. Upon clicking the ‘Send’ button the new order will be sent to the kitchen with the specified instruction. 3.2.6 Void Items Items need to be voided at times for numerous reasons such as for a mistake that the server committed while ordering the wrong item or at other times the guest didn’t necessarily like the food hence he/she decides to change their mind and order some thing else. Therefore to address these issues and many more the system provides for a way to void items. However voiding items as such is not a very good practice as it might create problems with the tax officials during auditing if done frequently. Therefore it is encouraged that the users be alert and calm while entering the order and double check it before sending it over to the kitchen. To void any item select the item from the ordering screen and click ‘Void’. Voiding credentials are only provided to the manager hence a manager password is required to enter the voiding screen. When the correct manager password is entered, the screen below will be seen. Before voiding any item a reason has to be selected. This information will later show up in the managers report so that a close eye can be kept regarding the use of this option. When the reason is selected, ‘Void’ button needs to be clicked which voids the selected item and takes us back to the ordering screen with the revised order list. 3.2.7 Room Post Room Post pertains to posting the restaurant bill into the guest folio so that the guest can pay all the bills at the time of check out. A guest may also be entitled to a meal as per the meal plan purchased hence the server/managers need to be aware of how the bill is to be settled. To complete a Room Post click on ‘Settlement’ and in the settlement window click ‘Room Post’. Below is the screen shot of the room post window. Before posting anything to the room the server/manager should ask the guest his/her room number. The room number is to be cross referenced by entering',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\rL\<p\=Pe<;U=\\_\<E<\I^$\<h-=\4\<\\\\Wׅݫ<@kE\=!;\`Z\K୘<V֨;g\\<\ MlL(4\;=+O<><=}\<\\< c.Z^H-as+w\<8*.$Yȵ\}jWiwK_-\\Ry\ \cҼ=a\q<\\RMQ#k_=|{=\n3;,8:>(8]=~<1ݻq<\=6<\\.=\MWTPfS<9\RBZ\CR<_*\|p=7VK໭Ol<eN\yȠ\</]|=\C=\\\<F*p:[jn?K=]6<]\\}&5+p</=<g\L=o<+=ꉘ=\/(|=P\輑׻\k1\=<w\ݽ\\\\Z#\}=v\n<=P`=D/\=\x\Q\=!\n9sO\jd8=ޒ<\;>h -KH콻	YC5=f\A=\4\63=	bO<f=v\=Ur(=\<ż@!q9\\1</_<+s@=\ք\=l;\qV\r=\"z_ K<<\5>\"U</&B<s̶\'pH\Zj=\Ζ`K=<=\J:A<\\l<c=&\g=\W8=!\g8;	O\\<\:\0=$[=~m=¼\9zwn<n\<\?+<z\\Y=v\;X<\E=Ȕ6;h	\eǼ\\<@x\\'\\<\9;\Z;=\\\#\'\v˼/=k=8<M:\;ޑ;2Rj=cTm=@=*\3ϋR+\Lr<\(=gB&ǽy\\<f#\h\ф<\4<ࡽ@wD\=M7\<M\0v^b;4\=\{=t\'Z\\;CM=_\=\x;:oѽT\¡Gh\Z%`==\'B\<%=F[>H=S\<\J̻=S\= <\0ʼ\衽Ǵ<_T=!&Ċ<[\96%p(=Db=V>IWGfX:\;Q=-=M\;`!~*4տ=\\;\_~\\Z=j:\\\=!w`\=v\\\<\0k=\<\<\"x\\U-3\?=ҍ==\ =&.\\<\w=IW=_w<Q+\=J=L|[Ic>5\:i4FJdL=/={O;a\,F<3\I,ʼK1[<-\<\r4;v=F_<(\=UBRJt\I~<7<]\=\e=1\r_\	=s3>\,\g)\rs[<,<\zM>hGҽa\=DuZ%<SMFP^\Ⱥ.Pw\;\l{=5<៌a<?\=\)A<PC>\	=_<\\\=\䠼F8\"',NULL),(3189,'44a57c9b-8b5a-45df-97ef-1fd58c8e37ba',13,'complete a Room Post click on ‘Settlement’ and in the settlement window click ‘Room Post’. Below is the screen shot of the room post window. Before posting anything to the room the server/manager should ask the guest his/her room number. The room number is to be cross referenced by entering it in the respective box and pressing the enter key in the keyboard. The figure above shows the information of the guest staying in the room 605 with their respective arrival and departure dates, meal plans and the total amount due. As mentioned before there are two ways to settle the bill. One is to post the bill as a charge so that the bill maybe settled during check out or it can be posted as a meal plan so that the guest is not charged. If ‘Post as Charge’ button is click then the bill will be charged to the guest folio but if the ‘Post as Meal Plan’ button is clicked then bill will be settled as a meal plan. However across different parts of the world including Nepal, alcoholic and other certain beverages are not covered under the meal plan. Hence in that case only the items applicable will be charged as meal plan and a separate bill is created for the other items which cannot be covered by the meal plan. But this new bill can be charged to the room as a charge. 3.3 House Keeping Fuctions The house keeping department of the hotel is constantly made aware of its rooms and its status by the house keeping module of the SDC which provides all the information in real time. During the busy season of a hotel the house keeping department is at its busiest therefore they clean the rooms from floor to floor and during slow seasons the rooms are cleaned as necessary. SDC also provides this similar functionality where the status of rooms can be changed individually or by the floor. Some of the basic functions of house keeping module is explained below. 3.3.1 Change Status Individually. To change the status of any room individually just click on the particular room from the screen shown above. For example we are selecting a room with room number 604 who’s current state is Vacant and Dirty. A room which is Vacant and Dirty can only be made Vacant or Out-of-Order, therefore these are the only two options available. To change the room to a vacant state, just select the option ‘Vacant’ and click on Change Status. 3.3.2 Change Status Floor Wise. To change the status floor wise click ‘Change Status’ button presented below. Upon click it, the above screen is seen. The house keeping provides a way to search the room according to their state and floor. The two screen shots below show where those options are available on the screen. By selecting a particular floor and a particular room state we can search for all the rooms that satisfies our criteria. In the figure',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n<\=r+Y^<\\ټ%=:\.<==y<+Խ\\<\==ELdʼ\$=\\0\<^v=q<Ӏ=%}\'>=jʺ\\`p=\N=P=ˇ9<\\0;\\R\=j^ƣ	̳;\Ǽ\r;\*\|<O=tb?z=k4=:\\;ұ:=\8%m\20=*]sv\09<SM,C\/%uM>\<K<ܞN=TLYcD~g<:<2\=~?<\\0H\<\\;\><\B=s\"\hJ^v];9~ws\'7=2\;j\@SU=d\=]\<p=2X=\%/T\b=\H= >=a=\\r%t;\9=a\n\=!p=_5=E2\\b\F4$=\[*<\{<Z?=]h>d\\P=\<\\^댽\b)y7#=	#)B\q\=ϾjMќ\<鹚=3<A\=+\u=%h~\B[=&<&s>(:H?{6\=\j=\\qh)=	=\9=c=^\Z7\\<?U<JI=ԕ<\\%\=\̻U\I5\<A\<\U\\<\䶽k\=\\\<,K߰<l=\:\<Zҽ7\'\ڽ\r%qFn\6=\|l\I\\\b<^q\\\<\W%=aO17\5~^idt=C\bǯ/=+;=\"a9=))5v=c\¼u;{<k=\jۼa2V.\a<6=\n<Zs<\7\;Ȣ;=:<tǼYݼ^<p\\\>7\0V\к|܌;7\Z=0\(6W=<6_\}^=\ZZ\ة<7\<>=Ђ=\n<W=7=C}#P<\_ai<rV=:c:=\\~4\:=V:װԽb<\\^\\<\\<\i\G=w\=\\)\\Ƽ	z=C&<ͬ콽z\K\Z;><	\:T\Om.G\d=l\g=y:=-F8z=;5=l<D\<=s==^y;Ko=<|ŝ=E\\<[O=A;$C,X4eQǼ;%M4\G=J	:;u<͞B\;TD9d7vPl:4\\|G<\"k</x\I<\\r\}\m2=sW<;Pb=9p˼\\rcǰ=\0=cdlbS\?Mr<u=@Xf:<\>8ҟ=AɇWt=rߐ\a3=XxGK<.J%}N=jU=\^Zy2|ڻ	E=c#1\k\SuAعS\\N+\Ի(\X=\\j=>w9(\q\=n\'h=ŉ<\\=;	(V*s',NULL),(3190,'44a57c9b-8b5a-45df-97ef-1fd58c8e37ba',14,'a way to search the room according to their state and floor. The two screen shots below show where those options are available on the screen. By selecting a particular floor and a particular room state we can search for all the rooms that satisfies our criteria. In the figure below, we have selected all the rooms in the 6th floor that are currently Vacant and Dirty. The result of our search is seen on the box which is pointed by the arrow . We can individually select the desired rooms by checking them off or if we wish to select all of the rooms at once then ‘Select All’ has to be checked. Now the selected rooms can be either made vacant, out of order or occupied-dirty which is presented on the left top corner of the screen shot presented above. To change the status click ‘Change Status’. A prompt is generated asking if the user is sure of the operation. When clicked ‘Yes’ the status of the rooms get changed. 3.3.3 Maintenance. The maintenance function provided with SDC is not a separate module but just a functionality which enhances the capabilities of the house keeping department. When the house keeping department notices something not working in a room such as the mini bar or the television, they notify the maintenance department regarding the nature of the defect filling out a form which is presented in the above figure under ‘Send Response Request’. After receiving the task the maintenance department on the other hand mobilizes its crews to take the right course of action based upon the information that was passed from the house keeping. Upon completion of the task in hand the maintenance notifies the house keeping and only then the house keeping change the status of the room to its respective state. Below is a screen shot of the form from where the maintenance is notified. After filling out the appropriate fields shown above the task is sent to maintenance by clicking ‘Dispatch to Maintenance’. When maintenance sees the task and completes it as requested, they resolve the task by clicking ‘Set Resolved Time’ which marks the task as Resolved. Below is a screen shot of the Maintenance which can be accessed by clicking ‘View History’ in the figure above.',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \nn;\0ټ\\<\?r=/`=Ln;e[=ce9<t!<\4=\\\<>\y᥼\=\\\}sZ.#(7F=b\J<S\r8r=*/\\<\vT<\\RO<\'==M\w=\\=6~kxVq<\=\\\	@<\H:(YO@\\<\\٨=\=+t\\"<\r=\\=%Q\=v\V=6`=X=&H3$%gG=SN]4\2<\$:i=t]@<_6\\d=wfiXr=K{=\c=	\d=1J˼Ǉ;\6C=Sֽ\).эJ\ =ꊼ\\\<\Lf&\h=\0_Z<0=_2`\;AH6+6?\<sƃ<\<5;6<L\?\7=b<t\<<w\)M7ͽ\v<D=P\19\\\'<M\=);~ؼ\zü:=ܓ,V\\\'\' =\0!(<\=d	 Nz=K,;/\=Ꮌ\`;%0;ƥ=c\x<m\<*=\Aq =j<;Z=5i=7=.<\=:\ixy=X=+\=q+\<\A	\<QD\WV=\--S,=\#\<[=]=g2ͼY6pPV^<%i=ŧ0</\!z=i2g\pG=4cH=d\'=*2̝<h<庻Ov!H\՛<\\&=*!!\\\\\<wO<7\P\<\nS\Pu=>4\gt^(\\=\\<μ\\qRKo<1+6ij3/Sl_+==\#ev;\r\<~Gv7=77ϼ\N=\|<۲=v_F;J.=c\\=G)-y\)C\\\M\=\X<<nP2Nv\>=),F\=\\\p=ht޽\v<ⓗ\"=@<\\\=Tx<DIA!T\\-\\=:\nf=b~<9/YUq=)=^v\F=X:@ŏަ>PU<ӨJ=Pq=ך.RZ;>7<>\'\\\c<l\=Z<[\\<\Ļ;F=.8aM<1[=ǧ<^=y\\nBg<ʒ2\:\<zH<Tgf;Z\S<%н;\7_\\\\\0<\|+֔=\[=M\)	3S\<ftE\n\t7o\R$R\b\\=`\\%\Z=\=F\= T<k\<\\Z<\2Za=:{;l\uC\_\"5<3J=L?a\><=A=7BQe\\F\-=3\=\\&=Q=fO=\b~\5=_1=\ْa.=!?=\1\	Ǽ+<l;jt?\"U=ĕ\\@<	y`ܒ]-L=\q\;\=ǳ1=\<\c<\=\1\<',NULL),(3191,'5dc74b21-17fa-4a69-b5c1-02ca12686a60',0,'Welcome to OutletA! We offer the following services: - Haircut - Massage - Facial treatment Appointments are available Monday to Friday between 10am and 6pm. Please provide your name, desired service, and preferred date when booking an appointment. To cancel appointment you need to visit url https://abc.com/cancel_appointment',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\7b:\>\;\n-=;n\T\;#\߼ͯ\nֻ\\L\\=x\s<\9W=\[\<F\0eM\=\`\<רE<TY00=?8\n<)@^\<\M}1|ѳ=ʻ\nʼhFO=k=Hq\=\=G2>w㴕S>=}K=m.<)n\\\\D<\&<F.\\0νa\=\6<\'\	T=.*\:\\,<<SϷ=\l,YS1$ƪ=\"zὡvfZ9Vb׀=\u½jý\윽9F<5W<\<\x=\;_\0\\r=\<=Kig<nc=ζ	E\ּ?ƨ\c\;{,^Ͻ*\;x\n>Fyu<%L\\[=g\fS_7G=#\=\\\r=*7eR>	=\ ?ڡB[\\jj֧$ѽ%}fD\=-\=|\<><\w\-=h2\<.<\N^x;sG=\	\ڹ\"ڢ<\M)\<g=\]$e<ܐh<G@}<\\ϼe=C\<\"\7	91\;=\\=\+B;yI<r=3\u\ļe=\X켸\0T=H\:\W彐b=\*\<%P<s=&5<=v97J<w\}ڼ\CWO\iӌ=\̼\\<\\-;;\_;\'3Zl\\=2h=P+<\p8;}<\<8=u\<\<h5s<o\<6\>=B\<	D\\0Q\K`;XF=?ۻU\ͼ\\Z\\=X6\:,5F\\R=P=\3=6=:\r=y<FD=m/A52=\@X\;\]6=C.p\=d=m==\`\<C=ls\;j4=\b;\g\<BS<r;,=k\\I\r\\<&Q\CV=%\\=a<\\[z<\;\"=\]=J=6\m~іNM\<p=s(\=ǥ\\E=N\\<A\rB<a} 5ǣ\Fz?!=\n\\+<\nԙ١?=3<n;\Ĝ= %*Y{=$$=`z+C<#=\s=:=*<Vx@<&:\Hq=\;{ʻo\=P\<2I\h\=u<3Q!	<\w\;\\\ż\<t=\0=\ͩϲ=;H:k<H\=g!\(~\\;=z\n\,=E\(\==<(\<\=Y׳=O=Xh<]¼<s=Ε<SX=JI@\n=\dzi\=vQ{J>Jw*9!j~»b8<Jڽ(YA(\i\ױD;(\Fҷ\JG\\(.#\0\\n:\\=ͯӼR\Z=\M=_`ļ\88=+f>=hI\'=AC= ;^2x<=)=wO\Yx\y& X','e582dbe1-68b0-471d-b4e2-49b47816f0ae');
+INSERT INTO `embeddings` (`id`, `document_id`, `chunk_index`, `chunk_text`, `embedding`, `document_outlet_name`) VALUES (3083,'33cb2e46-777c-47de-bd74-834ad8992f0f',0,'{\"PurchaseRequistionID\":10,\"RequisitionType\":\"Smooth Operation\",\"Date\":\"2025-09-17T00:00:00\",\"TotalAmount\":140.00,\"TaxAmount\":0.00,\"Company_Name\":\"New Company\",\"State\":\"Received\",\"ReceivedDate\":\"2025-09-17T00:00:00\",\"purchaseBillNumber\":222,\"DiscountAmount\":0.00,\"Outlet_Name\":\"Alice Restaurant, Gairidhara\",\"GRN\":9,\"RequisitionDetailsList\":[{\"ItemID\":188,\"UnitsOrdered\":1.00,\"PurchaseReqID\":10,\"Rate\":40.00,\"Name\":\"Radish\",\"BrandName\":\"\",\"Code\":\"\",\"UOM\":\"Kg\",\"StockType\":\"Non-Stockable\",\"Department\":\"Food\",\"GroupName\":\"Vegetables\",\"ExpDate\":\"\",\"Status\":\"In Stock\",\"Taxable\":\"No\"},{\"ItemID\":176,\"UnitsOrdered\":1.00,\"PurchaseReqID\":10,\"Rate\":100.00,\"Name\":\"Carrot\",\"BrandName\":\"\",\"Code\":\"\",\"UOM\":\"Kg\",\"StockType\":\"Stockable\",\"Department\":\"Food\",\"GroupName\":\"Vegetables\",\"ExpDate\":\"\",\"Status\":\"In Stock\",\"Taxable\":\"No\"}]}',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n*\aת=њS<tӽϾ<>\\Z=M\[<=8<\=Z/T1x43٫<f+Z U\\#\q/\<D=µ:h9w:d\n:\4=/\%\cQ=,뼄d/p;5,=ʺ=ʟ=<wF1\;\Hc!t=ȵ=\V2<4g(=9\\<+\=?\=tbE\\<9=\0dXl\n+&\櫽=T$Fv\:\\S`ǽU(\\\4=\0l\\(_=c<&^\.\pTh\=\$%lD6\vX\<2i;R\\<))<dBZAr<\9;\+-*_<V=Epu\\\[O9e\=l\S=\<\/<^\"|\U=o<f=#wy\nֽ@=PK,k<}\6_\\y=kJ?\=G=M󭺼!!`D=#1	\\޼\S@$N\#\\A=.ڼ$M<\nx7=1ڼX1=O\ҼąȍLH\׼\=\\=uR\\\ջ;#\<4LvlU\0^=#м)2^=`=`\";$(<E\<\\\RA,\Ni=ky~<I輴\<@\\<\<\\=ιk\<t-<t<\"dS;V\<%-W,\4=:v=c\ \q!~Z=J#~<`=sli<7f\"\\=U=7=Ճ=5	=v`\n=\=U5=\\<[CO\Y,Ң=PK\\=Z=;羼(=*=b\ʒ=ih@WQ\<Tn8u<;}$>ĸ-\"\\\Z=\\03=\\\_=n=E=<`Z\IN\P==:<\nP=ʽ\{>\\=	\p\\\<.6q]\ٸ=݁&=.7No3y\n>\@Z;H\=\M\=PpBH=p_<\R%=>H߼\<ń=ta.=U<\\<]:440l=\ꓼH\=>M=\2=\<\d@d\(AY<Rwa;0C=\\">\\wjD4N\\<4)\no?;Q=#p\o=\<D<\K:\Zl=q`1k=\\=\>bP}1d]=q\\<\w\?C=}oX2O\p==i<\t\^\ɽmK<0\=\\=6=\T-ļ\\<\A>=\\/GUOD\=\\\\E=R=?Q\r<{W=\\3i	=5\J<5\8=\"#=\<(W=c\Cˈ<=S0`\	\E\\;=\tu\\1\\<x=\=\E%l\e;R\r=\\ռ :AT \s=tG\\:@\\U<A(z<=\=oSK\[=',''),(3084,'9d0b6ec8-8f95-4df5-8fea-6fe8a33c9ae2',0,'Teaching Manual For SilverLine Dot Connector Version: S.10111 By SilverLine System Integrators Pvt. Ltd. Tables of Content. Introduction to SilverLine Dot Connector. Modules. Main Screen. Front Office. Point of Sale (POS). House Keeping. Maintenance. Functions. 3.1 Front Office Functions. 3.1.1 Check In 3.1.1.1 FIT Check In 3.1.1.2 Group Check In 3.1.2 Check Out 3.1.2.1 FIT Check Out 3.1.2.2 Group Check Out 3.1.3 Start Reservation 3.1.3.1 FIT Reservation 3.1.3.2 Group Reservation 3.2 Point of Sale Functions. 3.2.1 Start a Table 3.2.2 Add more item to an existing table 3.2.3 Settle a Table 3.2.4 Split a bill 3.2.5 Add Modifications 3.2.6 Void Items 3.2.8 Room Post 3.3 House Keeping Functions. Reports. Introduction to SilverLine Dot Connector. SilverLine Dot Connector (SDC) is a Property Management System (PMS) which is built for the purpose of managing different departmental operations of a hotel making it convenient to keep track of its day to day activities. With the arrival of computers into the scene, the old ways of maintaining logs of everything manually is long gone. In today’s competitive market its everyone’s aim to stay ahead of the game and one way of doing that is my having a system that helps you do just that. SDC is a system built towards addressing that need of a hotel where all the information needed to run a hotel efficiently is easily accessible with just a few clicks! More than that it integrates the functionality of all different departments of a hotel such as accounting, inventory, housekeeping etc reducing the time, energy and effort into managing all of them from one single point. SDC is one of the most efficient and easy to use PMS in the market. Build with the latest technology in software engineering, SDC provides a very efficient and user friendly operations making it very convenient for hotel staff to meet with the requirements of its daily operation. Some of its key features are as follows: SDC is a state of the art system that is capable of handling reservations for a hotel of any size. It is intelligent enough to interconnect different departments of a hotel, keeping them all informed about their duties and tasks in hand. The front office module gives an over view of the different states of different rooms (such as vacant-dirty or out-of-order), and these states are denoted by different color indexes helping the staff know everything they want with just a click. The reservation module is a full proof and fully tested part of the software that handles different information about the incoming guests such as their likes, and dislikes, room preferences and meal-plan, flight information. The guest history tracking system in the software makes reservations for repeated guests very simple and effective. The house keeping module also provides a visual over view for different rooms to be cleaned. The system provides a mechanism to clear the status of different rooms floor by floor or room by room as the situation demands. A maintenance module constantly keeps the maintenance',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n> :\4=y\;%\\<GK\<=ɖ;<2=trj=<jz=\<8)|=^\?<bBW<;\\=\;\-实= \rd=\\"<\Zf\<)\\uy=~6H:\r<.6=*z=.\\U=q\=\\>\0\h\(FP2&=\<̏XRb=\\<pe=Ůљ=\<J=z=\&\E\\;\c\?fo\<9Ҽ\i4\=WQB=ȋ12DGt-~=$=Ix=\\0<s=#ŽǓ\ >3^μF\r;\\9	i=\B=<oQ;\Z\MO=\j=[\L&;\MEg\Z\T9=:A<L=Fi=?\]a)f\\o\)B\:NF<:\#Tj\\	m\h5h\Q\S.t	=L).<=qS=3\0<C\;\+\<L=i	GZ\Tb9YGN=RL\<=\ϋ=;\"K=!tdL~\㬻y\;C\Ρ=|s=W6\:u\ѼS\2\Q=[ɼ~p=#L<xn=n=\/={<u=2=l\"ۼ0\\`=\x\r=0\?#\0Ϣ	US\Y.\]ӻ>#=)d\$=A =\=@ȉ\0A=DI\D<;;\<\\	{$$RkKؼ/_\Ol\1(3<J0x<KNL=$uG\=R\rd+ku;)*\<\'N<]:a&Gҍ<7=\\=RVO\<\r\\\;ː<\\N5UW=\뽱\"\n\}<t⡼C?7\_>\Z\<2_8=\\n=Av\>/8VVX<\p<[n\=\(=	\6/\\;=,>;O\r<\>a\"\L\0\<\=!;mx=2_\<q\7<_\"+ۋ6\z\oQ\ {@=)<+Tә%\;V^t=\=g~\;{=\=O%P=ʣ2qKy=\1>e=\j\n/^><C1 W\Ż\\k=\żpYH=\z=ȩ`rvr6\\\0=v=\=\=7	Q4=\\p3&H<SCN<\"H켃8\~\Z=\F~^=\`ӼȄ\G\"=\q\<䟯=\<\n\L<\I=\?9\=\L`=\_K\=\QƖו\ri$<<W\E\Z>=\J.Ҽ=HE\r<ߺ8=~]7=\\8\#)Y=\;b=\q\<s\=l.J;\\;f=p\吽\'\=\*=\<Ǎ==\=팻\0v=\aB<]=+\==\"h>ŁEn\:*>\Z;7\=θ5=xD%vz?C8(\0\:<\=`;<,4=&+t=','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3085,'9d0b6ec8-8f95-4df5-8fea-6fe8a33c9ae2',1,'very simple and effective. The house keeping module also provides a visual over view for different rooms to be cleaned. The system provides a mechanism to clear the status of different rooms floor by floor or room by room as the situation demands. A maintenance module constantly keeps the maintenance department at its toes with its constant reminder of the things that need to be addressed. Housekeeping department notifies the maintenance department instantly about any breakages or failures noticed during a cleaning procedure there by reducing the reaction time. A state of the art POS system is also a part of this software that takes care of all the restaurant management needs. The POS provides a visual overview of the entire restaurant with its exact floor plan and table numbering to help the manager and the servers know the status of different tables. Different color codes are used to signify different status of tables, such as Vacant or Occupied, which helps to know which tables are available for the guests walking in. The POS is best utilized with a touch screen monitor as the ordering process will be faster. Each menu item is listed under its own course list, helping servers or managers to know where to look for any particular menu item as needed. After the ordering is complete the order is sent with a push of a button. Upon doing so, all the bar items get printed in the bar and the kitchen items get printed in the kitchen reducing the need of having to send someone to the kitchen or the bar to inform the respective stations. Once the order is sent, it cannot be voided unless approved by the manager. Any alterations or special requests from the guests regarding any items ordered are entered into the system at the time of ordering which is printed at the respective terminals along with the items ordered so that the respective terminals are informed about such modifications. A bill splitting feature allows the bill to be split as requested by the customer which can be printed accordingly. A bill printing system is also a part of the software that prints the bills as necessary. Room posting for different guests according to their meal plan is also incorporated into the system. Reporting includes daily arrival, departure and stay-over reports. The end of the day report is also available with the exact cash count of both the local and foreign currencies. Any further reporting options preferred can also be incorporated upon request. These are just some of the general features of the PMS. Let us now go deeper into its individual module operations. Modules Just like any other PMS in the market, SDC covers all the basic modules required to run a successful hotel business. 70% of the revenue generated by a hotel comes from the guests that come to stay in the hotel, therefore a system as such requires every attention to details as far as guests are concerned. SDC',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\\ZE<\$Gv+Q \1\=eU;\U=np\n+8==%-=	툼J?[7W=\"\<\_*5);HI¼\9\vC=<\d< \t<t\Ľ5}e<׺j\=<U<\\T<1s=\n}L(j$w##\\\'x\<\\=֫eGG(xFA\\F\H=\"N=}M=T=L=\͊ZʌK=$]\P<+%\r=1<<9\0=eS\\:C\<Λ=\"nGu\<N\\\\2<ks^;\>\n\3<.G<l3`d\ZQGҘ\k=wH_;v9=*`\><\0}<\=Z	<Z\<\\!=Ti<\Ɏ<\\\!<\\<Z.=鐜n\<=?\\d\r*ls\< <\Z=/;rB=\IĻJ8;bpH=KG===\}9	5LC\lhG\\<q/;\=<N59\{\g>\v=R\Z=	\=\z<`O=	\Z\nD=\=\\n\r;\\(<;<vO<>\<wA<\>|=9<o=R\oj;2\=-=Ud<\\нnJ\n\'ӂ!mk9\fdTm\rd=\\<0sq{=Т7=\<Yuj\Z_\\<dzJͼ׏=getA=-<.;yg<z8<k2[=\noD\<w;1=g\|=Us\0=fz;\#\VG}\s#ڼ\\=2j\:%5\0\\<-GC</l=Go\'U=I \<<̼9=K\\n\\0=i\0l\Cg\ԶϽEW<D,\Z\\<5ɽtL=fqs<|!=\y\T[ýQ=\\}[\=/JJ1<\\\A-L=](ú\:^5D+\c⾻?f:<\\}=:=gW=\'==Ⓖ-><R$\I=)D\ؽ\*;By{\G\YT	<+k,=\'Aru(<\8\\m8=@\5ʙ:=\U\=	Ui?=Ē޼+ =$~\޼\#\<0!$=\G9(.\ZH;~$;LD,\=¼=Q==ǁ1=g\ȟ=\\&<kFVU\aC2=\lFL<Ppܽ|3F<5=W=5=;=\:\܍=g\Z|=Փ=_\W@=:E;+ﺦ<=)2=fDzt<:\'=Y\<=1s\=߭<\\<sqx<uP=\\"<t/P{5=\\\<\\}{۽&L\r=d,=a\\<\e`S\S=_T\K\w=,#\>K\>\<\\'<\\'=\\\"~','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3086,'9d0b6ec8-8f95-4df5-8fea-6fe8a33c9ae2',2,'market, SDC covers all the basic modules required to run a successful hotel business. 70% of the revenue generated by a hotel comes from the guests that come to stay in the hotel, therefore a system as such requires every attention to details as far as guests are concerned. SDC provides a state of the art front office reservation system that allows to know everything about a guest including any preferences in regards to dinning, lodging or any special requests that guests might have. Main Screen (fig 2.1) Apart from that house keeping also plays an important part in serving the guests as per their need. Restaurants are another place where the guests need to be served in a very professional manner. All of these operations are carried out by SDC which help the hotel staff to address the needed of the guest in a very professional and timely manner. Lets look at the operations of each of these modules. The above is a screen shot of SDC main screen. This is the main entry point of the system. On a first glace it gives all the statistics of the hotel that is relevant to the day. Values such as occupancy percentage and rooms to sell are very closely watched throughout the day as that determines the total revenue generated at the end of the day and also gives an idea of how many more guests can a hotel accommodate if new guests arrive as walk ins. Clicking in one of these parameters will give use more details pertaining to the parameters, such as if we double click “Total VIP’s” then a list of all the VIP’s with their room numbers will be seen on the screen. Shown below are 5 buttons which are the entry point to each of the mentioned modules. They are as follows: Front Office: By clicking in the above button in the SDC main screen, the front office of a hotel is seen. Front office module covers all the reservations together with the status of all the different rooms of a hotel. Settlement and viewing guest folio is also done from this module. Point of sale (POS): By clicking in the above button in the SDC, the POS can be accessed. POS is a module that serves as a restaurant management system for the hotels. Each restaurant of a hotel has its own terminal or POS from where it is accessed and used. House Keeping : By clicking on the above button, the House Keeping module can be accessed. House keeping module provides the house keeping department with the status of different rooms where by they know which rooms have to be cleaned or cleared. Accounting : By clicking on the above button, accounting module is viewed. Inventory Management : By clicking on the above button, Inventory Management module is accessed. Apart from accessing many different modules, SDC main screen also gives an over view of different time zones of different parts of the world,',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\<\\ἰ\rq<#80u=Wy=Ẻ7ʔ=\\\;IS.S<]<WDp(b=fQŽ=r7|oN=\I\B\ Ѻyo<\\\*<+\;{±< &{B=/˖=\Z!>3\<\'-=qλ\`ؽz`<}<Zi<Լ?\AλzaJKݡ=Ȕ\ޟ=Z=bs=0=o\=	\b̓\<fd=!s\<v<\[<\Z<야ns\:5\<W.<fs\pļ<\ZJ֐8\=20z\<:!=\'jMI\<>\{mdb=yx\\r<|=㶙<)E0=\\=\Ž\'&\y=ώ<\\_=T=q=\\Z\g\a>DI=S\Ż9X5a\˽	a=);\ļȖ\{]=l\\=\0ܼs<Õ\Z\\<\Zc(ҏ:H{H=̾\	f\ýļ&oM\y<\\<\C\n/5=jA<0먼&l\<E\<U\s=ޣ<\<\m=g\\0=\,\\<\\\<@\=: <\`P=ڃ<(\<K=j<<>p=!<<v\Z=g=^\\<yt=Ħ\ƻ;\Sv\\\<gJE=\۽	=Z\\X\<aH\=\	\Z\0\\=(gpf[;씽<`Q׽@\\G\<q~}\\n\jK#[<8i:\$xԻR=(k\\ro< <\<H\0<v\\\f\"%:\=]	#=|ݓ< \H`}b=ʉ\'_D\<\\\<.1=:7#<\\\`	&<3\Zik\=_\n\'쫅\\\<f?\ܺ樽\D\=U;ZCڂ=\"\;\=\˼\'𼆶\'\==Y[=\\ΏeU|\q:d==\Z=\\<L<nT=\=x\lFcVB=\n;>*>1Br\<\xX#6(7i~\m<Ê\w|<\=m=&\*=Ҩ<f\=\+\\v;\=\`3O{=}\,q 0wWJ\<\Jҽ\\Z\Ɗ;\L=\p\#\?ezμ \H\ޖtE<\Ha\"<\nOͽ<l\\Z=\Κ\⇳RnF\A0<\<8X0\\'g<X!=\J<\\Z=~*r=\j<\^]A;#Eǻ\W>x|B<\<B:IZ#=P5\6\<cl25%=L7;ǟ;\=+=\9=$>\=32<y><ݼD=\z/=ڐ<*+\<\Z=\D~<\n<\LB<7[k=\<<T\\׃=n)\=\=8Z!\k=\\<\6\=\"/o\\<','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3087,'9d0b6ec8-8f95-4df5-8fea-6fe8a33c9ae2',3,'Accounting : By clicking on the above button, accounting module is viewed. Inventory Management : By clicking on the above button, Inventory Management module is accessed. Apart from accessing many different modules, SDC main screen also gives an over view of different time zones of different parts of the world, and also a small calendar which is helpful in many different areas. Now let us go deeper into each of the modules of SDC. 2.2 Front Office. 2.2.1 Overview : The screen shot seen above is from the front office screen. Individual rectangles denote individual rooms of a hotel with their current status being represented by the color of these rectangles. For example, rooms 701 and 702 are out of order therefore they appear in a grey color, and the legend present in the right hand corner represents exactly just that. On the upper right hand corner there are 5 buttons. They are: 2.2.2 Refresh Button: Refreshes the display screen and updates the current house status. 2.2.3 Find Button: Upon entering guest room number in the highlighted textbox the user can press the Find button or press ‘Enter’ to view the room details. 2.2.4 Rates Button: Pressing the Rates Button will display the different rates offered in the hotel . Rates such as CP, MAP, BB can be seen with their individual breakdown of their room rates and meal plan rates. 2.2.5 View Report Button: Clicking on the View Report button, different reports can be seen. Details of different reports are covered in further sections. 2.2.6 Drop Down Menu Functions: Fig 2.2 Buttons Fig 2.3 Room State Fig 2.4 Room Type There are three Drop Down menus present in the front office screens which are highlighted above. The first one gives you the list of different room types present in the hotel such as Single, Double, Suite etc. The second one contains different room states as such Vacant, Out-of-order, Occupied etc. Selecting (Fig 2.5) different combinations of room states and room types and pressing the Find button or enter, the user can view the desired room having the selected states and types. For example in figure 2.2 and 2.3 user wishes to view all the single rooms in a hotel that are vacant. (Fig 2.5) Given below is a screen shot of the result where different room number and their corresponding states are seen. Fig (2.6) 2.2.7 View Room Button: In the above figure if one clicked room number 605 which is highlighted with the blue shade (indicating that the room is occupied), one would also be able to view the details of the room. The Figure is given below. 2.2.8 Reservation. Overview Fig (2.7) The figure above is from the Registration screen of the SDC. There are two types of reservations namely FIT Reservation and Group Reservation, which can be viewed by selecting the respective buttons shown below in figures 2.8 and 2.9. (FIT Reservation button or Group Reservation button). The result of the desired query can be seen',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \nF<-~vMY=tt=\\=\C<hV9=Z&O=x^li2=\`\\n;j͇\$<s 4<\\8<	{»rbb¼\e\a<aY\ZM=\<췽 \Z\<=i+=Cr=\A=F!n\\[\=l|ru\"\<иZF;\0<~+l׼u\0<\={=\P<B\=^7<,	><f\Ѽ\\;]E\;\0*\<\\l\<<jL+=`ۼ\v=v\';˸-\\\\N<}0<<\\\<7AbFq<\\@WJ=x*!v=<^i<\E<ߜ\Z<\ջF(= \':+\̼k<P#:|Bae==M\`n1=,=\\<=Q_c<Σ\=|\<A1\0\\r+0r=/%\Ģ:@;,\<\rG=Z\.\=\q`dN:g\K+u\H=Q\	u&Ė#CҪ<\">\&<\.\Ӹ;\_=o\<_e<~=\#K !\2Jָ\=bﺻ&i(YY=\ּ\=u^&>\_=~\=6\<s;v;=\C=jc=M<b{5=O	;H\	<\\<\(FmkQ\Nm=\\nU=X\<QX=\Nq=Pj\\(ܧ\]꼖Q<іŽ^<q\55Q;-=c7=M\Aj=V^\\r=S\⼳\"=\nA\&Sn/[=:\\\;>1fϼeX\q\;	\"\\ZЩ&=f\\0pp=NZ\弳Opa\\Z\r8.=*=\\Z=\q\\Sيؽ\[Nk\9S\<l<س<\<vݟ<<]\^<*PSu==*<lܽr\'<wdZ\`={7.\"O\|&\=\G[=\\\;<tE\7*q\0\=8[=P.-<\r=Itj^h=\`=\>0&ͽr<.5U\:Y=\<N+<ZŻች\\7 Eļ!\ս\\=\\\:\\d\=ȩ<ܯ\<c;\h=\}X:w=~ZP\Z=Ͳ\r޼ԝ\\1HW\Xz\uC.[o8ҍ;Tsj\&7z:?\\\\8j<;	-\=g=̼󲁳\Tk@\:\}*=fvBc=\\\=OW\\=	-缧\"=.\=*<qrI\Z=7=oW;GDZƼc=c}Tc=1@o<MMK>=[F\=ʉ=\O=(G¼}Y=؆5<bTjt\=PY@=\ަ=I0Ca⎱u=-<Òu\]CBU<!}\.\\%Ǽ[\=\Ql\̼\nw\;\\<\Z\<\\<\<5k=ե{Y<','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3088,'9d0b6ec8-8f95-4df5-8fea-6fe8a33c9ae2',4,'the Registration screen of the SDC. There are two types of reservations namely FIT Reservation and Group Reservation, which can be viewed by selecting the respective buttons shown below in figures 2.8 and 2.9. (FIT Reservation button or Group Reservation button). The result of the desired query can be seen in the box presented above. Fig (2.8) Fig (2.9) Fig (2.10) By clicking on the In House Guest button (Figure 2.10), the list of in house guests can be viewed. Fig (2.11) One can also perform any search that is based towards the guest’s first name, last name or the reservation ID that is provided at the time of reservation. Any such queries can be typed in the box located right below the reservation buttons shown in Figure 2.12. Fig (2.12) On the upper right hand corner of the Reservation/Registration window, there is a cluster of different buttons that provide access to different functionality to the user. Let us view each of these in detail. 2.2.9 REFRESH Button: The REFRESH button refreshes the view of either FIT reservation list or the Group reservation list or the in house guest list, depending upon which button is clicked, i.e. FIT Reservation Button or the Group Reservation Button or In House Guest Button (Refer to Figure 2.8, 2.9, 2.10). 2.2.10 START Button: By clicking the START Button, one can start making a reservation for either an FIT or a group. The details of how to create a reservation is described in later chapters. 2.2.11 CANCEL Button: By clicking the CANCEL Button, one can cancel a reservation. 2.2.12 GROUP CONTRACTS Button: The GROUP CONTRACTS button gives us access to information pertaining to different group reservation contracts a hotel may have with companies and travel agencies. Without any such contracts, a hotel may not choose to do any business with other companies. A contract includes important figures such as number and types of room, rates and dates at which the contract ends. The details are described in later chapters of how to create a group contract. 2.2.13 UPGRADE Button: The UPGRADE button takes us to the window where a reservation can be upgraded to other options provided by the hotel. 2.2.17 ADD ROOMS Button: The ADD ROOMS button adds more rooms to a reservation. 2.2.15 DEPOSITE Button: During the time of check in, guests may be asked for some deposits which can be entered in a window that is accessed by clicking in on the DEPOSITE button. The details are coming later in the chapters. 2.2.16 TODAY’S ARRIVAL Button: By clicking on the TODAY’S ARRIVAL button, one can view all the reservations that are arriving on the date it is clicked. 2.2.17 CHECK-IN Button: The CHECK-IN button takes us to the window where a guest that has a reservation and who is arriving today can be checked in. There are other information that is gathered from the guest at the time of check in which needs to be entered into the software. The guest check',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \noBv)+\W=\=G\= =[\H!̭K=ͯNu\<I$m\\<@!;7=\ok{?<\Lt<\}=Ͱ<R\X!MO\tYeJ=:=,=:@>u5=L̽\5Vv	GC]VFlè<\\"\;D\Z==5%=t^;\k\;=/\r>ur@\Ȼ:Q=Tm<\"=\JkN~\2.=c\o=lA.*Q==ZN\F+t\\\\=.	<w\=\\0<\}&\(\<n=w\\d;2%=Mc<-\'<\`6^\\\\\lt=MJ\$Ƽ=\\<\\?\pO=Ib=e\\n=-ϼJV\=!\,=}/Ey\\1\=\1/u:8\r\ݽ=<\rּc =&o,h4=i`	=\}r<\YE	Y\`5gkY;\n6\G\z\n9WZ\;\bȼ=l^\A=t+<\\n5y=\g%\ջ;\\k\=pyD=K=[&=(\<h=O<=/H=\\<\\E=lp{<\ͼ2rἴL;\\b\g=M\<}a=d\m\ܼ\x1=x\=\l\\<:%\'J==ZG<\o;\s\<H2=MZ[]\ȟ\b\n*=}\4>1=vspH?<P%t\f\";fk\'\\<H\Ͻ3\\=|(Ys<#\q=Q\nT`\mt44<K\\M=\<a1c\1=H9KlM\r=t$\\"T\<\\=L\B=KH1ꉷ\9=\y۹\\\<\0o=<7\0c<p\켷\n\\\P=4;N!H<>ae=ɝ;>{=W4\=k\Q<\\</=*si=\-=@\Z\ֵ;<M\dNJ=H=(ּ\oGo<x̽ ĺ=<\Ar\w\n;K\\z=F=\p|ЃA=\V<ùu\L8?d<ċ\oYi=\L=t?\D=\a<¼\\<\=1;mUAu<ٝ\\Լ\|\<\8X\\:=&\0=\o(<㺣D?=\8\'=K̼8<\\=\=%F!=Ӫ;u\>\<_\\\<\cg(;{n/\mvY*p;\JR\V=鲪_\\\=ěJ\=\Ź<v=Ac:Oj\j=\\=K;D;ʼ\\\ܼ\\\<,;&/\Z=\{<\r><m=\ ==7=>\\]\0\\=`\\\=p\;<\\l=aHy=NX=E7=s&\<~K	aP|׽\\}<\\S	=q۹\=f!<HgĻ@=\֟w<','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3089,'9d0b6ec8-8f95-4df5-8fea-6fe8a33c9ae2',5,'CHECK-IN button takes us to the window where a guest that has a reservation and who is arriving today can be checked in. There are other information that is gathered from the guest at the time of check in which needs to be entered into the software. The guest check in process is described in detail in later chapters. 2.2.18 VIEW DETAILS Button: The VIEW DETAILS button shows details such as guest details pertaining to either FIT reservation or Group reservation. When the in house guest list is viewed by clicking the In House Guest button (Figure 2.10), the details of each guest can be viewed by clicking the respective guest and after that then VIEW DETAILS Button. 2.2.19 EDIT Button: The EDIT button takes us to the window from where reservation details are edited. This feature, together with many other features is password protected so that only the person with the authorized privilege can make such changes. 2.2.20 ARRIVAL/DEPARTURE Button: The ARRIVAL/DEPARTURE button leads us to a command centre from where we are view the arrival and departure records. These records can be viewed according to their dates. Below is an example of such logs. 2.3 Point of Sale The point of sale (POS) of the SDC is concerned with the day to day activities of a particular restaurant and billing. The POS handles operations like ordering, notifying the kitchen, settling a table or posting the charge to the room of the in guest. Below is a screen shot of the POS main. The main screen of the POS represents the exact floor plan of the restaurant with its table numbers and other details regarding the location of its exits and bars. When trying to access the POS from the main screen of SDC, a prompt is generated asking which restaurant is to be entered. Upon selecting the desired restaurant its corresponding floor plan is fetched and shown on the screen. The main screen provides some valuable information such as which tables are occupied or vacant or which tables are departing making it easier for servers and managers alike to be better prepared for their service. The POS and all of its functions are described in detail in the further sections on POS Functions. 2.4 House Keeping. The house keeping module in the SDC is designed so that the house keeping department of a hotel is fully notified at all times, the different statuses a room may have during any particular time of day so that everyone working in and around is kept notified. Below is a screen shot of the house keeping module. Shown above is a listing of different rooms and their respective status. Just looking at the above screen the house keeping department is made aware of how many rooms are checking out, how many rooms are occupied and dirty and so on so that as soon as the rooms become available they are cleaned and made ready for future guests. Rooms of different categories can',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\0\<p\<!@&<}|=\\==O\z\<\_=\\u<P\;\\<\n\"\μ\Ƚ\\\r=HO=rM=|hm==䢼]p\\Z;\h:\W=\\ö==G\&S`ꋼ\0h\;R><ws\<Fa\<\=\>\'v{\\sn\=\f\<g|=SVM=\*wS֩=<\'qtnkJB=EK;\?+:=%Km\,ݼ\5=!\\T\\t=0W>\nc,\H\<\,}=\-~ͫ7\\n=\晽q\]<n<\\<<\<j\<\\c\\\;=<\\\μ\~޼n\<;8<-.1aL==*>=N̳<B=\|7=K	\	>O<\<5\ͼF}{@*=bA=U\\<\N<\f=\u=\s=O`-=F;Ҽ\`q쳽?)t==	\U*\\rRmSx@p_=2<V2\\nü:p;\\<=\۽/=삽\\<ZV=ݺ\n\\=r˶;ќ<ސ(=\\U\;R\=\0Ү;\Y=\*=1	=\ȅ<\'\e;ͼ\B\\\\<b<4V\>\\_<6Ѫ\\69l̉YE}4\PT\\\"\=跕<h\<ˡ!=\=mwL͏<6\]I\>yȫ<@>\0u\"=\_݈<\\pU/Hk\?{kVQ\=;#l,<($+<1<w\8\w\</=\;{#=Fg=Ǖ[= /A\u<<9&}\'z`<\nἯ|@gh2	<\\\E[=\.<\"م=\a\\\=z\;d\n\ʽ?\߱<ɼ\ګ\\r\8\\ʽMw_ \<oxȐV=U?=ѻO=d_<X=\(<5\<=\"=\L={ͼB\_<tcŒ=]L=ۦ=\U=n%{5=j6f=\\\n=\.7.\=L\<:=nÇˇ=h\gP\\;+\=\\_=k<%)\\=[\\\y=\:=ާ1znC(=\===\p=\	)\<ۈ;\{=#\\=Z\m\s:V\.;)\<\^h\xj\TR$<虛%\|;2%Lz)<\½T;S=\\<aQ=L\zƙ:l;\<\r,<;w<?=(\\̽\&=a֢=\'5Z\\\ީj2\<*2ݻ\r^=\cK<2\y<Z\5=\n9h2@= S=\=_LJ=\=\<F=$=\\\;\f=\	=\\=n<k\f\\\=as	<6\ܻ5)^༫P,ygP=7C(==x鷽\'e>A$):`<\س=$(','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3090,'9d0b6ec8-8f95-4df5-8fea-6fe8a33c9ae2',6,'the above screen the house keeping department is made aware of how many rooms are checking out, how many rooms are occupied and dirty and so on so that as soon as the rooms become available they are cleaned and made ready for future guests. Rooms of different categories can be searched by clicking on the respective buttons and clicking the ‘Find’ button. The complete function of house keeping is explained in the House keeping function section. Functions The numerous functions available in SDC enable one to better understand how a hotel operates on a day to day basis. From tracking guest folio, to viewing extra charges occurred during the guest’s stay, SDC provides the simplest of interfaces to carry out all the operations of a hotel in a very convenient and efficient manner. SDC also supports the flexibility of posting the charges from a restaurant to the guest’s room. Hence the operation capabilities of SDC expand into integrating different departmental functions of a hotel so that various tasks can be accomplished quicker. Let us look deeper into these different functionalities. 3.1 Front Office Funtions. 3.1.1 Guest Check In. Front Office is a place where the guests interact with the hotel formally for the first time, therefore it is very important for anyone working in the front office to be prepared with all the necessary details one might need during check in. On clicking the ‘Today’s Arrival’ button shown in the figure below, the user is able to view all the reservation details of all the guests or groups arriving today depending upon the selected reservation view. (FIT or Group) The procedure of checking in guests belonging to FIT or Group reservation is slightly different with one another. Let us go deeper into each of the following. 3.1.1.1 FIT Check In. As mentioned above, the list of reservations that are arriving today can be viewed by selecting the FIT reservation and clicking the Today’s Arrival button on the top. The reservation system searches for all the reservations that are arriving today and gives the result as shown below. The figure above shows two reservations that are currently scheduled to arrive today. By clicking on the individual listings we can view the details on the right side of the screen. We can see that for reservation 19, the assigned room number is shown as 0 and for reservation 20 the room number is shown as 602. This means that for the reservations having their room number as 0, individual room(s) will be selected at the time of check in and for the reservation with a room number other than 0, 602 in this case, a separate room is kept reserved. This is usually the case if the reservation is for a VIP guest. The above figure shows the details of the selected reservation whose arrival date is today. To check in guests, click the button ‘Check-In’ which is shown below. If the arrival date in the selected reservation matches with today’s',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n5\W<\v,@N\<\=߾\'=\"=j3\\<|<yY <U\\;*+4ƹ\r=]\	z=ܔh=s`tcp:<z:e&<Լ	&\0L(Ͻkj=@\=~=,6G<G3W\%<\'\<m<e\|\,F<wLe=c\ \\"|\;I=ʝ=sZW=\%k=\^<=\-=L܋Y\fZ\B;=4=\<Yd.:]>F=\"\=\\Zd )=|`i<\ʷf\\<3ح^my31=s\<Qc=K\γ=\'\0@;R\<c7:ûŨ=R\'=\\n\=W\\z$ɜa<Ë=j <\\\<-\<7Q=A;C..>\<\]\;4Ioc=;=.@\(!OP_O=-\\=lRy?=\\ȺF#=\Qt\<\阽M\\=\\	퀼[n<\ =2<0:=\Ԑ=]=tnZV)=\c\8\y`=Y\0Y<\W<\w=L<\H\,=\?6F=a\\<h=*d<x=\=d<JZ<\<G\:\<=$OV-=\{O\\Wa<M\,˽Gԙ<W`Y<.=I\Z<J<\\=ϼ\\\=ZNf\!&=?f;jP9r=7Qɽ{%e=\a;^\n\,=ؐ\p<:c\G;=g\WN\.rA<\"sMsO0\r=@`QUߪ\"@A\}\<E\<y)<em7qh=\}Il5=zQ{ꪭ=\Z\&==\\R<C^0\\9`i\\=y^9ݽ\\Dm\^M\Q<q0a=\j4D\0>\h=ڨf\\\!\"=\;剎<6<GOWp\Խ\y9M=\9===wxD=\b\\*=\0!=|\\0$b?=F@/\z<nŽ9\<gURuU\υ\4r\\>=OW<R\\:z\"=\0M=<\;<$\s=\\=FX\Z\Q=\\4\~g=p=\fO_KaE\r<\<v:^O\\\d;L\z\_<\;ﱼT\~\Ҽ#\BiLV\C;t@<LI\}?,= r_U=򿌼qhZ2\H<!<=ev\drO\B.!<7=\0\0;3\\r=\'+=\=:M\\ȽS=i=<|<Dkv.m.p=C׼v\ =%<e<ScĻ.=&QK=]6=$>9=l\\<\m;6_=ߞ\=3 =Å_=Q\=s\"\&\qӽ?\;	˼\S<\r<bs<+c\5&w=}fs<H|=,%$=ð=5\\\r=\Ze\i<','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3091,'9d0b6ec8-8f95-4df5-8fea-6fe8a33c9ae2',7,'is usually the case if the reservation is for a VIP guest. The above figure shows the details of the selected reservation whose arrival date is today. To check in guests, click the button ‘Check-In’ which is shown below. If the arrival date in the selected reservation matches with today’s date only then a check-in window is presented to the user. The figure below shows the window from where we can check in the guests. The figure above shows the terminal from where guests are checked into their rooms. As mentioned before if the room hasn’t been selected during the process of saving the reservation, then 0 appears as the selected room number and the system will ask the user to select a room first before entering any guest information. The system searches for available rooms based on the room type which was requested at the time of reservation and presents the options in the right hand corner of the screen. The figure above shows the interface from where a room is selected by just clicking the room number. (Note: Guest check-in is only possible after a room as has been assigned). When a room number is selected, a prompt is presented to make sure that the user intended to select that particular room. After pressing ‘Ok’, the selected room appears in Red as shown below. Now we are ready to enter guest information into the system so that the check in procedure can be completed and keys can be issued to the guest. The figure shown above is the terminal from where we enter all the guest information during the process of check-in. The entered information of the guest is saved by the system and it can be retrieved again in the future if the same guest decides to pay another visit. This type of guest tracking technology is found across all different PMS’s around the world and is one of the most helpful tool with which a hotel can understand more about its relationship with its guests. Let’s move in deeper into the details of the final stage of guest check in. Upon clicking the ‘Check-In’ button the above terminal is seen. The ‘Enter Guest Information’ box is already filled by the system since the guest information was already saved during the creation of the reservation. To save the information, just click ‘Add Guest’. The system only lets the user check in a specified number of guests, which was entered at the time of saving the reservation hence it keeps count of the number of guests entered. If the number of guests entered equals to the number of guests specified, a prompt is generated to let the user know that the guest assignment has been completed and that the FIT check in process is complete. 3.1.1.2 Group Check In. Group check in is quite similar to FIT check in with minor difference. Below is a screen shot of the group check in module which can be accessed by',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\j\=\<ȚibCI=)=L=T\=ݣy\\=Z\<T\<)6ɼ\E<\<=%ؼ|ӽI/=ME=\\<\dH<`	\@߼2<<1莽G=<6=)kMX\\=W=\S:=t=ޏ\H\AAǜ\ȺE$厽UY|\1;\=\r\0K\<\s֊=C<;V=r<\<\ƦU\=1e	usƼrмD\!\\nh\'\x<p\ag=~콫͞=\;#\\r\_o:\\DTP\.g+=0πp)!Q\'ʬ+\h;x\<\y=\\;P@\)&$=\U\yt4O=ę#=wR6=?a\=\\_\<\=\\=\:K.T=\<M6\\=\r\<$&:=JKV\r<\;\	>\;\a\!=yr=\=:Y<>4!=Kcw<=_Un\D\bq=ռ\	ʉ:\$kb	<\lv\<L-<s\r)t\;<N3\\\=u\R6r\\=Z<\>5\=\=8=h=Sļ_<&<=_%=o\j:T=:>Hǆ#%m\"\3F==x=\\R\'<\Z\|ņ7\\n<\\XV<	Wf\<\r=\\=\\\\j=`9c<bۃ\`\<\w+<eyƼq$\$=\\\ٗᄕ\"RX\"f7L=\̤\ғ<	\<Fw<\(\^ζ\\=k-NPq=]I\*<an<\b<yviMP\<W7-=\I\<\'2=%=?Aѥ=t\9\j\Nac^\]ma_*v\0=\=H~;\==-V=V;(\\Z=M\<\N#=z\uj̼\\U;9֎=b=t>\(8ػ\;=\W\=\!\y==\b\\=L,X<4\\ڌ<\ʓ\j=\=eC=e{;22\<\'ֻ/:Fm2<\=Z;_\0H|>G=V+dýM=\;w\˽\\8==Ϝ=Q$;?/%y.ʀS=Y\0/y<\Zz<=*PK^>6\\0{<\\\~5%b\\<\Z{\\f<O5\nFY9\EӼ﫼:VT\D⽬K\"A|/C\Z̼8\<\\E=\U%;\\ǻ<tP2\A<\\0<|v<4ߚ\=}b=tOy<#U\ZYB\e=tX_;4<T0=cT*ui=a|<BC<i`=V!=9;o\Z\A<\0=!\"\=O\Λ<\lڌn߼?d\<=\Ѽ=<S{VqG\8=\<\\ <b^>Tih=P\qA>\GE{\%;HV=h]','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3092,'9d0b6ec8-8f95-4df5-8fea-6fe8a33c9ae2',8,'know that the guest assignment has been completed and that the FIT check in process is complete. 3.1.1.2 Group Check In. Group check in is quite similar to FIT check in with minor difference. Below is a screen shot of the group check in module which can be accessed by clicking on ‘Group Reservations’ and selecting a group that is arriving today or simply by clicking the ‘Today’s Arrival’ button and clicking the ‘Check-In’ button. The first step in checking in a group is entering the individual guest information into the system and selecting a room for the guest to stay in. Group reservations are handled by the sales department of a hotel and therefore a list of rooms, their type and their rates are negotiated within a formal written contract between the travels agencies and the hotel. Each contract has a start date and a cut off date, total number of rooms, their respective types and their rates. The hotel sets aside specific rooms that fall under the categories requested in the contract known as ‘Blocks’ and only the rooms that belong to a certain block which are assigned to the guests during check in. Hence the system only allows the user to assign the rooms that fall under a particular block making it easy for the front office staff to handle the check in process. Upon selecting any room the box appears in red and at this point guest information is entered into the respective fields. If the guest is a group leader, ‘Assign as Group Leader’ should be checked and ‘Add Guest’ button should be clicked. Upon doing so a prompt is generated to make sure that the guest was intended to be appointed as group leader. After pressing ‘Ok’, the guest information is saved and the information of the next guest is to be entered after selecting a room. If more than one guest is to be entered into a room then the respective room number has to be selected from the drop down box presented below and entering the guest information, ‘Add Guest’ button has to be clicked. When total number of entered guests equals the total number of guests specified in the group, the system generates a prompt notifying the user that the guest check in process is complete and requests to check in the guests into their specific rooms. After the user clicks ‘Yes’ the check in process is complete. 3.1.2 Guest Check Out The figure above shows the status of different rooms and with that we see there are 4 rooms which are due to check- out. We can also see that of the 4 rooms 3 belong to a group and one belongs to FIT. There are numerous differences between the two types of check out procedures hence they are addressed as follows. 3.1.2.1 FIT Check Out The hotel personnel working at the front office should be well aware of the room that are due out therefore they stay prepared for',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n&=9=\hWi=\<ia<	=hյ== /=j$0NPB<\@*<ǿ\<:m\W@<o%<#<w!Q\Hzr\+<y<K0@\np\L\:%\0>Lm=\!k=\{/==$\FᩴHįߍa\=x\	=e\;\r;\<؃\\=\b=\\n=\fO=\nє<?=ĵ+PZ\<\5\<nE\kQ\\<d<\\\`\\\\;Y0 \<c;%H3<=\=\'=vZ\\\A<o\=`۽{N;ϼz\{)\ɻ`a%\0^\=L©\\\L<u\=Y}=B<=\nպ\Ǽⰲ=\ZB<9ى0=\\=!=\0\<=X=B)$l<#崃o\\0>!h<n<Ɋ\rc\<\>O;&\.=\=>==O=\R<R\A=h\3į;lS<\=	14&I)\0<OU=\Q#\\4n=\A<m=b|=\]=A>x<;\\<k\=I\;D<%&<8\ּlQ=\Z=\=r=-\an =k\'/+<^<G-s=s\ָ\;=[I%=\\'R+=\-0L\'X\Zw>;\7\=\\D(=\\<4\=]C	\<,\~\'	<5G`</A<ށ<QEf=\\<1O<UX\<&Q\\9\y8\=\r\ܖ5==8vI=Ar>#<n\<=\@`J\'LL<r<y&\s\\7=S\һע\Z}@v,Ҽ[=FO=h>\n\J<j<dS\0\Ǫ^\=\\ܼ?\\h\=\K\Z=)ǽ2\n:f=Bǝё,F\ =b\qx\<`\=YK;Fa=CNK_(G=\\C;a=FBR\H߼\/5=S\;vY\\ϽI=T\=@\;\>,n2x=Rݑ=\\\\xy\O0=<z=qq\z<RCo\NT<I^;KF=g4\(=Z̒=\.3i}x=\K=%ЂXfʀ<óEQ\=\h=>^\\0<\S\<\I<\ďy<\!\H\	\\5];lR<~j\9<\-<S\\\0<0X$^cT<tP\\zVyR/\A\ZF=J؆\i;r<UWL=K=5\<5	<\r\\<8=N*!\<y\0X<Kzq$T-<Y\\=.dM:uE=\<\Z\<\k=*&= \<\ <<<!&=9\cH\)=/\i=G\+=PӼC4\\⫻a]74\ҟUB+z].\<ft=m\\eN=H<\>b\ü.\oN=\','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3093,'9d0b6ec8-8f95-4df5-8fea-6fe8a33c9ae2',9,'one belongs to FIT. There are numerous differences between the two types of check out procedures hence they are addressed as follows. 3.1.2.1 FIT Check Out The hotel personnel working at the front office should be well aware of the room that are due out therefore they stay prepared for any guests who arrive at the desk to check out of the hotel. Upon confirming the room from the guest click on the particular room on the front office panel to access the detailed view of the reservation. Upon entering the detailed view click ‘Open’ in the financial information tab and click ‘Settlement’ to access the settlement window. Upon accessing the settlement window, the entire folio history will be available on the screen together with the charged rate, the total service charge and VAT shown in the figure below. On the right hand corner of the screen the reservation details can be seen such as the check in date and the check out date and most importantly the payment method highlighted in bold. If the payment method is cash then the ‘Cash’ should be selected in the ‘Payment Method’ box shown below. Since cash could be received in any currency that too should be documented by entering the right curreny in the next box together with the amount and press ‘Enter’. If the entered amount is less than the required amount then the system will generate a message prompting the user to enter more amount. If the amount entered is more than the required amount then the system will highlight the change that must be given back in NC. When all the monetary transactions are complete click the ‘Accept’ button. Upon clicking the button a prompt is generated to confirm the check out of the guest from the hotel. Upon clicking ‘Yes’ the FIT is checked out of the system. Then the house keeping department is notified about the departure by changing the room status to ‘Vacant – Dirty’. 3.1.2.2 Group Check Out The screen above shows 3 rooms that are checking out and that all the three rooms belong to the same group. The method to access the check out screen is the same as FIT (by clicking ‘Open’ and then ‘Settlement’) but the screen can only be accessed through the group leader’s room which is highlighted in white (room 402). Below is the screen shot of the settlement window for group check out. The rates that are charged is automatically picked by the system which was chosen at the time of reservation. On the top right hand corner we can see the list of extra charges that needs to be settled before the check out procedure can be taken forward. The extra charges if present, can be settled is a very easy manner. Since the charges are posted in individuals of the group, they are the ones responsible for paying their extra charges. Therefore each of the rooms need to be selected from the ‘Select Room’ box and',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n<>۩=\Z6ܽH׮\\<ƾ==|=\$=\>=\<Kİ=\(\\0=#W;n\\s7\66<u\=\\T`ݼkSٝ>=\\߮2<O=\\\)G\I=\\=x\<\\\$8	`\UD?A\0@H;g\\q=\)=\&;捘<x2=\r8\=@\<*5<\a#;\k=fܤ8=\nE=1\<NH\\V\O\r)$<dH\Zޫ<+<d\\\<S<\}!#k\mڽ>-;\ʼ\@<Q\\"\i**=\\<\J<\\н\<S=i)В\n=E5=M7F8ၽ\\\=DQ=*\\\Q\=\Zmm=\><\\=ֹ=!d;6\%=r\<*\\%s=Ӈ=؊=\h򡇽F=֠=D\3bG+= =3=\昼\=\\<m	`;aw&\<l=<\	m\ڼ\'ۂ\Qm\"\~q=T`\Q=C=.ʣ=ZVK;Y:)/|;9YpI=\4=׹<oK=\2<4\r\r=ۏ\<f$~=aw=&=Fj=h\\߼Oգ=\G\y<0<m\\< Ȁ<\2=+\ݼ\L@3*9<X\3=\\ıLPm=`2ռ[=\Ϋ=\50l\ȹk<J[v\<h!<\\=;\\	\6 [Ƚ߷d=NZ^C^=TRp=Is\=j=Z\v<w\<)\s<%q\\ؼɽn\^=\'\e\=SeJ0\=,\\"=\oku\n$=\\\n;̅=\\s\ٛ<6Lj%MQ=L^;̮V^=\H\<+\Ｏ6<\fkd:D:\<\n@<\U\Nc=\z<<\h$<1<J\P=`\=v\I\	=\\]Z?Vy=uȼѽ\O&=nC=X=ϣ:\"\<;\"k=[Ubv\w߻𼲊<\@/vA-<\b\"<e<R>~+=^\_t\)ռ\\\\<;j7=\n\e<B\;%f=/\<\\\\x۽K=\sK=\'<a=ｕ\b\\\}<~\\na\꼾Uј&ab\\b2C\K<U\<\|pNq;\o=$;=&۽x	uC=^3+\\;\\˽\'\?\<\\\<_=\$<\6\½\I\:\\s\nջbe\N$>9<V<F<\0\=b\:@6\<ۏ=\\<@\a=TS\=MS;ʽә`1P\<\\\0=ՉG[c{Zm֘̽K\\R#\X=\<ʻV&5\"\<\&==X=2ٻ\B=;','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3094,'9d0b6ec8-8f95-4df5-8fea-6fe8a33c9ae2',10,'taken forward. The extra charges if present, can be settled is a very easy manner. Since the charges are posted in individuals of the group, they are the ones responsible for paying their extra charges. Therefore each of the rooms need to be selected from the ‘Select Room’ box and their individual bills need to be settled. After entering the payment method and the amount press ‘Enter’ to save the information. If there is another room with an extra charge posted to it then it can also be selected from the ‘Select Room’ box following the same procedure of settlement explained above. When the required amount has been entered and also all the extra charges have been settled click ‘Settle Bill’. A prompt is generated to confirm the action. After clicking ‘Yes’ the bills are settled and now the check out procedure can be initiated. To go ahead with the check out procedure the billing instruction needs to be checked. If the billing instruction says ‘Bill to Travel Agent’ then ‘TA Voucher’ should be selected as the Payment Method. If ‘Payment at Check Out’ is the billing instruction then the amount, currency and mode (cash/credit card) needs to be entered. When the parameters entered are accepted by the system click ‘Check-Out Group’ button. Upon clicking ‘Yes’ at the prompt the group is successfully checked out of the system and out of the hotel. 3.2 Point of Sale Functions 3.2.1 Start a Table The figure above is a screen shot of the main screen of the POS. The numbers on each of the green buttons represent a table number and the color represents its present state. To start a table one must click on the respective table where the current state is vacant. Upon clicking any of the vacant tables a prompt is generated for the server/manager password. After entering the passwords the system asks for the total number of guests being served on that table. Upon entering the required information and pressing ‘Ok’, the ordering panel becomes available from where we can select the items that were ordered by the guest. After the ordering is complete the kitchen is to be notified hence the ‘Send’ button needs to be clicked for the order to be sent to the kitchen. Below is a screen shot of the ordering panel. When the ‘Send’ button is clicked, a printer placed in the kitchen prints the KOT’s together with all the information such as the table number, ordering server, order time and order details in that KOT. The table status also changes from vacant to occupied. 3.2.2 Add more items to an existing Table To add more items to an existing table just click on the respective table to open it. When the ordering screen is screen after entering the right server password, select the items being ordered just as before by clicking their names on the screen and when you’re done click ‘Send’ for the kitchen to be notified. 3.2.3 Settle a Table',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\\k<7\=\xz_<\0Q\\=\¼QQ=^(=\n|=) \Zz<\"rf =Ľ\2\.l=~JQ@l\\(t(#λ\$9;[H7<4\"+=\\=\Zd\<\o\\==\\\;\Gkkl\]<\'͌!\;\n\y\y=t[<\\\hp=ˊ0\}=\f=\8\$<Q\?=ӑI+;\=/Y:Q0꽼^L[<J,\0=E+\L=\5\:8\n=U<WPE1\<E>=<sȏ=9\=r\\Zp9\=t\\\<\,֫5	<`=t\\t\\;c\=\=);Ī=\n\9{lnDܖ=\0\:1F=o\<e@ټ^/D\=O\nNt\=\\;8=\$T>T Ld?=\Iz\=zK\<ؗc<=9q$F=s%=~\d*//=\"G=]\,=\˛	\o|\rlY=\C\n\d߼\\U=\\U\Z=\4OJٽ\5=\})\9R\r\C=C=3\;*˻p==N\=<\I<t\\<jX;=q<Q<x=ۯN\\=\\\<\d;q\W=<\r1\O.Ǽ\w\<(\7r/H=\x91Ȑ=\\=KPR<eԽd\~\\n\fý\\G3;0\^~\;\\eU:ONF\:qf\1\'A=E؅\)R=+>\h=\쨼Ȅz=^B+<M\n=yR5jb=ZZK@T:=;=)=:<c\ pT\\eW]\\@\=sWQ\<b=+Z^;Ө?`<0=\\\\!\=\=3<oF=\]\'=j\Z~=L׼\<;ǮZ==Eo4=\'輿;?\<C=/KH=y2<e@\\\Z=\'\r=\Y=Kýd=_~<\ZNc=\N\=!x=@ɼ\!\Oj=\\#;\zɽ#FлTJWEѕ\\E̼6g鼍\!\u<\?Cd	>a=Bͼ;;<mR\3P#=ڄ1:،=Y|;T\{\=\\C=B\y]}A=0\r6\\=\f=3˫C\ͼ]Ƽ)<\\=Br\;!\:\nj<-=[ⒽBϻ\Ծ=\(]*\I%\\C\0==\׽ \=[\E;\<<\ZM<㠽G\y]<\L5()3_!<P\	<\+K\}\<\nv<^e0\=Ud<]\`	Y3=K:]\\}OA&=\F<)>=n\<=[¢+\Kg5<zzѽiP\K%\ѻ\]=\1f=P3Q-\<\&<o==\"<Ml\;̫\0<\\','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3095,'9d0b6ec8-8f95-4df5-8fea-6fe8a33c9ae2',11,'on the respective table to open it. When the ordering screen is screen after entering the right server password, select the items being ordered just as before by clicking their names on the screen and when you’re done click ‘Send’ for the kitchen to be notified. 3.2.3 Settle a Table Open the table which needs to be settled and click ‘Settlement’. Below is the screen shot of the settlement window. A guest may desire to settle a bill in numerous ways such as cash, credit card or post it to the room. After selecting the appropriate payment mode, the amount is to be entered using the keyboard or the key pad provided in the panel. When the correct amount is entered the ‘Amount Tended’ button is to be clicked which will calculate the change that needs to be handed to the customer. To end the table click ‘Accept’. When the ‘Accept’ button is clicked the system makes sure that the entered amount has covered the amount due and only then closes the table and saves all the necessary data for accounting purposes or for any other future reference. 3.2.4 Split a bill Splitting a bill is one of the most important features in a POS that is used for a variety of functions making its application quite handy at times. A bill can be spliced for a minimum of 2 ways and a maximum of the number of items in the bill. For example an order that contains 5 items can only be split 5 ways. To split any order, open the table and click ‘Split’ after which the figure above can be seen. Then click on the individual item that needs to be spliced. When selected, the item appears on the left hand side of the screen. If ‘Split’ button is clicked at this point then the system will split the bill two ways with the selected ‘Red label 30’ appearing as Check 2. Below is a screen shot of splitting the bill in the manner mentioned above. When the bill has been spliced as per the need, ‘Done’ button needs to be clicked which closes the split window and takes us back to the ordering screen but now with an option of selecting which check/bill we want to view shown in figure below on the right. By selecting either Check 1 or Check 2 we can settle them individually as if they were separate tables. The un-splitting of the bill can also be performed at any time by clicking on the ‘Un-Split’ button presented above in the figure on the left. 3.2.5 Add modifications How the food is ordered by the guest might not always be the same even if the same entrée is ordered as different people prefer different way of enjoying their meals and as a hotel/restaurant guests have every right to demand things the way they prefer. Adding modifications as such means informing the kitchen regarding any special requests made by the guest so that',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\\x[=\"rtѼ\\Ľ/M<=p\;HMq=\\={\<!x^uj\"\<m=\\\)\u: =N\<\;$ߔ6=\\<U\n`<N\]:G8=\=\m)$\gSܻ۶߼9\0ۛ<s\/\K<(i\0=?\;&==4:u0=\r*<\´\=\?8f)=\\>:<\d*F\41]=\"\\:p,=Ђ\;]<\䎼:x-=\rN: >oqǽ鐼-QS<&\"<\?<\v4<a=\L;	e\n?h\wi=\?h*\=\n\=	\"=j=a89\;k\\=^=3=O=|<=\ʼ=\^@=wy!_f=\	ݍgX\<6=\-{ע&~=\~ȼ\;\\\=ahH<+Kx=kА;\=g,\<\'!Q*뮽5<`]M\=Pl<x?=7A7\t=]<=ZM@=\q;BK⑽\˻H=?\V=[$P\r>7I=\\=,$=])}<=s<q=X&\C9<\ټ3\<kq\"\U=ĭmʍ\':缇w<<tҽ\K=\[F73s=\6=p=\ra\\\0<\1X}嵽\l?<kvRo󦽲J\rߋ<\#=9\n84=#Rͼ#=\0J\˽ī===\ⒼA\nҼ\n=V	Ua=.\<.h\<!g\2=cl;H=\Z\,<\Z<HC<>7=Q\;љ\n>c\"yDm=1~b\ļ\g<=\\\$mF=8\=)\½i=K\"#@n0˻\/9=\=\nZ<>XK=5<~=*/;kn<\\P\sK\0\=ռu\dZ=\nE=	hUR=j=\v-\=yd<\l9h=:H;i|f;\Oȼ\e/<O;:>{<\\u\n?\=-=x\<\]LYe轉2=\\=\=Y;%<v	=mH6\\<0\n<t뽠=I	>ռ_>i<iX|_^ý\ƼnML=\<7QYtM=PK&\=8.Ű6\Hq<[޽Xl<5=TUT=ryQdjĪE㚽\\ټ\H\<Le\<Zgڼ\=[CjP9;\n=6\2=\\\=b^\\+<\\'\<NE\k;=\;ӭ߼4s\<,=&+P<5H><3@\3<Id=`u<\\\y<m/ϻ\=\Z\r=_=\5=h\g؜H\?L\\<\Z^\;\@^\\ؼq\<\e=\=z=\\\\s\=;\P=\\\w=<\;Zz<\<)\0+T\\','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3096,'9d0b6ec8-8f95-4df5-8fea-6fe8a33c9ae2',12,'even if the same entrée is ordered as different people prefer different way of enjoying their meals and as a hotel/restaurant guests have every right to demand things the way they prefer. Adding modifications as such means informing the kitchen regarding any special requests made by the guest so that there are no complications later when the food is delivered to the guest. To access the modification screen the ‘Modification’ button needs to be clicked and the modification can be entered only after the menu item has been selected. Below is a screen shot of the modification window. Any modification can be sent to the kitchen by typing in the requirements either by keyboard or from the screen itself. When the modification is typed, click ‘Done’. This will take us now to the ordering screen where the modification appears in the box presented below. Upon clicking the ‘Send’ button the new order will be sent to the kitchen with the specified instruction. 3.2.6 Void Items Items need to be voided at times for numerous reasons such as for a mistake that the server committed while ordering the wrong item or at other times the guest didn’t necessarily like the food hence he/she decides to change their mind and order some thing else. Therefore to address these issues and many more the system provides for a way to void items. However voiding items as such is not a very good practice as it might create problems with the tax officials during auditing if done frequently. Therefore it is encouraged that the users be alert and calm while entering the order and double check it before sending it over to the kitchen. To void any item select the item from the ordering screen and click ‘Void’. Voiding credentials are only provided to the manager hence a manager password is required to enter the voiding screen. When the correct manager password is entered, the screen below will be seen. Before voiding any item a reason has to be selected. This information will later show up in the managers report so that a close eye can be kept regarding the use of this option. When the reason is selected, ‘Void’ button needs to be clicked which voids the selected item and takes us back to the ordering screen with the revised order list. 3.2.7 Room Post Room Post pertains to posting the restaurant bill into the guest folio so that the guest can pay all the bills at the time of check out. A guest may also be entitled to a meal as per the meal plan purchased hence the server/managers need to be aware of how the bill is to be settled. To complete a Room Post click on ‘Settlement’ and in the settlement window click ‘Room Post’. Below is the screen shot of the room post window. Before posting anything to the room the server/manager should ask the guest his/her room number. The room number is to be cross referenced by entering',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\rL\<p\=Pe<;U=\\_\<E<\I^$\<h-=\4\<\\\\Wׅݫ<@kE\=!;\`Z\K୘<V֨;g\\<\ MlL(4\;=+O<><=}\<\\< c.Z^H-as+w\<8*.$Yȵ\}jWiwK_-\\Ry\ \cҼ=a\q<\\RMQ#k_=|{=\n3;,8:>(8]=~<1ݻq<\=6<\\.=\MWTPfS<9\RBZ\CR<_*\|p=7VK໭Ol<eN\yȠ\</]|=\C=\\\<F*p:[jn?K=]6<]\\}&5+p</=<g\L=o<+=ꉘ=\/(|=P\輑׻\k1\=<w\ݽ\\\\Z#\}=v\n<=P`=D/\=\x\Q\=!\n9sO\jd8=ޒ<\;>h -KH콻	YC5=f\A=\4\63=	bO<f=v\=Ur(=\<ż@!q9\\1</_<+s@=\ք\=l;\qV\r=\"z_ K<<\5>\"U</&B<s̶\'pH\Zj=\Ζ`K=<=\J:A<\\l<c=&\g=\W8=!\g8;	O\\<\:\0=$[=~m=¼\9zwn<n\<\?+<z\\Y=v\;X<\E=Ȕ6;h	\eǼ\\<@x\\'\\<\9;\Z;=\\\#\'\v˼/=k=8<M:\;ޑ;2Rj=cTm=@=*\3ϋR+\Lr<\(=gB&ǽy\\<f#\h\ф<\4<ࡽ@wD\=M7\<M\0v^b;4\=\{=t\'Z\\;CM=_\=\x;:oѽT\¡Gh\Z%`==\'B\<%=F[>H=S\<\J̻=S\= <\0ʼ\衽Ǵ<_T=!&Ċ<[\96%p(=Db=V>IWGfX:\;Q=-=M\;`!~*4տ=\\;\_~\\Z=j:\\\=!w`\=v\\\<\0k=\<\<\"x\\U-3\?=ҍ==\ =&.\\<\w=IW=_w<Q+\=J=L|[Ic>5\:i4FJdL=/={O;a\,F<3\I,ʼK1[<-\<\r4;v=F_<(\=UBRJt\I~<7<]\=\e=1\r_\	=s3>\,\g)\rs[<,<\zM>hGҽa\=DuZ%<SMFP^\Ⱥ.Pw\;\l{=5<៌a<?\=\)A<PC>\	=_<\\\=\䠼F8\"','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3097,'9d0b6ec8-8f95-4df5-8fea-6fe8a33c9ae2',13,'complete a Room Post click on ‘Settlement’ and in the settlement window click ‘Room Post’. Below is the screen shot of the room post window. Before posting anything to the room the server/manager should ask the guest his/her room number. The room number is to be cross referenced by entering it in the respective box and pressing the enter key in the keyboard. The figure above shows the information of the guest staying in the room 605 with their respective arrival and departure dates, meal plans and the total amount due. As mentioned before there are two ways to settle the bill. One is to post the bill as a charge so that the bill maybe settled during check out or it can be posted as a meal plan so that the guest is not charged. If ‘Post as Charge’ button is click then the bill will be charged to the guest folio but if the ‘Post as Meal Plan’ button is clicked then bill will be settled as a meal plan. However across different parts of the world including Nepal, alcoholic and other certain beverages are not covered under the meal plan. Hence in that case only the items applicable will be charged as meal plan and a separate bill is created for the other items which cannot be covered by the meal plan. But this new bill can be charged to the room as a charge. 3.3 House Keeping Fuctions The house keeping department of the hotel is constantly made aware of its rooms and its status by the house keeping module of the SDC which provides all the information in real time. During the busy season of a hotel the house keeping department is at its busiest therefore they clean the rooms from floor to floor and during slow seasons the rooms are cleaned as necessary. SDC also provides this similar functionality where the status of rooms can be changed individually or by the floor. Some of the basic functions of house keeping module is explained below. 3.3.1 Change Status Individually. To change the status of any room individually just click on the particular room from the screen shown above. For example we are selecting a room with room number 604 who’s current state is Vacant and Dirty. A room which is Vacant and Dirty can only be made Vacant or Out-of-Order, therefore these are the only two options available. To change the room to a vacant state, just select the option ‘Vacant’ and click on Change Status. 3.3.2 Change Status Floor Wise. To change the status floor wise click ‘Change Status’ button presented below. Upon click it, the above screen is seen. The house keeping provides a way to search the room according to their state and floor. The two screen shots below show where those options are available on the screen. By selecting a particular floor and a particular room state we can search for all the rooms that satisfies our criteria. In the figure',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n<\=r+Y^<\\ټ%=:\.<==y<+Խ\\<\==ELdʼ\$=\\0\<^v=q<Ӏ=%}\'>=jʺ\\`p=\N=P=ˇ9<\\0;\\R\=j^ƣ	̳;\Ǽ\r;\*\|<O=tb?z=k4=:\\;ұ:=\8%m\20=*]sv\09<SM,C\/%uM>\<K<ܞN=TLYcD~g<:<2\=~?<\\0H\<\\;\><\B=s\"\hJ^v];9~ws\'7=2\;j\@SU=d\=]\<p=2X=\%/T\b=\H= >=a=\\r%t;\9=a\n\=!p=_5=E2\\b\F4$=\[*<\{<Z?=]h>d\\P=\<\\^댽\b)y7#=	#)B\q\=ϾjMќ\<鹚=3<A\=+\u=%h~\B[=&<&s>(:H?{6\=\j=\\qh)=	=\9=c=^\Z7\\<?U<JI=ԕ<\\%\=\̻U\I5\<A\<\U\\<\䶽k\=\\\<,K߰<l=\:\<Zҽ7\'\ڽ\r%qFn\6=\|l\I\\\b<^q\\\<\W%=aO17\5~^idt=C\bǯ/=+;=\"a9=))5v=c\¼u;{<k=\jۼa2V.\a<6=\n<Zs<\7\;Ȣ;=:<tǼYݼ^<p\\\>7\0V\к|܌;7\Z=0\(6W=<6_\}^=\ZZ\ة<7\<>=Ђ=\n<W=7=C}#P<\_ai<rV=:c:=\\~4\:=V:װԽb<\\^\\<\\<\i\G=w\=\\)\\Ƽ	z=C&<ͬ콽z\K\Z;><	\:T\Om.G\d=l\g=y:=-F8z=;5=l<D\<=s==^y;Ko=<|ŝ=E\\<[O=A;$C,X4eQǼ;%M4\G=J	:;u<͞B\;TD9d7vPl:4\\|G<\"k</x\I<\\r\}\m2=sW<;Pb=9p˼\\rcǰ=\0=cdlbS\?Mr<u=@Xf:<\>8ҟ=AɇWt=rߐ\a3=XxGK<.J%}N=jU=\^Zy2|ڻ	E=c#1\k\SuAعS\\N+\Ի(\X=\\j=>w9(\q\=n\'h=ŉ<\\=;	(V*s','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3098,'9d0b6ec8-8f95-4df5-8fea-6fe8a33c9ae2',14,'a way to search the room according to their state and floor. The two screen shots below show where those options are available on the screen. By selecting a particular floor and a particular room state we can search for all the rooms that satisfies our criteria. In the figure below, we have selected all the rooms in the 6th floor that are currently Vacant and Dirty. The result of our search is seen on the box which is pointed by the arrow . We can individually select the desired rooms by checking them off or if we wish to select all of the rooms at once then ‘Select All’ has to be checked. Now the selected rooms can be either made vacant, out of order or occupied-dirty which is presented on the left top corner of the screen shot presented above. To change the status click ‘Change Status’. A prompt is generated asking if the user is sure of the operation. When clicked ‘Yes’ the status of the rooms get changed. 3.3.3 Maintenance. The maintenance function provided with SDC is not a separate module but just a functionality which enhances the capabilities of the house keeping department. When the house keeping department notices something not working in a room such as the mini bar or the television, they notify the maintenance department regarding the nature of the defect filling out a form which is presented in the above figure under ‘Send Response Request’. After receiving the task the maintenance department on the other hand mobilizes its crews to take the right course of action based upon the information that was passed from the house keeping. Upon completion of the task in hand the maintenance notifies the house keeping and only then the house keeping change the status of the room to its respective state. Below is a screen shot of the form from where the maintenance is notified. After filling out the appropriate fields shown above the task is sent to maintenance by clicking ‘Dispatch to Maintenance’. When maintenance sees the task and completes it as requested, they resolve the task by clicking ‘Set Resolved Time’ which marks the task as Resolved. Below is a screen shot of the Maintenance which can be accessed by clicking ‘View History’ in the figure above.',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \nn;\0ټ\\<\?r=/`=Ln;e[=ce9<t!<\4=\\\<>\y᥼\=\\\}sZ.#(7F=b\J<S\r8r=*/\\<\vT<\\RO<\'==M\w=\\=6~kxVq<\=\\\	@<\H:(YO@\\<\\٨=\=+t\\"<\r=\\=%Q\=v\V=6`=X=&H3$%gG=SN]4\2<\$:i=t]@<_6\\d=wfiXr=K{=\c=	\d=1J˼Ǉ;\6C=Sֽ\).эJ\ =ꊼ\\\<\Lf&\h=\0_Z<0=_2`\;AH6+6?\<sƃ<\<5;6<L\?\7=b<t\<<w\)M7ͽ\v<D=P\19\\\'<M\=);~ؼ\zü:=ܓ,V\\\'\' =\0!(<\=d	 Nz=K,;/\=Ꮌ\`;%0;ƥ=c\x<m\<*=\Aq =j<;Z=5i=7=.<\=:\ixy=X=+\=q+\<\A	\<QD\WV=\--S,=\#\<[=]=g2ͼY6pPV^<%i=ŧ0</\!z=i2g\pG=4cH=d\'=*2̝<h<庻Ov!H\՛<\\&=*!!\\\\\<wO<7\P\<\nS\Pu=>4\gt^(\\=\\<μ\\qRKo<1+6ij3/Sl_+==\#ev;\r\<~Gv7=77ϼ\N=\|<۲=v_F;J.=c\\=G)-y\)C\\\M\=\X<<nP2Nv\>=),F\=\\\p=ht޽\v<ⓗ\"=@<\\\=Tx<DIA!T\\-\\=:\nf=b~<9/YUq=)=^v\F=X:@ŏަ>PU<ӨJ=Pq=ך.RZ;>7<>\'\\\c<l\=Z<[\\<\Ļ;F=.8aM<1[=ǧ<^=y\\nBg<ʒ2\:\<zH<Tgf;Z\S<%н;\7_\\\\\0<\|+֔=\[=M\)	3S\<ftE\n\t7o\R$R\b\\=`\\%\Z=\=F\= T<k\<\\Z<\2Za=:{;l\uC\_\"5<3J=L?a\><=A=7BQe\\F\-=3\=\\&=Q=fO=\b~\5=_1=\ْa.=!?=\1\	Ǽ+<l;jt?\"U=ĕ\\@<	y`ܒ]-L=\q\;\=ǳ1=\<\c<\=\1\<','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3099,'b0fea813-cf69-455c-b7c8-3d0e42ad61f0',0,'Teaching Manual For SilverLine Dot Connector Version: S.10111 By SilverLine System Integrators Pvt. Ltd. Tables of Content. Introduction to SilverLine Dot Connector. Modules. Main Screen. Front Office. Point of Sale (POS). House Keeping. Maintenance. Functions. 3.1 Front Office Functions. 3.1.1 Check In 3.1.1.1 FIT Check In 3.1.1.2 Group Check In 3.1.2 Check Out 3.1.2.1 FIT Check Out 3.1.2.2 Group Check Out 3.1.3 Start Reservation 3.1.3.1 FIT Reservation 3.1.3.2 Group Reservation 3.2 Point of Sale Functions. 3.2.1 Start a Table 3.2.2 Add more item to an existing table 3.2.3 Settle a Table 3.2.4 Split a bill 3.2.5 Add Modifications 3.2.6 Void Items 3.2.8 Room Post 3.3 House Keeping Functions. Reports. Introduction to SilverLine Dot Connector. SilverLine Dot Connector (SDC) is a Property Management System (PMS) which is built for the purpose of managing different departmental operations of a hotel making it convenient to keep track of its day to day activities. With the arrival of computers into the scene, the old ways of maintaining logs of everything manually is long gone. In today’s competitive market its everyone’s aim to stay ahead of the game and one way of doing that is my having a system that helps you do just that. SDC is a system built towards addressing that need of a hotel where all the information needed to run a hotel efficiently is easily accessible with just a few clicks! More than that it integrates the functionality of all different departments of a hotel such as accounting, inventory, housekeeping etc reducing the time, energy and effort into managing all of them from one single point. SDC is one of the most efficient and easy to use PMS in the market. Build with the latest technology in software engineering, SDC provides a very efficient and user friendly operations making it very convenient for hotel staff to meet with the requirements of its daily operation. Some of its key features are as follows: SDC is a state of the art system that is capable of handling reservations for a hotel of any size. It is intelligent enough to interconnect different departments of a hotel, keeping them all informed about their duties and tasks in hand. The front office module gives an over view of the different states of different rooms (such as vacant-dirty or out-of-order), and these states are denoted by different color indexes helping the staff know everything they want with just a click. The reservation module is a full proof and fully tested part of the software that handles different information about the incoming guests such as their likes, and dislikes, room preferences and meal-plan, flight information. The guest history tracking system in the software makes reservations for repeated guests very simple and effective. The house keeping module also provides a visual over view for different rooms to be cleaned. The system provides a mechanism to clear the status of different rooms floor by floor or room by room as the situation demands. A maintenance module constantly keeps the maintenance',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n> :\4=y\;%\\<GK\<=ɖ;<2=trj=<jz=\<8)|=^\?<bBW<;\\=\;\-实= \rd=\\"<\Zf\<)\\uy=~6H:\r<.6=*z=.\\U=q\=\\>\0\h\(FP2&=\<̏XRb=\\<pe=Ůљ=\<J=z=\&\E\\;\c\?fo\<9Ҽ\i4\=WQB=ȋ12DGt-~=$=Ix=\\0<s=#ŽǓ\ >3^μF\r;\\9	i=\B=<oQ;\Z\MO=\j=[\L&;\MEg\Z\T9=:A<L=Fi=?\]a)f\\o\)B\:NF<:\#Tj\\	m\h5h\Q\S.t	=L).<=qS=3\0<C\;\+\<L=i	GZ\Tb9YGN=RL\<=\ϋ=;\"K=!tdL~\㬻y\;C\Ρ=|s=W6\:u\ѼS\2\Q=[ɼ~p=#L<xn=n=\/={<u=2=l\"ۼ0\\`=\x\r=0\?#\0Ϣ	US\Y.\]ӻ>#=)d\$=A =\=@ȉ\0A=DI\D<;;\<\\	{$$RkKؼ/_\Ol\1(3<J0x<KNL=$uG\=R\rd+ku;)*\<\'N<]:a&Gҍ<7=\\=RVO\<\r\\\;ː<\\N5UW=\뽱\"\n\}<t⡼C?7\_>\Z\<2_8=\\n=Av\>/8VVX<\p<[n\=\(=	\6/\\;=,>;O\r<\>a\"\L\0\<\=!;mx=2_\<q\7<_\"+ۋ6\z\oQ\ {@=)<+Tә%\;V^t=\=g~\;{=\=O%P=ʣ2qKy=\1>e=\j\n/^><C1 W\Ż\\k=\żpYH=\z=ȩ`rvr6\\\0=v=\=\=7	Q4=\\p3&H<SCN<\"H켃8\~\Z=\F~^=\`ӼȄ\G\"=\q\<䟯=\<\n\L<\I=\?9\=\L`=\_K\=\QƖו\ri$<<W\E\Z>=\J.Ҽ=HE\r<ߺ8=~]7=\\8\#)Y=\;b=\q\<s\=l.J;\\;f=p\吽\'\=\*=\<Ǎ==\=팻\0v=\aB<]=+\==\"h>ŁEn\:*>\Z;7\=θ5=xD%vz?C8(\0\:<\=`;<,4=&+t=',NULL),(3100,'b0fea813-cf69-455c-b7c8-3d0e42ad61f0',1,'very simple and effective. The house keeping module also provides a visual over view for different rooms to be cleaned. The system provides a mechanism to clear the status of different rooms floor by floor or room by room as the situation demands. A maintenance module constantly keeps the maintenance department at its toes with its constant reminder of the things that need to be addressed. Housekeeping department notifies the maintenance department instantly about any breakages or failures noticed during a cleaning procedure there by reducing the reaction time. A state of the art POS system is also a part of this software that takes care of all the restaurant management needs. The POS provides a visual overview of the entire restaurant with its exact floor plan and table numbering to help the manager and the servers know the status of different tables. Different color codes are used to signify different status of tables, such as Vacant or Occupied, which helps to know which tables are available for the guests walking in. The POS is best utilized with a touch screen monitor as the ordering process will be faster. Each menu item is listed under its own course list, helping servers or managers to know where to look for any particular menu item as needed. After the ordering is complete the order is sent with a push of a button. Upon doing so, all the bar items get printed in the bar and the kitchen items get printed in the kitchen reducing the need of having to send someone to the kitchen or the bar to inform the respective stations. Once the order is sent, it cannot be voided unless approved by the manager. Any alterations or special requests from the guests regarding any items ordered are entered into the system at the time of ordering which is printed at the respective terminals along with the items ordered so that the respective terminals are informed about such modifications. A bill splitting feature allows the bill to be split as requested by the customer which can be printed accordingly. A bill printing system is also a part of the software that prints the bills as necessary. Room posting for different guests according to their meal plan is also incorporated into the system. Reporting includes daily arrival, departure and stay-over reports. The end of the day report is also available with the exact cash count of both the local and foreign currencies. Any further reporting options preferred can also be incorporated upon request. These are just some of the general features of the PMS. Let us now go deeper into its individual module operations. Modules Just like any other PMS in the market, SDC covers all the basic modules required to run a successful hotel business. 70% of the revenue generated by a hotel comes from the guests that come to stay in the hotel, therefore a system as such requires every attention to details as far as guests are concerned. SDC',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\\ZE<\$Gv+Q \1\=eU;\U=np\n+8==%-=	툼J?[7W=\"\<\_*5);HI¼\9\vC=<\d< \t<t\Ľ5}e<׺j\=<U<\\T<1s=\n}L(j$w##\\\'x\<\\=֫eGG(xFA\\F\H=\"N=}M=T=L=\͊ZʌK=$]\P<+%\r=1<<9\0=eS\\:C\<Λ=\"nGu\<N\\\\2<ks^;\>\n\3<.G<l3`d\ZQGҘ\k=wH_;v9=*`\><\0}<\=Z	<Z\<\\!=Ti<\Ɏ<\\\!<\\<Z.=鐜n\<=?\\d\r*ls\< <\Z=/;rB=\IĻJ8;bpH=KG===\}9	5LC\lhG\\<q/;\=<N59\{\g>\v=R\Z=	\=\z<`O=	\Z\nD=\=\\n\r;\\(<;<vO<>\<wA<\>|=9<o=R\oj;2\=-=Ud<\\нnJ\n\'ӂ!mk9\fdTm\rd=\\<0sq{=Т7=\<Yuj\Z_\\<dzJͼ׏=getA=-<.;yg<z8<k2[=\noD\<w;1=g\|=Us\0=fz;\#\VG}\s#ڼ\\=2j\:%5\0\\<-GC</l=Go\'U=I \<<̼9=K\\n\\0=i\0l\Cg\ԶϽEW<D,\Z\\<5ɽtL=fqs<|!=\y\T[ýQ=\\}[\=/JJ1<\\\A-L=](ú\:^5D+\c⾻?f:<\\}=:=gW=\'==Ⓖ-><R$\I=)D\ؽ\*;By{\G\YT	<+k,=\'Aru(<\8\\m8=@\5ʙ:=\U\=	Ui?=Ē޼+ =$~\޼\#\<0!$=\G9(.\ZH;~$;LD,\=¼=Q==ǁ1=g\ȟ=\\&<kFVU\aC2=\lFL<Ppܽ|3F<5=W=5=;=\:\܍=g\Z|=Փ=_\W@=:E;+ﺦ<=)2=fDzt<:\'=Y\<=1s\=߭<\\<sqx<uP=\\"<t/P{5=\\\<\\}{۽&L\r=d,=a\\<\e`S\S=_T\K\w=,#\>K\>\<\\'<\\'=\\\"~',NULL),(3101,'b0fea813-cf69-455c-b7c8-3d0e42ad61f0',2,'market, SDC covers all the basic modules required to run a successful hotel business. 70% of the revenue generated by a hotel comes from the guests that come to stay in the hotel, therefore a system as such requires every attention to details as far as guests are concerned. SDC provides a state of the art front office reservation system that allows to know everything about a guest including any preferences in regards to dinning, lodging or any special requests that guests might have. Main Screen (fig 2.1) Apart from that house keeping also plays an important part in serving the guests as per their need. Restaurants are another place where the guests need to be served in a very professional manner. All of these operations are carried out by SDC which help the hotel staff to address the needed of the guest in a very professional and timely manner. Lets look at the operations of each of these modules. The above is a screen shot of SDC main screen. This is the main entry point of the system. On a first glace it gives all the statistics of the hotel that is relevant to the day. Values such as occupancy percentage and rooms to sell are very closely watched throughout the day as that determines the total revenue generated at the end of the day and also gives an idea of how many more guests can a hotel accommodate if new guests arrive as walk ins. Clicking in one of these parameters will give use more details pertaining to the parameters, such as if we double click “Total VIP’s” then a list of all the VIP’s with their room numbers will be seen on the screen. Shown below are 5 buttons which are the entry point to each of the mentioned modules. They are as follows: Front Office: By clicking in the above button in the SDC main screen, the front office of a hotel is seen. Front office module covers all the reservations together with the status of all the different rooms of a hotel. Settlement and viewing guest folio is also done from this module. Point of sale (POS): By clicking in the above button in the SDC, the POS can be accessed. POS is a module that serves as a restaurant management system for the hotels. Each restaurant of a hotel has its own terminal or POS from where it is accessed and used. House Keeping : By clicking on the above button, the House Keeping module can be accessed. House keeping module provides the house keeping department with the status of different rooms where by they know which rooms have to be cleaned or cleared. Accounting : By clicking on the above button, accounting module is viewed. Inventory Management : By clicking on the above button, Inventory Management module is accessed. Apart from accessing many different modules, SDC main screen also gives an over view of different time zones of different parts of the world,',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\<\\ἰ\rq<#80u=Wy=Ẻ7ʔ=\\\;IS.S<]<WDp(b=fQŽ=r7|oN=\I\B\ Ѻyo<\\\*<+\;{±< &{B=/˖=\Z!>3\<\'-=qλ\`ؽz`<}<Zi<Լ?\AλzaJKݡ=Ȕ\ޟ=Z=bs=0=o\=	\b̓\<fd=!s\<v<\[<\Z<야ns\:5\<W.<fs\pļ<\ZJ֐8\=20z\<:!=\'jMI\<>\{mdb=yx\\r<|=㶙<)E0=\\=\Ž\'&\y=ώ<\\_=T=q=\\Z\g\a>DI=S\Ż9X5a\˽	a=);\ļȖ\{]=l\\=\0ܼs<Õ\Z\\<\Zc(ҏ:H{H=̾\	f\ýļ&oM\y<\\<\C\n/5=jA<0먼&l\<E\<U\s=ޣ<\<\m=g\\0=\,\\<\\\<@\=: <\`P=ڃ<(\<K=j<<>p=!<<v\Z=g=^\\<yt=Ħ\ƻ;\Sv\\\<gJE=\۽	=Z\\X\<aH\=\	\Z\0\\=(gpf[;씽<`Q׽@\\G\<q~}\\n\jK#[<8i:\$xԻR=(k\\ro< <\<H\0<v\\\f\"%:\=]	#=|ݓ< \H`}b=ʉ\'_D\<\\\<.1=:7#<\\\`	&<3\Zik\=_\n\'쫅\\\<f?\ܺ樽\D\=U;ZCڂ=\"\;\=\˼\'𼆶\'\==Y[=\\ΏeU|\q:d==\Z=\\<L<nT=\=x\lFcVB=\n;>*>1Br\<\xX#6(7i~\m<Ê\w|<\=m=&\*=Ҩ<f\=\+\\v;\=\`3O{=}\,q 0wWJ\<\Jҽ\\Z\Ɗ;\L=\p\#\?ezμ \H\ޖtE<\Ha\"<\nOͽ<l\\Z=\Κ\⇳RnF\A0<\<8X0\\'g<X!=\J<\\Z=~*r=\j<\^]A;#Eǻ\W>x|B<\<B:IZ#=P5\6\<cl25%=L7;ǟ;\=+=\9=$>\=32<y><ݼD=\z/=ڐ<*+\<\Z=\D~<\n<\LB<7[k=\<<T\\׃=n)\=\=8Z!\k=\\<\6\=\"/o\\<',NULL),(3102,'b0fea813-cf69-455c-b7c8-3d0e42ad61f0',3,'Accounting : By clicking on the above button, accounting module is viewed. Inventory Management : By clicking on the above button, Inventory Management module is accessed. Apart from accessing many different modules, SDC main screen also gives an over view of different time zones of different parts of the world, and also a small calendar which is helpful in many different areas. Now let us go deeper into each of the modules of SDC. 2.2 Front Office. 2.2.1 Overview : The screen shot seen above is from the front office screen. Individual rectangles denote individual rooms of a hotel with their current status being represented by the color of these rectangles. For example, rooms 701 and 702 are out of order therefore they appear in a grey color, and the legend present in the right hand corner represents exactly just that. On the upper right hand corner there are 5 buttons. They are: 2.2.2 Refresh Button: Refreshes the display screen and updates the current house status. 2.2.3 Find Button: Upon entering guest room number in the highlighted textbox the user can press the Find button or press ‘Enter’ to view the room details. 2.2.4 Rates Button: Pressing the Rates Button will display the different rates offered in the hotel . Rates such as CP, MAP, BB can be seen with their individual breakdown of their room rates and meal plan rates. 2.2.5 View Report Button: Clicking on the View Report button, different reports can be seen. Details of different reports are covered in further sections. 2.2.6 Drop Down Menu Functions: Fig 2.2 Buttons Fig 2.3 Room State Fig 2.4 Room Type There are three Drop Down menus present in the front office screens which are highlighted above. The first one gives you the list of different room types present in the hotel such as Single, Double, Suite etc. The second one contains different room states as such Vacant, Out-of-order, Occupied etc. Selecting (Fig 2.5) different combinations of room states and room types and pressing the Find button or enter, the user can view the desired room having the selected states and types. For example in figure 2.2 and 2.3 user wishes to view all the single rooms in a hotel that are vacant. (Fig 2.5) Given below is a screen shot of the result where different room number and their corresponding states are seen. Fig (2.6) 2.2.7 View Room Button: In the above figure if one clicked room number 605 which is highlighted with the blue shade (indicating that the room is occupied), one would also be able to view the details of the room. The Figure is given below. 2.2.8 Reservation. Overview Fig (2.7) The figure above is from the Registration screen of the SDC. There are two types of reservations namely FIT Reservation and Group Reservation, which can be viewed by selecting the respective buttons shown below in figures 2.8 and 2.9. (FIT Reservation button or Group Reservation button). The result of the desired query can be seen',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \nF<-~vMY=tt=\\=\C<hV9=Z&O=x^li2=\`\\n;j͇\$<s 4<\\8<	{»rbb¼\e\a<aY\ZM=\<췽 \Z\<=i+=Cr=\A=F!n\\[\=l|ru\"\<иZF;\0<~+l׼u\0<\={=\P<B\=^7<,	><f\Ѽ\\;]E\;\0*\<\\l\<<jL+=`ۼ\v=v\';˸-\\\\N<}0<<\\\<7AbFq<\\@WJ=x*!v=<^i<\E<ߜ\Z<\ջF(= \':+\̼k<P#:|Bae==M\`n1=,=\\<=Q_c<Σ\=|\<A1\0\\r+0r=/%\Ģ:@;,\<\rG=Z\.\=\q`dN:g\K+u\H=Q\	u&Ė#CҪ<\">\&<\.\Ӹ;\_=o\<_e<~=\#K !\2Jָ\=bﺻ&i(YY=\ּ\=u^&>\_=~\=6\<s;v;=\C=jc=M<b{5=O	;H\	<\\<\(FmkQ\Nm=\\nU=X\<QX=\Nq=Pj\\(ܧ\]꼖Q<іŽ^<q\55Q;-=c7=M\Aj=V^\\r=S\⼳\"=\nA\&Sn/[=:\\\;>1fϼeX\q\;	\"\\ZЩ&=f\\0pp=NZ\弳Opa\\Z\r8.=*=\\Z=\q\\Sيؽ\[Nk\9S\<l<س<\<vݟ<<]\^<*PSu==*<lܽr\'<wdZ\`={7.\"O\|&\=\G[=\\\;<tE\7*q\0\=8[=P.-<\r=Itj^h=\`=\>0&ͽr<.5U\:Y=\<N+<ZŻች\\7 Eļ!\ս\\=\\\:\\d\=ȩ<ܯ\<c;\h=\}X:w=~ZP\Z=Ͳ\r޼ԝ\\1HW\Xz\uC.[o8ҍ;Tsj\&7z:?\\\\8j<;	-\=g=̼󲁳\Tk@\:\}*=fvBc=\\\=OW\\=	-缧\"=.\=*<qrI\Z=7=oW;GDZƼc=c}Tc=1@o<MMK>=[F\=ʉ=\O=(G¼}Y=؆5<bTjt\=PY@=\ަ=I0Ca⎱u=-<Òu\]CBU<!}\.\\%Ǽ[\=\Ql\̼\nw\;\\<\Z\<\\<\<5k=ե{Y<',NULL),(3103,'b0fea813-cf69-455c-b7c8-3d0e42ad61f0',4,'the Registration screen of the SDC. There are two types of reservations namely FIT Reservation and Group Reservation, which can be viewed by selecting the respective buttons shown below in figures 2.8 and 2.9. (FIT Reservation button or Group Reservation button). The result of the desired query can be seen in the box presented above. Fig (2.8) Fig (2.9) Fig (2.10) By clicking on the In House Guest button (Figure 2.10), the list of in house guests can be viewed. Fig (2.11) One can also perform any search that is based towards the guest’s first name, last name or the reservation ID that is provided at the time of reservation. Any such queries can be typed in the box located right below the reservation buttons shown in Figure 2.12. Fig (2.12) On the upper right hand corner of the Reservation/Registration window, there is a cluster of different buttons that provide access to different functionality to the user. Let us view each of these in detail. 2.2.9 REFRESH Button: The REFRESH button refreshes the view of either FIT reservation list or the Group reservation list or the in house guest list, depending upon which button is clicked, i.e. FIT Reservation Button or the Group Reservation Button or In House Guest Button (Refer to Figure 2.8, 2.9, 2.10). 2.2.10 START Button: By clicking the START Button, one can start making a reservation for either an FIT or a group. The details of how to create a reservation is described in later chapters. 2.2.11 CANCEL Button: By clicking the CANCEL Button, one can cancel a reservation. 2.2.12 GROUP CONTRACTS Button: The GROUP CONTRACTS button gives us access to information pertaining to different group reservation contracts a hotel may have with companies and travel agencies. Without any such contracts, a hotel may not choose to do any business with other companies. A contract includes important figures such as number and types of room, rates and dates at which the contract ends. The details are described in later chapters of how to create a group contract. 2.2.13 UPGRADE Button: The UPGRADE button takes us to the window where a reservation can be upgraded to other options provided by the hotel. 2.2.17 ADD ROOMS Button: The ADD ROOMS button adds more rooms to a reservation. 2.2.15 DEPOSITE Button: During the time of check in, guests may be asked for some deposits which can be entered in a window that is accessed by clicking in on the DEPOSITE button. The details are coming later in the chapters. 2.2.16 TODAY’S ARRIVAL Button: By clicking on the TODAY’S ARRIVAL button, one can view all the reservations that are arriving on the date it is clicked. 2.2.17 CHECK-IN Button: The CHECK-IN button takes us to the window where a guest that has a reservation and who is arriving today can be checked in. There are other information that is gathered from the guest at the time of check in which needs to be entered into the software. The guest check',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \noBv)+\W=\=G\= =[\H!̭K=ͯNu\<I$m\\<@!;7=\ok{?<\Lt<\}=Ͱ<R\X!MO\tYeJ=:=,=:@>u5=L̽\5Vv	GC]VFlè<\\"\;D\Z==5%=t^;\k\;=/\r>ur@\Ȼ:Q=Tm<\"=\JkN~\2.=c\o=lA.*Q==ZN\F+t\\\\=.	<w\=\\0<\}&\(\<n=w\\d;2%=Mc<-\'<\`6^\\\\\lt=MJ\$Ƽ=\\<\\?\pO=Ib=e\\n=-ϼJV\=!\,=}/Ey\\1\=\1/u:8\r\ݽ=<\rּc =&o,h4=i`	=\}r<\YE	Y\`5gkY;\n6\G\z\n9WZ\;\bȼ=l^\A=t+<\\n5y=\g%\ջ;\\k\=pyD=K=[&=(\<h=O<=/H=\\<\\E=lp{<\ͼ2rἴL;\\b\g=M\<}a=d\m\ܼ\x1=x\=\l\\<:%\'J==ZG<\o;\s\<H2=MZ[]\ȟ\b\n*=}\4>1=vspH?<P%t\f\";fk\'\\<H\Ͻ3\\=|(Ys<#\q=Q\nT`\mt44<K\\M=\<a1c\1=H9KlM\r=t$\\"T\<\\=L\B=KH1ꉷ\9=\y۹\\\<\0o=<7\0c<p\켷\n\\\P=4;N!H<>ae=ɝ;>{=W4\=k\Q<\\</=*si=\-=@\Z\ֵ;<M\dNJ=H=(ּ\oGo<x̽ ĺ=<\Ar\w\n;K\\z=F=\p|ЃA=\V<ùu\L8?d<ċ\oYi=\L=t?\D=\a<¼\\<\=1;mUAu<ٝ\\Լ\|\<\8X\\:=&\0=\o(<㺣D?=\8\'=K̼8<\\=\=%F!=Ӫ;u\>\<_\\\<\cg(;{n/\mvY*p;\JR\V=鲪_\\\=ěJ\=\Ź<v=Ac:Oj\j=\\=K;D;ʼ\\\ܼ\\\<,;&/\Z=\{<\r><m=\ ==7=>\\]\0\\=`\\\=p\;<\\l=aHy=NX=E7=s&\<~K	aP|׽\\}<\\S	=q۹\=f!<HgĻ@=\֟w<',NULL),(3104,'b0fea813-cf69-455c-b7c8-3d0e42ad61f0',5,'CHECK-IN button takes us to the window where a guest that has a reservation and who is arriving today can be checked in. There are other information that is gathered from the guest at the time of check in which needs to be entered into the software. The guest check in process is described in detail in later chapters. 2.2.18 VIEW DETAILS Button: The VIEW DETAILS button shows details such as guest details pertaining to either FIT reservation or Group reservation. When the in house guest list is viewed by clicking the In House Guest button (Figure 2.10), the details of each guest can be viewed by clicking the respective guest and after that then VIEW DETAILS Button. 2.2.19 EDIT Button: The EDIT button takes us to the window from where reservation details are edited. This feature, together with many other features is password protected so that only the person with the authorized privilege can make such changes. 2.2.20 ARRIVAL/DEPARTURE Button: The ARRIVAL/DEPARTURE button leads us to a command centre from where we are view the arrival and departure records. These records can be viewed according to their dates. Below is an example of such logs. 2.3 Point of Sale The point of sale (POS) of the SDC is concerned with the day to day activities of a particular restaurant and billing. The POS handles operations like ordering, notifying the kitchen, settling a table or posting the charge to the room of the in guest. Below is a screen shot of the POS main. The main screen of the POS represents the exact floor plan of the restaurant with its table numbers and other details regarding the location of its exits and bars. When trying to access the POS from the main screen of SDC, a prompt is generated asking which restaurant is to be entered. Upon selecting the desired restaurant its corresponding floor plan is fetched and shown on the screen. The main screen provides some valuable information such as which tables are occupied or vacant or which tables are departing making it easier for servers and managers alike to be better prepared for their service. The POS and all of its functions are described in detail in the further sections on POS Functions. 2.4 House Keeping. The house keeping module in the SDC is designed so that the house keeping department of a hotel is fully notified at all times, the different statuses a room may have during any particular time of day so that everyone working in and around is kept notified. Below is a screen shot of the house keeping module. Shown above is a listing of different rooms and their respective status. Just looking at the above screen the house keeping department is made aware of how many rooms are checking out, how many rooms are occupied and dirty and so on so that as soon as the rooms become available they are cleaned and made ready for future guests. Rooms of different categories can',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\0\<p\<!@&<}|=\\==O\z\<\_=\\u<P\;\\<\n\"\μ\Ƚ\\\r=HO=rM=|hm==䢼]p\\Z;\h:\W=\\ö==G\&S`ꋼ\0h\;R><ws\<Fa\<\=\>\'v{\\sn\=\f\<g|=SVM=\*wS֩=<\'qtnkJB=EK;\?+:=%Km\,ݼ\5=!\\T\\t=0W>\nc,\H\<\,}=\-~ͫ7\\n=\晽q\]<n<\\<<\<j\<\\c\\\;=<\\\μ\~޼n\<;8<-.1aL==*>=N̳<B=\|7=K	\	>O<\<5\ͼF}{@*=bA=U\\<\N<\f=\u=\s=O`-=F;Ҽ\`q쳽?)t==	\U*\\rRmSx@p_=2<V2\\nü:p;\\<=\۽/=삽\\<ZV=ݺ\n\\=r˶;ќ<ސ(=\\U\;R\=\0Ү;\Y=\*=1	=\ȅ<\'\e;ͼ\B\\\\<b<4V\>\\_<6Ѫ\\69l̉YE}4\PT\\\"\=跕<h\<ˡ!=\=mwL͏<6\]I\>yȫ<@>\0u\"=\_݈<\\pU/Hk\?{kVQ\=;#l,<($+<1<w\8\w\</=\;{#=Fg=Ǖ[= /A\u<<9&}\'z`<\nἯ|@gh2	<\\\E[=\.<\"م=\a\\\=z\;d\n\ʽ?\߱<ɼ\ګ\\r\8\\ʽMw_ \<oxȐV=U?=ѻO=d_<X=\(<5\<=\"=\L={ͼB\_<tcŒ=]L=ۦ=\U=n%{5=j6f=\\\n=\.7.\=L\<:=nÇˇ=h\gP\\;+\=\\_=k<%)\\=[\\\y=\:=ާ1znC(=\===\p=\	)\<ۈ;\{=#\\=Z\m\s:V\.;)\<\^h\xj\TR$<虛%\|;2%Lz)<\½T;S=\\<aQ=L\zƙ:l;\<\r,<;w<?=(\\̽\&=a֢=\'5Z\\\ީj2\<*2ݻ\r^=\cK<2\y<Z\5=\n9h2@= S=\=_LJ=\=\<F=$=\\\;\f=\	=\\=n<k\f\\\=as	<6\ܻ5)^༫P,ygP=7C(==x鷽\'e>A$):`<\س=$(',NULL),(3105,'b0fea813-cf69-455c-b7c8-3d0e42ad61f0',6,'the above screen the house keeping department is made aware of how many rooms are checking out, how many rooms are occupied and dirty and so on so that as soon as the rooms become available they are cleaned and made ready for future guests. Rooms of different categories can be searched by clicking on the respective buttons and clicking the ‘Find’ button. The complete function of house keeping is explained in the House keeping function section. Functions The numerous functions available in SDC enable one to better understand how a hotel operates on a day to day basis. From tracking guest folio, to viewing extra charges occurred during the guest’s stay, SDC provides the simplest of interfaces to carry out all the operations of a hotel in a very convenient and efficient manner. SDC also supports the flexibility of posting the charges from a restaurant to the guest’s room. Hence the operation capabilities of SDC expand into integrating different departmental functions of a hotel so that various tasks can be accomplished quicker. Let us look deeper into these different functionalities. 3.1 Front Office Funtions. 3.1.1 Guest Check In. Front Office is a place where the guests interact with the hotel formally for the first time, therefore it is very important for anyone working in the front office to be prepared with all the necessary details one might need during check in. On clicking the ‘Today’s Arrival’ button shown in the figure below, the user is able to view all the reservation details of all the guests or groups arriving today depending upon the selected reservation view. (FIT or Group) The procedure of checking in guests belonging to FIT or Group reservation is slightly different with one another. Let us go deeper into each of the following. 3.1.1.1 FIT Check In. As mentioned above, the list of reservations that are arriving today can be viewed by selecting the FIT reservation and clicking the Today’s Arrival button on the top. The reservation system searches for all the reservations that are arriving today and gives the result as shown below. The figure above shows two reservations that are currently scheduled to arrive today. By clicking on the individual listings we can view the details on the right side of the screen. We can see that for reservation 19, the assigned room number is shown as 0 and for reservation 20 the room number is shown as 602. This means that for the reservations having their room number as 0, individual room(s) will be selected at the time of check in and for the reservation with a room number other than 0, 602 in this case, a separate room is kept reserved. This is usually the case if the reservation is for a VIP guest. The above figure shows the details of the selected reservation whose arrival date is today. To check in guests, click the button ‘Check-In’ which is shown below. If the arrival date in the selected reservation matches with today’s',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n5\W<\v,@N\<\=߾\'=\"=j3\\<|<yY <U\\;*+4ƹ\r=]\	z=ܔh=s`tcp:<z:e&<Լ	&\0L(Ͻkj=@\=~=,6G<G3W\%<\'\<m<e\|\,F<wLe=c\ \\"|\;I=ʝ=sZW=\%k=\^<=\-=L܋Y\fZ\B;=4=\<Yd.:]>F=\"\=\\Zd )=|`i<\ʷf\\<3ح^my31=s\<Qc=K\γ=\'\0@;R\<c7:ûŨ=R\'=\\n\=W\\z$ɜa<Ë=j <\\\<-\<7Q=A;C..>\<\]\;4Ioc=;=.@\(!OP_O=-\\=lRy?=\\ȺF#=\Qt\<\阽M\\=\\	퀼[n<\ =2<0:=\Ԑ=]=tnZV)=\c\8\y`=Y\0Y<\W<\w=L<\H\,=\?6F=a\\<h=*d<x=\=d<JZ<\<G\:\<=$OV-=\{O\\Wa<M\,˽Gԙ<W`Y<.=I\Z<J<\\=ϼ\\\=ZNf\!&=?f;jP9r=7Qɽ{%e=\a;^\n\,=ؐ\p<:c\G;=g\WN\.rA<\"sMsO0\r=@`QUߪ\"@A\}\<E\<y)<em7qh=\}Il5=zQ{ꪭ=\Z\&==\\R<C^0\\9`i\\=y^9ݽ\\Dm\^M\Q<q0a=\j4D\0>\h=ڨf\\\!\"=\;剎<6<GOWp\Խ\y9M=\9===wxD=\b\\*=\0!=|\\0$b?=F@/\z<nŽ9\<gURuU\υ\4r\\>=OW<R\\:z\"=\0M=<\;<$\s=\\=FX\Z\Q=\\4\~g=p=\fO_KaE\r<\<v:^O\\\d;L\z\_<\;ﱼT\~\Ҽ#\BiLV\C;t@<LI\}?,= r_U=򿌼qhZ2\H<!<=ev\drO\B.!<7=\0\0;3\\r=\'+=\=:M\\ȽS=i=<|<Dkv.m.p=C׼v\ =%<e<ScĻ.=&QK=]6=$>9=l\\<\m;6_=ߞ\=3 =Å_=Q\=s\"\&\qӽ?\;	˼\S<\r<bs<+c\5&w=}fs<H|=,%$=ð=5\\\r=\Ze\i<',NULL),(3106,'b0fea813-cf69-455c-b7c8-3d0e42ad61f0',7,'is usually the case if the reservation is for a VIP guest. The above figure shows the details of the selected reservation whose arrival date is today. To check in guests, click the button ‘Check-In’ which is shown below. If the arrival date in the selected reservation matches with today’s date only then a check-in window is presented to the user. The figure below shows the window from where we can check in the guests. The figure above shows the terminal from where guests are checked into their rooms. As mentioned before if the room hasn’t been selected during the process of saving the reservation, then 0 appears as the selected room number and the system will ask the user to select a room first before entering any guest information. The system searches for available rooms based on the room type which was requested at the time of reservation and presents the options in the right hand corner of the screen. The figure above shows the interface from where a room is selected by just clicking the room number. (Note: Guest check-in is only possible after a room as has been assigned). When a room number is selected, a prompt is presented to make sure that the user intended to select that particular room. After pressing ‘Ok’, the selected room appears in Red as shown below. Now we are ready to enter guest information into the system so that the check in procedure can be completed and keys can be issued to the guest. The figure shown above is the terminal from where we enter all the guest information during the process of check-in. The entered information of the guest is saved by the system and it can be retrieved again in the future if the same guest decides to pay another visit. This type of guest tracking technology is found across all different PMS’s around the world and is one of the most helpful tool with which a hotel can understand more about its relationship with its guests. Let’s move in deeper into the details of the final stage of guest check in. Upon clicking the ‘Check-In’ button the above terminal is seen. The ‘Enter Guest Information’ box is already filled by the system since the guest information was already saved during the creation of the reservation. To save the information, just click ‘Add Guest’. The system only lets the user check in a specified number of guests, which was entered at the time of saving the reservation hence it keeps count of the number of guests entered. If the number of guests entered equals to the number of guests specified, a prompt is generated to let the user know that the guest assignment has been completed and that the FIT check in process is complete. 3.1.1.2 Group Check In. Group check in is quite similar to FIT check in with minor difference. Below is a screen shot of the group check in module which can be accessed by',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\j\=\<ȚibCI=)=L=T\=ݣy\\=Z\<T\<)6ɼ\E<\<=%ؼ|ӽI/=ME=\\<\dH<`	\@߼2<<1莽G=<6=)kMX\\=W=\S:=t=ޏ\H\AAǜ\ȺE$厽UY|\1;\=\r\0K\<\s֊=C<;V=r<\<\ƦU\=1e	usƼrмD\!\\nh\'\x<p\ag=~콫͞=\;#\\r\_o:\\DTP\.g+=0πp)!Q\'ʬ+\h;x\<\y=\\;P@\)&$=\U\yt4O=ę#=wR6=?a\=\\_\<\=\\=\:K.T=\<M6\\=\r\<$&:=JKV\r<\;\	>\;\a\!=yr=\=:Y<>4!=Kcw<=_Un\D\bq=ռ\	ʉ:\$kb	<\lv\<L-<s\r)t\;<N3\\\=u\R6r\\=Z<\>5\=\=8=h=Sļ_<&<=_%=o\j:T=:>Hǆ#%m\"\3F==x=\\R\'<\Z\|ņ7\\n<\\XV<	Wf\<\r=\\=\\\\j=`9c<bۃ\`\<\w+<eyƼq$\$=\\\ٗᄕ\"RX\"f7L=\̤\ғ<	\<Fw<\(\^ζ\\=k-NPq=]I\*<an<\b<yviMP\<W7-=\I\<\'2=%=?Aѥ=t\9\j\Nac^\]ma_*v\0=\=H~;\==-V=V;(\\Z=M\<\N#=z\uj̼\\U;9֎=b=t>\(8ػ\;=\W\=\!\y==\b\\=L,X<4\\ڌ<\ʓ\j=\=eC=e{;22\<\'ֻ/:Fm2<\=Z;_\0H|>G=V+dýM=\;w\˽\\8==Ϝ=Q$;?/%y.ʀS=Y\0/y<\Zz<=*PK^>6\\0{<\\\~5%b\\<\Z{\\f<O5\nFY9\EӼ﫼:VT\D⽬K\"A|/C\Z̼8\<\\E=\U%;\\ǻ<tP2\A<\\0<|v<4ߚ\=}b=tOy<#U\ZYB\e=tX_;4<T0=cT*ui=a|<BC<i`=V!=9;o\Z\A<\0=!\"\=O\Λ<\lڌn߼?d\<=\Ѽ=<S{VqG\8=\<\\ <b^>Tih=P\qA>\GE{\%;HV=h]',NULL),(3107,'b0fea813-cf69-455c-b7c8-3d0e42ad61f0',8,'know that the guest assignment has been completed and that the FIT check in process is complete. 3.1.1.2 Group Check In. Group check in is quite similar to FIT check in with minor difference. Below is a screen shot of the group check in module which can be accessed by clicking on ‘Group Reservations’ and selecting a group that is arriving today or simply by clicking the ‘Today’s Arrival’ button and clicking the ‘Check-In’ button. The first step in checking in a group is entering the individual guest information into the system and selecting a room for the guest to stay in. Group reservations are handled by the sales department of a hotel and therefore a list of rooms, their type and their rates are negotiated within a formal written contract between the travels agencies and the hotel. Each contract has a start date and a cut off date, total number of rooms, their respective types and their rates. The hotel sets aside specific rooms that fall under the categories requested in the contract known as ‘Blocks’ and only the rooms that belong to a certain block which are assigned to the guests during check in. Hence the system only allows the user to assign the rooms that fall under a particular block making it easy for the front office staff to handle the check in process. Upon selecting any room the box appears in red and at this point guest information is entered into the respective fields. If the guest is a group leader, ‘Assign as Group Leader’ should be checked and ‘Add Guest’ button should be clicked. Upon doing so a prompt is generated to make sure that the guest was intended to be appointed as group leader. After pressing ‘Ok’, the guest information is saved and the information of the next guest is to be entered after selecting a room. If more than one guest is to be entered into a room then the respective room number has to be selected from the drop down box presented below and entering the guest information, ‘Add Guest’ button has to be clicked. When total number of entered guests equals the total number of guests specified in the group, the system generates a prompt notifying the user that the guest check in process is complete and requests to check in the guests into their specific rooms. After the user clicks ‘Yes’ the check in process is complete. 3.1.2 Guest Check Out The figure above shows the status of different rooms and with that we see there are 4 rooms which are due to check- out. We can also see that of the 4 rooms 3 belong to a group and one belongs to FIT. There are numerous differences between the two types of check out procedures hence they are addressed as follows. 3.1.2.1 FIT Check Out The hotel personnel working at the front office should be well aware of the room that are due out therefore they stay prepared for',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n&=9=\hWi=\<ia<	=hյ== /=j$0NPB<\@*<ǿ\<:m\W@<o%<#<w!Q\Hzr\+<y<K0@\np\L\:%\0>Lm=\!k=\{/==$\FᩴHįߍa\=x\	=e\;\r;\<؃\\=\b=\\n=\fO=\nє<?=ĵ+PZ\<\5\<nE\kQ\\<d<\\\`\\\\;Y0 \<c;%H3<=\=\'=vZ\\\A<o\=`۽{N;ϼz\{)\ɻ`a%\0^\=L©\\\L<u\=Y}=B<=\nպ\Ǽⰲ=\ZB<9ى0=\\=!=\0\<=X=B)$l<#崃o\\0>!h<n<Ɋ\rc\<\>O;&\.=\=>==O=\R<R\A=h\3į;lS<\=	14&I)\0<OU=\Q#\\4n=\A<m=b|=\]=A>x<;\\<k\=I\;D<%&<8\ּlQ=\Z=\=r=-\an =k\'/+<^<G-s=s\ָ\;=[I%=\\'R+=\-0L\'X\Zw>;\7\=\\D(=\\<4\=]C	\<,\~\'	<5G`</A<ށ<QEf=\\<1O<UX\<&Q\\9\y8\=\r\ܖ5==8vI=Ar>#<n\<=\@`J\'LL<r<y&\s\\7=S\һע\Z}@v,Ҽ[=FO=h>\n\J<j<dS\0\Ǫ^\=\\ܼ?\\h\=\K\Z=)ǽ2\n:f=Bǝё,F\ =b\qx\<`\=YK;Fa=CNK_(G=\\C;a=FBR\H߼\/5=S\;vY\\ϽI=T\=@\;\>,n2x=Rݑ=\\\\xy\O0=<z=qq\z<RCo\NT<I^;KF=g4\(=Z̒=\.3i}x=\K=%ЂXfʀ<óEQ\=\h=>^\\0<\S\<\I<\ďy<\!\H\	\\5];lR<~j\9<\-<S\\\0<0X$^cT<tP\\zVyR/\A\ZF=J؆\i;r<UWL=K=5\<5	<\r\\<8=N*!\<y\0X<Kzq$T-<Y\\=.dM:uE=\<\Z\<\k=*&= \<\ <<<!&=9\cH\)=/\i=G\+=PӼC4\\⫻a]74\ҟUB+z].\<ft=m\\eN=H<\>b\ü.\oN=\',NULL),(3108,'b0fea813-cf69-455c-b7c8-3d0e42ad61f0',9,'one belongs to FIT. There are numerous differences between the two types of check out procedures hence they are addressed as follows. 3.1.2.1 FIT Check Out The hotel personnel working at the front office should be well aware of the room that are due out therefore they stay prepared for any guests who arrive at the desk to check out of the hotel. Upon confirming the room from the guest click on the particular room on the front office panel to access the detailed view of the reservation. Upon entering the detailed view click ‘Open’ in the financial information tab and click ‘Settlement’ to access the settlement window. Upon accessing the settlement window, the entire folio history will be available on the screen together with the charged rate, the total service charge and VAT shown in the figure below. On the right hand corner of the screen the reservation details can be seen such as the check in date and the check out date and most importantly the payment method highlighted in bold. If the payment method is cash then the ‘Cash’ should be selected in the ‘Payment Method’ box shown below. Since cash could be received in any currency that too should be documented by entering the right curreny in the next box together with the amount and press ‘Enter’. If the entered amount is less than the required amount then the system will generate a message prompting the user to enter more amount. If the amount entered is more than the required amount then the system will highlight the change that must be given back in NC. When all the monetary transactions are complete click the ‘Accept’ button. Upon clicking the button a prompt is generated to confirm the check out of the guest from the hotel. Upon clicking ‘Yes’ the FIT is checked out of the system. Then the house keeping department is notified about the departure by changing the room status to ‘Vacant – Dirty’. 3.1.2.2 Group Check Out The screen above shows 3 rooms that are checking out and that all the three rooms belong to the same group. The method to access the check out screen is the same as FIT (by clicking ‘Open’ and then ‘Settlement’) but the screen can only be accessed through the group leader’s room which is highlighted in white (room 402). Below is the screen shot of the settlement window for group check out. The rates that are charged is automatically picked by the system which was chosen at the time of reservation. On the top right hand corner we can see the list of extra charges that needs to be settled before the check out procedure can be taken forward. The extra charges if present, can be settled is a very easy manner. Since the charges are posted in individuals of the group, they are the ones responsible for paying their extra charges. Therefore each of the rooms need to be selected from the ‘Select Room’ box and',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n<>۩=\Z6ܽH׮\\<ƾ==|=\$=\>=\<Kİ=\(\\0=#W;n\\s7\66<u\=\\T`ݼkSٝ>=\\߮2<O=\\\)G\I=\\=x\<\\\$8	`\UD?A\0@H;g\\q=\)=\&;捘<x2=\r8\=@\<*5<\a#;\k=fܤ8=\nE=1\<NH\\V\O\r)$<dH\Zޫ<+<d\\\<S<\}!#k\mڽ>-;\ʼ\@<Q\\"\i**=\\<\J<\\н\<S=i)В\n=E5=M7F8ၽ\\\=DQ=*\\\Q\=\Zmm=\><\\=ֹ=!d;6\%=r\<*\\%s=Ӈ=؊=\h򡇽F=֠=D\3bG+= =3=\昼\=\\<m	`;aw&\<l=<\	m\ڼ\'ۂ\Qm\"\~q=T`\Q=C=.ʣ=ZVK;Y:)/|;9YpI=\4=׹<oK=\2<4\r\r=ۏ\<f$~=aw=&=Fj=h\\߼Oգ=\G\y<0<m\\< Ȁ<\2=+\ݼ\L@3*9<X\3=\\ıLPm=`2ռ[=\Ϋ=\50l\ȹk<J[v\<h!<\\=;\\	\6 [Ƚ߷d=NZ^C^=TRp=Is\=j=Z\v<w\<)\s<%q\\ؼɽn\^=\'\e\=SeJ0\=,\\"=\oku\n$=\\\n;̅=\\s\ٛ<6Lj%MQ=L^;̮V^=\H\<+\Ｏ6<\fkd:D:\<\n@<\U\Nc=\z<<\h$<1<J\P=`\=v\I\	=\\]Z?Vy=uȼѽ\O&=nC=X=ϣ:\"\<;\"k=[Ubv\w߻𼲊<\@/vA-<\b\"<e<R>~+=^\_t\)ռ\\\\<;j7=\n\e<B\;%f=/\<\\\\x۽K=\sK=\'<a=ｕ\b\\\}<~\\na\꼾Uј&ab\\b2C\K<U\<\|pNq;\o=$;=&۽x	uC=^3+\\;\\˽\'\?\<\\\<_=\$<\6\½\I\:\\s\nջbe\N$>9<V<F<\0\=b\:@6\<ۏ=\\<@\a=TS\=MS;ʽә`1P\<\\\0=ՉG[c{Zm֘̽K\\R#\X=\<ʻV&5\"\<\&==X=2ٻ\B=;',NULL),(3109,'b0fea813-cf69-455c-b7c8-3d0e42ad61f0',10,'taken forward. The extra charges if present, can be settled is a very easy manner. Since the charges are posted in individuals of the group, they are the ones responsible for paying their extra charges. Therefore each of the rooms need to be selected from the ‘Select Room’ box and their individual bills need to be settled. After entering the payment method and the amount press ‘Enter’ to save the information. If there is another room with an extra charge posted to it then it can also be selected from the ‘Select Room’ box following the same procedure of settlement explained above. When the required amount has been entered and also all the extra charges have been settled click ‘Settle Bill’. A prompt is generated to confirm the action. After clicking ‘Yes’ the bills are settled and now the check out procedure can be initiated. To go ahead with the check out procedure the billing instruction needs to be checked. If the billing instruction says ‘Bill to Travel Agent’ then ‘TA Voucher’ should be selected as the Payment Method. If ‘Payment at Check Out’ is the billing instruction then the amount, currency and mode (cash/credit card) needs to be entered. When the parameters entered are accepted by the system click ‘Check-Out Group’ button. Upon clicking ‘Yes’ at the prompt the group is successfully checked out of the system and out of the hotel. 3.2 Point of Sale Functions 3.2.1 Start a Table The figure above is a screen shot of the main screen of the POS. The numbers on each of the green buttons represent a table number and the color represents its present state. To start a table one must click on the respective table where the current state is vacant. Upon clicking any of the vacant tables a prompt is generated for the server/manager password. After entering the passwords the system asks for the total number of guests being served on that table. Upon entering the required information and pressing ‘Ok’, the ordering panel becomes available from where we can select the items that were ordered by the guest. After the ordering is complete the kitchen is to be notified hence the ‘Send’ button needs to be clicked for the order to be sent to the kitchen. Below is a screen shot of the ordering panel. When the ‘Send’ button is clicked, a printer placed in the kitchen prints the KOT’s together with all the information such as the table number, ordering server, order time and order details in that KOT. The table status also changes from vacant to occupied. 3.2.2 Add more items to an existing Table To add more items to an existing table just click on the respective table to open it. When the ordering screen is screen after entering the right server password, select the items being ordered just as before by clicking their names on the screen and when you’re done click ‘Send’ for the kitchen to be notified. 3.2.3 Settle a Table',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\\k<7\=\xz_<\0Q\\=\¼QQ=^(=\n|=) \Zz<\"rf =Ľ\2\.l=~JQ@l\\(t(#λ\$9;[H7<4\"+=\\=\Zd\<\o\\==\\\;\Gkkl\]<\'͌!\;\n\y\y=t[<\\\hp=ˊ0\}=\f=\8\$<Q\?=ӑI+;\=/Y:Q0꽼^L[<J,\0=E+\L=\5\:8\n=U<WPE1\<E>=<sȏ=9\=r\\Zp9\=t\\\<\,֫5	<`=t\\t\\;c\=\=);Ī=\n\9{lnDܖ=\0\:1F=o\<e@ټ^/D\=O\nNt\=\\;8=\$T>T Ld?=\Iz\=zK\<ؗc<=9q$F=s%=~\d*//=\"G=]\,=\˛	\o|\rlY=\C\n\d߼\\U=\\U\Z=\4OJٽ\5=\})\9R\r\C=C=3\;*˻p==N\=<\I<t\\<jX;=q<Q<x=ۯN\\=\\\<\d;q\W=<\r1\O.Ǽ\w\<(\7r/H=\x91Ȑ=\\=KPR<eԽd\~\\n\fý\\G3;0\^~\;\\eU:ONF\:qf\1\'A=E؅\)R=+>\h=\쨼Ȅz=^B+<M\n=yR5jb=ZZK@T:=;=)=:<c\ pT\\eW]\\@\=sWQ\<b=+Z^;Ө?`<0=\\\\!\=\=3<oF=\]\'=j\Z~=L׼\<;ǮZ==Eo4=\'輿;?\<C=/KH=y2<e@\\\Z=\'\r=\Y=Kýd=_~<\ZNc=\N\=!x=@ɼ\!\Oj=\\#;\zɽ#FлTJWEѕ\\E̼6g鼍\!\u<\?Cd	>a=Bͼ;;<mR\3P#=ڄ1:،=Y|;T\{\=\\C=B\y]}A=0\r6\\=\f=3˫C\ͼ]Ƽ)<\\=Br\;!\:\nj<-=[ⒽBϻ\Ծ=\(]*\I%\\C\0==\׽ \=[\E;\<<\ZM<㠽G\y]<\L5()3_!<P\	<\+K\}\<\nv<^e0\=Ud<]\`	Y3=K:]\\}OA&=\F<)>=n\<=[¢+\Kg5<zzѽiP\K%\ѻ\]=\1f=P3Q-\<\&<o==\"<Ml\;̫\0<\\',NULL),(3110,'b0fea813-cf69-455c-b7c8-3d0e42ad61f0',11,'on the respective table to open it. When the ordering screen is screen after entering the right server password, select the items being ordered just as before by clicking their names on the screen and when you’re done click ‘Send’ for the kitchen to be notified. 3.2.3 Settle a Table Open the table which needs to be settled and click ‘Settlement’. Below is the screen shot of the settlement window. A guest may desire to settle a bill in numerous ways such as cash, credit card or post it to the room. After selecting the appropriate payment mode, the amount is to be entered using the keyboard or the key pad provided in the panel. When the correct amount is entered the ‘Amount Tended’ button is to be clicked which will calculate the change that needs to be handed to the customer. To end the table click ‘Accept’. When the ‘Accept’ button is clicked the system makes sure that the entered amount has covered the amount due and only then closes the table and saves all the necessary data for accounting purposes or for any other future reference. 3.2.4 Split a bill Splitting a bill is one of the most important features in a POS that is used for a variety of functions making its application quite handy at times. A bill can be spliced for a minimum of 2 ways and a maximum of the number of items in the bill. For example an order that contains 5 items can only be split 5 ways. To split any order, open the table and click ‘Split’ after which the figure above can be seen. Then click on the individual item that needs to be spliced. When selected, the item appears on the left hand side of the screen. If ‘Split’ button is clicked at this point then the system will split the bill two ways with the selected ‘Red label 30’ appearing as Check 2. Below is a screen shot of splitting the bill in the manner mentioned above. When the bill has been spliced as per the need, ‘Done’ button needs to be clicked which closes the split window and takes us back to the ordering screen but now with an option of selecting which check/bill we want to view shown in figure below on the right. By selecting either Check 1 or Check 2 we can settle them individually as if they were separate tables. The un-splitting of the bill can also be performed at any time by clicking on the ‘Un-Split’ button presented above in the figure on the left. 3.2.5 Add modifications How the food is ordered by the guest might not always be the same even if the same entrée is ordered as different people prefer different way of enjoying their meals and as a hotel/restaurant guests have every right to demand things the way they prefer. Adding modifications as such means informing the kitchen regarding any special requests made by the guest so that',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\\x[=\"rtѼ\\Ľ/M<=p\;HMq=\\={\<!x^uj\"\<m=\\\)\u: =N\<\;$ߔ6=\\<U\n`<N\]:G8=\=\m)$\gSܻ۶߼9\0ۛ<s\/\K<(i\0=?\;&==4:u0=\r*<\´\=\?8f)=\\>:<\d*F\41]=\"\\:p,=Ђ\;]<\䎼:x-=\rN: >oqǽ鐼-QS<&\"<\?<\v4<a=\L;	e\n?h\wi=\?h*\=\n\=	\"=j=a89\;k\\=^=3=O=|<=\ʼ=\^@=wy!_f=\	ݍgX\<6=\-{ע&~=\~ȼ\;\\\=ahH<+Kx=kА;\=g,\<\'!Q*뮽5<`]M\=Pl<x?=7A7\t=]<=ZM@=\q;BK⑽\˻H=?\V=[$P\r>7I=\\=,$=])}<=s<q=X&\C9<\ټ3\<kq\"\U=ĭmʍ\':缇w<<tҽ\K=\[F73s=\6=p=\ra\\\0<\1X}嵽\l?<kvRo󦽲J\rߋ<\#=9\n84=#Rͼ#=\0J\˽ī===\ⒼA\nҼ\n=V	Ua=.\<.h\<!g\2=cl;H=\Z\,<\Z<HC<>7=Q\;љ\n>c\"yDm=1~b\ļ\g<=\\\$mF=8\=)\½i=K\"#@n0˻\/9=\=\nZ<>XK=5<~=*/;kn<\\P\sK\0\=ռu\dZ=\nE=	hUR=j=\v-\=yd<\l9h=:H;i|f;\Oȼ\e/<O;:>{<\\u\n?\=-=x\<\]LYe轉2=\\=\=Y;%<v	=mH6\\<0\n<t뽠=I	>ռ_>i<iX|_^ý\ƼnML=\<7QYtM=PK&\=8.Ű6\Hq<[޽Xl<5=TUT=ryQdjĪE㚽\\ټ\H\<Le\<Zgڼ\=[CjP9;\n=6\2=\\\=b^\\+<\\'\<NE\k;=\;ӭ߼4s\<,=&+P<5H><3@\3<Id=`u<\\\y<m/ϻ\=\Z\r=_=\5=h\g؜H\?L\\<\Z^\;\@^\\ؼq\<\e=\=z=\\\\s\=;\P=\\\w=<\;Zz<\<)\0+T\\',NULL),(3111,'b0fea813-cf69-455c-b7c8-3d0e42ad61f0',12,'even if the same entrée is ordered as different people prefer different way of enjoying their meals and as a hotel/restaurant guests have every right to demand things the way they prefer. Adding modifications as such means informing the kitchen regarding any special requests made by the guest so that there are no complications later when the food is delivered to the guest. To access the modification screen the ‘Modification’ button needs to be clicked and the modification can be entered only after the menu item has been selected. Below is a screen shot of the modification window. Any modification can be sent to the kitchen by typing in the requirements either by keyboard or from the screen itself. When the modification is typed, click ‘Done’. This will take us now to the ordering screen where the modification appears in the box presented below. Upon clicking the ‘Send’ button the new order will be sent to the kitchen with the specified instruction. 3.2.6 Void Items Items need to be voided at times for numerous reasons such as for a mistake that the server committed while ordering the wrong item or at other times the guest didn’t necessarily like the food hence he/she decides to change their mind and order some thing else. Therefore to address these issues and many more the system provides for a way to void items. However voiding items as such is not a very good practice as it might create problems with the tax officials during auditing if done frequently. Therefore it is encouraged that the users be alert and calm while entering the order and double check it before sending it over to the kitchen. To void any item select the item from the ordering screen and click ‘Void’. Voiding credentials are only provided to the manager hence a manager password is required to enter the voiding screen. When the correct manager password is entered, the screen below will be seen. Before voiding any item a reason has to be selected. This information will later show up in the managers report so that a close eye can be kept regarding the use of this option. When the reason is selected, ‘Void’ button needs to be clicked which voids the selected item and takes us back to the ordering screen with the revised order list. 3.2.7 Room Post Room Post pertains to posting the restaurant bill into the guest folio so that the guest can pay all the bills at the time of check out. A guest may also be entitled to a meal as per the meal plan purchased hence the server/managers need to be aware of how the bill is to be settled. To complete a Room Post click on ‘Settlement’ and in the settlement window click ‘Room Post’. Below is the screen shot of the room post window. Before posting anything to the room the server/manager should ask the guest his/her room number. The room number is to be cross referenced by entering',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\rL\<p\=Pe<;U=\\_\<E<\I^$\<h-=\4\<\\\\Wׅݫ<@kE\=!;\`Z\K୘<V֨;g\\<\ MlL(4\;=+O<><=}\<\\< c.Z^H-as+w\<8*.$Yȵ\}jWiwK_-\\Ry\ \cҼ=a\q<\\RMQ#k_=|{=\n3;,8:>(8]=~<1ݻq<\=6<\\.=\MWTPfS<9\RBZ\CR<_*\|p=7VK໭Ol<eN\yȠ\</]|=\C=\\\<F*p:[jn?K=]6<]\\}&5+p</=<g\L=o<+=ꉘ=\/(|=P\輑׻\k1\=<w\ݽ\\\\Z#\}=v\n<=P`=D/\=\x\Q\=!\n9sO\jd8=ޒ<\;>h -KH콻	YC5=f\A=\4\63=	bO<f=v\=Ur(=\<ż@!q9\\1</_<+s@=\ք\=l;\qV\r=\"z_ K<<\5>\"U</&B<s̶\'pH\Zj=\Ζ`K=<=\J:A<\\l<c=&\g=\W8=!\g8;	O\\<\:\0=$[=~m=¼\9zwn<n\<\?+<z\\Y=v\;X<\E=Ȕ6;h	\eǼ\\<@x\\'\\<\9;\Z;=\\\#\'\v˼/=k=8<M:\;ޑ;2Rj=cTm=@=*\3ϋR+\Lr<\(=gB&ǽy\\<f#\h\ф<\4<ࡽ@wD\=M7\<M\0v^b;4\=\{=t\'Z\\;CM=_\=\x;:oѽT\¡Gh\Z%`==\'B\<%=F[>H=S\<\J̻=S\= <\0ʼ\衽Ǵ<_T=!&Ċ<[\96%p(=Db=V>IWGfX:\;Q=-=M\;`!~*4տ=\\;\_~\\Z=j:\\\=!w`\=v\\\<\0k=\<\<\"x\\U-3\?=ҍ==\ =&.\\<\w=IW=_w<Q+\=J=L|[Ic>5\:i4FJdL=/={O;a\,F<3\I,ʼK1[<-\<\r4;v=F_<(\=UBRJt\I~<7<]\=\e=1\r_\	=s3>\,\g)\rs[<,<\zM>hGҽa\=DuZ%<SMFP^\Ⱥ.Pw\;\l{=5<៌a<?\=\)A<PC>\	=_<\\\=\䠼F8\"',NULL),(3112,'b0fea813-cf69-455c-b7c8-3d0e42ad61f0',13,'complete a Room Post click on ‘Settlement’ and in the settlement window click ‘Room Post’. Below is the screen shot of the room post window. Before posting anything to the room the server/manager should ask the guest his/her room number. The room number is to be cross referenced by entering it in the respective box and pressing the enter key in the keyboard. The figure above shows the information of the guest staying in the room 605 with their respective arrival and departure dates, meal plans and the total amount due. As mentioned before there are two ways to settle the bill. One is to post the bill as a charge so that the bill maybe settled during check out or it can be posted as a meal plan so that the guest is not charged. If ‘Post as Charge’ button is click then the bill will be charged to the guest folio but if the ‘Post as Meal Plan’ button is clicked then bill will be settled as a meal plan. However across different parts of the world including Nepal, alcoholic and other certain beverages are not covered under the meal plan. Hence in that case only the items applicable will be charged as meal plan and a separate bill is created for the other items which cannot be covered by the meal plan. But this new bill can be charged to the room as a charge. 3.3 House Keeping Fuctions The house keeping department of the hotel is constantly made aware of its rooms and its status by the house keeping module of the SDC which provides all the information in real time. During the busy season of a hotel the house keeping department is at its busiest therefore they clean the rooms from floor to floor and during slow seasons the rooms are cleaned as necessary. SDC also provides this similar functionality where the status of rooms can be changed individually or by the floor. Some of the basic functions of house keeping module is explained below. 3.3.1 Change Status Individually. To change the status of any room individually just click on the particular room from the screen shown above. For example we are selecting a room with room number 604 who’s current state is Vacant and Dirty. A room which is Vacant and Dirty can only be made Vacant or Out-of-Order, therefore these are the only two options available. To change the room to a vacant state, just select the option ‘Vacant’ and click on Change Status. 3.3.2 Change Status Floor Wise. To change the status floor wise click ‘Change Status’ button presented below. Upon click it, the above screen is seen. The house keeping provides a way to search the room according to their state and floor. The two screen shots below show where those options are available on the screen. By selecting a particular floor and a particular room state we can search for all the rooms that satisfies our criteria. In the figure',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n<\=r+Y^<\\ټ%=:\.<==y<+Խ\\<\==ELdʼ\$=\\0\<^v=q<Ӏ=%}\'>=jʺ\\`p=\N=P=ˇ9<\\0;\\R\=j^ƣ	̳;\Ǽ\r;\*\|<O=tb?z=k4=:\\;ұ:=\8%m\20=*]sv\09<SM,C\/%uM>\<K<ܞN=TLYcD~g<:<2\=~?<\\0H\<\\;\><\B=s\"\hJ^v];9~ws\'7=2\;j\@SU=d\=]\<p=2X=\%/T\b=\H= >=a=\\r%t;\9=a\n\=!p=_5=E2\\b\F4$=\[*<\{<Z?=]h>d\\P=\<\\^댽\b)y7#=	#)B\q\=ϾjMќ\<鹚=3<A\=+\u=%h~\B[=&<&s>(:H?{6\=\j=\\qh)=	=\9=c=^\Z7\\<?U<JI=ԕ<\\%\=\̻U\I5\<A\<\U\\<\䶽k\=\\\<,K߰<l=\:\<Zҽ7\'\ڽ\r%qFn\6=\|l\I\\\b<^q\\\<\W%=aO17\5~^idt=C\bǯ/=+;=\"a9=))5v=c\¼u;{<k=\jۼa2V.\a<6=\n<Zs<\7\;Ȣ;=:<tǼYݼ^<p\\\>7\0V\к|܌;7\Z=0\(6W=<6_\}^=\ZZ\ة<7\<>=Ђ=\n<W=7=C}#P<\_ai<rV=:c:=\\~4\:=V:װԽb<\\^\\<\\<\i\G=w\=\\)\\Ƽ	z=C&<ͬ콽z\K\Z;><	\:T\Om.G\d=l\g=y:=-F8z=;5=l<D\<=s==^y;Ko=<|ŝ=E\\<[O=A;$C,X4eQǼ;%M4\G=J	:;u<͞B\;TD9d7vPl:4\\|G<\"k</x\I<\\r\}\m2=sW<;Pb=9p˼\\rcǰ=\0=cdlbS\?Mr<u=@Xf:<\>8ҟ=AɇWt=rߐ\a3=XxGK<.J%}N=jU=\^Zy2|ڻ	E=c#1\k\SuAعS\\N+\Ի(\X=\\j=>w9(\q\=n\'h=ŉ<\\=;	(V*s',NULL),(3113,'b0fea813-cf69-455c-b7c8-3d0e42ad61f0',14,'a way to search the room according to their state and floor. The two screen shots below show where those options are available on the screen. By selecting a particular floor and a particular room state we can search for all the rooms that satisfies our criteria. In the figure below, we have selected all the rooms in the 6th floor that are currently Vacant and Dirty. The result of our search is seen on the box which is pointed by the arrow . We can individually select the desired rooms by checking them off or if we wish to select all of the rooms at once then ‘Select All’ has to be checked. Now the selected rooms can be either made vacant, out of order or occupied-dirty which is presented on the left top corner of the screen shot presented above. To change the status click ‘Change Status’. A prompt is generated asking if the user is sure of the operation. When clicked ‘Yes’ the status of the rooms get changed. 3.3.3 Maintenance. The maintenance function provided with SDC is not a separate module but just a functionality which enhances the capabilities of the house keeping department. When the house keeping department notices something not working in a room such as the mini bar or the television, they notify the maintenance department regarding the nature of the defect filling out a form which is presented in the above figure under ‘Send Response Request’. After receiving the task the maintenance department on the other hand mobilizes its crews to take the right course of action based upon the information that was passed from the house keeping. Upon completion of the task in hand the maintenance notifies the house keeping and only then the house keeping change the status of the room to its respective state. Below is a screen shot of the form from where the maintenance is notified. After filling out the appropriate fields shown above the task is sent to maintenance by clicking ‘Dispatch to Maintenance’. When maintenance sees the task and completes it as requested, they resolve the task by clicking ‘Set Resolved Time’ which marks the task as Resolved. Below is a screen shot of the Maintenance which can be accessed by clicking ‘View History’ in the figure above.',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \nn;\0ټ\\<\?r=/`=Ln;e[=ce9<t!<\4=\\\<>\y᥼\=\\\}sZ.#(7F=b\J<S\r8r=*/\\<\vT<\\RO<\'==M\w=\\=6~kxVq<\=\\\	@<\H:(YO@\\<\\٨=\=+t\\"<\r=\\=%Q\=v\V=6`=X=&H3$%gG=SN]4\2<\$:i=t]@<_6\\d=wfiXr=K{=\c=	\d=1J˼Ǉ;\6C=Sֽ\).эJ\ =ꊼ\\\<\Lf&\h=\0_Z<0=_2`\;AH6+6?\<sƃ<\<5;6<L\?\7=b<t\<<w\)M7ͽ\v<D=P\19\\\'<M\=);~ؼ\zü:=ܓ,V\\\'\' =\0!(<\=d	 Nz=K,;/\=Ꮌ\`;%0;ƥ=c\x<m\<*=\Aq =j<;Z=5i=7=.<\=:\ixy=X=+\=q+\<\A	\<QD\WV=\--S,=\#\<[=]=g2ͼY6pPV^<%i=ŧ0</\!z=i2g\pG=4cH=d\'=*2̝<h<庻Ov!H\՛<\\&=*!!\\\\\<wO<7\P\<\nS\Pu=>4\gt^(\\=\\<μ\\qRKo<1+6ij3/Sl_+==\#ev;\r\<~Gv7=77ϼ\N=\|<۲=v_F;J.=c\\=G)-y\)C\\\M\=\X<<nP2Nv\>=),F\=\\\p=ht޽\v<ⓗ\"=@<\\\=Tx<DIA!T\\-\\=:\nf=b~<9/YUq=)=^v\F=X:@ŏަ>PU<ӨJ=Pq=ך.RZ;>7<>\'\\\c<l\=Z<[\\<\Ļ;F=.8aM<1[=ǧ<^=y\\nBg<ʒ2\:\<zH<Tgf;Z\S<%н;\7_\\\\\0<\|+֔=\[=M\)	3S\<ftE\n\t7o\R$R\b\\=`\\%\Z=\=F\= T<k\<\\Z<\2Za=:{;l\uC\_\"5<3J=L?a\><=A=7BQe\\F\-=3\=\\&=Q=fO=\b~\5=_1=\ْa.=!?=\1\	Ǽ+<l;jt?\"U=ĕ\\@<	y`ܒ]-L=\q\;\=ǳ1=\<\c<\=\1\<',NULL),(3114,'4fb4ff17-d459-4223-a739-fed0bab0bd44',0,'Teaching Manual For SilverLine Dot Connector Version: S.10111 By SilverLine System Integrators Pvt. Ltd. Tables of Content. Introduction to SilverLine Dot Connector. Modules. Main Screen. Front Office. Point of Sale (POS). House Keeping. Maintenance. Functions. 3.1 Front Office Functions. 3.1.1 Check In 3.1.1.1 FIT Check In 3.1.1.2 Group Check In 3.1.2 Check Out 3.1.2.1 FIT Check Out 3.1.2.2 Group Check Out 3.1.3 Start Reservation 3.1.3.1 FIT Reservation 3.1.3.2 Group Reservation 3.2 Point of Sale Functions. 3.2.1 Start a Table 3.2.2 Add more item to an existing table 3.2.3 Settle a Table 3.2.4 Split a bill 3.2.5 Add Modifications 3.2.6 Void Items 3.2.8 Room Post 3.3 House Keeping Functions. Reports. Introduction to SilverLine Dot Connector. SilverLine Dot Connector (SDC) is a Property Management System (PMS) which is built for the purpose of managing different departmental operations of a hotel making it convenient to keep track of its day to day activities. With the arrival of computers into the scene, the old ways of maintaining logs of everything manually is long gone. In today’s competitive market its everyone’s aim to stay ahead of the game and one way of doing that is my having a system that helps you do just that. SDC is a system built towards addressing that need of a hotel where all the information needed to run a hotel efficiently is easily accessible with just a few clicks! More than that it integrates the functionality of all different departments of a hotel such as accounting, inventory, housekeeping etc reducing the time, energy and effort into managing all of them from one single point. SDC is one of the most efficient and easy to use PMS in the market. Build with the latest technology in software engineering, SDC provides a very efficient and user friendly operations making it very convenient for hotel staff to meet with the requirements of its daily operation. Some of its key features are as follows: SDC is a state of the art system that is capable of handling reservations for a hotel of any size. It is intelligent enough to interconnect different departments of a hotel, keeping them all informed about their duties and tasks in hand. The front office module gives an over view of the different states of different rooms (such as vacant-dirty or out-of-order), and these states are denoted by different color indexes helping the staff know everything they want with just a click. The reservation module is a full proof and fully tested part of the software that handles different information about the incoming guests such as their likes, and dislikes, room preferences and meal-plan, flight information. The guest history tracking system in the software makes reservations for repeated guests very simple and effective. The house keeping module also provides a visual over view for different rooms to be cleaned. The system provides a mechanism to clear the status of different rooms floor by floor or room by room as the situation demands. A maintenance module constantly keeps the maintenance',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n> :\4=y\;%\\<GK\<=ɖ;<2=trj=<jz=\<8)|=^\?<bBW<;\\=\;\-实= \rd=\\"<\Zf\<)\\uy=~6H:\r<.6=*z=.\\U=q\=\\>\0\h\(FP2&=\<̏XRb=\\<pe=Ůљ=\<J=z=\&\E\\;\c\?fo\<9Ҽ\i4\=WQB=ȋ12DGt-~=$=Ix=\\0<s=#ŽǓ\ >3^μF\r;\\9	i=\B=<oQ;\Z\MO=\j=[\L&;\MEg\Z\T9=:A<L=Fi=?\]a)f\\o\)B\:NF<:\#Tj\\	m\h5h\Q\S.t	=L).<=qS=3\0<C\;\+\<L=i	GZ\Tb9YGN=RL\<=\ϋ=;\"K=!tdL~\㬻y\;C\Ρ=|s=W6\:u\ѼS\2\Q=[ɼ~p=#L<xn=n=\/={<u=2=l\"ۼ0\\`=\x\r=0\?#\0Ϣ	US\Y.\]ӻ>#=)d\$=A =\=@ȉ\0A=DI\D<;;\<\\	{$$RkKؼ/_\Ol\1(3<J0x<KNL=$uG\=R\rd+ku;)*\<\'N<]:a&Gҍ<7=\\=RVO\<\r\\\;ː<\\N5UW=\뽱\"\n\}<t⡼C?7\_>\Z\<2_8=\\n=Av\>/8VVX<\p<[n\=\(=	\6/\\;=,>;O\r<\>a\"\L\0\<\=!;mx=2_\<q\7<_\"+ۋ6\z\oQ\ {@=)<+Tә%\;V^t=\=g~\;{=\=O%P=ʣ2qKy=\1>e=\j\n/^><C1 W\Ż\\k=\żpYH=\z=ȩ`rvr6\\\0=v=\=\=7	Q4=\\p3&H<SCN<\"H켃8\~\Z=\F~^=\`ӼȄ\G\"=\q\<䟯=\<\n\L<\I=\?9\=\L`=\_K\=\QƖו\ri$<<W\E\Z>=\J.Ҽ=HE\r<ߺ8=~]7=\\8\#)Y=\;b=\q\<s\=l.J;\\;f=p\吽\'\=\*=\<Ǎ==\=팻\0v=\aB<]=+\==\"h>ŁEn\:*>\Z;7\=θ5=xD%vz?C8(\0\:<\=`;<,4=&+t=',NULL),(3115,'4fb4ff17-d459-4223-a739-fed0bab0bd44',1,'very simple and effective. The house keeping module also provides a visual over view for different rooms to be cleaned. The system provides a mechanism to clear the status of different rooms floor by floor or room by room as the situation demands. A maintenance module constantly keeps the maintenance department at its toes with its constant reminder of the things that need to be addressed. Housekeeping department notifies the maintenance department instantly about any breakages or failures noticed during a cleaning procedure there by reducing the reaction time. A state of the art POS system is also a part of this software that takes care of all the restaurant management needs. The POS provides a visual overview of the entire restaurant with its exact floor plan and table numbering to help the manager and the servers know the status of different tables. Different color codes are used to signify different status of tables, such as Vacant or Occupied, which helps to know which tables are available for the guests walking in. The POS is best utilized with a touch screen monitor as the ordering process will be faster. Each menu item is listed under its own course list, helping servers or managers to know where to look for any particular menu item as needed. After the ordering is complete the order is sent with a push of a button. Upon doing so, all the bar items get printed in the bar and the kitchen items get printed in the kitchen reducing the need of having to send someone to the kitchen or the bar to inform the respective stations. Once the order is sent, it cannot be voided unless approved by the manager. Any alterations or special requests from the guests regarding any items ordered are entered into the system at the time of ordering which is printed at the respective terminals along with the items ordered so that the respective terminals are informed about such modifications. A bill splitting feature allows the bill to be split as requested by the customer which can be printed accordingly. A bill printing system is also a part of the software that prints the bills as necessary. Room posting for different guests according to their meal plan is also incorporated into the system. Reporting includes daily arrival, departure and stay-over reports. The end of the day report is also available with the exact cash count of both the local and foreign currencies. Any further reporting options preferred can also be incorporated upon request. These are just some of the general features of the PMS. Let us now go deeper into its individual module operations. Modules Just like any other PMS in the market, SDC covers all the basic modules required to run a successful hotel business. 70% of the revenue generated by a hotel comes from the guests that come to stay in the hotel, therefore a system as such requires every attention to details as far as guests are concerned. SDC',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\\ZE<\$Gv+Q \1\=eU;\U=np\n+8==%-=	툼J?[7W=\"\<\_*5);HI¼\9\vC=<\d< \t<t\Ľ5}e<׺j\=<U<\\T<1s=\n}L(j$w##\\\'x\<\\=֫eGG(xFA\\F\H=\"N=}M=T=L=\͊ZʌK=$]\P<+%\r=1<<9\0=eS\\:C\<Λ=\"nGu\<N\\\\2<ks^;\>\n\3<.G<l3`d\ZQGҘ\k=wH_;v9=*`\><\0}<\=Z	<Z\<\\!=Ti<\Ɏ<\\\!<\\<Z.=鐜n\<=?\\d\r*ls\< <\Z=/;rB=\IĻJ8;bpH=KG===\}9	5LC\lhG\\<q/;\=<N59\{\g>\v=R\Z=	\=\z<`O=	\Z\nD=\=\\n\r;\\(<;<vO<>\<wA<\>|=9<o=R\oj;2\=-=Ud<\\нnJ\n\'ӂ!mk9\fdTm\rd=\\<0sq{=Т7=\<Yuj\Z_\\<dzJͼ׏=getA=-<.;yg<z8<k2[=\noD\<w;1=g\|=Us\0=fz;\#\VG}\s#ڼ\\=2j\:%5\0\\<-GC</l=Go\'U=I \<<̼9=K\\n\\0=i\0l\Cg\ԶϽEW<D,\Z\\<5ɽtL=fqs<|!=\y\T[ýQ=\\}[\=/JJ1<\\\A-L=](ú\:^5D+\c⾻?f:<\\}=:=gW=\'==Ⓖ-><R$\I=)D\ؽ\*;By{\G\YT	<+k,=\'Aru(<\8\\m8=@\5ʙ:=\U\=	Ui?=Ē޼+ =$~\޼\#\<0!$=\G9(.\ZH;~$;LD,\=¼=Q==ǁ1=g\ȟ=\\&<kFVU\aC2=\lFL<Ppܽ|3F<5=W=5=;=\:\܍=g\Z|=Փ=_\W@=:E;+ﺦ<=)2=fDzt<:\'=Y\<=1s\=߭<\\<sqx<uP=\\"<t/P{5=\\\<\\}{۽&L\r=d,=a\\<\e`S\S=_T\K\w=,#\>K\>\<\\'<\\'=\\\"~',NULL),(3116,'4fb4ff17-d459-4223-a739-fed0bab0bd44',2,'market, SDC covers all the basic modules required to run a successful hotel business. 70% of the revenue generated by a hotel comes from the guests that come to stay in the hotel, therefore a system as such requires every attention to details as far as guests are concerned. SDC provides a state of the art front office reservation system that allows to know everything about a guest including any preferences in regards to dinning, lodging or any special requests that guests might have. Main Screen (fig 2.1) Apart from that house keeping also plays an important part in serving the guests as per their need. Restaurants are another place where the guests need to be served in a very professional manner. All of these operations are carried out by SDC which help the hotel staff to address the needed of the guest in a very professional and timely manner. Lets look at the operations of each of these modules. The above is a screen shot of SDC main screen. This is the main entry point of the system. On a first glace it gives all the statistics of the hotel that is relevant to the day. Values such as occupancy percentage and rooms to sell are very closely watched throughout the day as that determines the total revenue generated at the end of the day and also gives an idea of how many more guests can a hotel accommodate if new guests arrive as walk ins. Clicking in one of these parameters will give use more details pertaining to the parameters, such as if we double click “Total VIP’s” then a list of all the VIP’s with their room numbers will be seen on the screen. Shown below are 5 buttons which are the entry point to each of the mentioned modules. They are as follows: Front Office: By clicking in the above button in the SDC main screen, the front office of a hotel is seen. Front office module covers all the reservations together with the status of all the different rooms of a hotel. Settlement and viewing guest folio is also done from this module. Point of sale (POS): By clicking in the above button in the SDC, the POS can be accessed. POS is a module that serves as a restaurant management system for the hotels. Each restaurant of a hotel has its own terminal or POS from where it is accessed and used. House Keeping : By clicking on the above button, the House Keeping module can be accessed. House keeping module provides the house keeping department with the status of different rooms where by they know which rooms have to be cleaned or cleared. Accounting : By clicking on the above button, accounting module is viewed. Inventory Management : By clicking on the above button, Inventory Management module is accessed. Apart from accessing many different modules, SDC main screen also gives an over view of different time zones of different parts of the world,',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\<\\ἰ\rq<#80u=Wy=Ẻ7ʔ=\\\;IS.S<]<WDp(b=fQŽ=r7|oN=\I\B\ Ѻyo<\\\*<+\;{±< &{B=/˖=\Z!>3\<\'-=qλ\`ؽz`<}<Zi<Լ?\AλzaJKݡ=Ȕ\ޟ=Z=bs=0=o\=	\b̓\<fd=!s\<v<\[<\Z<야ns\:5\<W.<fs\pļ<\ZJ֐8\=20z\<:!=\'jMI\<>\{mdb=yx\\r<|=㶙<)E0=\\=\Ž\'&\y=ώ<\\_=T=q=\\Z\g\a>DI=S\Ż9X5a\˽	a=);\ļȖ\{]=l\\=\0ܼs<Õ\Z\\<\Zc(ҏ:H{H=̾\	f\ýļ&oM\y<\\<\C\n/5=jA<0먼&l\<E\<U\s=ޣ<\<\m=g\\0=\,\\<\\\<@\=: <\`P=ڃ<(\<K=j<<>p=!<<v\Z=g=^\\<yt=Ħ\ƻ;\Sv\\\<gJE=\۽	=Z\\X\<aH\=\	\Z\0\\=(gpf[;씽<`Q׽@\\G\<q~}\\n\jK#[<8i:\$xԻR=(k\\ro< <\<H\0<v\\\f\"%:\=]	#=|ݓ< \H`}b=ʉ\'_D\<\\\<.1=:7#<\\\`	&<3\Zik\=_\n\'쫅\\\<f?\ܺ樽\D\=U;ZCڂ=\"\;\=\˼\'𼆶\'\==Y[=\\ΏeU|\q:d==\Z=\\<L<nT=\=x\lFcVB=\n;>*>1Br\<\xX#6(7i~\m<Ê\w|<\=m=&\*=Ҩ<f\=\+\\v;\=\`3O{=}\,q 0wWJ\<\Jҽ\\Z\Ɗ;\L=\p\#\?ezμ \H\ޖtE<\Ha\"<\nOͽ<l\\Z=\Κ\⇳RnF\A0<\<8X0\\'g<X!=\J<\\Z=~*r=\j<\^]A;#Eǻ\W>x|B<\<B:IZ#=P5\6\<cl25%=L7;ǟ;\=+=\9=$>\=32<y><ݼD=\z/=ڐ<*+\<\Z=\D~<\n<\LB<7[k=\<<T\\׃=n)\=\=8Z!\k=\\<\6\=\"/o\\<',NULL),(3117,'4fb4ff17-d459-4223-a739-fed0bab0bd44',3,'Accounting : By clicking on the above button, accounting module is viewed. Inventory Management : By clicking on the above button, Inventory Management module is accessed. Apart from accessing many different modules, SDC main screen also gives an over view of different time zones of different parts of the world, and also a small calendar which is helpful in many different areas. Now let us go deeper into each of the modules of SDC. 2.2 Front Office. 2.2.1 Overview : The screen shot seen above is from the front office screen. Individual rectangles denote individual rooms of a hotel with their current status being represented by the color of these rectangles. For example, rooms 701 and 702 are out of order therefore they appear in a grey color, and the legend present in the right hand corner represents exactly just that. On the upper right hand corner there are 5 buttons. They are: 2.2.2 Refresh Button: Refreshes the display screen and updates the current house status. 2.2.3 Find Button: Upon entering guest room number in the highlighted textbox the user can press the Find button or press ‘Enter’ to view the room details. 2.2.4 Rates Button: Pressing the Rates Button will display the different rates offered in the hotel . Rates such as CP, MAP, BB can be seen with their individual breakdown of their room rates and meal plan rates. 2.2.5 View Report Button: Clicking on the View Report button, different reports can be seen. Details of different reports are covered in further sections. 2.2.6 Drop Down Menu Functions: Fig 2.2 Buttons Fig 2.3 Room State Fig 2.4 Room Type There are three Drop Down menus present in the front office screens which are highlighted above. The first one gives you the list of different room types present in the hotel such as Single, Double, Suite etc. The second one contains different room states as such Vacant, Out-of-order, Occupied etc. Selecting (Fig 2.5) different combinations of room states and room types and pressing the Find button or enter, the user can view the desired room having the selected states and types. For example in figure 2.2 and 2.3 user wishes to view all the single rooms in a hotel that are vacant. (Fig 2.5) Given below is a screen shot of the result where different room number and their corresponding states are seen. Fig (2.6) 2.2.7 View Room Button: In the above figure if one clicked room number 605 which is highlighted with the blue shade (indicating that the room is occupied), one would also be able to view the details of the room. The Figure is given below. 2.2.8 Reservation. Overview Fig (2.7) The figure above is from the Registration screen of the SDC. There are two types of reservations namely FIT Reservation and Group Reservation, which can be viewed by selecting the respective buttons shown below in figures 2.8 and 2.9. (FIT Reservation button or Group Reservation button). The result of the desired query can be seen',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \nF<-~vMY=tt=\\=\C<hV9=Z&O=x^li2=\`\\n;j͇\$<s 4<\\8<	{»rbb¼\e\a<aY\ZM=\<췽 \Z\<=i+=Cr=\A=F!n\\[\=l|ru\"\<иZF;\0<~+l׼u\0<\={=\P<B\=^7<,	><f\Ѽ\\;]E\;\0*\<\\l\<<jL+=`ۼ\v=v\';˸-\\\\N<}0<<\\\<7AbFq<\\@WJ=x*!v=<^i<\E<ߜ\Z<\ջF(= \':+\̼k<P#:|Bae==M\`n1=,=\\<=Q_c<Σ\=|\<A1\0\\r+0r=/%\Ģ:@;,\<\rG=Z\.\=\q`dN:g\K+u\H=Q\	u&Ė#CҪ<\">\&<\.\Ӹ;\_=o\<_e<~=\#K !\2Jָ\=bﺻ&i(YY=\ּ\=u^&>\_=~\=6\<s;v;=\C=jc=M<b{5=O	;H\	<\\<\(FmkQ\Nm=\\nU=X\<QX=\Nq=Pj\\(ܧ\]꼖Q<іŽ^<q\55Q;-=c7=M\Aj=V^\\r=S\⼳\"=\nA\&Sn/[=:\\\;>1fϼeX\q\;	\"\\ZЩ&=f\\0pp=NZ\弳Opa\\Z\r8.=*=\\Z=\q\\Sيؽ\[Nk\9S\<l<س<\<vݟ<<]\^<*PSu==*<lܽr\'<wdZ\`={7.\"O\|&\=\G[=\\\;<tE\7*q\0\=8[=P.-<\r=Itj^h=\`=\>0&ͽr<.5U\:Y=\<N+<ZŻች\\7 Eļ!\ս\\=\\\:\\d\=ȩ<ܯ\<c;\h=\}X:w=~ZP\Z=Ͳ\r޼ԝ\\1HW\Xz\uC.[o8ҍ;Tsj\&7z:?\\\\8j<;	-\=g=̼󲁳\Tk@\:\}*=fvBc=\\\=OW\\=	-缧\"=.\=*<qrI\Z=7=oW;GDZƼc=c}Tc=1@o<MMK>=[F\=ʉ=\O=(G¼}Y=؆5<bTjt\=PY@=\ަ=I0Ca⎱u=-<Òu\]CBU<!}\.\\%Ǽ[\=\Ql\̼\nw\;\\<\Z\<\\<\<5k=ե{Y<',NULL),(3118,'4fb4ff17-d459-4223-a739-fed0bab0bd44',4,'the Registration screen of the SDC. There are two types of reservations namely FIT Reservation and Group Reservation, which can be viewed by selecting the respective buttons shown below in figures 2.8 and 2.9. (FIT Reservation button or Group Reservation button). The result of the desired query can be seen in the box presented above. Fig (2.8) Fig (2.9) Fig (2.10) By clicking on the In House Guest button (Figure 2.10), the list of in house guests can be viewed. Fig (2.11) One can also perform any search that is based towards the guest’s first name, last name or the reservation ID that is provided at the time of reservation. Any such queries can be typed in the box located right below the reservation buttons shown in Figure 2.12. Fig (2.12) On the upper right hand corner of the Reservation/Registration window, there is a cluster of different buttons that provide access to different functionality to the user. Let us view each of these in detail. 2.2.9 REFRESH Button: The REFRESH button refreshes the view of either FIT reservation list or the Group reservation list or the in house guest list, depending upon which button is clicked, i.e. FIT Reservation Button or the Group Reservation Button or In House Guest Button (Refer to Figure 2.8, 2.9, 2.10). 2.2.10 START Button: By clicking the START Button, one can start making a reservation for either an FIT or a group. The details of how to create a reservation is described in later chapters. 2.2.11 CANCEL Button: By clicking the CANCEL Button, one can cancel a reservation. 2.2.12 GROUP CONTRACTS Button: The GROUP CONTRACTS button gives us access to information pertaining to different group reservation contracts a hotel may have with companies and travel agencies. Without any such contracts, a hotel may not choose to do any business with other companies. A contract includes important figures such as number and types of room, rates and dates at which the contract ends. The details are described in later chapters of how to create a group contract. 2.2.13 UPGRADE Button: The UPGRADE button takes us to the window where a reservation can be upgraded to other options provided by the hotel. 2.2.17 ADD ROOMS Button: The ADD ROOMS button adds more rooms to a reservation. 2.2.15 DEPOSITE Button: During the time of check in, guests may be asked for some deposits which can be entered in a window that is accessed by clicking in on the DEPOSITE button. The details are coming later in the chapters. 2.2.16 TODAY’S ARRIVAL Button: By clicking on the TODAY’S ARRIVAL button, one can view all the reservations that are arriving on the date it is clicked. 2.2.17 CHECK-IN Button: The CHECK-IN button takes us to the window where a guest that has a reservation and who is arriving today can be checked in. There are other information that is gathered from the guest at the time of check in which needs to be entered into the software. The guest check',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \noBv)+\W=\=G\= =[\H!̭K=ͯNu\<I$m\\<@!;7=\ok{?<\Lt<\}=Ͱ<R\X!MO\tYeJ=:=,=:@>u5=L̽\5Vv	GC]VFlè<\\"\;D\Z==5%=t^;\k\;=/\r>ur@\Ȼ:Q=Tm<\"=\JkN~\2.=c\o=lA.*Q==ZN\F+t\\\\=.	<w\=\\0<\}&\(\<n=w\\d;2%=Mc<-\'<\`6^\\\\\lt=MJ\$Ƽ=\\<\\?\pO=Ib=e\\n=-ϼJV\=!\,=}/Ey\\1\=\1/u:8\r\ݽ=<\rּc =&o,h4=i`	=\}r<\YE	Y\`5gkY;\n6\G\z\n9WZ\;\bȼ=l^\A=t+<\\n5y=\g%\ջ;\\k\=pyD=K=[&=(\<h=O<=/H=\\<\\E=lp{<\ͼ2rἴL;\\b\g=M\<}a=d\m\ܼ\x1=x\=\l\\<:%\'J==ZG<\o;\s\<H2=MZ[]\ȟ\b\n*=}\4>1=vspH?<P%t\f\";fk\'\\<H\Ͻ3\\=|(Ys<#\q=Q\nT`\mt44<K\\M=\<a1c\1=H9KlM\r=t$\\"T\<\\=L\B=KH1ꉷ\9=\y۹\\\<\0o=<7\0c<p\켷\n\\\P=4;N!H<>ae=ɝ;>{=W4\=k\Q<\\</=*si=\-=@\Z\ֵ;<M\dNJ=H=(ּ\oGo<x̽ ĺ=<\Ar\w\n;K\\z=F=\p|ЃA=\V<ùu\L8?d<ċ\oYi=\L=t?\D=\a<¼\\<\=1;mUAu<ٝ\\Լ\|\<\8X\\:=&\0=\o(<㺣D?=\8\'=K̼8<\\=\=%F!=Ӫ;u\>\<_\\\<\cg(;{n/\mvY*p;\JR\V=鲪_\\\=ěJ\=\Ź<v=Ac:Oj\j=\\=K;D;ʼ\\\ܼ\\\<,;&/\Z=\{<\r><m=\ ==7=>\\]\0\\=`\\\=p\;<\\l=aHy=NX=E7=s&\<~K	aP|׽\\}<\\S	=q۹\=f!<HgĻ@=\֟w<',NULL),(3119,'4fb4ff17-d459-4223-a739-fed0bab0bd44',5,'CHECK-IN button takes us to the window where a guest that has a reservation and who is arriving today can be checked in. There are other information that is gathered from the guest at the time of check in which needs to be entered into the software. The guest check in process is described in detail in later chapters. 2.2.18 VIEW DETAILS Button: The VIEW DETAILS button shows details such as guest details pertaining to either FIT reservation or Group reservation. When the in house guest list is viewed by clicking the In House Guest button (Figure 2.10), the details of each guest can be viewed by clicking the respective guest and after that then VIEW DETAILS Button. 2.2.19 EDIT Button: The EDIT button takes us to the window from where reservation details are edited. This feature, together with many other features is password protected so that only the person with the authorized privilege can make such changes. 2.2.20 ARRIVAL/DEPARTURE Button: The ARRIVAL/DEPARTURE button leads us to a command centre from where we are view the arrival and departure records. These records can be viewed according to their dates. Below is an example of such logs. 2.3 Point of Sale The point of sale (POS) of the SDC is concerned with the day to day activities of a particular restaurant and billing. The POS handles operations like ordering, notifying the kitchen, settling a table or posting the charge to the room of the in guest. Below is a screen shot of the POS main. The main screen of the POS represents the exact floor plan of the restaurant with its table numbers and other details regarding the location of its exits and bars. When trying to access the POS from the main screen of SDC, a prompt is generated asking which restaurant is to be entered. Upon selecting the desired restaurant its corresponding floor plan is fetched and shown on the screen. The main screen provides some valuable information such as which tables are occupied or vacant or which tables are departing making it easier for servers and managers alike to be better prepared for their service. The POS and all of its functions are described in detail in the further sections on POS Functions. 2.4 House Keeping. The house keeping module in the SDC is designed so that the house keeping department of a hotel is fully notified at all times, the different statuses a room may have during any particular time of day so that everyone working in and around is kept notified. Below is a screen shot of the house keeping module. Shown above is a listing of different rooms and their respective status. Just looking at the above screen the house keeping department is made aware of how many rooms are checking out, how many rooms are occupied and dirty and so on so that as soon as the rooms become available they are cleaned and made ready for future guests. Rooms of different categories can',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\0\<p\<!@&<}|=\\==O\z\<\_=\\u<P\;\\<\n\"\μ\Ƚ\\\r=HO=rM=|hm==䢼]p\\Z;\h:\W=\\ö==G\&S`ꋼ\0h\;R><ws\<Fa\<\=\>\'v{\\sn\=\f\<g|=SVM=\*wS֩=<\'qtnkJB=EK;\?+:=%Km\,ݼ\5=!\\T\\t=0W>\nc,\H\<\,}=\-~ͫ7\\n=\晽q\]<n<\\<<\<j\<\\c\\\;=<\\\μ\~޼n\<;8<-.1aL==*>=N̳<B=\|7=K	\	>O<\<5\ͼF}{@*=bA=U\\<\N<\f=\u=\s=O`-=F;Ҽ\`q쳽?)t==	\U*\\rRmSx@p_=2<V2\\nü:p;\\<=\۽/=삽\\<ZV=ݺ\n\\=r˶;ќ<ސ(=\\U\;R\=\0Ү;\Y=\*=1	=\ȅ<\'\e;ͼ\B\\\\<b<4V\>\\_<6Ѫ\\69l̉YE}4\PT\\\"\=跕<h\<ˡ!=\=mwL͏<6\]I\>yȫ<@>\0u\"=\_݈<\\pU/Hk\?{kVQ\=;#l,<($+<1<w\8\w\</=\;{#=Fg=Ǖ[= /A\u<<9&}\'z`<\nἯ|@gh2	<\\\E[=\.<\"م=\a\\\=z\;d\n\ʽ?\߱<ɼ\ګ\\r\8\\ʽMw_ \<oxȐV=U?=ѻO=d_<X=\(<5\<=\"=\L={ͼB\_<tcŒ=]L=ۦ=\U=n%{5=j6f=\\\n=\.7.\=L\<:=nÇˇ=h\gP\\;+\=\\_=k<%)\\=[\\\y=\:=ާ1znC(=\===\p=\	)\<ۈ;\{=#\\=Z\m\s:V\.;)\<\^h\xj\TR$<虛%\|;2%Lz)<\½T;S=\\<aQ=L\zƙ:l;\<\r,<;w<?=(\\̽\&=a֢=\'5Z\\\ީj2\<*2ݻ\r^=\cK<2\y<Z\5=\n9h2@= S=\=_LJ=\=\<F=$=\\\;\f=\	=\\=n<k\f\\\=as	<6\ܻ5)^༫P,ygP=7C(==x鷽\'e>A$):`<\س=$(',NULL),(3120,'4fb4ff17-d459-4223-a739-fed0bab0bd44',6,'the above screen the house keeping department is made aware of how many rooms are checking out, how many rooms are occupied and dirty and so on so that as soon as the rooms become available they are cleaned and made ready for future guests. Rooms of different categories can be searched by clicking on the respective buttons and clicking the ‘Find’ button. The complete function of house keeping is explained in the House keeping function section. Functions The numerous functions available in SDC enable one to better understand how a hotel operates on a day to day basis. From tracking guest folio, to viewing extra charges occurred during the guest’s stay, SDC provides the simplest of interfaces to carry out all the operations of a hotel in a very convenient and efficient manner. SDC also supports the flexibility of posting the charges from a restaurant to the guest’s room. Hence the operation capabilities of SDC expand into integrating different departmental functions of a hotel so that various tasks can be accomplished quicker. Let us look deeper into these different functionalities. 3.1 Front Office Funtions. 3.1.1 Guest Check In. Front Office is a place where the guests interact with the hotel formally for the first time, therefore it is very important for anyone working in the front office to be prepared with all the necessary details one might need during check in. On clicking the ‘Today’s Arrival’ button shown in the figure below, the user is able to view all the reservation details of all the guests or groups arriving today depending upon the selected reservation view. (FIT or Group) The procedure of checking in guests belonging to FIT or Group reservation is slightly different with one another. Let us go deeper into each of the following. 3.1.1.1 FIT Check In. As mentioned above, the list of reservations that are arriving today can be viewed by selecting the FIT reservation and clicking the Today’s Arrival button on the top. The reservation system searches for all the reservations that are arriving today and gives the result as shown below. The figure above shows two reservations that are currently scheduled to arrive today. By clicking on the individual listings we can view the details on the right side of the screen. We can see that for reservation 19, the assigned room number is shown as 0 and for reservation 20 the room number is shown as 602. This means that for the reservations having their room number as 0, individual room(s) will be selected at the time of check in and for the reservation with a room number other than 0, 602 in this case, a separate room is kept reserved. This is usually the case if the reservation is for a VIP guest. The above figure shows the details of the selected reservation whose arrival date is today. To check in guests, click the button ‘Check-In’ which is shown below. If the arrival date in the selected reservation matches with today’s',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n5\W<\v,@N\<\=߾\'=\"=j3\\<|<yY <U\\;*+4ƹ\r=]\	z=ܔh=s`tcp:<z:e&<Լ	&\0L(Ͻkj=@\=~=,6G<G3W\%<\'\<m<e\|\,F<wLe=c\ \\"|\;I=ʝ=sZW=\%k=\^<=\-=L܋Y\fZ\B;=4=\<Yd.:]>F=\"\=\\Zd )=|`i<\ʷf\\<3ح^my31=s\<Qc=K\γ=\'\0@;R\<c7:ûŨ=R\'=\\n\=W\\z$ɜa<Ë=j <\\\<-\<7Q=A;C..>\<\]\;4Ioc=;=.@\(!OP_O=-\\=lRy?=\\ȺF#=\Qt\<\阽M\\=\\	퀼[n<\ =2<0:=\Ԑ=]=tnZV)=\c\8\y`=Y\0Y<\W<\w=L<\H\,=\?6F=a\\<h=*d<x=\=d<JZ<\<G\:\<=$OV-=\{O\\Wa<M\,˽Gԙ<W`Y<.=I\Z<J<\\=ϼ\\\=ZNf\!&=?f;jP9r=7Qɽ{%e=\a;^\n\,=ؐ\p<:c\G;=g\WN\.rA<\"sMsO0\r=@`QUߪ\"@A\}\<E\<y)<em7qh=\}Il5=zQ{ꪭ=\Z\&==\\R<C^0\\9`i\\=y^9ݽ\\Dm\^M\Q<q0a=\j4D\0>\h=ڨf\\\!\"=\;剎<6<GOWp\Խ\y9M=\9===wxD=\b\\*=\0!=|\\0$b?=F@/\z<nŽ9\<gURuU\υ\4r\\>=OW<R\\:z\"=\0M=<\;<$\s=\\=FX\Z\Q=\\4\~g=p=\fO_KaE\r<\<v:^O\\\d;L\z\_<\;ﱼT\~\Ҽ#\BiLV\C;t@<LI\}?,= r_U=򿌼qhZ2\H<!<=ev\drO\B.!<7=\0\0;3\\r=\'+=\=:M\\ȽS=i=<|<Dkv.m.p=C׼v\ =%<e<ScĻ.=&QK=]6=$>9=l\\<\m;6_=ߞ\=3 =Å_=Q\=s\"\&\qӽ?\;	˼\S<\r<bs<+c\5&w=}fs<H|=,%$=ð=5\\\r=\Ze\i<',NULL),(3121,'4fb4ff17-d459-4223-a739-fed0bab0bd44',7,'is usually the case if the reservation is for a VIP guest. The above figure shows the details of the selected reservation whose arrival date is today. To check in guests, click the button ‘Check-In’ which is shown below. If the arrival date in the selected reservation matches with today’s date only then a check-in window is presented to the user. The figure below shows the window from where we can check in the guests. The figure above shows the terminal from where guests are checked into their rooms. As mentioned before if the room hasn’t been selected during the process of saving the reservation, then 0 appears as the selected room number and the system will ask the user to select a room first before entering any guest information. The system searches for available rooms based on the room type which was requested at the time of reservation and presents the options in the right hand corner of the screen. The figure above shows the interface from where a room is selected by just clicking the room number. (Note: Guest check-in is only possible after a room as has been assigned). When a room number is selected, a prompt is presented to make sure that the user intended to select that particular room. After pressing ‘Ok’, the selected room appears in Red as shown below. Now we are ready to enter guest information into the system so that the check in procedure can be completed and keys can be issued to the guest. The figure shown above is the terminal from where we enter all the guest information during the process of check-in. The entered information of the guest is saved by the system and it can be retrieved again in the future if the same guest decides to pay another visit. This type of guest tracking technology is found across all different PMS’s around the world and is one of the most helpful tool with which a hotel can understand more about its relationship with its guests. Let’s move in deeper into the details of the final stage of guest check in. Upon clicking the ‘Check-In’ button the above terminal is seen. The ‘Enter Guest Information’ box is already filled by the system since the guest information was already saved during the creation of the reservation. To save the information, just click ‘Add Guest’. The system only lets the user check in a specified number of guests, which was entered at the time of saving the reservation hence it keeps count of the number of guests entered. If the number of guests entered equals to the number of guests specified, a prompt is generated to let the user know that the guest assignment has been completed and that the FIT check in process is complete. 3.1.1.2 Group Check In. Group check in is quite similar to FIT check in with minor difference. Below is a screen shot of the group check in module which can be accessed by',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\j\=\<ȚibCI=)=L=T\=ݣy\\=Z\<T\<)6ɼ\E<\<=%ؼ|ӽI/=ME=\\<\dH<`	\@߼2<<1莽G=<6=)kMX\\=W=\S:=t=ޏ\H\AAǜ\ȺE$厽UY|\1;\=\r\0K\<\s֊=C<;V=r<\<\ƦU\=1e	usƼrмD\!\\nh\'\x<p\ag=~콫͞=\;#\\r\_o:\\DTP\.g+=0πp)!Q\'ʬ+\h;x\<\y=\\;P@\)&$=\U\yt4O=ę#=wR6=?a\=\\_\<\=\\=\:K.T=\<M6\\=\r\<$&:=JKV\r<\;\	>\;\a\!=yr=\=:Y<>4!=Kcw<=_Un\D\bq=ռ\	ʉ:\$kb	<\lv\<L-<s\r)t\;<N3\\\=u\R6r\\=Z<\>5\=\=8=h=Sļ_<&<=_%=o\j:T=:>Hǆ#%m\"\3F==x=\\R\'<\Z\|ņ7\\n<\\XV<	Wf\<\r=\\=\\\\j=`9c<bۃ\`\<\w+<eyƼq$\$=\\\ٗᄕ\"RX\"f7L=\̤\ғ<	\<Fw<\(\^ζ\\=k-NPq=]I\*<an<\b<yviMP\<W7-=\I\<\'2=%=?Aѥ=t\9\j\Nac^\]ma_*v\0=\=H~;\==-V=V;(\\Z=M\<\N#=z\uj̼\\U;9֎=b=t>\(8ػ\;=\W\=\!\y==\b\\=L,X<4\\ڌ<\ʓ\j=\=eC=e{;22\<\'ֻ/:Fm2<\=Z;_\0H|>G=V+dýM=\;w\˽\\8==Ϝ=Q$;?/%y.ʀS=Y\0/y<\Zz<=*PK^>6\\0{<\\\~5%b\\<\Z{\\f<O5\nFY9\EӼ﫼:VT\D⽬K\"A|/C\Z̼8\<\\E=\U%;\\ǻ<tP2\A<\\0<|v<4ߚ\=}b=tOy<#U\ZYB\e=tX_;4<T0=cT*ui=a|<BC<i`=V!=9;o\Z\A<\0=!\"\=O\Λ<\lڌn߼?d\<=\Ѽ=<S{VqG\8=\<\\ <b^>Tih=P\qA>\GE{\%;HV=h]',NULL),(3122,'4fb4ff17-d459-4223-a739-fed0bab0bd44',8,'know that the guest assignment has been completed and that the FIT check in process is complete. 3.1.1.2 Group Check In. Group check in is quite similar to FIT check in with minor difference. Below is a screen shot of the group check in module which can be accessed by clicking on ‘Group Reservations’ and selecting a group that is arriving today or simply by clicking the ‘Today’s Arrival’ button and clicking the ‘Check-In’ button. The first step in checking in a group is entering the individual guest information into the system and selecting a room for the guest to stay in. Group reservations are handled by the sales department of a hotel and therefore a list of rooms, their type and their rates are negotiated within a formal written contract between the travels agencies and the hotel. Each contract has a start date and a cut off date, total number of rooms, their respective types and their rates. The hotel sets aside specific rooms that fall under the categories requested in the contract known as ‘Blocks’ and only the rooms that belong to a certain block which are assigned to the guests during check in. Hence the system only allows the user to assign the rooms that fall under a particular block making it easy for the front office staff to handle the check in process. Upon selecting any room the box appears in red and at this point guest information is entered into the respective fields. If the guest is a group leader, ‘Assign as Group Leader’ should be checked and ‘Add Guest’ button should be clicked. Upon doing so a prompt is generated to make sure that the guest was intended to be appointed as group leader. After pressing ‘Ok’, the guest information is saved and the information of the next guest is to be entered after selecting a room. If more than one guest is to be entered into a room then the respective room number has to be selected from the drop down box presented below and entering the guest information, ‘Add Guest’ button has to be clicked. When total number of entered guests equals the total number of guests specified in the group, the system generates a prompt notifying the user that the guest check in process is complete and requests to check in the guests into their specific rooms. After the user clicks ‘Yes’ the check in process is complete. 3.1.2 Guest Check Out The figure above shows the status of different rooms and with that we see there are 4 rooms which are due to check- out. We can also see that of the 4 rooms 3 belong to a group and one belongs to FIT. There are numerous differences between the two types of check out procedures hence they are addressed as follows. 3.1.2.1 FIT Check Out The hotel personnel working at the front office should be well aware of the room that are due out therefore they stay prepared for',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n&=9=\hWi=\<ia<	=hյ== /=j$0NPB<\@*<ǿ\<:m\W@<o%<#<w!Q\Hzr\+<y<K0@\np\L\:%\0>Lm=\!k=\{/==$\FᩴHįߍa\=x\	=e\;\r;\<؃\\=\b=\\n=\fO=\nє<?=ĵ+PZ\<\5\<nE\kQ\\<d<\\\`\\\\;Y0 \<c;%H3<=\=\'=vZ\\\A<o\=`۽{N;ϼz\{)\ɻ`a%\0^\=L©\\\L<u\=Y}=B<=\nպ\Ǽⰲ=\ZB<9ى0=\\=!=\0\<=X=B)$l<#崃o\\0>!h<n<Ɋ\rc\<\>O;&\.=\=>==O=\R<R\A=h\3į;lS<\=	14&I)\0<OU=\Q#\\4n=\A<m=b|=\]=A>x<;\\<k\=I\;D<%&<8\ּlQ=\Z=\=r=-\an =k\'/+<^<G-s=s\ָ\;=[I%=\\'R+=\-0L\'X\Zw>;\7\=\\D(=\\<4\=]C	\<,\~\'	<5G`</A<ށ<QEf=\\<1O<UX\<&Q\\9\y8\=\r\ܖ5==8vI=Ar>#<n\<=\@`J\'LL<r<y&\s\\7=S\һע\Z}@v,Ҽ[=FO=h>\n\J<j<dS\0\Ǫ^\=\\ܼ?\\h\=\K\Z=)ǽ2\n:f=Bǝё,F\ =b\qx\<`\=YK;Fa=CNK_(G=\\C;a=FBR\H߼\/5=S\;vY\\ϽI=T\=@\;\>,n2x=Rݑ=\\\\xy\O0=<z=qq\z<RCo\NT<I^;KF=g4\(=Z̒=\.3i}x=\K=%ЂXfʀ<óEQ\=\h=>^\\0<\S\<\I<\ďy<\!\H\	\\5];lR<~j\9<\-<S\\\0<0X$^cT<tP\\zVyR/\A\ZF=J؆\i;r<UWL=K=5\<5	<\r\\<8=N*!\<y\0X<Kzq$T-<Y\\=.dM:uE=\<\Z\<\k=*&= \<\ <<<!&=9\cH\)=/\i=G\+=PӼC4\\⫻a]74\ҟUB+z].\<ft=m\\eN=H<\>b\ü.\oN=\',NULL),(3123,'4fb4ff17-d459-4223-a739-fed0bab0bd44',9,'one belongs to FIT. There are numerous differences between the two types of check out procedures hence they are addressed as follows. 3.1.2.1 FIT Check Out The hotel personnel working at the front office should be well aware of the room that are due out therefore they stay prepared for any guests who arrive at the desk to check out of the hotel. Upon confirming the room from the guest click on the particular room on the front office panel to access the detailed view of the reservation. Upon entering the detailed view click ‘Open’ in the financial information tab and click ‘Settlement’ to access the settlement window. Upon accessing the settlement window, the entire folio history will be available on the screen together with the charged rate, the total service charge and VAT shown in the figure below. On the right hand corner of the screen the reservation details can be seen such as the check in date and the check out date and most importantly the payment method highlighted in bold. If the payment method is cash then the ‘Cash’ should be selected in the ‘Payment Method’ box shown below. Since cash could be received in any currency that too should be documented by entering the right curreny in the next box together with the amount and press ‘Enter’. If the entered amount is less than the required amount then the system will generate a message prompting the user to enter more amount. If the amount entered is more than the required amount then the system will highlight the change that must be given back in NC. When all the monetary transactions are complete click the ‘Accept’ button. Upon clicking the button a prompt is generated to confirm the check out of the guest from the hotel. Upon clicking ‘Yes’ the FIT is checked out of the system. Then the house keeping department is notified about the departure by changing the room status to ‘Vacant – Dirty’. 3.1.2.2 Group Check Out The screen above shows 3 rooms that are checking out and that all the three rooms belong to the same group. The method to access the check out screen is the same as FIT (by clicking ‘Open’ and then ‘Settlement’) but the screen can only be accessed through the group leader’s room which is highlighted in white (room 402). Below is the screen shot of the settlement window for group check out. The rates that are charged is automatically picked by the system which was chosen at the time of reservation. On the top right hand corner we can see the list of extra charges that needs to be settled before the check out procedure can be taken forward. The extra charges if present, can be settled is a very easy manner. Since the charges are posted in individuals of the group, they are the ones responsible for paying their extra charges. Therefore each of the rooms need to be selected from the ‘Select Room’ box and',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n<>۩=\Z6ܽH׮\\<ƾ==|=\$=\>=\<Kİ=\(\\0=#W;n\\s7\66<u\=\\T`ݼkSٝ>=\\߮2<O=\\\)G\I=\\=x\<\\\$8	`\UD?A\0@H;g\\q=\)=\&;捘<x2=\r8\=@\<*5<\a#;\k=fܤ8=\nE=1\<NH\\V\O\r)$<dH\Zޫ<+<d\\\<S<\}!#k\mڽ>-;\ʼ\@<Q\\"\i**=\\<\J<\\н\<S=i)В\n=E5=M7F8ၽ\\\=DQ=*\\\Q\=\Zmm=\><\\=ֹ=!d;6\%=r\<*\\%s=Ӈ=؊=\h򡇽F=֠=D\3bG+= =3=\昼\=\\<m	`;aw&\<l=<\	m\ڼ\'ۂ\Qm\"\~q=T`\Q=C=.ʣ=ZVK;Y:)/|;9YpI=\4=׹<oK=\2<4\r\r=ۏ\<f$~=aw=&=Fj=h\\߼Oգ=\G\y<0<m\\< Ȁ<\2=+\ݼ\L@3*9<X\3=\\ıLPm=`2ռ[=\Ϋ=\50l\ȹk<J[v\<h!<\\=;\\	\6 [Ƚ߷d=NZ^C^=TRp=Is\=j=Z\v<w\<)\s<%q\\ؼɽn\^=\'\e\=SeJ0\=,\\"=\oku\n$=\\\n;̅=\\s\ٛ<6Lj%MQ=L^;̮V^=\H\<+\Ｏ6<\fkd:D:\<\n@<\U\Nc=\z<<\h$<1<J\P=`\=v\I\	=\\]Z?Vy=uȼѽ\O&=nC=X=ϣ:\"\<;\"k=[Ubv\w߻𼲊<\@/vA-<\b\"<e<R>~+=^\_t\)ռ\\\\<;j7=\n\e<B\;%f=/\<\\\\x۽K=\sK=\'<a=ｕ\b\\\}<~\\na\꼾Uј&ab\\b2C\K<U\<\|pNq;\o=$;=&۽x	uC=^3+\\;\\˽\'\?\<\\\<_=\$<\6\½\I\:\\s\nջbe\N$>9<V<F<\0\=b\:@6\<ۏ=\\<@\a=TS\=MS;ʽә`1P\<\\\0=ՉG[c{Zm֘̽K\\R#\X=\<ʻV&5\"\<\&==X=2ٻ\B=;',NULL),(3124,'4fb4ff17-d459-4223-a739-fed0bab0bd44',10,'taken forward. The extra charges if present, can be settled is a very easy manner. Since the charges are posted in individuals of the group, they are the ones responsible for paying their extra charges. Therefore each of the rooms need to be selected from the ‘Select Room’ box and their individual bills need to be settled. After entering the payment method and the amount press ‘Enter’ to save the information. If there is another room with an extra charge posted to it then it can also be selected from the ‘Select Room’ box following the same procedure of settlement explained above. When the required amount has been entered and also all the extra charges have been settled click ‘Settle Bill’. A prompt is generated to confirm the action. After clicking ‘Yes’ the bills are settled and now the check out procedure can be initiated. To go ahead with the check out procedure the billing instruction needs to be checked. If the billing instruction says ‘Bill to Travel Agent’ then ‘TA Voucher’ should be selected as the Payment Method. If ‘Payment at Check Out’ is the billing instruction then the amount, currency and mode (cash/credit card) needs to be entered. When the parameters entered are accepted by the system click ‘Check-Out Group’ button. Upon clicking ‘Yes’ at the prompt the group is successfully checked out of the system and out of the hotel. 3.2 Point of Sale Functions 3.2.1 Start a Table The figure above is a screen shot of the main screen of the POS. The numbers on each of the green buttons represent a table number and the color represents its present state. To start a table one must click on the respective table where the current state is vacant. Upon clicking any of the vacant tables a prompt is generated for the server/manager password. After entering the passwords the system asks for the total number of guests being served on that table. Upon entering the required information and pressing ‘Ok’, the ordering panel becomes available from where we can select the items that were ordered by the guest. After the ordering is complete the kitchen is to be notified hence the ‘Send’ button needs to be clicked for the order to be sent to the kitchen. Below is a screen shot of the ordering panel. When the ‘Send’ button is clicked, a printer placed in the kitchen prints the KOT’s together with all the information such as the table number, ordering server, order time and order details in that KOT. The table status also changes from vacant to occupied. 3.2.2 Add more items to an existing Table To add more items to an existing table just click on the respective table to open it. When the ordering screen is screen after entering the right server password, select the items being ordered just as before by clicking their names on the screen and when you’re done click ‘Send’ for the kitchen to be notified. 3.2.3 Settle a Table',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\\k<7\=\xz_<\0Q\\=\¼QQ=^(=\n|=) \Zz<\"rf =Ľ\2\.l=~JQ@l\\(t(#λ\$9;[H7<4\"+=\\=\Zd\<\o\\==\\\;\Gkkl\]<\'͌!\;\n\y\y=t[<\\\hp=ˊ0\}=\f=\8\$<Q\?=ӑI+;\=/Y:Q0꽼^L[<J,\0=E+\L=\5\:8\n=U<WPE1\<E>=<sȏ=9\=r\\Zp9\=t\\\<\,֫5	<`=t\\t\\;c\=\=);Ī=\n\9{lnDܖ=\0\:1F=o\<e@ټ^/D\=O\nNt\=\\;8=\$T>T Ld?=\Iz\=zK\<ؗc<=9q$F=s%=~\d*//=\"G=]\,=\˛	\o|\rlY=\C\n\d߼\\U=\\U\Z=\4OJٽ\5=\})\9R\r\C=C=3\;*˻p==N\=<\I<t\\<jX;=q<Q<x=ۯN\\=\\\<\d;q\W=<\r1\O.Ǽ\w\<(\7r/H=\x91Ȑ=\\=KPR<eԽd\~\\n\fý\\G3;0\^~\;\\eU:ONF\:qf\1\'A=E؅\)R=+>\h=\쨼Ȅz=^B+<M\n=yR5jb=ZZK@T:=;=)=:<c\ pT\\eW]\\@\=sWQ\<b=+Z^;Ө?`<0=\\\\!\=\=3<oF=\]\'=j\Z~=L׼\<;ǮZ==Eo4=\'輿;?\<C=/KH=y2<e@\\\Z=\'\r=\Y=Kýd=_~<\ZNc=\N\=!x=@ɼ\!\Oj=\\#;\zɽ#FлTJWEѕ\\E̼6g鼍\!\u<\?Cd	>a=Bͼ;;<mR\3P#=ڄ1:،=Y|;T\{\=\\C=B\y]}A=0\r6\\=\f=3˫C\ͼ]Ƽ)<\\=Br\;!\:\nj<-=[ⒽBϻ\Ծ=\(]*\I%\\C\0==\׽ \=[\E;\<<\ZM<㠽G\y]<\L5()3_!<P\	<\+K\}\<\nv<^e0\=Ud<]\`	Y3=K:]\\}OA&=\F<)>=n\<=[¢+\Kg5<zzѽiP\K%\ѻ\]=\1f=P3Q-\<\&<o==\"<Ml\;̫\0<\\',NULL),(3125,'4fb4ff17-d459-4223-a739-fed0bab0bd44',11,'on the respective table to open it. When the ordering screen is screen after entering the right server password, select the items being ordered just as before by clicking their names on the screen and when you’re done click ‘Send’ for the kitchen to be notified. 3.2.3 Settle a Table Open the table which needs to be settled and click ‘Settlement’. Below is the screen shot of the settlement window. A guest may desire to settle a bill in numerous ways such as cash, credit card or post it to the room. After selecting the appropriate payment mode, the amount is to be entered using the keyboard or the key pad provided in the panel. When the correct amount is entered the ‘Amount Tended’ button is to be clicked which will calculate the change that needs to be handed to the customer. To end the table click ‘Accept’. When the ‘Accept’ button is clicked the system makes sure that the entered amount has covered the amount due and only then closes the table and saves all the necessary data for accounting purposes or for any other future reference. 3.2.4 Split a bill Splitting a bill is one of the most important features in a POS that is used for a variety of functions making its application quite handy at times. A bill can be spliced for a minimum of 2 ways and a maximum of the number of items in the bill. For example an order that contains 5 items can only be split 5 ways. To split any order, open the table and click ‘Split’ after which the figure above can be seen. Then click on the individual item that needs to be spliced. When selected, the item appears on the left hand side of the screen. If ‘Split’ button is clicked at this point then the system will split the bill two ways with the selected ‘Red label 30’ appearing as Check 2. Below is a screen shot of splitting the bill in the manner mentioned above. When the bill has been spliced as per the need, ‘Done’ button needs to be clicked which closes the split window and takes us back to the ordering screen but now with an option of selecting which check/bill we want to view shown in figure below on the right. By selecting either Check 1 or Check 2 we can settle them individually as if they were separate tables. The un-splitting of the bill can also be performed at any time by clicking on the ‘Un-Split’ button presented above in the figure on the left. 3.2.5 Add modifications How the food is ordered by the guest might not always be the same even if the same entrée is ordered as different people prefer different way of enjoying their meals and as a hotel/restaurant guests have every right to demand things the way they prefer. Adding modifications as such means informing the kitchen regarding any special requests made by the guest so that',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\\x[=\"rtѼ\\Ľ/M<=p\;HMq=\\={\<!x^uj\"\<m=\\\)\u: =N\<\;$ߔ6=\\<U\n`<N\]:G8=\=\m)$\gSܻ۶߼9\0ۛ<s\/\K<(i\0=?\;&==4:u0=\r*<\´\=\?8f)=\\>:<\d*F\41]=\"\\:p,=Ђ\;]<\䎼:x-=\rN: >oqǽ鐼-QS<&\"<\?<\v4<a=\L;	e\n?h\wi=\?h*\=\n\=	\"=j=a89\;k\\=^=3=O=|<=\ʼ=\^@=wy!_f=\	ݍgX\<6=\-{ע&~=\~ȼ\;\\\=ahH<+Kx=kА;\=g,\<\'!Q*뮽5<`]M\=Pl<x?=7A7\t=]<=ZM@=\q;BK⑽\˻H=?\V=[$P\r>7I=\\=,$=])}<=s<q=X&\C9<\ټ3\<kq\"\U=ĭmʍ\':缇w<<tҽ\K=\[F73s=\6=p=\ra\\\0<\1X}嵽\l?<kvRo󦽲J\rߋ<\#=9\n84=#Rͼ#=\0J\˽ī===\ⒼA\nҼ\n=V	Ua=.\<.h\<!g\2=cl;H=\Z\,<\Z<HC<>7=Q\;љ\n>c\"yDm=1~b\ļ\g<=\\\$mF=8\=)\½i=K\"#@n0˻\/9=\=\nZ<>XK=5<~=*/;kn<\\P\sK\0\=ռu\dZ=\nE=	hUR=j=\v-\=yd<\l9h=:H;i|f;\Oȼ\e/<O;:>{<\\u\n?\=-=x\<\]LYe轉2=\\=\=Y;%<v	=mH6\\<0\n<t뽠=I	>ռ_>i<iX|_^ý\ƼnML=\<7QYtM=PK&\=8.Ű6\Hq<[޽Xl<5=TUT=ryQdjĪE㚽\\ټ\H\<Le\<Zgڼ\=[CjP9;\n=6\2=\\\=b^\\+<\\'\<NE\k;=\;ӭ߼4s\<,=&+P<5H><3@\3<Id=`u<\\\y<m/ϻ\=\Z\r=_=\5=h\g؜H\?L\\<\Z^\;\@^\\ؼq\<\e=\=z=\\\\s\=;\P=\\\w=<\;Zz<\<)\0+T\\',NULL),(3126,'4fb4ff17-d459-4223-a739-fed0bab0bd44',12,'even if the same entrée is ordered as different people prefer different way of enjoying their meals and as a hotel/restaurant guests have every right to demand things the way they prefer. Adding modifications as such means informing the kitchen regarding any special requests made by the guest so that there are no complications later when the food is delivered to the guest. To access the modification screen the ‘Modification’ button needs to be clicked and the modification can be entered only after the menu item has been selected. Below is a screen shot of the modification window. Any modification can be sent to the kitchen by typing in the requirements either by keyboard or from the screen itself. When the modification is typed, click ‘Done’. This will take us now to the ordering screen where the modification appears in the box presented below. Upon clicking the ‘Send’ button the new order will be sent to the kitchen with the specified instruction. 3.2.6 Void Items Items need to be voided at times for numerous reasons such as for a mistake that the server committed while ordering the wrong item or at other times the guest didn’t necessarily like the food hence he/she decides to change their mind and order some thing else. Therefore to address these issues and many more the system provides for a way to void items. However voiding items as such is not a very good practice as it might create problems with the tax officials during auditing if done frequently. Therefore it is encouraged that the users be alert and calm while entering the order and double check it before sending it over to the kitchen. To void any item select the item from the ordering screen and click ‘Void’. Voiding credentials are only provided to the manager hence a manager password is required to enter the voiding screen. When the correct manager password is entered, the screen below will be seen. Before voiding any item a reason has to be selected. This information will later show up in the managers report so that a close eye can be kept regarding the use of this option. When the reason is selected, ‘Void’ button needs to be clicked which voids the selected item and takes us back to the ordering screen with the revised order list. 3.2.7 Room Post Room Post pertains to posting the restaurant bill into the guest folio so that the guest can pay all the bills at the time of check out. A guest may also be entitled to a meal as per the meal plan purchased hence the server/managers need to be aware of how the bill is to be settled. To complete a Room Post click on ‘Settlement’ and in the settlement window click ‘Room Post’. Below is the screen shot of the room post window. Before posting anything to the room the server/manager should ask the guest his/her room number. The room number is to be cross referenced by entering',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\rL\<p\=Pe<;U=\\_\<E<\I^$\<h-=\4\<\\\\Wׅݫ<@kE\=!;\`Z\K୘<V֨;g\\<\ MlL(4\;=+O<><=}\<\\< c.Z^H-as+w\<8*.$Yȵ\}jWiwK_-\\Ry\ \cҼ=a\q<\\RMQ#k_=|{=\n3;,8:>(8]=~<1ݻq<\=6<\\.=\MWTPfS<9\RBZ\CR<_*\|p=7VK໭Ol<eN\yȠ\</]|=\C=\\\<F*p:[jn?K=]6<]\\}&5+p</=<g\L=o<+=ꉘ=\/(|=P\輑׻\k1\=<w\ݽ\\\\Z#\}=v\n<=P`=D/\=\x\Q\=!\n9sO\jd8=ޒ<\;>h -KH콻	YC5=f\A=\4\63=	bO<f=v\=Ur(=\<ż@!q9\\1</_<+s@=\ք\=l;\qV\r=\"z_ K<<\5>\"U</&B<s̶\'pH\Zj=\Ζ`K=<=\J:A<\\l<c=&\g=\W8=!\g8;	O\\<\:\0=$[=~m=¼\9zwn<n\<\?+<z\\Y=v\;X<\E=Ȕ6;h	\eǼ\\<@x\\'\\<\9;\Z;=\\\#\'\v˼/=k=8<M:\;ޑ;2Rj=cTm=@=*\3ϋR+\Lr<\(=gB&ǽy\\<f#\h\ф<\4<ࡽ@wD\=M7\<M\0v^b;4\=\{=t\'Z\\;CM=_\=\x;:oѽT\¡Gh\Z%`==\'B\<%=F[>H=S\<\J̻=S\= <\0ʼ\衽Ǵ<_T=!&Ċ<[\96%p(=Db=V>IWGfX:\;Q=-=M\;`!~*4տ=\\;\_~\\Z=j:\\\=!w`\=v\\\<\0k=\<\<\"x\\U-3\?=ҍ==\ =&.\\<\w=IW=_w<Q+\=J=L|[Ic>5\:i4FJdL=/={O;a\,F<3\I,ʼK1[<-\<\r4;v=F_<(\=UBRJt\I~<7<]\=\e=1\r_\	=s3>\,\g)\rs[<,<\zM>hGҽa\=DuZ%<SMFP^\Ⱥ.Pw\;\l{=5<៌a<?\=\)A<PC>\	=_<\\\=\䠼F8\"',NULL),(3127,'4fb4ff17-d459-4223-a739-fed0bab0bd44',13,'complete a Room Post click on ‘Settlement’ and in the settlement window click ‘Room Post’. Below is the screen shot of the room post window. Before posting anything to the room the server/manager should ask the guest his/her room number. The room number is to be cross referenced by entering it in the respective box and pressing the enter key in the keyboard. The figure above shows the information of the guest staying in the room 605 with their respective arrival and departure dates, meal plans and the total amount due. As mentioned before there are two ways to settle the bill. One is to post the bill as a charge so that the bill maybe settled during check out or it can be posted as a meal plan so that the guest is not charged. If ‘Post as Charge’ button is click then the bill will be charged to the guest folio but if the ‘Post as Meal Plan’ button is clicked then bill will be settled as a meal plan. However across different parts of the world including Nepal, alcoholic and other certain beverages are not covered under the meal plan. Hence in that case only the items applicable will be charged as meal plan and a separate bill is created for the other items which cannot be covered by the meal plan. But this new bill can be charged to the room as a charge. 3.3 House Keeping Fuctions The house keeping department of the hotel is constantly made aware of its rooms and its status by the house keeping module of the SDC which provides all the information in real time. During the busy season of a hotel the house keeping department is at its busiest therefore they clean the rooms from floor to floor and during slow seasons the rooms are cleaned as necessary. SDC also provides this similar functionality where the status of rooms can be changed individually or by the floor. Some of the basic functions of house keeping module is explained below. 3.3.1 Change Status Individually. To change the status of any room individually just click on the particular room from the screen shown above. For example we are selecting a room with room number 604 who’s current state is Vacant and Dirty. A room which is Vacant and Dirty can only be made Vacant or Out-of-Order, therefore these are the only two options available. To change the room to a vacant state, just select the option ‘Vacant’ and click on Change Status. 3.3.2 Change Status Floor Wise. To change the status floor wise click ‘Change Status’ button presented below. Upon click it, the above screen is seen. The house keeping provides a way to search the room according to their state and floor. The two screen shots below show where those options are available on the screen. By selecting a particular floor and a particular room state we can search for all the rooms that satisfies our criteria. In the figure',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n<\=r+Y^<\\ټ%=:\.<==y<+Խ\\<\==ELdʼ\$=\\0\<^v=q<Ӏ=%}\'>=jʺ\\`p=\N=P=ˇ9<\\0;\\R\=j^ƣ	̳;\Ǽ\r;\*\|<O=tb?z=k4=:\\;ұ:=\8%m\20=*]sv\09<SM,C\/%uM>\<K<ܞN=TLYcD~g<:<2\=~?<\\0H\<\\;\><\B=s\"\hJ^v];9~ws\'7=2\;j\@SU=d\=]\<p=2X=\%/T\b=\H= >=a=\\r%t;\9=a\n\=!p=_5=E2\\b\F4$=\[*<\{<Z?=]h>d\\P=\<\\^댽\b)y7#=	#)B\q\=ϾjMќ\<鹚=3<A\=+\u=%h~\B[=&<&s>(:H?{6\=\j=\\qh)=	=\9=c=^\Z7\\<?U<JI=ԕ<\\%\=\̻U\I5\<A\<\U\\<\䶽k\=\\\<,K߰<l=\:\<Zҽ7\'\ڽ\r%qFn\6=\|l\I\\\b<^q\\\<\W%=aO17\5~^idt=C\bǯ/=+;=\"a9=))5v=c\¼u;{<k=\jۼa2V.\a<6=\n<Zs<\7\;Ȣ;=:<tǼYݼ^<p\\\>7\0V\к|܌;7\Z=0\(6W=<6_\}^=\ZZ\ة<7\<>=Ђ=\n<W=7=C}#P<\_ai<rV=:c:=\\~4\:=V:װԽb<\\^\\<\\<\i\G=w\=\\)\\Ƽ	z=C&<ͬ콽z\K\Z;><	\:T\Om.G\d=l\g=y:=-F8z=;5=l<D\<=s==^y;Ko=<|ŝ=E\\<[O=A;$C,X4eQǼ;%M4\G=J	:;u<͞B\;TD9d7vPl:4\\|G<\"k</x\I<\\r\}\m2=sW<;Pb=9p˼\\rcǰ=\0=cdlbS\?Mr<u=@Xf:<\>8ҟ=AɇWt=rߐ\a3=XxGK<.J%}N=jU=\^Zy2|ڻ	E=c#1\k\SuAعS\\N+\Ի(\X=\\j=>w9(\q\=n\'h=ŉ<\\=;	(V*s',NULL),(3128,'4fb4ff17-d459-4223-a739-fed0bab0bd44',14,'a way to search the room according to their state and floor. The two screen shots below show where those options are available on the screen. By selecting a particular floor and a particular room state we can search for all the rooms that satisfies our criteria. In the figure below, we have selected all the rooms in the 6th floor that are currently Vacant and Dirty. The result of our search is seen on the box which is pointed by the arrow . We can individually select the desired rooms by checking them off or if we wish to select all of the rooms at once then ‘Select All’ has to be checked. Now the selected rooms can be either made vacant, out of order or occupied-dirty which is presented on the left top corner of the screen shot presented above. To change the status click ‘Change Status’. A prompt is generated asking if the user is sure of the operation. When clicked ‘Yes’ the status of the rooms get changed. 3.3.3 Maintenance. The maintenance function provided with SDC is not a separate module but just a functionality which enhances the capabilities of the house keeping department. When the house keeping department notices something not working in a room such as the mini bar or the television, they notify the maintenance department regarding the nature of the defect filling out a form which is presented in the above figure under ‘Send Response Request’. After receiving the task the maintenance department on the other hand mobilizes its crews to take the right course of action based upon the information that was passed from the house keeping. Upon completion of the task in hand the maintenance notifies the house keeping and only then the house keeping change the status of the room to its respective state. Below is a screen shot of the form from where the maintenance is notified. After filling out the appropriate fields shown above the task is sent to maintenance by clicking ‘Dispatch to Maintenance’. When maintenance sees the task and completes it as requested, they resolve the task by clicking ‘Set Resolved Time’ which marks the task as Resolved. Below is a screen shot of the Maintenance which can be accessed by clicking ‘View History’ in the figure above.',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \nn;\0ټ\\<\?r=/`=Ln;e[=ce9<t!<\4=\\\<>\y᥼\=\\\}sZ.#(7F=b\J<S\r8r=*/\\<\vT<\\RO<\'==M\w=\\=6~kxVq<\=\\\	@<\H:(YO@\\<\\٨=\=+t\\"<\r=\\=%Q\=v\V=6`=X=&H3$%gG=SN]4\2<\$:i=t]@<_6\\d=wfiXr=K{=\c=	\d=1J˼Ǉ;\6C=Sֽ\).эJ\ =ꊼ\\\<\Lf&\h=\0_Z<0=_2`\;AH6+6?\<sƃ<\<5;6<L\?\7=b<t\<<w\)M7ͽ\v<D=P\19\\\'<M\=);~ؼ\zü:=ܓ,V\\\'\' =\0!(<\=d	 Nz=K,;/\=Ꮌ\`;%0;ƥ=c\x<m\<*=\Aq =j<;Z=5i=7=.<\=:\ixy=X=+\=q+\<\A	\<QD\WV=\--S,=\#\<[=]=g2ͼY6pPV^<%i=ŧ0</\!z=i2g\pG=4cH=d\'=*2̝<h<庻Ov!H\՛<\\&=*!!\\\\\<wO<7\P\<\nS\Pu=>4\gt^(\\=\\<μ\\qRKo<1+6ij3/Sl_+==\#ev;\r\<~Gv7=77ϼ\N=\|<۲=v_F;J.=c\\=G)-y\)C\\\M\=\X<<nP2Nv\>=),F\=\\\p=ht޽\v<ⓗ\"=@<\\\=Tx<DIA!T\\-\\=:\nf=b~<9/YUq=)=^v\F=X:@ŏަ>PU<ӨJ=Pq=ך.RZ;>7<>\'\\\c<l\=Z<[\\<\Ļ;F=.8aM<1[=ǧ<^=y\\nBg<ʒ2\:\<zH<Tgf;Z\S<%н;\7_\\\\\0<\|+֔=\[=M\)	3S\<ftE\n\t7o\R$R\b\\=`\\%\Z=\=F\= T<k\<\\Z<\2Za=:{;l\uC\_\"5<3J=L?a\><=A=7BQe\\F\-=3\=\\&=Q=fO=\b~\5=_1=\ْa.=!?=\1\	Ǽ+<l;jt?\"U=ĕ\\@<	y`ܒ]-L=\q\;\=ǳ1=\<\c<\=\1\<',NULL),(3129,'0b8a7f62-04e4-4f6a-b79f-1004f7564f19',0,'Teaching Manual For SilverLine Dot Connector Version: S.10111 By SilverLine System Integrators Pvt. Ltd. Tables of Content. Introduction to SilverLine Dot Connector. Modules. Main Screen. Front Office. Point of Sale (POS). House Keeping. Maintenance. Functions. 3.1 Front Office Functions. 3.1.1 Check In 3.1.1.1 FIT Check In 3.1.1.2 Group Check In 3.1.2 Check Out 3.1.2.1 FIT Check Out 3.1.2.2 Group Check Out 3.1.3 Start Reservation 3.1.3.1 FIT Reservation 3.1.3.2 Group Reservation 3.2 Point of Sale Functions. 3.2.1 Start a Table 3.2.2 Add more item to an existing table 3.2.3 Settle a Table 3.2.4 Split a bill 3.2.5 Add Modifications 3.2.6 Void Items 3.2.8 Room Post 3.3 House Keeping Functions. Reports. Introduction to SilverLine Dot Connector. SilverLine Dot Connector (SDC) is a Property Management System (PMS) which is built for the purpose of managing different departmental operations of a hotel making it convenient to keep track of its day to day activities. With the arrival of computers into the scene, the old ways of maintaining logs of everything manually is long gone. In today’s competitive market its everyone’s aim to stay ahead of the game and one way of doing that is my having a system that helps you do just that. SDC is a system built towards addressing that need of a hotel where all the information needed to run a hotel efficiently is easily accessible with just a few clicks! More than that it integrates the functionality of all different departments of a hotel such as accounting, inventory, housekeeping etc reducing the time, energy and effort into managing all of them from one single point. SDC is one of the most efficient and easy to use PMS in the market. Build with the latest technology in software engineering, SDC provides a very efficient and user friendly operations making it very convenient for hotel staff to meet with the requirements of its daily operation. Some of its key features are as follows: SDC is a state of the art system that is capable of handling reservations for a hotel of any size. It is intelligent enough to interconnect different departments of a hotel, keeping them all informed about their duties and tasks in hand. The front office module gives an over view of the different states of different rooms (such as vacant-dirty or out-of-order), and these states are denoted by different color indexes helping the staff know everything they want with just a click. The reservation module is a full proof and fully tested part of the software that handles different information about the incoming guests such as their likes, and dislikes, room preferences and meal-plan, flight information. The guest history tracking system in the software makes reservations for repeated guests very simple and effective. The house keeping module also provides a visual over view for different rooms to be cleaned. The system provides a mechanism to clear the status of different rooms floor by floor or room by room as the situation demands. A maintenance module constantly keeps the maintenance',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n> :\4=y\;%\\<GK\<=ɖ;<2=trj=<jz=\<8)|=^\?<bBW<;\\=\;\-实= \rd=\\"<\Zf\<)\\uy=~6H:\r<.6=*z=.\\U=q\=\\>\0\h\(FP2&=\<̏XRb=\\<pe=Ůљ=\<J=z=\&\E\\;\c\?fo\<9Ҽ\i4\=WQB=ȋ12DGt-~=$=Ix=\\0<s=#ŽǓ\ >3^μF\r;\\9	i=\B=<oQ;\Z\MO=\j=[\L&;\MEg\Z\T9=:A<L=Fi=?\]a)f\\o\)B\:NF<:\#Tj\\	m\h5h\Q\S.t	=L).<=qS=3\0<C\;\+\<L=i	GZ\Tb9YGN=RL\<=\ϋ=;\"K=!tdL~\㬻y\;C\Ρ=|s=W6\:u\ѼS\2\Q=[ɼ~p=#L<xn=n=\/={<u=2=l\"ۼ0\\`=\x\r=0\?#\0Ϣ	US\Y.\]ӻ>#=)d\$=A =\=@ȉ\0A=DI\D<;;\<\\	{$$RkKؼ/_\Ol\1(3<J0x<KNL=$uG\=R\rd+ku;)*\<\'N<]:a&Gҍ<7=\\=RVO\<\r\\\;ː<\\N5UW=\뽱\"\n\}<t⡼C?7\_>\Z\<2_8=\\n=Av\>/8VVX<\p<[n\=\(=	\6/\\;=,>;O\r<\>a\"\L\0\<\=!;mx=2_\<q\7<_\"+ۋ6\z\oQ\ {@=)<+Tә%\;V^t=\=g~\;{=\=O%P=ʣ2qKy=\1>e=\j\n/^><C1 W\Ż\\k=\żpYH=\z=ȩ`rvr6\\\0=v=\=\=7	Q4=\\p3&H<SCN<\"H켃8\~\Z=\F~^=\`ӼȄ\G\"=\q\<䟯=\<\n\L<\I=\?9\=\L`=\_K\=\QƖו\ri$<<W\E\Z>=\J.Ҽ=HE\r<ߺ8=~]7=\\8\#)Y=\;b=\q\<s\=l.J;\\;f=p\吽\'\=\*=\<Ǎ==\=팻\0v=\aB<]=+\==\"h>ŁEn\:*>\Z;7\=θ5=xD%vz?C8(\0\:<\=`;<,4=&+t=',NULL),(3130,'0b8a7f62-04e4-4f6a-b79f-1004f7564f19',1,'very simple and effective. The house keeping module also provides a visual over view for different rooms to be cleaned. The system provides a mechanism to clear the status of different rooms floor by floor or room by room as the situation demands. A maintenance module constantly keeps the maintenance department at its toes with its constant reminder of the things that need to be addressed. Housekeeping department notifies the maintenance department instantly about any breakages or failures noticed during a cleaning procedure there by reducing the reaction time. A state of the art POS system is also a part of this software that takes care of all the restaurant management needs. The POS provides a visual overview of the entire restaurant with its exact floor plan and table numbering to help the manager and the servers know the status of different tables. Different color codes are used to signify different status of tables, such as Vacant or Occupied, which helps to know which tables are available for the guests walking in. The POS is best utilized with a touch screen monitor as the ordering process will be faster. Each menu item is listed under its own course list, helping servers or managers to know where to look for any particular menu item as needed. After the ordering is complete the order is sent with a push of a button. Upon doing so, all the bar items get printed in the bar and the kitchen items get printed in the kitchen reducing the need of having to send someone to the kitchen or the bar to inform the respective stations. Once the order is sent, it cannot be voided unless approved by the manager. Any alterations or special requests from the guests regarding any items ordered are entered into the system at the time of ordering which is printed at the respective terminals along with the items ordered so that the respective terminals are informed about such modifications. A bill splitting feature allows the bill to be split as requested by the customer which can be printed accordingly. A bill printing system is also a part of the software that prints the bills as necessary. Room posting for different guests according to their meal plan is also incorporated into the system. Reporting includes daily arrival, departure and stay-over reports. The end of the day report is also available with the exact cash count of both the local and foreign currencies. Any further reporting options preferred can also be incorporated upon request. These are just some of the general features of the PMS. Let us now go deeper into its individual module operations. Modules Just like any other PMS in the market, SDC covers all the basic modules required to run a successful hotel business. 70% of the revenue generated by a hotel comes from the guests that come to stay in the hotel, therefore a system as such requires every attention to details as far as guests are concerned. SDC',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\\ZE<\$Gv+Q \1\=eU;\U=np\n+8==%-=	툼J?[7W=\"\<\_*5);HI¼\9\vC=<\d< \t<t\Ľ5}e<׺j\=<U<\\T<1s=\n}L(j$w##\\\'x\<\\=֫eGG(xFA\\F\H=\"N=}M=T=L=\͊ZʌK=$]\P<+%\r=1<<9\0=eS\\:C\<Λ=\"nGu\<N\\\\2<ks^;\>\n\3<.G<l3`d\ZQGҘ\k=wH_;v9=*`\><\0}<\=Z	<Z\<\\!=Ti<\Ɏ<\\\!<\\<Z.=鐜n\<=?\\d\r*ls\< <\Z=/;rB=\IĻJ8;bpH=KG===\}9	5LC\lhG\\<q/;\=<N59\{\g>\v=R\Z=	\=\z<`O=	\Z\nD=\=\\n\r;\\(<;<vO<>\<wA<\>|=9<o=R\oj;2\=-=Ud<\\нnJ\n\'ӂ!mk9\fdTm\rd=\\<0sq{=Т7=\<Yuj\Z_\\<dzJͼ׏=getA=-<.;yg<z8<k2[=\noD\<w;1=g\|=Us\0=fz;\#\VG}\s#ڼ\\=2j\:%5\0\\<-GC</l=Go\'U=I \<<̼9=K\\n\\0=i\0l\Cg\ԶϽEW<D,\Z\\<5ɽtL=fqs<|!=\y\T[ýQ=\\}[\=/JJ1<\\\A-L=](ú\:^5D+\c⾻?f:<\\}=:=gW=\'==Ⓖ-><R$\I=)D\ؽ\*;By{\G\YT	<+k,=\'Aru(<\8\\m8=@\5ʙ:=\U\=	Ui?=Ē޼+ =$~\޼\#\<0!$=\G9(.\ZH;~$;LD,\=¼=Q==ǁ1=g\ȟ=\\&<kFVU\aC2=\lFL<Ppܽ|3F<5=W=5=;=\:\܍=g\Z|=Փ=_\W@=:E;+ﺦ<=)2=fDzt<:\'=Y\<=1s\=߭<\\<sqx<uP=\\"<t/P{5=\\\<\\}{۽&L\r=d,=a\\<\e`S\S=_T\K\w=,#\>K\>\<\\'<\\'=\\\"~',NULL),(3131,'0b8a7f62-04e4-4f6a-b79f-1004f7564f19',2,'market, SDC covers all the basic modules required to run a successful hotel business. 70% of the revenue generated by a hotel comes from the guests that come to stay in the hotel, therefore a system as such requires every attention to details as far as guests are concerned. SDC provides a state of the art front office reservation system that allows to know everything about a guest including any preferences in regards to dinning, lodging or any special requests that guests might have. Main Screen (fig 2.1) Apart from that house keeping also plays an important part in serving the guests as per their need. Restaurants are another place where the guests need to be served in a very professional manner. All of these operations are carried out by SDC which help the hotel staff to address the needed of the guest in a very professional and timely manner. Lets look at the operations of each of these modules. The above is a screen shot of SDC main screen. This is the main entry point of the system. On a first glace it gives all the statistics of the hotel that is relevant to the day. Values such as occupancy percentage and rooms to sell are very closely watched throughout the day as that determines the total revenue generated at the end of the day and also gives an idea of how many more guests can a hotel accommodate if new guests arrive as walk ins. Clicking in one of these parameters will give use more details pertaining to the parameters, such as if we double click “Total VIP’s” then a list of all the VIP’s with their room numbers will be seen on the screen. Shown below are 5 buttons which are the entry point to each of the mentioned modules. They are as follows: Front Office: By clicking in the above button in the SDC main screen, the front office of a hotel is seen. Front office module covers all the reservations together with the status of all the different rooms of a hotel. Settlement and viewing guest folio is also done from this module. Point of sale (POS): By clicking in the above button in the SDC, the POS can be accessed. POS is a module that serves as a restaurant management system for the hotels. Each restaurant of a hotel has its own terminal or POS from where it is accessed and used. House Keeping : By clicking on the above button, the House Keeping module can be accessed. House keeping module provides the house keeping department with the status of different rooms where by they know which rooms have to be cleaned or cleared. Accounting : By clicking on the above button, accounting module is viewed. Inventory Management : By clicking on the above button, Inventory Management module is accessed. Apart from accessing many different modules, SDC main screen also gives an over view of different time zones of different parts of the world,',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\<\\ἰ\rq<#80u=Wy=Ẻ7ʔ=\\\;IS.S<]<WDp(b=fQŽ=r7|oN=\I\B\ Ѻyo<\\\*<+\;{±< &{B=/˖=\Z!>3\<\'-=qλ\`ؽz`<}<Zi<Լ?\AλzaJKݡ=Ȕ\ޟ=Z=bs=0=o\=	\b̓\<fd=!s\<v<\[<\Z<야ns\:5\<W.<fs\pļ<\ZJ֐8\=20z\<:!=\'jMI\<>\{mdb=yx\\r<|=㶙<)E0=\\=\Ž\'&\y=ώ<\\_=T=q=\\Z\g\a>DI=S\Ż9X5a\˽	a=);\ļȖ\{]=l\\=\0ܼs<Õ\Z\\<\Zc(ҏ:H{H=̾\	f\ýļ&oM\y<\\<\C\n/5=jA<0먼&l\<E\<U\s=ޣ<\<\m=g\\0=\,\\<\\\<@\=: <\`P=ڃ<(\<K=j<<>p=!<<v\Z=g=^\\<yt=Ħ\ƻ;\Sv\\\<gJE=\۽	=Z\\X\<aH\=\	\Z\0\\=(gpf[;씽<`Q׽@\\G\<q~}\\n\jK#[<8i:\$xԻR=(k\\ro< <\<H\0<v\\\f\"%:\=]	#=|ݓ< \H`}b=ʉ\'_D\<\\\<.1=:7#<\\\`	&<3\Zik\=_\n\'쫅\\\<f?\ܺ樽\D\=U;ZCڂ=\"\;\=\˼\'𼆶\'\==Y[=\\ΏeU|\q:d==\Z=\\<L<nT=\=x\lFcVB=\n;>*>1Br\<\xX#6(7i~\m<Ê\w|<\=m=&\*=Ҩ<f\=\+\\v;\=\`3O{=}\,q 0wWJ\<\Jҽ\\Z\Ɗ;\L=\p\#\?ezμ \H\ޖtE<\Ha\"<\nOͽ<l\\Z=\Κ\⇳RnF\A0<\<8X0\\'g<X!=\J<\\Z=~*r=\j<\^]A;#Eǻ\W>x|B<\<B:IZ#=P5\6\<cl25%=L7;ǟ;\=+=\9=$>\=32<y><ݼD=\z/=ڐ<*+\<\Z=\D~<\n<\LB<7[k=\<<T\\׃=n)\=\=8Z!\k=\\<\6\=\"/o\\<',NULL),(3132,'0b8a7f62-04e4-4f6a-b79f-1004f7564f19',3,'Accounting : By clicking on the above button, accounting module is viewed. Inventory Management : By clicking on the above button, Inventory Management module is accessed. Apart from accessing many different modules, SDC main screen also gives an over view of different time zones of different parts of the world, and also a small calendar which is helpful in many different areas. Now let us go deeper into each of the modules of SDC. 2.2 Front Office. 2.2.1 Overview : The screen shot seen above is from the front office screen. Individual rectangles denote individual rooms of a hotel with their current status being represented by the color of these rectangles. For example, rooms 701 and 702 are out of order therefore they appear in a grey color, and the legend present in the right hand corner represents exactly just that. On the upper right hand corner there are 5 buttons. They are: 2.2.2 Refresh Button: Refreshes the display screen and updates the current house status. 2.2.3 Find Button: Upon entering guest room number in the highlighted textbox the user can press the Find button or press ‘Enter’ to view the room details. 2.2.4 Rates Button: Pressing the Rates Button will display the different rates offered in the hotel . Rates such as CP, MAP, BB can be seen with their individual breakdown of their room rates and meal plan rates. 2.2.5 View Report Button: Clicking on the View Report button, different reports can be seen. Details of different reports are covered in further sections. 2.2.6 Drop Down Menu Functions: Fig 2.2 Buttons Fig 2.3 Room State Fig 2.4 Room Type There are three Drop Down menus present in the front office screens which are highlighted above. The first one gives you the list of different room types present in the hotel such as Single, Double, Suite etc. The second one contains different room states as such Vacant, Out-of-order, Occupied etc. Selecting (Fig 2.5) different combinations of room states and room types and pressing the Find button or enter, the user can view the desired room having the selected states and types. For example in figure 2.2 and 2.3 user wishes to view all the single rooms in a hotel that are vacant. (Fig 2.5) Given below is a screen shot of the result where different room number and their corresponding states are seen. Fig (2.6) 2.2.7 View Room Button: In the above figure if one clicked room number 605 which is highlighted with the blue shade (indicating that the room is occupied), one would also be able to view the details of the room. The Figure is given below. 2.2.8 Reservation. Overview Fig (2.7) The figure above is from the Registration screen of the SDC. There are two types of reservations namely FIT Reservation and Group Reservation, which can be viewed by selecting the respective buttons shown below in figures 2.8 and 2.9. (FIT Reservation button or Group Reservation button). The result of the desired query can be seen',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \nF<-~vMY=tt=\\=\C<hV9=Z&O=x^li2=\`\\n;j͇\$<s 4<\\8<	{»rbb¼\e\a<aY\ZM=\<췽 \Z\<=i+=Cr=\A=F!n\\[\=l|ru\"\<иZF;\0<~+l׼u\0<\={=\P<B\=^7<,	><f\Ѽ\\;]E\;\0*\<\\l\<<jL+=`ۼ\v=v\';˸-\\\\N<}0<<\\\<7AbFq<\\@WJ=x*!v=<^i<\E<ߜ\Z<\ջF(= \':+\̼k<P#:|Bae==M\`n1=,=\\<=Q_c<Σ\=|\<A1\0\\r+0r=/%\Ģ:@;,\<\rG=Z\.\=\q`dN:g\K+u\H=Q\	u&Ė#CҪ<\">\&<\.\Ӹ;\_=o\<_e<~=\#K !\2Jָ\=bﺻ&i(YY=\ּ\=u^&>\_=~\=6\<s;v;=\C=jc=M<b{5=O	;H\	<\\<\(FmkQ\Nm=\\nU=X\<QX=\Nq=Pj\\(ܧ\]꼖Q<іŽ^<q\55Q;-=c7=M\Aj=V^\\r=S\⼳\"=\nA\&Sn/[=:\\\;>1fϼeX\q\;	\"\\ZЩ&=f\\0pp=NZ\弳Opa\\Z\r8.=*=\\Z=\q\\Sيؽ\[Nk\9S\<l<س<\<vݟ<<]\^<*PSu==*<lܽr\'<wdZ\`={7.\"O\|&\=\G[=\\\;<tE\7*q\0\=8[=P.-<\r=Itj^h=\`=\>0&ͽr<.5U\:Y=\<N+<ZŻች\\7 Eļ!\ս\\=\\\:\\d\=ȩ<ܯ\<c;\h=\}X:w=~ZP\Z=Ͳ\r޼ԝ\\1HW\Xz\uC.[o8ҍ;Tsj\&7z:?\\\\8j<;	-\=g=̼󲁳\Tk@\:\}*=fvBc=\\\=OW\\=	-缧\"=.\=*<qrI\Z=7=oW;GDZƼc=c}Tc=1@o<MMK>=[F\=ʉ=\O=(G¼}Y=؆5<bTjt\=PY@=\ަ=I0Ca⎱u=-<Òu\]CBU<!}\.\\%Ǽ[\=\Ql\̼\nw\;\\<\Z\<\\<\<5k=ե{Y<',NULL),(3133,'0b8a7f62-04e4-4f6a-b79f-1004f7564f19',4,'the Registration screen of the SDC. There are two types of reservations namely FIT Reservation and Group Reservation, which can be viewed by selecting the respective buttons shown below in figures 2.8 and 2.9. (FIT Reservation button or Group Reservation button). The result of the desired query can be seen in the box presented above. Fig (2.8) Fig (2.9) Fig (2.10) By clicking on the In House Guest button (Figure 2.10), the list of in house guests can be viewed. Fig (2.11) One can also perform any search that is based towards the guest’s first name, last name or the reservation ID that is provided at the time of reservation. Any such queries can be typed in the box located right below the reservation buttons shown in Figure 2.12. Fig (2.12) On the upper right hand corner of the Reservation/Registration window, there is a cluster of different buttons that provide access to different functionality to the user. Let us view each of these in detail. 2.2.9 REFRESH Button: The REFRESH button refreshes the view of either FIT reservation list or the Group reservation list or the in house guest list, depending upon which button is clicked, i.e. FIT Reservation Button or the Group Reservation Button or In House Guest Button (Refer to Figure 2.8, 2.9, 2.10). 2.2.10 START Button: By clicking the START Button, one can start making a reservation for either an FIT or a group. The details of how to create a reservation is described in later chapters. 2.2.11 CANCEL Button: By clicking the CANCEL Button, one can cancel a reservation. 2.2.12 GROUP CONTRACTS Button: The GROUP CONTRACTS button gives us access to information pertaining to different group reservation contracts a hotel may have with companies and travel agencies. Without any such contracts, a hotel may not choose to do any business with other companies. A contract includes important figures such as number and types of room, rates and dates at which the contract ends. The details are described in later chapters of how to create a group contract. 2.2.13 UPGRADE Button: The UPGRADE button takes us to the window where a reservation can be upgraded to other options provided by the hotel. 2.2.17 ADD ROOMS Button: The ADD ROOMS button adds more rooms to a reservation. 2.2.15 DEPOSITE Button: During the time of check in, guests may be asked for some deposits which can be entered in a window that is accessed by clicking in on the DEPOSITE button. The details are coming later in the chapters. 2.2.16 TODAY’S ARRIVAL Button: By clicking on the TODAY’S ARRIVAL button, one can view all the reservations that are arriving on the date it is clicked. 2.2.17 CHECK-IN Button: The CHECK-IN button takes us to the window where a guest that has a reservation and who is arriving today can be checked in. There are other information that is gathered from the guest at the time of check in which needs to be entered into the software. The guest check',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \noBv)+\W=\=G\= =[\H!̭K=ͯNu\<I$m\\<@!;7=\ok{?<\Lt<\}=Ͱ<R\X!MO\tYeJ=:=,=:@>u5=L̽\5Vv	GC]VFlè<\\"\;D\Z==5%=t^;\k\;=/\r>ur@\Ȼ:Q=Tm<\"=\JkN~\2.=c\o=lA.*Q==ZN\F+t\\\\=.	<w\=\\0<\}&\(\<n=w\\d;2%=Mc<-\'<\`6^\\\\\lt=MJ\$Ƽ=\\<\\?\pO=Ib=e\\n=-ϼJV\=!\,=}/Ey\\1\=\1/u:8\r\ݽ=<\rּc =&o,h4=i`	=\}r<\YE	Y\`5gkY;\n6\G\z\n9WZ\;\bȼ=l^\A=t+<\\n5y=\g%\ջ;\\k\=pyD=K=[&=(\<h=O<=/H=\\<\\E=lp{<\ͼ2rἴL;\\b\g=M\<}a=d\m\ܼ\x1=x\=\l\\<:%\'J==ZG<\o;\s\<H2=MZ[]\ȟ\b\n*=}\4>1=vspH?<P%t\f\";fk\'\\<H\Ͻ3\\=|(Ys<#\q=Q\nT`\mt44<K\\M=\<a1c\1=H9KlM\r=t$\\"T\<\\=L\B=KH1ꉷ\9=\y۹\\\<\0o=<7\0c<p\켷\n\\\P=4;N!H<>ae=ɝ;>{=W4\=k\Q<\\</=*si=\-=@\Z\ֵ;<M\dNJ=H=(ּ\oGo<x̽ ĺ=<\Ar\w\n;K\\z=F=\p|ЃA=\V<ùu\L8?d<ċ\oYi=\L=t?\D=\a<¼\\<\=1;mUAu<ٝ\\Լ\|\<\8X\\:=&\0=\o(<㺣D?=\8\'=K̼8<\\=\=%F!=Ӫ;u\>\<_\\\<\cg(;{n/\mvY*p;\JR\V=鲪_\\\=ěJ\=\Ź<v=Ac:Oj\j=\\=K;D;ʼ\\\ܼ\\\<,;&/\Z=\{<\r><m=\ ==7=>\\]\0\\=`\\\=p\;<\\l=aHy=NX=E7=s&\<~K	aP|׽\\}<\\S	=q۹\=f!<HgĻ@=\֟w<',NULL),(3134,'0b8a7f62-04e4-4f6a-b79f-1004f7564f19',5,'CHECK-IN button takes us to the window where a guest that has a reservation and who is arriving today can be checked in. There are other information that is gathered from the guest at the time of check in which needs to be entered into the software. The guest check in process is described in detail in later chapters. 2.2.18 VIEW DETAILS Button: The VIEW DETAILS button shows details such as guest details pertaining to either FIT reservation or Group reservation. When the in house guest list is viewed by clicking the In House Guest button (Figure 2.10), the details of each guest can be viewed by clicking the respective guest and after that then VIEW DETAILS Button. 2.2.19 EDIT Button: The EDIT button takes us to the window from where reservation details are edited. This feature, together with many other features is password protected so that only the person with the authorized privilege can make such changes. 2.2.20 ARRIVAL/DEPARTURE Button: The ARRIVAL/DEPARTURE button leads us to a command centre from where we are view the arrival and departure records. These records can be viewed according to their dates. Below is an example of such logs. 2.3 Point of Sale The point of sale (POS) of the SDC is concerned with the day to day activities of a particular restaurant and billing. The POS handles operations like ordering, notifying the kitchen, settling a table or posting the charge to the room of the in guest. Below is a screen shot of the POS main. The main screen of the POS represents the exact floor plan of the restaurant with its table numbers and other details regarding the location of its exits and bars. When trying to access the POS from the main screen of SDC, a prompt is generated asking which restaurant is to be entered. Upon selecting the desired restaurant its corresponding floor plan is fetched and shown on the screen. The main screen provides some valuable information such as which tables are occupied or vacant or which tables are departing making it easier for servers and managers alike to be better prepared for their service. The POS and all of its functions are described in detail in the further sections on POS Functions. 2.4 House Keeping. The house keeping module in the SDC is designed so that the house keeping department of a hotel is fully notified at all times, the different statuses a room may have during any particular time of day so that everyone working in and around is kept notified. Below is a screen shot of the house keeping module. Shown above is a listing of different rooms and their respective status. Just looking at the above screen the house keeping department is made aware of how many rooms are checking out, how many rooms are occupied and dirty and so on so that as soon as the rooms become available they are cleaned and made ready for future guests. Rooms of different categories can',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\0\<p\<!@&<}|=\\==O\z\<\_=\\u<P\;\\<\n\"\μ\Ƚ\\\r=HO=rM=|hm==䢼]p\\Z;\h:\W=\\ö==G\&S`ꋼ\0h\;R><ws\<Fa\<\=\>\'v{\\sn\=\f\<g|=SVM=\*wS֩=<\'qtnkJB=EK;\?+:=%Km\,ݼ\5=!\\T\\t=0W>\nc,\H\<\,}=\-~ͫ7\\n=\晽q\]<n<\\<<\<j\<\\c\\\;=<\\\μ\~޼n\<;8<-.1aL==*>=N̳<B=\|7=K	\	>O<\<5\ͼF}{@*=bA=U\\<\N<\f=\u=\s=O`-=F;Ҽ\`q쳽?)t==	\U*\\rRmSx@p_=2<V2\\nü:p;\\<=\۽/=삽\\<ZV=ݺ\n\\=r˶;ќ<ސ(=\\U\;R\=\0Ү;\Y=\*=1	=\ȅ<\'\e;ͼ\B\\\\<b<4V\>\\_<6Ѫ\\69l̉YE}4\PT\\\"\=跕<h\<ˡ!=\=mwL͏<6\]I\>yȫ<@>\0u\"=\_݈<\\pU/Hk\?{kVQ\=;#l,<($+<1<w\8\w\</=\;{#=Fg=Ǖ[= /A\u<<9&}\'z`<\nἯ|@gh2	<\\\E[=\.<\"م=\a\\\=z\;d\n\ʽ?\߱<ɼ\ګ\\r\8\\ʽMw_ \<oxȐV=U?=ѻO=d_<X=\(<5\<=\"=\L={ͼB\_<tcŒ=]L=ۦ=\U=n%{5=j6f=\\\n=\.7.\=L\<:=nÇˇ=h\gP\\;+\=\\_=k<%)\\=[\\\y=\:=ާ1znC(=\===\p=\	)\<ۈ;\{=#\\=Z\m\s:V\.;)\<\^h\xj\TR$<虛%\|;2%Lz)<\½T;S=\\<aQ=L\zƙ:l;\<\r,<;w<?=(\\̽\&=a֢=\'5Z\\\ީj2\<*2ݻ\r^=\cK<2\y<Z\5=\n9h2@= S=\=_LJ=\=\<F=$=\\\;\f=\	=\\=n<k\f\\\=as	<6\ܻ5)^༫P,ygP=7C(==x鷽\'e>A$):`<\س=$(',NULL),(3135,'0b8a7f62-04e4-4f6a-b79f-1004f7564f19',6,'the above screen the house keeping department is made aware of how many rooms are checking out, how many rooms are occupied and dirty and so on so that as soon as the rooms become available they are cleaned and made ready for future guests. Rooms of different categories can be searched by clicking on the respective buttons and clicking the ‘Find’ button. The complete function of house keeping is explained in the House keeping function section. Functions The numerous functions available in SDC enable one to better understand how a hotel operates on a day to day basis. From tracking guest folio, to viewing extra charges occurred during the guest’s stay, SDC provides the simplest of interfaces to carry out all the operations of a hotel in a very convenient and efficient manner. SDC also supports the flexibility of posting the charges from a restaurant to the guest’s room. Hence the operation capabilities of SDC expand into integrating different departmental functions of a hotel so that various tasks can be accomplished quicker. Let us look deeper into these different functionalities. 3.1 Front Office Funtions. 3.1.1 Guest Check In. Front Office is a place where the guests interact with the hotel formally for the first time, therefore it is very important for anyone working in the front office to be prepared with all the necessary details one might need during check in. On clicking the ‘Today’s Arrival’ button shown in the figure below, the user is able to view all the reservation details of all the guests or groups arriving today depending upon the selected reservation view. (FIT or Group) The procedure of checking in guests belonging to FIT or Group reservation is slightly different with one another. Let us go deeper into each of the following. 3.1.1.1 FIT Check In. As mentioned above, the list of reservations that are arriving today can be viewed by selecting the FIT reservation and clicking the Today’s Arrival button on the top. The reservation system searches for all the reservations that are arriving today and gives the result as shown below. The figure above shows two reservations that are currently scheduled to arrive today. By clicking on the individual listings we can view the details on the right side of the screen. We can see that for reservation 19, the assigned room number is shown as 0 and for reservation 20 the room number is shown as 602. This means that for the reservations having their room number as 0, individual room(s) will be selected at the time of check in and for the reservation with a room number other than 0, 602 in this case, a separate room is kept reserved. This is usually the case if the reservation is for a VIP guest. The above figure shows the details of the selected reservation whose arrival date is today. To check in guests, click the button ‘Check-In’ which is shown below. If the arrival date in the selected reservation matches with today’s',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n5\W<\v,@N\<\=߾\'=\"=j3\\<|<yY <U\\;*+4ƹ\r=]\	z=ܔh=s`tcp:<z:e&<Լ	&\0L(Ͻkj=@\=~=,6G<G3W\%<\'\<m<e\|\,F<wLe=c\ \\"|\;I=ʝ=sZW=\%k=\^<=\-=L܋Y\fZ\B;=4=\<Yd.:]>F=\"\=\\Zd )=|`i<\ʷf\\<3ح^my31=s\<Qc=K\γ=\'\0@;R\<c7:ûŨ=R\'=\\n\=W\\z$ɜa<Ë=j <\\\<-\<7Q=A;C..>\<\]\;4Ioc=;=.@\(!OP_O=-\\=lRy?=\\ȺF#=\Qt\<\阽M\\=\\	퀼[n<\ =2<0:=\Ԑ=]=tnZV)=\c\8\y`=Y\0Y<\W<\w=L<\H\,=\?6F=a\\<h=*d<x=\=d<JZ<\<G\:\<=$OV-=\{O\\Wa<M\,˽Gԙ<W`Y<.=I\Z<J<\\=ϼ\\\=ZNf\!&=?f;jP9r=7Qɽ{%e=\a;^\n\,=ؐ\p<:c\G;=g\WN\.rA<\"sMsO0\r=@`QUߪ\"@A\}\<E\<y)<em7qh=\}Il5=zQ{ꪭ=\Z\&==\\R<C^0\\9`i\\=y^9ݽ\\Dm\^M\Q<q0a=\j4D\0>\h=ڨf\\\!\"=\;剎<6<GOWp\Խ\y9M=\9===wxD=\b\\*=\0!=|\\0$b?=F@/\z<nŽ9\<gURuU\υ\4r\\>=OW<R\\:z\"=\0M=<\;<$\s=\\=FX\Z\Q=\\4\~g=p=\fO_KaE\r<\<v:^O\\\d;L\z\_<\;ﱼT\~\Ҽ#\BiLV\C;t@<LI\}?,= r_U=򿌼qhZ2\H<!<=ev\drO\B.!<7=\0\0;3\\r=\'+=\=:M\\ȽS=i=<|<Dkv.m.p=C׼v\ =%<e<ScĻ.=&QK=]6=$>9=l\\<\m;6_=ߞ\=3 =Å_=Q\=s\"\&\qӽ?\;	˼\S<\r<bs<+c\5&w=}fs<H|=,%$=ð=5\\\r=\Ze\i<',NULL),(3136,'0b8a7f62-04e4-4f6a-b79f-1004f7564f19',7,'is usually the case if the reservation is for a VIP guest. The above figure shows the details of the selected reservation whose arrival date is today. To check in guests, click the button ‘Check-In’ which is shown below. If the arrival date in the selected reservation matches with today’s date only then a check-in window is presented to the user. The figure below shows the window from where we can check in the guests. The figure above shows the terminal from where guests are checked into their rooms. As mentioned before if the room hasn’t been selected during the process of saving the reservation, then 0 appears as the selected room number and the system will ask the user to select a room first before entering any guest information. The system searches for available rooms based on the room type which was requested at the time of reservation and presents the options in the right hand corner of the screen. The figure above shows the interface from where a room is selected by just clicking the room number. (Note: Guest check-in is only possible after a room as has been assigned). When a room number is selected, a prompt is presented to make sure that the user intended to select that particular room. After pressing ‘Ok’, the selected room appears in Red as shown below. Now we are ready to enter guest information into the system so that the check in procedure can be completed and keys can be issued to the guest. The figure shown above is the terminal from where we enter all the guest information during the process of check-in. The entered information of the guest is saved by the system and it can be retrieved again in the future if the same guest decides to pay another visit. This type of guest tracking technology is found across all different PMS’s around the world and is one of the most helpful tool with which a hotel can understand more about its relationship with its guests. Let’s move in deeper into the details of the final stage of guest check in. Upon clicking the ‘Check-In’ button the above terminal is seen. The ‘Enter Guest Information’ box is already filled by the system since the guest information was already saved during the creation of the reservation. To save the information, just click ‘Add Guest’. The system only lets the user check in a specified number of guests, which was entered at the time of saving the reservation hence it keeps count of the number of guests entered. If the number of guests entered equals to the number of guests specified, a prompt is generated to let the user know that the guest assignment has been completed and that the FIT check in process is complete. 3.1.1.2 Group Check In. Group check in is quite similar to FIT check in with minor difference. Below is a screen shot of the group check in module which can be accessed by',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\j\=\<ȚibCI=)=L=T\=ݣy\\=Z\<T\<)6ɼ\E<\<=%ؼ|ӽI/=ME=\\<\dH<`	\@߼2<<1莽G=<6=)kMX\\=W=\S:=t=ޏ\H\AAǜ\ȺE$厽UY|\1;\=\r\0K\<\s֊=C<;V=r<\<\ƦU\=1e	usƼrмD\!\\nh\'\x<p\ag=~콫͞=\;#\\r\_o:\\DTP\.g+=0πp)!Q\'ʬ+\h;x\<\y=\\;P@\)&$=\U\yt4O=ę#=wR6=?a\=\\_\<\=\\=\:K.T=\<M6\\=\r\<$&:=JKV\r<\;\	>\;\a\!=yr=\=:Y<>4!=Kcw<=_Un\D\bq=ռ\	ʉ:\$kb	<\lv\<L-<s\r)t\;<N3\\\=u\R6r\\=Z<\>5\=\=8=h=Sļ_<&<=_%=o\j:T=:>Hǆ#%m\"\3F==x=\\R\'<\Z\|ņ7\\n<\\XV<	Wf\<\r=\\=\\\\j=`9c<bۃ\`\<\w+<eyƼq$\$=\\\ٗᄕ\"RX\"f7L=\̤\ғ<	\<Fw<\(\^ζ\\=k-NPq=]I\*<an<\b<yviMP\<W7-=\I\<\'2=%=?Aѥ=t\9\j\Nac^\]ma_*v\0=\=H~;\==-V=V;(\\Z=M\<\N#=z\uj̼\\U;9֎=b=t>\(8ػ\;=\W\=\!\y==\b\\=L,X<4\\ڌ<\ʓ\j=\=eC=e{;22\<\'ֻ/:Fm2<\=Z;_\0H|>G=V+dýM=\;w\˽\\8==Ϝ=Q$;?/%y.ʀS=Y\0/y<\Zz<=*PK^>6\\0{<\\\~5%b\\<\Z{\\f<O5\nFY9\EӼ﫼:VT\D⽬K\"A|/C\Z̼8\<\\E=\U%;\\ǻ<tP2\A<\\0<|v<4ߚ\=}b=tOy<#U\ZYB\e=tX_;4<T0=cT*ui=a|<BC<i`=V!=9;o\Z\A<\0=!\"\=O\Λ<\lڌn߼?d\<=\Ѽ=<S{VqG\8=\<\\ <b^>Tih=P\qA>\GE{\%;HV=h]',NULL),(3137,'0b8a7f62-04e4-4f6a-b79f-1004f7564f19',8,'know that the guest assignment has been completed and that the FIT check in process is complete. 3.1.1.2 Group Check In. Group check in is quite similar to FIT check in with minor difference. Below is a screen shot of the group check in module which can be accessed by clicking on ‘Group Reservations’ and selecting a group that is arriving today or simply by clicking the ‘Today’s Arrival’ button and clicking the ‘Check-In’ button. The first step in checking in a group is entering the individual guest information into the system and selecting a room for the guest to stay in. Group reservations are handled by the sales department of a hotel and therefore a list of rooms, their type and their rates are negotiated within a formal written contract between the travels agencies and the hotel. Each contract has a start date and a cut off date, total number of rooms, their respective types and their rates. The hotel sets aside specific rooms that fall under the categories requested in the contract known as ‘Blocks’ and only the rooms that belong to a certain block which are assigned to the guests during check in. Hence the system only allows the user to assign the rooms that fall under a particular block making it easy for the front office staff to handle the check in process. Upon selecting any room the box appears in red and at this point guest information is entered into the respective fields. If the guest is a group leader, ‘Assign as Group Leader’ should be checked and ‘Add Guest’ button should be clicked. Upon doing so a prompt is generated to make sure that the guest was intended to be appointed as group leader. After pressing ‘Ok’, the guest information is saved and the information of the next guest is to be entered after selecting a room. If more than one guest is to be entered into a room then the respective room number has to be selected from the drop down box presented below and entering the guest information, ‘Add Guest’ button has to be clicked. When total number of entered guests equals the total number of guests specified in the group, the system generates a prompt notifying the user that the guest check in process is complete and requests to check in the guests into their specific rooms. After the user clicks ‘Yes’ the check in process is complete. 3.1.2 Guest Check Out The figure above shows the status of different rooms and with that we see there are 4 rooms which are due to check- out. We can also see that of the 4 rooms 3 belong to a group and one belongs to FIT. There are numerous differences between the two types of check out procedures hence they are addressed as follows. 3.1.2.1 FIT Check Out The hotel personnel working at the front office should be well aware of the room that are due out therefore they stay prepared for',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n&=9=\hWi=\<ia<	=hյ== /=j$0NPB<\@*<ǿ\<:m\W@<o%<#<w!Q\Hzr\+<y<K0@\np\L\:%\0>Lm=\!k=\{/==$\FᩴHįߍa\=x\	=e\;\r;\<؃\\=\b=\\n=\fO=\nє<?=ĵ+PZ\<\5\<nE\kQ\\<d<\\\`\\\\;Y0 \<c;%H3<=\=\'=vZ\\\A<o\=`۽{N;ϼz\{)\ɻ`a%\0^\=L©\\\L<u\=Y}=B<=\nպ\Ǽⰲ=\ZB<9ى0=\\=!=\0\<=X=B)$l<#崃o\\0>!h<n<Ɋ\rc\<\>O;&\.=\=>==O=\R<R\A=h\3į;lS<\=	14&I)\0<OU=\Q#\\4n=\A<m=b|=\]=A>x<;\\<k\=I\;D<%&<8\ּlQ=\Z=\=r=-\an =k\'/+<^<G-s=s\ָ\;=[I%=\\'R+=\-0L\'X\Zw>;\7\=\\D(=\\<4\=]C	\<,\~\'	<5G`</A<ށ<QEf=\\<1O<UX\<&Q\\9\y8\=\r\ܖ5==8vI=Ar>#<n\<=\@`J\'LL<r<y&\s\\7=S\һע\Z}@v,Ҽ[=FO=h>\n\J<j<dS\0\Ǫ^\=\\ܼ?\\h\=\K\Z=)ǽ2\n:f=Bǝё,F\ =b\qx\<`\=YK;Fa=CNK_(G=\\C;a=FBR\H߼\/5=S\;vY\\ϽI=T\=@\;\>,n2x=Rݑ=\\\\xy\O0=<z=qq\z<RCo\NT<I^;KF=g4\(=Z̒=\.3i}x=\K=%ЂXfʀ<óEQ\=\h=>^\\0<\S\<\I<\ďy<\!\H\	\\5];lR<~j\9<\-<S\\\0<0X$^cT<tP\\zVyR/\A\ZF=J؆\i;r<UWL=K=5\<5	<\r\\<8=N*!\<y\0X<Kzq$T-<Y\\=.dM:uE=\<\Z\<\k=*&= \<\ <<<!&=9\cH\)=/\i=G\+=PӼC4\\⫻a]74\ҟUB+z].\<ft=m\\eN=H<\>b\ü.\oN=\',NULL),(3138,'0b8a7f62-04e4-4f6a-b79f-1004f7564f19',9,'one belongs to FIT. There are numerous differences between the two types of check out procedures hence they are addressed as follows. 3.1.2.1 FIT Check Out The hotel personnel working at the front office should be well aware of the room that are due out therefore they stay prepared for any guests who arrive at the desk to check out of the hotel. Upon confirming the room from the guest click on the particular room on the front office panel to access the detailed view of the reservation. Upon entering the detailed view click ‘Open’ in the financial information tab and click ‘Settlement’ to access the settlement window. Upon accessing the settlement window, the entire folio history will be available on the screen together with the charged rate, the total service charge and VAT shown in the figure below. On the right hand corner of the screen the reservation details can be seen such as the check in date and the check out date and most importantly the payment method highlighted in bold. If the payment method is cash then the ‘Cash’ should be selected in the ‘Payment Method’ box shown below. Since cash could be received in any currency that too should be documented by entering the right curreny in the next box together with the amount and press ‘Enter’. If the entered amount is less than the required amount then the system will generate a message prompting the user to enter more amount. If the amount entered is more than the required amount then the system will highlight the change that must be given back in NC. When all the monetary transactions are complete click the ‘Accept’ button. Upon clicking the button a prompt is generated to confirm the check out of the guest from the hotel. Upon clicking ‘Yes’ the FIT is checked out of the system. Then the house keeping department is notified about the departure by changing the room status to ‘Vacant – Dirty’. 3.1.2.2 Group Check Out The screen above shows 3 rooms that are checking out and that all the three rooms belong to the same group. The method to access the check out screen is the same as FIT (by clicking ‘Open’ and then ‘Settlement’) but the screen can only be accessed through the group leader’s room which is highlighted in white (room 402). Below is the screen shot of the settlement window for group check out. The rates that are charged is automatically picked by the system which was chosen at the time of reservation. On the top right hand corner we can see the list of extra charges that needs to be settled before the check out procedure can be taken forward. The extra charges if present, can be settled is a very easy manner. Since the charges are posted in individuals of the group, they are the ones responsible for paying their extra charges. Therefore each of the rooms need to be selected from the ‘Select Room’ box and',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n<>۩=\Z6ܽH׮\\<ƾ==|=\$=\>=\<Kİ=\(\\0=#W;n\\s7\66<u\=\\T`ݼkSٝ>=\\߮2<O=\\\)G\I=\\=x\<\\\$8	`\UD?A\0@H;g\\q=\)=\&;捘<x2=\r8\=@\<*5<\a#;\k=fܤ8=\nE=1\<NH\\V\O\r)$<dH\Zޫ<+<d\\\<S<\}!#k\mڽ>-;\ʼ\@<Q\\"\i**=\\<\J<\\н\<S=i)В\n=E5=M7F8ၽ\\\=DQ=*\\\Q\=\Zmm=\><\\=ֹ=!d;6\%=r\<*\\%s=Ӈ=؊=\h򡇽F=֠=D\3bG+= =3=\昼\=\\<m	`;aw&\<l=<\	m\ڼ\'ۂ\Qm\"\~q=T`\Q=C=.ʣ=ZVK;Y:)/|;9YpI=\4=׹<oK=\2<4\r\r=ۏ\<f$~=aw=&=Fj=h\\߼Oգ=\G\y<0<m\\< Ȁ<\2=+\ݼ\L@3*9<X\3=\\ıLPm=`2ռ[=\Ϋ=\50l\ȹk<J[v\<h!<\\=;\\	\6 [Ƚ߷d=NZ^C^=TRp=Is\=j=Z\v<w\<)\s<%q\\ؼɽn\^=\'\e\=SeJ0\=,\\"=\oku\n$=\\\n;̅=\\s\ٛ<6Lj%MQ=L^;̮V^=\H\<+\Ｏ6<\fkd:D:\<\n@<\U\Nc=\z<<\h$<1<J\P=`\=v\I\	=\\]Z?Vy=uȼѽ\O&=nC=X=ϣ:\"\<;\"k=[Ubv\w߻𼲊<\@/vA-<\b\"<e<R>~+=^\_t\)ռ\\\\<;j7=\n\e<B\;%f=/\<\\\\x۽K=\sK=\'<a=ｕ\b\\\}<~\\na\꼾Uј&ab\\b2C\K<U\<\|pNq;\o=$;=&۽x	uC=^3+\\;\\˽\'\?\<\\\<_=\$<\6\½\I\:\\s\nջbe\N$>9<V<F<\0\=b\:@6\<ۏ=\\<@\a=TS\=MS;ʽә`1P\<\\\0=ՉG[c{Zm֘̽K\\R#\X=\<ʻV&5\"\<\&==X=2ٻ\B=;',NULL),(3139,'0b8a7f62-04e4-4f6a-b79f-1004f7564f19',10,'taken forward. The extra charges if present, can be settled is a very easy manner. Since the charges are posted in individuals of the group, they are the ones responsible for paying their extra charges. Therefore each of the rooms need to be selected from the ‘Select Room’ box and their individual bills need to be settled. After entering the payment method and the amount press ‘Enter’ to save the information. If there is another room with an extra charge posted to it then it can also be selected from the ‘Select Room’ box following the same procedure of settlement explained above. When the required amount has been entered and also all the extra charges have been settled click ‘Settle Bill’. A prompt is generated to confirm the action. After clicking ‘Yes’ the bills are settled and now the check out procedure can be initiated. To go ahead with the check out procedure the billing instruction needs to be checked. If the billing instruction says ‘Bill to Travel Agent’ then ‘TA Voucher’ should be selected as the Payment Method. If ‘Payment at Check Out’ is the billing instruction then the amount, currency and mode (cash/credit card) needs to be entered. When the parameters entered are accepted by the system click ‘Check-Out Group’ button. Upon clicking ‘Yes’ at the prompt the group is successfully checked out of the system and out of the hotel. 3.2 Point of Sale Functions 3.2.1 Start a Table The figure above is a screen shot of the main screen of the POS. The numbers on each of the green buttons represent a table number and the color represents its present state. To start a table one must click on the respective table where the current state is vacant. Upon clicking any of the vacant tables a prompt is generated for the server/manager password. After entering the passwords the system asks for the total number of guests being served on that table. Upon entering the required information and pressing ‘Ok’, the ordering panel becomes available from where we can select the items that were ordered by the guest. After the ordering is complete the kitchen is to be notified hence the ‘Send’ button needs to be clicked for the order to be sent to the kitchen. Below is a screen shot of the ordering panel. When the ‘Send’ button is clicked, a printer placed in the kitchen prints the KOT’s together with all the information such as the table number, ordering server, order time and order details in that KOT. The table status also changes from vacant to occupied. 3.2.2 Add more items to an existing Table To add more items to an existing table just click on the respective table to open it. When the ordering screen is screen after entering the right server password, select the items being ordered just as before by clicking their names on the screen and when you’re done click ‘Send’ for the kitchen to be notified. 3.2.3 Settle a Table',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\\k<7\=\xz_<\0Q\\=\¼QQ=^(=\n|=) \Zz<\"rf =Ľ\2\.l=~JQ@l\\(t(#λ\$9;[H7<4\"+=\\=\Zd\<\o\\==\\\;\Gkkl\]<\'͌!\;\n\y\y=t[<\\\hp=ˊ0\}=\f=\8\$<Q\?=ӑI+;\=/Y:Q0꽼^L[<J,\0=E+\L=\5\:8\n=U<WPE1\<E>=<sȏ=9\=r\\Zp9\=t\\\<\,֫5	<`=t\\t\\;c\=\=);Ī=\n\9{lnDܖ=\0\:1F=o\<e@ټ^/D\=O\nNt\=\\;8=\$T>T Ld?=\Iz\=zK\<ؗc<=9q$F=s%=~\d*//=\"G=]\,=\˛	\o|\rlY=\C\n\d߼\\U=\\U\Z=\4OJٽ\5=\})\9R\r\C=C=3\;*˻p==N\=<\I<t\\<jX;=q<Q<x=ۯN\\=\\\<\d;q\W=<\r1\O.Ǽ\w\<(\7r/H=\x91Ȑ=\\=KPR<eԽd\~\\n\fý\\G3;0\^~\;\\eU:ONF\:qf\1\'A=E؅\)R=+>\h=\쨼Ȅz=^B+<M\n=yR5jb=ZZK@T:=;=)=:<c\ pT\\eW]\\@\=sWQ\<b=+Z^;Ө?`<0=\\\\!\=\=3<oF=\]\'=j\Z~=L׼\<;ǮZ==Eo4=\'輿;?\<C=/KH=y2<e@\\\Z=\'\r=\Y=Kýd=_~<\ZNc=\N\=!x=@ɼ\!\Oj=\\#;\zɽ#FлTJWEѕ\\E̼6g鼍\!\u<\?Cd	>a=Bͼ;;<mR\3P#=ڄ1:،=Y|;T\{\=\\C=B\y]}A=0\r6\\=\f=3˫C\ͼ]Ƽ)<\\=Br\;!\:\nj<-=[ⒽBϻ\Ծ=\(]*\I%\\C\0==\׽ \=[\E;\<<\ZM<㠽G\y]<\L5()3_!<P\	<\+K\}\<\nv<^e0\=Ud<]\`	Y3=K:]\\}OA&=\F<)>=n\<=[¢+\Kg5<zzѽiP\K%\ѻ\]=\1f=P3Q-\<\&<o==\"<Ml\;̫\0<\\',NULL),(3140,'0b8a7f62-04e4-4f6a-b79f-1004f7564f19',11,'on the respective table to open it. When the ordering screen is screen after entering the right server password, select the items being ordered just as before by clicking their names on the screen and when you’re done click ‘Send’ for the kitchen to be notified. 3.2.3 Settle a Table Open the table which needs to be settled and click ‘Settlement’. Below is the screen shot of the settlement window. A guest may desire to settle a bill in numerous ways such as cash, credit card or post it to the room. After selecting the appropriate payment mode, the amount is to be entered using the keyboard or the key pad provided in the panel. When the correct amount is entered the ‘Amount Tended’ button is to be clicked which will calculate the change that needs to be handed to the customer. To end the table click ‘Accept’. When the ‘Accept’ button is clicked the system makes sure that the entered amount has covered the amount due and only then closes the table and saves all the necessary data for accounting purposes or for any other future reference. 3.2.4 Split a bill Splitting a bill is one of the most important features in a POS that is used for a variety of functions making its application quite handy at times. A bill can be spliced for a minimum of 2 ways and a maximum of the number of items in the bill. For example an order that contains 5 items can only be split 5 ways. To split any order, open the table and click ‘Split’ after which the figure above can be seen. Then click on the individual item that needs to be spliced. When selected, the item appears on the left hand side of the screen. If ‘Split’ button is clicked at this point then the system will split the bill two ways with the selected ‘Red label 30’ appearing as Check 2. Below is a screen shot of splitting the bill in the manner mentioned above. When the bill has been spliced as per the need, ‘Done’ button needs to be clicked which closes the split window and takes us back to the ordering screen but now with an option of selecting which check/bill we want to view shown in figure below on the right. By selecting either Check 1 or Check 2 we can settle them individually as if they were separate tables. The un-splitting of the bill can also be performed at any time by clicking on the ‘Un-Split’ button presented above in the figure on the left. 3.2.5 Add modifications How the food is ordered by the guest might not always be the same even if the same entrée is ordered as different people prefer different way of enjoying their meals and as a hotel/restaurant guests have every right to demand things the way they prefer. Adding modifications as such means informing the kitchen regarding any special requests made by the guest so that',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\\x[=\"rtѼ\\Ľ/M<=p\;HMq=\\={\<!x^uj\"\<m=\\\)\u: =N\<\;$ߔ6=\\<U\n`<N\]:G8=\=\m)$\gSܻ۶߼9\0ۛ<s\/\K<(i\0=?\;&==4:u0=\r*<\´\=\?8f)=\\>:<\d*F\41]=\"\\:p,=Ђ\;]<\䎼:x-=\rN: >oqǽ鐼-QS<&\"<\?<\v4<a=\L;	e\n?h\wi=\?h*\=\n\=	\"=j=a89\;k\\=^=3=O=|<=\ʼ=\^@=wy!_f=\	ݍgX\<6=\-{ע&~=\~ȼ\;\\\=ahH<+Kx=kА;\=g,\<\'!Q*뮽5<`]M\=Pl<x?=7A7\t=]<=ZM@=\q;BK⑽\˻H=?\V=[$P\r>7I=\\=,$=])}<=s<q=X&\C9<\ټ3\<kq\"\U=ĭmʍ\':缇w<<tҽ\K=\[F73s=\6=p=\ra\\\0<\1X}嵽\l?<kvRo󦽲J\rߋ<\#=9\n84=#Rͼ#=\0J\˽ī===\ⒼA\nҼ\n=V	Ua=.\<.h\<!g\2=cl;H=\Z\,<\Z<HC<>7=Q\;љ\n>c\"yDm=1~b\ļ\g<=\\\$mF=8\=)\½i=K\"#@n0˻\/9=\=\nZ<>XK=5<~=*/;kn<\\P\sK\0\=ռu\dZ=\nE=	hUR=j=\v-\=yd<\l9h=:H;i|f;\Oȼ\e/<O;:>{<\\u\n?\=-=x\<\]LYe轉2=\\=\=Y;%<v	=mH6\\<0\n<t뽠=I	>ռ_>i<iX|_^ý\ƼnML=\<7QYtM=PK&\=8.Ű6\Hq<[޽Xl<5=TUT=ryQdjĪE㚽\\ټ\H\<Le\<Zgڼ\=[CjP9;\n=6\2=\\\=b^\\+<\\'\<NE\k;=\;ӭ߼4s\<,=&+P<5H><3@\3<Id=`u<\\\y<m/ϻ\=\Z\r=_=\5=h\g؜H\?L\\<\Z^\;\@^\\ؼq\<\e=\=z=\\\\s\=;\P=\\\w=<\;Zz<\<)\0+T\\',NULL),(3141,'0b8a7f62-04e4-4f6a-b79f-1004f7564f19',12,'even if the same entrée is ordered as different people prefer different way of enjoying their meals and as a hotel/restaurant guests have every right to demand things the way they prefer. Adding modifications as such means informing the kitchen regarding any special requests made by the guest so that there are no complications later when the food is delivered to the guest. To access the modification screen the ‘Modification’ button needs to be clicked and the modification can be entered only after the menu item has been selected. Below is a screen shot of the modification window. Any modification can be sent to the kitchen by typing in the requirements either by keyboard or from the screen itself. When the modification is typed, click ‘Done’. This will take us now to the ordering screen where the modification appears in the box presented below. Upon clicking the ‘Send’ button the new order will be sent to the kitchen with the specified instruction. 3.2.6 Void Items Items need to be voided at times for numerous reasons such as for a mistake that the server committed while ordering the wrong item or at other times the guest didn’t necessarily like the food hence he/she decides to change their mind and order some thing else. Therefore to address these issues and many more the system provides for a way to void items. However voiding items as such is not a very good practice as it might create problems with the tax officials during auditing if done frequently. Therefore it is encouraged that the users be alert and calm while entering the order and double check it before sending it over to the kitchen. To void any item select the item from the ordering screen and click ‘Void’. Voiding credentials are only provided to the manager hence a manager password is required to enter the voiding screen. When the correct manager password is entered, the screen below will be seen. Before voiding any item a reason has to be selected. This information will later show up in the managers report so that a close eye can be kept regarding the use of this option. When the reason is selected, ‘Void’ button needs to be clicked which voids the selected item and takes us back to the ordering screen with the revised order list. 3.2.7 Room Post Room Post pertains to posting the restaurant bill into the guest folio so that the guest can pay all the bills at the time of check out. A guest may also be entitled to a meal as per the meal plan purchased hence the server/managers need to be aware of how the bill is to be settled. To complete a Room Post click on ‘Settlement’ and in the settlement window click ‘Room Post’. Below is the screen shot of the room post window. Before posting anything to the room the server/manager should ask the guest his/her room number. The room number is to be cross referenced by entering',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\rL\<p\=Pe<;U=\\_\<E<\I^$\<h-=\4\<\\\\Wׅݫ<@kE\=!;\`Z\K୘<V֨;g\\<\ MlL(4\;=+O<><=}\<\\< c.Z^H-as+w\<8*.$Yȵ\}jWiwK_-\\Ry\ \cҼ=a\q<\\RMQ#k_=|{=\n3;,8:>(8]=~<1ݻq<\=6<\\.=\MWTPfS<9\RBZ\CR<_*\|p=7VK໭Ol<eN\yȠ\</]|=\C=\\\<F*p:[jn?K=]6<]\\}&5+p</=<g\L=o<+=ꉘ=\/(|=P\輑׻\k1\=<w\ݽ\\\\Z#\}=v\n<=P`=D/\=\x\Q\=!\n9sO\jd8=ޒ<\;>h -KH콻	YC5=f\A=\4\63=	bO<f=v\=Ur(=\<ż@!q9\\1</_<+s@=\ք\=l;\qV\r=\"z_ K<<\5>\"U</&B<s̶\'pH\Zj=\Ζ`K=<=\J:A<\\l<c=&\g=\W8=!\g8;	O\\<\:\0=$[=~m=¼\9zwn<n\<\?+<z\\Y=v\;X<\E=Ȕ6;h	\eǼ\\<@x\\'\\<\9;\Z;=\\\#\'\v˼/=k=8<M:\;ޑ;2Rj=cTm=@=*\3ϋR+\Lr<\(=gB&ǽy\\<f#\h\ф<\4<ࡽ@wD\=M7\<M\0v^b;4\=\{=t\'Z\\;CM=_\=\x;:oѽT\¡Gh\Z%`==\'B\<%=F[>H=S\<\J̻=S\= <\0ʼ\衽Ǵ<_T=!&Ċ<[\96%p(=Db=V>IWGfX:\;Q=-=M\;`!~*4տ=\\;\_~\\Z=j:\\\=!w`\=v\\\<\0k=\<\<\"x\\U-3\?=ҍ==\ =&.\\<\w=IW=_w<Q+\=J=L|[Ic>5\:i4FJdL=/={O;a\,F<3\I,ʼK1[<-\<\r4;v=F_<(\=UBRJt\I~<7<]\=\e=1\r_\	=s3>\,\g)\rs[<,<\zM>hGҽa\=DuZ%<SMFP^\Ⱥ.Pw\;\l{=5<៌a<?\=\)A<PC>\	=_<\\\=\䠼F8\"',NULL),(3142,'0b8a7f62-04e4-4f6a-b79f-1004f7564f19',13,'complete a Room Post click on ‘Settlement’ and in the settlement window click ‘Room Post’. Below is the screen shot of the room post window. Before posting anything to the room the server/manager should ask the guest his/her room number. The room number is to be cross referenced by entering it in the respective box and pressing the enter key in the keyboard. The figure above shows the information of the guest staying in the room 605 with their respective arrival and departure dates, meal plans and the total amount due. As mentioned before there are two ways to settle the bill. One is to post the bill as a charge so that the bill maybe settled during check out or it can be posted as a meal plan so that the guest is not charged. If ‘Post as Charge’ button is click then the bill will be charged to the guest folio but if the ‘Post as Meal Plan’ button is clicked then bill will be settled as a meal plan. However across different parts of the world including Nepal, alcoholic and other certain beverages are not covered under the meal plan. Hence in that case only the items applicable will be charged as meal plan and a separate bill is created for the other items which cannot be covered by the meal plan. But this new bill can be charged to the room as a charge. 3.3 House Keeping Fuctions The house keeping department of the hotel is constantly made aware of its rooms and its status by the house keeping module of the SDC which provides all the information in real time. During the busy season of a hotel the house keeping department is at its busiest therefore they clean the rooms from floor to floor and during slow seasons the rooms are cleaned as necessary. SDC also provides this similar functionality where the status of rooms can be changed individually or by the floor. Some of the basic functions of house keeping module is explained below. 3.3.1 Change Status Individually. To change the status of any room individually just click on the particular room from the screen shown above. For example we are selecting a room with room number 604 who’s current state is Vacant and Dirty. A room which is Vacant and Dirty can only be made Vacant or Out-of-Order, therefore these are the only two options available. To change the room to a vacant state, just select the option ‘Vacant’ and click on Change Status. 3.3.2 Change Status Floor Wise. To change the status floor wise click ‘Change Status’ button presented below. Upon click it, the above screen is seen. The house keeping provides a way to search the room according to their state and floor. The two screen shots below show where those options are available on the screen. By selecting a particular floor and a particular room state we can search for all the rooms that satisfies our criteria. In the figure',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n<\=r+Y^<\\ټ%=:\.<==y<+Խ\\<\==ELdʼ\$=\\0\<^v=q<Ӏ=%}\'>=jʺ\\`p=\N=P=ˇ9<\\0;\\R\=j^ƣ	̳;\Ǽ\r;\*\|<O=tb?z=k4=:\\;ұ:=\8%m\20=*]sv\09<SM,C\/%uM>\<K<ܞN=TLYcD~g<:<2\=~?<\\0H\<\\;\><\B=s\"\hJ^v];9~ws\'7=2\;j\@SU=d\=]\<p=2X=\%/T\b=\H= >=a=\\r%t;\9=a\n\=!p=_5=E2\\b\F4$=\[*<\{<Z?=]h>d\\P=\<\\^댽\b)y7#=	#)B\q\=ϾjMќ\<鹚=3<A\=+\u=%h~\B[=&<&s>(:H?{6\=\j=\\qh)=	=\9=c=^\Z7\\<?U<JI=ԕ<\\%\=\̻U\I5\<A\<\U\\<\䶽k\=\\\<,K߰<l=\:\<Zҽ7\'\ڽ\r%qFn\6=\|l\I\\\b<^q\\\<\W%=aO17\5~^idt=C\bǯ/=+;=\"a9=))5v=c\¼u;{<k=\jۼa2V.\a<6=\n<Zs<\7\;Ȣ;=:<tǼYݼ^<p\\\>7\0V\к|܌;7\Z=0\(6W=<6_\}^=\ZZ\ة<7\<>=Ђ=\n<W=7=C}#P<\_ai<rV=:c:=\\~4\:=V:װԽb<\\^\\<\\<\i\G=w\=\\)\\Ƽ	z=C&<ͬ콽z\K\Z;><	\:T\Om.G\d=l\g=y:=-F8z=;5=l<D\<=s==^y;Ko=<|ŝ=E\\<[O=A;$C,X4eQǼ;%M4\G=J	:;u<͞B\;TD9d7vPl:4\\|G<\"k</x\I<\\r\}\m2=sW<;Pb=9p˼\\rcǰ=\0=cdlbS\?Mr<u=@Xf:<\>8ҟ=AɇWt=rߐ\a3=XxGK<.J%}N=jU=\^Zy2|ڻ	E=c#1\k\SuAعS\\N+\Ի(\X=\\j=>w9(\q\=n\'h=ŉ<\\=;	(V*s',NULL),(3143,'0b8a7f62-04e4-4f6a-b79f-1004f7564f19',14,'a way to search the room according to their state and floor. The two screen shots below show where those options are available on the screen. By selecting a particular floor and a particular room state we can search for all the rooms that satisfies our criteria. In the figure below, we have selected all the rooms in the 6th floor that are currently Vacant and Dirty. The result of our search is seen on the box which is pointed by the arrow . We can individually select the desired rooms by checking them off or if we wish to select all of the rooms at once then ‘Select All’ has to be checked. Now the selected rooms can be either made vacant, out of order or occupied-dirty which is presented on the left top corner of the screen shot presented above. To change the status click ‘Change Status’. A prompt is generated asking if the user is sure of the operation. When clicked ‘Yes’ the status of the rooms get changed. 3.3.3 Maintenance. The maintenance function provided with SDC is not a separate module but just a functionality which enhances the capabilities of the house keeping department. When the house keeping department notices something not working in a room such as the mini bar or the television, they notify the maintenance department regarding the nature of the defect filling out a form which is presented in the above figure under ‘Send Response Request’. After receiving the task the maintenance department on the other hand mobilizes its crews to take the right course of action based upon the information that was passed from the house keeping. Upon completion of the task in hand the maintenance notifies the house keeping and only then the house keeping change the status of the room to its respective state. Below is a screen shot of the form from where the maintenance is notified. After filling out the appropriate fields shown above the task is sent to maintenance by clicking ‘Dispatch to Maintenance’. When maintenance sees the task and completes it as requested, they resolve the task by clicking ‘Set Resolved Time’ which marks the task as Resolved. Below is a screen shot of the Maintenance which can be accessed by clicking ‘View History’ in the figure above.',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \nn;\0ټ\\<\?r=/`=Ln;e[=ce9<t!<\4=\\\<>\y᥼\=\\\}sZ.#(7F=b\J<S\r8r=*/\\<\vT<\\RO<\'==M\w=\\=6~kxVq<\=\\\	@<\H:(YO@\\<\\٨=\=+t\\"<\r=\\=%Q\=v\V=6`=X=&H3$%gG=SN]4\2<\$:i=t]@<_6\\d=wfiXr=K{=\c=	\d=1J˼Ǉ;\6C=Sֽ\).эJ\ =ꊼ\\\<\Lf&\h=\0_Z<0=_2`\;AH6+6?\<sƃ<\<5;6<L\?\7=b<t\<<w\)M7ͽ\v<D=P\19\\\'<M\=);~ؼ\zü:=ܓ,V\\\'\' =\0!(<\=d	 Nz=K,;/\=Ꮌ\`;%0;ƥ=c\x<m\<*=\Aq =j<;Z=5i=7=.<\=:\ixy=X=+\=q+\<\A	\<QD\WV=\--S,=\#\<[=]=g2ͼY6pPV^<%i=ŧ0</\!z=i2g\pG=4cH=d\'=*2̝<h<庻Ov!H\՛<\\&=*!!\\\\\<wO<7\P\<\nS\Pu=>4\gt^(\\=\\<μ\\qRKo<1+6ij3/Sl_+==\#ev;\r\<~Gv7=77ϼ\N=\|<۲=v_F;J.=c\\=G)-y\)C\\\M\=\X<<nP2Nv\>=),F\=\\\p=ht޽\v<ⓗ\"=@<\\\=Tx<DIA!T\\-\\=:\nf=b~<9/YUq=)=^v\F=X:@ŏަ>PU<ӨJ=Pq=ך.RZ;>7<>\'\\\c<l\=Z<[\\<\Ļ;F=.8aM<1[=ǧ<^=y\\nBg<ʒ2\:\<zH<Tgf;Z\S<%н;\7_\\\\\0<\|+֔=\[=M\)	3S\<ftE\n\t7o\R$R\b\\=`\\%\Z=\=F\= T<k\<\\Z<\2Za=:{;l\uC\_\"5<3J=L?a\><=A=7BQe\\F\-=3\=\\&=Q=fO=\b~\5=_1=\ْa.=!?=\1\	Ǽ+<l;jt?\"U=ĕ\\@<	y`ܒ]-L=\q\;\=ǳ1=\<\c<\=\1\<',NULL),(3144,'ec8ac072-fd4f-4840-9937-d7f598c20e2f',0,'Teaching Manual For SilverLine Dot Connector Version: S.10111 By SilverLine System Integrators Pvt. Ltd. Tables of Content. Introduction to SilverLine Dot Connector. Modules. Main Screen. Front Office. Point of Sale (POS). House Keeping. Maintenance. Functions. 3.1 Front Office Functions. 3.1.1 Check In 3.1.1.1 FIT Check In 3.1.1.2 Group Check In 3.1.2 Check Out 3.1.2.1 FIT Check Out 3.1.2.2 Group Check Out 3.1.3 Start Reservation 3.1.3.1 FIT Reservation 3.1.3.2 Group Reservation 3.2 Point of Sale Functions. 3.2.1 Start a Table 3.2.2 Add more item to an existing table 3.2.3 Settle a Table 3.2.4 Split a bill 3.2.5 Add Modifications 3.2.6 Void Items 3.2.8 Room Post 3.3 House Keeping Functions. Reports. Introduction to SilverLine Dot Connector. SilverLine Dot Connector (SDC) is a Property Management System (PMS) which is built for the purpose of managing different departmental operations of a hotel making it convenient to keep track of its day to day activities. With the arrival of computers into the scene, the old ways of maintaining logs of everything manually is long gone. In today’s competitive market its everyone’s aim to stay ahead of the game and one way of doing that is my having a system that helps you do just that. SDC is a system built towards addressing that need of a hotel where all the information needed to run a hotel efficiently is easily accessible with just a few clicks! More than that it integrates the functionality of all different departments of a hotel such as accounting, inventory, housekeeping etc reducing the time, energy and effort into managing all of them from one single point. SDC is one of the most efficient and easy to use PMS in the market. Build with the latest technology in software engineering, SDC provides a very efficient and user friendly operations making it very convenient for hotel staff to meet with the requirements of its daily operation. Some of its key features are as follows: SDC is a state of the art system that is capable of handling reservations for a hotel of any size. It is intelligent enough to interconnect different departments of a hotel, keeping them all informed about their duties and tasks in hand. The front office module gives an over view of the different states of different rooms (such as vacant-dirty or out-of-order), and these states are denoted by different color indexes helping the staff know everything they want with just a click. The reservation module is a full proof and fully tested part of the software that handles different information about the incoming guests such as their likes, and dislikes, room preferences and meal-plan, flight information. The guest history tracking system in the software makes reservations for repeated guests very simple and effective. The house keeping module also provides a visual over view for different rooms to be cleaned. The system provides a mechanism to clear the status of different rooms floor by floor or room by room as the situation demands. A maintenance module constantly keeps the maintenance',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n> :\4=y\;%\\<GK\<=ɖ;<2=trj=<jz=\<8)|=^\?<bBW<;\\=\;\-实= \rd=\\"<\Zf\<)\\uy=~6H:\r<.6=*z=.\\U=q\=\\>\0\h\(FP2&=\<̏XRb=\\<pe=Ůљ=\<J=z=\&\E\\;\c\?fo\<9Ҽ\i4\=WQB=ȋ12DGt-~=$=Ix=\\0<s=#ŽǓ\ >3^μF\r;\\9	i=\B=<oQ;\Z\MO=\j=[\L&;\MEg\Z\T9=:A<L=Fi=?\]a)f\\o\)B\:NF<:\#Tj\\	m\h5h\Q\S.t	=L).<=qS=3\0<C\;\+\<L=i	GZ\Tb9YGN=RL\<=\ϋ=;\"K=!tdL~\㬻y\;C\Ρ=|s=W6\:u\ѼS\2\Q=[ɼ~p=#L<xn=n=\/={<u=2=l\"ۼ0\\`=\x\r=0\?#\0Ϣ	US\Y.\]ӻ>#=)d\$=A =\=@ȉ\0A=DI\D<;;\<\\	{$$RkKؼ/_\Ol\1(3<J0x<KNL=$uG\=R\rd+ku;)*\<\'N<]:a&Gҍ<7=\\=RVO\<\r\\\;ː<\\N5UW=\뽱\"\n\}<t⡼C?7\_>\Z\<2_8=\\n=Av\>/8VVX<\p<[n\=\(=	\6/\\;=,>;O\r<\>a\"\L\0\<\=!;mx=2_\<q\7<_\"+ۋ6\z\oQ\ {@=)<+Tә%\;V^t=\=g~\;{=\=O%P=ʣ2qKy=\1>e=\j\n/^><C1 W\Ż\\k=\żpYH=\z=ȩ`rvr6\\\0=v=\=\=7	Q4=\\p3&H<SCN<\"H켃8\~\Z=\F~^=\`ӼȄ\G\"=\q\<䟯=\<\n\L<\I=\?9\=\L`=\_K\=\QƖו\ri$<<W\E\Z>=\J.Ҽ=HE\r<ߺ8=~]7=\\8\#)Y=\;b=\q\<s\=l.J;\\;f=p\吽\'\=\*=\<Ǎ==\=팻\0v=\aB<]=+\==\"h>ŁEn\:*>\Z;7\=θ5=xD%vz?C8(\0\:<\=`;<,4=&+t=',NULL),(3145,'ec8ac072-fd4f-4840-9937-d7f598c20e2f',1,'very simple and effective. The house keeping module also provides a visual over view for different rooms to be cleaned. The system provides a mechanism to clear the status of different rooms floor by floor or room by room as the situation demands. A maintenance module constantly keeps the maintenance department at its toes with its constant reminder of the things that need to be addressed. Housekeeping department notifies the maintenance department instantly about any breakages or failures noticed during a cleaning procedure there by reducing the reaction time. A state of the art POS system is also a part of this software that takes care of all the restaurant management needs. The POS provides a visual overview of the entire restaurant with its exact floor plan and table numbering to help the manager and the servers know the status of different tables. Different color codes are used to signify different status of tables, such as Vacant or Occupied, which helps to know which tables are available for the guests walking in. The POS is best utilized with a touch screen monitor as the ordering process will be faster. Each menu item is listed under its own course list, helping servers or managers to know where to look for any particular menu item as needed. After the ordering is complete the order is sent with a push of a button. Upon doing so, all the bar items get printed in the bar and the kitchen items get printed in the kitchen reducing the need of having to send someone to the kitchen or the bar to inform the respective stations. Once the order is sent, it cannot be voided unless approved by the manager. Any alterations or special requests from the guests regarding any items ordered are entered into the system at the time of ordering which is printed at the respective terminals along with the items ordered so that the respective terminals are informed about such modifications. A bill splitting feature allows the bill to be split as requested by the customer which can be printed accordingly. A bill printing system is also a part of the software that prints the bills as necessary. Room posting for different guests according to their meal plan is also incorporated into the system. Reporting includes daily arrival, departure and stay-over reports. The end of the day report is also available with the exact cash count of both the local and foreign currencies. Any further reporting options preferred can also be incorporated upon request. These are just some of the general features of the PMS. Let us now go deeper into its individual module operations. Modules Just like any other PMS in the market, SDC covers all the basic modules required to run a successful hotel business. 70% of the revenue generated by a hotel comes from the guests that come to stay in the hotel, therefore a system as such requires every attention to details as far as guests are concerned. SDC',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\\ZE<\$Gv+Q \1\=eU;\U=np\n+8==%-=	툼J?[7W=\"\<\_*5);HI¼\9\vC=<\d< \t<t\Ľ5}e<׺j\=<U<\\T<1s=\n}L(j$w##\\\'x\<\\=֫eGG(xFA\\F\H=\"N=}M=T=L=\͊ZʌK=$]\P<+%\r=1<<9\0=eS\\:C\<Λ=\"nGu\<N\\\\2<ks^;\>\n\3<.G<l3`d\ZQGҘ\k=wH_;v9=*`\><\0}<\=Z	<Z\<\\!=Ti<\Ɏ<\\\!<\\<Z.=鐜n\<=?\\d\r*ls\< <\Z=/;rB=\IĻJ8;bpH=KG===\}9	5LC\lhG\\<q/;\=<N59\{\g>\v=R\Z=	\=\z<`O=	\Z\nD=\=\\n\r;\\(<;<vO<>\<wA<\>|=9<o=R\oj;2\=-=Ud<\\нnJ\n\'ӂ!mk9\fdTm\rd=\\<0sq{=Т7=\<Yuj\Z_\\<dzJͼ׏=getA=-<.;yg<z8<k2[=\noD\<w;1=g\|=Us\0=fz;\#\VG}\s#ڼ\\=2j\:%5\0\\<-GC</l=Go\'U=I \<<̼9=K\\n\\0=i\0l\Cg\ԶϽEW<D,\Z\\<5ɽtL=fqs<|!=\y\T[ýQ=\\}[\=/JJ1<\\\A-L=](ú\:^5D+\c⾻?f:<\\}=:=gW=\'==Ⓖ-><R$\I=)D\ؽ\*;By{\G\YT	<+k,=\'Aru(<\8\\m8=@\5ʙ:=\U\=	Ui?=Ē޼+ =$~\޼\#\<0!$=\G9(.\ZH;~$;LD,\=¼=Q==ǁ1=g\ȟ=\\&<kFVU\aC2=\lFL<Ppܽ|3F<5=W=5=;=\:\܍=g\Z|=Փ=_\W@=:E;+ﺦ<=)2=fDzt<:\'=Y\<=1s\=߭<\\<sqx<uP=\\"<t/P{5=\\\<\\}{۽&L\r=d,=a\\<\e`S\S=_T\K\w=,#\>K\>\<\\'<\\'=\\\"~',NULL),(3146,'ec8ac072-fd4f-4840-9937-d7f598c20e2f',2,'market, SDC covers all the basic modules required to run a successful hotel business. 70% of the revenue generated by a hotel comes from the guests that come to stay in the hotel, therefore a system as such requires every attention to details as far as guests are concerned. SDC provides a state of the art front office reservation system that allows to know everything about a guest including any preferences in regards to dinning, lodging or any special requests that guests might have. Main Screen (fig 2.1) Apart from that house keeping also plays an important part in serving the guests as per their need. Restaurants are another place where the guests need to be served in a very professional manner. All of these operations are carried out by SDC which help the hotel staff to address the needed of the guest in a very professional and timely manner. Lets look at the operations of each of these modules. The above is a screen shot of SDC main screen. This is the main entry point of the system. On a first glace it gives all the statistics of the hotel that is relevant to the day. Values such as occupancy percentage and rooms to sell are very closely watched throughout the day as that determines the total revenue generated at the end of the day and also gives an idea of how many more guests can a hotel accommodate if new guests arrive as walk ins. Clicking in one of these parameters will give use more details pertaining to the parameters, such as if we double click “Total VIP’s” then a list of all the VIP’s with their room numbers will be seen on the screen. Shown below are 5 buttons which are the entry point to each of the mentioned modules. They are as follows: Front Office: By clicking in the above button in the SDC main screen, the front office of a hotel is seen. Front office module covers all the reservations together with the status of all the different rooms of a hotel. Settlement and viewing guest folio is also done from this module. Point of sale (POS): By clicking in the above button in the SDC, the POS can be accessed. POS is a module that serves as a restaurant management system for the hotels. Each restaurant of a hotel has its own terminal or POS from where it is accessed and used. House Keeping : By clicking on the above button, the House Keeping module can be accessed. House keeping module provides the house keeping department with the status of different rooms where by they know which rooms have to be cleaned or cleared. Accounting : By clicking on the above button, accounting module is viewed. Inventory Management : By clicking on the above button, Inventory Management module is accessed. Apart from accessing many different modules, SDC main screen also gives an over view of different time zones of different parts of the world,',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\<\\ἰ\rq<#80u=Wy=Ẻ7ʔ=\\\;IS.S<]<WDp(b=fQŽ=r7|oN=\I\B\ Ѻyo<\\\*<+\;{±< &{B=/˖=\Z!>3\<\'-=qλ\`ؽz`<}<Zi<Լ?\AλzaJKݡ=Ȕ\ޟ=Z=bs=0=o\=	\b̓\<fd=!s\<v<\[<\Z<야ns\:5\<W.<fs\pļ<\ZJ֐8\=20z\<:!=\'jMI\<>\{mdb=yx\\r<|=㶙<)E0=\\=\Ž\'&\y=ώ<\\_=T=q=\\Z\g\a>DI=S\Ż9X5a\˽	a=);\ļȖ\{]=l\\=\0ܼs<Õ\Z\\<\Zc(ҏ:H{H=̾\	f\ýļ&oM\y<\\<\C\n/5=jA<0먼&l\<E\<U\s=ޣ<\<\m=g\\0=\,\\<\\\<@\=: <\`P=ڃ<(\<K=j<<>p=!<<v\Z=g=^\\<yt=Ħ\ƻ;\Sv\\\<gJE=\۽	=Z\\X\<aH\=\	\Z\0\\=(gpf[;씽<`Q׽@\\G\<q~}\\n\jK#[<8i:\$xԻR=(k\\ro< <\<H\0<v\\\f\"%:\=]	#=|ݓ< \H`}b=ʉ\'_D\<\\\<.1=:7#<\\\`	&<3\Zik\=_\n\'쫅\\\<f?\ܺ樽\D\=U;ZCڂ=\"\;\=\˼\'𼆶\'\==Y[=\\ΏeU|\q:d==\Z=\\<L<nT=\=x\lFcVB=\n;>*>1Br\<\xX#6(7i~\m<Ê\w|<\=m=&\*=Ҩ<f\=\+\\v;\=\`3O{=}\,q 0wWJ\<\Jҽ\\Z\Ɗ;\L=\p\#\?ezμ \H\ޖtE<\Ha\"<\nOͽ<l\\Z=\Κ\⇳RnF\A0<\<8X0\\'g<X!=\J<\\Z=~*r=\j<\^]A;#Eǻ\W>x|B<\<B:IZ#=P5\6\<cl25%=L7;ǟ;\=+=\9=$>\=32<y><ݼD=\z/=ڐ<*+\<\Z=\D~<\n<\LB<7[k=\<<T\\׃=n)\=\=8Z!\k=\\<\6\=\"/o\\<',NULL),(3147,'ec8ac072-fd4f-4840-9937-d7f598c20e2f',3,'Accounting : By clicking on the above button, accounting module is viewed. Inventory Management : By clicking on the above button, Inventory Management module is accessed. Apart from accessing many different modules, SDC main screen also gives an over view of different time zones of different parts of the world, and also a small calendar which is helpful in many different areas. Now let us go deeper into each of the modules of SDC. 2.2 Front Office. 2.2.1 Overview : The screen shot seen above is from the front office screen. Individual rectangles denote individual rooms of a hotel with their current status being represented by the color of these rectangles. For example, rooms 701 and 702 are out of order therefore they appear in a grey color, and the legend present in the right hand corner represents exactly just that. On the upper right hand corner there are 5 buttons. They are: 2.2.2 Refresh Button: Refreshes the display screen and updates the current house status. 2.2.3 Find Button: Upon entering guest room number in the highlighted textbox the user can press the Find button or press ‘Enter’ to view the room details. 2.2.4 Rates Button: Pressing the Rates Button will display the different rates offered in the hotel . Rates such as CP, MAP, BB can be seen with their individual breakdown of their room rates and meal plan rates. 2.2.5 View Report Button: Clicking on the View Report button, different reports can be seen. Details of different reports are covered in further sections. 2.2.6 Drop Down Menu Functions: Fig 2.2 Buttons Fig 2.3 Room State Fig 2.4 Room Type There are three Drop Down menus present in the front office screens which are highlighted above. The first one gives you the list of different room types present in the hotel such as Single, Double, Suite etc. The second one contains different room states as such Vacant, Out-of-order, Occupied etc. Selecting (Fig 2.5) different combinations of room states and room types and pressing the Find button or enter, the user can view the desired room having the selected states and types. For example in figure 2.2 and 2.3 user wishes to view all the single rooms in a hotel that are vacant. (Fig 2.5) Given below is a screen shot of the result where different room number and their corresponding states are seen. Fig (2.6) 2.2.7 View Room Button: In the above figure if one clicked room number 605 which is highlighted with the blue shade (indicating that the room is occupied), one would also be able to view the details of the room. The Figure is given below. 2.2.8 Reservation. Overview Fig (2.7) The figure above is from the Registration screen of the SDC. There are two types of reservations namely FIT Reservation and Group Reservation, which can be viewed by selecting the respective buttons shown below in figures 2.8 and 2.9. (FIT Reservation button or Group Reservation button). The result of the desired query can be seen',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \nF<-~vMY=tt=\\=\C<hV9=Z&O=x^li2=\`\\n;j͇\$<s 4<\\8<	{»rbb¼\e\a<aY\ZM=\<췽 \Z\<=i+=Cr=\A=F!n\\[\=l|ru\"\<иZF;\0<~+l׼u\0<\={=\P<B\=^7<,	><f\Ѽ\\;]E\;\0*\<\\l\<<jL+=`ۼ\v=v\';˸-\\\\N<}0<<\\\<7AbFq<\\@WJ=x*!v=<^i<\E<ߜ\Z<\ջF(= \':+\̼k<P#:|Bae==M\`n1=,=\\<=Q_c<Σ\=|\<A1\0\\r+0r=/%\Ģ:@;,\<\rG=Z\.\=\q`dN:g\K+u\H=Q\	u&Ė#CҪ<\">\&<\.\Ӹ;\_=o\<_e<~=\#K !\2Jָ\=bﺻ&i(YY=\ּ\=u^&>\_=~\=6\<s;v;=\C=jc=M<b{5=O	;H\	<\\<\(FmkQ\Nm=\\nU=X\<QX=\Nq=Pj\\(ܧ\]꼖Q<іŽ^<q\55Q;-=c7=M\Aj=V^\\r=S\⼳\"=\nA\&Sn/[=:\\\;>1fϼeX\q\;	\"\\ZЩ&=f\\0pp=NZ\弳Opa\\Z\r8.=*=\\Z=\q\\Sيؽ\[Nk\9S\<l<س<\<vݟ<<]\^<*PSu==*<lܽr\'<wdZ\`={7.\"O\|&\=\G[=\\\;<tE\7*q\0\=8[=P.-<\r=Itj^h=\`=\>0&ͽr<.5U\:Y=\<N+<ZŻች\\7 Eļ!\ս\\=\\\:\\d\=ȩ<ܯ\<c;\h=\}X:w=~ZP\Z=Ͳ\r޼ԝ\\1HW\Xz\uC.[o8ҍ;Tsj\&7z:?\\\\8j<;	-\=g=̼󲁳\Tk@\:\}*=fvBc=\\\=OW\\=	-缧\"=.\=*<qrI\Z=7=oW;GDZƼc=c}Tc=1@o<MMK>=[F\=ʉ=\O=(G¼}Y=؆5<bTjt\=PY@=\ަ=I0Ca⎱u=-<Òu\]CBU<!}\.\\%Ǽ[\=\Ql\̼\nw\;\\<\Z\<\\<\<5k=ե{Y<',NULL),(3148,'ec8ac072-fd4f-4840-9937-d7f598c20e2f',4,'the Registration screen of the SDC. There are two types of reservations namely FIT Reservation and Group Reservation, which can be viewed by selecting the respective buttons shown below in figures 2.8 and 2.9. (FIT Reservation button or Group Reservation button). The result of the desired query can be seen in the box presented above. Fig (2.8) Fig (2.9) Fig (2.10) By clicking on the In House Guest button (Figure 2.10), the list of in house guests can be viewed. Fig (2.11) One can also perform any search that is based towards the guest’s first name, last name or the reservation ID that is provided at the time of reservation. Any such queries can be typed in the box located right below the reservation buttons shown in Figure 2.12. Fig (2.12) On the upper right hand corner of the Reservation/Registration window, there is a cluster of different buttons that provide access to different functionality to the user. Let us view each of these in detail. 2.2.9 REFRESH Button: The REFRESH button refreshes the view of either FIT reservation list or the Group reservation list or the in house guest list, depending upon which button is clicked, i.e. FIT Reservation Button or the Group Reservation Button or In House Guest Button (Refer to Figure 2.8, 2.9, 2.10). 2.2.10 START Button: By clicking the START Button, one can start making a reservation for either an FIT or a group. The details of how to create a reservation is described in later chapters. 2.2.11 CANCEL Button: By clicking the CANCEL Button, one can cancel a reservation. 2.2.12 GROUP CONTRACTS Button: The GROUP CONTRACTS button gives us access to information pertaining to different group reservation contracts a hotel may have with companies and travel agencies. Without any such contracts, a hotel may not choose to do any business with other companies. A contract includes important figures such as number and types of room, rates and dates at which the contract ends. The details are described in later chapters of how to create a group contract. 2.2.13 UPGRADE Button: The UPGRADE button takes us to the window where a reservation can be upgraded to other options provided by the hotel. 2.2.17 ADD ROOMS Button: The ADD ROOMS button adds more rooms to a reservation. 2.2.15 DEPOSITE Button: During the time of check in, guests may be asked for some deposits which can be entered in a window that is accessed by clicking in on the DEPOSITE button. The details are coming later in the chapters. 2.2.16 TODAY’S ARRIVAL Button: By clicking on the TODAY’S ARRIVAL button, one can view all the reservations that are arriving on the date it is clicked. 2.2.17 CHECK-IN Button: The CHECK-IN button takes us to the window where a guest that has a reservation and who is arriving today can be checked in. There are other information that is gathered from the guest at the time of check in which needs to be entered into the software. The guest check',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \noBv)+\W=\=G\= =[\H!̭K=ͯNu\<I$m\\<@!;7=\ok{?<\Lt<\}=Ͱ<R\X!MO\tYeJ=:=,=:@>u5=L̽\5Vv	GC]VFlè<\\"\;D\Z==5%=t^;\k\;=/\r>ur@\Ȼ:Q=Tm<\"=\JkN~\2.=c\o=lA.*Q==ZN\F+t\\\\=.	<w\=\\0<\}&\(\<n=w\\d;2%=Mc<-\'<\`6^\\\\\lt=MJ\$Ƽ=\\<\\?\pO=Ib=e\\n=-ϼJV\=!\,=}/Ey\\1\=\1/u:8\r\ݽ=<\rּc =&o,h4=i`	=\}r<\YE	Y\`5gkY;\n6\G\z\n9WZ\;\bȼ=l^\A=t+<\\n5y=\g%\ջ;\\k\=pyD=K=[&=(\<h=O<=/H=\\<\\E=lp{<\ͼ2rἴL;\\b\g=M\<}a=d\m\ܼ\x1=x\=\l\\<:%\'J==ZG<\o;\s\<H2=MZ[]\ȟ\b\n*=}\4>1=vspH?<P%t\f\";fk\'\\<H\Ͻ3\\=|(Ys<#\q=Q\nT`\mt44<K\\M=\<a1c\1=H9KlM\r=t$\\"T\<\\=L\B=KH1ꉷ\9=\y۹\\\<\0o=<7\0c<p\켷\n\\\P=4;N!H<>ae=ɝ;>{=W4\=k\Q<\\</=*si=\-=@\Z\ֵ;<M\dNJ=H=(ּ\oGo<x̽ ĺ=<\Ar\w\n;K\\z=F=\p|ЃA=\V<ùu\L8?d<ċ\oYi=\L=t?\D=\a<¼\\<\=1;mUAu<ٝ\\Լ\|\<\8X\\:=&\0=\o(<㺣D?=\8\'=K̼8<\\=\=%F!=Ӫ;u\>\<_\\\<\cg(;{n/\mvY*p;\JR\V=鲪_\\\=ěJ\=\Ź<v=Ac:Oj\j=\\=K;D;ʼ\\\ܼ\\\<,;&/\Z=\{<\r><m=\ ==7=>\\]\0\\=`\\\=p\;<\\l=aHy=NX=E7=s&\<~K	aP|׽\\}<\\S	=q۹\=f!<HgĻ@=\֟w<',NULL),(3149,'ec8ac072-fd4f-4840-9937-d7f598c20e2f',5,'CHECK-IN button takes us to the window where a guest that has a reservation and who is arriving today can be checked in. There are other information that is gathered from the guest at the time of check in which needs to be entered into the software. The guest check in process is described in detail in later chapters. 2.2.18 VIEW DETAILS Button: The VIEW DETAILS button shows details such as guest details pertaining to either FIT reservation or Group reservation. When the in house guest list is viewed by clicking the In House Guest button (Figure 2.10), the details of each guest can be viewed by clicking the respective guest and after that then VIEW DETAILS Button. 2.2.19 EDIT Button: The EDIT button takes us to the window from where reservation details are edited. This feature, together with many other features is password protected so that only the person with the authorized privilege can make such changes. 2.2.20 ARRIVAL/DEPARTURE Button: The ARRIVAL/DEPARTURE button leads us to a command centre from where we are view the arrival and departure records. These records can be viewed according to their dates. Below is an example of such logs. 2.3 Point of Sale The point of sale (POS) of the SDC is concerned with the day to day activities of a particular restaurant and billing. The POS handles operations like ordering, notifying the kitchen, settling a table or posting the charge to the room of the in guest. Below is a screen shot of the POS main. The main screen of the POS represents the exact floor plan of the restaurant with its table numbers and other details regarding the location of its exits and bars. When trying to access the POS from the main screen of SDC, a prompt is generated asking which restaurant is to be entered. Upon selecting the desired restaurant its corresponding floor plan is fetched and shown on the screen. The main screen provides some valuable information such as which tables are occupied or vacant or which tables are departing making it easier for servers and managers alike to be better prepared for their service. The POS and all of its functions are described in detail in the further sections on POS Functions. 2.4 House Keeping. The house keeping module in the SDC is designed so that the house keeping department of a hotel is fully notified at all times, the different statuses a room may have during any particular time of day so that everyone working in and around is kept notified. Below is a screen shot of the house keeping module. Shown above is a listing of different rooms and their respective status. Just looking at the above screen the house keeping department is made aware of how many rooms are checking out, how many rooms are occupied and dirty and so on so that as soon as the rooms become available they are cleaned and made ready for future guests. Rooms of different categories can',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\0\<p\<!@&<}|=\\==O\z\<\_=\\u<P\;\\<\n\"\μ\Ƚ\\\r=HO=rM=|hm==䢼]p\\Z;\h:\W=\\ö==G\&S`ꋼ\0h\;R><ws\<Fa\<\=\>\'v{\\sn\=\f\<g|=SVM=\*wS֩=<\'qtnkJB=EK;\?+:=%Km\,ݼ\5=!\\T\\t=0W>\nc,\H\<\,}=\-~ͫ7\\n=\晽q\]<n<\\<<\<j\<\\c\\\;=<\\\μ\~޼n\<;8<-.1aL==*>=N̳<B=\|7=K	\	>O<\<5\ͼF}{@*=bA=U\\<\N<\f=\u=\s=O`-=F;Ҽ\`q쳽?)t==	\U*\\rRmSx@p_=2<V2\\nü:p;\\<=\۽/=삽\\<ZV=ݺ\n\\=r˶;ќ<ސ(=\\U\;R\=\0Ү;\Y=\*=1	=\ȅ<\'\e;ͼ\B\\\\<b<4V\>\\_<6Ѫ\\69l̉YE}4\PT\\\"\=跕<h\<ˡ!=\=mwL͏<6\]I\>yȫ<@>\0u\"=\_݈<\\pU/Hk\?{kVQ\=;#l,<($+<1<w\8\w\</=\;{#=Fg=Ǖ[= /A\u<<9&}\'z`<\nἯ|@gh2	<\\\E[=\.<\"م=\a\\\=z\;d\n\ʽ?\߱<ɼ\ګ\\r\8\\ʽMw_ \<oxȐV=U?=ѻO=d_<X=\(<5\<=\"=\L={ͼB\_<tcŒ=]L=ۦ=\U=n%{5=j6f=\\\n=\.7.\=L\<:=nÇˇ=h\gP\\;+\=\\_=k<%)\\=[\\\y=\:=ާ1znC(=\===\p=\	)\<ۈ;\{=#\\=Z\m\s:V\.;)\<\^h\xj\TR$<虛%\|;2%Lz)<\½T;S=\\<aQ=L\zƙ:l;\<\r,<;w<?=(\\̽\&=a֢=\'5Z\\\ީj2\<*2ݻ\r^=\cK<2\y<Z\5=\n9h2@= S=\=_LJ=\=\<F=$=\\\;\f=\	=\\=n<k\f\\\=as	<6\ܻ5)^༫P,ygP=7C(==x鷽\'e>A$):`<\س=$(',NULL),(3150,'ec8ac072-fd4f-4840-9937-d7f598c20e2f',6,'the above screen the house keeping department is made aware of how many rooms are checking out, how many rooms are occupied and dirty and so on so that as soon as the rooms become available they are cleaned and made ready for future guests. Rooms of different categories can be searched by clicking on the respective buttons and clicking the ‘Find’ button. The complete function of house keeping is explained in the House keeping function section. Functions The numerous functions available in SDC enable one to better understand how a hotel operates on a day to day basis. From tracking guest folio, to viewing extra charges occurred during the guest’s stay, SDC provides the simplest of interfaces to carry out all the operations of a hotel in a very convenient and efficient manner. SDC also supports the flexibility of posting the charges from a restaurant to the guest’s room. Hence the operation capabilities of SDC expand into integrating different departmental functions of a hotel so that various tasks can be accomplished quicker. Let us look deeper into these different functionalities. 3.1 Front Office Funtions. 3.1.1 Guest Check In. Front Office is a place where the guests interact with the hotel formally for the first time, therefore it is very important for anyone working in the front office to be prepared with all the necessary details one might need during check in. On clicking the ‘Today’s Arrival’ button shown in the figure below, the user is able to view all the reservation details of all the guests or groups arriving today depending upon the selected reservation view. (FIT or Group) The procedure of checking in guests belonging to FIT or Group reservation is slightly different with one another. Let us go deeper into each of the following. 3.1.1.1 FIT Check In. As mentioned above, the list of reservations that are arriving today can be viewed by selecting the FIT reservation and clicking the Today’s Arrival button on the top. The reservation system searches for all the reservations that are arriving today and gives the result as shown below. The figure above shows two reservations that are currently scheduled to arrive today. By clicking on the individual listings we can view the details on the right side of the screen. We can see that for reservation 19, the assigned room number is shown as 0 and for reservation 20 the room number is shown as 602. This means that for the reservations having their room number as 0, individual room(s) will be selected at the time of check in and for the reservation with a room number other than 0, 602 in this case, a separate room is kept reserved. This is usually the case if the reservation is for a VIP guest. The above figure shows the details of the selected reservation whose arrival date is today. To check in guests, click the button ‘Check-In’ which is shown below. If the arrival date in the selected reservation matches with today’s',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n5\W<\v,@N\<\=߾\'=\"=j3\\<|<yY <U\\;*+4ƹ\r=]\	z=ܔh=s`tcp:<z:e&<Լ	&\0L(Ͻkj=@\=~=,6G<G3W\%<\'\<m<e\|\,F<wLe=c\ \\"|\;I=ʝ=sZW=\%k=\^<=\-=L܋Y\fZ\B;=4=\<Yd.:]>F=\"\=\\Zd )=|`i<\ʷf\\<3ح^my31=s\<Qc=K\γ=\'\0@;R\<c7:ûŨ=R\'=\\n\=W\\z$ɜa<Ë=j <\\\<-\<7Q=A;C..>\<\]\;4Ioc=;=.@\(!OP_O=-\\=lRy?=\\ȺF#=\Qt\<\阽M\\=\\	퀼[n<\ =2<0:=\Ԑ=]=tnZV)=\c\8\y`=Y\0Y<\W<\w=L<\H\,=\?6F=a\\<h=*d<x=\=d<JZ<\<G\:\<=$OV-=\{O\\Wa<M\,˽Gԙ<W`Y<.=I\Z<J<\\=ϼ\\\=ZNf\!&=?f;jP9r=7Qɽ{%e=\a;^\n\,=ؐ\p<:c\G;=g\WN\.rA<\"sMsO0\r=@`QUߪ\"@A\}\<E\<y)<em7qh=\}Il5=zQ{ꪭ=\Z\&==\\R<C^0\\9`i\\=y^9ݽ\\Dm\^M\Q<q0a=\j4D\0>\h=ڨf\\\!\"=\;剎<6<GOWp\Խ\y9M=\9===wxD=\b\\*=\0!=|\\0$b?=F@/\z<nŽ9\<gURuU\υ\4r\\>=OW<R\\:z\"=\0M=<\;<$\s=\\=FX\Z\Q=\\4\~g=p=\fO_KaE\r<\<v:^O\\\d;L\z\_<\;ﱼT\~\Ҽ#\BiLV\C;t@<LI\}?,= r_U=򿌼qhZ2\H<!<=ev\drO\B.!<7=\0\0;3\\r=\'+=\=:M\\ȽS=i=<|<Dkv.m.p=C׼v\ =%<e<ScĻ.=&QK=]6=$>9=l\\<\m;6_=ߞ\=3 =Å_=Q\=s\"\&\qӽ?\;	˼\S<\r<bs<+c\5&w=}fs<H|=,%$=ð=5\\\r=\Ze\i<',NULL),(3151,'ec8ac072-fd4f-4840-9937-d7f598c20e2f',7,'is usually the case if the reservation is for a VIP guest. The above figure shows the details of the selected reservation whose arrival date is today. To check in guests, click the button ‘Check-In’ which is shown below. If the arrival date in the selected reservation matches with today’s date only then a check-in window is presented to the user. The figure below shows the window from where we can check in the guests. The figure above shows the terminal from where guests are checked into their rooms. As mentioned before if the room hasn’t been selected during the process of saving the reservation, then 0 appears as the selected room number and the system will ask the user to select a room first before entering any guest information. The system searches for available rooms based on the room type which was requested at the time of reservation and presents the options in the right hand corner of the screen. The figure above shows the interface from where a room is selected by just clicking the room number. (Note: Guest check-in is only possible after a room as has been assigned). When a room number is selected, a prompt is presented to make sure that the user intended to select that particular room. After pressing ‘Ok’, the selected room appears in Red as shown below. Now we are ready to enter guest information into the system so that the check in procedure can be completed and keys can be issued to the guest. The figure shown above is the terminal from where we enter all the guest information during the process of check-in. The entered information of the guest is saved by the system and it can be retrieved again in the future if the same guest decides to pay another visit. This type of guest tracking technology is found across all different PMS’s around the world and is one of the most helpful tool with which a hotel can understand more about its relationship with its guests. Let’s move in deeper into the details of the final stage of guest check in. Upon clicking the ‘Check-In’ button the above terminal is seen. The ‘Enter Guest Information’ box is already filled by the system since the guest information was already saved during the creation of the reservation. To save the information, just click ‘Add Guest’. The system only lets the user check in a specified number of guests, which was entered at the time of saving the reservation hence it keeps count of the number of guests entered. If the number of guests entered equals to the number of guests specified, a prompt is generated to let the user know that the guest assignment has been completed and that the FIT check in process is complete. 3.1.1.2 Group Check In. Group check in is quite similar to FIT check in with minor difference. Below is a screen shot of the group check in module which can be accessed by',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\j\=\<ȚibCI=)=L=T\=ݣy\\=Z\<T\<)6ɼ\E<\<=%ؼ|ӽI/=ME=\\<\dH<`	\@߼2<<1莽G=<6=)kMX\\=W=\S:=t=ޏ\H\AAǜ\ȺE$厽UY|\1;\=\r\0K\<\s֊=C<;V=r<\<\ƦU\=1e	usƼrмD\!\\nh\'\x<p\ag=~콫͞=\;#\\r\_o:\\DTP\.g+=0πp)!Q\'ʬ+\h;x\<\y=\\;P@\)&$=\U\yt4O=ę#=wR6=?a\=\\_\<\=\\=\:K.T=\<M6\\=\r\<$&:=JKV\r<\;\	>\;\a\!=yr=\=:Y<>4!=Kcw<=_Un\D\bq=ռ\	ʉ:\$kb	<\lv\<L-<s\r)t\;<N3\\\=u\R6r\\=Z<\>5\=\=8=h=Sļ_<&<=_%=o\j:T=:>Hǆ#%m\"\3F==x=\\R\'<\Z\|ņ7\\n<\\XV<	Wf\<\r=\\=\\\\j=`9c<bۃ\`\<\w+<eyƼq$\$=\\\ٗᄕ\"RX\"f7L=\̤\ғ<	\<Fw<\(\^ζ\\=k-NPq=]I\*<an<\b<yviMP\<W7-=\I\<\'2=%=?Aѥ=t\9\j\Nac^\]ma_*v\0=\=H~;\==-V=V;(\\Z=M\<\N#=z\uj̼\\U;9֎=b=t>\(8ػ\;=\W\=\!\y==\b\\=L,X<4\\ڌ<\ʓ\j=\=eC=e{;22\<\'ֻ/:Fm2<\=Z;_\0H|>G=V+dýM=\;w\˽\\8==Ϝ=Q$;?/%y.ʀS=Y\0/y<\Zz<=*PK^>6\\0{<\\\~5%b\\<\Z{\\f<O5\nFY9\EӼ﫼:VT\D⽬K\"A|/C\Z̼8\<\\E=\U%;\\ǻ<tP2\A<\\0<|v<4ߚ\=}b=tOy<#U\ZYB\e=tX_;4<T0=cT*ui=a|<BC<i`=V!=9;o\Z\A<\0=!\"\=O\Λ<\lڌn߼?d\<=\Ѽ=<S{VqG\8=\<\\ <b^>Tih=P\qA>\GE{\%;HV=h]',NULL),(3152,'ec8ac072-fd4f-4840-9937-d7f598c20e2f',8,'know that the guest assignment has been completed and that the FIT check in process is complete. 3.1.1.2 Group Check In. Group check in is quite similar to FIT check in with minor difference. Below is a screen shot of the group check in module which can be accessed by clicking on ‘Group Reservations’ and selecting a group that is arriving today or simply by clicking the ‘Today’s Arrival’ button and clicking the ‘Check-In’ button. The first step in checking in a group is entering the individual guest information into the system and selecting a room for the guest to stay in. Group reservations are handled by the sales department of a hotel and therefore a list of rooms, their type and their rates are negotiated within a formal written contract between the travels agencies and the hotel. Each contract has a start date and a cut off date, total number of rooms, their respective types and their rates. The hotel sets aside specific rooms that fall under the categories requested in the contract known as ‘Blocks’ and only the rooms that belong to a certain block which are assigned to the guests during check in. Hence the system only allows the user to assign the rooms that fall under a particular block making it easy for the front office staff to handle the check in process. Upon selecting any room the box appears in red and at this point guest information is entered into the respective fields. If the guest is a group leader, ‘Assign as Group Leader’ should be checked and ‘Add Guest’ button should be clicked. Upon doing so a prompt is generated to make sure that the guest was intended to be appointed as group leader. After pressing ‘Ok’, the guest information is saved and the information of the next guest is to be entered after selecting a room. If more than one guest is to be entered into a room then the respective room number has to be selected from the drop down box presented below and entering the guest information, ‘Add Guest’ button has to be clicked. When total number of entered guests equals the total number of guests specified in the group, the system generates a prompt notifying the user that the guest check in process is complete and requests to check in the guests into their specific rooms. After the user clicks ‘Yes’ the check in process is complete. 3.1.2 Guest Check Out The figure above shows the status of different rooms and with that we see there are 4 rooms which are due to check- out. We can also see that of the 4 rooms 3 belong to a group and one belongs to FIT. There are numerous differences between the two types of check out procedures hence they are addressed as follows. 3.1.2.1 FIT Check Out The hotel personnel working at the front office should be well aware of the room that are due out therefore they stay prepared for',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n&=9=\hWi=\<ia<	=hյ== /=j$0NPB<\@*<ǿ\<:m\W@<o%<#<w!Q\Hzr\+<y<K0@\np\L\:%\0>Lm=\!k=\{/==$\FᩴHįߍa\=x\	=e\;\r;\<؃\\=\b=\\n=\fO=\nє<?=ĵ+PZ\<\5\<nE\kQ\\<d<\\\`\\\\;Y0 \<c;%H3<=\=\'=vZ\\\A<o\=`۽{N;ϼz\{)\ɻ`a%\0^\=L©\\\L<u\=Y}=B<=\nպ\Ǽⰲ=\ZB<9ى0=\\=!=\0\<=X=B)$l<#崃o\\0>!h<n<Ɋ\rc\<\>O;&\.=\=>==O=\R<R\A=h\3į;lS<\=	14&I)\0<OU=\Q#\\4n=\A<m=b|=\]=A>x<;\\<k\=I\;D<%&<8\ּlQ=\Z=\=r=-\an =k\'/+<^<G-s=s\ָ\;=[I%=\\'R+=\-0L\'X\Zw>;\7\=\\D(=\\<4\=]C	\<,\~\'	<5G`</A<ށ<QEf=\\<1O<UX\<&Q\\9\y8\=\r\ܖ5==8vI=Ar>#<n\<=\@`J\'LL<r<y&\s\\7=S\һע\Z}@v,Ҽ[=FO=h>\n\J<j<dS\0\Ǫ^\=\\ܼ?\\h\=\K\Z=)ǽ2\n:f=Bǝё,F\ =b\qx\<`\=YK;Fa=CNK_(G=\\C;a=FBR\H߼\/5=S\;vY\\ϽI=T\=@\;\>,n2x=Rݑ=\\\\xy\O0=<z=qq\z<RCo\NT<I^;KF=g4\(=Z̒=\.3i}x=\K=%ЂXfʀ<óEQ\=\h=>^\\0<\S\<\I<\ďy<\!\H\	\\5];lR<~j\9<\-<S\\\0<0X$^cT<tP\\zVyR/\A\ZF=J؆\i;r<UWL=K=5\<5	<\r\\<8=N*!\<y\0X<Kzq$T-<Y\\=.dM:uE=\<\Z\<\k=*&= \<\ <<<!&=9\cH\)=/\i=G\+=PӼC4\\⫻a]74\ҟUB+z].\<ft=m\\eN=H<\>b\ü.\oN=\',NULL),(3153,'ec8ac072-fd4f-4840-9937-d7f598c20e2f',9,'one belongs to FIT. There are numerous differences between the two types of check out procedures hence they are addressed as follows. 3.1.2.1 FIT Check Out The hotel personnel working at the front office should be well aware of the room that are due out therefore they stay prepared for any guests who arrive at the desk to check out of the hotel. Upon confirming the room from the guest click on the particular room on the front office panel to access the detailed view of the reservation. Upon entering the detailed view click ‘Open’ in the financial information tab and click ‘Settlement’ to access the settlement window. Upon accessing the settlement window, the entire folio history will be available on the screen together with the charged rate, the total service charge and VAT shown in the figure below. On the right hand corner of the screen the reservation details can be seen such as the check in date and the check out date and most importantly the payment method highlighted in bold. If the payment method is cash then the ‘Cash’ should be selected in the ‘Payment Method’ box shown below. Since cash could be received in any currency that too should be documented by entering the right curreny in the next box together with the amount and press ‘Enter’. If the entered amount is less than the required amount then the system will generate a message prompting the user to enter more amount. If the amount entered is more than the required amount then the system will highlight the change that must be given back in NC. When all the monetary transactions are complete click the ‘Accept’ button. Upon clicking the button a prompt is generated to confirm the check out of the guest from the hotel. Upon clicking ‘Yes’ the FIT is checked out of the system. Then the house keeping department is notified about the departure by changing the room status to ‘Vacant – Dirty’. 3.1.2.2 Group Check Out The screen above shows 3 rooms that are checking out and that all the three rooms belong to the same group. The method to access the check out screen is the same as FIT (by clicking ‘Open’ and then ‘Settlement’) but the screen can only be accessed through the group leader’s room which is highlighted in white (room 402). Below is the screen shot of the settlement window for group check out. The rates that are charged is automatically picked by the system which was chosen at the time of reservation. On the top right hand corner we can see the list of extra charges that needs to be settled before the check out procedure can be taken forward. The extra charges if present, can be settled is a very easy manner. Since the charges are posted in individuals of the group, they are the ones responsible for paying their extra charges. Therefore each of the rooms need to be selected from the ‘Select Room’ box and',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n<>۩=\Z6ܽH׮\\<ƾ==|=\$=\>=\<Kİ=\(\\0=#W;n\\s7\66<u\=\\T`ݼkSٝ>=\\߮2<O=\\\)G\I=\\=x\<\\\$8	`\UD?A\0@H;g\\q=\)=\&;捘<x2=\r8\=@\<*5<\a#;\k=fܤ8=\nE=1\<NH\\V\O\r)$<dH\Zޫ<+<d\\\<S<\}!#k\mڽ>-;\ʼ\@<Q\\"\i**=\\<\J<\\н\<S=i)В\n=E5=M7F8ၽ\\\=DQ=*\\\Q\=\Zmm=\><\\=ֹ=!d;6\%=r\<*\\%s=Ӈ=؊=\h򡇽F=֠=D\3bG+= =3=\昼\=\\<m	`;aw&\<l=<\	m\ڼ\'ۂ\Qm\"\~q=T`\Q=C=.ʣ=ZVK;Y:)/|;9YpI=\4=׹<oK=\2<4\r\r=ۏ\<f$~=aw=&=Fj=h\\߼Oգ=\G\y<0<m\\< Ȁ<\2=+\ݼ\L@3*9<X\3=\\ıLPm=`2ռ[=\Ϋ=\50l\ȹk<J[v\<h!<\\=;\\	\6 [Ƚ߷d=NZ^C^=TRp=Is\=j=Z\v<w\<)\s<%q\\ؼɽn\^=\'\e\=SeJ0\=,\\"=\oku\n$=\\\n;̅=\\s\ٛ<6Lj%MQ=L^;̮V^=\H\<+\Ｏ6<\fkd:D:\<\n@<\U\Nc=\z<<\h$<1<J\P=`\=v\I\	=\\]Z?Vy=uȼѽ\O&=nC=X=ϣ:\"\<;\"k=[Ubv\w߻𼲊<\@/vA-<\b\"<e<R>~+=^\_t\)ռ\\\\<;j7=\n\e<B\;%f=/\<\\\\x۽K=\sK=\'<a=ｕ\b\\\}<~\\na\꼾Uј&ab\\b2C\K<U\<\|pNq;\o=$;=&۽x	uC=^3+\\;\\˽\'\?\<\\\<_=\$<\6\½\I\:\\s\nջbe\N$>9<V<F<\0\=b\:@6\<ۏ=\\<@\a=TS\=MS;ʽә`1P\<\\\0=ՉG[c{Zm֘̽K\\R#\X=\<ʻV&5\"\<\&==X=2ٻ\B=;',NULL),(3154,'ec8ac072-fd4f-4840-9937-d7f598c20e2f',10,'taken forward. The extra charges if present, can be settled is a very easy manner. Since the charges are posted in individuals of the group, they are the ones responsible for paying their extra charges. Therefore each of the rooms need to be selected from the ‘Select Room’ box and their individual bills need to be settled. After entering the payment method and the amount press ‘Enter’ to save the information. If there is another room with an extra charge posted to it then it can also be selected from the ‘Select Room’ box following the same procedure of settlement explained above. When the required amount has been entered and also all the extra charges have been settled click ‘Settle Bill’. A prompt is generated to confirm the action. After clicking ‘Yes’ the bills are settled and now the check out procedure can be initiated. To go ahead with the check out procedure the billing instruction needs to be checked. If the billing instruction says ‘Bill to Travel Agent’ then ‘TA Voucher’ should be selected as the Payment Method. If ‘Payment at Check Out’ is the billing instruction then the amount, currency and mode (cash/credit card) needs to be entered. When the parameters entered are accepted by the system click ‘Check-Out Group’ button. Upon clicking ‘Yes’ at the prompt the group is successfully checked out of the system and out of the hotel. 3.2 Point of Sale Functions 3.2.1 Start a Table The figure above is a screen shot of the main screen of the POS. The numbers on each of the green buttons represent a table number and the color represents its present state. To start a table one must click on the respective table where the current state is vacant. Upon clicking any of the vacant tables a prompt is generated for the server/manager password. After entering the passwords the system asks for the total number of guests being served on that table. Upon entering the required information and pressing ‘Ok’, the ordering panel becomes available from where we can select the items that were ordered by the guest. After the ordering is complete the kitchen is to be notified hence the ‘Send’ button needs to be clicked for the order to be sent to the kitchen. Below is a screen shot of the ordering panel. When the ‘Send’ button is clicked, a printer placed in the kitchen prints the KOT’s together with all the information such as the table number, ordering server, order time and order details in that KOT. The table status also changes from vacant to occupied. 3.2.2 Add more items to an existing Table To add more items to an existing table just click on the respective table to open it. When the ordering screen is screen after entering the right server password, select the items being ordered just as before by clicking their names on the screen and when you’re done click ‘Send’ for the kitchen to be notified. 3.2.3 Settle a Table',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\\k<7\=\xz_<\0Q\\=\¼QQ=^(=\n|=) \Zz<\"rf =Ľ\2\.l=~JQ@l\\(t(#λ\$9;[H7<4\"+=\\=\Zd\<\o\\==\\\;\Gkkl\]<\'͌!\;\n\y\y=t[<\\\hp=ˊ0\}=\f=\8\$<Q\?=ӑI+;\=/Y:Q0꽼^L[<J,\0=E+\L=\5\:8\n=U<WPE1\<E>=<sȏ=9\=r\\Zp9\=t\\\<\,֫5	<`=t\\t\\;c\=\=);Ī=\n\9{lnDܖ=\0\:1F=o\<e@ټ^/D\=O\nNt\=\\;8=\$T>T Ld?=\Iz\=zK\<ؗc<=9q$F=s%=~\d*//=\"G=]\,=\˛	\o|\rlY=\C\n\d߼\\U=\\U\Z=\4OJٽ\5=\})\9R\r\C=C=3\;*˻p==N\=<\I<t\\<jX;=q<Q<x=ۯN\\=\\\<\d;q\W=<\r1\O.Ǽ\w\<(\7r/H=\x91Ȑ=\\=KPR<eԽd\~\\n\fý\\G3;0\^~\;\\eU:ONF\:qf\1\'A=E؅\)R=+>\h=\쨼Ȅz=^B+<M\n=yR5jb=ZZK@T:=;=)=:<c\ pT\\eW]\\@\=sWQ\<b=+Z^;Ө?`<0=\\\\!\=\=3<oF=\]\'=j\Z~=L׼\<;ǮZ==Eo4=\'輿;?\<C=/KH=y2<e@\\\Z=\'\r=\Y=Kýd=_~<\ZNc=\N\=!x=@ɼ\!\Oj=\\#;\zɽ#FлTJWEѕ\\E̼6g鼍\!\u<\?Cd	>a=Bͼ;;<mR\3P#=ڄ1:،=Y|;T\{\=\\C=B\y]}A=0\r6\\=\f=3˫C\ͼ]Ƽ)<\\=Br\;!\:\nj<-=[ⒽBϻ\Ծ=\(]*\I%\\C\0==\׽ \=[\E;\<<\ZM<㠽G\y]<\L5()3_!<P\	<\+K\}\<\nv<^e0\=Ud<]\`	Y3=K:]\\}OA&=\F<)>=n\<=[¢+\Kg5<zzѽiP\K%\ѻ\]=\1f=P3Q-\<\&<o==\"<Ml\;̫\0<\\',NULL),(3155,'ec8ac072-fd4f-4840-9937-d7f598c20e2f',11,'on the respective table to open it. When the ordering screen is screen after entering the right server password, select the items being ordered just as before by clicking their names on the screen and when you’re done click ‘Send’ for the kitchen to be notified. 3.2.3 Settle a Table Open the table which needs to be settled and click ‘Settlement’. Below is the screen shot of the settlement window. A guest may desire to settle a bill in numerous ways such as cash, credit card or post it to the room. After selecting the appropriate payment mode, the amount is to be entered using the keyboard or the key pad provided in the panel. When the correct amount is entered the ‘Amount Tended’ button is to be clicked which will calculate the change that needs to be handed to the customer. To end the table click ‘Accept’. When the ‘Accept’ button is clicked the system makes sure that the entered amount has covered the amount due and only then closes the table and saves all the necessary data for accounting purposes or for any other future reference. 3.2.4 Split a bill Splitting a bill is one of the most important features in a POS that is used for a variety of functions making its application quite handy at times. A bill can be spliced for a minimum of 2 ways and a maximum of the number of items in the bill. For example an order that contains 5 items can only be split 5 ways. To split any order, open the table and click ‘Split’ after which the figure above can be seen. Then click on the individual item that needs to be spliced. When selected, the item appears on the left hand side of the screen. If ‘Split’ button is clicked at this point then the system will split the bill two ways with the selected ‘Red label 30’ appearing as Check 2. Below is a screen shot of splitting the bill in the manner mentioned above. When the bill has been spliced as per the need, ‘Done’ button needs to be clicked which closes the split window and takes us back to the ordering screen but now with an option of selecting which check/bill we want to view shown in figure below on the right. By selecting either Check 1 or Check 2 we can settle them individually as if they were separate tables. The un-splitting of the bill can also be performed at any time by clicking on the ‘Un-Split’ button presented above in the figure on the left. 3.2.5 Add modifications How the food is ordered by the guest might not always be the same even if the same entrée is ordered as different people prefer different way of enjoying their meals and as a hotel/restaurant guests have every right to demand things the way they prefer. Adding modifications as such means informing the kitchen regarding any special requests made by the guest so that',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\\x[=\"rtѼ\\Ľ/M<=p\;HMq=\\={\<!x^uj\"\<m=\\\)\u: =N\<\;$ߔ6=\\<U\n`<N\]:G8=\=\m)$\gSܻ۶߼9\0ۛ<s\/\K<(i\0=?\;&==4:u0=\r*<\´\=\?8f)=\\>:<\d*F\41]=\"\\:p,=Ђ\;]<\䎼:x-=\rN: >oqǽ鐼-QS<&\"<\?<\v4<a=\L;	e\n?h\wi=\?h*\=\n\=	\"=j=a89\;k\\=^=3=O=|<=\ʼ=\^@=wy!_f=\	ݍgX\<6=\-{ע&~=\~ȼ\;\\\=ahH<+Kx=kА;\=g,\<\'!Q*뮽5<`]M\=Pl<x?=7A7\t=]<=ZM@=\q;BK⑽\˻H=?\V=[$P\r>7I=\\=,$=])}<=s<q=X&\C9<\ټ3\<kq\"\U=ĭmʍ\':缇w<<tҽ\K=\[F73s=\6=p=\ra\\\0<\1X}嵽\l?<kvRo󦽲J\rߋ<\#=9\n84=#Rͼ#=\0J\˽ī===\ⒼA\nҼ\n=V	Ua=.\<.h\<!g\2=cl;H=\Z\,<\Z<HC<>7=Q\;љ\n>c\"yDm=1~b\ļ\g<=\\\$mF=8\=)\½i=K\"#@n0˻\/9=\=\nZ<>XK=5<~=*/;kn<\\P\sK\0\=ռu\dZ=\nE=	hUR=j=\v-\=yd<\l9h=:H;i|f;\Oȼ\e/<O;:>{<\\u\n?\=-=x\<\]LYe轉2=\\=\=Y;%<v	=mH6\\<0\n<t뽠=I	>ռ_>i<iX|_^ý\ƼnML=\<7QYtM=PK&\=8.Ű6\Hq<[޽Xl<5=TUT=ryQdjĪE㚽\\ټ\H\<Le\<Zgڼ\=[CjP9;\n=6\2=\\\=b^\\+<\\'\<NE\k;=\;ӭ߼4s\<,=&+P<5H><3@\3<Id=`u<\\\y<m/ϻ\=\Z\r=_=\5=h\g؜H\?L\\<\Z^\;\@^\\ؼq\<\e=\=z=\\\\s\=;\P=\\\w=<\;Zz<\<)\0+T\\',NULL),(3156,'ec8ac072-fd4f-4840-9937-d7f598c20e2f',12,'even if the same entrée is ordered as different people prefer different way of enjoying their meals and as a hotel/restaurant guests have every right to demand things the way they prefer. Adding modifications as such means informing the kitchen regarding any special requests made by the guest so that there are no complications later when the food is delivered to the guest. To access the modification screen the ‘Modification’ button needs to be clicked and the modification can be entered only after the menu item has been selected. Below is a screen shot of the modification window. Any modification can be sent to the kitchen by typing in the requirements either by keyboard or from the screen itself. When the modification is typed, click ‘Done’. This will take us now to the ordering screen where the modification appears in the box presented below. Upon clicking the ‘Send’ button the new order will be sent to the kitchen with the specified instruction. 3.2.6 Void Items Items need to be voided at times for numerous reasons such as for a mistake that the server committed while ordering the wrong item or at other times the guest didn’t necessarily like the food hence he/she decides to change their mind and order some thing else. Therefore to address these issues and many more the system provides for a way to void items. However voiding items as such is not a very good practice as it might create problems with the tax officials during auditing if done frequently. Therefore it is encouraged that the users be alert and calm while entering the order and double check it before sending it over to the kitchen. To void any item select the item from the ordering screen and click ‘Void’. Voiding credentials are only provided to the manager hence a manager password is required to enter the voiding screen. When the correct manager password is entered, the screen below will be seen. Before voiding any item a reason has to be selected. This information will later show up in the managers report so that a close eye can be kept regarding the use of this option. When the reason is selected, ‘Void’ button needs to be clicked which voids the selected item and takes us back to the ordering screen with the revised order list. 3.2.7 Room Post Room Post pertains to posting the restaurant bill into the guest folio so that the guest can pay all the bills at the time of check out. A guest may also be entitled to a meal as per the meal plan purchased hence the server/managers need to be aware of how the bill is to be settled. To complete a Room Post click on ‘Settlement’ and in the settlement window click ‘Room Post’. Below is the screen shot of the room post window. Before posting anything to the room the server/manager should ask the guest his/her room number. The room number is to be cross referenced by entering',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\rL\<p\=Pe<;U=\\_\<E<\I^$\<h-=\4\<\\\\Wׅݫ<@kE\=!;\`Z\K୘<V֨;g\\<\ MlL(4\;=+O<><=}\<\\< c.Z^H-as+w\<8*.$Yȵ\}jWiwK_-\\Ry\ \cҼ=a\q<\\RMQ#k_=|{=\n3;,8:>(8]=~<1ݻq<\=6<\\.=\MWTPfS<9\RBZ\CR<_*\|p=7VK໭Ol<eN\yȠ\</]|=\C=\\\<F*p:[jn?K=]6<]\\}&5+p</=<g\L=o<+=ꉘ=\/(|=P\輑׻\k1\=<w\ݽ\\\\Z#\}=v\n<=P`=D/\=\x\Q\=!\n9sO\jd8=ޒ<\;>h -KH콻	YC5=f\A=\4\63=	bO<f=v\=Ur(=\<ż@!q9\\1</_<+s@=\ք\=l;\qV\r=\"z_ K<<\5>\"U</&B<s̶\'pH\Zj=\Ζ`K=<=\J:A<\\l<c=&\g=\W8=!\g8;	O\\<\:\0=$[=~m=¼\9zwn<n\<\?+<z\\Y=v\;X<\E=Ȕ6;h	\eǼ\\<@x\\'\\<\9;\Z;=\\\#\'\v˼/=k=8<M:\;ޑ;2Rj=cTm=@=*\3ϋR+\Lr<\(=gB&ǽy\\<f#\h\ф<\4<ࡽ@wD\=M7\<M\0v^b;4\=\{=t\'Z\\;CM=_\=\x;:oѽT\¡Gh\Z%`==\'B\<%=F[>H=S\<\J̻=S\= <\0ʼ\衽Ǵ<_T=!&Ċ<[\96%p(=Db=V>IWGfX:\;Q=-=M\;`!~*4տ=\\;\_~\\Z=j:\\\=!w`\=v\\\<\0k=\<\<\"x\\U-3\?=ҍ==\ =&.\\<\w=IW=_w<Q+\=J=L|[Ic>5\:i4FJdL=/={O;a\,F<3\I,ʼK1[<-\<\r4;v=F_<(\=UBRJt\I~<7<]\=\e=1\r_\	=s3>\,\g)\rs[<,<\zM>hGҽa\=DuZ%<SMFP^\Ⱥ.Pw\;\l{=5<៌a<?\=\)A<PC>\	=_<\\\=\䠼F8\"',NULL),(3157,'ec8ac072-fd4f-4840-9937-d7f598c20e2f',13,'complete a Room Post click on ‘Settlement’ and in the settlement window click ‘Room Post’. Below is the screen shot of the room post window. Before posting anything to the room the server/manager should ask the guest his/her room number. The room number is to be cross referenced by entering it in the respective box and pressing the enter key in the keyboard. The figure above shows the information of the guest staying in the room 605 with their respective arrival and departure dates, meal plans and the total amount due. As mentioned before there are two ways to settle the bill. One is to post the bill as a charge so that the bill maybe settled during check out or it can be posted as a meal plan so that the guest is not charged. If ‘Post as Charge’ button is click then the bill will be charged to the guest folio but if the ‘Post as Meal Plan’ button is clicked then bill will be settled as a meal plan. However across different parts of the world including Nepal, alcoholic and other certain beverages are not covered under the meal plan. Hence in that case only the items applicable will be charged as meal plan and a separate bill is created for the other items which cannot be covered by the meal plan. But this new bill can be charged to the room as a charge. 3.3 House Keeping Fuctions The house keeping department of the hotel is constantly made aware of its rooms and its status by the house keeping module of the SDC which provides all the information in real time. During the busy season of a hotel the house keeping department is at its busiest therefore they clean the rooms from floor to floor and during slow seasons the rooms are cleaned as necessary. SDC also provides this similar functionality where the status of rooms can be changed individually or by the floor. Some of the basic functions of house keeping module is explained below. 3.3.1 Change Status Individually. To change the status of any room individually just click on the particular room from the screen shown above. For example we are selecting a room with room number 604 who’s current state is Vacant and Dirty. A room which is Vacant and Dirty can only be made Vacant or Out-of-Order, therefore these are the only two options available. To change the room to a vacant state, just select the option ‘Vacant’ and click on Change Status. 3.3.2 Change Status Floor Wise. To change the status floor wise click ‘Change Status’ button presented below. Upon click it, the above screen is seen. The house keeping provides a way to search the room according to their state and floor. The two screen shots below show where those options are available on the screen. By selecting a particular floor and a particular room state we can search for all the rooms that satisfies our criteria. In the figure',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n<\=r+Y^<\\ټ%=:\.<==y<+Խ\\<\==ELdʼ\$=\\0\<^v=q<Ӏ=%}\'>=jʺ\\`p=\N=P=ˇ9<\\0;\\R\=j^ƣ	̳;\Ǽ\r;\*\|<O=tb?z=k4=:\\;ұ:=\8%m\20=*]sv\09<SM,C\/%uM>\<K<ܞN=TLYcD~g<:<2\=~?<\\0H\<\\;\><\B=s\"\hJ^v];9~ws\'7=2\;j\@SU=d\=]\<p=2X=\%/T\b=\H= >=a=\\r%t;\9=a\n\=!p=_5=E2\\b\F4$=\[*<\{<Z?=]h>d\\P=\<\\^댽\b)y7#=	#)B\q\=ϾjMќ\<鹚=3<A\=+\u=%h~\B[=&<&s>(:H?{6\=\j=\\qh)=	=\9=c=^\Z7\\<?U<JI=ԕ<\\%\=\̻U\I5\<A\<\U\\<\䶽k\=\\\<,K߰<l=\:\<Zҽ7\'\ڽ\r%qFn\6=\|l\I\\\b<^q\\\<\W%=aO17\5~^idt=C\bǯ/=+;=\"a9=))5v=c\¼u;{<k=\jۼa2V.\a<6=\n<Zs<\7\;Ȣ;=:<tǼYݼ^<p\\\>7\0V\к|܌;7\Z=0\(6W=<6_\}^=\ZZ\ة<7\<>=Ђ=\n<W=7=C}#P<\_ai<rV=:c:=\\~4\:=V:װԽb<\\^\\<\\<\i\G=w\=\\)\\Ƽ	z=C&<ͬ콽z\K\Z;><	\:T\Om.G\d=l\g=y:=-F8z=;5=l<D\<=s==^y;Ko=<|ŝ=E\\<[O=A;$C,X4eQǼ;%M4\G=J	:;u<͞B\;TD9d7vPl:4\\|G<\"k</x\I<\\r\}\m2=sW<;Pb=9p˼\\rcǰ=\0=cdlbS\?Mr<u=@Xf:<\>8ҟ=AɇWt=rߐ\a3=XxGK<.J%}N=jU=\^Zy2|ڻ	E=c#1\k\SuAعS\\N+\Ի(\X=\\j=>w9(\q\=n\'h=ŉ<\\=;	(V*s',NULL),(3158,'ec8ac072-fd4f-4840-9937-d7f598c20e2f',14,'a way to search the room according to their state and floor. The two screen shots below show where those options are available on the screen. By selecting a particular floor and a particular room state we can search for all the rooms that satisfies our criteria. In the figure below, we have selected all the rooms in the 6th floor that are currently Vacant and Dirty. The result of our search is seen on the box which is pointed by the arrow . We can individually select the desired rooms by checking them off or if we wish to select all of the rooms at once then ‘Select All’ has to be checked. Now the selected rooms can be either made vacant, out of order or occupied-dirty which is presented on the left top corner of the screen shot presented above. To change the status click ‘Change Status’. A prompt is generated asking if the user is sure of the operation. When clicked ‘Yes’ the status of the rooms get changed. 3.3.3 Maintenance. The maintenance function provided with SDC is not a separate module but just a functionality which enhances the capabilities of the house keeping department. When the house keeping department notices something not working in a room such as the mini bar or the television, they notify the maintenance department regarding the nature of the defect filling out a form which is presented in the above figure under ‘Send Response Request’. After receiving the task the maintenance department on the other hand mobilizes its crews to take the right course of action based upon the information that was passed from the house keeping. Upon completion of the task in hand the maintenance notifies the house keeping and only then the house keeping change the status of the room to its respective state. Below is a screen shot of the form from where the maintenance is notified. After filling out the appropriate fields shown above the task is sent to maintenance by clicking ‘Dispatch to Maintenance’. When maintenance sees the task and completes it as requested, they resolve the task by clicking ‘Set Resolved Time’ which marks the task as Resolved. Below is a screen shot of the Maintenance which can be accessed by clicking ‘View History’ in the figure above.',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \nn;\0ټ\\<\?r=/`=Ln;e[=ce9<t!<\4=\\\<>\y᥼\=\\\}sZ.#(7F=b\J<S\r8r=*/\\<\vT<\\RO<\'==M\w=\\=6~kxVq<\=\\\	@<\H:(YO@\\<\\٨=\=+t\\"<\r=\\=%Q\=v\V=6`=X=&H3$%gG=SN]4\2<\$:i=t]@<_6\\d=wfiXr=K{=\c=	\d=1J˼Ǉ;\6C=Sֽ\).эJ\ =ꊼ\\\<\Lf&\h=\0_Z<0=_2`\;AH6+6?\<sƃ<\<5;6<L\?\7=b<t\<<w\)M7ͽ\v<D=P\19\\\'<M\=);~ؼ\zü:=ܓ,V\\\'\' =\0!(<\=d	 Nz=K,;/\=Ꮌ\`;%0;ƥ=c\x<m\<*=\Aq =j<;Z=5i=7=.<\=:\ixy=X=+\=q+\<\A	\<QD\WV=\--S,=\#\<[=]=g2ͼY6pPV^<%i=ŧ0</\!z=i2g\pG=4cH=d\'=*2̝<h<庻Ov!H\՛<\\&=*!!\\\\\<wO<7\P\<\nS\Pu=>4\gt^(\\=\\<μ\\qRKo<1+6ij3/Sl_+==\#ev;\r\<~Gv7=77ϼ\N=\|<۲=v_F;J.=c\\=G)-y\)C\\\M\=\X<<nP2Nv\>=),F\=\\\p=ht޽\v<ⓗ\"=@<\\\=Tx<DIA!T\\-\\=:\nf=b~<9/YUq=)=^v\F=X:@ŏަ>PU<ӨJ=Pq=ך.RZ;>7<>\'\\\c<l\=Z<[\\<\Ļ;F=.8aM<1[=ǧ<^=y\\nBg<ʒ2\:\<zH<Tgf;Z\S<%н;\7_\\\\\0<\|+֔=\[=M\)	3S\<ftE\n\t7o\R$R\b\\=`\\%\Z=\=F\= T<k\<\\Z<\2Za=:{;l\uC\_\"5<3J=L?a\><=A=7BQe\\F\-=3\=\\&=Q=fO=\b~\5=_1=\ْa.=!?=\1\	Ǽ+<l;jt?\"U=ĕ\\@<	y`ܒ]-L=\q\;\=ǳ1=\<\c<\=\1\<',NULL),(3160,'61b765e5-ae10-4594-beff-e88be67efe3c',0,'Teaching Manual For SilverLine Dot Connector Version: S.10111 By SilverLine System Integrators Pvt. Ltd. Tables of Content. Introduction to SilverLine Dot Connector. Modules. Main Screen. Front Office. Point of Sale (POS). House Keeping. Maintenance. Functions. 3.1 Front Office Functions. 3.1.1 Check In 3.1.1.1 FIT Check In 3.1.1.2 Group Check In 3.1.2 Check Out 3.1.2.1 FIT Check Out 3.1.2.2 Group Check Out 3.1.3 Start Reservation 3.1.3.1 FIT Reservation 3.1.3.2 Group Reservation 3.2 Point of Sale Functions. 3.2.1 Start a Table 3.2.2 Add more item to an existing table 3.2.3 Settle a Table 3.2.4 Split a bill 3.2.5 Add Modifications 3.2.6 Void Items 3.2.8 Room Post 3.3 House Keeping Functions. Reports. Introduction to SilverLine Dot Connector. SilverLine Dot Connector (SDC) is a Property Management System (PMS) which is built for the purpose of managing different departmental operations of a hotel making it convenient to keep track of its day to day activities. With the arrival of computers into the scene, the old ways of maintaining logs of everything manually is long gone. In today’s competitive market its everyone’s aim to stay ahead of the game and one way of doing that is my having a system that helps you do just that. SDC is a system built towards addressing that need of a hotel where all the information needed to run a hotel efficiently is easily accessible with just a few clicks! More than that it integrates the functionality of all different departments of a hotel such as accounting, inventory, housekeeping etc reducing the time, energy and effort into managing all of them from one single point. SDC is one of the most efficient and easy to use PMS in the market. Build with the latest technology in software engineering, SDC provides a very efficient and user friendly operations making it very convenient for hotel staff to meet with the requirements of its daily operation. Some of its key features are as follows: SDC is a state of the art system that is capable of handling reservations for a hotel of any size. It is intelligent enough to interconnect different departments of a hotel, keeping them all informed about their duties and tasks in hand. The front office module gives an over view of the different states of different rooms (such as vacant-dirty or out-of-order), and these states are denoted by different color indexes helping the staff know everything they want with just a click. The reservation module is a full proof and fully tested part of the software that handles different information about the incoming guests such as their likes, and dislikes, room preferences and meal-plan, flight information. The guest history tracking system in the software makes reservations for repeated guests very simple and effective. The house keeping module also provides a visual over view for different rooms to be cleaned. The system provides a mechanism to clear the status of different rooms floor by floor or room by room as the situation demands. A maintenance module constantly keeps the maintenance',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n> :\4=y\;%\\<GK\<=ɖ;<2=trj=<jz=\<8)|=^\?<bBW<;\\=\;\-实= \rd=\\"<\Zf\<)\\uy=~6H:\r<.6=*z=.\\U=q\=\\>\0\h\(FP2&=\<̏XRb=\\<pe=Ůљ=\<J=z=\&\E\\;\c\?fo\<9Ҽ\i4\=WQB=ȋ12DGt-~=$=Ix=\\0<s=#ŽǓ\ >3^μF\r;\\9	i=\B=<oQ;\Z\MO=\j=[\L&;\MEg\Z\T9=:A<L=Fi=?\]a)f\\o\)B\:NF<:\#Tj\\	m\h5h\Q\S.t	=L).<=qS=3\0<C\;\+\<L=i	GZ\Tb9YGN=RL\<=\ϋ=;\"K=!tdL~\㬻y\;C\Ρ=|s=W6\:u\ѼS\2\Q=[ɼ~p=#L<xn=n=\/={<u=2=l\"ۼ0\\`=\x\r=0\?#\0Ϣ	US\Y.\]ӻ>#=)d\$=A =\=@ȉ\0A=DI\D<;;\<\\	{$$RkKؼ/_\Ol\1(3<J0x<KNL=$uG\=R\rd+ku;)*\<\'N<]:a&Gҍ<7=\\=RVO\<\r\\\;ː<\\N5UW=\뽱\"\n\}<t⡼C?7\_>\Z\<2_8=\\n=Av\>/8VVX<\p<[n\=\(=	\6/\\;=,>;O\r<\>a\"\L\0\<\=!;mx=2_\<q\7<_\"+ۋ6\z\oQ\ {@=)<+Tә%\;V^t=\=g~\;{=\=O%P=ʣ2qKy=\1>e=\j\n/^><C1 W\Ż\\k=\żpYH=\z=ȩ`rvr6\\\0=v=\=\=7	Q4=\\p3&H<SCN<\"H켃8\~\Z=\F~^=\`ӼȄ\G\"=\q\<䟯=\<\n\L<\I=\?9\=\L`=\_K\=\QƖו\ri$<<W\E\Z>=\J.Ҽ=HE\r<ߺ8=~]7=\\8\#)Y=\;b=\q\<s\=l.J;\\;f=p\吽\'\=\*=\<Ǎ==\=팻\0v=\aB<]=+\==\"h>ŁEn\:*>\Z;7\=θ5=xD%vz?C8(\0\:<\=`;<,4=&+t=','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3161,'61b765e5-ae10-4594-beff-e88be67efe3c',1,'very simple and effective. The house keeping module also provides a visual over view for different rooms to be cleaned. The system provides a mechanism to clear the status of different rooms floor by floor or room by room as the situation demands. A maintenance module constantly keeps the maintenance department at its toes with its constant reminder of the things that need to be addressed. Housekeeping department notifies the maintenance department instantly about any breakages or failures noticed during a cleaning procedure there by reducing the reaction time. A state of the art POS system is also a part of this software that takes care of all the restaurant management needs. The POS provides a visual overview of the entire restaurant with its exact floor plan and table numbering to help the manager and the servers know the status of different tables. Different color codes are used to signify different status of tables, such as Vacant or Occupied, which helps to know which tables are available for the guests walking in. The POS is best utilized with a touch screen monitor as the ordering process will be faster. Each menu item is listed under its own course list, helping servers or managers to know where to look for any particular menu item as needed. After the ordering is complete the order is sent with a push of a button. Upon doing so, all the bar items get printed in the bar and the kitchen items get printed in the kitchen reducing the need of having to send someone to the kitchen or the bar to inform the respective stations. Once the order is sent, it cannot be voided unless approved by the manager. Any alterations or special requests from the guests regarding any items ordered are entered into the system at the time of ordering which is printed at the respective terminals along with the items ordered so that the respective terminals are informed about such modifications. A bill splitting feature allows the bill to be split as requested by the customer which can be printed accordingly. A bill printing system is also a part of the software that prints the bills as necessary. Room posting for different guests according to their meal plan is also incorporated into the system. Reporting includes daily arrival, departure and stay-over reports. The end of the day report is also available with the exact cash count of both the local and foreign currencies. Any further reporting options preferred can also be incorporated upon request. These are just some of the general features of the PMS. Let us now go deeper into its individual module operations. Modules Just like any other PMS in the market, SDC covers all the basic modules required to run a successful hotel business. 70% of the revenue generated by a hotel comes from the guests that come to stay in the hotel, therefore a system as such requires every attention to details as far as guests are concerned. SDC',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\\ZE<\$Gv+Q \1\=eU;\U=np\n+8==%-=	툼J?[7W=\"\<\_*5);HI¼\9\vC=<\d< \t<t\Ľ5}e<׺j\=<U<\\T<1s=\n}L(j$w##\\\'x\<\\=֫eGG(xFA\\F\H=\"N=}M=T=L=\͊ZʌK=$]\P<+%\r=1<<9\0=eS\\:C\<Λ=\"nGu\<N\\\\2<ks^;\>\n\3<.G<l3`d\ZQGҘ\k=wH_;v9=*`\><\0}<\=Z	<Z\<\\!=Ti<\Ɏ<\\\!<\\<Z.=鐜n\<=?\\d\r*ls\< <\Z=/;rB=\IĻJ8;bpH=KG===\}9	5LC\lhG\\<q/;\=<N59\{\g>\v=R\Z=	\=\z<`O=	\Z\nD=\=\\n\r;\\(<;<vO<>\<wA<\>|=9<o=R\oj;2\=-=Ud<\\нnJ\n\'ӂ!mk9\fdTm\rd=\\<0sq{=Т7=\<Yuj\Z_\\<dzJͼ׏=getA=-<.;yg<z8<k2[=\noD\<w;1=g\|=Us\0=fz;\#\VG}\s#ڼ\\=2j\:%5\0\\<-GC</l=Go\'U=I \<<̼9=K\\n\\0=i\0l\Cg\ԶϽEW<D,\Z\\<5ɽtL=fqs<|!=\y\T[ýQ=\\}[\=/JJ1<\\\A-L=](ú\:^5D+\c⾻?f:<\\}=:=gW=\'==Ⓖ-><R$\I=)D\ؽ\*;By{\G\YT	<+k,=\'Aru(<\8\\m8=@\5ʙ:=\U\=	Ui?=Ē޼+ =$~\޼\#\<0!$=\G9(.\ZH;~$;LD,\=¼=Q==ǁ1=g\ȟ=\\&<kFVU\aC2=\lFL<Ppܽ|3F<5=W=5=;=\:\܍=g\Z|=Փ=_\W@=:E;+ﺦ<=)2=fDzt<:\'=Y\<=1s\=߭<\\<sqx<uP=\\"<t/P{5=\\\<\\}{۽&L\r=d,=a\\<\e`S\S=_T\K\w=,#\>K\>\<\\'<\\'=\\\"~','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3162,'61b765e5-ae10-4594-beff-e88be67efe3c',2,'market, SDC covers all the basic modules required to run a successful hotel business. 70% of the revenue generated by a hotel comes from the guests that come to stay in the hotel, therefore a system as such requires every attention to details as far as guests are concerned. SDC provides a state of the art front office reservation system that allows to know everything about a guest including any preferences in regards to dinning, lodging or any special requests that guests might have. Main Screen (fig 2.1) Apart from that house keeping also plays an important part in serving the guests as per their need. Restaurants are another place where the guests need to be served in a very professional manner. All of these operations are carried out by SDC which help the hotel staff to address the needed of the guest in a very professional and timely manner. Lets look at the operations of each of these modules. The above is a screen shot of SDC main screen. This is the main entry point of the system. On a first glace it gives all the statistics of the hotel that is relevant to the day. Values such as occupancy percentage and rooms to sell are very closely watched throughout the day as that determines the total revenue generated at the end of the day and also gives an idea of how many more guests can a hotel accommodate if new guests arrive as walk ins. Clicking in one of these parameters will give use more details pertaining to the parameters, such as if we double click “Total VIP’s” then a list of all the VIP’s with their room numbers will be seen on the screen. Shown below are 5 buttons which are the entry point to each of the mentioned modules. They are as follows: Front Office: By clicking in the above button in the SDC main screen, the front office of a hotel is seen. Front office module covers all the reservations together with the status of all the different rooms of a hotel. Settlement and viewing guest folio is also done from this module. Point of sale (POS): By clicking in the above button in the SDC, the POS can be accessed. POS is a module that serves as a restaurant management system for the hotels. Each restaurant of a hotel has its own terminal or POS from where it is accessed and used. House Keeping : By clicking on the above button, the House Keeping module can be accessed. House keeping module provides the house keeping department with the status of different rooms where by they know which rooms have to be cleaned or cleared. Accounting : By clicking on the above button, accounting module is viewed. Inventory Management : By clicking on the above button, Inventory Management module is accessed. Apart from accessing many different modules, SDC main screen also gives an over view of different time zones of different parts of the world,',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\<\\ἰ\rq<#80u=Wy=Ẻ7ʔ=\\\;IS.S<]<WDp(b=fQŽ=r7|oN=\I\B\ Ѻyo<\\\*<+\;{±< &{B=/˖=\Z!>3\<\'-=qλ\`ؽz`<}<Zi<Լ?\AλzaJKݡ=Ȕ\ޟ=Z=bs=0=o\=	\b̓\<fd=!s\<v<\[<\Z<야ns\:5\<W.<fs\pļ<\ZJ֐8\=20z\<:!=\'jMI\<>\{mdb=yx\\r<|=㶙<)E0=\\=\Ž\'&\y=ώ<\\_=T=q=\\Z\g\a>DI=S\Ż9X5a\˽	a=);\ļȖ\{]=l\\=\0ܼs<Õ\Z\\<\Zc(ҏ:H{H=̾\	f\ýļ&oM\y<\\<\C\n/5=jA<0먼&l\<E\<U\s=ޣ<\<\m=g\\0=\,\\<\\\<@\=: <\`P=ڃ<(\<K=j<<>p=!<<v\Z=g=^\\<yt=Ħ\ƻ;\Sv\\\<gJE=\۽	=Z\\X\<aH\=\	\Z\0\\=(gpf[;씽<`Q׽@\\G\<q~}\\n\jK#[<8i:\$xԻR=(k\\ro< <\<H\0<v\\\f\"%:\=]	#=|ݓ< \H`}b=ʉ\'_D\<\\\<.1=:7#<\\\`	&<3\Zik\=_\n\'쫅\\\<f?\ܺ樽\D\=U;ZCڂ=\"\;\=\˼\'𼆶\'\==Y[=\\ΏeU|\q:d==\Z=\\<L<nT=\=x\lFcVB=\n;>*>1Br\<\xX#6(7i~\m<Ê\w|<\=m=&\*=Ҩ<f\=\+\\v;\=\`3O{=}\,q 0wWJ\<\Jҽ\\Z\Ɗ;\L=\p\#\?ezμ \H\ޖtE<\Ha\"<\nOͽ<l\\Z=\Κ\⇳RnF\A0<\<8X0\\'g<X!=\J<\\Z=~*r=\j<\^]A;#Eǻ\W>x|B<\<B:IZ#=P5\6\<cl25%=L7;ǟ;\=+=\9=$>\=32<y><ݼD=\z/=ڐ<*+\<\Z=\D~<\n<\LB<7[k=\<<T\\׃=n)\=\=8Z!\k=\\<\6\=\"/o\\<','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3163,'61b765e5-ae10-4594-beff-e88be67efe3c',3,'Accounting : By clicking on the above button, accounting module is viewed. Inventory Management : By clicking on the above button, Inventory Management module is accessed. Apart from accessing many different modules, SDC main screen also gives an over view of different time zones of different parts of the world, and also a small calendar which is helpful in many different areas. Now let us go deeper into each of the modules of SDC. 2.2 Front Office. 2.2.1 Overview : The screen shot seen above is from the front office screen. Individual rectangles denote individual rooms of a hotel with their current status being represented by the color of these rectangles. For example, rooms 701 and 702 are out of order therefore they appear in a grey color, and the legend present in the right hand corner represents exactly just that. On the upper right hand corner there are 5 buttons. They are: 2.2.2 Refresh Button: Refreshes the display screen and updates the current house status. 2.2.3 Find Button: Upon entering guest room number in the highlighted textbox the user can press the Find button or press ‘Enter’ to view the room details. 2.2.4 Rates Button: Pressing the Rates Button will display the different rates offered in the hotel . Rates such as CP, MAP, BB can be seen with their individual breakdown of their room rates and meal plan rates. 2.2.5 View Report Button: Clicking on the View Report button, different reports can be seen. Details of different reports are covered in further sections. 2.2.6 Drop Down Menu Functions: Fig 2.2 Buttons Fig 2.3 Room State Fig 2.4 Room Type There are three Drop Down menus present in the front office screens which are highlighted above. The first one gives you the list of different room types present in the hotel such as Single, Double, Suite etc. The second one contains different room states as such Vacant, Out-of-order, Occupied etc. Selecting (Fig 2.5) different combinations of room states and room types and pressing the Find button or enter, the user can view the desired room having the selected states and types. For example in figure 2.2 and 2.3 user wishes to view all the single rooms in a hotel that are vacant. (Fig 2.5) Given below is a screen shot of the result where different room number and their corresponding states are seen. Fig (2.6) 2.2.7 View Room Button: In the above figure if one clicked room number 605 which is highlighted with the blue shade (indicating that the room is occupied), one would also be able to view the details of the room. The Figure is given below. 2.2.8 Reservation. Overview Fig (2.7) The figure above is from the Registration screen of the SDC. There are two types of reservations namely FIT Reservation and Group Reservation, which can be viewed by selecting the respective buttons shown below in figures 2.8 and 2.9. (FIT Reservation button or Group Reservation button). The result of the desired query can be seen',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \nF<-~vMY=tt=\\=\C<hV9=Z&O=x^li2=\`\\n;j͇\$<s 4<\\8<	{»rbb¼\e\a<aY\ZM=\<췽 \Z\<=i+=Cr=\A=F!n\\[\=l|ru\"\<иZF;\0<~+l׼u\0<\={=\P<B\=^7<,	><f\Ѽ\\;]E\;\0*\<\\l\<<jL+=`ۼ\v=v\';˸-\\\\N<}0<<\\\<7AbFq<\\@WJ=x*!v=<^i<\E<ߜ\Z<\ջF(= \':+\̼k<P#:|Bae==M\`n1=,=\\<=Q_c<Σ\=|\<A1\0\\r+0r=/%\Ģ:@;,\<\rG=Z\.\=\q`dN:g\K+u\H=Q\	u&Ė#CҪ<\">\&<\.\Ӹ;\_=o\<_e<~=\#K !\2Jָ\=bﺻ&i(YY=\ּ\=u^&>\_=~\=6\<s;v;=\C=jc=M<b{5=O	;H\	<\\<\(FmkQ\Nm=\\nU=X\<QX=\Nq=Pj\\(ܧ\]꼖Q<іŽ^<q\55Q;-=c7=M\Aj=V^\\r=S\⼳\"=\nA\&Sn/[=:\\\;>1fϼeX\q\;	\"\\ZЩ&=f\\0pp=NZ\弳Opa\\Z\r8.=*=\\Z=\q\\Sيؽ\[Nk\9S\<l<س<\<vݟ<<]\^<*PSu==*<lܽr\'<wdZ\`={7.\"O\|&\=\G[=\\\;<tE\7*q\0\=8[=P.-<\r=Itj^h=\`=\>0&ͽr<.5U\:Y=\<N+<ZŻች\\7 Eļ!\ս\\=\\\:\\d\=ȩ<ܯ\<c;\h=\}X:w=~ZP\Z=Ͳ\r޼ԝ\\1HW\Xz\uC.[o8ҍ;Tsj\&7z:?\\\\8j<;	-\=g=̼󲁳\Tk@\:\}*=fvBc=\\\=OW\\=	-缧\"=.\=*<qrI\Z=7=oW;GDZƼc=c}Tc=1@o<MMK>=[F\=ʉ=\O=(G¼}Y=؆5<bTjt\=PY@=\ަ=I0Ca⎱u=-<Òu\]CBU<!}\.\\%Ǽ[\=\Ql\̼\nw\;\\<\Z\<\\<\<5k=ե{Y<','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3164,'61b765e5-ae10-4594-beff-e88be67efe3c',4,'the Registration screen of the SDC. There are two types of reservations namely FIT Reservation and Group Reservation, which can be viewed by selecting the respective buttons shown below in figures 2.8 and 2.9. (FIT Reservation button or Group Reservation button). The result of the desired query can be seen in the box presented above. Fig (2.8) Fig (2.9) Fig (2.10) By clicking on the In House Guest button (Figure 2.10), the list of in house guests can be viewed. Fig (2.11) One can also perform any search that is based towards the guest’s first name, last name or the reservation ID that is provided at the time of reservation. Any such queries can be typed in the box located right below the reservation buttons shown in Figure 2.12. Fig (2.12) On the upper right hand corner of the Reservation/Registration window, there is a cluster of different buttons that provide access to different functionality to the user. Let us view each of these in detail. 2.2.9 REFRESH Button: The REFRESH button refreshes the view of either FIT reservation list or the Group reservation list or the in house guest list, depending upon which button is clicked, i.e. FIT Reservation Button or the Group Reservation Button or In House Guest Button (Refer to Figure 2.8, 2.9, 2.10). 2.2.10 START Button: By clicking the START Button, one can start making a reservation for either an FIT or a group. The details of how to create a reservation is described in later chapters. 2.2.11 CANCEL Button: By clicking the CANCEL Button, one can cancel a reservation. 2.2.12 GROUP CONTRACTS Button: The GROUP CONTRACTS button gives us access to information pertaining to different group reservation contracts a hotel may have with companies and travel agencies. Without any such contracts, a hotel may not choose to do any business with other companies. A contract includes important figures such as number and types of room, rates and dates at which the contract ends. The details are described in later chapters of how to create a group contract. 2.2.13 UPGRADE Button: The UPGRADE button takes us to the window where a reservation can be upgraded to other options provided by the hotel. 2.2.17 ADD ROOMS Button: The ADD ROOMS button adds more rooms to a reservation. 2.2.15 DEPOSITE Button: During the time of check in, guests may be asked for some deposits which can be entered in a window that is accessed by clicking in on the DEPOSITE button. The details are coming later in the chapters. 2.2.16 TODAY’S ARRIVAL Button: By clicking on the TODAY’S ARRIVAL button, one can view all the reservations that are arriving on the date it is clicked. 2.2.17 CHECK-IN Button: The CHECK-IN button takes us to the window where a guest that has a reservation and who is arriving today can be checked in. There are other information that is gathered from the guest at the time of check in which needs to be entered into the software. The guest check',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \noBv)+\W=\=G\= =[\H!̭K=ͯNu\<I$m\\<@!;7=\ok{?<\Lt<\}=Ͱ<R\X!MO\tYeJ=:=,=:@>u5=L̽\5Vv	GC]VFlè<\\"\;D\Z==5%=t^;\k\;=/\r>ur@\Ȼ:Q=Tm<\"=\JkN~\2.=c\o=lA.*Q==ZN\F+t\\\\=.	<w\=\\0<\}&\(\<n=w\\d;2%=Mc<-\'<\`6^\\\\\lt=MJ\$Ƽ=\\<\\?\pO=Ib=e\\n=-ϼJV\=!\,=}/Ey\\1\=\1/u:8\r\ݽ=<\rּc =&o,h4=i`	=\}r<\YE	Y\`5gkY;\n6\G\z\n9WZ\;\bȼ=l^\A=t+<\\n5y=\g%\ջ;\\k\=pyD=K=[&=(\<h=O<=/H=\\<\\E=lp{<\ͼ2rἴL;\\b\g=M\<}a=d\m\ܼ\x1=x\=\l\\<:%\'J==ZG<\o;\s\<H2=MZ[]\ȟ\b\n*=}\4>1=vspH?<P%t\f\";fk\'\\<H\Ͻ3\\=|(Ys<#\q=Q\nT`\mt44<K\\M=\<a1c\1=H9KlM\r=t$\\"T\<\\=L\B=KH1ꉷ\9=\y۹\\\<\0o=<7\0c<p\켷\n\\\P=4;N!H<>ae=ɝ;>{=W4\=k\Q<\\</=*si=\-=@\Z\ֵ;<M\dNJ=H=(ּ\oGo<x̽ ĺ=<\Ar\w\n;K\\z=F=\p|ЃA=\V<ùu\L8?d<ċ\oYi=\L=t?\D=\a<¼\\<\=1;mUAu<ٝ\\Լ\|\<\8X\\:=&\0=\o(<㺣D?=\8\'=K̼8<\\=\=%F!=Ӫ;u\>\<_\\\<\cg(;{n/\mvY*p;\JR\V=鲪_\\\=ěJ\=\Ź<v=Ac:Oj\j=\\=K;D;ʼ\\\ܼ\\\<,;&/\Z=\{<\r><m=\ ==7=>\\]\0\\=`\\\=p\;<\\l=aHy=NX=E7=s&\<~K	aP|׽\\}<\\S	=q۹\=f!<HgĻ@=\֟w<','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3165,'61b765e5-ae10-4594-beff-e88be67efe3c',5,'CHECK-IN button takes us to the window where a guest that has a reservation and who is arriving today can be checked in. There are other information that is gathered from the guest at the time of check in which needs to be entered into the software. The guest check in process is described in detail in later chapters. 2.2.18 VIEW DETAILS Button: The VIEW DETAILS button shows details such as guest details pertaining to either FIT reservation or Group reservation. When the in house guest list is viewed by clicking the In House Guest button (Figure 2.10), the details of each guest can be viewed by clicking the respective guest and after that then VIEW DETAILS Button. 2.2.19 EDIT Button: The EDIT button takes us to the window from where reservation details are edited. This feature, together with many other features is password protected so that only the person with the authorized privilege can make such changes. 2.2.20 ARRIVAL/DEPARTURE Button: The ARRIVAL/DEPARTURE button leads us to a command centre from where we are view the arrival and departure records. These records can be viewed according to their dates. Below is an example of such logs. 2.3 Point of Sale The point of sale (POS) of the SDC is concerned with the day to day activities of a particular restaurant and billing. The POS handles operations like ordering, notifying the kitchen, settling a table or posting the charge to the room of the in guest. Below is a screen shot of the POS main. The main screen of the POS represents the exact floor plan of the restaurant with its table numbers and other details regarding the location of its exits and bars. When trying to access the POS from the main screen of SDC, a prompt is generated asking which restaurant is to be entered. Upon selecting the desired restaurant its corresponding floor plan is fetched and shown on the screen. The main screen provides some valuable information such as which tables are occupied or vacant or which tables are departing making it easier for servers and managers alike to be better prepared for their service. The POS and all of its functions are described in detail in the further sections on POS Functions. 2.4 House Keeping. The house keeping module in the SDC is designed so that the house keeping department of a hotel is fully notified at all times, the different statuses a room may have during any particular time of day so that everyone working in and around is kept notified. Below is a screen shot of the house keeping module. Shown above is a listing of different rooms and their respective status. Just looking at the above screen the house keeping department is made aware of how many rooms are checking out, how many rooms are occupied and dirty and so on so that as soon as the rooms become available they are cleaned and made ready for future guests. Rooms of different categories can',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\0\<p\<!@&<}|=\\==O\z\<\_=\\u<P\;\\<\n\"\μ\Ƚ\\\r=HO=rM=|hm==䢼]p\\Z;\h:\W=\\ö==G\&S`ꋼ\0h\;R><ws\<Fa\<\=\>\'v{\\sn\=\f\<g|=SVM=\*wS֩=<\'qtnkJB=EK;\?+:=%Km\,ݼ\5=!\\T\\t=0W>\nc,\H\<\,}=\-~ͫ7\\n=\晽q\]<n<\\<<\<j\<\\c\\\;=<\\\μ\~޼n\<;8<-.1aL==*>=N̳<B=\|7=K	\	>O<\<5\ͼF}{@*=bA=U\\<\N<\f=\u=\s=O`-=F;Ҽ\`q쳽?)t==	\U*\\rRmSx@p_=2<V2\\nü:p;\\<=\۽/=삽\\<ZV=ݺ\n\\=r˶;ќ<ސ(=\\U\;R\=\0Ү;\Y=\*=1	=\ȅ<\'\e;ͼ\B\\\\<b<4V\>\\_<6Ѫ\\69l̉YE}4\PT\\\"\=跕<h\<ˡ!=\=mwL͏<6\]I\>yȫ<@>\0u\"=\_݈<\\pU/Hk\?{kVQ\=;#l,<($+<1<w\8\w\</=\;{#=Fg=Ǖ[= /A\u<<9&}\'z`<\nἯ|@gh2	<\\\E[=\.<\"م=\a\\\=z\;d\n\ʽ?\߱<ɼ\ګ\\r\8\\ʽMw_ \<oxȐV=U?=ѻO=d_<X=\(<5\<=\"=\L={ͼB\_<tcŒ=]L=ۦ=\U=n%{5=j6f=\\\n=\.7.\=L\<:=nÇˇ=h\gP\\;+\=\\_=k<%)\\=[\\\y=\:=ާ1znC(=\===\p=\	)\<ۈ;\{=#\\=Z\m\s:V\.;)\<\^h\xj\TR$<虛%\|;2%Lz)<\½T;S=\\<aQ=L\zƙ:l;\<\r,<;w<?=(\\̽\&=a֢=\'5Z\\\ީj2\<*2ݻ\r^=\cK<2\y<Z\5=\n9h2@= S=\=_LJ=\=\<F=$=\\\;\f=\	=\\=n<k\f\\\=as	<6\ܻ5)^༫P,ygP=7C(==x鷽\'e>A$):`<\س=$(','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3166,'61b765e5-ae10-4594-beff-e88be67efe3c',6,'the above screen the house keeping department is made aware of how many rooms are checking out, how many rooms are occupied and dirty and so on so that as soon as the rooms become available they are cleaned and made ready for future guests. Rooms of different categories can be searched by clicking on the respective buttons and clicking the ‘Find’ button. The complete function of house keeping is explained in the House keeping function section. Functions The numerous functions available in SDC enable one to better understand how a hotel operates on a day to day basis. From tracking guest folio, to viewing extra charges occurred during the guest’s stay, SDC provides the simplest of interfaces to carry out all the operations of a hotel in a very convenient and efficient manner. SDC also supports the flexibility of posting the charges from a restaurant to the guest’s room. Hence the operation capabilities of SDC expand into integrating different departmental functions of a hotel so that various tasks can be accomplished quicker. Let us look deeper into these different functionalities. 3.1 Front Office Funtions. 3.1.1 Guest Check In. Front Office is a place where the guests interact with the hotel formally for the first time, therefore it is very important for anyone working in the front office to be prepared with all the necessary details one might need during check in. On clicking the ‘Today’s Arrival’ button shown in the figure below, the user is able to view all the reservation details of all the guests or groups arriving today depending upon the selected reservation view. (FIT or Group) The procedure of checking in guests belonging to FIT or Group reservation is slightly different with one another. Let us go deeper into each of the following. 3.1.1.1 FIT Check In. As mentioned above, the list of reservations that are arriving today can be viewed by selecting the FIT reservation and clicking the Today’s Arrival button on the top. The reservation system searches for all the reservations that are arriving today and gives the result as shown below. The figure above shows two reservations that are currently scheduled to arrive today. By clicking on the individual listings we can view the details on the right side of the screen. We can see that for reservation 19, the assigned room number is shown as 0 and for reservation 20 the room number is shown as 602. This means that for the reservations having their room number as 0, individual room(s) will be selected at the time of check in and for the reservation with a room number other than 0, 602 in this case, a separate room is kept reserved. This is usually the case if the reservation is for a VIP guest. The above figure shows the details of the selected reservation whose arrival date is today. To check in guests, click the button ‘Check-In’ which is shown below. If the arrival date in the selected reservation matches with today’s',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n5\W<\v,@N\<\=߾\'=\"=j3\\<|<yY <U\\;*+4ƹ\r=]\	z=ܔh=s`tcp:<z:e&<Լ	&\0L(Ͻkj=@\=~=,6G<G3W\%<\'\<m<e\|\,F<wLe=c\ \\"|\;I=ʝ=sZW=\%k=\^<=\-=L܋Y\fZ\B;=4=\<Yd.:]>F=\"\=\\Zd )=|`i<\ʷf\\<3ح^my31=s\<Qc=K\γ=\'\0@;R\<c7:ûŨ=R\'=\\n\=W\\z$ɜa<Ë=j <\\\<-\<7Q=A;C..>\<\]\;4Ioc=;=.@\(!OP_O=-\\=lRy?=\\ȺF#=\Qt\<\阽M\\=\\	퀼[n<\ =2<0:=\Ԑ=]=tnZV)=\c\8\y`=Y\0Y<\W<\w=L<\H\,=\?6F=a\\<h=*d<x=\=d<JZ<\<G\:\<=$OV-=\{O\\Wa<M\,˽Gԙ<W`Y<.=I\Z<J<\\=ϼ\\\=ZNf\!&=?f;jP9r=7Qɽ{%e=\a;^\n\,=ؐ\p<:c\G;=g\WN\.rA<\"sMsO0\r=@`QUߪ\"@A\}\<E\<y)<em7qh=\}Il5=zQ{ꪭ=\Z\&==\\R<C^0\\9`i\\=y^9ݽ\\Dm\^M\Q<q0a=\j4D\0>\h=ڨf\\\!\"=\;剎<6<GOWp\Խ\y9M=\9===wxD=\b\\*=\0!=|\\0$b?=F@/\z<nŽ9\<gURuU\υ\4r\\>=OW<R\\:z\"=\0M=<\;<$\s=\\=FX\Z\Q=\\4\~g=p=\fO_KaE\r<\<v:^O\\\d;L\z\_<\;ﱼT\~\Ҽ#\BiLV\C;t@<LI\}?,= r_U=򿌼qhZ2\H<!<=ev\drO\B.!<7=\0\0;3\\r=\'+=\=:M\\ȽS=i=<|<Dkv.m.p=C׼v\ =%<e<ScĻ.=&QK=]6=$>9=l\\<\m;6_=ߞ\=3 =Å_=Q\=s\"\&\qӽ?\;	˼\S<\r<bs<+c\5&w=}fs<H|=,%$=ð=5\\\r=\Ze\i<','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3167,'61b765e5-ae10-4594-beff-e88be67efe3c',7,'is usually the case if the reservation is for a VIP guest. The above figure shows the details of the selected reservation whose arrival date is today. To check in guests, click the button ‘Check-In’ which is shown below. If the arrival date in the selected reservation matches with today’s date only then a check-in window is presented to the user. The figure below shows the window from where we can check in the guests. The figure above shows the terminal from where guests are checked into their rooms. As mentioned before if the room hasn’t been selected during the process of saving the reservation, then 0 appears as the selected room number and the system will ask the user to select a room first before entering any guest information. The system searches for available rooms based on the room type which was requested at the time of reservation and presents the options in the right hand corner of the screen. The figure above shows the interface from where a room is selected by just clicking the room number. (Note: Guest check-in is only possible after a room as has been assigned). When a room number is selected, a prompt is presented to make sure that the user intended to select that particular room. After pressing ‘Ok’, the selected room appears in Red as shown below. Now we are ready to enter guest information into the system so that the check in procedure can be completed and keys can be issued to the guest. The figure shown above is the terminal from where we enter all the guest information during the process of check-in. The entered information of the guest is saved by the system and it can be retrieved again in the future if the same guest decides to pay another visit. This type of guest tracking technology is found across all different PMS’s around the world and is one of the most helpful tool with which a hotel can understand more about its relationship with its guests. Let’s move in deeper into the details of the final stage of guest check in. Upon clicking the ‘Check-In’ button the above terminal is seen. The ‘Enter Guest Information’ box is already filled by the system since the guest information was already saved during the creation of the reservation. To save the information, just click ‘Add Guest’. The system only lets the user check in a specified number of guests, which was entered at the time of saving the reservation hence it keeps count of the number of guests entered. If the number of guests entered equals to the number of guests specified, a prompt is generated to let the user know that the guest assignment has been completed and that the FIT check in process is complete. 3.1.1.2 Group Check In. Group check in is quite similar to FIT check in with minor difference. Below is a screen shot of the group check in module which can be accessed by',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\j\=\<ȚibCI=)=L=T\=ݣy\\=Z\<T\<)6ɼ\E<\<=%ؼ|ӽI/=ME=\\<\dH<`	\@߼2<<1莽G=<6=)kMX\\=W=\S:=t=ޏ\H\AAǜ\ȺE$厽UY|\1;\=\r\0K\<\s֊=C<;V=r<\<\ƦU\=1e	usƼrмD\!\\nh\'\x<p\ag=~콫͞=\;#\\r\_o:\\DTP\.g+=0πp)!Q\'ʬ+\h;x\<\y=\\;P@\)&$=\U\yt4O=ę#=wR6=?a\=\\_\<\=\\=\:K.T=\<M6\\=\r\<$&:=JKV\r<\;\	>\;\a\!=yr=\=:Y<>4!=Kcw<=_Un\D\bq=ռ\	ʉ:\$kb	<\lv\<L-<s\r)t\;<N3\\\=u\R6r\\=Z<\>5\=\=8=h=Sļ_<&<=_%=o\j:T=:>Hǆ#%m\"\3F==x=\\R\'<\Z\|ņ7\\n<\\XV<	Wf\<\r=\\=\\\\j=`9c<bۃ\`\<\w+<eyƼq$\$=\\\ٗᄕ\"RX\"f7L=\̤\ғ<	\<Fw<\(\^ζ\\=k-NPq=]I\*<an<\b<yviMP\<W7-=\I\<\'2=%=?Aѥ=t\9\j\Nac^\]ma_*v\0=\=H~;\==-V=V;(\\Z=M\<\N#=z\uj̼\\U;9֎=b=t>\(8ػ\;=\W\=\!\y==\b\\=L,X<4\\ڌ<\ʓ\j=\=eC=e{;22\<\'ֻ/:Fm2<\=Z;_\0H|>G=V+dýM=\;w\˽\\8==Ϝ=Q$;?/%y.ʀS=Y\0/y<\Zz<=*PK^>6\\0{<\\\~5%b\\<\Z{\\f<O5\nFY9\EӼ﫼:VT\D⽬K\"A|/C\Z̼8\<\\E=\U%;\\ǻ<tP2\A<\\0<|v<4ߚ\=}b=tOy<#U\ZYB\e=tX_;4<T0=cT*ui=a|<BC<i`=V!=9;o\Z\A<\0=!\"\=O\Λ<\lڌn߼?d\<=\Ѽ=<S{VqG\8=\<\\ <b^>Tih=P\qA>\GE{\%;HV=h]','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3168,'61b765e5-ae10-4594-beff-e88be67efe3c',8,'know that the guest assignment has been completed and that the FIT check in process is complete. 3.1.1.2 Group Check In. Group check in is quite similar to FIT check in with minor difference. Below is a screen shot of the group check in module which can be accessed by clicking on ‘Group Reservations’ and selecting a group that is arriving today or simply by clicking the ‘Today’s Arrival’ button and clicking the ‘Check-In’ button. The first step in checking in a group is entering the individual guest information into the system and selecting a room for the guest to stay in. Group reservations are handled by the sales department of a hotel and therefore a list of rooms, their type and their rates are negotiated within a formal written contract between the travels agencies and the hotel. Each contract has a start date and a cut off date, total number of rooms, their respective types and their rates. The hotel sets aside specific rooms that fall under the categories requested in the contract known as ‘Blocks’ and only the rooms that belong to a certain block which are assigned to the guests during check in. Hence the system only allows the user to assign the rooms that fall under a particular block making it easy for the front office staff to handle the check in process. Upon selecting any room the box appears in red and at this point guest information is entered into the respective fields. If the guest is a group leader, ‘Assign as Group Leader’ should be checked and ‘Add Guest’ button should be clicked. Upon doing so a prompt is generated to make sure that the guest was intended to be appointed as group leader. After pressing ‘Ok’, the guest information is saved and the information of the next guest is to be entered after selecting a room. If more than one guest is to be entered into a room then the respective room number has to be selected from the drop down box presented below and entering the guest information, ‘Add Guest’ button has to be clicked. When total number of entered guests equals the total number of guests specified in the group, the system generates a prompt notifying the user that the guest check in process is complete and requests to check in the guests into their specific rooms. After the user clicks ‘Yes’ the check in process is complete. 3.1.2 Guest Check Out The figure above shows the status of different rooms and with that we see there are 4 rooms which are due to check- out. We can also see that of the 4 rooms 3 belong to a group and one belongs to FIT. There are numerous differences between the two types of check out procedures hence they are addressed as follows. 3.1.2.1 FIT Check Out The hotel personnel working at the front office should be well aware of the room that are due out therefore they stay prepared for',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n&=9=\hWi=\<ia<	=hյ== /=j$0NPB<\@*<ǿ\<:m\W@<o%<#<w!Q\Hzr\+<y<K0@\np\L\:%\0>Lm=\!k=\{/==$\FᩴHįߍa\=x\	=e\;\r;\<؃\\=\b=\\n=\fO=\nє<?=ĵ+PZ\<\5\<nE\kQ\\<d<\\\`\\\\;Y0 \<c;%H3<=\=\'=vZ\\\A<o\=`۽{N;ϼz\{)\ɻ`a%\0^\=L©\\\L<u\=Y}=B<=\nպ\Ǽⰲ=\ZB<9ى0=\\=!=\0\<=X=B)$l<#崃o\\0>!h<n<Ɋ\rc\<\>O;&\.=\=>==O=\R<R\A=h\3į;lS<\=	14&I)\0<OU=\Q#\\4n=\A<m=b|=\]=A>x<;\\<k\=I\;D<%&<8\ּlQ=\Z=\=r=-\an =k\'/+<^<G-s=s\ָ\;=[I%=\\'R+=\-0L\'X\Zw>;\7\=\\D(=\\<4\=]C	\<,\~\'	<5G`</A<ށ<QEf=\\<1O<UX\<&Q\\9\y8\=\r\ܖ5==8vI=Ar>#<n\<=\@`J\'LL<r<y&\s\\7=S\һע\Z}@v,Ҽ[=FO=h>\n\J<j<dS\0\Ǫ^\=\\ܼ?\\h\=\K\Z=)ǽ2\n:f=Bǝё,F\ =b\qx\<`\=YK;Fa=CNK_(G=\\C;a=FBR\H߼\/5=S\;vY\\ϽI=T\=@\;\>,n2x=Rݑ=\\\\xy\O0=<z=qq\z<RCo\NT<I^;KF=g4\(=Z̒=\.3i}x=\K=%ЂXfʀ<óEQ\=\h=>^\\0<\S\<\I<\ďy<\!\H\	\\5];lR<~j\9<\-<S\\\0<0X$^cT<tP\\zVyR/\A\ZF=J؆\i;r<UWL=K=5\<5	<\r\\<8=N*!\<y\0X<Kzq$T-<Y\\=.dM:uE=\<\Z\<\k=*&= \<\ <<<!&=9\cH\)=/\i=G\+=PӼC4\\⫻a]74\ҟUB+z].\<ft=m\\eN=H<\>b\ü.\oN=\','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3169,'61b765e5-ae10-4594-beff-e88be67efe3c',9,'one belongs to FIT. There are numerous differences between the two types of check out procedures hence they are addressed as follows. 3.1.2.1 FIT Check Out The hotel personnel working at the front office should be well aware of the room that are due out therefore they stay prepared for any guests who arrive at the desk to check out of the hotel. Upon confirming the room from the guest click on the particular room on the front office panel to access the detailed view of the reservation. Upon entering the detailed view click ‘Open’ in the financial information tab and click ‘Settlement’ to access the settlement window. Upon accessing the settlement window, the entire folio history will be available on the screen together with the charged rate, the total service charge and VAT shown in the figure below. On the right hand corner of the screen the reservation details can be seen such as the check in date and the check out date and most importantly the payment method highlighted in bold. If the payment method is cash then the ‘Cash’ should be selected in the ‘Payment Method’ box shown below. Since cash could be received in any currency that too should be documented by entering the right curreny in the next box together with the amount and press ‘Enter’. If the entered amount is less than the required amount then the system will generate a message prompting the user to enter more amount. If the amount entered is more than the required amount then the system will highlight the change that must be given back in NC. When all the monetary transactions are complete click the ‘Accept’ button. Upon clicking the button a prompt is generated to confirm the check out of the guest from the hotel. Upon clicking ‘Yes’ the FIT is checked out of the system. Then the house keeping department is notified about the departure by changing the room status to ‘Vacant – Dirty’. 3.1.2.2 Group Check Out The screen above shows 3 rooms that are checking out and that all the three rooms belong to the same group. The method to access the check out screen is the same as FIT (by clicking ‘Open’ and then ‘Settlement’) but the screen can only be accessed through the group leader’s room which is highlighted in white (room 402). Below is the screen shot of the settlement window for group check out. The rates that are charged is automatically picked by the system which was chosen at the time of reservation. On the top right hand corner we can see the list of extra charges that needs to be settled before the check out procedure can be taken forward. The extra charges if present, can be settled is a very easy manner. Since the charges are posted in individuals of the group, they are the ones responsible for paying their extra charges. Therefore each of the rooms need to be selected from the ‘Select Room’ box and',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n<>۩=\Z6ܽH׮\\<ƾ==|=\$=\>=\<Kİ=\(\\0=#W;n\\s7\66<u\=\\T`ݼkSٝ>=\\߮2<O=\\\)G\I=\\=x\<\\\$8	`\UD?A\0@H;g\\q=\)=\&;捘<x2=\r8\=@\<*5<\a#;\k=fܤ8=\nE=1\<NH\\V\O\r)$<dH\Zޫ<+<d\\\<S<\}!#k\mڽ>-;\ʼ\@<Q\\"\i**=\\<\J<\\н\<S=i)В\n=E5=M7F8ၽ\\\=DQ=*\\\Q\=\Zmm=\><\\=ֹ=!d;6\%=r\<*\\%s=Ӈ=؊=\h򡇽F=֠=D\3bG+= =3=\昼\=\\<m	`;aw&\<l=<\	m\ڼ\'ۂ\Qm\"\~q=T`\Q=C=.ʣ=ZVK;Y:)/|;9YpI=\4=׹<oK=\2<4\r\r=ۏ\<f$~=aw=&=Fj=h\\߼Oգ=\G\y<0<m\\< Ȁ<\2=+\ݼ\L@3*9<X\3=\\ıLPm=`2ռ[=\Ϋ=\50l\ȹk<J[v\<h!<\\=;\\	\6 [Ƚ߷d=NZ^C^=TRp=Is\=j=Z\v<w\<)\s<%q\\ؼɽn\^=\'\e\=SeJ0\=,\\"=\oku\n$=\\\n;̅=\\s\ٛ<6Lj%MQ=L^;̮V^=\H\<+\Ｏ6<\fkd:D:\<\n@<\U\Nc=\z<<\h$<1<J\P=`\=v\I\	=\\]Z?Vy=uȼѽ\O&=nC=X=ϣ:\"\<;\"k=[Ubv\w߻𼲊<\@/vA-<\b\"<e<R>~+=^\_t\)ռ\\\\<;j7=\n\e<B\;%f=/\<\\\\x۽K=\sK=\'<a=ｕ\b\\\}<~\\na\꼾Uј&ab\\b2C\K<U\<\|pNq;\o=$;=&۽x	uC=^3+\\;\\˽\'\?\<\\\<_=\$<\6\½\I\:\\s\nջbe\N$>9<V<F<\0\=b\:@6\<ۏ=\\<@\a=TS\=MS;ʽә`1P\<\\\0=ՉG[c{Zm֘̽K\\R#\X=\<ʻV&5\"\<\&==X=2ٻ\B=;','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3170,'61b765e5-ae10-4594-beff-e88be67efe3c',10,'taken forward. The extra charges if present, can be settled is a very easy manner. Since the charges are posted in individuals of the group, they are the ones responsible for paying their extra charges. Therefore each of the rooms need to be selected from the ‘Select Room’ box and their individual bills need to be settled. After entering the payment method and the amount press ‘Enter’ to save the information. If there is another room with an extra charge posted to it then it can also be selected from the ‘Select Room’ box following the same procedure of settlement explained above. When the required amount has been entered and also all the extra charges have been settled click ‘Settle Bill’. A prompt is generated to confirm the action. After clicking ‘Yes’ the bills are settled and now the check out procedure can be initiated. To go ahead with the check out procedure the billing instruction needs to be checked. If the billing instruction says ‘Bill to Travel Agent’ then ‘TA Voucher’ should be selected as the Payment Method. If ‘Payment at Check Out’ is the billing instruction then the amount, currency and mode (cash/credit card) needs to be entered. When the parameters entered are accepted by the system click ‘Check-Out Group’ button. Upon clicking ‘Yes’ at the prompt the group is successfully checked out of the system and out of the hotel. 3.2 Point of Sale Functions 3.2.1 Start a Table The figure above is a screen shot of the main screen of the POS. The numbers on each of the green buttons represent a table number and the color represents its present state. To start a table one must click on the respective table where the current state is vacant. Upon clicking any of the vacant tables a prompt is generated for the server/manager password. After entering the passwords the system asks for the total number of guests being served on that table. Upon entering the required information and pressing ‘Ok’, the ordering panel becomes available from where we can select the items that were ordered by the guest. After the ordering is complete the kitchen is to be notified hence the ‘Send’ button needs to be clicked for the order to be sent to the kitchen. Below is a screen shot of the ordering panel. When the ‘Send’ button is clicked, a printer placed in the kitchen prints the KOT’s together with all the information such as the table number, ordering server, order time and order details in that KOT. The table status also changes from vacant to occupied. 3.2.2 Add more items to an existing Table To add more items to an existing table just click on the respective table to open it. When the ordering screen is screen after entering the right server password, select the items being ordered just as before by clicking their names on the screen and when you’re done click ‘Send’ for the kitchen to be notified. 3.2.3 Settle a Table',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\\k<7\=\xz_<\0Q\\=\¼QQ=^(=\n|=) \Zz<\"rf =Ľ\2\.l=~JQ@l\\(t(#λ\$9;[H7<4\"+=\\=\Zd\<\o\\==\\\;\Gkkl\]<\'͌!\;\n\y\y=t[<\\\hp=ˊ0\}=\f=\8\$<Q\?=ӑI+;\=/Y:Q0꽼^L[<J,\0=E+\L=\5\:8\n=U<WPE1\<E>=<sȏ=9\=r\\Zp9\=t\\\<\,֫5	<`=t\\t\\;c\=\=);Ī=\n\9{lnDܖ=\0\:1F=o\<e@ټ^/D\=O\nNt\=\\;8=\$T>T Ld?=\Iz\=zK\<ؗc<=9q$F=s%=~\d*//=\"G=]\,=\˛	\o|\rlY=\C\n\d߼\\U=\\U\Z=\4OJٽ\5=\})\9R\r\C=C=3\;*˻p==N\=<\I<t\\<jX;=q<Q<x=ۯN\\=\\\<\d;q\W=<\r1\O.Ǽ\w\<(\7r/H=\x91Ȑ=\\=KPR<eԽd\~\\n\fý\\G3;0\^~\;\\eU:ONF\:qf\1\'A=E؅\)R=+>\h=\쨼Ȅz=^B+<M\n=yR5jb=ZZK@T:=;=)=:<c\ pT\\eW]\\@\=sWQ\<b=+Z^;Ө?`<0=\\\\!\=\=3<oF=\]\'=j\Z~=L׼\<;ǮZ==Eo4=\'輿;?\<C=/KH=y2<e@\\\Z=\'\r=\Y=Kýd=_~<\ZNc=\N\=!x=@ɼ\!\Oj=\\#;\zɽ#FлTJWEѕ\\E̼6g鼍\!\u<\?Cd	>a=Bͼ;;<mR\3P#=ڄ1:،=Y|;T\{\=\\C=B\y]}A=0\r6\\=\f=3˫C\ͼ]Ƽ)<\\=Br\;!\:\nj<-=[ⒽBϻ\Ծ=\(]*\I%\\C\0==\׽ \=[\E;\<<\ZM<㠽G\y]<\L5()3_!<P\	<\+K\}\<\nv<^e0\=Ud<]\`	Y3=K:]\\}OA&=\F<)>=n\<=[¢+\Kg5<zzѽiP\K%\ѻ\]=\1f=P3Q-\<\&<o==\"<Ml\;̫\0<\\','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3171,'61b765e5-ae10-4594-beff-e88be67efe3c',11,'on the respective table to open it. When the ordering screen is screen after entering the right server password, select the items being ordered just as before by clicking their names on the screen and when you’re done click ‘Send’ for the kitchen to be notified. 3.2.3 Settle a Table Open the table which needs to be settled and click ‘Settlement’. Below is the screen shot of the settlement window. A guest may desire to settle a bill in numerous ways such as cash, credit card or post it to the room. After selecting the appropriate payment mode, the amount is to be entered using the keyboard or the key pad provided in the panel. When the correct amount is entered the ‘Amount Tended’ button is to be clicked which will calculate the change that needs to be handed to the customer. To end the table click ‘Accept’. When the ‘Accept’ button is clicked the system makes sure that the entered amount has covered the amount due and only then closes the table and saves all the necessary data for accounting purposes or for any other future reference. 3.2.4 Split a bill Splitting a bill is one of the most important features in a POS that is used for a variety of functions making its application quite handy at times. A bill can be spliced for a minimum of 2 ways and a maximum of the number of items in the bill. For example an order that contains 5 items can only be split 5 ways. To split any order, open the table and click ‘Split’ after which the figure above can be seen. Then click on the individual item that needs to be spliced. When selected, the item appears on the left hand side of the screen. If ‘Split’ button is clicked at this point then the system will split the bill two ways with the selected ‘Red label 30’ appearing as Check 2. Below is a screen shot of splitting the bill in the manner mentioned above. When the bill has been spliced as per the need, ‘Done’ button needs to be clicked which closes the split window and takes us back to the ordering screen but now with an option of selecting which check/bill we want to view shown in figure below on the right. By selecting either Check 1 or Check 2 we can settle them individually as if they were separate tables. The un-splitting of the bill can also be performed at any time by clicking on the ‘Un-Split’ button presented above in the figure on the left. 3.2.5 Add modifications How the food is ordered by the guest might not always be the same even if the same entrée is ordered as different people prefer different way of enjoying their meals and as a hotel/restaurant guests have every right to demand things the way they prefer. Adding modifications as such means informing the kitchen regarding any special requests made by the guest so that',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\\x[=\"rtѼ\\Ľ/M<=p\;HMq=\\={\<!x^uj\"\<m=\\\)\u: =N\<\;$ߔ6=\\<U\n`<N\]:G8=\=\m)$\gSܻ۶߼9\0ۛ<s\/\K<(i\0=?\;&==4:u0=\r*<\´\=\?8f)=\\>:<\d*F\41]=\"\\:p,=Ђ\;]<\䎼:x-=\rN: >oqǽ鐼-QS<&\"<\?<\v4<a=\L;	e\n?h\wi=\?h*\=\n\=	\"=j=a89\;k\\=^=3=O=|<=\ʼ=\^@=wy!_f=\	ݍgX\<6=\-{ע&~=\~ȼ\;\\\=ahH<+Kx=kА;\=g,\<\'!Q*뮽5<`]M\=Pl<x?=7A7\t=]<=ZM@=\q;BK⑽\˻H=?\V=[$P\r>7I=\\=,$=])}<=s<q=X&\C9<\ټ3\<kq\"\U=ĭmʍ\':缇w<<tҽ\K=\[F73s=\6=p=\ra\\\0<\1X}嵽\l?<kvRo󦽲J\rߋ<\#=9\n84=#Rͼ#=\0J\˽ī===\ⒼA\nҼ\n=V	Ua=.\<.h\<!g\2=cl;H=\Z\,<\Z<HC<>7=Q\;љ\n>c\"yDm=1~b\ļ\g<=\\\$mF=8\=)\½i=K\"#@n0˻\/9=\=\nZ<>XK=5<~=*/;kn<\\P\sK\0\=ռu\dZ=\nE=	hUR=j=\v-\=yd<\l9h=:H;i|f;\Oȼ\e/<O;:>{<\\u\n?\=-=x\<\]LYe轉2=\\=\=Y;%<v	=mH6\\<0\n<t뽠=I	>ռ_>i<iX|_^ý\ƼnML=\<7QYtM=PK&\=8.Ű6\Hq<[޽Xl<5=TUT=ryQdjĪE㚽\\ټ\H\<Le\<Zgڼ\=[CjP9;\n=6\2=\\\=b^\\+<\\'\<NE\k;=\;ӭ߼4s\<,=&+P<5H><3@\3<Id=`u<\\\y<m/ϻ\=\Z\r=_=\5=h\g؜H\?L\\<\Z^\;\@^\\ؼq\<\e=\=z=\\\\s\=;\P=\\\w=<\;Zz<\<)\0+T\\','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3172,'61b765e5-ae10-4594-beff-e88be67efe3c',12,'even if the same entrée is ordered as different people prefer different way of enjoying their meals and as a hotel/restaurant guests have every right to demand things the way they prefer. Adding modifications as such means informing the kitchen regarding any special requests made by the guest so that there are no complications later when the food is delivered to the guest. To access the modification screen the ‘Modification’ button needs to be clicked and the modification can be entered only after the menu item has been selected. Below is a screen shot of the modification window. Any modification can be sent to the kitchen by typing in the requirements either by keyboard or from the screen itself. When the modification is typed, click ‘Done’. This will take us now to the ordering screen where the modification appears in the box presented below. Upon clicking the ‘Send’ button the new order will be sent to the kitchen with the specified instruction. 3.2.6 Void Items Items need to be voided at times for numerous reasons such as for a mistake that the server committed while ordering the wrong item or at other times the guest didn’t necessarily like the food hence he/she decides to change their mind and order some thing else. Therefore to address these issues and many more the system provides for a way to void items. However voiding items as such is not a very good practice as it might create problems with the tax officials during auditing if done frequently. Therefore it is encouraged that the users be alert and calm while entering the order and double check it before sending it over to the kitchen. To void any item select the item from the ordering screen and click ‘Void’. Voiding credentials are only provided to the manager hence a manager password is required to enter the voiding screen. When the correct manager password is entered, the screen below will be seen. Before voiding any item a reason has to be selected. This information will later show up in the managers report so that a close eye can be kept regarding the use of this option. When the reason is selected, ‘Void’ button needs to be clicked which voids the selected item and takes us back to the ordering screen with the revised order list. 3.2.7 Room Post Room Post pertains to posting the restaurant bill into the guest folio so that the guest can pay all the bills at the time of check out. A guest may also be entitled to a meal as per the meal plan purchased hence the server/managers need to be aware of how the bill is to be settled. To complete a Room Post click on ‘Settlement’ and in the settlement window click ‘Room Post’. Below is the screen shot of the room post window. Before posting anything to the room the server/manager should ask the guest his/her room number. The room number is to be cross referenced by entering',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\rL\<p\=Pe<;U=\\_\<E<\I^$\<h-=\4\<\\\\Wׅݫ<@kE\=!;\`Z\K୘<V֨;g\\<\ MlL(4\;=+O<><=}\<\\< c.Z^H-as+w\<8*.$Yȵ\}jWiwK_-\\Ry\ \cҼ=a\q<\\RMQ#k_=|{=\n3;,8:>(8]=~<1ݻq<\=6<\\.=\MWTPfS<9\RBZ\CR<_*\|p=7VK໭Ol<eN\yȠ\</]|=\C=\\\<F*p:[jn?K=]6<]\\}&5+p</=<g\L=o<+=ꉘ=\/(|=P\輑׻\k1\=<w\ݽ\\\\Z#\}=v\n<=P`=D/\=\x\Q\=!\n9sO\jd8=ޒ<\;>h -KH콻	YC5=f\A=\4\63=	bO<f=v\=Ur(=\<ż@!q9\\1</_<+s@=\ք\=l;\qV\r=\"z_ K<<\5>\"U</&B<s̶\'pH\Zj=\Ζ`K=<=\J:A<\\l<c=&\g=\W8=!\g8;	O\\<\:\0=$[=~m=¼\9zwn<n\<\?+<z\\Y=v\;X<\E=Ȕ6;h	\eǼ\\<@x\\'\\<\9;\Z;=\\\#\'\v˼/=k=8<M:\;ޑ;2Rj=cTm=@=*\3ϋR+\Lr<\(=gB&ǽy\\<f#\h\ф<\4<ࡽ@wD\=M7\<M\0v^b;4\=\{=t\'Z\\;CM=_\=\x;:oѽT\¡Gh\Z%`==\'B\<%=F[>H=S\<\J̻=S\= <\0ʼ\衽Ǵ<_T=!&Ċ<[\96%p(=Db=V>IWGfX:\;Q=-=M\;`!~*4տ=\\;\_~\\Z=j:\\\=!w`\=v\\\<\0k=\<\<\"x\\U-3\?=ҍ==\ =&.\\<\w=IW=_w<Q+\=J=L|[Ic>5\:i4FJdL=/={O;a\,F<3\I,ʼK1[<-\<\r4;v=F_<(\=UBRJt\I~<7<]\=\e=1\r_\	=s3>\,\g)\rs[<,<\zM>hGҽa\=DuZ%<SMFP^\Ⱥ.Pw\;\l{=5<៌a<?\=\)A<PC>\	=_<\\\=\䠼F8\"','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3173,'61b765e5-ae10-4594-beff-e88be67efe3c',13,'complete a Room Post click on ‘Settlement’ and in the settlement window click ‘Room Post’. Below is the screen shot of the room post window. Before posting anything to the room the server/manager should ask the guest his/her room number. The room number is to be cross referenced by entering it in the respective box and pressing the enter key in the keyboard. The figure above shows the information of the guest staying in the room 605 with their respective arrival and departure dates, meal plans and the total amount due. As mentioned before there are two ways to settle the bill. One is to post the bill as a charge so that the bill maybe settled during check out or it can be posted as a meal plan so that the guest is not charged. If ‘Post as Charge’ button is click then the bill will be charged to the guest folio but if the ‘Post as Meal Plan’ button is clicked then bill will be settled as a meal plan. However across different parts of the world including Nepal, alcoholic and other certain beverages are not covered under the meal plan. Hence in that case only the items applicable will be charged as meal plan and a separate bill is created for the other items which cannot be covered by the meal plan. But this new bill can be charged to the room as a charge. 3.3 House Keeping Fuctions The house keeping department of the hotel is constantly made aware of its rooms and its status by the house keeping module of the SDC which provides all the information in real time. During the busy season of a hotel the house keeping department is at its busiest therefore they clean the rooms from floor to floor and during slow seasons the rooms are cleaned as necessary. SDC also provides this similar functionality where the status of rooms can be changed individually or by the floor. Some of the basic functions of house keeping module is explained below. 3.3.1 Change Status Individually. To change the status of any room individually just click on the particular room from the screen shown above. For example we are selecting a room with room number 604 who’s current state is Vacant and Dirty. A room which is Vacant and Dirty can only be made Vacant or Out-of-Order, therefore these are the only two options available. To change the room to a vacant state, just select the option ‘Vacant’ and click on Change Status. 3.3.2 Change Status Floor Wise. To change the status floor wise click ‘Change Status’ button presented below. Upon click it, the above screen is seen. The house keeping provides a way to search the room according to their state and floor. The two screen shots below show where those options are available on the screen. By selecting a particular floor and a particular room state we can search for all the rooms that satisfies our criteria. In the figure',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n<\=r+Y^<\\ټ%=:\.<==y<+Խ\\<\==ELdʼ\$=\\0\<^v=q<Ӏ=%}\'>=jʺ\\`p=\N=P=ˇ9<\\0;\\R\=j^ƣ	̳;\Ǽ\r;\*\|<O=tb?z=k4=:\\;ұ:=\8%m\20=*]sv\09<SM,C\/%uM>\<K<ܞN=TLYcD~g<:<2\=~?<\\0H\<\\;\><\B=s\"\hJ^v];9~ws\'7=2\;j\@SU=d\=]\<p=2X=\%/T\b=\H= >=a=\\r%t;\9=a\n\=!p=_5=E2\\b\F4$=\[*<\{<Z?=]h>d\\P=\<\\^댽\b)y7#=	#)B\q\=ϾjMќ\<鹚=3<A\=+\u=%h~\B[=&<&s>(:H?{6\=\j=\\qh)=	=\9=c=^\Z7\\<?U<JI=ԕ<\\%\=\̻U\I5\<A\<\U\\<\䶽k\=\\\<,K߰<l=\:\<Zҽ7\'\ڽ\r%qFn\6=\|l\I\\\b<^q\\\<\W%=aO17\5~^idt=C\bǯ/=+;=\"a9=))5v=c\¼u;{<k=\jۼa2V.\a<6=\n<Zs<\7\;Ȣ;=:<tǼYݼ^<p\\\>7\0V\к|܌;7\Z=0\(6W=<6_\}^=\ZZ\ة<7\<>=Ђ=\n<W=7=C}#P<\_ai<rV=:c:=\\~4\:=V:װԽb<\\^\\<\\<\i\G=w\=\\)\\Ƽ	z=C&<ͬ콽z\K\Z;><	\:T\Om.G\d=l\g=y:=-F8z=;5=l<D\<=s==^y;Ko=<|ŝ=E\\<[O=A;$C,X4eQǼ;%M4\G=J	:;u<͞B\;TD9d7vPl:4\\|G<\"k</x\I<\\r\}\m2=sW<;Pb=9p˼\\rcǰ=\0=cdlbS\?Mr<u=@Xf:<\>8ҟ=AɇWt=rߐ\a3=XxGK<.J%}N=jU=\^Zy2|ڻ	E=c#1\k\SuAعS\\N+\Ի(\X=\\j=>w9(\q\=n\'h=ŉ<\\=;	(V*s','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3174,'61b765e5-ae10-4594-beff-e88be67efe3c',14,'a way to search the room according to their state and floor. The two screen shots below show where those options are available on the screen. By selecting a particular floor and a particular room state we can search for all the rooms that satisfies our criteria. In the figure below, we have selected all the rooms in the 6th floor that are currently Vacant and Dirty. The result of our search is seen on the box which is pointed by the arrow . We can individually select the desired rooms by checking them off or if we wish to select all of the rooms at once then ‘Select All’ has to be checked. Now the selected rooms can be either made vacant, out of order or occupied-dirty which is presented on the left top corner of the screen shot presented above. To change the status click ‘Change Status’. A prompt is generated asking if the user is sure of the operation. When clicked ‘Yes’ the status of the rooms get changed. 3.3.3 Maintenance. The maintenance function provided with SDC is not a separate module but just a functionality which enhances the capabilities of the house keeping department. When the house keeping department notices something not working in a room such as the mini bar or the television, they notify the maintenance department regarding the nature of the defect filling out a form which is presented in the above figure under ‘Send Response Request’. After receiving the task the maintenance department on the other hand mobilizes its crews to take the right course of action based upon the information that was passed from the house keeping. Upon completion of the task in hand the maintenance notifies the house keeping and only then the house keeping change the status of the room to its respective state. Below is a screen shot of the form from where the maintenance is notified. After filling out the appropriate fields shown above the task is sent to maintenance by clicking ‘Dispatch to Maintenance’. When maintenance sees the task and completes it as requested, they resolve the task by clicking ‘Set Resolved Time’ which marks the task as Resolved. Below is a screen shot of the Maintenance which can be accessed by clicking ‘View History’ in the figure above.',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \nn;\0ټ\\<\?r=/`=Ln;e[=ce9<t!<\4=\\\<>\y᥼\=\\\}sZ.#(7F=b\J<S\r8r=*/\\<\vT<\\RO<\'==M\w=\\=6~kxVq<\=\\\	@<\H:(YO@\\<\\٨=\=+t\\"<\r=\\=%Q\=v\V=6`=X=&H3$%gG=SN]4\2<\$:i=t]@<_6\\d=wfiXr=K{=\c=	\d=1J˼Ǉ;\6C=Sֽ\).эJ\ =ꊼ\\\<\Lf&\h=\0_Z<0=_2`\;AH6+6?\<sƃ<\<5;6<L\?\7=b<t\<<w\)M7ͽ\v<D=P\19\\\'<M\=);~ؼ\zü:=ܓ,V\\\'\' =\0!(<\=d	 Nz=K,;/\=Ꮌ\`;%0;ƥ=c\x<m\<*=\Aq =j<;Z=5i=7=.<\=:\ixy=X=+\=q+\<\A	\<QD\WV=\--S,=\#\<[=]=g2ͼY6pPV^<%i=ŧ0</\!z=i2g\pG=4cH=d\'=*2̝<h<庻Ov!H\՛<\\&=*!!\\\\\<wO<7\P\<\nS\Pu=>4\gt^(\\=\\<μ\\qRKo<1+6ij3/Sl_+==\#ev;\r\<~Gv7=77ϼ\N=\|<۲=v_F;J.=c\\=G)-y\)C\\\M\=\X<<nP2Nv\>=),F\=\\\p=ht޽\v<ⓗ\"=@<\\\=Tx<DIA!T\\-\\=:\nf=b~<9/YUq=)=^v\F=X:@ŏަ>PU<ӨJ=Pq=ך.RZ;>7<>\'\\\c<l\=Z<[\\<\Ļ;F=.8aM<1[=ǧ<^=y\\nBg<ʒ2\:\<zH<Tgf;Z\S<%н;\7_\\\\\0<\|+֔=\[=M\)	3S\<ftE\n\t7o\R$R\b\\=`\\%\Z=\=F\= T<k\<\\Z<\2Za=:{;l\uC\_\"5<3J=L?a\><=A=7BQe\\F\-=3\=\\&=Q=fO=\b~\5=_1=\ْa.=!?=\1\	Ǽ+<l;jt?\"U=ĕ\\@<	y`ܒ]-L=\q\;\=ǳ1=\<\c<\=\1\<','b02fb4d5-15f0-4a5e-9fc4-63cb0767009e'),(3175,'aea3a964-72a4-4fb6-a2a1-b792c0f64e57',0,'Aavani Food Pvt. Ltd., KaryaBinayak, Bhaisipati Date : Saturday, September 20, 2025 CONDUCTED AT 9:01 PM --------------------------------------------------------- Total Sale : 38465.09 Dine - In : 20408.96 Take Away : 18056.13 Banquet : ---------------------------------------------------------- Total Net Sale : 34039.89 Dine - In : 18061.02 Take Away : 15978.87 Banquet : 0.00 ---------------------------------------------------------- VAT : 4425.20 Dine - In : 2347.94 Take Away : 2077.26 Banquet : 0.00 ---------------------------------------------------------- Service Charge : 0.00 Dine - In : 0.00 Banquet : 0.00 ---------------------------------------------------------- Food Sale : 33271.68 Beverage Sale : 1395.55 Other : Banquet Sales : Credit Card : 4345 Mobile Payment : 12210.08 Cash : 17745.97 Total No. Of Guests : 52 Discount Amount : 627.35 Credit Sale : 4164.04 **********Credit Bills************* ------------------------------------ BillNo Name Total ------ --------------- ------- 1495 Foodmandu 896.99 1496 Foodmandu 1592.03 1500 Foodmandu 398.01 ------- 2887.03 ------------------------------------- 1494 Pathao Food 679.01 1497 Pathao Food 598.00 ------- 1277.01 ------------------------------------- ************************************** **********DISCOUNT LIST************** ------------------------------------- Guest Name: Roma AcHarya Bill No: 1473 Discount : 10, 10.00% Discount Amt: 45.13 ------------------------------------- Guest Name: Vinayak C80 Bill No: 1476 Discount : 10, 10.00% Discount Amt: 190.09 ------------------------------------- Guest Name: Vinayak C54 (Priyanka Karki) Bill No: 1478 Discount : 10, 10.00% Discount Amt: 114.69 ------------------------------------- Guest Name: vinayak c17 Bill No: 1481 Discount : 10, 10.00% Discount Amt: 105.84 ------------------------------------- Guest Name: Sundar Man Dangol Sir Bill No: 1492 Discount : 10, 10.00% Discount Amt: 111.86 ------------------------------------- Guest Name: Vinayak A5 Bill No: 1506 Discount : 10, 10.00% Discount Amt: 59.74 ------------------------------------- ************************************** **********Complimentary/NC************* ------------------------------------- ------------------------------------- Total :0 ************************************** Starting Bill # : 1469 Ending Bill # : 1508 ------------------------------------ *******BILL TRANSFERS******* ------------------------------------ ****Void Details**** ------------------------------------ Employee : Barun tamang Item : CHICKEN MOMO STEAM Quantity : 1 Reason : Wrong Item Ordered Order ID : 1518 ------------------------------------- ------------------------------------ Employee : Barun tamang Item : CURLY FRIES T.A Quantity : 1 Reason : Wrong Item Ordered Order ID : 1518 ------------------------------------- *********************************** ***********END OF REPORT*********** ***********************************',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \nu\̼B\=\x</Vw=\=\ڼ^d<ۭܻ٣=\Z\rDiVX\/\<S/ȼ&\\HWq9+l㶼;E\+=&qټ{<\蝲q\\":=ޡ>G9=\@=\\<;O\=\kE}=v\\ڻy}U[=u7绚½ϻ:=;<\Z<9=\\t\0\<\"I;\"0\\=눮J\Z.<-:\\<\܂=ֽp<s~\l\n\=\Po<>\\Q<\=t7Ƶڃ\;ã\Ҁ\\‼\(\㼭<\< =\Nm9=\ZP<?ϼ\~>\DԷ\-=\t=Q\=\r=ʉ=\0\|0ƵlUYI\<׼џ\\\u=\5IL&=Ԟ0`!\0ʼ<N=6b\=S\\\\O9a=\k\׽\y;\\ypk\=O:iHhm\0\:<\Fօͽ뼷\<\&P:w=rmP_<,\$ͷ<#\'G\f]<<=t\\<W\5=\]=n==\\=~=4\§14\/\R\B4(\\"\6+=!S\6=l\e:.\=FPE\9	<=U<)=nxٌ<\\\;\0=j\-\Z\Rh\ց\\\\$<r|c=W=4Iۉ[Pr;ι\?~ȷӛ\\<R=O;ʟ<\ȇ<A\=<6\\f=g#=3\\\<\4=\h\=\\=IS\<\\\n\0l%m;\\u=J]kP\;\<\r=\F=r\ nL=6\^<QN^ζ\qٖ\=F=\v5*缲{+ea\=\tS-\;HC=v,=\<A?Bb gҦ.~>=Bc\Z\\=g֩:qR\\<(<5%=\\\=;1\\`t=z\nq\d=eP=\ }0>x=9?գ\W;`=	=\\;\=Ǥ=7c<_%=zM\=Aᒽ\~\<9Q\(*\<<\KY=mW\9=\\Ӻ\7ļY)<\\tԼk|\gh\hA=E%<\<\໸W\'=x<Pb=1]\Lz=+݂1=\M=\E[\<,\\<\㘼\$~=\~[Y\\<iG<\rl\N6h\֊f3=V3=A>=\SK3o/<˻g\=TH=ŋ\5L\<\n\\rƂ5C\Z=\c=\\ͽv=&D<\[<8U\lip\==\<\nm\<\0\n\\;\/\<<1:UذZ=7Hy<\\'fq+|/64y/=\O*P=',NULL),(3176,'44a57c9b-8b5a-45df-97ef-1fd58c8e37ba',0,'Teaching Manual For SilverLine Dot Connector Version: S.10111 By SilverLine System Integrators Pvt. Ltd. Tables of Content. Introduction to SilverLine Dot Connector. Modules. Main Screen. Front Office. Point of Sale (POS). House Keeping. Maintenance. Functions. 3.1 Front Office Functions. 3.1.1 Check In 3.1.1.1 FIT Check In 3.1.1.2 Group Check In 3.1.2 Check Out 3.1.2.1 FIT Check Out 3.1.2.2 Group Check Out 3.1.3 Start Reservation 3.1.3.1 FIT Reservation 3.1.3.2 Group Reservation 3.2 Point of Sale Functions. 3.2.1 Start a Table 3.2.2 Add more item to an existing table 3.2.3 Settle a Table 3.2.4 Split a bill 3.2.5 Add Modifications 3.2.6 Void Items 3.2.8 Room Post 3.3 House Keeping Functions. Reports. Introduction to SilverLine Dot Connector. SilverLine Dot Connector (SDC) is a Property Management System (PMS) which is built for the purpose of managing different departmental operations of a hotel making it convenient to keep track of its day to day activities. With the arrival of computers into the scene, the old ways of maintaining logs of everything manually is long gone. In today’s competitive market its everyone’s aim to stay ahead of the game and one way of doing that is my having a system that helps you do just that. SDC is a system built towards addressing that need of a hotel where all the information needed to run a hotel efficiently is easily accessible with just a few clicks! More than that it integrates the functionality of all different departments of a hotel such as accounting, inventory, housekeeping etc reducing the time, energy and effort into managing all of them from one single point. SDC is one of the most efficient and easy to use PMS in the market. Build with the latest technology in software engineering, SDC provides a very efficient and user friendly operations making it very convenient for hotel staff to meet with the requirements of its daily operation. Some of its key features are as follows: SDC is a state of the art system that is capable of handling reservations for a hotel of any size. It is intelligent enough to interconnect different departments of a hotel, keeping them all informed about their duties and tasks in hand. The front office module gives an over view of the different states of different rooms (such as vacant-dirty or out-of-order), and these states are denoted by different color indexes helping the staff know everything they want with just a click. The reservation module is a full proof and fully tested part of the software that handles different information about the incoming guests such as their likes, and dislikes, room preferences and meal-plan, flight information. The guest history tracking system in the software makes reservations for repeated guests very simple and effective. The house keeping module also provides a visual over view for different rooms to be cleaned. The system provides a mechanism to clear the status of different rooms floor by floor or room by room as the situation demands. A maintenance module constantly keeps the maintenance',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n> :\4=y\;%\\<GK\<=ɖ;<2=trj=<jz=\<8)|=^\?<bBW<;\\=\;\-实= \rd=\\"<\Zf\<)\\uy=~6H:\r<.6=*z=.\\U=q\=\\>\0\h\(FP2&=\<̏XRb=\\<pe=Ůљ=\<J=z=\&\E\\;\c\?fo\<9Ҽ\i4\=WQB=ȋ12DGt-~=$=Ix=\\0<s=#ŽǓ\ >3^μF\r;\\9	i=\B=<oQ;\Z\MO=\j=[\L&;\MEg\Z\T9=:A<L=Fi=?\]a)f\\o\)B\:NF<:\#Tj\\	m\h5h\Q\S.t	=L).<=qS=3\0<C\;\+\<L=i	GZ\Tb9YGN=RL\<=\ϋ=;\"K=!tdL~\㬻y\;C\Ρ=|s=W6\:u\ѼS\2\Q=[ɼ~p=#L<xn=n=\/={<u=2=l\"ۼ0\\`=\x\r=0\?#\0Ϣ	US\Y.\]ӻ>#=)d\$=A =\=@ȉ\0A=DI\D<;;\<\\	{$$RkKؼ/_\Ol\1(3<J0x<KNL=$uG\=R\rd+ku;)*\<\'N<]:a&Gҍ<7=\\=RVO\<\r\\\;ː<\\N5UW=\뽱\"\n\}<t⡼C?7\_>\Z\<2_8=\\n=Av\>/8VVX<\p<[n\=\(=	\6/\\;=,>;O\r<\>a\"\L\0\<\=!;mx=2_\<q\7<_\"+ۋ6\z\oQ\ {@=)<+Tә%\;V^t=\=g~\;{=\=O%P=ʣ2qKy=\1>e=\j\n/^><C1 W\Ż\\k=\żpYH=\z=ȩ`rvr6\\\0=v=\=\=7	Q4=\\p3&H<SCN<\"H켃8\~\Z=\F~^=\`ӼȄ\G\"=\q\<䟯=\<\n\L<\I=\?9\=\L`=\_K\=\QƖו\ri$<<W\E\Z>=\J.Ҽ=HE\r<ߺ8=~]7=\\8\#)Y=\;b=\q\<s\=l.J;\\;f=p\吽\'\=\*=\<Ǎ==\=팻\0v=\aB<]=+\==\"h>ŁEn\:*>\Z;7\=θ5=xD%vz?C8(\0\:<\=`;<,4=&+t=',NULL),(3177,'44a57c9b-8b5a-45df-97ef-1fd58c8e37ba',1,'very simple and effective. The house keeping module also provides a visual over view for different rooms to be cleaned. The system provides a mechanism to clear the status of different rooms floor by floor or room by room as the situation demands. A maintenance module constantly keeps the maintenance department at its toes with its constant reminder of the things that need to be addressed. Housekeeping department notifies the maintenance department instantly about any breakages or failures noticed during a cleaning procedure there by reducing the reaction time. A state of the art POS system is also a part of this software that takes care of all the restaurant management needs. The POS provides a visual overview of the entire restaurant with its exact floor plan and table numbering to help the manager and the servers know the status of different tables. Different color codes are used to signify different status of tables, such as Vacant or Occupied, which helps to know which tables are available for the guests walking in. The POS is best utilized with a touch screen monitor as the ordering process will be faster. Each menu item is listed under its own course list, helping servers or managers to know where to look for any particular menu item as needed. After the ordering is complete the order is sent with a push of a button. Upon doing so, all the bar items get printed in the bar and the kitchen items get printed in the kitchen reducing the need of having to send someone to the kitchen or the bar to inform the respective stations. Once the order is sent, it cannot be voided unless approved by the manager. Any alterations or special requests from the guests regarding any items ordered are entered into the system at the time of ordering which is printed at the respective terminals along with the items ordered so that the respective terminals are informed about such modifications. A bill splitting feature allows the bill to be split as requested by the customer which can be printed accordingly. A bill printing system is also a part of the software that prints the bills as necessary. Room posting for different guests according to their meal plan is also incorporated into the system. Reporting includes daily arrival, departure and stay-over reports. The end of the day report is also available with the exact cash count of both the local and foreign currencies. Any further reporting options preferred can also be incorporated upon request. These are just some of the general features of the PMS. Let us now go deeper into its individual module operations. Modules Just like any other PMS in the market, SDC covers all the basic modules required to run a successful hotel business. 70% of the revenue generated by a hotel comes from the guests that come to stay in the hotel, therefore a system as such requires every attention to details as far as guests are concerned. SDC',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\\ZE<\$Gv+Q \1\=eU;\U=np\n+8==%-=	툼J?[7W=\"\<\_*5);HI¼\9\vC=<\d< \t<t\Ľ5}e<׺j\=<U<\\T<1s=\n}L(j$w##\\\'x\<\\=֫eGG(xFA\\F\H=\"N=}M=T=L=\͊ZʌK=$]\P<+%\r=1<<9\0=eS\\:C\<Λ=\"nGu\<N\\\\2<ks^;\>\n\3<.G<l3`d\ZQGҘ\k=wH_;v9=*`\><\0}<\=Z	<Z\<\\!=Ti<\Ɏ<\\\!<\\<Z.=鐜n\<=?\\d\r*ls\< <\Z=/;rB=\IĻJ8;bpH=KG===\}9	5LC\lhG\\<q/;\=<N59\{\g>\v=R\Z=	\=\z<`O=	\Z\nD=\=\\n\r;\\(<;<vO<>\<wA<\>|=9<o=R\oj;2\=-=Ud<\\нnJ\n\'ӂ!mk9\fdTm\rd=\\<0sq{=Т7=\<Yuj\Z_\\<dzJͼ׏=getA=-<.;yg<z8<k2[=\noD\<w;1=g\|=Us\0=fz;\#\VG}\s#ڼ\\=2j\:%5\0\\<-GC</l=Go\'U=I \<<̼9=K\\n\\0=i\0l\Cg\ԶϽEW<D,\Z\\<5ɽtL=fqs<|!=\y\T[ýQ=\\}[\=/JJ1<\\\A-L=](ú\:^5D+\c⾻?f:<\\}=:=gW=\'==Ⓖ-><R$\I=)D\ؽ\*;By{\G\YT	<+k,=\'Aru(<\8\\m8=@\5ʙ:=\U\=	Ui?=Ē޼+ =$~\޼\#\<0!$=\G9(.\ZH;~$;LD,\=¼=Q==ǁ1=g\ȟ=\\&<kFVU\aC2=\lFL<Ppܽ|3F<5=W=5=;=\:\܍=g\Z|=Փ=_\W@=:E;+ﺦ<=)2=fDzt<:\'=Y\<=1s\=߭<\\<sqx<uP=\\"<t/P{5=\\\<\\}{۽&L\r=d,=a\\<\e`S\S=_T\K\w=,#\>K\>\<\\'<\\'=\\\"~',NULL),(3178,'44a57c9b-8b5a-45df-97ef-1fd58c8e37ba',2,'market, SDC covers all the basic modules required to run a successful hotel business. 70% of the revenue generated by a hotel comes from the guests that come to stay in the hotel, therefore a system as such requires every attention to details as far as guests are concerned. SDC provides a state of the art front office reservation system that allows to know everything about a guest including any preferences in regards to dinning, lodging or any special requests that guests might have. Main Screen (fig 2.1) Apart from that house keeping also plays an important part in serving the guests as per their need. Restaurants are another place where the guests need to be served in a very professional manner. All of these operations are carried out by SDC which help the hotel staff to address the needed of the guest in a very professional and timely manner. Lets look at the operations of each of these modules. The above is a screen shot of SDC main screen. This is the main entry point of the system. On a first glace it gives all the statistics of the hotel that is relevant to the day. Values such as occupancy percentage and rooms to sell are very closely watched throughout the day as that determines the total revenue generated at the end of the day and also gives an idea of how many more guests can a hotel accommodate if new guests arrive as walk ins. Clicking in one of these parameters will give use more details pertaining to the parameters, such as if we double click “Total VIP’s” then a list of all the VIP’s with their room numbers will be seen on the screen. Shown below are 5 buttons which are the entry point to each of the mentioned modules. They are as follows: Front Office: By clicking in the above button in the SDC main screen, the front office of a hotel is seen. Front office module covers all the reservations together with the status of all the different rooms of a hotel. Settlement and viewing guest folio is also done from this module. Point of sale (POS): By clicking in the above button in the SDC, the POS can be accessed. POS is a module that serves as a restaurant management system for the hotels. Each restaurant of a hotel has its own terminal or POS from where it is accessed and used. House Keeping : By clicking on the above button, the House Keeping module can be accessed. House keeping module provides the house keeping department with the status of different rooms where by they know which rooms have to be cleaned or cleared. Accounting : By clicking on the above button, accounting module is viewed. Inventory Management : By clicking on the above button, Inventory Management module is accessed. Apart from accessing many different modules, SDC main screen also gives an over view of different time zones of different parts of the world,',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\<\\ἰ\rq<#80u=Wy=Ẻ7ʔ=\\\;IS.S<]<WDp(b=fQŽ=r7|oN=\I\B\ Ѻyo<\\\*<+\;{±< &{B=/˖=\Z!>3\<\'-=qλ\`ؽz`<}<Zi<Լ?\AλzaJKݡ=Ȕ\ޟ=Z=bs=0=o\=	\b̓\<fd=!s\<v<\[<\Z<야ns\:5\<W.<fs\pļ<\ZJ֐8\=20z\<:!=\'jMI\<>\{mdb=yx\\r<|=㶙<)E0=\\=\Ž\'&\y=ώ<\\_=T=q=\\Z\g\a>DI=S\Ż9X5a\˽	a=);\ļȖ\{]=l\\=\0ܼs<Õ\Z\\<\Zc(ҏ:H{H=̾\	f\ýļ&oM\y<\\<\C\n/5=jA<0먼&l\<E\<U\s=ޣ<\<\m=g\\0=\,\\<\\\<@\=: <\`P=ڃ<(\<K=j<<>p=!<<v\Z=g=^\\<yt=Ħ\ƻ;\Sv\\\<gJE=\۽	=Z\\X\<aH\=\	\Z\0\\=(gpf[;씽<`Q׽@\\G\<q~}\\n\jK#[<8i:\$xԻR=(k\\ro< <\<H\0<v\\\f\"%:\=]	#=|ݓ< \H`}b=ʉ\'_D\<\\\<.1=:7#<\\\`	&<3\Zik\=_\n\'쫅\\\<f?\ܺ樽\D\=U;ZCڂ=\"\;\=\˼\'𼆶\'\==Y[=\\ΏeU|\q:d==\Z=\\<L<nT=\=x\lFcVB=\n;>*>1Br\<\xX#6(7i~\m<Ê\w|<\=m=&\*=Ҩ<f\=\+\\v;\=\`3O{=}\,q 0wWJ\<\Jҽ\\Z\Ɗ;\L=\p\#\?ezμ \H\ޖtE<\Ha\"<\nOͽ<l\\Z=\Κ\⇳RnF\A0<\<8X0\\'g<X!=\J<\\Z=~*r=\j<\^]A;#Eǻ\W>x|B<\<B:IZ#=P5\6\<cl25%=L7;ǟ;\=+=\9=$>\=32<y><ݼD=\z/=ڐ<*+\<\Z=\D~<\n<\LB<7[k=\<<T\\׃=n)\=\=8Z!\k=\\<\6\=\"/o\\<',NULL),(3179,'44a57c9b-8b5a-45df-97ef-1fd58c8e37ba',3,'Accounting : By clicking on the above button, accounting module is viewed. Inventory Management : By clicking on the above button, Inventory Management module is accessed. Apart from accessing many different modules, SDC main screen also gives an over view of different time zones of different parts of the world, and also a small calendar which is helpful in many different areas. Now let us go deeper into each of the modules of SDC. 2.2 Front Office. 2.2.1 Overview : The screen shot seen above is from the front office screen. Individual rectangles denote individual rooms of a hotel with their current status being represented by the color of these rectangles. For example, rooms 701 and 702 are out of order therefore they appear in a grey color, and the legend present in the right hand corner represents exactly just that. On the upper right hand corner there are 5 buttons. They are: 2.2.2 Refresh Button: Refreshes the display screen and updates the current house status. 2.2.3 Find Button: Upon entering guest room number in the highlighted textbox the user can press the Find button or press ‘Enter’ to view the room details. 2.2.4 Rates Button: Pressing the Rates Button will display the different rates offered in the hotel . Rates such as CP, MAP, BB can be seen with their individual breakdown of their room rates and meal plan rates. 2.2.5 View Report Button: Clicking on the View Report button, different reports can be seen. Details of different reports are covered in further sections. 2.2.6 Drop Down Menu Functions: Fig 2.2 Buttons Fig 2.3 Room State Fig 2.4 Room Type There are three Drop Down menus present in the front office screens which are highlighted above. The first one gives you the list of different room types present in the hotel such as Single, Double, Suite etc. The second one contains different room states as such Vacant, Out-of-order, Occupied etc. Selecting (Fig 2.5) different combinations of room states and room types and pressing the Find button or enter, the user can view the desired room having the selected states and types. For example in figure 2.2 and 2.3 user wishes to view all the single rooms in a hotel that are vacant. (Fig 2.5) Given below is a screen shot of the result where different room number and their corresponding states are seen. Fig (2.6) 2.2.7 View Room Button: In the above figure if one clicked room number 605 which is highlighted with the blue shade (indicating that the room is occupied), one would also be able to view the details of the room. The Figure is given below. 2.2.8 Reservation. Overview Fig (2.7) The figure above is from the Registration screen of the SDC. There are two types of reservations namely FIT Reservation and Group Reservation, which can be viewed by selecting the respective buttons shown below in figures 2.8 and 2.9. (FIT Reservation button or Group Reservation button). The result of the desired query can be seen',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \nF<-~vMY=tt=\\=\C<hV9=Z&O=x^li2=\`\\n;j͇\$<s 4<\\8<	{»rbb¼\e\a<aY\ZM=\<췽 \Z\<=i+=Cr=\A=F!n\\[\=l|ru\"\<иZF;\0<~+l׼u\0<\={=\P<B\=^7<,	><f\Ѽ\\;]E\;\0*\<\\l\<<jL+=`ۼ\v=v\';˸-\\\\N<}0<<\\\<7AbFq<\\@WJ=x*!v=<^i<\E<ߜ\Z<\ջF(= \':+\̼k<P#:|Bae==M\`n1=,=\\<=Q_c<Σ\=|\<A1\0\\r+0r=/%\Ģ:@;,\<\rG=Z\.\=\q`dN:g\K+u\H=Q\	u&Ė#CҪ<\">\&<\.\Ӹ;\_=o\<_e<~=\#K !\2Jָ\=bﺻ&i(YY=\ּ\=u^&>\_=~\=6\<s;v;=\C=jc=M<b{5=O	;H\	<\\<\(FmkQ\Nm=\\nU=X\<QX=\Nq=Pj\\(ܧ\]꼖Q<іŽ^<q\55Q;-=c7=M\Aj=V^\\r=S\⼳\"=\nA\&Sn/[=:\\\;>1fϼeX\q\;	\"\\ZЩ&=f\\0pp=NZ\弳Opa\\Z\r8.=*=\\Z=\q\\Sيؽ\[Nk\9S\<l<س<\<vݟ<<]\^<*PSu==*<lܽr\'<wdZ\`={7.\"O\|&\=\G[=\\\;<tE\7*q\0\=8[=P.-<\r=Itj^h=\`=\>0&ͽr<.5U\:Y=\<N+<ZŻች\\7 Eļ!\ս\\=\\\:\\d\=ȩ<ܯ\<c;\h=\}X:w=~ZP\Z=Ͳ\r޼ԝ\\1HW\Xz\uC.[o8ҍ;Tsj\&7z:?\\\\8j<;	-\=g=̼󲁳\Tk@\:\}*=fvBc=\\\=OW\\=	-缧\"=.\=*<qrI\Z=7=oW;GDZƼc=c}Tc=1@o<MMK>=[F\=ʉ=\O=(G¼}Y=؆5<bTjt\=PY@=\ަ=I0Ca⎱u=-<Òu\]CBU<!}\.\\%Ǽ[\=\Ql\̼\nw\;\\<\Z\<\\<\<5k=ե{Y<',NULL),(3180,'44a57c9b-8b5a-45df-97ef-1fd58c8e37ba',4,'the Registration screen of the SDC. There are two types of reservations namely FIT Reservation and Group Reservation, which can be viewed by selecting the respective buttons shown below in figures 2.8 and 2.9. (FIT Reservation button or Group Reservation button). The result of the desired query can be seen in the box presented above. Fig (2.8) Fig (2.9) Fig (2.10) By clicking on the In House Guest button (Figure 2.10), the list of in house guests can be viewed. Fig (2.11) One can also perform any search that is based towards the guest’s first name, last name or the reservation ID that is provided at the time of reservation. Any such queries can be typed in the box located right below the reservation buttons shown in Figure 2.12. Fig (2.12) On the upper right hand corner of the Reservation/Registration window, there is a cluster of different buttons that provide access to different functionality to the user. Let us view each of these in detail. 2.2.9 REFRESH Button: The REFRESH button refreshes the view of either FIT reservation list or the Group reservation list or the in house guest list, depending upon which button is clicked, i.e. FIT Reservation Button or the Group Reservation Button or In House Guest Button (Refer to Figure 2.8, 2.9, 2.10). 2.2.10 START Button: By clicking the START Button, one can start making a reservation for either an FIT or a group. The details of how to create a reservation is described in later chapters. 2.2.11 CANCEL Button: By clicking the CANCEL Button, one can cancel a reservation. 2.2.12 GROUP CONTRACTS Button: The GROUP CONTRACTS button gives us access to information pertaining to different group reservation contracts a hotel may have with companies and travel agencies. Without any such contracts, a hotel may not choose to do any business with other companies. A contract includes important figures such as number and types of room, rates and dates at which the contract ends. The details are described in later chapters of how to create a group contract. 2.2.13 UPGRADE Button: The UPGRADE button takes us to the window where a reservation can be upgraded to other options provided by the hotel. 2.2.17 ADD ROOMS Button: The ADD ROOMS button adds more rooms to a reservation. 2.2.15 DEPOSITE Button: During the time of check in, guests may be asked for some deposits which can be entered in a window that is accessed by clicking in on the DEPOSITE button. The details are coming later in the chapters. 2.2.16 TODAY’S ARRIVAL Button: By clicking on the TODAY’S ARRIVAL button, one can view all the reservations that are arriving on the date it is clicked. 2.2.17 CHECK-IN Button: The CHECK-IN button takes us to the window where a guest that has a reservation and who is arriving today can be checked in. There are other information that is gathered from the guest at the time of check in which needs to be entered into the software. The guest check',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \noBv)+\W=\=G\= =[\H!̭K=ͯNu\<I$m\\<@!;7=\ok{?<\Lt<\}=Ͱ<R\X!MO\tYeJ=:=,=:@>u5=L̽\5Vv	GC]VFlè<\\"\;D\Z==5%=t^;\k\;=/\r>ur@\Ȼ:Q=Tm<\"=\JkN~\2.=c\o=lA.*Q==ZN\F+t\\\\=.	<w\=\\0<\}&\(\<n=w\\d;2%=Mc<-\'<\`6^\\\\\lt=MJ\$Ƽ=\\<\\?\pO=Ib=e\\n=-ϼJV\=!\,=}/Ey\\1\=\1/u:8\r\ݽ=<\rּc =&o,h4=i`	=\}r<\YE	Y\`5gkY;\n6\G\z\n9WZ\;\bȼ=l^\A=t+<\\n5y=\g%\ջ;\\k\=pyD=K=[&=(\<h=O<=/H=\\<\\E=lp{<\ͼ2rἴL;\\b\g=M\<}a=d\m\ܼ\x1=x\=\l\\<:%\'J==ZG<\o;\s\<H2=MZ[]\ȟ\b\n*=}\4>1=vspH?<P%t\f\";fk\'\\<H\Ͻ3\\=|(Ys<#\q=Q\nT`\mt44<K\\M=\<a1c\1=H9KlM\r=t$\\"T\<\\=L\B=KH1ꉷ\9=\y۹\\\<\0o=<7\0c<p\켷\n\\\P=4;N!H<>ae=ɝ;>{=W4\=k\Q<\\</=*si=\-=@\Z\ֵ;<M\dNJ=H=(ּ\oGo<x̽ ĺ=<\Ar\w\n;K\\z=F=\p|ЃA=\V<ùu\L8?d<ċ\oYi=\L=t?\D=\a<¼\\<\=1;mUAu<ٝ\\Լ\|\<\8X\\:=&\0=\o(<㺣D?=\8\'=K̼8<\\=\=%F!=Ӫ;u\>\<_\\\<\cg(;{n/\mvY*p;\JR\V=鲪_\\\=ěJ\=\Ź<v=Ac:Oj\j=\\=K;D;ʼ\\\ܼ\\\<,;&/\Z=\{<\r><m=\ ==7=>\\]\0\\=`\\\=p\;<\\l=aHy=NX=E7=s&\<~K	aP|׽\\}<\\S	=q۹\=f!<HgĻ@=\֟w<',NULL),(3181,'44a57c9b-8b5a-45df-97ef-1fd58c8e37ba',5,'CHECK-IN button takes us to the window where a guest that has a reservation and who is arriving today can be checked in. There are other information that is gathered from the guest at the time of check in which needs to be entered into the software. The guest check in process is described in detail in later chapters. 2.2.18 VIEW DETAILS Button: The VIEW DETAILS button shows details such as guest details pertaining to either FIT reservation or Group reservation. When the in house guest list is viewed by clicking the In House Guest button (Figure 2.10), the details of each guest can be viewed by clicking the respective guest and after that then VIEW DETAILS Button. 2.2.19 EDIT Button: The EDIT button takes us to the window from where reservation details are edited. This feature, together with many other features is password protected so that only the person with the authorized privilege can make such changes. 2.2.20 ARRIVAL/DEPARTURE Button: The ARRIVAL/DEPARTURE button leads us to a command centre from where we are view the arrival and departure records. These records can be viewed according to their dates. Below is an example of such logs. 2.3 Point of Sale The point of sale (POS) of the SDC is concerned with the day to day activities of a particular restaurant and billing. The POS handles operations like ordering, notifying the kitchen, settling a table or posting the charge to the room of the in guest. Below is a screen shot of the POS main. The main screen of the POS represents the exact floor plan of the restaurant with its table numbers and other details regarding the location of its exits and bars. When trying to access the POS from the main screen of SDC, a prompt is generated asking which restaurant is to be entered. Upon selecting the desired restaurant its corresponding floor plan is fetched and shown on the screen. The main screen provides some valuable information such as which tables are occupied or vacant or which tables are departing making it easier for servers and managers alike to be better prepared for their service. The POS and all of its functions are described in detail in the further sections on POS Functions. 2.4 House Keeping. The house keeping module in the SDC is designed so that the house keeping department of a hotel is fully notified at all times, the different statuses a room may have during any particular time of day so that everyone working in and around is kept notified. Below is a screen shot of the house keeping module. Shown above is a listing of different rooms and their respective status. Just looking at the above screen the house keeping department is made aware of how many rooms are checking out, how many rooms are occupied and dirty and so on so that as soon as the rooms become available they are cleaned and made ready for future guests. Rooms of different categories can',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\0\<p\<!@&<}|=\\==O\z\<\_=\\u<P\;\\<\n\"\μ\Ƚ\\\r=HO=rM=|hm==䢼]p\\Z;\h:\W=\\ö==G\&S`ꋼ\0h\;R><ws\<Fa\<\=\>\'v{\\sn\=\f\<g|=SVM=\*wS֩=<\'qtnkJB=EK;\?+:=%Km\,ݼ\5=!\\T\\t=0W>\nc,\H\<\,}=\-~ͫ7\\n=\晽q\]<n<\\<<\<j\<\\c\\\;=<\\\μ\~޼n\<;8<-.1aL==*>=N̳<B=\|7=K	\	>O<\<5\ͼF}{@*=bA=U\\<\N<\f=\u=\s=O`-=F;Ҽ\`q쳽?)t==	\U*\\rRmSx@p_=2<V2\\nü:p;\\<=\۽/=삽\\<ZV=ݺ\n\\=r˶;ќ<ސ(=\\U\;R\=\0Ү;\Y=\*=1	=\ȅ<\'\e;ͼ\B\\\\<b<4V\>\\_<6Ѫ\\69l̉YE}4\PT\\\"\=跕<h\<ˡ!=\=mwL͏<6\]I\>yȫ<@>\0u\"=\_݈<\\pU/Hk\?{kVQ\=;#l,<($+<1<w\8\w\</=\;{#=Fg=Ǖ[= /A\u<<9&}\'z`<\nἯ|@gh2	<\\\E[=\.<\"م=\a\\\=z\;d\n\ʽ?\߱<ɼ\ګ\\r\8\\ʽMw_ \<oxȐV=U?=ѻO=d_<X=\(<5\<=\"=\L={ͼB\_<tcŒ=]L=ۦ=\U=n%{5=j6f=\\\n=\.7.\=L\<:=nÇˇ=h\gP\\;+\=\\_=k<%)\\=[\\\y=\:=ާ1znC(=\===\p=\	)\<ۈ;\{=#\\=Z\m\s:V\.;)\<\^h\xj\TR$<虛%\|;2%Lz)<\½T;S=\\<aQ=L\zƙ:l;\<\r,<;w<?=(\\̽\&=a֢=\'5Z\\\ީj2\<*2ݻ\r^=\cK<2\y<Z\5=\n9h2@= S=\=_LJ=\=\<F=$=\\\;\f=\	=\\=n<k\f\\\=as	<6\ܻ5)^༫P,ygP=7C(==x鷽\'e>A$):`<\س=$(',NULL),(3182,'44a57c9b-8b5a-45df-97ef-1fd58c8e37ba',6,'the above screen the house keeping department is made aware of how many rooms are checking out, how many rooms are occupied and dirty and so on so that as soon as the rooms become available they are cleaned and made ready for future guests. Rooms of different categories can be searched by clicking on the respective buttons and clicking the ‘Find’ button. The complete function of house keeping is explained in the House keeping function section. Functions The numerous functions available in SDC enable one to better understand how a hotel operates on a day to day basis. From tracking guest folio, to viewing extra charges occurred during the guest’s stay, SDC provides the simplest of interfaces to carry out all the operations of a hotel in a very convenient and efficient manner. SDC also supports the flexibility of posting the charges from a restaurant to the guest’s room. Hence the operation capabilities of SDC expand into integrating different departmental functions of a hotel so that various tasks can be accomplished quicker. Let us look deeper into these different functionalities. 3.1 Front Office Funtions. 3.1.1 Guest Check In. Front Office is a place where the guests interact with the hotel formally for the first time, therefore it is very important for anyone working in the front office to be prepared with all the necessary details one might need during check in. On clicking the ‘Today’s Arrival’ button shown in the figure below, the user is able to view all the reservation details of all the guests or groups arriving today depending upon the selected reservation view. (FIT or Group) The procedure of checking in guests belonging to FIT or Group reservation is slightly different with one another. Let us go deeper into each of the following. 3.1.1.1 FIT Check In. As mentioned above, the list of reservations that are arriving today can be viewed by selecting the FIT reservation and clicking the Today’s Arrival button on the top. The reservation system searches for all the reservations that are arriving today and gives the result as shown below. The figure above shows two reservations that are currently scheduled to arrive today. By clicking on the individual listings we can view the details on the right side of the screen. We can see that for reservation 19, the assigned room number is shown as 0 and for reservation 20 the room number is shown as 602. This means that for the reservations having their room number as 0, individual room(s) will be selected at the time of check in and for the reservation with a room number other than 0, 602 in this case, a separate room is kept reserved. This is usually the case if the reservation is for a VIP guest. The above figure shows the details of the selected reservation whose arrival date is today. To check in guests, click the button ‘Check-In’ which is shown below. If the arrival date in the selected reservation matches with today’s',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n5\W<\v,@N\<\=߾\'=\"=j3\\<|<yY <U\\;*+4ƹ\r=]\	z=ܔh=s`tcp:<z:e&<Լ	&\0L(Ͻkj=@\=~=,6G<G3W\%<\'\<m<e\|\,F<wLe=c\ \\"|\;I=ʝ=sZW=\%k=\^<=\-=L܋Y\fZ\B;=4=\<Yd.:]>F=\"\=\\Zd )=|`i<\ʷf\\<3ح^my31=s\<Qc=K\γ=\'\0@;R\<c7:ûŨ=R\'=\\n\=W\\z$ɜa<Ë=j <\\\<-\<7Q=A;C..>\<\]\;4Ioc=;=.@\(!OP_O=-\\=lRy?=\\ȺF#=\Qt\<\阽M\\=\\	퀼[n<\ =2<0:=\Ԑ=]=tnZV)=\c\8\y`=Y\0Y<\W<\w=L<\H\,=\?6F=a\\<h=*d<x=\=d<JZ<\<G\:\<=$OV-=\{O\\Wa<M\,˽Gԙ<W`Y<.=I\Z<J<\\=ϼ\\\=ZNf\!&=?f;jP9r=7Qɽ{%e=\a;^\n\,=ؐ\p<:c\G;=g\WN\.rA<\"sMsO0\r=@`QUߪ\"@A\}\<E\<y)<em7qh=\}Il5=zQ{ꪭ=\Z\&==\\R<C^0\\9`i\\=y^9ݽ\\Dm\^M\Q<q0a=\j4D\0>\h=ڨf\\\!\"=\;剎<6<GOWp\Խ\y9M=\9===wxD=\b\\*=\0!=|\\0$b?=F@/\z<nŽ9\<gURuU\υ\4r\\>=OW<R\\:z\"=\0M=<\;<$\s=\\=FX\Z\Q=\\4\~g=p=\fO_KaE\r<\<v:^O\\\d;L\z\_<\;ﱼT\~\Ҽ#\BiLV\C;t@<LI\}?,= r_U=򿌼qhZ2\H<!<=ev\drO\B.!<7=\0\0;3\\r=\'+=\=:M\\ȽS=i=<|<Dkv.m.p=C׼v\ =%<e<ScĻ.=&QK=]6=$>9=l\\<\m;6_=ߞ\=3 =Å_=Q\=s\"\&\qӽ?\;	˼\S<\r<bs<+c\5&w=}fs<H|=,%$=ð=5\\\r=\Ze\i<',NULL),(3183,'44a57c9b-8b5a-45df-97ef-1fd58c8e37ba',7,'is usually the case if the reservation is for a VIP guest. The above figure shows the details of the selected reservation whose arrival date is today. To check in guests, click the button ‘Check-In’ which is shown below. If the arrival date in the selected reservation matches with today’s date only then a check-in window is presented to the user. The figure below shows the window from where we can check in the guests. The figure above shows the terminal from where guests are checked into their rooms. As mentioned before if the room hasn’t been selected during the process of saving the reservation, then 0 appears as the selected room number and the system will ask the user to select a room first before entering any guest information. The system searches for available rooms based on the room type which was requested at the time of reservation and presents the options in the right hand corner of the screen. The figure above shows the interface from where a room is selected by just clicking the room number. (Note: Guest check-in is only possible after a room as has been assigned). When a room number is selected, a prompt is presented to make sure that the user intended to select that particular room. After pressing ‘Ok’, the selected room appears in Red as shown below. Now we are ready to enter guest information into the system so that the check in procedure can be completed and keys can be issued to the guest. The figure shown above is the terminal from where we enter all the guest information during the process of check-in. The entered information of the guest is saved by the system and it can be retrieved again in the future if the same guest decides to pay another visit. This type of guest tracking technology is found across all different PMS’s around the world and is one of the most helpful tool with which a hotel can understand more about its relationship with its guests. Let’s move in deeper into the details of the final stage of guest check in. Upon clicking the ‘Check-In’ button the above terminal is seen. The ‘Enter Guest Information’ box is already filled by the system since the guest information was already saved during the creation of the reservation. To save the information, just click ‘Add Guest’. The system only lets the user check in a specified number of guests, which was entered at the time of saving the reservation hence it keeps count of the number of guests entered. If the number of guests entered equals to the number of guests specified, a prompt is generated to let the user know that the guest assignment has been completed and that the FIT check in process is complete. 3.1.1.2 Group Check In. Group check in is quite similar to FIT check in with minor difference. Below is a screen shot of the group check in module which can be accessed by',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\j\=\<ȚibCI=)=L=T\=ݣy\\=Z\<T\<)6ɼ\E<\<=%ؼ|ӽI/=ME=\\<\dH<`	\@߼2<<1莽G=<6=)kMX\\=W=\S:=t=ޏ\H\AAǜ\ȺE$厽UY|\1;\=\r\0K\<\s֊=C<;V=r<\<\ƦU\=1e	usƼrмD\!\\nh\'\x<p\ag=~콫͞=\;#\\r\_o:\\DTP\.g+=0πp)!Q\'ʬ+\h;x\<\y=\\;P@\)&$=\U\yt4O=ę#=wR6=?a\=\\_\<\=\\=\:K.T=\<M6\\=\r\<$&:=JKV\r<\;\	>\;\a\!=yr=\=:Y<>4!=Kcw<=_Un\D\bq=ռ\	ʉ:\$kb	<\lv\<L-<s\r)t\;<N3\\\=u\R6r\\=Z<\>5\=\=8=h=Sļ_<&<=_%=o\j:T=:>Hǆ#%m\"\3F==x=\\R\'<\Z\|ņ7\\n<\\XV<	Wf\<\r=\\=\\\\j=`9c<bۃ\`\<\w+<eyƼq$\$=\\\ٗᄕ\"RX\"f7L=\̤\ғ<	\<Fw<\(\^ζ\\=k-NPq=]I\*<an<\b<yviMP\<W7-=\I\<\'2=%=?Aѥ=t\9\j\Nac^\]ma_*v\0=\=H~;\==-V=V;(\\Z=M\<\N#=z\uj̼\\U;9֎=b=t>\(8ػ\;=\W\=\!\y==\b\\=L,X<4\\ڌ<\ʓ\j=\=eC=e{;22\<\'ֻ/:Fm2<\=Z;_\0H|>G=V+dýM=\;w\˽\\8==Ϝ=Q$;?/%y.ʀS=Y\0/y<\Zz<=*PK^>6\\0{<\\\~5%b\\<\Z{\\f<O5\nFY9\EӼ﫼:VT\D⽬K\"A|/C\Z̼8\<\\E=\U%;\\ǻ<tP2\A<\\0<|v<4ߚ\=}b=tOy<#U\ZYB\e=tX_;4<T0=cT*ui=a|<BC<i`=V!=9;o\Z\A<\0=!\"\=O\Λ<\lڌn߼?d\<=\Ѽ=<S{VqG\8=\<\\ <b^>Tih=P\qA>\GE{\%;HV=h]',NULL),(3184,'44a57c9b-8b5a-45df-97ef-1fd58c8e37ba',8,'know that the guest assignment has been completed and that the FIT check in process is complete. 3.1.1.2 Group Check In. Group check in is quite similar to FIT check in with minor difference. Below is a screen shot of the group check in module which can be accessed by clicking on ‘Group Reservations’ and selecting a group that is arriving today or simply by clicking the ‘Today’s Arrival’ button and clicking the ‘Check-In’ button. The first step in checking in a group is entering the individual guest information into the system and selecting a room for the guest to stay in. Group reservations are handled by the sales department of a hotel and therefore a list of rooms, their type and their rates are negotiated within a formal written contract between the travels agencies and the hotel. Each contract has a start date and a cut off date, total number of rooms, their respective types and their rates. The hotel sets aside specific rooms that fall under the categories requested in the contract known as ‘Blocks’ and only the rooms that belong to a certain block which are assigned to the guests during check in. Hence the system only allows the user to assign the rooms that fall under a particular block making it easy for the front office staff to handle the check in process. Upon selecting any room the box appears in red and at this point guest information is entered into the respective fields. If the guest is a group leader, ‘Assign as Group Leader’ should be checked and ‘Add Guest’ button should be clicked. Upon doing so a prompt is generated to make sure that the guest was intended to be appointed as group leader. After pressing ‘Ok’, the guest information is saved and the information of the next guest is to be entered after selecting a room. If more than one guest is to be entered into a room then the respective room number has to be selected from the drop down box presented below and entering the guest information, ‘Add Guest’ button has to be clicked. When total number of entered guests equals the total number of guests specified in the group, the system generates a prompt notifying the user that the guest check in process is complete and requests to check in the guests into their specific rooms. After the user clicks ‘Yes’ the check in process is complete. 3.1.2 Guest Check Out The figure above shows the status of different rooms and with that we see there are 4 rooms which are due to check- out. We can also see that of the 4 rooms 3 belong to a group and one belongs to FIT. There are numerous differences between the two types of check out procedures hence they are addressed as follows. 3.1.2.1 FIT Check Out The hotel personnel working at the front office should be well aware of the room that are due out therefore they stay prepared for',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n&=9=\hWi=\<ia<	=hյ== /=j$0NPB<\@*<ǿ\<:m\W@<o%<#<w!Q\Hzr\+<y<K0@\np\L\:%\0>Lm=\!k=\{/==$\FᩴHįߍa\=x\	=e\;\r;\<؃\\=\b=\\n=\fO=\nє<?=ĵ+PZ\<\5\<nE\kQ\\<d<\\\`\\\\;Y0 \<c;%H3<=\=\'=vZ\\\A<o\=`۽{N;ϼz\{)\ɻ`a%\0^\=L©\\\L<u\=Y}=B<=\nպ\Ǽⰲ=\ZB<9ى0=\\=!=\0\<=X=B)$l<#崃o\\0>!h<n<Ɋ\rc\<\>O;&\.=\=>==O=\R<R\A=h\3į;lS<\=	14&I)\0<OU=\Q#\\4n=\A<m=b|=\]=A>x<;\\<k\=I\;D<%&<8\ּlQ=\Z=\=r=-\an =k\'/+<^<G-s=s\ָ\;=[I%=\\'R+=\-0L\'X\Zw>;\7\=\\D(=\\<4\=]C	\<,\~\'	<5G`</A<ށ<QEf=\\<1O<UX\<&Q\\9\y8\=\r\ܖ5==8vI=Ar>#<n\<=\@`J\'LL<r<y&\s\\7=S\һע\Z}@v,Ҽ[=FO=h>\n\J<j<dS\0\Ǫ^\=\\ܼ?\\h\=\K\Z=)ǽ2\n:f=Bǝё,F\ =b\qx\<`\=YK;Fa=CNK_(G=\\C;a=FBR\H߼\/5=S\;vY\\ϽI=T\=@\;\>,n2x=Rݑ=\\\\xy\O0=<z=qq\z<RCo\NT<I^;KF=g4\(=Z̒=\.3i}x=\K=%ЂXfʀ<óEQ\=\h=>^\\0<\S\<\I<\ďy<\!\H\	\\5];lR<~j\9<\-<S\\\0<0X$^cT<tP\\zVyR/\A\ZF=J؆\i;r<UWL=K=5\<5	<\r\\<8=N*!\<y\0X<Kzq$T-<Y\\=.dM:uE=\<\Z\<\k=*&= \<\ <<<!&=9\cH\)=/\i=G\+=PӼC4\\⫻a]74\ҟUB+z].\<ft=m\\eN=H<\>b\ü.\oN=\',NULL),(3185,'44a57c9b-8b5a-45df-97ef-1fd58c8e37ba',9,'one belongs to FIT. There are numerous differences between the two types of check out procedures hence they are addressed as follows. 3.1.2.1 FIT Check Out The hotel personnel working at the front office should be well aware of the room that are due out therefore they stay prepared for any guests who arrive at the desk to check out of the hotel. Upon confirming the room from the guest click on the particular room on the front office panel to access the detailed view of the reservation. Upon entering the detailed view click ‘Open’ in the financial information tab and click ‘Settlement’ to access the settlement window. Upon accessing the settlement window, the entire folio history will be available on the screen together with the charged rate, the total service charge and VAT shown in the figure below. On the right hand corner of the screen the reservation details can be seen such as the check in date and the check out date and most importantly the payment method highlighted in bold. If the payment method is cash then the ‘Cash’ should be selected in the ‘Payment Method’ box shown below. Since cash could be received in any currency that too should be documented by entering the right curreny in the next box together with the amount and press ‘Enter’. If the entered amount is less than the required amount then the system will generate a message prompting the user to enter more amount. If the amount entered is more than the required amount then the system will highlight the change that must be given back in NC. When all the monetary transactions are complete click the ‘Accept’ button. Upon clicking the button a prompt is generated to confirm the check out of the guest from the hotel. Upon clicking ‘Yes’ the FIT is checked out of the system. Then the house keeping department is notified about the departure by changing the room status to ‘Vacant – Dirty’. 3.1.2.2 Group Check Out The screen above shows 3 rooms that are checking out and that all the three rooms belong to the same group. The method to access the check out screen is the same as FIT (by clicking ‘Open’ and then ‘Settlement’) but the screen can only be accessed through the group leader’s room which is highlighted in white (room 402). Below is the screen shot of the settlement window for group check out. The rates that are charged is automatically picked by the system which was chosen at the time of reservation. On the top right hand corner we can see the list of extra charges that needs to be settled before the check out procedure can be taken forward. The extra charges if present, can be settled is a very easy manner. Since the charges are posted in individuals of the group, they are the ones responsible for paying their extra charges. Therefore each of the rooms need to be selected from the ‘Select Room’ box and',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n<>۩=\Z6ܽH׮\\<ƾ==|=\$=\>=\<Kİ=\(\\0=#W;n\\s7\66<u\=\\T`ݼkSٝ>=\\߮2<O=\\\)G\I=\\=x\<\\\$8	`\UD?A\0@H;g\\q=\)=\&;捘<x2=\r8\=@\<*5<\a#;\k=fܤ8=\nE=1\<NH\\V\O\r)$<dH\Zޫ<+<d\\\<S<\}!#k\mڽ>-;\ʼ\@<Q\\"\i**=\\<\J<\\н\<S=i)В\n=E5=M7F8ၽ\\\=DQ=*\\\Q\=\Zmm=\><\\=ֹ=!d;6\%=r\<*\\%s=Ӈ=؊=\h򡇽F=֠=D\3bG+= =3=\昼\=\\<m	`;aw&\<l=<\	m\ڼ\'ۂ\Qm\"\~q=T`\Q=C=.ʣ=ZVK;Y:)/|;9YpI=\4=׹<oK=\2<4\r\r=ۏ\<f$~=aw=&=Fj=h\\߼Oգ=\G\y<0<m\\< Ȁ<\2=+\ݼ\L@3*9<X\3=\\ıLPm=`2ռ[=\Ϋ=\50l\ȹk<J[v\<h!<\\=;\\	\6 [Ƚ߷d=NZ^C^=TRp=Is\=j=Z\v<w\<)\s<%q\\ؼɽn\^=\'\e\=SeJ0\=,\\"=\oku\n$=\\\n;̅=\\s\ٛ<6Lj%MQ=L^;̮V^=\H\<+\Ｏ6<\fkd:D:\<\n@<\U\Nc=\z<<\h$<1<J\P=`\=v\I\	=\\]Z?Vy=uȼѽ\O&=nC=X=ϣ:\"\<;\"k=[Ubv\w߻𼲊<\@/vA-<\b\"<e<R>~+=^\_t\)ռ\\\\<;j7=\n\e<B\;%f=/\<\\\\x۽K=\sK=\'<a=ｕ\b\\\}<~\\na\꼾Uј&ab\\b2C\K<U\<\|pNq;\o=$;=&۽x	uC=^3+\\;\\˽\'\?\<\\\<_=\$<\6\½\I\:\\s\nջbe\N$>9<V<F<\0\=b\:@6\<ۏ=\\<@\a=TS\=MS;ʽә`1P\<\\\0=ՉG[c{Zm֘̽K\\R#\X=\<ʻV&5\"\<\&==X=2ٻ\B=;',NULL),(3186,'44a57c9b-8b5a-45df-97ef-1fd58c8e37ba',10,'taken forward. The extra charges if present, can be settled is a very easy manner. Since the charges are posted in individuals of the group, they are the ones responsible for paying their extra charges. Therefore each of the rooms need to be selected from the ‘Select Room’ box and their individual bills need to be settled. After entering the payment method and the amount press ‘Enter’ to save the information. If there is another room with an extra charge posted to it then it can also be selected from the ‘Select Room’ box following the same procedure of settlement explained above. When the required amount has been entered and also all the extra charges have been settled click ‘Settle Bill’. A prompt is generated to confirm the action. After clicking ‘Yes’ the bills are settled and now the check out procedure can be initiated. To go ahead with the check out procedure the billing instruction needs to be checked. If the billing instruction says ‘Bill to Travel Agent’ then ‘TA Voucher’ should be selected as the Payment Method. If ‘Payment at Check Out’ is the billing instruction then the amount, currency and mode (cash/credit card) needs to be entered. When the parameters entered are accepted by the system click ‘Check-Out Group’ button. Upon clicking ‘Yes’ at the prompt the group is successfully checked out of the system and out of the hotel. 3.2 Point of Sale Functions 3.2.1 Start a Table The figure above is a screen shot of the main screen of the POS. The numbers on each of the green buttons represent a table number and the color represents its present state. To start a table one must click on the respective table where the current state is vacant. Upon clicking any of the vacant tables a prompt is generated for the server/manager password. After entering the passwords the system asks for the total number of guests being served on that table. Upon entering the required information and pressing ‘Ok’, the ordering panel becomes available from where we can select the items that were ordered by the guest. After the ordering is complete the kitchen is to be notified hence the ‘Send’ button needs to be clicked for the order to be sent to the kitchen. Below is a screen shot of the ordering panel. When the ‘Send’ button is clicked, a printer placed in the kitchen prints the KOT’s together with all the information such as the table number, ordering server, order time and order details in that KOT. The table status also changes from vacant to occupied. 3.2.2 Add more items to an existing Table To add more items to an existing table just click on the respective table to open it. When the ordering screen is screen after entering the right server password, select the items being ordered just as before by clicking their names on the screen and when you’re done click ‘Send’ for the kitchen to be notified. 3.2.3 Settle a Table',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\\k<7\=\xz_<\0Q\\=\¼QQ=^(=\n|=) \Zz<\"rf =Ľ\2\.l=~JQ@l\\(t(#λ\$9;[H7<4\"+=\\=\Zd\<\o\\==\\\;\Gkkl\]<\'͌!\;\n\y\y=t[<\\\hp=ˊ0\}=\f=\8\$<Q\?=ӑI+;\=/Y:Q0꽼^L[<J,\0=E+\L=\5\:8\n=U<WPE1\<E>=<sȏ=9\=r\\Zp9\=t\\\<\,֫5	<`=t\\t\\;c\=\=);Ī=\n\9{lnDܖ=\0\:1F=o\<e@ټ^/D\=O\nNt\=\\;8=\$T>T Ld?=\Iz\=zK\<ؗc<=9q$F=s%=~\d*//=\"G=]\,=\˛	\o|\rlY=\C\n\d߼\\U=\\U\Z=\4OJٽ\5=\})\9R\r\C=C=3\;*˻p==N\=<\I<t\\<jX;=q<Q<x=ۯN\\=\\\<\d;q\W=<\r1\O.Ǽ\w\<(\7r/H=\x91Ȑ=\\=KPR<eԽd\~\\n\fý\\G3;0\^~\;\\eU:ONF\:qf\1\'A=E؅\)R=+>\h=\쨼Ȅz=^B+<M\n=yR5jb=ZZK@T:=;=)=:<c\ pT\\eW]\\@\=sWQ\<b=+Z^;Ө?`<0=\\\\!\=\=3<oF=\]\'=j\Z~=L׼\<;ǮZ==Eo4=\'輿;?\<C=/KH=y2<e@\\\Z=\'\r=\Y=Kýd=_~<\ZNc=\N\=!x=@ɼ\!\Oj=\\#;\zɽ#FлTJWEѕ\\E̼6g鼍\!\u<\?Cd	>a=Bͼ;;<mR\3P#=ڄ1:،=Y|;T\{\=\\C=B\y]}A=0\r6\\=\f=3˫C\ͼ]Ƽ)<\\=Br\;!\:\nj<-=[ⒽBϻ\Ծ=\(]*\I%\\C\0==\׽ \=[\E;\<<\ZM<㠽G\y]<\L5()3_!<P\	<\+K\}\<\nv<^e0\=Ud<]\`	Y3=K:]\\}OA&=\F<)>=n\<=[¢+\Kg5<zzѽiP\K%\ѻ\]=\1f=P3Q-\<\&<o==\"<Ml\;̫\0<\\',NULL),(3187,'44a57c9b-8b5a-45df-97ef-1fd58c8e37ba',11,'on the respective table to open it. When the ordering screen is screen after entering the right server password, select the items being ordered just as before by clicking their names on the screen and when you’re done click ‘Send’ for the kitchen to be notified. 3.2.3 Settle a Table Open the table which needs to be settled and click ‘Settlement’. Below is the screen shot of the settlement window. A guest may desire to settle a bill in numerous ways such as cash, credit card or post it to the room. After selecting the appropriate payment mode, the amount is to be entered using the keyboard or the key pad provided in the panel. When the correct amount is entered the ‘Amount Tended’ button is to be clicked which will calculate the change that needs to be handed to the customer. To end the table click ‘Accept’. When the ‘Accept’ button is clicked the system makes sure that the entered amount has covered the amount due and only then closes the table and saves all the necessary data for accounting purposes or for any other future reference. 3.2.4 Split a bill Splitting a bill is one of the most important features in a POS that is used for a variety of functions making its application quite handy at times. A bill can be spliced for a minimum of 2 ways and a maximum of the number of items in the bill. For example an order that contains 5 items can only be split 5 ways. To split any order, open the table and click ‘Split’ after which the figure above can be seen. Then click on the individual item that needs to be spliced. When selected, the item appears on the left hand side of the screen. If ‘Split’ button is clicked at this point then the system will split the bill two ways with the selected ‘Red label 30’ appearing as Check 2. Below is a screen shot of splitting the bill in the manner mentioned above. When the bill has been spliced as per the need, ‘Done’ button needs to be clicked which closes the split window and takes us back to the ordering screen but now with an option of selecting which check/bill we want to view shown in figure below on the right. By selecting either Check 1 or Check 2 we can settle them individually as if they were separate tables. The un-splitting of the bill can also be performed at any time by clicking on the ‘Un-Split’ button presented above in the figure on the left. 3.2.5 Add modifications How the food is ordered by the guest might not always be the same even if the same entrée is ordered as different people prefer different way of enjoying their meals and as a hotel/restaurant guests have every right to demand things the way they prefer. Adding modifications as such means informing the kitchen regarding any special requests made by the guest so that',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\\x[=\"rtѼ\\Ľ/M<=p\;HMq=\\={\<!x^uj\"\<m=\\\)\u: =N\<\;$ߔ6=\\<U\n`<N\]:G8=\=\m)$\gSܻ۶߼9\0ۛ<s\/\K<(i\0=?\;&==4:u0=\r*<\´\=\?8f)=\\>:<\d*F\41]=\"\\:p,=Ђ\;]<\䎼:x-=\rN: >oqǽ鐼-QS<&\"<\?<\v4<a=\L;	e\n?h\wi=\?h*\=\n\=	\"=j=a89\;k\\=^=3=O=|<=\ʼ=\^@=wy!_f=\	ݍgX\<6=\-{ע&~=\~ȼ\;\\\=ahH<+Kx=kА;\=g,\<\'!Q*뮽5<`]M\=Pl<x?=7A7\t=]<=ZM@=\q;BK⑽\˻H=?\V=[$P\r>7I=\\=,$=])}<=s<q=X&\C9<\ټ3\<kq\"\U=ĭmʍ\':缇w<<tҽ\K=\[F73s=\6=p=\ra\\\0<\1X}嵽\l?<kvRo󦽲J\rߋ<\#=9\n84=#Rͼ#=\0J\˽ī===\ⒼA\nҼ\n=V	Ua=.\<.h\<!g\2=cl;H=\Z\,<\Z<HC<>7=Q\;љ\n>c\"yDm=1~b\ļ\g<=\\\$mF=8\=)\½i=K\"#@n0˻\/9=\=\nZ<>XK=5<~=*/;kn<\\P\sK\0\=ռu\dZ=\nE=	hUR=j=\v-\=yd<\l9h=:H;i|f;\Oȼ\e/<O;:>{<\\u\n?\=-=x\<\]LYe轉2=\\=\=Y;%<v	=mH6\\<0\n<t뽠=I	>ռ_>i<iX|_^ý\ƼnML=\<7QYtM=PK&\=8.Ű6\Hq<[޽Xl<5=TUT=ryQdjĪE㚽\\ټ\H\<Le\<Zgڼ\=[CjP9;\n=6\2=\\\=b^\\+<\\'\<NE\k;=\;ӭ߼4s\<,=&+P<5H><3@\3<Id=`u<\\\y<m/ϻ\=\Z\r=_=\5=h\g؜H\?L\\<\Z^\;\@^\\ؼq\<\e=\=z=\\\\s\=;\P=\\\w=<\;Zz<\<)\0+T\\',NULL),(3188,'44a57c9b-8b5a-45df-97ef-1fd58c8e37ba',12,'even if the same entrée is ordered as different people prefer different way of enjoying their meals and as a hotel/restaurant guests have every right to demand things the way they prefer. Adding modifications as such means informing the kitchen regarding any special requests made by the guest so that there are no complications later when the food is delivered to the guest. To access the modification screen the ‘Modification’ button needs to be clicked and the modification can be entered only after the menu item has been selected. Below is a screen shot of the modification window. Any modification can be sent to the kitchen by typing in the requirements either by keyboard or from the screen itself. When the modification is typed, click ‘Done’. This will take us now to the ordering screen where the modification appears in the box presented below. Upon clicking the ‘Send’ button the new order will be sent to the kitchen with the specified instruction. 3.2.6 Void Items Items need to be voided at times for numerous reasons such as for a mistake that the server committed while ordering the wrong item or at other times the guest didn’t necessarily like the food hence he/she decides to change their mind and order some thing else. Therefore to address these issues and many more the system provides for a way to void items. However voiding items as such is not a very good practice as it might create problems with the tax officials during auditing if done frequently. Therefore it is encouraged that the users be alert and calm while entering the order and double check it before sending it over to the kitchen. To void any item select the item from the ordering screen and click ‘Void’. Voiding credentials are only provided to the manager hence a manager password is required to enter the voiding screen. When the correct manager password is entered, the screen below will be seen. Before voiding any item a reason has to be selected. This information will later show up in the managers report so that a close eye can be kept regarding the use of this option. When the reason is selected, ‘Void’ button needs to be clicked which voids the selected item and takes us back to the ordering screen with the revised order list. 3.2.7 Room Post Room Post pertains to posting the restaurant bill into the guest folio so that the guest can pay all the bills at the time of check out. A guest may also be entitled to a meal as per the meal plan purchased hence the server/managers need to be aware of how the bill is to be settled. To complete a Room Post click on ‘Settlement’ and in the settlement window click ‘Room Post’. Below is the screen shot of the room post window. Before posting anything to the room the server/manager should ask the guest his/her room number. The room number is to be cross referenced by entering',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\rL\<p\=Pe<;U=\\_\<E<\I^$\<h-=\4\<\\\\Wׅݫ<@kE\=!;\`Z\K୘<V֨;g\\<\ MlL(4\;=+O<><=}\<\\< c.Z^H-as+w\<8*.$Yȵ\}jWiwK_-\\Ry\ \cҼ=a\q<\\RMQ#k_=|{=\n3;,8:>(8]=~<1ݻq<\=6<\\.=\MWTPfS<9\RBZ\CR<_*\|p=7VK໭Ol<eN\yȠ\</]|=\C=\\\<F*p:[jn?K=]6<]\\}&5+p</=<g\L=o<+=ꉘ=\/(|=P\輑׻\k1\=<w\ݽ\\\\Z#\}=v\n<=P`=D/\=\x\Q\=!\n9sO\jd8=ޒ<\;>h -KH콻	YC5=f\A=\4\63=	bO<f=v\=Ur(=\<ż@!q9\\1</_<+s@=\ք\=l;\qV\r=\"z_ K<<\5>\"U</&B<s̶\'pH\Zj=\Ζ`K=<=\J:A<\\l<c=&\g=\W8=!\g8;	O\\<\:\0=$[=~m=¼\9zwn<n\<\?+<z\\Y=v\;X<\E=Ȕ6;h	\eǼ\\<@x\\'\\<\9;\Z;=\\\#\'\v˼/=k=8<M:\;ޑ;2Rj=cTm=@=*\3ϋR+\Lr<\(=gB&ǽy\\<f#\h\ф<\4<ࡽ@wD\=M7\<M\0v^b;4\=\{=t\'Z\\;CM=_\=\x;:oѽT\¡Gh\Z%`==\'B\<%=F[>H=S\<\J̻=S\= <\0ʼ\衽Ǵ<_T=!&Ċ<[\96%p(=Db=V>IWGfX:\;Q=-=M\;`!~*4տ=\\;\_~\\Z=j:\\\=!w`\=v\\\<\0k=\<\<\"x\\U-3\?=ҍ==\ =&.\\<\w=IW=_w<Q+\=J=L|[Ic>5\:i4FJdL=/={O;a\,F<3\I,ʼK1[<-\<\r4;v=F_<(\=UBRJt\I~<7<]\=\e=1\r_\	=s3>\,\g)\rs[<,<\zM>hGҽa\=DuZ%<SMFP^\Ⱥ.Pw\;\l{=5<៌a<?\=\)A<PC>\	=_<\\\=\䠼F8\"',NULL),(3189,'44a57c9b-8b5a-45df-97ef-1fd58c8e37ba',13,'complete a Room Post click on ‘Settlement’ and in the settlement window click ‘Room Post’. Below is the screen shot of the room post window. Before posting anything to the room the server/manager should ask the guest his/her room number. The room number is to be cross referenced by entering it in the respective box and pressing the enter key in the keyboard. The figure above shows the information of the guest staying in the room 605 with their respective arrival and departure dates, meal plans and the total amount due. As mentioned before there are two ways to settle the bill. One is to post the bill as a charge so that the bill maybe settled during check out or it can be posted as a meal plan so that the guest is not charged. If ‘Post as Charge’ button is click then the bill will be charged to the guest folio but if the ‘Post as Meal Plan’ button is clicked then bill will be settled as a meal plan. However across different parts of the world including Nepal, alcoholic and other certain beverages are not covered under the meal plan. Hence in that case only the items applicable will be charged as meal plan and a separate bill is created for the other items which cannot be covered by the meal plan. But this new bill can be charged to the room as a charge. 3.3 House Keeping Fuctions The house keeping department of the hotel is constantly made aware of its rooms and its status by the house keeping module of the SDC which provides all the information in real time. During the busy season of a hotel the house keeping department is at its busiest therefore they clean the rooms from floor to floor and during slow seasons the rooms are cleaned as necessary. SDC also provides this similar functionality where the status of rooms can be changed individually or by the floor. Some of the basic functions of house keeping module is explained below. 3.3.1 Change Status Individually. To change the status of any room individually just click on the particular room from the screen shown above. For example we are selecting a room with room number 604 who’s current state is Vacant and Dirty. A room which is Vacant and Dirty can only be made Vacant or Out-of-Order, therefore these are the only two options available. To change the room to a vacant state, just select the option ‘Vacant’ and click on Change Status. 3.3.2 Change Status Floor Wise. To change the status floor wise click ‘Change Status’ button presented below. Upon click it, the above screen is seen. The house keeping provides a way to search the room according to their state and floor. The two screen shots below show where those options are available on the screen. By selecting a particular floor and a particular room state we can search for all the rooms that satisfies our criteria. In the figure',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n<\=r+Y^<\\ټ%=:\.<==y<+Խ\\<\==ELdʼ\$=\\0\<^v=q<Ӏ=%}\'>=jʺ\\`p=\N=P=ˇ9<\\0;\\R\=j^ƣ	̳;\Ǽ\r;\*\|<O=tb?z=k4=:\\;ұ:=\8%m\20=*]sv\09<SM,C\/%uM>\<K<ܞN=TLYcD~g<:<2\=~?<\\0H\<\\;\><\B=s\"\hJ^v];9~ws\'7=2\;j\@SU=d\=]\<p=2X=\%/T\b=\H= >=a=\\r%t;\9=a\n\=!p=_5=E2\\b\F4$=\[*<\{<Z?=]h>d\\P=\<\\^댽\b)y7#=	#)B\q\=ϾjMќ\<鹚=3<A\=+\u=%h~\B[=&<&s>(:H?{6\=\j=\\qh)=	=\9=c=^\Z7\\<?U<JI=ԕ<\\%\=\̻U\I5\<A\<\U\\<\䶽k\=\\\<,K߰<l=\:\<Zҽ7\'\ڽ\r%qFn\6=\|l\I\\\b<^q\\\<\W%=aO17\5~^idt=C\bǯ/=+;=\"a9=))5v=c\¼u;{<k=\jۼa2V.\a<6=\n<Zs<\7\;Ȣ;=:<tǼYݼ^<p\\\>7\0V\к|܌;7\Z=0\(6W=<6_\}^=\ZZ\ة<7\<>=Ђ=\n<W=7=C}#P<\_ai<rV=:c:=\\~4\:=V:װԽb<\\^\\<\\<\i\G=w\=\\)\\Ƽ	z=C&<ͬ콽z\K\Z;><	\:T\Om.G\d=l\g=y:=-F8z=;5=l<D\<=s==^y;Ko=<|ŝ=E\\<[O=A;$C,X4eQǼ;%M4\G=J	:;u<͞B\;TD9d7vPl:4\\|G<\"k</x\I<\\r\}\m2=sW<;Pb=9p˼\\rcǰ=\0=cdlbS\?Mr<u=@Xf:<\>8ҟ=AɇWt=rߐ\a3=XxGK<.J%}N=jU=\^Zy2|ڻ	E=c#1\k\SuAعS\\N+\Ի(\X=\\j=>w9(\q\=n\'h=ŉ<\\=;	(V*s',NULL),(3190,'44a57c9b-8b5a-45df-97ef-1fd58c8e37ba',14,'a way to search the room according to their state and floor. The two screen shots below show where those options are available on the screen. By selecting a particular floor and a particular room state we can search for all the rooms that satisfies our criteria. In the figure below, we have selected all the rooms in the 6th floor that are currently Vacant and Dirty. The result of our search is seen on the box which is pointed by the arrow . We can individually select the desired rooms by checking them off or if we wish to select all of the rooms at once then ‘Select All’ has to be checked. Now the selected rooms can be either made vacant, out of order or occupied-dirty which is presented on the left top corner of the screen shot presented above. To change the status click ‘Change Status’. A prompt is generated asking if the user is sure of the operation. When clicked ‘Yes’ the status of the rooms get changed. 3.3.3 Maintenance. The maintenance function provided with SDC is not a separate module but just a functionality which enhances the capabilities of the house keeping department. When the house keeping department notices something not working in a room such as the mini bar or the television, they notify the maintenance department regarding the nature of the defect filling out a form which is presented in the above figure under ‘Send Response Request’. After receiving the task the maintenance department on the other hand mobilizes its crews to take the right course of action based upon the information that was passed from the house keeping. Upon completion of the task in hand the maintenance notifies the house keeping and only then the house keeping change the status of the room to its respective state. Below is a screen shot of the form from where the maintenance is notified. After filling out the appropriate fields shown above the task is sent to maintenance by clicking ‘Dispatch to Maintenance’. When maintenance sees the task and completes it as requested, they resolve the task by clicking ‘Set Resolved Time’ which marks the task as Resolved. Below is a screen shot of the Maintenance which can be accessed by clicking ‘View History’ in the figure above.',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \nn;\0ټ\\<\?r=/`=Ln;e[=ce9<t!<\4=\\\<>\y᥼\=\\\}sZ.#(7F=b\J<S\r8r=*/\\<\vT<\\RO<\'==M\w=\\=6~kxVq<\=\\\	@<\H:(YO@\\<\\٨=\=+t\\"<\r=\\=%Q\=v\V=6`=X=&H3$%gG=SN]4\2<\$:i=t]@<_6\\d=wfiXr=K{=\c=	\d=1J˼Ǉ;\6C=Sֽ\).эJ\ =ꊼ\\\<\Lf&\h=\0_Z<0=_2`\;AH6+6?\<sƃ<\<5;6<L\?\7=b<t\<<w\)M7ͽ\v<D=P\19\\\'<M\=);~ؼ\zü:=ܓ,V\\\'\' =\0!(<\=d	 Nz=K,;/\=Ꮌ\`;%0;ƥ=c\x<m\<*=\Aq =j<;Z=5i=7=.<\=:\ixy=X=+\=q+\<\A	\<QD\WV=\--S,=\#\<[=]=g2ͼY6pPV^<%i=ŧ0</\!z=i2g\pG=4cH=d\'=*2̝<h<庻Ov!H\՛<\\&=*!!\\\\\<wO<7\P\<\nS\Pu=>4\gt^(\\=\\<μ\\qRKo<1+6ij3/Sl_+==\#ev;\r\<~Gv7=77ϼ\N=\|<۲=v_F;J.=c\\=G)-y\)C\\\M\=\X<<nP2Nv\>=),F\=\\\p=ht޽\v<ⓗ\"=@<\\\=Tx<DIA!T\\-\\=:\nf=b~<9/YUq=)=^v\F=X:@ŏަ>PU<ӨJ=Pq=ך.RZ;>7<>\'\\\c<l\=Z<[\\<\Ļ;F=.8aM<1[=ǧ<^=y\\nBg<ʒ2\:\<zH<Tgf;Z\S<%н;\7_\\\\\0<\|+֔=\[=M\)	3S\<ftE\n\t7o\R$R\b\\=`\\%\Z=\=F\= T<k\<\\Z<\2Za=:{;l\uC\_\"5<3J=L?a\><=A=7BQe\\F\-=3\=\\&=Q=fO=\b~\5=_1=\ْa.=!?=\1\	Ǽ+<l;jt?\"U=ĕ\\@<	y`ܒ]-L=\q\;\=ǳ1=\<\c<\=\1\<',NULL),(3191,'5dc74b21-17fa-4a69-b5c1-02ca12686a60',0,'Welcome to OutletA! We offer the following services: - Haircut - Massage - Facial treatment Appointments are available Monday to Friday between 10am and 6pm. Please provide your name, desired service, and preferred date when booking an appointment. To cancel appointment you need to visit url https://abc.com/cancel_appointment',_binary 'NUMPY\0v\0{\'descr\': \'<f4\', \'fortran_order\': False, \'shape\': (384,), }                                                          \n\7b:\>\;\n-=;n\T\;#\߼ͯ\nֻ\\L\\=x\s<\9W=\[\<F\0eM\=\`\<רE<TY00=?8\n<)@^\<\M}1|ѳ=ʻ\nʼhFO=k=Hq\=\=G2>w㴕S>=}K=m.<)n\\\\D<\&<F.\\0νa\=\6<\'\	T=.*\:\\,<<SϷ=\l,YS1$ƪ=\"zὡvfZ9Vb׀=\u½jý\윽9F<5W<\<\x=\;_\0\\r=\<=Kig<nc=ζ	E\ּ?ƨ\c\;{,^Ͻ*\;x\n>Fyu<%L\\[=g\fS_7G=#\=\\\r=*7eR>	=\ ?ڡB[\\jj֧$ѽ%}fD\=-\=|\<><\w\-=h2\<.<\N^x;sG=\	\ڹ\"ڢ<\M)\<g=\]$e<ܐh<G@}<\\ϼe=C\<\"\7	91\;=\\=\+B;yI<r=3\u\ļe=\X켸\0T=H\:\W彐b=\*\<%P<s=&5<=v97J<w\}ڼ\CWO\iӌ=\̼\\<\\-;;\_;\'3Zl\\=2h=P+<\p8;}<\<8=u\<\<h5s<o\<6\>=B\<	D\\0Q\K`;XF=?ۻU\ͼ\\Z\\=X6\:,5F\\R=P=\3=6=:\r=y<FD=m/A52=\@X\;\]6=C.p\=d=m==\`\<C=ls\;j4=\b;\g\<BS<r;,=k\\I\r\\<&Q\CV=%\\=a<\\[z<\;\"=\]=J=6\m~іNM\<p=s(\=ǥ\\E=N\\<A\rB<a} 5ǣ\Fz?!=\n\\+<\nԙ١?=3<n;\Ĝ= %*Y{=$$=`z+C<#=\s=:=*<Vx@<&:\Hq=\;{ʻo\=P\<2I\h\=u<3Q!	<\w\;\\\ż\<t=\0=\ͩϲ=;H:k<H\=g!\(~\\;=z\n\,=E\(\==<(\<\=Y׳=O=Xh<]¼<s=Ε<SX=JI@\n=\dzi\=vQ{J>Jw*9!j~»b8<Jڽ(YA(\i\ױD;(\Fҷ\JG\\(.#\0\\n:\\=ͯӼR\Z=\M=_`ļ\88=+f>=hI\'=AC= ;^2x<=)=wO\Yx\y& X','e582dbe1-68b0-471d-b4e2-49b47816f0ae');
 /*!40000 ALTER TABLE `embeddings` ENABLE KEYS */;
 UNLOCK TABLES;
 
@@ -85,7 +93,8 @@ CREATE TABLE `image_ocr` (
   `filename` varchar(255) DEFAULT NULL,
   `detected_text` longtext DEFAULT NULL,
   `created_at` timestamp NULL DEFAULT current_timestamp(),
-  PRIMARY KEY (`id`)
+  PRIMARY KEY (`id`),
+  KEY `created_at` (`created_at`)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
 /*!40101 SET character_set_client = @saved_cs_client */;
 
@@ -98,6 +107,34 @@ LOCK TABLES `image_ocr` WRITE;
 /*!40000 ALTER TABLE `image_ocr` ENABLE KEYS */;
 UNLOCK TABLES;
 
+--
+-- Table structure for table `image_ocr_embeddings`
+--
+
+DROP TABLE IF EXISTS `image_ocr_embeddings`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE `image_ocr_embeddings` (
+  `id` int(11) NOT NULL AUTO_INCREMENT,
+  `image_id` char(36) NOT NULL,
+  `chunk_index` int(11) NOT NULL,
+  `chunk_text` text DEFAULT NULL,
+  `embedding` longblob DEFAULT NULL,
+  PRIMARY KEY (`id`),
+  KEY `image_id_chunk_index` (`image_id`,`chunk_index`),
+  CONSTRAINT `image_ocr_embeddings_ibfk_1` FOREIGN KEY (`image_id`) REFERENCES `image_ocr` (`id`) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Dumping data for table `image_ocr_embeddings`
+--
+
+LOCK TABLES `image_ocr_embeddings` WRITE;
+/*!40000 ALTER TABLE `image_ocr_embeddings` DISABLE KEYS */;
+/*!40000 ALTER TABLE `image_ocr_embeddings` ENABLE KEYS */;
+UNLOCK TABLES;
+
 --
 -- Table structure for table `outlet_command_slots`
 --
@@ -112,6 +149,7 @@ CREATE TABLE `outlet_command_slots` (
   `required` tinyint(1) DEFAULT 1,
   PRIMARY KEY (`slot_id`),
   KEY `outlet_command_slots_ibfk_1` (`command_id`),
+  KEY `command_required` (`command_id`,`required`),
   CONSTRAINT `outlet_command_slots_ibfk_1` FOREIGN KEY (`command_id`) REFERENCES `outlet_commands` (`command_id`) ON DELETE CASCADE
 ) ENGINE=InnoDB AUTO_INCREMENT=36 DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
 /*!40101 SET character_set_client = @saved_cs_client */;
@@ -141,6 +179,7 @@ CREATE TABLE `outlet_commands` (
   PRIMARY KEY (`command_id`),
   KEY `document_outlet_name` (`document_outlet_name`),
   KEY `fk_parent_command` (`parent_command_id`),
+  KEY `outlet_parent_text` (`document_outlet_name`,`parent_command_id`,`command_text`),
   CONSTRAINT `fk_parent_command` FOREIGN KEY (`parent_command_id`) REFERENCES `outlet_commands` (`command_id`) ON DELETE CASCADE,
   CONSTRAINT `outlet_commands_ibfk_1` FOREIGN KEY (`document_outlet_name`) REFERENCES `users` (`iframe_id`) ON DELETE CASCADE ON UPDATE CASCADE
 ) ENGINE=InnoDB AUTO_INCREMENT=25 DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
@@ -156,6 +195,33 @@ INSERT INTO `outlet_commands` VALUES (17,'e582dbe1-68b0-471d-b4e2-49b47816f0ae',
 /*!40000 ALTER TABLE `outlet_commands` ENABLE KEYS */;
 UNLOCK TABLES;
 
+--
+-- Table structure for table `outlet_keyword_segments`
+--
+
+DROP TABLE IF EXISTS `outlet_keyword_segments`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE `outlet_keyword_segments` (
+  `id` int(11) NOT NULL AUTO_INCREMENT,
+  `document_outlet_name` varchar(255) NOT NULL,
+  `chunk_count` int(11) NOT NULL,
+  `segment_blob` longblob NOT NULL,
+  `created_at` timestamp NOT NULL DEFAULT current_timestamp(),
+  PRIMARY KEY (`id`),
+  KEY `outlet_id` (`document_outlet_name`,`id`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Dumping data for table `outlet_keyword_segments`
+--
+
+LOCK TABLES `outlet_keyword_segments` WRITE;
+/*!40000 ALTER TABLE `outlet_keyword_segments` DISABLE KEYS */;
+/*!40000 ALTER TABLE `outlet_keyword_segments` ENABLE KEYS */;
+UNLOCK TABLES;
+
 --
 -- Table structure for table `users`
 --
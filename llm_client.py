@@ -0,0 +1,85 @@
+# llm_client.py
+import os
+import time
+import requests
+import httpx
+from flask import g, has_request_context
+from prompt_builder import MODEL_CONTEXT_TOKENS, current_labels
+from llm_scheduler import SCHEDULER, ASYNC_SCHEDULER, INTERACTIVE
+from metrics import record_stage, stage
+
+# Talk to the Ollama server over HTTP instead of spawning `ollama run` per
+# request: chat messages let the server keep the KV cache for a stable
+# system prefix, and the response carries prompt-eval timings.
+OLLAMA_URL = os.environ.get("OLLAMA_URL", "http://localhost:11434")
+DEFAULT_MODEL = "llama3.2:3b"
+KEEP_ALIVE = "30m"          # keep the model (and its prompt cache) loaded
+NUM_CTX = MODEL_CONTEXT_TOKENS
+REQUEST_TIMEOUT = 300       # seconds, same as the gunicorn worker timeout
+
+
+def _payload(messages, model, options):
+    return {
+        "model": model,
+        "messages": messages,
+        "stream": False,
+        "keep_alive": KEEP_ALIVE,
+        "options": {"num_ctx": NUM_CTX, **(options or {})},
+    }
+
+
+def _parse(body, model):
+    stats = {
+        "prompt_eval_count": body.get("prompt_eval_count", 0),
+        "prompt_eval_ms": body.get("prompt_eval_duration", 0) / 1e6,
+        "eval_count": body.get("eval_count", 0),
+        "total_ms": body.get("total_duration", 0) / 1e6,
+    }
+    print(f"[LLM] model={model} prompt_tokens={stats['prompt_eval_count']} "
+          f"prompt_eval_ms={stats['prompt_eval_ms']:.0f} total_ms={stats['total_ms']:.0f}")
+    return body.get("message", {}).get("content", ""), stats
+
+
+def chat(messages, model=DEFAULT_MODEL, options=None, priority=INTERACTIVE):
+    """
+    Send chat messages to Ollama. Returns (content, stats) where stats holds
+    prompt_eval_count / prompt_eval_ms / eval_count / total_ms.
+    Waits for a slot in llm_scheduler first; raises QueueFull if it is too deep.
+    """
+    _, outlet = current_labels()
+    queued = time.perf_counter()
+    with SCHEDULER.slot(priority, outlet) as position:
+        record_stage("llm_queue", time.perf_counter() - queued)
+        if has_request_context():
+            g.llm_queue_position = max(position, g.get("llm_queue_position", 0))
+        with stage("llm"):
+            response = requests.post(f"{OLLAMA_URL}/api/chat", json=_payload(messages, model, options), timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    return _parse(response.json(), model)
+
+
+# ------------------------------
+# Async client (asgi_app)
+# ------------------------------
+_async_client = None
+
+
+def get_async_client():
+    """One pooled httpx client per event loop process."""
+    global _async_client
+    if _async_client is None:
+        _async_client = httpx.AsyncClient(base_url=OLLAMA_URL, timeout=REQUEST_TIMEOUT)
+    return _async_client
+
+
+async def achat(messages, model=DEFAULT_MODEL, options=None, priority=INTERACTIVE):
+    """Async chat(); returns (content, stats, queue_position)."""
+    _, outlet = current_labels()
+    queued = time.perf_counter()
+    async with ASYNC_SCHEDULER.slot(priority, outlet) as position:
+        record_stage("llm_queue", time.perf_counter() - queued)
+        with stage("llm"):
+            response = await get_async_client().post("/api/chat", json=_payload(messages, model, options))
+    response.raise_for_status()
+    content, stats = _parse(response.json(), model)
+    return content, stats, position
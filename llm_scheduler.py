@@ -0,0 +1,193 @@
+# llm_scheduler.py
+import asyncio
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager, contextmanager
+
+# Ollama runs one CPU-bound model; letting every request thread hit it at
+# once only makes them all slow. These limits are per worker process, so the
+# box-wide ceiling is workers x LLM_MAX_IN_FLIGHT.
+LLM_MAX_IN_FLIGHT = int(os.environ.get("LLM_MAX_IN_FLIGHT", "1"))
+LLM_MAX_QUEUE = int(os.environ.get("LLM_MAX_QUEUE", "8"))
+# A waiting coroutine costs almost nothing, so the async app can hold far more
+LLM_ASYNC_MAX_QUEUE = int(os.environ.get("LLM_ASYNC_MAX_QUEUE", "256"))
+
+# Lower value = served first
+INTERACTIVE = 0   # /ask* answers a user is waiting on
+BACKGROUND = 1    # explanations generated alongside uploads
+
+
+class QueueFull(Exception):
+    """Raised when the LLM queue is too deep; the caller should answer 429."""
+
+    def __init__(self, retry_after):
+        super().__init__(f"LLM queue is full, retry in {retry_after}s")
+        self.retry_after = retry_after
+
+
+class _Waiter:
+    __slots__ = ("event",)
+
+    def __init__(self):
+        self.event = threading.Event()
+
+    def wake(self):
+        self.event.set()
+
+
+class _AsyncWaiter:
+    __slots__ = ("future",)
+
+    def __init__(self):
+        self.future = asyncio.get_running_loop().create_future()
+
+    def wake(self):
+        if not self.future.done():
+            self.future.set_result(None)
+
+
+class LLMScheduler:
+    """
+    Priority queue in front of the LLM with per-outlet round-robin inside
+    each priority, so one busy outlet can't starve the others.
+    """
+
+    def __init__(self, max_in_flight=LLM_MAX_IN_FLIGHT, max_queue=LLM_MAX_QUEUE):
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        # {priority: OrderedDict(outlet -> deque[_Waiter])}
+        self._queues = {INTERACTIVE: OrderedDict(), BACKGROUND: OrderedDict()}
+        self._waiting = 0
+        self._avg_seconds = 20.0  # running estimate of one LLM call
+
+    # ------------------------------
+    def _ahead_of(self, priority):
+        """Waiters that would be served before a new request of this priority."""
+        return sum(
+            len(q) for p, outlets in self._queues.items() if p <= priority for q in outlets.values()
+        )
+
+    def _retry_after(self):
+        backlog = self._waiting + self._in_flight
+        return max(1, int(self._avg_seconds * backlog / self.max_in_flight))
+
+    def _dispatch(self):
+        """Hand free slots to waiters. Caller holds the lock."""
+        while self._in_flight < self.max_in_flight and self._waiting:
+            for priority in sorted(self._queues):
+                outlets = self._queues[priority]
+                if outlets:
+                    outlet, waiters = next(iter(outlets.items()))
+                    waiter = waiters.popleft()
+                    del outlets[outlet]
+                    if waiters:
+                        outlets[outlet] = waiters  # back of the round-robin
+                    break
+            self._waiting -= 1
+            self._in_flight += 1
+            waiter.wake()
+
+    def _enqueue(self, waiter, priority, outlet):
+        """
+        Take a free slot (returns 0) or queue the waiter (returns its position).
+        Raises QueueFull.
+        """
+        with self._lock:
+            if self._in_flight < self.max_in_flight and not self._waiting:
+                self._in_flight += 1
+                return 0
+            # Background work may only fill half the queue, keeping room for users
+            limit = self.max_queue if priority == INTERACTIVE else self.max_queue // 2
+            if self._waiting >= limit:
+                raise QueueFull(self._retry_after())
+            position = self._ahead_of(priority) + 1
+            self._queues[priority].setdefault(outlet, deque()).append(waiter)
+            self._waiting += 1
+        print(f"[LLM QUEUE] waiting priority={priority} outlet={outlet} position={position}")
+        return position
+
+    def _withdraw(self, waiter):
+        """Remove a waiter that gave up. Returns False if it was already given a slot."""
+        with self._lock:
+            for outlets in self._queues.values():
+                for outlet, waiters in list(outlets.items()):
+                    if waiter in waiters:
+                        waiters.remove(waiter)
+                        if not waiters:
+                            del outlets[outlet]
+                        self._waiting -= 1
+                        return True
+        return False
+
+    # ------------------------------
+    def acquire(self, priority=INTERACTIVE, outlet=None):
+        """
+        Block until an LLM slot is free. Returns the queue position the
+        request started at (0 = ran immediately). Raises QueueFull.
+        """
+        waiter = _Waiter()
+        position = self._enqueue(waiter, priority, outlet)
+        if position:
+            waiter.event.wait()
+        return position
+
+    def release(self, seconds=None):
+        with self._lock:
+            self._in_flight -= 1
+            if seconds is not None:
+                self._avg_seconds = 0.8 * self._avg_seconds + 0.2 * seconds
+            self._dispatch()
+
+    @contextmanager
+    def slot(self, priority=INTERACTIVE, outlet=None):
+        """with SCHEDULER.slot(...) as position: <call the LLM>"""
+        position = self.acquire(priority, outlet)
+        start = time.perf_counter()
+        try:
+            yield position
+        finally:
+            self.release(time.perf_counter() - start)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "in_flight": self._in_flight,
+                "waiting": self._waiting,
+                "max_in_flight": self.max_in_flight,
+                "max_queue": self.max_queue,
+                "avg_seconds": round(self._avg_seconds, 2),
+            }
+
+
+class AsyncLLMScheduler(LLMScheduler):
+    """Same queueing policy for coroutines on one event loop (asgi_app)."""
+
+    async def acquire(self, priority=INTERACTIVE, outlet=None):
+        waiter = _AsyncWaiter()
+        position = self._enqueue(waiter, priority, outlet)
+        if position:
+            try:
+                await waiter.future
+            except asyncio.CancelledError:
+                # Client went away: leave the queue, or hand back a slot we were just given
+                if not self._withdraw(waiter):
+                    self.release()
+                raise
+        return position
+
+    @asynccontextmanager
+    async def slot(self, priority=INTERACTIVE, outlet=None):
+        position = await self.acquire(priority, outlet)
+        start = time.perf_counter()
+        try:
+            yield position
+        finally:
+            self.release(time.perf_counter() - start)
+
+
+SCHEDULER = LLMScheduler()
+ASYNC_SCHEDULER = AsyncLLMScheduler(max_queue=LLM_ASYNC_MAX_QUEUE)
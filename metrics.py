@@ -0,0 +1,130 @@
+# metrics.py
+import contextvars
+import os
+import time
+from contextlib import contextmanager
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+# Where a request's time goes: each stage below is timed wherever it runs
+# (helper_func, async_db, models, prompt_builder, llm_client, ...) and
+# recorded against the route and outlet of the request being served.
+# GET /metrics exposes the histograms for Prometheus; every response also
+# carries a Server-Timing header with its own breakdown.
+#
+# Under gunicorn each worker has its own registry. gunicorn.conf.py sets
+# PROMETHEUS_MULTIPROC_DIR so /metrics adds up every worker's samples.
+STAGES = ("db_fetch", "decode", "index_build", "embed", "search", "prompt_build", "llm_queue", "llm", "ocr")
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+MAX_OUTLET_LABELS = 200  # outlet names come from clients; beyond this they're labelled "other"
+BACKGROUND_ROUTE = "background"  # stages run outside a request (scheduler jobs, warm-up)
+
+REQUEST_SECONDS = Histogram(
+    "rag_request_seconds", "Request latency", ["route", "outlet"], buckets=BUCKETS
+)
+STAGE_SECONDS = Histogram(
+    "rag_stage_seconds", "Time spent per request stage", ["route", "outlet", "stage"], buckets=BUCKETS
+)
+# Hit ratio: rate(rag_cache_lookups_total{result="hit"}[5m]) / rate(rag_cache_lookups_total[5m])
+CACHE_LOOKUPS = Counter(
+    "rag_cache_lookups_total", "In-process cache lookups", ["cache", "result"]
+)
+# Questions answered with the canned reply because no chunk was relevant
+LLM_SKIPPED = Counter(
+    "rag_llm_skipped_total", "Questions answered without calling the LLM", ["route"]
+)
+
+_outlets = set()
+
+
+class RequestTimings:
+    def __init__(self, route, outlet):
+        self.route = route or "unknown"
+        self.outlet = outlet_label(outlet)
+        self.start = time.perf_counter()
+        self.stages = {}  # {stage: seconds}, summed over repeats
+        self.total = None
+
+    def labels(self):
+        return self.route, self.outlet
+
+
+_current = contextvars.ContextVar("request_timings", default=None)
+
+
+def outlet_label(outlet):
+    if not outlet:
+        return ""
+    if outlet not in _outlets:
+        if len(_outlets) >= MAX_OUTLET_LABELS:
+            return "other"
+        _outlets.add(outlet)
+    return outlet
+
+
+def start_request(route, outlet=None):
+    """Begin timing a request; stages run in this context are attributed to it."""
+    _current.set(RequestTimings(route, outlet))
+
+
+def finish_request():
+    """Record the request's total latency and return its RequestTimings (or None)."""
+    timings = _current.get()
+    if timings is None:
+        return None
+    _current.set(None)
+    timings.total = time.perf_counter() - timings.start
+    REQUEST_SECONDS.labels(*timings.labels()).observe(timings.total)
+    stages = " ".join(f"{name}={seconds * 1000:.0f}ms" for name, seconds in timings.stages.items())
+    print(f"[TIMING] route={timings.route} outlet={timings.outlet} total={timings.total * 1000:.0f}ms {stages}")
+    return timings
+
+
+@contextmanager
+def stage(name):
+    """Time the block as one occurrence of `name` (one of STAGES)."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_stage(name, time.perf_counter() - start)
+
+
+def record_stage(name, seconds):
+    """Record a stage timed by the caller (e.g. a wait that ends inside a `with`)."""
+    timings = _current.get()
+    labels = timings.labels() if timings is not None else (BACKGROUND_ROUTE, "")
+    STAGE_SECONDS.labels(*labels, name).observe(seconds)
+    if timings is not None:
+        timings.stages[name] = timings.stages.get(name, 0.0) + seconds
+
+
+def record_cache(cache, hit):
+    CACHE_LOOKUPS.labels(cache, "hit" if hit else "miss").inc()
+
+
+def record_llm_skipped():
+    timings = _current.get()
+    LLM_SKIPPED.labels(timings.route if timings is not None else BACKGROUND_ROUTE).inc()
+
+
+def server_timing(timings):
+    """Server-Timing header value, e.g. 'db_fetch;dur=12.5, embed;dur=30.1, total;dur=48.0'."""
+    parts = [f"{name};dur={seconds * 1000:.1f}" for name, seconds in timings.stages.items()]
+    parts.append(f"total;dur={timings.total * 1000:.1f}")
+    return ", ".join(parts)
+
+
+def render():
+    """(body, content_type) for GET /metrics."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(), CONTENT_TYPE_LATEST
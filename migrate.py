@@ -0,0 +1,76 @@
+# migrate.py
+"""
+Apply versioned schema migrations.
+
+    python migrate.py            # apply pending migrations/NNNN_*.sql in order
+    python migrate.py --status   # list applied / pending versions
+
+Applied versions are recorded in the `schema_migrations` table. Migrations
+use IF [NOT] EXISTS so they are also safe on databases restored from
+lamallm.sql, which already contains their changes.
+"""
+import os
+import re
+import sys
+from helper_func import get_db_connection
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "migrations")
+
+
+def list_migrations():
+    """Return [(version, path)] sorted by version."""
+    migrations = []
+    for name in sorted(os.listdir(MIGRATIONS_DIR)):
+        match = re.match(r"^(\d{4})_.*\.sql$", name)
+        if match:
+            migrations.append((match.group(1), os.path.join(MIGRATIONS_DIR, name)))
+    return migrations
+
+
+def split_statements(sql):
+    """Split a migration file into statements (no procedures, so ';' is enough)."""
+    lines = [line for line in sql.splitlines() if not line.strip().startswith("--")]
+    return [stmt.strip() for stmt in "\n".join(lines).split(";") if stmt.strip()]
+
+
+def applied_versions(cursor):
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version varchar(16) NOT NULL PRIMARY KEY,
+            applied_at timestamp NULL DEFAULT current_timestamp()
+        )
+    """)
+    cursor.execute("SELECT version FROM schema_migrations")
+    return {row[0] for row in cursor.fetchall()}
+
+
+def migrate(status_only=False):
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    done = applied_versions(cursor)
+
+    for version, path in list_migrations():
+        name = os.path.basename(path)
+        if version in done:
+            print(f"[MIGRATE] applied  {name}")
+            continue
+        if status_only:
+            print(f"[MIGRATE] pending  {name}")
+            continue
+
+        with open(path, encoding="utf-8") as f:
+            statements = split_statements(f.read())
+        print(f"[MIGRATE] applying {name} ({len(statements)} statements)")
+        # DDL auto-commits in MariaDB, so a failure leaves the version unrecorded
+        # and the (idempotent) migration is simply re-run next time.
+        for statement in statements:
+            cursor.execute(statement)
+        cursor.execute("INSERT INTO schema_migrations (version) VALUES (%s)", (version,))
+        conn.commit()
+
+    cursor.close()
+    conn.close()
+
+
+if __name__ == "__main__":
+    migrate(status_only="--status" in sys.argv[1:])
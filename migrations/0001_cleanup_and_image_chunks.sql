@@ -0,0 +1,17 @@
+-- OCR chunk embeddings for /ask-image-question retrieval
+CREATE TABLE IF NOT EXISTS `image_ocr_embeddings` (
+  `id` int(11) NOT NULL AUTO_INCREMENT,
+  `image_id` char(36) NOT NULL,
+  `chunk_index` int(11) NOT NULL,
+  `chunk_text` text DEFAULT NULL,
+  `embedding` longblob DEFAULT NULL,
+  PRIMARY KEY (`id`),
+  KEY `image_id_chunk_index` (`image_id`,`chunk_index`),
+  CONSTRAINT `image_ocr_embeddings_ibfk_1` FOREIGN KEY (`image_id`) REFERENCES `image_ocr` (`id`) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
+
+-- delete_old_documents: WHERE document_outlet_name IS NULL AND created_at < ...
+ALTER TABLE `documents` ADD INDEX IF NOT EXISTS `outlet_created_at` (`document_outlet_name`,`created_at`);
+
+-- delete_old_images: WHERE created_at < ...
+ALTER TABLE `image_ocr` ADD INDEX IF NOT EXISTS `created_at` (`created_at`);
@@ -0,0 +1,13 @@
+-- load_document_from_db_outletwise: WHERE document_outlet_name=%s ORDER BY chunk_index
+ALTER TABLE `embeddings` ADD INDEX IF NOT EXISTS `outlet_chunk` (`document_outlet_name`,`chunk_index`);
+
+-- load_document_from_db: WHERE document_id=%s AND document_outlet_name <=> %s ORDER BY chunk_index
+-- (leads with document_id, so it also backs the embeddings_ibfk_1 foreign key)
+ALTER TABLE `embeddings` ADD INDEX IF NOT EXISTS `document_outlet_chunk` (`document_id`,`document_outlet_name`,`chunk_index`);
+ALTER TABLE `embeddings` DROP INDEX IF EXISTS `document_id`;
+
+-- get_command_slots: WHERE command_id=%s AND required=1
+ALTER TABLE `outlet_command_slots` ADD INDEX IF NOT EXISTS `command_required` (`command_id`,`required`);
+
+-- command tree: WHERE document_outlet_name=%s AND parent_command_id <=> %s [ORDER BY command_text]
+ALTER TABLE `outlet_commands` ADD INDEX IF NOT EXISTS `outlet_parent_text` (`document_outlet_name`,`parent_command_id`,`command_text`);
@@ -0,0 +1,9 @@
+-- BM25 keyword index per outlet (keyword_index.KeywordIndex.to_blob),
+-- rebuilt whenever a document is uploaded for the outlet.
+CREATE TABLE IF NOT EXISTS `outlet_keyword_indexes` (
+  `document_outlet_name` varchar(255) NOT NULL,
+  `chunk_count` int(11) NOT NULL,
+  `index_blob` longblob NOT NULL,
+  `updated_at` timestamp NOT NULL DEFAULT current_timestamp() ON UPDATE current_timestamp(),
+  PRIMARY KEY (`document_outlet_name`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
@@ -0,0 +1,3 @@
+-- How each document was chunked (chunking.chunk_params as JSON); NULL for
+-- documents uploaded before this column, which used 500-word windows.
+ALTER TABLE `documents` ADD COLUMN IF NOT EXISTS `chunk_params` text DEFAULT NULL AFTER `document_outlet_name`;
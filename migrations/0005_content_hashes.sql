@@ -0,0 +1,10 @@
+-- File-level dedup: /upload reuses a document with the same bytes, outlet and chunk_params
+ALTER TABLE `documents` ADD COLUMN IF NOT EXISTS `content_hash` char(64) DEFAULT NULL AFTER `chunk_params`;
+ALTER TABLE `documents` ADD INDEX IF NOT EXISTS `content_hash` (`content_hash`,`document_outlet_name`);
+
+-- Chunk-level dedup: a chunk text is embedded once per outlet
+ALTER TABLE `embeddings` ADD COLUMN IF NOT EXISTS `chunk_hash` char(64) DEFAULT NULL AFTER `document_outlet_name`;
+ALTER TABLE `embeddings` ADD INDEX IF NOT EXISTS `outlet_chunk_hash` (`document_outlet_name`,`chunk_hash`);
+
+-- Same value helper_func.content_hash computes (sha256 of the UTF-8 text)
+UPDATE `embeddings` SET `chunk_hash` = SHA2(`chunk_text`, 256) WHERE `chunk_hash` IS NULL AND `chunk_text` IS NOT NULL;
@@ -0,0 +1,2 @@
+-- Incremental outlet indexes (outlet_index.py) read rows by outlet and id range
+ALTER TABLE `embeddings` ADD INDEX IF NOT EXISTS `outlet_id` (`document_outlet_name`,`id`);
@@ -0,0 +1,14 @@
+-- Keyword indexes are stored as one segment per upload (keyword_index.KeywordIndex.to_blob
+-- of that upload's new chunks) instead of one blob rewritten on every upload.
+CREATE TABLE IF NOT EXISTS `outlet_keyword_segments` (
+  `id` int(11) NOT NULL AUTO_INCREMENT,
+  `document_outlet_name` varchar(255) NOT NULL,
+  `chunk_count` int(11) NOT NULL,
+  `segment_blob` longblob NOT NULL,
+  `created_at` timestamp NOT NULL DEFAULT current_timestamp(),
+  PRIMARY KEY (`id`),
+  KEY `outlet_id` (`document_outlet_name`,`id`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
+
+-- Outlets get a first segment rebuilt from their chunks on first use
+DROP TABLE IF EXISTS `outlet_keyword_indexes`;
@@ -0,0 +1,92 @@
+# models.py
+import threading
+import time
+from metrics import stage
+
+# Heavy models are loaded on first use rather than at import, so a worker
+# that never sees an image never pays for easyocr. Under gunicorn --preload
+# (gunicorn.conf.py) they can instead be loaded once in the master and
+# shared copy-on-write with the forked workers.
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+OCR_LANGUAGES = ['en']  # supports multiple languages, e.g., ['en', 'ch_sim']
+
+_models = {}
+_lock = threading.Lock()
+
+
+def _load_embedder():
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer(EMBEDDING_MODEL)
+
+
+def _load_ocr_reader():
+    import easyocr
+    return easyocr.Reader(OCR_LANGUAGES)
+
+
+def _load_tokenizer():
+    from prompt_builder import get_tokenizer
+    return get_tokenizer()
+
+
+LOADERS = {
+    "embedder": _load_embedder,
+    "ocr": _load_ocr_reader,
+    "tokenizer": _load_tokenizer,
+}
+
+
+def get_model(name):
+    """Return the named model, loading it on first use (once per process)."""
+    model = _models.get(name)
+    if model is None:
+        with _lock:
+            model = _models.get(name)
+            if model is None:
+                start = time.perf_counter()
+                model = LOADERS[name]()
+                _models[name] = model
+                print(f"[MODELS] loaded {name} in {time.perf_counter() - start:.1f}s")
+    return model
+
+
+def get_embedder():
+    return get_model("embedder")
+
+
+def get_ocr_reader():
+    return get_model("ocr")
+
+
+def embed(texts):
+    """Embed texts with the shared embedder (timed as the "embed" stage)."""
+    with stage("embed"):
+        return get_embedder().encode(texts)
+
+
+def loaded_models():
+    return sorted(_models)
+
+
+def _exercise(name, model):
+    """Run one tiny inference so lazy kernels/allocations happen now, not on a user request."""
+    if name == "embedder":
+        model.encode(["warm up"])
+    elif name == "ocr":
+        import numpy as np
+        model.readtext(np.full((32, 128), 255, dtype=np.uint8), detail=0)
+
+
+def warm_up(names=None, exercise=True):
+    """
+    Load (and optionally exercise) models ahead of traffic.
+    Returns {name: seconds}. Unknown names raise KeyError.
+    """
+    timings = {}
+    for name in names or LOADERS:
+        start = time.perf_counter()
+        model = get_model(name)
+        if exercise and model is not None:
+            _exercise(name, model)
+        timings[name] = round(time.perf_counter() - start, 3)
+    return timings
@@ -0,0 +1,335 @@
+# outlet_index.py
+import threading
+import time
+import numpy as np
+import faiss
+from metrics import record_cache, stage
+from keyword_index import KeywordIndex, hybrid_search
+from helper_func import (
+    append_keyword_segment,
+    deserialize_embedding,
+    load_keyword_segments,
+    new_faiss_index,
+    load_outlet_rows_after,
+    load_outlet_rows_by_ids,
+    count_outlet_rows,
+    load_outlet_row_ids,
+)
+
+# Each worker keeps one FAISS index per outlet, keyed by embeddings.id, and
+# keeps it in step with the table instead of rebuilding it: rows with an id
+# above the last one seen are added, rows that disappeared are removed.
+# Uploading to a 50k-chunk outlet then costs O(new chunks) per worker.
+# The outlet's BM25 index is cached with it and refreshed in the same step
+# from the keyword segments stored after the last one seen.
+OUTLET_INDEX_MAXSIZE = 64
+OUTLET_INDEX_REFRESH_SECONDS = 5     # how stale another worker's upload may look
+OUTLET_INDEX_COMPACT_SECONDS = 3600  # full rebuild of an index that has changed since this long
+OUTLET_INDEX_COMPACT_REMOVED = 0.1   # ... or sooner once this share of its rows was removed
+
+
+class OutletIndex:
+    """
+    IndexIDMap over an outlet's embeddings (flat or scalar-quantized, see
+    EMBEDDING_STORAGE). Usable wherever a faiss index is expected (search /
+    ntotal); search returns embeddings.id, and `chunks` maps those ids to
+    chunk text. `keyword_index` is the outlet's KeywordIndex; its segments
+    are append-only, so removed texts stay in it and searches filter its
+    hits through `text_ids`.
+    """
+
+    def __init__(self):
+        self.index = None           # created on the first add, once the dimension is known
+        self.chunks = {}            # {embeddings.id: chunk_text}, in id (= upload) order
+        self.row_ids = {}           # {embeddings.id: chunk_text} of every row seen, repeats included
+        self.text_ids = {}          # {chunk_text: embeddings.id} of the indexed copy
+        self.text_rows = {}         # {chunk_text: {embeddings.id}} of every row with that text
+        self.max_id = 0
+        self.keyword_index = KeywordIndex.build([])
+        self.keyword_segment_id = 0  # last outlet_keyword_segments.id merged in
+        self.removed = 0
+        self.changed = False
+        self.built_at = time.time()
+        self.checked_at = self.built_at
+        self.lock = threading.Lock()
+
+    @property
+    def ntotal(self):
+        return self.index.ntotal if self.index is not None else 0
+
+    def search(self, q_embed, k):
+        with self.lock:
+            return self.index.search(q_embed, k)
+
+    def texts(self):
+        """Chunk texts in upload order (the stable whole-outlet prefix)."""
+        with self.lock:
+            return list(self.chunks.values())
+
+    def apply(self, rows, removed_ids=()):
+        """
+        Add rows (id, chunk_text, embedding) and drop removed_ids. Rows already
+        seen and unknown ids are ignored, so overlapping refreshes are harmless.
+        """
+        with self.lock:
+            removed_ids = [i for i in removed_ids if i in self.row_ids]
+            if removed_ids:
+                # A text leaves the index with its last row; while other rows
+                # repeat it, its vector stays under the id it was indexed with
+                dropped = []
+                for i in removed_ids:
+                    text = self.row_ids.pop(i)
+                    holders = self.text_rows[text]
+                    holders.discard(i)
+                    if not holders:
+                        del self.text_rows[text]
+                        dropped.append(self.text_ids.pop(text))
+                for i in dropped:
+                    del self.chunks[i]
+                if dropped:
+                    self.index.remove_ids(np.array(dropped, dtype="int64"))
+                self.removed += len(removed_ids)
+                self.changed = True
+
+            ids, vectors = [], []
+            for row in rows:
+                row_id = int(row['id'])
+                if row_id in self.row_ids:
+                    continue
+                text = row['chunk_text'] or ""
+                self.row_ids[row_id] = text
+                self.max_id = max(self.max_id, row_id)
+                # Documents repeat texts (boilerplate, shared rows); index one copy
+                self.text_rows.setdefault(text, set()).add(row_id)
+                if text in self.text_ids:
+                    continue
+                self.text_ids[text] = row_id
+                self.chunks[row_id] = text
+                ids.append(row_id)
+                vectors.append(row['embedding'])
+            if ids:
+                with stage("decode"):
+                    vectors = np.array([deserialize_embedding(blob) for blob in vectors], dtype="float32")
+                with stage("index_build"):
+                    if self.index is None:
+                        self.index = faiss.IndexIDMap(new_faiss_index(vectors.shape[1]))
+                    self.index.add_with_ids(vectors, np.array(ids, dtype="int64"))
+                self.changed = True
+            return len(ids), len(removed_ids)
+
+    def apply_keyword_segments(self, segments):
+        """
+        Merge (id, KeywordIndex) segments newer than the last one merged.
+        KeywordIndex.extend only appends, so searches run alongside it.
+        """
+        with self.lock:
+            merged = 0
+            for segment_id, segment in segments:
+                if segment_id <= self.keyword_segment_id:
+                    continue
+                self.keyword_index.extend(segment)
+                self.keyword_segment_id = segment_id
+                merged += len(segment)
+            return merged
+
+    def reconcile(self, current_ids, max_id):
+        """(removed, missing) row ids up to max_id, compared with the ids now in the table."""
+        with self.lock:
+            known = {i for i in self.row_ids if i <= max_id}
+        return known - current_ids, current_ids - known
+
+    def row_count(self):
+        with self.lock:
+            return len(self.row_ids)
+
+    def needs_compaction(self, now=None):
+        now = now or time.time()
+        if self.removed and self.removed >= OUTLET_INDEX_COMPACT_REMOVED * max(len(self.row_ids), 1):
+            return True
+        return self.changed and now - self.built_at >= OUTLET_INDEX_COMPACT_SECONDS
+
+
+# ------------------------------
+# Per-worker cache
+# ------------------------------
+_outlet_indexes = {}  # {document_outlet_name: OutletIndex}, least recently used first
+_outlets_lock = threading.Lock()
+
+
+def _cached(document_outlet_name):
+    with _outlets_lock:
+        entry = _outlet_indexes.pop(document_outlet_name, None)
+        if entry is not None:
+            _outlet_indexes[document_outlet_name] = entry
+        return entry
+
+
+def _store(document_outlet_name, entry):
+    with _outlets_lock:
+        _outlet_indexes.pop(document_outlet_name, None)
+        _outlet_indexes[document_outlet_name] = entry
+        while len(_outlet_indexes) > OUTLET_INDEX_MAXSIZE:
+            _outlet_indexes.pop(next(iter(_outlet_indexes)))
+
+
+def cached_outlets():
+    """Outlets with an index in this worker, least recently used first."""
+    with _outlets_lock:
+        return list(_outlet_indexes)
+
+
+def evict_outlet_index(document_outlet_name):
+    with _outlets_lock:
+        _outlet_indexes.pop(document_outlet_name, None)
+
+
+def _due(entry, force):
+    """Claim the next refresh of entry; False if another request just did it."""
+    now = time.time()
+    with entry.lock:
+        if not force and now - entry.checked_at < OUTLET_INDEX_REFRESH_SECONDS:
+            return False
+        entry.checked_at = now
+        return True
+
+
+def _ready(document_outlet_name, entry):
+    if entry.ntotal == 0:
+        raise LookupError(f"No documents for outlet {document_outlet_name}")
+    return entry
+
+
+def refresh_outlet_keywords(document_outlet_name, entry):
+    """Merge the keyword segments stored since the entry's last one."""
+    segments = load_keyword_segments(document_outlet_name, entry.keyword_segment_id)
+    if not segments and entry.keyword_segment_id == 0 and entry.ntotal:
+        # Outlet ingested before keyword segments existed
+        append_keyword_segment(document_outlet_name)
+        segments = load_keyword_segments(document_outlet_name)
+    return entry.apply_keyword_segments(segments)
+
+
+def build_outlet_index(document_outlet_name):
+    entry = OutletIndex()
+    entry.apply(load_outlet_rows_after(document_outlet_name, 0))
+    refresh_outlet_keywords(document_outlet_name, entry)
+    return entry
+
+
+def refresh_outlet_index(document_outlet_name, entry):
+    """Bring entry up to date with the embeddings table: O(changed rows)."""
+    max_id = entry.max_id
+    rows = load_outlet_rows_after(document_outlet_name, max_id)
+    removed = ()
+    # Rows at or below max_id only change when documents are deleted, or when
+    # a slower upload commits an id below one we already saw
+    if count_outlet_rows(document_outlet_name, max_id) != entry.row_count():
+        removed, missing = entry.reconcile(set(load_outlet_row_ids(document_outlet_name, max_id)), max_id)
+        if missing:
+            rows = list(load_outlet_rows_by_ids(missing)) + list(rows)
+    added, dropped = entry.apply(rows, removed)
+    refresh_outlet_keywords(document_outlet_name, entry)
+    if added or dropped:
+        print(f"[OUTLET INDEX] {document_outlet_name}: +{added} -{dropped} ({entry.ntotal} vectors)")
+    return entry
+
+
+def get_outlet_index(document_outlet_name, force_refresh=False):
+    """
+    The outlet's OutletIndex, built on first use and refreshed at most every
+    OUTLET_INDEX_REFRESH_SECONDS (force_refresh: now, e.g. after an upload).
+    Raises LookupError when the outlet has no chunks.
+    """
+    entry = _cached(document_outlet_name)
+    record_cache("outlet_index", entry is not None)
+    if entry is None:
+        entry = build_outlet_index(document_outlet_name)
+        _store(document_outlet_name, entry)
+    elif _due(entry, force_refresh):
+        refresh_outlet_index(document_outlet_name, entry)
+    return _ready(document_outlet_name, entry)
+
+
+def refresh_cached_outlet_index(document_outlet_name):
+    """After an upload: update this worker's index now, if it has one."""
+    entry = _cached(document_outlet_name)
+    if entry is not None and _due(entry, True):
+        refresh_outlet_index(document_outlet_name, entry)
+
+
+def search_outlet_index(document_outlet_name, question, q_embed, k=3):
+    """hybrid_search over the outlet's vector and keyword indexes (k=None: every chunk, ranked)."""
+    index = get_outlet_index(document_outlet_name)
+    return hybrid_search(
+        question, q_embed, index.chunks, index, index.keyword_index, k=k, live_texts=index.text_ids
+    )
+
+
+async def arefresh_outlet_keywords(document_outlet_name, entry):
+    """Async refresh_outlet_keywords."""
+    import asyncio
+    import async_db
+
+    segments = await async_db.load_keyword_segments(document_outlet_name, entry.keyword_segment_id)
+    if not segments and entry.keyword_segment_id == 0 and entry.ntotal:
+        await asyncio.to_thread(append_keyword_segment, document_outlet_name)
+        segments = await async_db.load_keyword_segments(document_outlet_name)
+    return await asyncio.to_thread(entry.apply_keyword_segments, segments)
+
+
+async def aget_outlet_index(document_outlet_name, force_refresh=False):
+    """Async get_outlet_index: queries through aiomysql, FAISS work in a thread."""
+    import asyncio
+    import async_db
+
+    entry = _cached(document_outlet_name)
+    record_cache("outlet_index", entry is not None)
+    if entry is None:
+        rows = await async_db.load_outlet_rows_after(document_outlet_name, 0)
+        entry = OutletIndex()
+        await asyncio.to_thread(entry.apply, rows)
+        await arefresh_outlet_keywords(document_outlet_name, entry)
+        _store(document_outlet_name, entry)
+    elif _due(entry, force_refresh):
+        max_id = entry.max_id
+        rows = await async_db.load_outlet_rows_after(document_outlet_name, max_id)
+        removed = ()
+        if await async_db.count_outlet_rows(document_outlet_name, max_id) != entry.row_count():
+            removed, missing = entry.reconcile(set(await async_db.load_outlet_row_ids(document_outlet_name, max_id)), max_id)
+            if missing:
+                rows = list(await async_db.load_outlet_rows_by_ids(missing)) + list(rows)
+        await asyncio.to_thread(entry.apply, rows, removed)
+        await arefresh_outlet_keywords(document_outlet_name, entry)
+    return _ready(document_outlet_name, entry)
+
+
+async def asearch_outlet_index(document_outlet_name, question, q_embed, k=3):
+    """Async search_outlet_index; the search itself runs in a thread (k=None ranks the whole outlet)."""
+    import asyncio
+
+    index = await aget_outlet_index(document_outlet_name)
+    return await asyncio.to_thread(
+        hybrid_search, question, q_embed, index.chunks, index, index.keyword_index, k=k, live_texts=index.text_ids
+    )
+
+
+def compact_outlet_indexes():
+    """
+    Rebuild cached indexes that have drifted (removals, long runs of adds)
+    and swap them in; requests keep using the old index meanwhile. Run from
+    the background scheduler.
+    """
+    with _outlets_lock:
+        entries = list(_outlet_indexes.items())
+    compacted = 0
+    for document_outlet_name, entry in entries:
+        if not entry.needs_compaction():
+            continue
+        fresh = build_outlet_index(document_outlet_name)
+        with _outlets_lock:
+            if _outlet_indexes.get(document_outlet_name) is entry:
+                _outlet_indexes[document_outlet_name] = fresh
+                compacted += 1
+    if compacted:
+        print(f"[OUTLET INDEX] compacted {compacted} index(es)")
+    return compacted
@@ -0,0 +1,167 @@
+# outlet_warmup.py
+import asyncio
+import datetime
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from redis.exceptions import RedisError
+from redis_client import get_redis, get_async_redis
+
+# After a deploy every worker starts cold: the first question to an outlet
+# pays for loading its rows and building its index. Requests that name an
+# outlet bump a per-day Redis counter; on start-up each worker warms the
+# embedder and then the indexes and command tables of the most active
+# outlets over the last WARM_UP_DAYS, a few at a time, in a background
+# thread. GET /ready answers 503 until that is done, so a load balancer
+# only sends traffic to warm workers.
+WARM_UP_OUTLETS = int(os.environ.get("WARM_UP_OUTLETS", "20"))  # top N; 0 disables the outlet stage
+WARM_UP_PINNED_OUTLETS = [o.strip() for o in os.environ.get("WARM_UP_PINNED_OUTLETS", "").split(",") if o.strip()]
+WARM_UP_CONCURRENCY = int(os.environ.get("WARM_UP_CONCURRENCY", "2"))
+WARM_UP_TIMEOUT_SECONDS = int(os.environ.get("WARM_UP_TIMEOUT_SECONDS", "240"))  # ready regardless after this
+WARM_UP_DAYS = 7
+ACTIVITY_KEY = "outlet_activity:{day}"
+RANKED_KEY = "outlet_activity:ranked"
+
+
+# ------------------------------
+# Activity counters
+# ------------------------------
+def activity_key(day=None):
+    return ACTIVITY_KEY.format(day=(day or datetime.date.today()).strftime("%Y%m%d"))
+
+
+def record_outlet_activity(document_outlet_name):
+    """Count a request for the outlet (best effort: Redis errors are ignored)."""
+    if not document_outlet_name:
+        return
+    key = activity_key()
+    try:
+        pipe = get_redis().pipeline(transaction=False)
+        pipe.zincrby(key, 1, document_outlet_name)
+        pipe.expire(key, (WARM_UP_DAYS + 1) * 86400)
+        pipe.execute()
+    except RedisError:
+        pass
+
+
+async def arecord_outlet_activity(document_outlet_name):
+    """Async record_outlet_activity."""
+    key = activity_key()
+    try:
+        pipe = get_async_redis().pipeline(transaction=False)
+        pipe.zincrby(key, 1, document_outlet_name)
+        pipe.expire(key, (WARM_UP_DAYS + 1) * 86400)
+        await pipe.execute()
+    except RedisError:
+        pass
+
+
+_pending = set()  # keeps fire-and-forget tasks referenced until they finish
+
+
+def record_outlet_activity_soon(document_outlet_name):
+    """From the event loop: count the request without waiting on Redis."""
+    if not document_outlet_name:
+        return
+    task = asyncio.get_running_loop().create_task(arecord_outlet_activity(document_outlet_name))
+    _pending.add(task)
+    task.add_done_callback(_pending.discard)
+
+
+def top_outlets(count, days=WARM_UP_DAYS):
+    """Pinned outlets, then the most requested ones over the last `days` days."""
+    today = datetime.date.today()
+    keys = [activity_key(today - datetime.timedelta(days=n)) for n in range(days)]
+    ranked = []
+    if count > 0:
+        try:
+            r = get_redis()
+            r.zunionstore(RANKED_KEY, keys)
+            ranked = r.zrevrange(RANKED_KEY, 0, count - 1)
+        except RedisError as e:
+            print(f"[WARM UP] outlet ranking unavailable: {e}")
+    return list(dict.fromkeys(WARM_UP_PINNED_OUTLETS + ranked))
+
+
+# ------------------------------
+# Warm-up
+# ------------------------------
+class WarmUp:
+    """
+    Background warm-up of one worker. `warm_outlet(name)` does the per-outlet
+    work; `select(name)` picks the outlets this process is responsible for.
+    """
+
+    def __init__(self, warm_outlet, select=None, models=("embedder",)):
+        self.warm_outlet = warm_outlet
+        self.select = select
+        self.models = models
+        self.state = "idle"
+        self.outlets = []
+        self.warmed = 0
+        self.failed = {}  # {outlet: error}
+        self.started_at = None
+        self.finished_at = None
+        self.lock = threading.Lock()
+        self._thread = None
+
+    def start(self):
+        with self.lock:
+            if self._thread is not None:
+                return
+            self.state = "warming"
+            self.started_at = time.time()
+            self._thread = threading.Thread(target=self._run, name="outlet-warm-up", daemon=True)
+            self._thread.start()
+
+    def wait(self, timeout=WARM_UP_TIMEOUT_SECONDS):
+        """Block until warm-up finished or timeout (gunicorn post_fork with WARM_UP_BLOCKING)."""
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _warm(self, document_outlet_name):
+        try:
+            self.warm_outlet(document_outlet_name)
+            with self.lock:
+                self.warmed += 1
+        except Exception as e:
+            with self.lock:
+                self.failed[document_outlet_name] = str(e)
+
+    def _run(self):
+        try:
+            if self.models:
+                from models import warm_up
+                warm_up(list(self.models))
+            outlets = top_outlets(WARM_UP_OUTLETS)
+            if self.select is not None:
+                outlets = [o for o in outlets if self.select(o)]
+            self.outlets = outlets
+            with ThreadPoolExecutor(max_workers=WARM_UP_CONCURRENCY) as pool:
+                list(pool.map(self._warm, outlets))
+        except Exception as e:
+            print(f"[WARM UP] failed: {e}")
+        finally:
+            self.finished_at = time.time()
+            self.state = "ready"
+            print(f"[WARM UP] pid={os.getpid()} warmed {self.warmed}/{len(self.outlets)} outlet(s) "
+                  f"in {self.finished_at - self.started_at:.1f}s ({len(self.failed)} failed)")
+
+    def ready(self):
+        if self.state == "ready":
+            return True
+        # A stuck warm-up must not keep the worker out of rotation for good
+        return self.started_at is not None and time.time() - self.started_at >= WARM_UP_TIMEOUT_SECONDS
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                "ready": self.ready(),
+                "state": self.state,
+                "pid": os.getpid(),
+                "outlets": len(self.outlets),
+                "warmed": self.warmed,
+                "failed": dict(self.failed),
+                "seconds": round((self.finished_at or time.time()) - self.started_at, 1) if self.started_at else None,
+            }
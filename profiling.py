@@ -0,0 +1,189 @@
+# profiling.py
+import hmac
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+# Where a slow request spends its Python time, as folded stacks
+# ("outer;inner;leaf 42" per line): the input format of flamegraph.pl and
+# speedscope. A sampler thread reads the request thread's stack every few
+# ms via sys._current_frames(), so nothing is traced and the overhead does
+# not depend on how much code the request runs.
+#
+# On demand, for one request (admins only, PROFILE_TOKEN must be set):
+#     curl -H "X-Profile-Token: $PROFILE_TOKEN" -H "X-Profile: 1" ...   stored in PROFILE_DIR
+#     curl -H "X-Profile-Token: $PROFILE_TOKEN" "...?profile=inline"    stacks returned as the body
+#
+# Continuously (PROFILE_CONTINUOUS_HZ > 0): every thread serving a request
+# is sampled at that low rate and the stacks are added up per route, then
+# written to PROFILE_DIR/continuous/<route>.<pid>.folded every
+# PROFILE_DUMP_SECONDS. Files from several workers can simply be concatenated.
+PROFILE_TOKEN = os.environ.get("PROFILE_TOKEN", "")
+PROFILE_DIR = os.environ.get("PROFILE_DIR", "/tmp/llm_profiles")
+PROFILE_INTERVAL_MS = float(os.environ.get("PROFILE_INTERVAL_MS", "5"))
+PROFILE_MAX_SECONDS = 300  # a profiled request that hangs stops being sampled after this
+PROFILE_CONTINUOUS_HZ = float(os.environ.get("PROFILE_CONTINUOUS_HZ", "0"))
+PROFILE_DUMP_SECONDS = int(os.environ.get("PROFILE_DUMP_SECONDS", "60"))
+PROFILE_MODES = ("1", "store", "inline")
+
+
+def folded_stack(frame):
+    """'outer;...;leaf' for a frame, each entry 'function (file.py:line)'."""
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+def folded(stacks):
+    """Folded-stack text for a Counter of {stack: samples}, largest first."""
+    return "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
+
+
+def safe_name(value):
+    return "".join(c if c.isalnum() or c in "-_." else "_" for c in value or "unknown")
+
+
+# ------------------------------
+# On-demand, one request
+# ------------------------------
+def requested_mode(headers, args):
+    """
+    "store" / "inline" when the request asks to be profiled and carries the
+    admin token, else None. The token is only read from a header so it
+    doesn't end up in access logs.
+    """
+    mode = headers.get("X-Profile") or args.get("profile")
+    if not mode or not PROFILE_TOKEN:
+        return None
+    if mode not in PROFILE_MODES:
+        return None
+    if not hmac.compare_digest(headers.get("X-Profile-Token", ""), PROFILE_TOKEN):
+        return None
+    return "inline" if mode == "inline" else "store"
+
+
+class RequestProfiler:
+    """Samples one thread (the request's) until stop()."""
+
+    def __init__(self, route, interval_ms=PROFILE_INTERVAL_MS, thread_id=None):
+        self.route = route or "unknown"
+        self.interval = interval_ms / 1000
+        self.thread_id = thread_id or threading.get_ident()
+        self.stacks = Counter()
+        self.samples = 0
+        self.started = time.time()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def _run(self):
+        deadline = time.monotonic() + PROFILE_MAX_SECONDS
+        while not self._stop.wait(self.interval) and time.monotonic() < deadline:
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                break
+            self.stacks[folded_stack(frame)] += 1
+            self.samples += 1
+            del frame
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        return self
+
+    def save(self, directory=PROFILE_DIR):
+        """Write the folded stacks; returns the file name (relative to directory)."""
+        os.makedirs(directory, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(self.started))
+        name = f"{stamp}-{safe_name(self.route)}-{os.getpid()}-{self.thread_id}.folded"
+        with open(os.path.join(directory, name), "w", encoding="utf-8") as f:
+            f.write(folded(self.stacks))
+        print(f"[PROFILE] {self.route}: {self.samples} samples -> {name}")
+        return name
+
+    def text(self):
+        return folded(self.stacks)
+
+
+# ------------------------------
+# Continuous, low rate
+# ------------------------------
+class ContinuousSampler:
+    """
+    Samples every registered request thread at PROFILE_CONTINUOUS_HZ and
+    aggregates per route. One per worker; started lazily after fork.
+    """
+
+    def __init__(self, hz, dump_seconds, directory):
+        self.interval = 1 / hz
+        self.dump_seconds = dump_seconds
+        self.directory = os.path.join(directory, "continuous")
+        self.active = {}   # {thread_id: route} of requests in progress
+        self.stacks = {}   # {route: Counter}
+        self.lock = threading.Lock()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="continuous-profiler", daemon=True)
+            self._thread.start()
+
+    def enter(self, route):
+        with self.lock:
+            self.active[threading.get_ident()] = route or "unknown"
+
+    def exit(self):
+        with self.lock:
+            self.active.pop(threading.get_ident(), None)
+
+    def sample(self):
+        with self.lock:
+            active = dict(self.active)
+        if not active:
+            return
+        frames = sys._current_frames()
+        with self.lock:
+            for thread_id, route in active.items():
+                frame = frames.get(thread_id)
+                if frame is not None:
+                    self.stacks.setdefault(route, Counter())[folded_stack(frame)] += 1
+        del frames
+
+    def dump(self):
+        """Write this worker's totals so far, one file per route (overwritten each dump)."""
+        with self.lock:
+            stacks = {route: Counter(counts) for route, counts in self.stacks.items()}
+        if not stacks:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        for route, counts in stacks.items():
+            path = os.path.join(self.directory, f"{safe_name(route)}.{os.getpid()}.folded")
+            with open(path + ".tmp", "w", encoding="utf-8") as f:
+                f.write(folded(counts))
+            os.replace(path + ".tmp", path)
+
+    def _run(self):
+        next_dump = time.monotonic() + self.dump_seconds
+        while True:
+            time.sleep(self.interval)
+            try:
+                self.sample()
+                if time.monotonic() >= next_dump:
+                    next_dump = time.monotonic() + self.dump_seconds
+                    self.dump()
+            except Exception as e:
+                print(f"[PROFILE] continuous sampling failed: {e}")
+
+
+CONTINUOUS = (
+    ContinuousSampler(PROFILE_CONTINUOUS_HZ, PROFILE_DUMP_SECONDS, PROFILE_DIR)
+    if PROFILE_CONTINUOUS_HZ > 0 else None
+)
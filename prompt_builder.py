@@ -0,0 +1,161 @@
+# prompt_builder.py
+import threading
+from collections import deque
+from contextvars import ContextVar
+from metrics import stage
+from flask import g, has_request_context, request
+
+# llama3.2:3b as served by Ollama. Anything past num_ctx is silently
+# dropped by the server, so prompts are packed to fit before sending.
+MODEL_CONTEXT_TOKENS = 4096
+ANSWER_RESERVE_TOKENS = 512  # room left for the generated answer
+PROMPT_TOKENIZER = "unsloth/Llama-3.2-3B-Instruct"  # same tokenizer, no HF gate
+CHAT_TEMPLATE_OVERHEAD = 32  # role headers / special tokens added by the chat template
+
+# Recent prompt sizes for capacity planning (see prompt_token_summary)
+PROMPT_STATS = deque(maxlen=5000)
+
+# (route, outlet) for code running outside a Flask request (the ASGI app)
+REQUEST_LABELS = ContextVar("request_labels", default=(None, None))
+
+_tokenizer = None
+_tokenizer_lock = threading.Lock()
+
+
+# ------------------------------
+# Token counting
+# ------------------------------
+def get_tokenizer():
+    """Load the model tokenizer once; returns None if it can't be loaded."""
+    global _tokenizer
+    if _tokenizer is None:
+        with _tokenizer_lock:
+            if _tokenizer is None:
+                try:
+                    from transformers import AutoTokenizer
+                    _tokenizer = AutoTokenizer.from_pretrained(PROMPT_TOKENIZER)
+                except Exception as e:
+                    print(f"[PROMPT] tokenizer unavailable, estimating tokens: {e}")
+                    _tokenizer = False
+    return _tokenizer or None
+
+
+def count_tokens(text):
+    tokenizer = get_tokenizer()
+    if tokenizer is None:
+        return (len(text) + 3) // 4  # ~4 characters per token for English
+    return len(tokenizer.encode(text, add_special_tokens=False))
+
+
+def truncate_to_tokens(text, budget):
+    """Keep the beginning of text up to `budget` tokens."""
+    if budget <= 0:
+        return ""
+    tokenizer = get_tokenizer()
+    if tokenizer is None:
+        return text[:budget * 4]
+    ids = tokenizer.encode(text, add_special_tokens=False)
+    if len(ids) <= budget:
+        return text
+    return tokenizer.decode(ids[:budget])
+
+
+# ------------------------------
+# Packing
+# ------------------------------
+def pack_chunks(chunks, budget, separator=" "):
+    """
+    Greedily take chunks (best first) while they fit in `budget` tokens.
+    Returns (context, used, dropped).
+    """
+    sep_tokens = count_tokens(separator) if separator.strip() else 0
+    picked, used_tokens, dropped = [], 0, 0
+    for chunk in chunks:
+        cost = count_tokens(chunk) + (sep_tokens if picked else 0)
+        if used_tokens + cost > budget:
+            dropped += 1
+            continue
+        picked.append(chunk)
+        used_tokens += cost
+    return separator.join(picked), len(picked), dropped
+
+
+def likely_fits(chunks, budget):
+    """Cheap, conservative check (~3 chars/token) that all chunks fit in budget."""
+    return sum(len(c) + 1 for c in chunks) // 3 <= budget
+
+
+def _fit_context(context, budget, separator):
+    """Returns (packed_text, chunks_used, chunks_dropped)."""
+    if isinstance(context, str):
+        packed = truncate_to_tokens(context, budget)
+        return packed, (1 if packed else 0), (0 if packed == context else 1)
+    return pack_chunks(context, budget, separator)
+
+
+def context_budget(system, user, max_tokens=None, **fields):
+    """Tokens left for {context} once the fixed parts of both messages are counted."""
+    max_tokens = max_tokens or MODEL_CONTEXT_TOKENS - ANSWER_RESERVE_TOKENS
+    fixed = system.format(context="", **fields) + user.format(context="", **fields)
+    return max_tokens - count_tokens(fixed) - CHAT_TEMPLATE_OVERHEAD
+
+
+def build_messages(system, user, context="", separator=" ", max_tokens=None, **fields):
+    """
+    Fill the system and user templates ({context} plus any other fields) so
+    the chat fits the model window minus the answer reserve.
+
+    `context` may be a string (truncated to fit) or a list of chunks ordered
+    best first (packed whole, lowest-ranked dropped first). Put {context} in
+    `system` when it is the same for consecutive requests (e.g. a whole
+    outlet's documents) so Ollama can reuse the cached prefix, and in `user`
+    when it changes per question.
+    """
+    with stage("prompt_build"):
+        budget = context_budget(system, user, max_tokens, **fields)
+        packed, used, dropped = _fit_context(context, budget, separator)
+
+        messages = [
+            {"role": "system", "content": system.format(context=packed, **fields)},
+            {"role": "user", "content": user.format(context=packed, **fields)},
+        ]
+        tokens = sum(count_tokens(m["content"]) for m in messages) + CHAT_TEMPLATE_OVERHEAD
+    record_prompt_tokens(tokens, used, dropped)
+    return messages
+
+
+# ------------------------------
+# Accounting
+# ------------------------------
+def current_labels():
+    """(route, outlet) of the request being served, Flask or ASGI."""
+    if has_request_context():
+        return request.endpoint, g.get("document_outlet_name")
+    return REQUEST_LABELS.get()
+
+
+def record_prompt_tokens(tokens, chunks_used=0, chunks_dropped=0):
+    """Remember prompt size per request, labelled by route and outlet."""
+    route, outlet = current_labels()
+    PROMPT_STATS.append({
+        "route": route,
+        "outlet": outlet,
+        "tokens": tokens,
+        "chunks_used": chunks_used,
+        "chunks_dropped": chunks_dropped,
+    })
+    print(f"[PROMPT] route={route} outlet={outlet} tokens={tokens} chunks={chunks_used} dropped={chunks_dropped}")
+
+
+def prompt_token_summary():
+    """Per-route count / mean / max prompt tokens over the recent window."""
+    summary = {}
+    for stat in list(PROMPT_STATS):
+        row = summary.setdefault(stat["route"] or "none", {"requests": 0, "total": 0, "max": 0, "dropped_chunks": 0})
+        row["requests"] += 1
+        row["total"] += stat["tokens"]
+        row["max"] = max(row["max"], stat["tokens"])
+        row["dropped_chunks"] += stat["chunks_dropped"]
+    for row in summary.values():
+        row["mean"] = round(row.pop("total") / row["requests"], 1)
+    return summary
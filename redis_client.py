@@ -0,0 +1,25 @@
+# redis_client.py
+import redis
+
+# One connection pool per process, shared by every request thread
+REDIS_POOL = redis.ConnectionPool(host='localhost', port=6379, db=0, decode_responses=True)
+
+
+def get_redis():
+    """Return a Redis client backed by the shared pool."""
+    return redis.Redis(connection_pool=REDIS_POOL)
+
+
+# ------------------------------
+# asyncio client (asgi_app)
+# ------------------------------
+_async_pool = None
+
+
+def get_async_redis():
+    """Return an asyncio Redis client backed by one shared pool."""
+    global _async_pool
+    import redis.asyncio as aioredis
+    if _async_pool is None:
+        _async_pool = aioredis.ConnectionPool(host='localhost', port=6379, db=0, decode_responses=True)
+    return aioredis.Redis(connection_pool=_async_pool)
@@ -0,0 +1,73 @@
+# requantize.py
+"""
+Rewrite stored embeddings in another storage format (see EMBEDDING_STORAGE
+in helper_func.py).
+
+    python requantize.py int8                      # every row
+    python requantize.py float16 --outlet OUTLET   # one outlet's rows
+    python requantize.py int8 --dry-run            # only report the size change
+
+Rows already in the target format are left alone, so an interrupted run
+can be restarted. Workers keep their cached indexes until the next
+compaction; the vectors only move by the quantization error.
+"""
+import argparse
+from helper_func import (
+    EMBEDDING_STORAGE_MODES,
+    deserialize_embedding,
+    get_db_connection,
+    serialize_embedding,
+)
+
+BATCH_SIZE = 500
+
+
+def requantize(storage, document_outlet_name=None, dry_run=False):
+    conn = get_db_connection()
+    read = conn.cursor(dictionary=True)
+    write = conn.cursor()
+    last_id = rows = changed = bytes_before = bytes_after = 0
+    outlet_filter = " AND document_outlet_name=%s" if document_outlet_name else ""
+
+    while True:
+        params = (last_id, document_outlet_name) if document_outlet_name else (last_id,)
+        read.execute(
+            f"SELECT id, embedding FROM embeddings WHERE id > %s{outlet_filter} ORDER BY id LIMIT {BATCH_SIZE}",
+            params,
+        )
+        batch = read.fetchall()
+        if not batch:
+            break
+        last_id = batch[-1]['id']
+        updates = []
+        for row in batch:
+            blob = bytes(row['embedding'])
+            new_blob = serialize_embedding(deserialize_embedding(blob), storage)
+            rows += 1
+            bytes_before += len(blob)
+            if new_blob[:4] == blob[:4]:  # already in this format
+                bytes_after += len(blob)
+                continue
+            bytes_after += len(new_blob)
+            updates.append((new_blob, row['id']))
+        changed += len(updates)
+        if updates and not dry_run:
+            write.executemany("UPDATE embeddings SET embedding=%s WHERE id=%s", updates)
+            conn.commit()
+
+    read.close()
+    write.close()
+    conn.close()
+    action = "would rewrite" if dry_run else "rewrote"
+    print(f"[REQUANTIZE] {action} {changed} of {rows} rows as {storage}: "
+          f"{bytes_before / 2**20:.1f} MB -> {bytes_after / 2**20:.1f} MB")
+    return changed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("storage", choices=EMBEDDING_STORAGE_MODES)
+    parser.add_argument("--outlet")
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+    requantize(args.storage, args.outlet, args.dry_run)
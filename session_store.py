@@ -0,0 +1,74 @@
+# session_store.py
+import json
+from redis_client import get_redis, get_async_redis
+from command_meta import (
+    get_command_meta,
+    version_key,
+    cached_outlet_commands,
+    store_outlet_commands,
+    lookup_command,
+)
+
+SESSION_TTL = 3600  # slot-filling sessions expire after 1 hour
+
+
+def _session_key(document_outlet_name, user_id, command_id):
+    return f"session:{document_outlet_name}:{user_id}:{command_id}"
+
+
+def load_session(document_outlet_name, user_id, command_id):
+    """
+    Fetch session slots and the command's metadata.
+    The session hash and the outlet's command-table version come back in one
+    round trip; metadata is then an in-process lookup (see command_meta).
+    Returns (session_slots, meta); meta is None if the command is unknown.
+    """
+    pipe = get_redis().pipeline(transaction=False)
+    pipe.hgetall(_session_key(document_outlet_name, user_id, command_id))
+    pipe.get(version_key(document_outlet_name))
+    raw_session, version = pipe.execute()
+
+    session_slots = {name: json.loads(value) for name, value in raw_session.items()}
+    return session_slots, get_command_meta(document_outlet_name, command_id, version)
+
+
+def save_session(document_outlet_name, user_id, command_id, slots):
+    """Replace the session's slots and refresh its expiry in one round trip."""
+    key = _session_key(document_outlet_name, user_id, command_id)
+    pipe = get_redis().pipeline(transaction=True)
+    pipe.delete(key)
+    if slots:
+        pipe.hset(key, mapping={name: json.dumps(value) for name, value in slots.items()})
+        pipe.expire(key, SESSION_TTL)
+    pipe.execute()
+
+
+# ------------------------------
+# asyncio versions (asgi_app)
+# ------------------------------
+async def aload_session(document_outlet_name, user_id, command_id):
+    """Async load_session(); a stale command table is reloaded via async_db."""
+    from async_db import load_outlet_command_meta
+
+    pipe = get_async_redis().pipeline(transaction=False)
+    pipe.hgetall(_session_key(document_outlet_name, user_id, command_id))
+    pipe.get(version_key(document_outlet_name))
+    raw_session, version = await pipe.execute()
+
+    session_slots = {name: json.loads(value) for name, value in raw_session.items()}
+    commands = cached_outlet_commands(document_outlet_name, version)
+    if commands is None:
+        commands = store_outlet_commands(
+            document_outlet_name, version, await load_outlet_command_meta(document_outlet_name)
+        )
+    return session_slots, lookup_command(commands, command_id)
+
+
+async def asave_session(document_outlet_name, user_id, command_id, slots):
+    key = _session_key(document_outlet_name, user_id, command_id)
+    pipe = get_async_redis().pipeline(transaction=True)
+    pipe.delete(key)
+    if slots:
+        pipe.hset(key, mapping={name: json.dumps(value) for name, value in slots.items()})
+        pipe.expire(key, SESSION_TTL)
+    await pipe.execute()
@@ -0,0 +1,307 @@
+# spreadsheet.py
+import os
+import re
+from file_utils import ARTIFACT_FOLDER
+from index_cache import get_document_table, put_document_table
+
+# Excel uploads are kept as a table: one chunk per row ("Header: value | ...")
+# for retrieval, plus the DataFrame itself as Parquet so simple filter /
+# aggregate questions are answered exactly, without the LLM.
+SPREADSHEET_EXTENSIONS = (".xls", ".xlsx")
+MAX_LISTED_ROWS = 20        # rows spelled out in a lookup / filter answer
+MAX_VALUE_CARDINALITY = 5000  # text columns with more distinct values aren't scanned for filters
+NUMERIC_COLUMN_SHARE = 0.8  # share of parseable cells for a column to count as numeric
+
+AGGREGATE_WORDS = [
+    ("count", ("how many", "number of", "count")),
+    ("mean", ("average", "avg", "mean")),
+    ("sum", ("total", "sum")),
+    ("max", ("highest", "maximum", "max", "most expensive", "largest", "biggest")),
+    ("min", ("lowest", "minimum", "min", "cheapest", "smallest")),
+]
+# "... price under 200", "cost more than Rs. 1,500"
+COMPARISON_RE = re.compile(
+    r"(over|above|more than|greater than|at least|under|below|less than|at most|cheaper than)"
+    r"\s+(?:rs\.?|\$|inr)?\s*(\d[\d,]*(?:\.\d+)?)"
+)
+LESS_THAN = {"under", "below", "less than", "at most", "cheaper than"}
+INCLUSIVE = {"at least", "at most"}
+PRICE_WORDS = ("price", "cost", "rate", "amount", "mrp")
+IMPLIED_PRICE_WORDS = ("expensive", "cheap", "cost", "price")
+# Words a question may contain besides what the parser reads (columns,
+# values, aggregate words, comparisons). Anything else is a condition we
+# can't apply ("vegetarian", "contain chicken"), so the question goes to
+# retrieval + LLM instead of getting an answer over the wrong rows.
+QUESTION_WORDS = {
+    "a", "an", "the", "is", "are", "was", "were", "be", "do", "does", "did", "s",
+    "what", "which", "who", "whats", "how", "there", "here", "any", "all", "each", "every",
+    "of", "in", "on", "for", "with", "to", "from", "by", "at", "as", "and", "or",
+    "me", "i", "we", "you", "your", "our", "it", "its", "this", "that", "these", "those",
+    "tell", "give", "show", "list", "find", "please", "have", "has", "got",
+    "item", "items", "row", "rows", "entry", "entries", "record", "records",
+    "product", "products", "dish", "dishes", "one", "ones",
+    "rs", "inr", "rupees", "priced", "costing",
+}
+# Stripped before parsing a cell as a number ("Rs. 1,200" -> 1200); codes like ITM0042 stay text
+CURRENCY_RE = r"(?i)^\s*(?:rs\.?|inr|\$|₹)\s*|\s*(?:/-|rs\.?|inr)\s*$"
+
+
+def is_spreadsheet(filename):
+    return (filename or "").lower().endswith(SPREADSHEET_EXTENSIONS)
+
+
+# ------------------------------
+# Ingestion
+# ------------------------------
+def read_spreadsheet(file):
+    """First sheet as a DataFrame with clean, unique headers and no empty rows/columns."""
+    import pandas as pd
+
+    table = pd.read_excel(file, engine="openpyxl")
+    table = table.dropna(how="all").dropna(axis=1, how="all")
+
+    headers, seen = [], {}
+    for position, column in enumerate(table.columns):
+        name = str(column).strip()
+        if not name or name.lower().startswith("unnamed:"):
+            name = f"Column {position + 1}"
+        seen[name] = seen.get(name, 0) + 1
+        headers.append(name if seen[name] == 1 else f"{name} {seen[name]}")
+    table.columns = headers
+
+    # Mixed-type object columns can't be written to Parquet; keep them as text
+    for column in table.columns:
+        if table[column].dtype == object:
+            table[column] = table[column].map(lambda v: None if pd.isna(v) else str(v).strip()).astype("string")
+    return table.reset_index(drop=True)
+
+
+def format_cell(value):
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def row_chunks(table):
+    """One chunk per row: 'Header: value | Header: value', skipping empty cells."""
+    import pandas as pd
+
+    chunks = []
+    for row in table.itertuples(index=False, name=None):
+        cells = [f"{column}: {format_cell(value)}" for column, value in zip(table.columns, row) if not pd.isna(value)]
+        if cells:
+            chunks.append(" | ".join(cells))
+    return chunks
+
+
+def table_path(doc_id):
+    return os.path.join(ARTIFACT_FOLDER, f"{doc_id}.parquet")
+
+
+def save_table(doc_id, table):
+    """Write the table next to the other per-document artifacts (removed by cleanup)."""
+    table.to_parquet(table_path(doc_id), index=False)
+
+
+def load_table(doc_id):
+    """The document's table (cached), or None if it wasn't a spreadsheet."""
+    table = get_document_table(doc_id)
+    if table is None:
+        path = table_path(doc_id)
+        if not os.path.exists(path):
+            return None
+        import pandas as pd
+        table = pd.read_parquet(path)
+        put_document_table(doc_id, table)
+    return table
+
+
+# ------------------------------
+# Tabular question answering
+# ------------------------------
+def _contains_phrase(text, phrase):
+    return re.search(rf"(?<![a-z0-9]){re.escape(phrase)}(?![a-z0-9])", text) is not None
+
+
+def numeric_columns(table):
+    """{column: numeric Series} for columns that are (mostly) numbers, e.g. 'Rs. 1,200'."""
+    import pandas as pd
+
+    numeric = {}
+    for column in table.columns:
+        series = table[column]
+        if not pd.api.types.is_numeric_dtype(series):
+            cleaned = series.astype("string").str.replace(CURRENCY_RE, "", regex=True).str.replace(",", "")
+            series = pd.to_numeric(cleaned, errors="coerce")
+        present = table[column].notna().sum()
+        if present and series.notna().sum() / present >= NUMERIC_COLUMN_SHARE:
+            numeric[column] = series
+    return numeric
+
+
+def mentioned_columns(question, columns):
+    """Columns named in the question (plural forms too), longest name first."""
+    found = []
+    for column in sorted(columns, key=len, reverse=True):
+        name = column.lower()
+        if _contains_phrase(question, name) or _contains_phrase(question, name + "s"):
+            found.append(column)
+    return found
+
+
+def value_filters(question, table, skip):
+    """[(column, value)] for text cell values that appear verbatim in the question."""
+    filters = []
+    for column in table.columns:
+        if column in skip:
+            continue
+        values = table[column].dropna().astype(str).str.strip()
+        if values.nunique() > MAX_VALUE_CARDINALITY:
+            continue
+        matches = [v for v in values.unique() if len(v) >= 2 and not v.replace(".", "").isdigit()
+                   and (_contains_phrase(question, v.lower()) or _contains_phrase(question, v.lower() + "s"))]
+        if matches:
+            # "Chicken Curry Large" beats "Chicken Curry"
+            filters.append((column, max(matches, key=len)))
+    return filters
+
+
+def strip_phrases(text, phrases):
+    """text without the phrases (or their plurals), longest first."""
+    for phrase in sorted(phrases, key=len, reverse=True):
+        text = re.sub(rf"(?<![a-z0-9]){re.escape(phrase.lower())}s?(?![a-z0-9])", " ", text)
+    return text
+
+
+def unread_words(question, phrases):
+    """Words of the question left once the parsed phrases and QUESTION_WORDS are taken out."""
+    rest = strip_phrases(COMPARISON_RE.sub(" ", question), phrases)
+    return [word for word in re.findall(r"[a-z0-9]+", rest) if word not in QUESTION_WORDS]
+
+
+def label_column(table, numeric):
+    """First text column, used to name rows in answers."""
+    for column in table.columns:
+        if column not in numeric:
+            return column
+    return table.columns[0]
+
+
+def row_count(n):
+    return f"{n} row" if n == 1 else f"{n} rows"
+
+
+def answer_table_question(question, table):
+    """
+    Answer a simple lookup / filter / aggregate question from the table.
+    Returns the answer text, or None when the question isn't one we can
+    answer exactly (the caller then falls back to retrieval + LLM).
+    """
+    q = question.lower()
+    numeric = numeric_columns(table)
+    filters = value_filters(q, table, skip=set(numeric))
+    # "Veg Biryani" is a value; it doesn't also name the Veg column
+    columns = mentioned_columns(strip_phrases(q, [v for _, v in filters]), table.columns)
+
+    operation = next((op for op, words in AGGREGATE_WORDS if any(_contains_phrase(q, w) for w in words)), None)
+
+    # Target numeric column: named in the question, or implied by price words
+    targets = [c for c in columns if c in numeric]
+    if not targets and any(w in q for w in IMPLIED_PRICE_WORDS):
+        targets = [c for c in numeric if any(w in c.lower() for w in PRICE_WORDS)]
+    comparisons = COMPARISON_RE.findall(q)
+    if not targets and comparisons and len(numeric) == 1:
+        targets = list(numeric)
+    target = targets[0] if targets else None
+
+    # "how many calories in X" asks for a column value, not a row count
+    if operation == "count" and any(c in numeric for c in columns):
+        operation = None
+
+    import pandas as pd
+
+    mask = pd.Series(True, index=table.index)
+    # Only questions about this table: "how many days are you open?" names
+    # none of its columns or values and belongs to retrieval
+    if not columns and not filters:
+        return None
+    # Every word must be accounted for, or part of the question is a
+    # condition we'd silently drop ("how many items are vegetarian?")
+    phrases = list(columns) + [v for _, v in filters] + list(IMPLIED_PRICE_WORDS)
+    phrases += [w for _, words in AGGREGATE_WORDS for w in words if _contains_phrase(q, w)]
+    if unread_words(q, phrases):
+        return None
+    # A text column named but not filtered on ("how many items are veg?")
+    # is a condition too, unless a lookup asks for its value. A column
+    # called "Item" or "Product" only names the rows.
+    filtered = {c for c, _ in filters}
+    lookup = filters and operation is None and not comparisons
+    unfiltered = [c for c in columns if c not in numeric and c not in filtered and c.lower() not in QUESTION_WORDS]
+    if unfiltered and not lookup:
+        return None
+    for column, value in filters:
+        mask &= table[column].astype(str).str.strip().str.lower() == value.lower()
+
+    if comparisons and target is None:
+        return None
+    for word, number in comparisons:
+        number = float(number.replace(",", ""))
+        series = numeric[target]
+        if word in LESS_THAN:
+            mask &= (series <= number) if word in INCLUSIVE else (series < number)
+        else:
+            mask &= (series >= number) if word in INCLUSIVE else (series > number)
+
+    rows = table[mask]
+    label = label_column(table, numeric)
+    conditions = [f"{c} = {v}" for c, v in filters] + [f"{target} {w} {n}" for w, n in comparisons]
+    where = f" where {', '.join(conditions)}" if conditions else ""
+
+    if operation == "count":
+        return f"{row_count(len(rows))}{where}."
+
+    if operation in ("sum", "mean", "max", "min"):
+        if target is None:
+            return None
+        values = numeric[target][mask].dropna()
+        if values.empty:
+            return f"No rows with a {target} value{where}."
+        if operation == "sum":
+            return f"Total {target}{where}: {format_cell(float(values.sum()))}"
+        if operation == "mean":
+            return f"Average {target}{where}: {round(float(values.mean()), 2)}"
+        position = values.idxmax() if operation == "max" else values.idxmin()
+        word = "Highest" if operation == "max" else "Lowest"
+        return f"{word} {target}{where}: {format_cell(table.at[position, target])} ({label}: {format_cell(table.at[position, label])})"
+
+    # Lookup: a row picked by value and a column asked for
+    asked = [c for c in columns if c not in {f[0] for f in filters}]
+    if filters and asked and not rows.empty:
+        lines = []
+        for _, row in rows.head(MAX_LISTED_ROWS).iterrows():
+            cells = ", ".join(f"{c}: {format_cell(row[c])}" for c in asked)
+            lines.append(f"{format_cell(row[label])} - {cells}" if label not in asked else cells)
+        return "\n".join(lines)
+
+    # Pure filter: list the matching rows
+    if comparisons:
+        if rows.empty:
+            return f"No rows{where}."
+        names = [f"{format_cell(row[label])} ({target}: {format_cell(row[target])})" for _, row in rows.head(MAX_LISTED_ROWS).iterrows()]
+        more = f" (showing {MAX_LISTED_ROWS} of {len(rows)})" if len(rows) > MAX_LISTED_ROWS else ""
+        return f"{row_count(len(rows))}{where}{more}:\n" + "\n".join(names)
+
+    return None
+
+
+def answer_from_tables(question, doc_ids):
+    """First exact table answer across the given documents' tables, or None."""
+    for doc_id in doc_ids:
+        table = load_table(doc_id)
+        if table is None:
+            continue
+        answer = answer_table_question(question, table)
+        if answer is not None:
+            print(f"[TABLE] answered from {doc_id}")
+            return answer
+    return None